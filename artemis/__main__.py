@@ -1,27 +1,48 @@
 import sys
 
-from PySide6.QtCore import QCoreApplication
-from PySide6.QtGui import QGuiApplication, QIcon
-
-from .utils.constants import Constants
-from .utils.ui_utils import set_ui
-from .ui.artemis import UIArtemis
+from .utils.profile_utils import PROFILER
+from .cli import is_cli, run
 
 
 def main():
-    set_ui()
+    if is_cli(sys.argv[1:]):
+        # Command-line mode: Qt is never loaded
+        sys.exit(run(sys.argv[1:]))
+
+    # The conf file is read without Qt, so that the profiler records the imports too
+    from .utils.config_utils import CONFIGURE_QT
+
+    if CONFIGURE_QT.value('Develop', 'profile', '0') == '1':
+        PROFILER.enable()
+
+    with PROFILER.span('import modules'):
+        from PySide6.QtCore import QCoreApplication
+        from PySide6.QtGui import QGuiApplication, QIcon
+
+        from .utils.constants import Constants
+        from .utils.path_utils import APP_DIR
+        from .utils.ui_utils import set_ui
+        from .ui.artemis import UIArtemis
+
+    with PROFILER.span('set_ui'):
+        set_ui()
 
     QCoreApplication.setOrganizationName(Constants.ORGANIZATION_NAME)
     QCoreApplication.setOrganizationDomain(Constants.ORGANIZATION_DOMAIN)
     QCoreApplication.setApplicationName(Constants.APPLICATION_NAME)
 
-    app = QGuiApplication(sys.argv)
+    with PROFILER.span('create application'):
+        app = QGuiApplication(sys.argv)
+
+        icon_file_path = (':/data/images/artemis_icon.ico')
+        app.setWindowIcon(QIcon(icon_file_path))
 
-    icon_file_path = (':/data/images/artemis_icon.ico')
-    app.setWindowIcon(QIcon(icon_file_path))
+    with PROFILER.span('create main window'):
+        ui = UIArtemis()
 
-    UIArtemis()
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    PROFILER.dump(APP_DIR / 'profile')
+    sys.exit(exit_code)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,377 @@
+""" Command-line interface of Artemis (python -m artemis <command>), for scripted use of the
+local databases without starting the GUI. Only the Qt-free data layer (artemis.core) is used.
+"""
+import re
+import sys
+import csv
+import json
+import argparse
+
+from contextlib import nullcontext
+
+from artemis.core import (
+    Constants, ArtemisDatabase, ArtemisSignal, scan_databases, get_latest_sigid_db, import_database,
+    make_tar, match_hash, file_hash
+)
+
+
+class CliError(Exception):
+    """ Error reported to the user (without traceback) with exit code 1 """
+
+
+UNITS = {'': 1, 'k': 10**3, 'm': 10**6, 'g': 10**9}
+
+
+def parse_frequency(text):
+    """ Parse a frequency/bandwidth in Hz, with an optional unit (e.g. 7074000, 7.074M, 12.5kHz)
+    """
+    match = re.fullmatch(r'\s*([0-9]*\.?[0-9]+(?:e[0-9]+)?)\s*([kmg]?)(?:hz)?\s*', text, re.IGNORECASE)
+    if match is None:
+        raise argparse.ArgumentTypeError("invalid frequency: '{}'".format(text))
+    return round(float(match.group(1)) * UNITS[match.group(2).lower()])
+
+
+def parse_range(parse_value):
+    """ Return a parser of 'LOW:HIGH' ranges (or a single value, LOW = HIGH)
+        into the {'lower_band', 'upper_band'} filter of the FilterPage
+    """
+    def parser(text):
+        low, _, high = text.partition(':')
+        lower_band = parse_value(low)
+        upper_band = parse_value(high) if high else lower_band
+        if lower_band > upper_band:
+            raise argparse.ArgumentTypeError("invalid range: '{}'".format(text))
+        return {'lower_band': lower_band, 'upper_band': upper_band}
+    return parser
+
+
+def parse_acf(text):
+    try:
+        return float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid ACF: '{}'".format(text))
+
+
+def find_database(key):
+    """ Return the local DB matching the key (name or folder name, case insensitive),
+        as probed by scan_databases (shared, not to be loaded).
+        Without a key, the latest SigID DB is returned.
+    """
+    if key is None:
+        database = get_latest_sigid_db()
+        if database is None:
+            raise CliError('No SigID database found, use --db to choose a database')
+        return database
+
+    matches = [db for db in scan_databases() if key == db.db_dir_name or key.lower() == (db.name or '').lower()]
+    if not matches:
+        raise CliError("Database not found: '{}' (see 'python -m artemis dbs')".format(key))
+    if len(matches) > 1:
+        raise CliError("More databases named '{}', use the folder name instead".format(key))
+    return matches[0]
+
+
+def open_database(key):
+    """ Open the local DB matching the key (see find_database) in read-only mode and load it.
+        The DB is not migrated: a DB not opened yet by this version of Artemis is refused.
+    """
+    probed = find_database(key)
+    database = ArtemisDatabase(probed.db_dir_name, read_only=True)
+    if database.needs_migration():
+        database.close()
+        raise CliError("'{}' was saved by an older version of Artemis, open it once in Artemis to update it".format(probed.name))
+    database.load()
+    return database
+
+
+def signal_details(database, sig_id):
+    """ Return all the parameters of a signal as a flat dict (lists of values)
+    """
+    signal = ArtemisSignal(database)
+    signal.load(sig_id)
+    return {
+        'SIG_ID': sig_id,
+        'name': signal.name,
+        'description': signal.description,
+        'url': signal.url,
+        'category': [item[1] for item in signal.category],
+        'frequency': [item[1] for item in signal.frequency],
+        'bandwidth': [item[1] for item in signal.bandwidth],
+        'modulation': [item[1] for item in signal.modulation],
+        'mode': [item[1] for item in signal.mode],
+        'location': [item[1] for item in signal.location],
+        'acf': [item[1] for item in signal.acf]
+    }
+
+
+def write_records(records, output_format, output):
+    """ Write a list of dicts as JSON or CSV (lists are joined with ';' in CSV)
+    """
+    if output_format == 'json':
+        json.dump(records, output, indent=4, ensure_ascii=False)
+        output.write('\n')
+        return
+
+    if not records:
+        return
+
+    writer = csv.DictWriter(output, fieldnames=list(records[0]))
+    writer.writeheader()
+    for record in records:
+        writer.writerow({
+            key: ';'.join(str(item) for item in value) if isinstance(value, list) else value
+            for key, value in record.items()
+        })
+
+
+def open_output(path):
+    """ Open the output file, stdout if no path is given (left open on exit)
+    """
+    if path is None or path == '-':
+        return nullcontext(sys.stdout)
+    return open(path, 'w', newline='', encoding=Constants.DEFAULT_ENCODING)
+
+
+################################## MARK: COMMANDS
+
+def command_query(args):
+    """ Filter the signals of a DB, with the same semantics of the FilterPage
+    """
+    database = open_database(args.db)
+
+    filter_status = {}
+    if args.freq:
+        filter_status['frequency'] = args.freq
+    if args.band:
+        filter_status['bandwidth'] = args.band
+    if args.acf:
+        filter_status['acf'] = args.acf
+    if args.modulation:
+        filter_status['modulation'] = args.modulation
+    if args.location:
+        filter_status['location'] = args.location
+    if args.category:
+        labels = {item['value'].lower(): item['clb_id'] for item in database.all_category_labels}
+        unknown = [label for label in args.category if label.lower() not in labels]
+        if unknown:
+            raise CliError('Unknown categories: {}'.format(', '.join(unknown)))
+        filter_status['category'] = [labels[label.lower()] for label in args.category]
+
+    database.select_by_filter(filter_status)
+    signals = database.filtered_signals
+
+    if args.search:
+        ranks = {sig_id: rank for rank, sig_id in enumerate(database.stream_search(args.search))}
+        signals = sorted((sig for sig in signals if sig['SIG_ID'] in ranks), key=lambda sig: ranks[sig['SIG_ID']])
+
+    if args.limit is not None:
+        signals = signals[:args.limit]
+
+    if args.details:
+        records = [signal_details(database, sig['SIG_ID']) for sig in signals]
+    else:
+        records = [dict(sig) for sig in signals]
+
+    with open_output(args.output) as output:
+        write_records(records, args.format, output)
+
+    database.close()
+
+
+def read_observations(path):
+    """ Read the observations (frequency, bandwidth, acf) from a CSV file. Columns are
+        taken by header name if the first row is a header, otherwise by position.
+        Frequencies and bandwidths accept k/M/G units, empty cells are missing values.
+    """
+    with open(path, newline='', encoding=Constants.DEFAULT_ENCODING) as f:
+        rows = [row for row in csv.reader(f) if row and any(cell.strip() for cell in row)]
+
+    columns = [0, 1, 2]
+    if rows:
+        header = [cell.strip().lower() for cell in rows[0]]
+        if 'frequency' in header:
+            columns = [header.index(key) if key in header else None for key in ('frequency', 'bandwidth', 'acf')]
+            rows = rows[1:]
+
+    parsers = (parse_frequency, parse_frequency, parse_acf)
+    observations = []
+    for line, row in enumerate(rows, 1):
+        values = []
+        for column, parse_value in zip(columns, parsers):
+            cell = row[column].strip() if column is not None and column < len(row) else ''
+            try:
+                values.append(parse_value(cell) if cell else None)
+            except argparse.ArgumentTypeError as e:
+                raise CliError('{}, row {}: {}'.format(path, line, e))
+        observations.append(tuple(values))
+    return observations
+
+
+def command_identify(args):
+    """ Identify a batch of observed signals (CSV of frequency, bandwidth, acf)
+    """
+    observations = read_observations(args.observations)
+
+    database = open_database(args.db)
+    results = database.identify(
+        observations,
+        frequency_tolerance=args.tolerance,
+        bandwidth_tolerance=args.band_tolerance,
+        acf_tolerance=args.acf_tolerance,
+        limit=args.limit
+    )
+    database.close()
+
+    records = []
+    for position, ((freq, band, acf), candidates) in enumerate(zip(observations, results), 1):
+        observation = {'observation': position, 'frequency': freq, 'bandwidth': band, 'acf': acf}
+        if args.format == 'json':
+            records.append({**observation, 'candidates': candidates})
+            continue
+        for rank, candidate in enumerate(candidates, 1):
+            records.append({**observation, 'rank': rank, **candidate})
+        if not candidates:
+            records.append({**observation, 'rank': None, 'SIG_ID': None, 'name': None, 'score': None})
+
+    with open_output(args.output) as output:
+        write_records(records, args.format, output)
+
+
+def command_dbs(args):
+    """ List the valid local DBs
+    """
+    records = [
+        {
+            'folder': db.db_dir_name,
+            'name': db.name,
+            'version': db.version,
+            'sigid': db.editable == -1,
+            'date': db.date,
+            **db.stats
+        }
+        for db in sorted(scan_databases(), key=lambda db: (db.name or '').lower())
+    ]
+
+    with open_output(args.output) as output:
+        write_records(records, args.format, output)
+
+
+def command_export(args):
+    """ Export a DB as a tar archive (same format of File > Export Database)
+    """
+    database = find_database(args.db)
+    make_tar(args.archive, database.db_dir, database.media_files())
+    print('{} exported in {}'.format(database.name, args.archive), file=sys.stderr)
+
+
+def command_import(args):
+    """ Import a tar archive in the data folder (same format of File > Import Database)
+    """
+    if args.sha256 and not match_hash(args.archive, args.sha256.lower()):
+        raise CliError('Hash mismatch: {}'.format(args.archive))
+
+    try:
+        database = import_database(args.archive)
+    except Exception as e:
+        raise CliError('Not a valid Artemis database: {} ({})'.format(args.archive, e))
+    database.close()
+
+    print('{} imported in {}'.format(database.name, database.db_dir_name), file=sys.stderr)
+
+
+def command_hash(args):
+    """ Print the SHA-256 hash of the files, or verify it against the expected one
+    """
+    if args.expected is not None:
+        if len(args.files) != 1:
+            raise CliError('--expected requires a single file')
+        if not match_hash(args.files[0], args.expected.lower()):
+            raise CliError('Hash mismatch: {}'.format(args.files[0]))
+        print('{}: OK'.format(args.files[0]))
+        return
+
+    for path in args.files:
+        print('{}  {}'.format(file_hash(path), path))
+
+
+################################## MARK: PARSER
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m artemis',
+        description='Artemis command-line interface. Without a command, the GUI is started.'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    query = commands.add_parser('query', help='filter the signals of a database')
+    query.set_defaults(handler=command_query)
+    query.add_argument('--db', help='database name or folder (default: latest SigID database)')
+    query.add_argument('--freq', type=parse_range(parse_frequency), metavar='LOW[:HIGH]',
+                       help='frequency range in Hz, k/M/G units allowed (e.g. 7M:7.2M)')
+    query.add_argument('--band', type=parse_range(parse_frequency), metavar='LOW[:HIGH]', help='bandwidth range in Hz')
+    query.add_argument('--acf', type=parse_range(parse_acf), metavar='LOW[:HIGH]', help='ACF range in ms')
+    query.add_argument('--modulation', action='append', help='modulation (repeatable, any of them)')
+    query.add_argument('--location', action='append', help='location (repeatable, any of them)')
+    query.add_argument('--category', action='append', help='category tag (repeatable, any of them)')
+    query.add_argument('--search', help='full-text search, best matches first')
+    query.add_argument('--limit', type=int, help='maximum number of signals')
+    query.add_argument('--details', action='store_true', help='include all the parameters of the signals')
+    query.add_argument('--format', choices=['json', 'csv'], default='json')
+    query.add_argument('--output', '-o', help='output file (default: stdout)')
+
+    identify = commands.add_parser('identify', help='identify a batch of observed signals')
+    identify.set_defaults(handler=command_identify)
+    identify.add_argument('observations', help='CSV file with frequency, bandwidth (optional) and acf (optional) columns')
+    identify.add_argument('--db', help='database name or folder (default: latest SigID database)')
+    identify.add_argument('--tolerance', type=parse_frequency, default=0, help='frequency tolerance in Hz (default: 0)')
+    identify.add_argument('--band-tolerance', type=float, default=Constants.IDENTIFY_BAND_TOLERANCE,
+                          help='relative bandwidth tolerance (default: %(default)s)')
+    identify.add_argument('--acf-tolerance', type=float, default=Constants.IDENTIFY_ACF_TOLERANCE,
+                          help='relative ACF tolerance (default: %(default)s)')
+    identify.add_argument('--limit', type=int, default=Constants.IDENTIFY_CANDIDATES,
+                          help='candidates for each observation (default: %(default)s)')
+    identify.add_argument('--format', choices=['json', 'csv'], default='json')
+    identify.add_argument('--output', '-o', help='output file (default: stdout)')
+
+    dbs = commands.add_parser('dbs', help='list the local databases')
+    dbs.set_defaults(handler=command_dbs)
+    dbs.add_argument('--format', choices=['json', 'csv'], default='json')
+    dbs.add_argument('--output', '-o', help='output file (default: stdout)')
+
+    export = commands.add_parser('export', help='export a database as a tar archive')
+    export.set_defaults(handler=command_export)
+    export.add_argument('archive', help='destination .tar file')
+    export.add_argument('--db', help='database name or folder (default: latest SigID database)')
+
+    import_ = commands.add_parser('import', help='import a database tar archive')
+    import_.set_defaults(handler=command_import)
+    import_.add_argument('archive', help='.tar file to be imported')
+    import_.add_argument('--sha256', help='expected SHA-256 hash of the archive')
+
+    hash_ = commands.add_parser('hash', help='compute or verify SHA-256 hashes')
+    hash_.set_defaults(handler=command_hash)
+    hash_.add_argument('files', nargs='+')
+    hash_.add_argument('--expected', help='expected SHA-256 hash (exit code 1 on mismatch)')
+
+    return parser
+
+
+COMMANDS = ('query', 'identify', 'dbs', 'export', 'import', 'hash')
+
+
+def is_cli(argv):
+    """ True if the command line asks for a CLI command instead of the GUI
+    """
+    return bool(argv) and (argv[0] in COMMANDS or argv[0] in ('-h', '--help'))
+
+
+def run(argv):
+    """ Run a CLI command and return the exit code
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        args.handler(args)
+    except (CliError, OSError, ValueError) as e:
+        print('ERROR: {}'.format(e), file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,38 @@
+""" Data layer of Artemis (databases, signals, filters, archives, media store, hashing), usable without Qt.
+
+Importing this module does not load PySide6 nor the conf file, so it can be used by scripts,
+batch jobs and worker processes. The Qt adapters (list models, workers, windows) live in
+artemis.utils.model_utils, search_utils, thread_utils, ui_utils and in artemis.ui.
+"""
+from artemis.utils.constants import Constants, Query
+from artemis.utils.generic_utils import format_frequency, generate_filter_query, generate_search_query
+from artemis.utils.interval_utils import IntervalIndex
+from artemis.utils.media_utils import MediaStore, media_store
+from artemis.utils.path_utils import DATA_DIR, STORE_DIR
+from artemis.utils.sql_utils import (
+    Database, ArtemisDatabase, ArtemisSignal, scan_databases, get_latest_sigid_db, import_database
+)
+from artemis.utils.sys_utils import make_tar, unpack_tar, match_hash, file_hash
+
+__all__ = [
+    'Constants',
+    'Query',
+    'DATA_DIR',
+    'STORE_DIR',
+    'Database',
+    'ArtemisDatabase',
+    'ArtemisSignal',
+    'IntervalIndex',
+    'MediaStore',
+    'media_store',
+    'scan_databases',
+    'get_latest_sigid_db',
+    'import_database',
+    'format_frequency',
+    'generate_filter_query',
+    'generate_search_query',
+    'make_tar',
+    'unpack_tar',
+    'match_hash',
+    'file_hash'
+]
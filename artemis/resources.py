@@ -1,3152 +1,3190 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.11.1
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x05U\
-\x00\
-\x00\x17\xcbx\xda\xedXmo\xdb6\x10\xfe^\xa0\xff\
-\x81\xcb\x97\xdah\xa6\xb8\xc1\xf2E]0\xb8N\x87\x06\
-H\xb245Z\x14AP\xd0\xe2Y&J\x93*I\
-\xc5qW\xff\xf7\x1dE\xc9\x96\xf5b\xbbY\x02,\xc0\
-\xd4\x22\x96\xc8\x87<\xde\xddsw$\xf94Q\xda\x92\
-\xf7\xf6}\xca\xa3\xaf\xcf\x9f\xf1\xb5\xef\xe0\x13\x97L\xcd\
-j\xcd\x03%\xadV\xc2\xb4v\x04\xe7\xd4\x82\xe6T\xd4\
-\x10gt\xaeR\x8b#\xdd??=\xf9\xfb\xf93\x82\
-\x0fg!\x99e-\x03\x1c\x1d+=\x7f\xcb\xb8U\xda\
-\xf7Zn\x05\x84\xe4E_[\x98rC~%\x05\x8a\
-\x9cSIc\xd0/\xdc\x94\x0e:\xe3\xccNB\xf2\xdb\
-Q\xcf\x7fO\x80\xc7\x13\x8b\x0d\xbd^\x01\x19(\x5c\x96\
-\x04i\x03%\xdd\xbb\x00\x0b(>_\x89{\xee\xc81\
-\xf9\x10i\x00\x19d\xf3\x91\x03r\x88B\x97\xef+\xe4\
-|\x85\xf4\x92r\xe8\xea\xc3c\x17\x85\xf0\xa9bTp\
-;\x0f\xd1*A?I\x04\x8f\xa8\xe5J\x9e\xbbv\x0f\
-\x19\x0b\x1a\x9b\xac\xbfp\x81o7<\x96T\x10Co\
-\xe1\x92j:\xed\xdcRM\x18\xb5t\x9f\x8c\x94\x12\x84\
-\x9b\x0b\x98u\xd7\xb0\x0c\x9cr\x1e\xcd\xa5%\x91\x18\x9d\
-\xb2n1\xe18\x95\x91\x93M\x84\xa2\xec\x8c\x1b\xdba\
-<\xb2\xdd\xb2%\x22\x01T\xf7\x85\xe8tWmc\xa5\
-I&\x9b\xa3\xf2\xbd\xd7\xf8\xf3;q\x03\x03\x012\xb6\
-\x13lx\xf9rm\x92L\xef9j\x08\x22\xa0I\x02\
-\x92e\x82\xae\xf9Mi\xd6E\xc5P\xcb\xc5q\xf4\xf9\
-`Be\x0c\xac\xb36\xad[\x82A\x05#t\xdf\x17\
-\xb4\x22\xae\xa6\x90\x12\x83\xed\x08T\xe8#\x87Y\x10\xa5\
-Z\xa3\xb7O%\x83\xbb\x92@>&\x9d\xb5\xe1\xbf\x1c\
-\x1f\x93\x14Ac.\x81\xd5\x14\xc0)\xe8\x14\xde\xa4\xd6\
-*\x19\xe0\xfbH\x00C\x89V\xa7\xb0\x0e\xf46\xdf\x02\
-\x5c\x10\x10\x06v\x941\xa6\x88\xddIH\x05\xd9j\xd3\
-\x95[\xcbK(\xac\x97\xf5\x16\x1e_\x0e>\xc1\x90V\
-\xf19\x18\x83\x01W\x1e\xe6b\x97e\x9d'\xd9\xaa0\
-\x11\x8c\xb9\x9ef\xb4.M\xee\x08\x1eV\xcc\x90\x07\xf6\
-^_\x03\xc1\xdc@L\xaa\xe1\x8f\xbd\xd2 /\x0d\x11\
-\x9f\xb1\x97\x22\x8a\x8e0\x85\x10\xabr\x0b\x10;\x81%\
-\x09HTd\x05K\xe3\x80\x0c\xb1+\xd1*\xc29\xb0\
-GJe\xc9\x08\x9c\x871\xf8\x83\xba\x90\xe1<q\x82\
-fT\xcbR\xa7\xb1T2\xaa\x9975\x86\xa57C\
-0\xa02\x02A~\x14\xdf\x9f\xc1\x14\x86r\x8f\x92\xfd\
-(\x82\xa4\x9aXV\xae\xf31\xb9\x9d\xaf\xe8\x8c\xd1\x17\
-\xce6\x04\x8a_@\xb3C0!`\xa6,/\xec.\
-$\x9d\x84\xba\xf9\xf3\xd4\x96\xa7\xb5n%\xaf\xad`y\
-*+rZ\x0e\xdc\xe2\xd8H(\x03\x97\x0a\xb3\x1b\xce\
-t\xa9\x924\x09.T?\xb5j\xe0:\xca\xc3\xdb\x0c\
-\xfc\xd7\xd7\x95q\xbd\xb1\xcb\xa3\x06J\xa4S\xe9\x0bJ\
-\xd5\xc0\x08\x9e(m\x821\x17\xb8.\xaf\xc5:\xe2\x8c\
-\x8e\xd0w\x95a\x19\x1f\xe1\x0ek\xc573\xd4\x9d\xbd\
-\xb7\x12\xcbX\xc6/\x17\x94D\x8d\xfd;\xcc\x1c\xbb\xc2\
-\xbdn}\xb4_N0R\xa8\xc9\xf4\x9c\xea\x98\xcb\x90\
-\xbc:\xaa\x03\xc7X*\x83DaF\xfe\xc0\xbf#\xe9\
-^\x1d\xaec\x16\xeb\x9fC\x5c\xd5\x9f\x1c\x04kZ\xb2\
-s\xb6\xcc\xdc|\x81\xcbl]\x943\xc6'_\x1b\xeb\
-)\xcb=\x89\xa0\x11L\x94`\xa0\x87%+\x0ciL\
-\xdc\xc4U}\x17k\x84\xdc\x89\xf8\xab\xc2u\xbdZp\
-\xe0L~\xb3\x9f-\xea\x9e$\xbf\xca\xb2\xe6\xff<\xff\
-\xf7<Gng\x5cw\x15\xde5\xfc\xe7\x88\xae\x0bW\
-?\x1d\xae\xd7\xa5_\xd7\x9bV\xc5\xbf\x1c\x16\xfb\xcd\xc0\
-\x9d\x8bF}\xf8M\xc3\x94\x0d\xbb\x8b\x0d\x81xY)\
-\xfe\xcd$|(\x02\x17\x08\xed\x22rI\xb4^3H\
-\xc0x+\xa6B\xd9\x16\x94UI\x19\xb2\x0e\xbaR\xb3\
-fu*\x0c|\x97\x9f<\x9a)\xd8F\xd5\x06d\xee\
-\xe2&qE\x5c\x144hF\xec\x1a\x16?\xa5@v\
-\xb8B\x80\xc8\x5c\xa3n\xe1$\xd5\xd9\x96/$\xbd-\
-\xe8\x90\x5c\xe1~\x0dw\xf4\x02\xa9D\x22%\x94\x0eI\
-qj\x0c(\xc6\x94\xb4\xaf\x89\xa6\x8c\xa7\x98'\x8f\xaa\
-Yb\x15~\x83\x12\xe9\xf3#\x02Fb\xe5\xc4\xd02\
-\xdam\xc3b\x94\x19\x92S\x84\xb7\x19\xb7l\xe0\x93|\
-D;2?|\x16\x1e\x0bn\xdd\x9f\xac\xb1}Lq\
-@=\xec\xb5c\xf2<\x9e\xa7\xed[*RhS\xcb\
-=\xe7*5\x80[j\xbaI\xab\xdd\x02\xb0\xc1\xe6X\
-\xeb\xbe6d\xbc\xa6\xa71;\xe11\x85\xbb\xdf\xcd\xc3\
-7\xa8\xd7\xd2\xd5\xd2<u\xb9\xd2\xfb$K\x9b\xdb<\
-\x9dg\xd7\x9de,j\xb5\xe2~\xe9bK\x16\xf0\xdb\
-\x86M9\x80\xb2|o\xd1\x0c)\x97\xfc>cMe\
-}w\x07\x97O\x17\x81\xc2\x13}\xa7\xfbSN\xe1\x11\
-\x1e[\x8dJu\xe4\x8e\x5c\xdft\x14\x1e\xb8\x8b\x8c\x03\
->\xc5\xf2b\x0e\x5c\xb79@\x85\x02s\x1b\xef\xb5\xc4\
-/7X\xc6q\xd7\xd5\x1f\x19\xabid\xf3\xc3\xb0+\
-\xe8o\xc0p\x06\xa7Q\x9b-r\xb3S\xccFr\x8a\
-\xbc\xf4\x971\xee\xeb\xdd\x00\xb2\xed\xd0\x8fe\xcbG\xdf\
-\xd2\xe8\xf8z\xe3\xa6\x5c\xb2k\x1a^\xdc\xcf\xff\xe5\xcb\
-\x83\xed\x14\xf0\x9b\xe6\x87`\xc1r\xfb\xfdhD\xf0\x9a\
-m\xe0B~\x01\x126\xede\x1e\x97/W\xd9\x99\xe1\
-\x09\xb2\xa5|\x81\xb4\x9d-\xfeb\xe7!\xd8R\xbf\x22\
-z4\xdax\x15\x9f<m\xdaO\x22\xf9\x0f\xfe\xff\x07\
-\x1c\xfa\xf8C\
-\x00\x00\x0b\xdd\
-\x00\
-\x00:\x03x\xda\xcd\x1b\xdbn\x1b\xb9\xf5}\x81\xfd\x07\
-V\x0f\x1b\xa9q\xc7N\xba\x01\xb6\xca\xa6\x0bGv\x12\
-\xa3\xb6\xe3DN\x82\x22\x08\x02j\x86\x92\xb8\xa6\xc8Y\
-\x0eG\xb671\xd0o\xe9\xa7\xf5Kz\x0e9\xf7\x9b\
-F\xb6\xd3\xad\x1c\xd8\x1a\xf2\x90\xe7\xc2\xc3s\x9d\xf0U\
-\xa8\xb4!o\xcc\x9b\x98\xfb\x17\xdf\x7f\xc7K\xcf\xde\x07\
-.\x03uY\x1b\x9e(i\xb4\x12Q\xeb\x84wB\x0d\
-\xd3\x9c\x8a\x1a\xc41\xbdV\xb1\xa9\xaf<\x00`\xb5\x80\
-q\xfcqh\xc9\x97\xef\xbf#\xf0\xe1\xc1\x98\x5c&\x84\
-\xe0\xf3%\x0f\xccrL\x1e=\xda\xdbs\x03K\xc6\x17\
-K3&?\xe1\x80\x1b\x9a(\xd8^2i<%\xf1\
-\xbb`\x86\xc16\xc9\x8e\xf8\xb9\x22\xcf\xc8\xd4\xd7\x8cI\
-\xcfnHv\xc9c\xf2\x17\x92}\xcf!\xafsH\x87\
-)\x01\xcd\x1f\x1c\xecM\x8a\xdcp#\xd8\x98\xfc\x16\x9d\
-\xeb\xe1`_\x1b\xb6\xe2\xd1`\xe4\xe6\xd6<\xe23\x9c\
-5:fn\xc8\xfd^\xa9\x80\x0an\xae\xc7 \x12o\
-?\x0c\x05\xf7\xa9\xe1J\x9e\xe0\xb8\x03\x99\x0b\xba\x88\xec\
-\xfc\x87\x828\xdc\xef\xdd]\xe2\x06#`\xc1,A\xc6\
-$\x0eC\xa6\xc9\x8c\xea\x14\x22_\xffB\xd3\x15\x13,\
-\x8a\xdc\x9aW\x5c\x9a\x94\xf8\x88/$\x15D(\x1aL\
-\xed\xd7!L&\xa3G\xc1\xa8\x04\x14-\xd5\xe5\x99f\
-\xf3a}\xf8\xe0\xf9\x8aJ\xba`\xbaanB\xcdI\
-\xe3\xa4\x0a\x99\x04\xa4\x87\x017J\x0f#\xa3\xb9\x5c\x10\
-s\x1d\xb2\x1d\xb2\xa6\x1a\xa1>\x87\x14H\xdf!3\xa5\
-\x04\xe1\xd1g\xc9.\xeb\xfbOC\xea\xb3\x0f\x8c\x9ae\
-\x0d\x83\xbfd\xfe\xc5\x0b\xa5\xdf\x85\x01hhe2\xb6\
-\x83\x07\xb3\xc6\xe1\xe4\x1c\x1b(>\x98\x1dp\xcd| \
-\xf9\xba2\x0b\xd4\xc1n\x09\x1f\x12D^\x9efWx\
-\x05r\x88\x10(.C\xb8KR\x83p0\xa1\x06\xec\
-\xda\x5c[\xd9\xe0y\xb1\xe0\x98G\xa62i%\x95\xb0\
-\xb0\xa6\x5cP\xab}s*\x22\x96n4\x8f\xa5\x8f\xaa\
-FB\x15\xc6\x02\x00q\x9b\xa1#!\xc2\xef\xa3\xe2\xc5\
-\xc91\xc1\xbd(\x00\xe5\x10\x86]\x99\x17\x9c\x89`\xca\
-\xa8\xf6\x97\x1e\x93\x884\x00\xf0\x5c\xe9\xed]\x00\xba\xfd\
-Xk\xb8\xa6G2`x#\x05l\xf4\x9e\xb3K\xaf\
-8\x9e\xaf\x00]\xd3,ZZ\xfaF\xf90(\xff\x94\
-\x19\x02\xe7]\xdeoF\xfd\x0bB\xe7`\x8a\xd2\x95V\
-\xa1\x00L\x94\x08\xe6s2,-\xfc\xfb3\xb2G~\
-\xf8\xa1\xbc\xdb\xcfv\x15\xdcG&<_\xc5\xb2,\x16\
-+\x9a&\xea\x81\xabffn*f#;\x86\x12\x97\
-%\xd1\xe7\xf8\x05\x88\xb6(\x82\xb9\xd2d\x88\x02\xe5\x80\
-o\xef)\xfc\xf9\xb9pR\x9e`ra\x960\xfc\xf0\
-a\x8dj\x5c\x85\xca\x89\xe2\xcfV|\xe4\x9f<\x1c\xf4\
-\x8c:V\x97LOh\xc4\x8a\xf8\xd2\x85\x01\x8b|\xcd\
-CKwu}an\xd36\x91\xd5\x14\xd4\x90\x8a\xee\
-\xe0s\xd7b<:K'\x97\xbe\x88\x01\xe3\xd0m5\
-\x22_\xbf\x16\x89\xab\xcd\xd7\xc4P\x160\x05\xe3)\x83\
-a\x89\xa1\x0a\xea\x9b\xdaQZ\x82\xc0LL\x96T.\
-\xdc\xb2\x94\xde\xfa)\xd7\x00\x8b\x049\x99\x08\xb0*,\
-\xf8\x0c\x97,\xb9\x1a\x8e\xb6\x053\xc3FU\x1b\x95U\
-\xba\xb4\xc1\x9f\x9e=#1\x00\xcd\xb9dA]ss\
-s\xdf\x07\x8f7=z\xf9\xf9\xe8\xa0\x22\x10\x06v\xdb\
-mr\xc2d\xdcz\xedo\x08\x03\xe3S\xa5\xa0uq\
-b\xaa6\xde\x1a{%\xb6\xba3%K\xf6\xf1S\xbb\
-\x01\xab\xadl\xb7p\x05j\xeb$\x0a\xe5_ wC\
-\xa3\x16\x0b\xc1Jt\xe2\x815\x0c\xe3\x07\x9d\xcc\x0b.\
-X\xb7`\xac\x10\xadG\xe9\x07\x0b\xce\xa9\x8f\xbc\xd3\xb3\
-\x01\xa7\xcd\x16\xe0\xe26\x9cN\xe3\xd9\xb60PV\x8b\
-N\xfa\xeb\xa0m\xe47l\xdaN}E1\xdb\xcem\
-\xa6\x8cQ\xab#9W\xcfA\x0fV\x107A\xf0\xb2\
-C\x92/\xe7\x10\xa0\x94\xce,\x07?\xa63P<\xd4\
-\x16@\x96\x80\xe7p\x11Dj`\xf4\x86m\xfb\xf8`\
-\xef\xc8\xe0\x92j\x09nk0.sUE\xe2+\x01\
-.\xe0\x19I#o70\xcc\x1e\xdf\xb2\xa0r]g\
-\x9a\xd1\x8b*6\x0e\x1bn\x8d\x0a\x9c\x0f[hp\x89\
-A'\x86V\xf9\xa2~\xbcd\x92i*\x5c\x1eP\x14\
-\xc9\x8e\x8b\xa73q\x97D\x14X\xf0d\xadWX\x95\
-\xcb\x1b\x9f\xda\x16\xd8\x9dQ\x0f\xf0\xef\x86]\x9bN\xb0\
-\x0c\x88l\xb4\xdb{\x1b*Z\xf8\x03u)\xd1\xf6@\
-\x5c\xb7\x1d\x9f\xf9\xc2\xfe\xac\x16\xd6tr[\xdf\xbb\x9d\
-\xe1\x02l_\x9e\xdf\x95\x82\xe8\x0e\xb6w\x08\x8d\x8dj\
-`\xbe\xb4C\x7f\xfe\xcb\xcb:E\xd0\x88\xa1]\x0ae\
-p\xa4\xda\x8d\xc0\x0a|\xe8\x06o\x94\x9b\x13\xd5I\x82\
-\xb8\xe8\x1c w\xad\x8a>\x9f\xb5\xa9c\x9aQ\x16\xcc\
-\x8b\xa12\xa0:x\x1e\xc3\xf5\x95\x90\xf8\xb9\xed\xbd\x09\
-\x95>\x13\xe4k\xfa\xfcO\x16\x15\x97)\xb9\xef\xfb,\
-\xac\xe6\xcb\xf8\xa9&HM\x97\xba\x07\x0f%Ild\
-\xa3\x9c\xc9\xe4b\xfe\xb6\xac\xa2;\xceq5\x06\x8b\x95\
-\xbc\xf0i%:l\xf4\x84\xf8\x81\xfc\x1bO\xff\x9d\x16\
-\x87W`@\xc1\x85\x89\xeb\xe1`iL\x18\x8dww\
-\x17\x90\xbd\xc73\xb0\xb1\xab\xdd}\xc8\x02\xde\xc3,\xbb\
-\xde\xcd\xaa\x08O7\xc5\xa0\xdb\x1cDb\xb8n\xadI\
-\xaf/\x1aq6#;\xc5d\xb8\xb8\xeb\xd5\x98\x0c!\
-\x9d\xc7\x22\x8d\xab\xba$\xd5\x97Q\xa5\xfc\x92\x83%\x15\
-\x97\xb4\xf4\x92\x00\xb6\x90\x9f\xf95\xa1\x22v\xa6\x04\xf7\
-a\xa73\xc8pC\xefT\xed\xc3\xd1Np\xa2\x1f\x9b\
-\xb9\x069\x8d*\xae\x9a(\x11\xaf\xa4\xabkU\x8f\x1b\
-\x80\x97JG\xde\x9c\x0b\xa0\xcbqQ\x86\xb0\x1e\xb5I\
-K0hHkH\x87\x12SX\xcc[m\x9e\xa6\xe6\
-\xee;\xbb$\xa0\x81t\x06\x8e{<\x18\xd5\xb7p4\
-y\xce}\x9fP\xbd\xe0rL\x1e=\xa9\x03\xce\x15\x08\
-7T\x5cB\x04\xfe;\x03\x98\xc7\xadZ\x86\x9f\xf34\
-\xfam\xa2\x1b\x0f\xdc\xd6=N\x81\xd4V\x9aP \x1f\
-\x5c\x1d\xaf\x1e\xb0\xd9[/\xa8\xcf\x96J\x04L\x9f\x17\
-$\x81\x9b\x0e:\xf3\xb0^\xb7\xdb\x15f22m\x84\
-\xd6a\xd30 mV\xed\xa4\x84c\xe7\x0a\xe9\x81+\
-\x00\x0e\xce o\x00\x1b\x00:\x00\x9aF(\x89\xe8\x9a\
-\x81\xb0\x91)\xcf\xf3\x06\x85\xec\x1d#^HR\xc6\x05\
-T\xde\x14\xa0\xf11\x07\xc3\xd3\x87\x11P\x06P\xce\x8f\
-\x83}!\xec\xca\x88\x0c\xff<\x1a|\xea\xc9{^u\
-J\xd2C\xc4q+\xe6\x93\xeaTO\xe6\xd7T\xf0\x80\
-\x18\xaa\xbd\xc5\xef\x04\xb3&\xbef=\xa4\xf0:\xc9\x1d\
-\xeeY\x0aye\xad\x9f\x14\xf6g\x95\xeb\x8d\x02\xa08\
-X\xe4?\x03?\xab\xd8\xdcnC \xd8\xdc\x9c\xd1 \
-\x800\x1f.\xdf^5\x93(M\x15K>~\x1c\xd5\
-\x8d\xf5?\xd85\x84\x17\x12\x03\x853p \x112\x9f\
-e\xf1\x5c\xfa\x9a\xad\x00\xf9\xa4\x90\xce\x17\xddy\xb2\xfa\
-]X_\x1b\xb0\x96\xb5\xf9\xea%\x83\x8cZ\x8f\x09\xa6\
-Y\x90*\xd5\x84\x0e\xdb\x19\x15>\xc7\x92ty\x06\x17\
-4Z\xc1b)\x1d\x8fh0\xaa.M\x97\x1f\x81\x87\
-l\xda\x227\xa6\x03pA\xe4 \xb1\x98e\xd5+e\
-\xabr\x02\xce\xe2\xc2*M\xc1u%!\xdbM}\xd1\
-\xcd\x1dH:\x86XnK\x9a*\xe5\xf5m\x08\x9a2\
-\xac\x9f\x1b\xc8\xde\xbe\xdc\x8a\xe8\xfc\xd6\xa79z's\
-G\xae\xc7\x93\xb2\xd7\x83\xb7\xa2I\xb9g\x81\xe7\xe6\xba\
-\x17\xed\x87W\xdb\xd2^\xf4\x05\xed\xb4[\x13\xec\x0a\x10\
-\xe3\xa6Z\xcb7?\xbfj9\xa4[\x0a\x00L\xce\xe9\
-\x22\xea\xa9\x97\xc5\xd6\xce\xff#\xf3\xc5JT'\xe3\xe8\
-v\xb2\xc3'/\xac\xcf\xee!\x83Z?\xe8\xbe\x85\xd0\
-\xc3\xa4`G\x8e\x81\x81\xf6Y\xdfSs=\xbc{\xb6\
-l\x87W\xdc\xf4\xc0\xef:\xbb\x9e\x8d\xd2\xfb\xd1p\xd3\
-\xd7y\xe0\x81GY\x8dp\x83sq\xc5\xc4\xdb\xb9\x97\
-$\xe6\x9dv\xe0\xeas\xe8eO\xd5\xcb\x17\x94;\xa6\
-\x0f\x1c\x05\x0fv\xc8\xc7O;60\xb8_\xebY*\
-\xd1\xdf\x99G$\xda\xbb3\x97\x16O\x0b\x9b\xb7\xd2\x9a\
-\xb2V`+\x99$\xbd\xe4;\xc5\x1e\x13\xec<\x93\xb7\
-\x0c}D\x0f\x96\x9b!l\x96\xda\xd2\xe1\xde\xc0\xff]\
-D\x92\xc5\xba\x9d\xf7(\xb9\xc9\x95^3\xf9%\x11\xe5\
-+&B\xf2\x9f\x7f\xfd{0\x22\xe3\xc2P\xb3Po\
-\xab\xa2\xe5\xfe~\x84\xe0\x9be]{+\x80\xb4X\xed\
-\xe6Q\xec>\xab\xb5\xa6\xd8k\x5cs\xbaR\x84\x0b\xe2\
-CJ\x8d12\xd2\x8b\xafap\x191\x0dn\x01\xd4\
-!2\x8a<\x84\x1c@\x08.\x15\xd1*\x8aT\xf3\xc6\
-\x85=\xc6\xe4\xad\xbal\xae1\x94t\x03\xf4\xa2\x96D\
-\xf4\xe3\xa2\xb3\x18\xd1V\x98pJ\x8d\xbd\xe7D\xe0\x83\
-Q\xf7b\xac44\x9e\x92\x873\xddkm\xdb\xa1y\
-q\xda\xd1\xf9\xa5\xa9'\x01\xea\x96\x8d.\xb94XO\
-\x98\xe0^\xdd\xe8\xfaV*:\xee\xdbf\x89\x83\xee\x9c\
-%\x8a\xf0\xb6]\x11\xf0\xf3\x16\x22\x0a*\x17\x82m:\
-\x1f\xbc\x06I\xa1Vm\x90h\xf2&\xd5O\xddP\xd9\
-\xebU\xdd`\x9a\x06\x1c\xf3\xd1\x1f{\x9db\xff6U\
-\xf5\x93\xbdA\xd5bo@\xa4h\x22#\xb8\xe2\xe2\x1a\
-\xeb\xb8\x0e \x22\x90t\x13\x9a\x82\xf5:{*\xc0\xd3\
-`\xc6\xeb^\xca\xc2\xa7\xf7\x13\x86\xc5\xb8&\xfbT\xfc\
-L\xd9o1\x00\x02G\xfb\x92\xaf\xa8k\x86`?\x04\
-\xee\xa7\xb9\xdet\x84\xae9\xadB\x90f\xb6\xdc;\x92\
-s.\xb9a\x9b\x97\xeaXJk\x05\x9a%\xb4y\x83\
-\xd3x5c:\xa7\xfc\x0b\x99k\x056\xe8\x91\xb7\xf7\
-\x14\x12\xf81\xd9\xf3~|J\x82X\xdb\xe91y\xfc\
-\x04\xc6\x19\x8d\x00\xa9\x87\xafk\x8d\xc9\xa1{8\x92\xaf\
-c\xf3&\x86\x14\xf7\xe6\xf6X-2\xc4j\xd1\xe7X\
-\x9f\xec\xdd\x15\xeb\xcd\xd6\xb7\xf9\x7f\x99lg\xe1\xbc\xfa\
-\x15\xee>y\xa5V\xb0\xe1\xa2O&\xda\xd8ax\x90\
-v\x18\xe0\x1eDk\xdbV\xb0]\x86\x07\xf7\x1d\xf8\x1f\
-(?\xc6Kc\x8f\xe9\xce\xd4\xe6M\x10/i\x8dp\
-\x95\xb6C\xee\x9d\xf4)\x18\x0e\xb0\xb4\xaery\xaaL\
-\xaf\x0c\xaa\x9b\xfe\xce~\xce\xeeL\xa8\xd9\xee\x8aF\xb0\
-nw\xf2j\xff\xf4\xe5\xe1\xf1\xeb\x97\xde*x0\xfa\
-\x034\xcd\x05\xa7\xe4(\x8ab\xf6\x8d\xf9\xe6\x88#\xfa\
-C\xb8\xb4\x95\xdc;E\xe0\x85\xb2o\xa9\x8f{\xab\x08\
-\xbc\x91\xed\xb9\x02\xdd\x03/\xd9\x18\x90\xa1\x83\xaf\xbc\x92\
-Q\x06p\xed\x1c~\xc5Ds;\xa7Tn\xae\xb4\x83\
-4\xfa\xfa\xb6\xc9J9\xfaI\x0b\xf5\xad\xa1\xea\xe6v\
-X)\x80-Ou\xf5\xd9\x0a>{E\xaf\xf8*^\
-%!\x1bx\xa6&U\xe9\xec`e\x95\xea\xf2K^\
-\xcd\x80\x09\xd6\xd0\xd6\x5c4\x0b^%\xc1\xd2_\xff\xd6\
-\x09oT\x986\xe4\x9e\xdc>\x91n\x0bQ\x9b\xa1[\
-Zj\x8e\xbb\xb6\xc0]I\x1b.\xbb\xf7\x14;oE\
-\xcb\xbb\xb9\xb7\xf1\x9e%\x05ja=\xe9JtQ\xc4\
-\x0b\xdd\x8b\xae\xa4g\xbb8\xbf\x00\x9f\x1ev\xf7\x82%\
-\x00\x09\x04<Qkv\x90\x85/\x1d\x19\x9a/x\xb8\
-i\xd7\xa9\xaf\x95\x10\xcf\xa9\xf6\xd6L\x1b\xeec\xe3;\
-{\xd7\xbf\x93\x8cq1\x97\xa8\xc5\xe3\xd4\xf7\xe1V>\
-\xcd\xc2\xf9']Q\x12\xd8\xcbB/(\xd7\x92\x86\x97\
-[;v\x09\xc0\xe1.\x00\xff\x98t\x99\xef\xea\xa9\x1e\
-$\xabz\xa58\xa9\xbaxk\xfce\x07\xfb%=\x8f\
-\xf76e\x0a\xd6B;\xdf\x82\x9d\xc9\x0d!\xe7\x89\x8a\
-#\x06\x0e\x91\xf6\xc9\x016\xdb\xcb\x0dN\xac\xed\x85t\
-^~\x13\xfd~b\xe3\xe4\x0d\x0c&\x9c\xb8\xedK\xb7\
-}\x0f\xd3\x02\xdf&\x1ao\x9e\xc8.\xc7&\xf3\xd0y\
-c\xb6\xbe\xe9\xd47|\xcd\xba\xa0nQ\x94\xeb\xe9\xf7\
-\x1ar\xd5c\xf0\xf3\xe4k\xf6x\xae\xc2\xce\xf71\xba\
-y\xec\xefk\xce\xe9\xacC\xf2\xd6\xb3Z\x88\xfb\xf0i\
-\x88\xcb\xbe\xad\xd3u\xd0\xc5\x8a\xd5\xf4\xe8\xe5\xe9\xfe\xf1\
-`\xb4\xa5Bm\x8d\xe7\xc5\xd1\xf1\xf9\xe1\xdb\xe9\xe0\x8e\
-\x9epj\xa8\x7f\xd1]\xf7+^\xedT\xb4-\xff}\
-\xa6\x9f\xda\xbcr%\x8e\x82\xe6dE\x8f;\xdf\x92\xed\
-Nw\x93;p\x8d\x80\xea\xbb\x16mZ\x17e\xd0\xf7\
-gh6Q\xe8\xdeS\xe9K\xe1<\x83\xbe\xa7\xc2D\
-{\xae\x91\xfc\x81\x7f\xff\x05A\xa5\x8d\xb6\
-\x00\x00\x08n\
-\x00\
-\x00r{x\xda\xed\x5cos\x9b8\x1e~\xdf\x99~\
-\x07]fn\x9c\x5c\xce\x0e\x12mo\xeb\xbb\xbep\x1d\
-\xe7\xcf\xb5N\x5cp\x1bw2\x99\x0c\xb1\x15\x87\x14#\
-\x16H\xb2\xdd]\x7f\xf7\x95\xc0vD\x0dH\x8a\x1d6\
-)0\x9d\x06\x83\xf4H\xcf#=?\x04\x08\xd9\x13\x8f\
-\xf8!\xf8\x14~\xba\xb1\x87\xdf^\xbe\xb0\x13\xbf\x1b'\
-\xb6;\x22wK\x87\xdb\xc4\x0d}\xe2\x04\x99'\x1a]\
-+\xc4\xbem9K)>Z\xdf\xc9MHs\xbe|\
-\xd1\xb3\xc6\x18\xfc\xf1\xf2\x05\xa0\x9b=j\x82\xc0\xb3\x86\
-\xf8\x04[\xe1\x15\xf6\xdb7\xbe\x8f\xdd0>i\xb9\xc3\
-+\xe2\x07\x8dK\xdbq\x9a\xc0\xb3\xe23\xf19rq\
-\x8d\x87\xe1\x915\xc1M\xb0\xc1#\xec\x11\x1f\x0f\xad \
-<\xbe\xb8\xde\x98'\xbe\xbcq\x87\xa1M\x5c\xe0\x10k\
-4O``V\xc1M\x8f\x04\xd8\x1e\x11\xf7|d\x85\
-\xd6\xd6\xbc^Q\xdd.A\xf2\xecim\xef\xd8h\x9b\
-\xfd\xda\xd9i\xcd\xfc\xdc\xed\xb6\x8c\xaflw\xff\xdc\xe8\
-\xf4\x8e\x0dvX;\x03\xef\xde\xbd\x030\x81\x13aM\
-(\xe9V\x18R\x06\xb4\x1e\xfbq\xd9\x8d\x80\xdc\xf8C\
-\x0c\xde\x81\x8d_\xfdas\x87\x95\xb1\x13\xa5\x0cv\xec\
-!q\x83\x9d\x11\x95\x92\x8c\xcf\xef,\xdfm\x04\xb7\xe3\
-\x8d{\xd0)\xc0N\x80\xd7[\x8c\xed^\x92\x1f\x8b\xb9\
-\xdfu\xac\x0b\xec\xcc!C\xfc[H\x01\x15\xe5\x81g\
-\xf3\x16Q\xd1\xd7T\xd6\xd7,F_s\xfd\xfa\x9a\xea\
-\xfa\x9a\xab\xeak(\xebk\x14\xa3\xaf\xb1~}\x0du\
-}\x8d,}#\xc0]\xeb;\xfc\xe6\xa9\xe0\xf5\x8c\xce\
-\xf9n\xab\xdf1#\xbd\x97\xe1\xd0\xc3\xe1`\x0a\x9c\xfe\
-p8\x94\xa0{k\xf9 \xb4'\xd8\xb0\x5c\xaa<\x85\
-;\xadiZ]\xd3?\xf7k\xff\x065M\xafko\
-f\xbbo\xea\xda\xdb\xd9\xee\xdb:D\xf1.Du\xf8\
-z\xb6\xfb\xba\x0e\x7f\x99\xed\xfeRG0\xdeE\xb0\xae\
-it7Q\xe8%\xf1\xc1&+\xd9\xa6\x05j\xff\xa5\
-\x7f\xfe\xc7U\xa2\xe1`w\x1c^\xd1\xc3\xdb\xdbK]\
-6Q_\x9a\xfb>\xdb\xa9}\x96L\xba(\xe5:.\
-\xe5\x9a\x96\xa2\xd3?)\xa8sdz\x81\xc4\xbf\xd1\xd4\
-\xd7\x8d\x90\x98\xa1o\xbb\xe3\xcd\xad\xf4\x94QC\xb0\x0b\
-\x15M]\x8b~|\xf0j`\x1bl\xda[\x5c^v\
-\xe0z\x1bn\xc9\xc1\xf5\xe5\x1b\xf4\x9bG\xff_p?\
-;\xbd\xa6\xc7X\x7f\xb8\xb1\x9c\xdaYz\x11C\xe2\x10\
-\x7f\xc5\x22\x22\x8cd[\xce7|k9\x9b\xf7\xaal\
-\x83\xda\xbc\x83.\xb8\xd5R\xc8\xb3pv_\xb3\x7f\xd0\
-0U\xab\xa56OF\x19Q^Z\xc8\x02#\xad\x90\
-i\xf2\xd0\x94\x0fXtK\xb5\x7f\xe7\x96\x86+\xa1\xc7\
-\x84\xb6W\x87I\xb5\xbb:\x0cZ\x8ej\x11\x88\x095\
-\xb5\xebP\xcf8~\xcf\xf6<\x9f\x5c\x980\xbe\x9cP\
-\xe5\xc1?k\xe9\xf0pEx\x98\x0f\x8fV\x84G\xf7\
-\xf0i\x05t\xf7\x1c:\x22\x15K\xd4\xfe\xd82\xcd\xf3\
-\xaeH\x8e\x18\x0e*\xc0A1\x1cR\x80\x13\xd0\x1d(\
-\xd1\x1d\x88\xe8\x0e\x94\xe8\x0eDt\x07Jt\x07b\xba\
-=%\xba\xb4\xef\xf4\x8f\x8fD\x9c{J\x9c\x17\x98P\
-\x8c\x89T1\x05\xec\x0dh Mm\x90\xc4\xdb\xc7\x10\
-\x9a\x9f\x15\x00W,\x00\x8a\x0a@+\x16 \x12I_\
-E\x22](\x91\x0eW\x84\xcf\x17HG+\xc2\xa7\xca\
-\xc3\xc6\x0fcLZ\xf4~\xfb\x16w\xb5<\xf4\xfd\xce\
-\xf1y\xf7p\xf7\xbc\xd5\xee\x1f~\xe9\xa4\xcb\x91\x84\x83\
-JpP\x04\x87\x94\xe0\xc4t\x0f\x84t\x0f\x0e\xf7\xe5\
-\xe9\x1e@%8\x11\xdd\x03\xa4\x04\x97G\xb7k\xbb\xc4\
-\x97k\xdc\xee\xe1\xd1\xb1\x91K6\x06\x83*`P\x00\
-\x86T\xc0\x84D\xe5\x9aU\x92\xa8\x5c\xa3J\x12\x95k\
-R)\xa2\xd6\xb5t\x8b\xb6\xfe/\x22\x1a\x81A\x150\
-(\x00C*`B\xa2\x92-*GT\xb2E\xe5\x88\
-J\xb6h\x1e\xd1\xfb\x10\x1f\xfb~q\x91\xe2\xc32\xcb\
-\xb6\x03\xd8m(\x17\xbd\xb21\xe02\x06L\xc5\x80\xd9\
-\x18h\x19\x03\xa5b\xa0\x8c\xf16\xeb\xf1<\x99y\x14\
-J`\xcc\x1c\x9b\x09\x00\x97\x00`\x1a\x00\xcc\x04@K\
-\x00(\x0d \x8b\x04k\xe4\x04\x89\x99\xf1\x92\x10q'\
-\xcd\x04\x80K\x000\x0d\x00f\x02\xa0%\x00\x94\x06\x80\
-b\x80\xe9\x9cK\x9b87\x137~\x94\xcf\xdfy\xa7\
-?\xa8\xff\xf1\xaco\x8f\xafh\xf1\xfe\xd8v\x9b\x00j\
-\xcb\x09\x1c|\x99{\xfe\x82\x84!\x99\xe4\xa5\x08\x89\xc7\
-\x9f\xbeO\x90Us\xb6\xc5G\xa3\xca\x1f`V\xc7&\
-\x08\xfd\x1b\x9c\x99\xe8\xc4\x1e\x85W\xf34?\xa6\xa22\
-\xa7=\x93`r7\xc1\xafA\xdf\xdf\xdc\xa0~\xee\xb4\
-[f\x1f\xcc\x86W\x1b)\xcf!.\x09\xbd\x89\x1fZ\
-\x9e\x1dZ\x8e\xfd\xbb\xc5\x9e\x866\xc1\x1e;hN,\
-\xc7i[^\xb0\x9ciVG\x9ac\xecNh\x134\
-\xc1\xa7\xb0\xd1b\xbf\x0e\xda\xf4'\xf6\xc1\x9f\x8b#_\
-\xe2#K\x8f;\x92\x07\xf6|\xf6\xf4\xe4\x8f\xcc\xa2\x04\
-r\x88\x94\x97\xeb?\xfc\xc6\xde\xf4\xd8\xee\x986\xef\xeb\
-\xb4\xc2\xd8f\x90\xbb\xfc\xd2\x128H\xcb\xc2a\xdb\xe1\
-\x84{W\x95\xb5\xb1wX\xa9/^\xf2\xb3\xc5O\xb5\
-M\xfbw\xdc\xb8\x9au\xbbW\x9at\x96\xbbXuQ\
-\x0e\xa6h\x97\x8cp3\xa6\xd2\xe8\xf98\xc0\xfe-n\
-\x05\x1e\x1e\x86{vN\x1d\xa7y\xc2\xc8\xb4\xaa\x92\xbf\
-\x1e\xde\xc1\xa4\xfc\xb7\x16\x7f\xe5\x99z\x1f\x13*\xb0\x8b\
-C{\x08\xa2\xeb\x98\x1d~O3vjE<b\xbb\
-!kV\xda\xaf\xa18O\x966yy\xa6k\x93\x8e\
-uw\xfe]\xa08\xc7\x9doyq'\x8c\x0ai\x9c\
-\x10\x7ftB\x8f=\x1aS\xc5S\xd3'\x1cJL\x19\
-\x91Wpy!\x91\xe8\xef\x0e%\x92=\x9b\xf7\xb3I\
-\x1c:,7\xac\x91\x1d\x05\x07`\x86\xc4\x9f\x04\x8f\xe5\
-\xe8\xb5\x84\xa3'\x12\x16\xccg\x17\x16\x1e\x02\xf9\x0cC\
-\x89Q\x85\x12\x99P\xf2\x08\xc1\x84\x85\x11\x02\xde;\xd6\
-\xf0\x1b\x9b\x04UE\x11q\x141\x9el\x14)*\x8e\
-(\xbc\x9a\xe6+\x95\x19h\xd6x\x9b+\xf2\x99\xf4e\
-Z~\x94\x9f\xdb\x83x\xaf\xe9\xf5\xdd\xd6W\xf0\xc1\x03\
-\x87G\xbb\x9dA\x96\xd5\x1el\x95\x95\xef\xb13{Q\
-\xe6\xbd6\xdb\x86\x8e\xed\xe5u%\xc5h\xb6\xef\xdb#\
-q\x98\x94\xbf-\x8f\xaa\x18u\x0a\x93\xbfA\xcfJ\xea\
-\x93\xbb\xa0\x09\xde\x8a\xb0h\x9aWy~\x93\x8a*|\
-\xdf\xe8\xdbT\xe1\xcd\xcf\xfd\xf6V^\x08\x9e\xae\x5c\xe6\
-\x22\x8a\xc5\xb3\xc3\xe4+H\xd3\x03(\xba<\xac\xa5\x0b\
->\x0eY\xa4J\x16=c\xb2\xba*Y\xfd\x99\x91\xe5\
-\xeb\x1fM\xf5+\xc85\x1f<\x0dJ\x09\xc5?0\xe6\
-gcF\xe3H\xf0/\xa05t\xc1h\xf7\xc7Q\x16\
-\x92H\x7fA\x9c\x91\xc4e}\x8dj\xa0J\x0dN\x0d\
-\xbd\xf4j$\x8c\xc9&\xde\x16fLX\x19\x93W\xa3\
-2&\xafFe\xcc\x841\xd94\xf8\xc2\x8c\x89*c\
-\xf2jT\xc6\xe4\xd5\xa8\x8c\x990&\xfb(\xa50c\
-\xea\x951y5*c\xf2jT\xc6\xe4\x8d\x19}\x22\
-V\x981_U\xc6\xe4\xd5\xa8\x8c\xc9\xabQ\x193a\
-L\xf6\xc1fa\xc6|]\x19\x93W\xa32&\xafF\
-e\xcc\x841\xd9\xe7\xd3\x85\x19\xf3MeL^\x8d\xca\
-\x98\xbc\x1a\x951ycF\x8b\x19\x14f\xcc\xffT\xc6\
-\xe4\xd5\xa8\x8c\xc9\xab\xf1\x13\x18S\xf2\xf0T\xf05\x83\
-x\xda\x8a\xe4\x1c\x93\xce\x97\xceQ\xdf\x04\xec\x8b\xd8\xd6\
-\xfb\xc3\x8f\x87\xfd\xaf?\xcb<\x13\x95\xe9K\x8f1\x89\
-Drf\x88\xd4,\x935M\x22Y\xf3t\x90\xe8#\
-\xac\x12\xcd\x08y\x00\xdfg=)\xe4\x01|\x9f\xf3\xbc\
-\x90\xd4y\xf2\x22>+OT\x95\xbexp\xea-\x22\
-\x87\x1bE\x84\x82\xe4\x81\x80\xf8`\xecc\xb6.bA\
-\xe3\xc1\xf9\xe2=\xeb\x97\xf0\xc9\x19n\xbe\x90Py\xa8\
-\xa2\x9f\x97\xearX\x89\xd6\xb6\x09\xaah2W\xa5\xed\
-XA\x00\xba\xe0\x92\xe9Rd4\x99\xaduU\x16\x9b\
-\xcd\xd6\xe2*\x17\xdd\x92D\x96\xd8C\x83\xe2=4(\
-\x97\x87\x06\xe5\xf2\xd0\xa0L\x1e\xea\xf9$\xa4c\xfd\xc2\
--\xd4+\x97\x85z\xe5\xb2P\xef\x19Xh\x8d&J\
-~\x14Z\x0dr\x17\xba@P\x07\x06*2\xaeD\xcb\
-]\x96\xc5f\xd1\xd2\x9be\x22[\x92\x8b\xb2\xa1\xffM\
-\x8f\x9a\x0c\xbd<\xde\xd1\xcb\xe3\x1c\xbd$\xbey\xc8\xca\
-M\xe5\xb9\x1a\xc7k2\x16\x19Nf\xabV\x96\xc5g\
-\xb3\x056\xcbE\xb7$\xa1%Z\x0a\xb4\xd0\xe7\xb4\xd1\
-\x1a\xa9\xa5yn\x19-\xe8Z*\xb6e1\x0e[~\
-\xb6P\xe3D\xeb\xf2\x96\xa6+E\x8b\x08\x97\x8a\xedS\
-6\x8e\x92\x08JK \xe6-\x1b4}\x84u\x9b2\
-\xf0\xa7\x8bu\xa4\xe9\xbf\xbf\x00\x06 \xb6\xcd\
-\x00\x00\x03\x1c\
-\x00\
-\x00\x0b\xf6x\xda\xb5V\xdbn\xe20\x10}\xaf\xd4\x7f\
-\xb0x\x01\xa4nh\xfb\x18\x89\x07\x16X\xb5R)4\
-\xd0\x96\xaa\xaa*\x93\x0c\xc4\xadc\xa7\xb6\xc3ew\xf9\
-\xf7\xb5\xc3rIH\x80m\x97\x80D\x9c93>s\
-f<\x81\x04!\x17\x0a\xdd\xa9\xbb\x88\xb8\xef\xa7'$\
-\xb1\xb6\x1e\x09\xf3\xf8d\xebq\x9d3%8\x95\xb9\x06\
-\xab\x85\x15\x08\x82\xe9\x16\xe2\x06\xcfx\xa4\xb4\xa7\xf9t\
-\xf0\x08\xd0\xaf\xd3\x13\xa4/\xe2\xd9H\x86\xd8\x85G\xc0\
-\xca\x07\xd1pj\x9d\x85\x053\xd7\xe7BZCB\xa9\
-\x8dB,\x80)\xe3ml|\xf0\x06\xae\xba\xc5\x01\xd8\
-\xa8\x90vo\x0f\xde\x0aK\xe00b\xae\x22\x9c!\xca\
-\xb1\xd7\x108t\xc0\xf0*\x85\x5c\x02\xf18{\xf5\xb0\
-\xc2\xe5%\x19sQ<\x00\xea\x80\xcb\xc7 f\x96\x82\
-\xa9BU\x94\x80?\x17\xcd.\xc5\x97\xe7\xe2\x12\x86z\
-$\x80\xe2K*H_\xe0YK\x8e\xf6\xc4\xe8;x\
-\x864l\xcb\xbd#\xb8\xe2l\x7f\x80\x05n\x19b\x1d\
-\xc4\xf5\xc1}\xbf\x17\xb49%R\xc9R\xc1W*\x94\
-v\xa52\x99L,-\xa6\x1ccJaf\xb9<\xa8\
-\xac\x22\x03\x1b\x11\x06\x15O\x0be\x85lT8[\x09\
-X\x828LB\xaa\xb8~C\x94g\x8a\xcd\x81\xae\xf5\
-w>\xb5$\x8f\x84\x0b:\x8bO\xf1H\x06\x9e#\xa0\
-\x12\x0e\xdc\xeeC\xb8z\xb3\x8a\xd1\xac\x12\x9be\x05\x0b\
-\x05\x01\x91\xaf\x8c\xabW<\xc6D\xcbM\xc1\x92\xe3\xad\
-}\xd6\xcbyyq?\xdfj\xac\x94\xcc\x91\xa0g\xc8\
-\xd5)\x0d\xb0\xfb\x9e\x90d\x8c\x05\x9a\xfaBsb0\
-A\xfd\xd6\xcd\x95\x16\xc2\x81\x8f\x08\xa4*\x95\xd78\x8d\
-\xb18\x13\x80\xbd\x99T\xfa<\xb9>f#\x93\xca\xaa\
-\x14\x99E0n\xb1S\xd78\xa1j\xb5\x9a\xda\xc3j\
-\xb4o\x9b\x99EZ\xd2\x8dc\x98=#\x19\xfb_\x9e\
-\x9f\x97\xf3\x15I1\x0e\x81\x95\x0aW\xcdZC7M\
-,\x82\x12\x11\xa4\xd2\x92\xc0\xbcRZ\xc9:\xa7Q\xc0\
-\x16\x03b\x93]\xf6\xf9O[\x05\x19\xf9\xaa\x85\x85\xee\
-\x17\x1b]\x9co\x03(\x0cw\xda\x07\x5c)\x1e\xecB\
-(\x1en\x9a\xd7\x80\xeb`c\x90\xadj\xa1\x07\xda\xb2\
-\x0d\x93\x96E\x8aq>W`h\xdb\xb1F\xb9\xa0G\
-\xe2)?\x0bc\x8c-\xee\xe9\xd9\x173\xb0:\xfa\x14\
-\x81\x18CM\x86z*\xfe j\x93\xe4|s\xe1\xf0\
-\xc9\xb6\xd0q*\xfaDd\xb5\xc6!t\xe6\xe9\x0c\xf4\
-\xf0\xca\x8ae\xc6\x98\x8d>dO\x94\x0aN\xb3\xde~\
-h:O\xa8w\xddj\xda\x85\xf2!;\x0f\xb1>\xf5\
-\xb9@L\xc9\x88\x05\xbaGl\xfd\xd2\xb1jfuU\
-\xd7K\x10\xe8\xf7\xea\xc9\xc3\xe2\xc9\xe7\xf8\x9b\xca&\xde\
-\x0eG\xe0\x12\x97W\xbfM\xad\x90\x13\xa6\xba\xe4\xa7.\
-\xf2\xc5e\x0ef\xc0\xa9w@A\xfeSm\x0fk\xa4\
-/+\x90\xc7*\x89\xca\x1b\x1a{\x8b\x98n\xc4\xfe7\
-\xa7\xf6\x84\xba\xbdZ\xef\xbe\x9b\xd5\x86\xf3\x7f\x8c\xbdj\
-\x92\xbfo\xffl\xd4!%\xde[\xe6\x0cz\xf3\xb4N\
-_\xac\xfd\x91D\xef8\xed^\xfbv\x87\xea\xbb;\xc9\
-1\xc3\xf3\x90\x93\xf4\xe9\xe2\xad\xfe{\x1d\x8d\xda\x91\xbb\
- u\xab\x7f\xf4\xf7\x0f{\xa1!B\
-\x00\x00\x06\xd4\
-\x00\
-\x00E\x82x\xda\xed[mo\xda:\x14\xfe>i\xff\
-\xc1\xea\x17\xa8n\x9b\xf1\xaa^!\xf5C\xc6(E-\
-\x85%\xb0n\xba\x9a\x90I\x0cx\x988s\x9c\x96\xee\
-\xde\xfe\xf7\xeb$@\x03\x84\xbc@i\xda\x8dhZ\x89\
-}\xcec\x9f\x17\x1f\x1f\xdb1\x9e\x98\x94q\xf0\x99\x7f\
-\xb6\xb16~\xff\x0e/\xbdK\xb7\xd8\xd0\xe9\xfdZq\
-\x95\x1a\x9cQbm\xac\x90\x9a\x90#\x86!Y\xa3\xb8\
-\x86\x0f\xd4\xe6\x82sQ\x93\x91>hT\xfc4\x90\xc1\
-\xad\x0c\x80\x16\xe86\xaa\x8b\x02\x87\xf0\xfd\xbb6\x1c\x22\
-\xf0\xef\xfbw@<X\xaf\x00\xcb\x84\x1a\xbaE\x90\x8f\
-\x10\xab\xda\x8c\x09J\xaf\x12\x1a\xda\x882K\x1a`B\
-*\xc0\x84^\x8dWG\xfb?\x90\xc6o\xe0\x04U\xc0\
-Q\x00B\xab\xff\xe3hNk2j\x22\xc6\x1f\x80\xc5\
-\x196\x86`\xd83\xe8}\x8f\xa3)\x0f\xae\xb7\x22\xea\
-\x99\xaf\xde\xa3\x18\xd8\x86\xc615\x00\xa1PW\x90\xa3\
-\x8a\xacI-\x84uj\xf4t\xc8\xe1\xf1\x5c`\xe7\xb1\
-\x10\xbf\xc6\xc3\x11\xcf\x12\xe7\xff\xba\x83v\x022\xf5\xcc\
-\x09X\xe2\xf9'SW\x95\x9eZ\x95\xafkj\xe6\xbb\
-xs\x083\xdf\x8f7\x01\xa93 5\x0aH\x8d\x00\
-Rf@J\x14\x90\xb2\x00\xda,\x5c\xa14\x8a'\xdc\
-\x04N\x05m\xa8|\x1eV\x0c\xf9\x22\xb1\x94\x19V\x0c\
-\x11}XOhO.\x04\xcecX\xcd\xa5\xcc|\xf7\
-\xf5&6\xbf\x1a\xc8\xcfb\xf3+K\xfcO\x08\xe3\x86\
-\xa1\xa3\xa9\xab\x9264\x10\x91\xe6\x0a\xb2\xb2+x\xf2\
-\x95\x833\xeea\x87\xa1\xc7\xa8m\xe8K\x9a%\xb0\x8f\
-\xc8\x95\x0b'\xcdz\x94\xb92\x81[P\x01\x19\xf0\x17\
-\x08\x03\x5c\xee\x15L\xd8+8\x07Y\xed\x8f\xbc\xdc\x1f\
-9\xb2;0\xa8;.T\xd3^\xe0\xacp\xb6\x95V\
-[\xae\xcb\x9dF\xeb\xc6\x81hv\xbf\xfam\xe42\xd7\
-\x9a\xb5x\xcc\x82p\x8d\xb9\xa9\xc6lX]oW\xad\
-u\xcb\xb9\x98M\xab\xbdZ\xb7W\xce\x05\x82\x9c%\x02\
-9\x0b\x06\xc9\x97JIP\x04y\x00\x8c\xdcUZ\x8a\
-\x1c\x1b\xc7#_\xc3\xb9\x1c\xdcPl\xa1\x0d0\x9e/\
-\xa0\xa9)F\x8d\xa0\x0a\xf0\x866\x82\xe3\x0bbO\xab\
-\x04Z\xd6\x06\x94\xaf\x8a\xfc\xcd\xc11\x05mo \x88\
-{\x9aC\xbd\xd6\x97%\xac\xe2(\x19Z\xaf8\x0a\x07\
-\x14Q+!\xa2\x1b\xe7<\xc8\xc7\xb5\xa9m9\x806\
-\xf4\x13\xc0\x1fLt\x02\x08\xbaCdi~\x9b\x11\xcc\
-\x1bw\xc8\xc4\xa8s\xe9\xfc\xea\xc4\x03\x90u\x0b\xc1\xf9\
-\xf99\xc8\xb9\x10O\xb5\x8f\x00\x11\x0b\xad\x10\xe5\x97\xda\
-\xf1\xb75\xcfQ\xa4>\xd4\xc6C7H\x89\xa6\x17\xa5\
-u\x86\x90\x11\x01^\xd8\x16\x5c\x9e\xf4\x11\x8b\x00/n\
-\x0b\xdeb\xd0\x18\xa2\x08\xf4\xd2\xb6\xe8\x9f\x102c\xb5\
-P\xde\xb6\x05\x05\xe9>\xe8\x15\xe7\xfa$(\xe8\xb0\x89\
-,\xcb\x97\x13\xce\xf3\xc2\xa1\xc5\xbcz\xdf\xb4\xc9\xa1\xa1\
-C\xa6\x7f\xb49\xa7\x86U\x99\x01H\xad\xb1\x0f\xd8\xfb\
-\xd9^A\x0cK&\x9dG\xa1\xf7^:\xbb*g0\
-c\x10\x05s4\xd2\x84l\x88\x8d\x0a\xc8\xe7\x82\x89\x08\
-\x1aD\xd2\xf4\xa9\x10o\x12E\xc5\xa9\xe9'Y&\xaa\
-RbO\x8c`\x89\x9c\xc7\xabq\x85\xbaDN\xbf+\
-\x803\x1b\x05\x11\x8a\xb8\x12\x8407\x93o\xfa\x0f&\
-r\xc2@\x05\xfc\xb4:,{\xb4\xc8\x0b\x8e\x8e\x83\x89\
-\x07b\xd1!\x99\x14\x1b\x5c\xc5\xbfDn\x9f\xcf\x87\xd0\
-i\xd0\xc4\x1c\x12\xfc\x0b:\x11\xaa\x02.\x9cBu\x02\
-\x09\xa9B\xd3\x0af\x9c\x09.\xb8\x86\xc6D\x98\xb2\x22\
-V3\x92\xec\xbc]V\xc5+b\xe0\xbfE\xc9\x17\xaf\
-d\x1d\xe8q\xbd\xc8\xbf\xce\x91\xae\x9e\xd2\x980\xd5\xad\
-\xe6`\xc1\x94\xf7X\xe7\xa3\x0a(\x94s\xa1\x12E\x9b\
-rk\xf1#\x15\xf0\xb8\x83\xfb\xddz\xe2m\xf2\xbe\x0d\
-\xb2\xad\x93\xae6\xb9I\xfe\x10w^\xf5\xd6\x9b\x96,\
-\x03\xb5-Wk\xe0\xb6&w.k\x0ap\x13\xebM\
-\xce\xbbpL\x82\xb8P\x9c*\x96\xa5b\xbdX\x019\
-\xa9\xbc\x99\xe1Y\x1c2\xd0\x08\xf3\xe7\x82\x89er\x98\
-\xcc\x1a\xc1f\x98\xd3\x84Yl3G\x9da}\xb3\x07\
-$\x0b\xb1\xab\x0f\xa3\xf7\x22\xfa\x97\xc3\x894\xd7#\x04\
-]1\xac\x9b\xb1\xbcbe,z]\x94\xdc7\xf0\xa1\
-\x18\xcd\xe7\xf7\xaa:\xa2\x1384\x10\xc7\x1aP9e\
-\x930w\xda9\xde\xed\xc5\xd5\x22].\xb1b\xfd\x0a\
-R)\x81\x0c(P\xc7\xae\x9c\x9e\x92\xac8Zzv\
-\x01\x9fE\xf5\xfb\xd1\x92\xa3\x1f\x0a>\x12\x91u\x09\x99\
-\x7fc\xed48\x9aD)g?*\x9e\xed%\xa6\xab\
-[_2\xf4\xf7k\xd0\xa4\x97{\xc7Q\xa5\x9b\x1d.\
-\xb68\x13\x06\xc9\xd8A\xd1\xc4SDf\xc9b9M\
-C\xf5)\xd1\xa3f\xd1\xf9\xa3c\xcb$\xf0\xa1\x02\xe4\
-\xbe\xc5\x19\xd4\xb8\xa7U\xa9#T\xd02\xc8C4B\
-\x87R\xd2\xc1\xa6t\x87-\xdc'B\xf8\x11\xbdC\xcc\
-\xbf\xd8\x8a\xe2\x5c\xf2t\x82\xb5\xb1\x10\x83\x01\x1dq\x88\
-I\xachK\x0d\x97\x0d\x09\xa9cx\x83\xbbm:_\
-\xd2I\x1cs\x82\xc4:q}6\xb4\x8e\x92bMf\
-\xeb\xc7\xf3\xb5\x9d\xfd\xf8\x18\xd4DF6\x86\xcc\x8f/\
-?z\xd4\xe4\xa3G\xdd\xd7\xe8\xd9\xddo\x9f\xc5i6\
-d\x08\xdb;\x8e\x95\xb6\xe3\xbc\x9e\xd0\x94r`\xd9\xc7\
-\x08R\x92\x8f \xe57\x1fA+\xd9\xe3\xf6#\x87\x1d\
-F\xce[\x199\xe9%\xd2\x85\xd2\x084\xe1\x14O\xec\
-\xb4\xd7q\xbfE6-\xd4\xf9J\xb2\xe9\xdd\xa3Y\xfa\
-Cw?9[b\x1b\xa9\x07\x1b\xbdtV\x90\xd8F\
-\xca\xc1F[\xcd\xd3\x8f\x1bw\xacc\x19:\xea4!\
-\xa9\xfc\x1dj>\xcb\xf9\xc0\xd7SE\xfe\x06\xd4\xd6\xb5\
-\xac\x00\xb9\xdai|it\xbe\x1d\xce\x06\xd2>\x1b\xf0\
-\xb6\xfd\x17\x0a\xce\xc7=%(\xc49r(\xecs\xa3\
-\x118\xdfn\x00\xf7\xe3\x8d\xca\xce\xd9^\xec\x8e,\x0e\
-q\x97\xbe\x1e\xd9%\xe2(\xee\xc1g\x1a\x9b\xc9[\xe5\
-\xedkg\xce\x854rdG\xfb\xa08zM>P\
-\x1c\x1d\xbc \x0d/p\x96K\xaf\xc8\x0db\xa5I\x7f\
-\xb2\x1f\xfcai\x8fr\x01|\x9f[\x1e\x12\x9e7\x96\
-\xf0,\x12\x99\xb8Y\xd1\x1e\xc2\xdcl3\x08t-\xd8\
-'H\x18\x05\xfd\xb4\x91\xa1=\x80l\xf3\xf2\xd7q\x1a\
-\x11\xafiO\x0fA\xee\x85'\xbb\x1ad|t\xda\xa4\
-\xd48u\x7f\xa6a\xf7Z\xb3\x96\x9e\xdd\x13X`{\
-3\xbf\xbeOW\x9a\x88#\xca\x80\xaaAgfHe\
-\xb4\xabo\xcb\xe8/\x1a \xf6\xf4U\x97I\x19\xd4\xb1\
-vZ\x03\xb5.(\xe7\x80\x88\xf4\xa9\x0cx\xf7f\xcc\
-\xc1\xfc\xa9\x9a\xff,U\xf3\x9f\x1d\xcc\x9f\xae\xf9\xf3\xa5\
-R\x9a\xf6\x17\xcd\x1f\x1c\xe0\x85\x1d@\xb6\x99\xf0\x00 \
-\xfc\x80[\xe9\xd8\xdd\xbb\x10x0\xfcK'\xf9S\x13\
-i\x1c\xe9\xe0\xf2\x02\xb8W/\xd3\xb0\xfe\xec\xd6\xe7\xc1\
-\xf8)lc\x85}'\xb1\xcd\xdd\xa5\xc8KC\xbb_\
-N\x8as\xe5M\x8ey\xe5M\xfe#n\xbc\xc9\xf1n\
-\xbc\xc17r\xe3-\xda\xa5V~\x8a?\xe2\xdf\xffM\
-R\xc1\xf5\
-\x00\x00\x06\x8c\
-\x00\
-\x00\x19\x0fx\xda\xddXmo\x139\x10\xfe\x8e\xc4\x7f\
-0\xd1IIho\x93\xf2vb\x01UmJi%\
-z\x07m\x8f\x0a\x01\x87\x9c]'\xb1\xea\xd8\x8b\xedM\
-\x1a\xa0\xff\xfd\xc6v6\xeb}K\xdar\x9f.\xa0j\
-\xd7\x9e\x19\xcf\xeb3\xe3\xa5\xd3DH\x8d\xde\xeb\xf7)\
-\x8d.\xef\xdf\xa3\x85\xf7\xe0\x82\xf2X\xcc+\xcb\x03\xc1\
-\xb5\x14L5n\x04'X\x13I1\xabP\xbc\xc5\x0b\
-\x91j\xe04\xff\x9cx\xf4\xe3\xfe=\x04?\x1a\x87h\
-nW\xce\xe8\x98c\xf6:\xa6ZHCgv\xe74\
-\xd6\x93\x10=\xed\xf7\xdd\xfb\x84\xd0\xf1D\x87\xe8\x89Y\
-pK\x03\x01gq\xc2u \xb8yfD\x13\x90\xb9\
-\x14o~W\xe8\x15:\x8b$!<\xb0\xf2P\x0f=\
-B\xbf\xa3\xd5sN\xb9\xc8)\xddIK\xd2\xfc\xc5\xd1\
-^g\x87OE\x8c\x19\xd5\x8b\x10L\x0d\xf6\x92\x84\xd1\
-\x08k*\xf8\x89Yw$#\x86\xc7\xca\xeeg~u\
-\xeb\xca\x9a\x8b\x14\x9e\x91wX\xe2iGiI\xf9\x18\
-\xe9EB\xb6\xd1\x0cK\x14c\x8d\xb7\xd1P\x08\x86\xa8\
-\xfa\x93\xcc\xbb\x05\xc6\x98\x18KkX)\xd7\xe8\xf8\xa0\
-\x9b\x9d\x93H\x91\x10\xa9\x17hI\x94\x18\x8es\xa0,\
-m\x1b6\xbbw|P\xda\xc95\xa8\xc84j\xce\xc0\
-\x03\xa0\xaa\x90_G\x92|\x0bQ\xef\x9f\xcf\xf1V\xe7\
-s\x00\x7f\xbb\xbb\xbf\xf5\xd6r`\xc6\x80!x\xd8s\
-\xa9a\xfd\x95\xf2\xc8\xb8\x101\x81\xe3\x8e3\x09L\xfe\
-ju\x03\xeb\xd4W\x0e\xae\xf0\xe3\x1b1\x82\xe5\x1ec\
-\x9dn\xbef\xd5\x85h:\xf2|}e=\xeci\xeb\
-\x84\xd2\xde\x07\xccR\x12$\x0cGd\x22XL\xe49\
-\xb9\xd2@\xec\xb9\xcd;e\x84:.4\xbe>+Y\
-\xc7\x07\xc0\xd8/nTs=\xd0T3\xa3O{O\
-j2\xa5\x0a\x12\xce(\xdfF[\xe5`\xd9\xdcC\x84\
-)\xd2|\xde\xcaW\x9f\xfa_\xeer\xb4\xd9i:;\
-\xb3\xd9\xf3\xe2+`>\x84\xb8\xa7\x84G\x8b6\xfa\xf9\
-\x13\x956\xf71\x8fm\xa9\xb5+N2?\x93\x0f&\
-o@\x89h\x82\xf9\x98\xfc\xcd\xa9\xee\xe4F\xec|\xe9\
-V\x99\xbcHi\x17\x1e\x9f\x01\xea\xd4H\x0cT\x84\x19\
-\xa92\x9b\xbc2\x87\x00X\x0c\xc5\xbe\xb8\xeaX\xe2\x14\
-VJ'\xd5{z\xf3\xf9%)5\x81: *\x92\
-41i^\x15\xf0\xc8\x13p]\xc2\x9bUq\x18\xd8\
-\xe8\x14\x1c\xfa\x1f\xc6\xc5\xc4\xc4:\xef\x10G\x90%\xa0\
-]\xea\xf9+\x88R)\x01o\x9d\xfd3\xf3\xb7\xca>\
-\xc5\x94[\x82\xact<o=\xf4\x85oJ\xec\x0d\xc2\
-*\xae\xcax,\x1d\xd0\x7fZV\xc6v.e\xbb>\
-\x08\x9e\xdbsP^9m\xc9\xb4]\x80b\x8b>6\
-k\xcf\x80#>\x80\xde'\xc6\x01 \x1d\xcf\xb0\xa8\x1a\
-\xb9\x1c\xad|S=\xb3,\x81\x8fe\x15m+\x14\x95\
-\x94n\x1f}o7k\x90\xd7\xd9(\xcb\x90\x822\xb6\
-\xf9\xd01\xd5\x0a\x1c\xb8\x22\x09\xb48\xb3-\xa4\xd3\x0d\
-\x18\xe1c=)C\xe1\x92\xe7%zR\xaa$It\
-*9\xfa\xe1\x02\x1f\xa2\x9dm\x9bQ!j\x1d}o\
-\xf9\x91\xb3\x19P\x10\xf5\xc7\x06Q0sL\x82D\xcc\
-;;\xfdm\xf4\xb8\xbb\x12|\xb9Q\xf2N\xff6\xa2\
-\x9f\xe5\xa2OjD\xdfB\xd2\xf3\x5c\xd2\x1bO\xd2u\
-m\x03,D\xd5b\x94\x1f\xa8\x11\x14g\xc7D\x8b\xc6\
-f\xc8\xe9\xbf\xb0\x0f/K\xe5*R\xae\xdd\xce\xd6V\
-\xa5\xd6\x8dK\x0c\xb9\x05\x85\x02\x9f\xad\xec=\xdd\x01\xc6\
-\xae-\x90Z\xfc\xaeC\x86c\x1e\x13\xa3\x0fpV\x19\
-\x86\x92\xe0\xcbF\x88,;\xc3\x95\xd4\x09Q\x0a\x8f\x0b\
-\xd8`\xe6\xc6J\xe9\xe5\xdb\xb6\xb1\x85\xa8=\xb0$\xc8\
-\xd2<h\xe7\xfbS'\x11(>\x8aT.%)4\
-\x01:4\x84\xf9\x0f\xa94\x8a\x80f\x942\xb6\xb0x\
-P`W\x1a\xd0\x13\xcbx?\xd5Zp\x18\xef\x96\xa5\
-\xff\xd7\xa5_\x13\x82\xef\x81\x90\xa4<\x8f6\xf4\xe2\x88\
-\x09E\xfc\xaa\xbe\x95/b\xbby`\x87B\x18\xc8G\
-TN\xed$\xea\x99lf\xd2\x10i\xe9\xe3\xf5\xd2O\
-\xad=I\x10\xcc\xe8`\xb6$\xbb\xad\x1a?\xb5\xc0O\
-\x08\x03\x15\x1e\xc2(\x8f\xb4X\x0e\xa0HO\x08R\xf0\
-\x18\x81\x99\xa8\xe5\xcf\x0d\xf0\xdc\x0a\xd09\xec\xc3\xf4g\
-\x9c\x89\x22\xcc\xb9\xd0\xe0`H\x9b\x18\x86\xf6\xa0z\x92\
-a\x84\xd3\xe6X\xf2\xd6f\x7f\x0f0\x8f\x08C?\xb3\
-\xf7\x8fD\xdd0\x00\xfe\xf8\x5c\x06y;=\xffj\xb4\
-\xde\x95\x82\x04\x9aN\x84T\xc1\x88\x9a\x99\x17\xce\x81B\
-\xf1u\x1d\x08\x96N\xb9\xbb)\x95\x95\xad\xe7\xad\xa3`\
-d\xa4O\xb0\x1cS\x0e(\xdb\xaf\xa7\x91\xe62\xb3\x89\
-H\x8bd\x13\xc9P@0\xa6>U\x91\xeeT\xccs\
-s\xaa@`\x06\xebCJX\x5c\x07+YZ\xe7}\
-\xb1\x9efF\x15\x1d\x9a\x0c\xce\xb3\xee\x81\x99n\xbcv\
-\xd9F\xbb6\xe9Q\x88F\xb8\x02\xd5\xd9\xcfij=\
-|\xe1.\x9d\xc5B)\xccp\xc5\xdbA\x88\xbe\xa9s\
-\xd9i\xad\xc6\xadV\xb7A\xd9\xec\xde\x13\xa2S2N\
-\x19\x96\xaf\xaf\x12\x09y\x0fZ~\xc8\xf6\x9a\xbc\xe1\xfa\
-J\x89+Dw\x1b\xf9\xc0%\xc5k\x1b8\xa7p+\
-\xab\xd7\xe1\xba\xba|]\x17\xda\xac!\xac\x8b\xac\xdf8\
-n\x1c\xdb[\xda\xb89\xec\xa6\xaf\x9d\x0a\xdb*\xccc\
-\xbb\x9e\x0a\xa0\x93@\xe1\xbd\xa5J\x9f\x98\xc7u12\
-D\xaf\x19\x99B\x89\xc2\x00\xa0m~\x98q\xec\x05\xb2\
-\x0d\x15\x0a\xa5\xce\x8dk\xb9/\x0b\xec\xe4\xf1\xad\x05\x9c\
-\x14\x05<\xbb\xb5\x807E\x01\xcf\x9b\x04\xd4'\xc8\xda\
-|9d4\xba\xc4\x10\xe7:\xa7\xde\xb4*=\xba\xa3\
-\xe5'\xa2\xb5\x84\x1e\xba=\xadG&h\x888\x18e\
-\xba\x85\xab\xb5\x8d`\xe5!\xcf\xad\xd0\xc3\xe3k\xc2\x8f\
-\x91\xe0\x1a\xc6H\xca\xf5\x19\xfdN\xaa\xc0\xbcjW\x12\
-'&O\x9d\xd6\xa6a\x05\x17B\xc6\x17\xb0\xbc1>\
-\xe6w\x16I\xc1\xd8>\x96\xc1\x8cHM#36\xac\
-\xd6\x9a\x1c\xb0\xfcTW\xa7\xd3\xa6\x14(4\x8a\x86\x88\
-\x018\x8d\xb9IJ\xf7\xa9\xcd\xbc\x1d\x0d\xe0\x95H\xe8\
-\xfe\xd9\xca\x07\xb7r\xf3<\xaaR\xba\x09c]\x94\xdd\
-\xe4\xe0\xe86\x00\x97\xfb\x0a\xb5\xeb\x00\x08\xadk)\xba\
-\x90\x09\xe6\x80\xa6$\xa0\x11\xdc\x00\x15\x0c\xad\x91\x99\x93\
-\xbe\xc9(\xec\x99\x0f\x85=:\x85\x81C\xf5\xcc\xb6\xea\
-9\x1d\x035\x1b\xb7\xea\xa5\xc4TA\x1e.B\xb47\
-TZ\xc2M\xdc\xd9\x13\x98\x84\xd9'\x8a\xc6\xe48j\
-2\xaf9\x22\xa7\xf63\xe9\x0d\xe2\xe1\x86\xb3\x81)\xaf\
-\x9a\xd9\xac\xa8h\xfd\x5c[\xb8e\xdf\xb5O\x1dk2\
-m:\xfc\xa6\xd0s}\xb7,2W\x8au9\xe4'\
-\x84\xb9\xbd\xfcR:\x98\xc3\xfe\x0f\xc9\xe0\xbez\xfdB\
-\xeb\xa9\x0e\xeb\xf0\xff_\x1e\xcb\xa5\xf8\
-\x00\x00\x0c \
-\x00\
-\x00C\xe8x\xda\xed\x1cko\xdb8\xf2{\x81\xfe\x07\
-\xad\xefC\xec6\xa7\xb8\xed\xf6\xb0\xf0nqp\x93\x06\
-\x0d\x90\xb4\xd9&\xb7\xc5\xa2(\x0aZ\xa2m^iQ\
-K\xd1q\xd2\xad\xff\xfb\xcdP\xd4\x9b\x94\xe4\xa4\xed-\
-\x16\x0d\x0a\xd9&g\x86\xc3\xe1p^\xa4\xcaV\xb1\x90\
-\xca\xfbU\xfd\xbaf\xc1\xc7\xfb\xf7X\xe5\xb7\xff\x96E\
-\xa1\xd84\x9a\x0fE\xa4\xa4\xe0\x89\xb3\xc3?#\x8aJ\
-Fx\x03\xe2\x94\xdc\x88\xb5jb\x1e\x01\xb0X@\xfb\
-\xfd{\xe9\xa0\xde\x9f\xf7\xefy\xf0\xc7\xc2\x89\x17\x8a`\
-\xbd\xa2\x91J\xceHD\x16T\xa6O\x84E\x88\x0d\x0b\
-\xd5r\xe2\xfd4\x1e\xa7\xbf\x97\x94-\x96j\xe2=\xc5\
-\x86\xb4\xe9P\xc0h\x11P\xf0E\x84\xdf9U\x14\xe8\
-\x9a!\xf0\xef\xda{\xe6]\x04\x92\xd2\xc8\xd7\xf4\xbc\x03\
-\xef\xb1\xf7O/\xff^@\xde\x14\x90\xe9H\x06\xb4\xf8\
-\x91\xc2n\xb3\xc1W\x22$\x9c\xa9\x9b\x09L\xd6\x9f\xc6\
-1g\x01QLDg\xd8\x9e\x82\xcc9Y$\xba?\
-\x93x\xda\xae\x98\xe2t\xe2\xfd\x91\x5c\xca\xe1`*\x15\
-]\xb1\x04\x86:\xca\xe4\xe1\x19\x81\x0cF\x19F\xc2\x16\
-\x11\xe1^B\xae\xe8+\xba\x01@oxE`%\x22\
-\x85R<'\x92\xacN\x135\xaa\x00\xaf\xe3\x10\x96\xab\
-\x1flHQv\x1a6Q\x92E\x0b\x04=\x09\xf7=\
-\xf3\x8b^+\x1a%0\xbb\xbcE\xdd\xc4t\xdf\x9b\x09\
-\xc1\xbdX\xd2+F7U\x8a\x22\xa6Q\x0fzz\x86\
-FZ\xeb(@\x01z\x5c\x90\xf0\x94%j\x18\xb2@\
-\x8d\xca\xcb\x19pJ\xe4\x94\xf3\xe1\xa8h\x9b\x0b\xa9'\
-\xe81X\xc1\xf1\xcf\xf0\xf1\x8b\x87\x88>\xa7\xd1B-\
-\xa1\xe1\xe1\xc3\x0a\x11\xbdx7\xb0L\x94\xfb$\x066\
-C=\xd0;\xf6\xbeDu[|e\xb0>\x87K\x12\
--h\x98\x8d\xbbm\xf0\xbc\xa0JS\x1cV\x86B\xb6\
-\x906@\x10y\x83s\x02\x1e\xdf\xbdog>\xe3-\
-\x10\xebH\xd9\xd9\xaf\xd2E\x9a\xd5\xfe\xf2\x14\x81\xb3!\
-\x1b\xf9 \xff\x0f,\xdc\xef\x84\x8b\xc8\x8avC\x854\
-\x09$\x8b\x91\x81n`\xad*\x9dPF\x8b\xba\x01s\
-\xdd\xa9B\xbe\xaf\xfe\xac\x8a\xdd\x8f\xd7\xc9rX\xb4\xd9\
-WZR\xb5\x96Q\x0d\xd5\xb5\xe2\x15\xb5\xa8/z\x02\
-\xfb)\x00c\xf4\x01\xc4\x0e\xcbS\x9e\x01\x07\x9a\xbf\xc1\
-D\xfd`-%\xec\xf6\x93(\xa4\xd7%~\xd8\x1c\xf6\
-L\x19\xfd\x87g\xcf\xbc5\x00\xcdYDC=\x92E\
-\x19pw\xc1@eD\xb3\xe4M\xe0\x5c\x80u\x04\x87\
-d\x11\x07\xd5\xa2\x0e\x8em\x16V\x0a\xd5h0Tt\
-5\xf1PK\xea\x08\xd8\xd6\x844\x9aR\x076\xcdu\
-\xf1 \x97\xc7\x8c\xf2\xd0W0?@j\xb2=g\x9c\
-\xbe\xaa\x83\xa5\x22}\xe8\xed\xf9{\xf0t\x88\xa64\xa3\
-*\xb2k\xa6\x5c\x04\x1f\xcfh\xb4\x1e\xce\x09O\xe8\xa8\
-\xce,.~*\x08X\xf4\xbd\x93\x15x\x81=\xef\xf3\
-g\xafh\x9b\xaeC&\xf6\x1a\x16A[\xde\x0dS\xc1\
-\xf2<\x15\x83\x7f\xc5\x126\xe3(R%\xd7\xb4\x09\x8d\
-C\xe5\x92\x04\xca\x8f\xac4\x9bt\x83%\x0d>\xd2\xd0\
-Iw\xebQ\x98\xd9\xae\xb4\xb48,\xc4\xaaMn\xda\
-\xae\xb9[\xe8\x96h\xda\xe9\xe5k\x84\x13lZ\x8a\xad\
-\xc5ae\x08b\xb1\xe0\xb4\x22H\xbd\xa2\xcdf\xfcC\
-\x17\xf9|\xad\x94\x88|\x1a\x11\xe0\xd7!\x88\x1d\xe6\x96\
-\xfa\xf1>Di\xc8T\x17\x9c]<V\xb6\x9b\xba\xe0\
-`\xa5\x09h\xe5\xa4\x0a\xe6\x94|\x11\x10\x94\xb9,\xb6\
-\xbc\xee\xafD\x0b\x95\xad\xde\xe8n\xec\xe7\x06D\xee\x9d\
-\xcb\x1dM\xc6\xcc\xce\xca\x1c\x04K>dQR\xddU\
-\x98\xf6\x13p'\xb7\xf0\x14%\xec\xcc\x00j\x87\xe1\x18\
-0Ck\xe9\xbeCXR\x1e\xc1\x12\x03h3Sf\
-\x18\x1b\x9dD\xdc!\x02\xf2d\xc7\xd9vZ\x10\xfc\xb3\
-\xc9\x0c\xec_\x19\xa4\xaf\xd9\xb1\x93\x1a;\x0d\x0e\xfe\xe5\
-q\xf9\xb0\x08\x1aG\xb5%j\x86\x9cy\x08\xac\x9b/\
- \x11\x08\xd3\xe4\xca\xc7\xfd8\xecc\xa6\xae _\xc1\
-\xa1\xb5f'\xc3\x86\x99\x8a\xe8\xe6\x9c\xa8e\xd9\x91\xa1\
-\xc7\xd1\x0e\x08\xfa\xea\x1eR\xf75\x96\xef\xe0\xc0[\xd1\
-$\x01\xc7\xa5\xf7\x9a'L\xec\x10\x09\x95\xbb\xeb*\x86\
-\x89\xbaz\xd9\x1e\x03\xdb\xd3:$T\xbd\x00\xe3r\x0c\
-|\x5c\x82\xaaA\x8a8\x13\xcf\xc5\xf5\xb0\xa1w\x85\xbe\
-\x87\xd7F\xe3\xe1\xcb/\xda4\xd5\xb1\xf3\x0d\x00\x10\x96\
-=P\xf1\xe0V|X\x865\x9d\x82B\x87\xd7#\xab\
-\xf6\xdbG-\xd9\x00`\x11\x90\x9b\x883I\xc9G\xb7\
-\xb3s\x89\x09\xc7;L\xc9\xa3V\xea\x0c\xa0l\x09\xf7\
-\xbd\x86\xc0\xee\x18\xe3\x9a\x90\xf5C\x8c\xc9h3}\xb1\
-D\xb1\xfb\xcd\xa0n\xdf\x19\x8a\xd5z,\xf9\x87-p\
-,\x81\x94r\x89b\xb7\xbe\xcb9~_7\xfb\xb8Z\
-\xe9n\xac\xec\xa9p\xa2\xf7@\xdaS\xb4\x9b\xf4\x7fp\
-\x0e.\x04T<X\x0a\x01\x1fD\xc3\x0e\xea^\x8c+\
-*\x93I]B\x03\x1d\x1az\xc3\x07~\x0c\xd9\xf4\x03\
-\xff\xbfq\xfa\xa4\xf8\xb1\x00\x1d|\xe0\xcfV1<\x15\
-\x9b\xcf\xd3\x0fxn\xe8\x0c\xdb\x92+\x84ZR\x16\xc0\
-\x87$\x1bx\x06\xf21<#\x8aPB\xe23\xd1-\
-Dbo\x18-F\x83\x9a\x04\x07:\x10E\x0eV\xf1\
-\x13\xa4M\xae\x10\x9e \xcd9\xd7\x1f$\xfd\xd8\xac\x08\
-R]\xe0\xa0\xab\x1f\xf1;I\x99\x22\x9a)\xb2\x92\xd8\
-\x0d\x09\x1a\xf6\xb30}2\xf8\x88\x83Us\xd8\xacH\
-\x82#\xa3\xe2\xe9\xe75B\x87z\xa2`\x99`RJ\
-O$\xc4\xefK\xb5\xe2\xe9\x07<\xaf\xf5\xf78V\xe9\
-\x13\xf1\xaey\x92>\xf1G\x90\xe0,h\xbc\x9e!\x1b\
-b\x86l\xac\x90%0y8\x958\xb1\x08\x82s\xbd\
-t\x09\xb04\x1aT\x94\xa8\xf8!\xa2i\x10\xd0\xb8^\
-\x9f\xd2\xeb\xdc4\xbb\xb9~\xa2b\xd9r\x84\xac\xffU\
-\xae#~\x9a\xa1\x15i\x83\xd5\xb4\xc0X]\x96el\
-\xf5}\x9d\x83\xb6\xe4%=\x06}t\xbbA3e\xb8\
-\xf5\xb8\x8f\xfb:\xfa\x1e\xb4\x9e\xf4\xb6\xbcvS\x11\xea\
-\xd6i\x18\xbe\xc2$6\xeb\xc9\xca\x9e?\x8eK\x0bc\
-j\xa3\x95\xb6\xeb\x09D\x83\x04\x192\xa5NS\xe6\x1c\
-\xd5\xea\x9c\x05\x98)mf5N\x03X\x0au\xb1\x92\
-9\xa99\xdb\x80\x83\xb1:\x17\x9c\x05@\xe9\x1c\xb6m\
-\xec\xbf\x12\xd3\xb5\x12\x87\xd8QFO\x14\x89B\x22\xc3\
-4\xb6\x07\x1bf\xe2\x15\x8c]\xbc\xcf\xd9\xaf\x06\xda\xa1\
-\xe0\xebU\x94\x16\x94\xeb+A\x220\x962\xf1a\xbb\
-\x01c\xe94\xea\xdb\xe3\x8d\xd8\xd8\x91\xf1/\xed\xd1\xf8\
-oS\x19\xda\x93\xd8f\xcb%lL\xbdE\x9dA/\
-,ay+\xdb\xa1\xfa2\xa0\x83K\xb0\x9ft)x\
-H%\x8e\x9e\x15\x8cq\x84\xc1\xc8\x8e\x02\x01@\xf8:\
-\xe27.\xb2\xdb>SM\x17\xcc5OUb\xe5\xb9\
-\x14\x9b\x84\xba\x98\x11\xd1!\xa8\xc9G\x8b\xc9\xab\x17_\
-\x1c\x91\xecn\xa1\xfd\xf6\x1biB\xb6\xff;\x14\xa1n\
-.\xec\xc0+\x8c\x99\xc0\xbd\xa7\x0e}\xb0o\xfc*~\
-\xc9\x8c\x1b~\x7f\xad\x96T\x0e\xde\xdfrA\xfb\xean\
-\x1e\xe1\x7f5\xdd\xc5\x11l\xea\xd2\xb5\x94\xc7\xa8HX\
-\x1b\xb8\xcbR\x96\xe0^\x1a\xabj\x07D\x8e\xa7\xb0\x95\
- \x901\xc3N\xf2\xb6\x0e\x11\x1e\xd5\x0a\x08;I\xa7\
-\x84\xec\xdaSs\x01\x86;\x16,R\x17\xec\x13\xb0\xf5\
-\xc8\x91\x09o$\x891\x1eO\x19\xc7,\xc8\x7f+d\
-\xf8\x16\x9a{)\xd1E \x05\xe7\xcf\x89\xf4\xaf\xa8T\
-,@G\x90\xb7\xb9d`\xdc\x92\x8d\xa7m\x9bs\xec\
-\x15&a0P\xcf`\xede\xd0\xfc\x90lhg\xf3\
-\x9d\xdb\x185b\xb1\xfdV\xd8jJ\xdc\x0e{d+\
-\x15\xb7\xa3\xb8\x22\x0e\x5cR;\xa2\xc5B\x8c\xbeHX\
-\x82\x1a\xf4=(\xf9\xab\x05%}\x5c\x91\xad\x9a\xf0W\
-\xf7E\xc8\xf3wgt7g\x842\xfc\xee\x8d\xbe\x96\
-7\xaa\xd5\xcc\xecE\xbcN\xf7`[\xa36\xd8\xfe\x0e\
-a\xd4e\xe6\xcfL\x91\xd6j\xed\x8f\xf4\xd9\xcd\xa1\x88\
-\xe6L\xaeH\xf5\x14\xd3j\x80\xb3\x92\x16(\xa5\x07z\
-\xed%kI\xff]\xaa\x85\x98\x920@\xfc\x0e\xbd`\
-\x22=2Ck\xa8\x849'\xf2\xc0\xa8\xe4U\x8f\xfc\
-f\x90\xef]Bs,E\x00\xf8^@\x22\xac\x22\xcf\
-(\x1e\x87\x8b\x88\xfa\xcd\x01P80\xc8\x86\xc8h\xd0\
-\xc7\xec\x1f\x82\xf1\xa6\xbc0\xfc\xbf\xd3\xa4\xa7\x02\xe47\
-f\x86\xed\x17\x16\xec\xa5\xd0~\xd71\x1c\xb8\xc5e\x9c\
-[\xa1\xf7\xb8\x8e\xe1\xc0\xccO\xd8\xbf\x84\xa65\x0e2\
-\x1a\xda\xb4\x97\x1e\x81x\x1a\xe6\x87=\x8b6\xed\x816\
-IC)\xf1\x96\xe8\xc3g\x94F\xa0~\x01j\xcc|\
-\xcd\xf9\x8d\x8e\x07+\xe8.ex\xfd\xb1\xc6\xffy\x8d\
-\xed.O\xef\xf4\xf2vD\x1b\x84DWpF\xe4\x82\
-EM\xd3\x95\x01q:\xef\x84\x99\x09\x98\xdc\xca\x05\x95\
-\xc4$`\xd1b\xe29\xb0\x95\x88\xcb\xa8U\xa0\xb6`\
-\xa8\xe4\xdaV,b\xab\xf5\xcax\xc1GO-v\xb8\
-5,\xaa\xdc\xf0k\xab \xa06%T\x9fe\xbc\xa4\
-$\x84y\xb9a\xdf\x00\x1ch\x0b\xa7m\x04K\xde\xe3\
-4\xdb\x09\xfa\xec]7\xb6\xe3e\xa1\xf1\x93q;\x5c\
- \xb8\x90`\xaa\xfe16\x7f\x83v\xf8S2\x03C\
-\xd5\xc1tQ\x9f1\xf2\xe8\x06\xd7.< 1S\x90\
-[}\xd2\xb6~\xe2\x1dc\xe3\x94\xf3\xff\xc41\x95\x01\
-IhO:3\x08\x22\xda\x02\xb1f\xec\xc0\xae)7\
-\xb1\xc3\xbf\xbaq\x8c\xd0\xb2k\xa8>\x81m\x1e\xa9\x9e\
-c\x81\xbd\x06\xb4\x8b\x5c\xf3\xfd\xa7\xdd\x88\xd9~\xc8\xc2\
-\x8eC\x18\x8e\xcal\x0b\xd7\x9a\xfb\x93\x83\x07\xfb\x04<\
-5\x08\xd6;\xdaIn\xdd\xdd[g\x15\xcd\x11N\x1b\
-=\xef\xdag\x99gpC\xed\x12\x98\xef\x14\x08\xe7;\
-\x0c\x80\xb86\x93\xe2\x8a\x1e\xad\xa5\xd1\xd9\x96\xfd\x16p\
-\x16wQ\xb5\x85\x983\x22{\xb01)\x1b\x15\x87\x8a\
-\xfe\xecI0Lk\xf05O\xdbVMD\x87%\x87\
-kn\x00@\xe8Q\xbbl\xd8B\x01\xc3\x92\x05\x8c=\
-\xf1\xf4\x85\x92\x0e{\x91\xad\xe8\x91\xc1\xfa\xba&\xf1\xf1\
-\xb8\x97\x893\x16L\x9f\xf2l\xdb1\xce\xc4:\xa1m\
-\x89\xd0nN\xf8\xf6E\xec\xca\xf51[\xf0\x84G\xf6\
-\xf8\xd9Mb{\x97=\xdfr\x95&M\xeeq\xf1t\
-\x9c\xd7G5LH\xb8\xb3\x95\xb1g\xfe\xc5\xd9\xbbv\
-M\x10M\x0a\xf0.x\x81~\x80!\xe9\xa0\x1b\x03\xf2\
-$\xbd\xab&\x1e\xca\xf7\xc2\xb4\x1eC\x94w\xa1\xaf\x95\
-wS(\xb6G\x9f\x80\xc11\xbd\xce\xcc3\x93_\xab\
-\xfd\xd8\xd9\xee\x11`\xf8\x8a\xb6A\xd9\xcfHv=\xe0\
-A\xceIh\xa2\xe3\xee3\xa0i\x18\xba\xca\x03f\x8a\
-\x10X,\x22L\xe7\xd2W%\xf0\xd7\xcb\xd4\xbdA\xe2\
-\x95\xb5\xfc\xd6\xe6\xf0X\x00k\x97@\xac\x1f`v\xf7\
-\x87\x0c&\x07!Q\xe4\x80a\xa1*9\xc0\xee\xe4\x00\
-x\xc6\xab\x0d\x0e=\x0aY\x12s\x02\xca6\x9d%J\
-\x82,\xcd\x95CL\x9d\x9f\xd3\x84\x85\xf4$pM\xb7\
-\x9f\x0d(\x9f\xdf~\xe9\xa3\xacK!\xf8\x05\xc5\xcb'\
-JX\xd5\x0e\x17M\x95\x81\x9a :\xb58\x07)\xe9\
-\xf0\xc7V\x16\xc1\xbc\xa2\x15\xa0\x97\xceno\x99/@\
-v9\xa7`1C\x136<\x19\x8fm\xca\xdb\x1a\x08\
-\x97\x15\xf3\xf8\xe4\xf4\x85w\xf4\xe2rzrz\xd1Z\
-\xc0\xea\x1b\x18\xee\x12}6\xa2\xdb\x9f\xbe\xe2\x16\xb1n\
-\xf2~\x87~\xff\xb7\x22k\xcf\xd3\xea[\xce\xabr\xcd\
-\xf7\xab\xcd\x0d\xcbq_tn\xad\x95\xe5]\x99\xde\xc9\
-\xc1\xdc\xa6\xca\x9c\xd7\x0c{U\x99\xefVi\xee#\xd2\
-]\xab\xd2;W\xa6\xfb\xc4\x04\xbbT\xa8;\xaa\xd4\xbb\
-\xb8\xf4\xceJJ\xbb\xcf/\x96\xb2\xb8\xb4\xef\x86T\x95\
-\xb5C\x8c\xb6e\xeb\xe5\xbc\xd3\x81[\xfc\xf7]}x\
-\xbb\xb1}\xa3\x0f\x1d{F#\xbb\xa5\x05\xae\x8azk\
-\x88p\x9b\x14\xbe+\xe1\xdb\xc5v8\x07\xb9\xd0\xef\xa2\
-tV\xe3\xcao\xac\xf4\xd3\xa33\xc2\xa2\xc1\xa8-\x83\
-\x01\x91\xa7\xaf\x0b\x15yqG\x0a3\xf7\x86\xe6\x0d\xa3\
-Q\x9f\xe4\xad\xf6\xce\xc6\xa3QG&\xd6\xfa\xa2S\x0b\
-\xe1\xf1\xe8\x9b\x95u\xfa\xed\xfa\xe2\x0d\x9c~k\x85f\
-\xb2m\xc7\x9b\xd7x&\xae\xb7\xbav\xb2\x0c\x90B\x83\
-#\xff;Z\x86\xe6\x11a\xafk\xf4\x96\xf7.\x9b\xe9\
-\xae\xfd\xc5\x87\x9e\xa7C\xa3n\xbe\x8f\x1c/>\xf69\
-\xfar\xbd\x1bi\xb7\x9c\xda'\x7fi[\xd9o_\x14\
-o\xba\xf5\xdb\x17\xaf\x01\xfe\x9b\xed\x0bd\xee\xef\xb8+\
-\xcc\x7f\x1c0\xec6\xabw9f\xbd\xcb\xb1k;\xb5\
-[i\xe9N\x17\x14\xcc\x07\xfc\xfb\x1f\x5c\xc7\xa0\xdd\
-\x00\x00\x02\x83\
-\x00\
-\x00\x08\xabx\xda\xa5U\xdfo\xd30\x10~\xaf\xd4\xff\
-\xc1\xf4\xa9{\xc0\x19hB(\xd2\x1eF\x11\x02\xa9\x83\
-mT\xda#r\x93Kb\xcd\xc9\x85\xf3e]\x81\xfd\
-\xef\xd8I\xdb\xa5K\x1a\xd8fUr\xce\xf7\xf9\xbb_\
-\xbe\xab\xceK$\x16\x97|Y\xe9\xe8f<\xd2{\xb2\
-\x9c\xab5Vl;\xe73,\x98\xd0\x1cV\xc8s\xc5\
-@Z\x99\xf1h<\xfa\xe8vL\xc5\xef\xf1H\xb8\xa5\
-\xe3P\x10\x227\xd2](\xa6\xa5\x22(X\xaet\xcc\
-\x99x-\xea\xfdH\x04\xe2m\x03Y?@2\xd0i\
-\xc6\x0e\xd3|l@\x0d,\xc7X\x99P0U\xd0\x1c\
-D\x06-\x5c\xa0\xd1\x91c\xb8\xc0\xb2*\xe5W<\xab\
-\x18g^\xb1\xbdV\x12\x96@\xbc\x16\x96I\x17\xa9\xc8\
-\xc1Z\x95B(&\x93A\xc0b]\x0e\x80\xe2:\xe4\
-\x85fS\x83\xc4\xd6Z\x1d[(NN\x8ew\xf6U\
-\x1c\xbb\x1b\xa1x\xf3n{t\x85\xab&\xf1\xdb\x94\xf9\
-\xa5\x8a(C\xb22\xd1\xc6E\xd9\xe4\xe3AkK\x15\
-=b\xf1\xebK\xee<m\xb3\xf8\xd5pKetZ\
-\xe4\x8e%t\xd5\x93g^\x9aC\xc2\xe2\xcfN\x5c`\
-\xd9{\xb3$H\x80\x08\xe2\xebM4\xef\x87a\x9f\xeb\
-buq\x16+\x8a\xe0\xbb\xfe\x05r\xd5\xcf\xd4Bd\
--\x92>P\xf88\xccZ\xb5\xd2\x1ceb\xda\xaa\x99\
-d\x9c\xe3\x0ah\xa6,L\x8f\x8e\xfanEN%&\
-?+\xb0\xac\xb1\x98\x84]\x84_\x04\x5cQ\xe1p\x14\
-\x85A\x10\xc4\x8aU\xa0}\xbem\xa0#,l\xd0\xbc\
-\x81\x1f5\x8f\xb4\xb7\xe9\xe4\x90\xa5\x95\xa2\x17[\xf1\x1c\
-\x83F\x5c%\x90^j\xa5&\x194\xa3\x8b\x04\xfb\xac\
-\xc4\x90\xa8\xca\xf0\x0b\xed{\xf6\x03\xe6\xef\xf7\x8fZ\xe2\
-}\xfb\xc1\xcc\xd0Ty\xd1m\xaf\xd6\xbb\xf5\x1d\xb6y\
-\xd9\x0f\xc3\xe4y\xcd\xf3\xf8\xee\x12L\xdf\x83c\xb8\xe3\
-f(\xca\xd6\xe0\xe8\xe2\x127]e\xa9\xef\xc0\xf8\x96\
-h\x9a\xbd\x17\xb3D\x13\xf7y_\xd7\x09\x0dR(\xb6\
-\x03Z&H\x90\x12VE\xdc\xc5\xdej\xab\x97~\x84\
-y\x0f\xc5\xab\xd3\xd3\xdd\xc0{j\xde\xea\xe1G\xaa<\
-\xc7\xd8\xd1-\x1c\x9d\xbcvb\xa7h\xfb\x07\x1ewF\
-\xa0\xfe\x91\xb4M{\xf7c>!\xe5\x8a76\xaft\
-\x94\xf9\x8f\xfft\xae\x0bs\xce\xc4\xdf\x0a\xb3>\x14\xa3\
-\x05\x03\x11\x7fX\x9fce\xe1\x10h\xa9\xa2\x9b&\xe5\
-\xa1(*cD\x9f\xa5N\xb1O\x9eV\xcb\xe7\xd7\x89\
-\xb1\xbc\xd8\xfe+\x1d\xf7x\x8f\xcc\x98\x0f!\x8ck\x85\
-!=\xf9Q~\x08\xb0\xdf\xb9\x9b\xcd\xfd\xfe\x02\xa1\xb6\
-@\x1f\
-\x00\x00\x02M\
-\x00\
-\x00\x0a{x\xda\xbdVQo\xda0\x10~G\xe2?\
-X}j\x1f\x96\xd1J\xd3\xa4H}\xa0L\xd3\x90Z\
-\x89.\x95\xfal\x92\x03\xac:vf\x9f\x05l\xca\x7f\
-\x9f\x1d\xc7\x10B\xd8\x96N`\xf1\x90\xdc}w\xf7\xdd\
-\xf9\xb3\x03\xcb\x0b\xa9\x90<\xe3\xb3a\xe9\xdbp\xc0\x0e\
-\xde\xa3W&2\xb9>2O\xa4@%\xb9>\xe9\x88\
-\x9e(\x82b\x94\x1f!\x1e\xe9V\x1a\xb4\x91\xc3\x81O\
-N~\x0d\x07\xc4.\x96\xc5d]Y\x92\x82\xa6\xf0\x0a\
-\x14W\xa0\x1c\xcey\xd7,\xc3ULnG\xa3\x917\
-\xac\x80-W\x18\x93\xcf\xce\xe0M\x13iK\x09\x10\x18\
-I\xe1\x9e9 \xd8\xa4u~\xb76\xe4\x9e$\xa9\x02\
-\x10Q\x95\x90|$w\xe4\x03\xd9=\xef\x91\xdb=\xd2\
-W\xaa\xa1\xfb\x17\x8f-C\xf1\x5cf\x943\xdc\xc6\xb6\
-\xd3h\x5c\x14\x9c\xa5\x14\x99\x14O\xce\xee!\x0bN\x97\
-\xba\xf2\x87\xb1z;2\xe4\x10\x93\x1f\xfaE]_\x8d\
-\x15B\xce\xb4-U\x8d\x81\xd4s\xb8\xba\x09\xe8\x85\x11\
-\xa9KLL\x91\xd9!?HD\x99?Pu\x9d\x83\
-\xd6t\x097\xcd\x86\xb5\xcb\xb1\x83D\x08\x1b\xb4\x8d\xd5\
-\xc8F\x07\xfeqf\x8d\xcdh*\xd2\x95T:Z0\
-\xcecRPeg\x1b\xb0\x15\x15)\xed.\xc7\xe4\x91\
-\xce\x817\x03\xc3~\x1e\x96?\xf4/\xacT\xa2\x82m\
-\x80'\xec\xa7m\xff\xf6\xee\xd0\xcfa\x813\x9aeL\
-,c\xf2\xe9\xd0\xa7\xdc&\x9cr\xce\xabz]\xde\xb2\
-I~\x22\xb9\xc9\x85\x97c\x9b\xfb\xdf\x1aw\xeb\x85\xce\
-mO\xed\xc8\xd09V\xdec_\xadc\x9f\xd2\x8b\xf0\
-\x18\xe4IU\xd5_=\x1e\x95\x816\x81@\xc2\xd8v\
-E\x17\x8fJ[v\xc7\x83\xb4&F\xb9\xaaNJm\
-X\xf9\x9f\xa9\xbfJ\x05)\xd5\xa8\xcf\x91\xfc\xcb\xf7\xf1\
-\xec\x1cy\xc7FIE\xcf\x919I\xc6gIk\x04\
-\x99\xe6\xf6\x90\xaa\x7f\x99s\xd9\x16L\x824}\xeb\x16\
-\xbc[\xa9\x97\xc7Td\xb0\x09\x02\x8e\x9a\xc6?\x0a\xf5\
-[}\x1f{\xa5\xbe_\xd1S{\xfd\x9d\x9aE\xf3\xc3\
-P\x8b\xb9}eu\x9dE\xdd\x1d\xd6\x1dTv\xce\xf5\
-\xfd<\xc3\xc9\xe8K\xb4\x19w\x19\xa6\xee\x98\xf5e\x19\
-b.\xc3\xd0\x1f\xd8\xbe\x1c\xf7Q\x97ai\x0f\x7f\x1f\
-z\x16~!^F\xd4\x97G/z\xbb\xa8>,O\
-\xbc\x96\xbb\xbf\x1c\xf6\xf7\x1b\xfa\xe8n|\
-\x00\x00\x08\xee\
-\x00\
-\x00[Ux\xda\xed\x5cms\xdb6\x12\xfe\xde\x99\xfe\
-\x07\x9c>TR\x95j\x9cd\xa63\xa7^>\xd8\xca\
-)\xb9\x99\xf8\xae\xad=\xb9\x0f\x1eO\x87\xa2`\x09\x0d\
-D\xb0$h\xc7\xc9\xf8\xbf\x1f\x00\xbe\x01$\xdeDI\
-\xb5}%\x93I,p\xb1X\xec\xb3\xc0\xee\x03RF\
-\xdb\x98$\x14\xfcB\x7f\xc9P\xf8\xe9\xdbo\x90\xf2y\
-:'\x11M\x08N\x8d7\xa6\xe7\x01\x85\x09\x0apK\
-\xe2CpO2\xcaz\xf2??\x07k\x08\xbe~\xfb\
-\x0d`\x17Z\xcd\xc0\x0d\xc2\xac\x1bo\xcd\xdb\x82(\xdc\
-\x90$\x9d\xb2v<\x03q\x90\xc0\x88\xe6w\xc8\xf2w\
-\x18\xd2\x7f\x07[8\x03\x83\xba\xdb\x7f\x96\xbf\x0f\xb8b\
-.\x92\xa2u\x14`\x10\xc41\xbe_\x08\x89\xd1m\x90\
-\x14c\xbcE!\x1d+r)\x8cVg\x84R\xb2=\
-\xc50\xa1\xa3\x94&(Z\x83-LS\xa6\xf8\x05P\
->_\xde\xc7p\x5c\x0e\x14'$f=\xee\x81\xaa~\
-\x06\xbe>\x94\x227Y\x14RD\x22\x90\xc5+\xe6\x99\
-E%4\x1a\x97\xf3\x17bU;x#z\x977\xd0\
-\x0d\x18\xa5w\x88\x86\x9bE\x02\xff\x98\x86\x1b\x18~\x82\
-+\xa5/\xbf\xb8\x01Y\x84(\x17\xfa\x18\xe0\x0c25\
-!\xd9.\xc9\x19\xf9\x9cw\xcc\x12\xeeCqoz\xcb\
-\xffm+\xc0\xe4\x0e&\xbf-\x83h\xc5z3\x9f\xa7\
-p\x81I@G\x14~\xa6\x0b\x04\xf1Jh\xe2\x9f\xc6\
-\xe0\xfb\xc6p\xdf\x83\xd1K\xf0\x03\xa0\x04\x0b!1\xc2\
-Xcc\x1c\xef7\xc4\xc4:D\xed\xc6\xab\xe1\x0d\x13\
-\xca`\x14\xde\x0f\xaf\xb9OUA~\x0d\xeb\xf9\x0eg\
-\xd2\xe4_hDk\xbb\x99h\xfdA\x95\x94`\xab\xf0\
-W1<c}\x9c\x18r\xa1&\x86y\xc7C`(\
-4\xc9\x0e\xae\x87\xab1\x14B\x9d1t\x0d1\xb1\x0e\
-!c\xc8\x07\xb9C+\xbayB\x18\x9e\xce\x17V\x08\
-\x9d\x08p\x05\xa5wJ\x87\xf3\xb6\xce\xfen(\x9c\xd8\
-\x14\xca\xde\x0d\xc2\x9b'\xe4\xd7s\xb2\xcap\xc0\xf7J\
-\xab{\xb7\x95\xd8\x07\x94\xf2\xdd\xf2\xea\xba1C\x92\x00\
-\xb1\xdf#v\xf3\xe4'\xf6\xdf?x'\x88\xe5\x01H\
-\x16Qvk2\x19\xebf\xcf\x8djvYC:B\
-c\xa3i\xe5\xa5\x9a7\x8d\xb3t3\xd2K\x16\xd2\xba\
-A4k\xbb\xbc\xc6\xed\xe6\x07\xa3\xa7\x9b\x80\xd7\xc6\x09\
-\xdcU[\x9d\x00} \xa1\x1b\x1e\x5c\x08\xed\x0aN\xad\
-\xdc\x13\x9a\xaa\x83'0\xb2a^\xb04\x078\x16(\
-\xa5a\x02\x12\xd9J' sVP\xacIro\x05\
-$,\x84v\x05\xa4V\xee\x09H\xd5\xc1\x13\x10\xd90\
-/@Z\x03\xe0\xe5ohu\x04DJ\xcb\x04\x22\xb2\
-\x99\x0a\x22\xe5\x8fr\x99\xd9*1\xdbu`\x02SH\
-O1V\xeb\xbfv\x89\xc7\x86\xbe\x09p\x0a\x9b2r\
-\x09a\x92\x91R\x94I\xa4\xbd\xdb\x9a$\x9b\xcb\xde$\
-\xd7\x8c\xc6\xb6\x1c\x0b\xeeO|\x8a#\x9a(y\x89\xb7\
-\xf3i\xe9\xda\xd9T\xe4\xe6\xb6?k\xa5d\xbd\xc6P\
-\xf1*\xba\xd1\xb5\xf2K\xad7a\x14,\xb1\xceb\x11\
-\xa7r\x19m\x95,+S\xabP\x9am\xb7Ar_\
-\xd5\xb9Lj8\xd4\x06\x16d}}\xed\xe6.\xf22\
-\xbb-\xd8\xb6\xba-\xc3\x17y\xbbD\x07\x7f{\xc3\x8d\
-\xd7\xae\xf0\x9c\xee\x5c\xd4\x93\x1d\x8dMB2'\xb2\x15\
-\x0df\xfc\xf3\xe0\xe9\x84\xbfXN^\xf8\xbb%\xcb\xaa\
-\xd6\x07\xff\xaaF\xee\x88\x7fc 3\xfeN\xc1\xb6\xd5\
-\x0e\xfck\xd3}\xf1\x17\xf8\x1c\x11\x7f\xb1It\x82\x9f\
-\xef\x94.L\x9d2\x05\xa4e\x19\xde\x11Qu\x18-\
-N.\x11\x05\xa6\xca\x1c_\x94\xb8\x17\x8f\x04\x92f7\
-P\x812n/\x83\x81\xf5\xac\xe32\xf7\xb7\xf9\xa8\x83\
-+\xd2r4.\xcaz\x8e\x9c\x87\x10\x9as\x8d\xf1\x94\
-\x92\x05\xfa\x0cW\xa3\x97z\xbe\xb6\x8b\xf2\x89U\xb9\x06\
-`Y\x1a\xbca>:\xd1b\xabI4\xe5\xb4'`\
-\xc0\xfeL\x14/Z\xab#]\xe0v\x18C4\xfe\x90\
-7\x17N\xda\xc9\x14\xbf\xf8\xcaw\x1bc|\xa9\xdb\x97\
-%\xbe\xb8`#\xbe\xda\xc70\xc6\xf8:\xcb\xf9\xfa\xc8\
-y@\xa29sq\xc6\xd7.\xca'V\xe5\xda\xf8\xaa\
-\xa5\xdd\xf1%'\xb2r\xda2\xa8\xa5\x17\xf7\x89/\xdf\
-1\xd4\xf8\xda\xdd\x14\xbf\xf8\x12\xfb\xa41\xbc\x94m\xd7\
-\x10]\x8e\xf0\xb0\x1f\x10\xed\x15\x1c\xf6\xa3\x22\x8f\xd0\xa8\
-\x84\xdd\x91!\xe5C\x19\xb4m:\xd8'\x16\xccZ\x0d\
-\xe8\xf3;]\xca\x8a`\xc5)_Zp:\xfe\xb32\
-\xd9\xd6\x91\x12\x86A\x22\xe7F\xf5\xb0\xaa8\xda\xaf\x95\
-]\x9d\x5cO\xeb\xdb\xd2\x93\x00=!\x97\xd4L1\x8c\
-\xd6t\xa3\xa7\xe4M\xb3\x18;\x85l;T5\x5c\xa1\
-\xeb\xb1\xe1t\xa1q\x18\xa3\x9bTyF\xa1\x9dRy\
-\xd3>!Y\x85{:\x959\xc5d\xe4\xde\xae\xa9\xd4\
-\xacT7\x95\x92\xdck\xa7R\xde\xb4OEV\xe1\x9e\
-JeN1\x15\xb9wk*\xca\x8c\xe6\x04g\xdb(\
-\x7f\x88&\xab6?)\x93\xef&h\xbd\xa1\xe7A\xb2\
-F\xd1\x0c\xbc<i\x0bP\x12\xcb\xb7k\x81w\x09Z\
-\xb5G\xe5WB\xee\xd2\x19x\xd5\xa4\x1d\xdcL\xd6\xfe\
-\xba%|\x11\x07!\x8a\xd6\xea\xf8u\x1f\xe5\xb6*\xf0\
-.!Y\xcc\xd2\xafn[\xc8m\x13\xd3\x7f\x0f\xf9,\
-g\x9a\xc2\xb8!\xf8_\xfeH\xa1\x94kK\x9a\x5c-\
-_z\xb7\xebe\x7f%wve\xb9yK\x88m\x02\
-%Y\x98\x81?\xd2\xcbd4X\x94\xcf\xb7\x06c{\
-'\xd3\xc4m}nHD\xa7K\x82W\xde\xc21A\
-\x11\xbd@_ \x03\xf0\x95\x87|\x18\xc4\x88\x06\x18}\
-\x11Ky\x06\x16\xbc\xf1b\x1b`\xb6F\xe2\xd4\xac\xe0\
-\xc1\xe4e~]\x88\x93(\x97\x17\xf9\x03\xe7\xfa\xc0\xcd\
-.K\xa2KA!Y\x17\x87\xd6\x82qz<\xac5\
-]\xd5Q\x96\xe0\x98cw\xa7\x07\xb7\x88)\x9bZ\xc7\
-o\x9c\xc3\xd9.\x17;\xec`\xf6\x83\x15\xfc\x9db\xc2\
-k\xe5]\x96\xc5\x91O\xdc(4\xee\xf0\xeb.\xc6A\
-\x087l\xdd\xc1\xe4\xb2\xcbZg\xa5\x19b\x80\x90d\
-\x06\xde\x92l\x89\xe1\xc7\xb2\xe1\xebR\xbc\xe20\x03'\
-\x0e\xf7\x17\x07\x0c3\xddI\x87fu0+\xe7\x9b \
-Z\xef\xb3B\xc0w\xdf\x81\xdd\x8e\x17\xcd\xa1\xe88r\
-|\x121l\xbe9/\x88\xa6O(\xca\x87\x1e\x87\x83\
-\x94{\xfeW\x82\xd96>\xe4?\x0e\xed\xd2\xa2\xa8\x99\
-\xb1Xg5\xd39\xff\xd9\x07,.\xfcO\x0c\xb7,\
-e\x82\xafEN\x1b\xbc\xff2\xf8\x09\x08f\xc1\x12\x88\
-\xcf\xce\xa6\xd5\xf2IQ\x03_wVt\xae*\xfa\xb1\
-\xb3\xa2w\xaa\xa2\xbf\xef\x119\xf9\x8a;e\x04\xe5\x96\
-\xc5k\xbf\xde\x8e\x933.\xd8\x86\x09\x13\x9b\x13D\x1e\
-\xc8O\xe1l\xf5\xdcn\xbb\xbf\xef\x1a-\x22\xe9\xc4,\
-A\x22q4\xe5\xbb+\x1f)B:E\xc7\xae\x91q\
-@\xd8\x9d\xf5\xb7\xa8\x1a\xeb\xe9\x1c\x0eyo\x06#\xf1\
-%\x9e\xe0\xcb7-\xa7\xe2\xf3\xa8\xfa\xf8.\x810\xb2\
-8\x8e\xf1\x16\xf4\x85U\xdb\x01>\xc5h\x1d\xf1\xedj\
-&\x8a\xa0\xa9\xf8\xfc~\xce\x1a`b\x89@\x98P\x14\
-\x1az\x7ft\xf5n\x91\x85\x1f\x8d@\xb9\x9f\xe0\xf74\
-\xd1I\x13\xcf\xcaW\xe8z\x9a\xd8\x99&\x9e\xb5^g\
-;\x10M\xb4\xbe\x0fj\xa3i\xe2\x19\xc7#\xd2D\xdd\
-\xeb\x1a=M\xd4\xd0Dw\xe8\x98)\x9b\x0f \x15\xab\
-\xdb\xb3\xaa\xec\xcc\xe3\x94\xf7\x91\xe4\xaa\xc1\xeb5\x01g\
-\xe5`zu\xe0\xf1\x83\xec\xc0\x14\xdf{\x9f\xf6-\x14\
-\x0f\xce3\xdd\xa1\xdc\xf3\xcc\x9eg\xfee\xf7\x83\xa3\xf1\
-L\xfb\xba{~<\xf3\xb0\x11\xd2):\xfe\x14\x9e\xb9\
-/\xcb<,\xee=\xcb\xecY\xe6\xf1X\xe6\xe9|\xd1\
-\xf3\xcb\xce\xfc\x92y\xef(\xf4\xd2\xf6U5\x1b\xbb\xe3\
-o8y\x93\xcb\x9d\xb9c\xe3\x95\xfe\x9e:\x1a\xa8\xa3\
-3*\x9e9s\x94\xbf\xa5\x22\x97\x01>/.;+\
-\x01\xc3\xcb\xcc\xffw\xb4\xd1c\xe3\xfdS\x09\xe3.\x14\
-\xb0 uW\xc3m:\xbc~\x84\xc2\xda\xba\xc0\x9e_\
-]}\xc8\xf5\xd4e-=\x8b\xa2\xfa\xa0\x98\xf75u\
-_S\x1f\xaf\xa6\xae\xdf\xe2\xfd\xcb\x95\xd6\x87*\xac\xcf\
-5/X\xef__?\xe6Sj\x94\xd2\x8f\x08\xde\xd9\
-\x03MD\xc3\x16Eh\x9bm\xcb5\xf3\xea\xe4\xe4\x11\
-7\xbe\x0d\x13\xc2\xe2\x1ddr\x0b\xdffI\x11\x12\x16\
-\x93B\x8cb\x97\xd6\x8b0!\x18\x9f\x05\xc9\xb4\xdc\xd9\
-fu\x9b\x0b\xc9\x80\x9foB\xd7\x10\x16\xecX\xf1\x02\
-\xd7,\x10f\xe0_\x14n]\xc3\xdd\xe5~-\x01\x9c\
-\xde\xf2\x7fD\xa3\xbd\xdf\xa6\xf0\xefkG\x9d>\xe7\x99\
-\xdf\xa3@Sj\x15\xd3w\xc1\xdd*\xf2\x8d\xca\xf2;\
-\x11\xd4\xe55\xcf\xf5\xee\xc2\x13\xaa\x0aQ2/\x85\xf4\
-\xe7\xe2w.\x8dP\xb4\x82\x9f_\x80Aa\xf2\xe0\x05\
-(\xa9\xee3\xe2\x95R\x19\xec\xfdh\x83oo\x0d\xc7\
-\x1c\xa2\x92\xeast\x87\x1c]~5\xa5\xcf\xd0\x1d3\
-\xf4\x87\xd6\xf7\x85\xfa\xfc|\x80|\xbbk\xbc\xf5\xf9\xf9\
-\x09\xe7\xe7\xe6o`yR\xd9\xb92\xae\xcf\xcdrn\
-v\xefk}f>jf.\xbfi\xd9g\xe6\x8e\x99\
-y\xde\xfa\xfak\x9f\x99\xfb\xcc\xdcgf937\x7f\
-\xe7\xd9\x93\xca\xcc\x95q}f\x963\xb3{_\xdb'\
-37~d\xff\xb1\xbf\xff\x03\xd3k\xad\xfa\
-\x00\x00\x06\xf7\
-\x00\
-\x00%\xfbx\xda\xe5ZQo\xdb6\x10~\x1f\xd0\xff\
-\xc0\xe5%6\xda)i\xb0<L]18v\xb7\x06\
-H\xd24\x09Z\x14\xc3P\xd0\x22-\x13\xa1I\x95\xa2\
-\x92z\xab\xff\xfb\x8e\x94\x14S\x12%\xcbi;4\xab\
-R\xc4\x16y<\xf2>~w<^\xca\x16\x89T\x1a\
-\xbd\xd6\xaf3\x16]?\xfa\x81U\xde\x83\xb7L\x10y\
-\xdbh\x1eK\xa1\x95\xe4ikGp\x8a5U\x0c\xf3\
-\x86\xc4\x09^\xcaL\xc3H\xf3\x93\xabG\xff<\xfa\x01\
-\xc1\xc3H\x88nm\xcb\xe4h\x81\x05\x8e\xa92B\xa6\
-\xeb\x96\x11=\x0f\xd1\xe1\xfe~\xfe>\xa7,\x9e\xeb\x10\
-\xfdl\x1a\xf2\xa6\x85$\x983\xbd\x0ca\xaa`\x94$\
-\x9cEX3)NM{.2\xe38Nm\xff\x04\
-\x96&\xe3r\xa8f\x9a\xd3\x10}H\xaf\xd4`g\xa4\
-4]\xb0\x14\xfd\x84N$&h\x825\x9e\xe2\x94\xee\
-\x0cK\xe9\x94\xc5\x02s\xc4\xa1wr\x84\x06\xa9VL\
-\xc4\x88L\xcf\xf0\x82\x0e+\x22\x84r\xaa\xe9\x06!E\
-\x05\xb45\x84\x9e\xa0\xe2U\xd0\xdbI9\xac0#\x13\
-\x91\xb1\xcc.\xe1\x84\xa5z@X\xa4\x87%\x8c\xe6\x89\
-8\xc5j\xc4\xf9`\xb8n\x9bI\x85\x067X!\x86\
-\x9e\xa3\xfdg\xf0\xf1+2\x03\x03NE\xac\xe7\xd0\xf0\
-\xf8qE\x89Eu\x09\xf8Q\x1e\xe0$\xa1\x82\xd8\x89\
-\xfed\x7f9ZW\xeb\xaf\x0c\x80\x1b\xcf\xb1\x88))\
-\xe7]5\xd6\x5c\x11rg3+K\x01\xb0HS\xf2\
-\x9eLa\x8d\xe5\xdc1\xd5\x03\x0ef\xbea\xf46\x88\
-2\x05\x88\xe9cA\xe8Gg\x19l\x06\xf89\xa3\x7f\
-|\xfe\x1ce 3c\x82\x92\x86U\x5cF\xd7\xa7T\
-d\x83\x19\xe6)\x1dV;-\x1bN\xf0\x14f\xd6\xf4\
-\xa3\xee\xb5\x90\xc0\xecaU\xcd\x0dU)\x18\x5cQ\xb4\
-\xfb\xe6\xc5\xc5\xe5\xf1\xab3\xb4\x8b\x1e\xf7\xd1Z\xe8\xa8\
-*&\xe0Z\xdb.\xcf\x8c\xa9Y)\xf5DF\xe9\xd6\
-\x8ad\x94-\xe05}/\x1a\xfa.-\xa1\xb7V\x99\
-\xfb\x81O\xe1\xf1\x02b\xc0\xd6\xfa\x98\x1d\xe5Q7\xca\
-\x08\x93\xdbj\xc3f\x90\xabl\x85(p\xa6\x95QZ\
-e\xb4\xe9\x1eM?X{\xa8\xab\xaa\xc9\xbd\xdd\xb3\xbd\
-\xd1\xae\xe3%>V9\xfd\x0dr\xb8\x9d\xbe=\xaf\xf5\
-\xfb\xf6\xb0&\xe2\xd9\x95\x9aD\x13hW\xa0\x04\xdd\x22\
-\xd0\x1e(\xf2\xf8z\x94i-E\x15\xa4\xbcg\xd0\x87\
-\xad\xd3\xf7\x84\xa9\xf7b\x1dt\x9b\xf3\x14\xf1wZ\x9d\
-\xc3\xc4\x13\xb3\xf6\xc9\x91\x09\xbd\x81\xa2\x98\xbc\x12|\xd9\
-\x88$\x8e\xcc\x0c\x5c#\x05[\x0d\x03Z\x85JE \
-gcOU0_Kns0\x87#\x8e\x9bc\x8e\
-\x12\xaf\xd6\x08t\xc1\xe92-\xc4a\xe8\x94[Q\x8f\
-\xe2\xe2$\xda(\xebDs\x1f\xcb\xcb\xb3jK\xec\x9f\
-\xb8\x08\x98\xaf\xc3\x8d zl\xf0\xa3\xd8\xc4\xa5\x03D\
-\x8f\xd6V\x14\x9b\x8a[A\xac\x8a\xae\xda\x19]\xc6\x08\
-\x19\xc7\x9c6\xf9\xd6l^O\xdbg\x97+\x96wJ\
-\x1a\x17\xda\xc8\x05/\x05ZV\xb3a\x1b\xba\x04\xbdk\
-\xe9\x864O\xdfNi\x9aB(\xaa\xc0\x08)$\xb1\
-\x9d\x13\xbbN\xc8GgL-l\x22\xe8D \x93\x12\
-\x86\xb59\x8a$\x10\xf2?\x8a EEi\xa6\xe8o\
-;\xce\xa0|6\x90x\x07\xbd\x18\xa4\xf0\x142Y\x88\
-w\x05&H\xcf\xa9\x89\xbf6]DX\x10\x849\x87\
-|'E\x11d\xc5\xe6\xccD\x09\x85\xb5\x08\xf8\xca\x97\
-\x01\xba\x02\xf1D\xc9\x08\xf4\xa2\x08\x0b!5\x9aR\x93\
-\xb4HA\x83\xe6\xc4W\xcb\xc4L~\x8b\x95\xd8)q\
-\xb0i\xa4\x86\xa9\xb0* \x84\xf46\x07'\x18c\x11\
-Q\x8e>\x95\xef\xefh\xea\x0e\x93b\x14E4\x01\xbf\
-\x08\xfd[|\xdf\x08\xdb\xbe_\xf5\x8d*#\xaf\xbb\xac\
-\x8f!\x1a$\xd8L\x10\xd8\x9c\x1f\xd2p\xfb9D{\
-\xe8`-\xb6\x5c\x8b\xe5W\x01\x90\xcb\xbf\x14\x82\x1b6\
-;\xe22\xa5\xe7\x12\xee\x08\xa0\xe9\x5c&Y\x12\x9c\xc9\
-Q\xa6\xe5\xd8t\xf4\x81\xf7\xd5\xf5\x1a\xda\x1cjw\xd4\
-X\xf2l!\xf2\xbbN\x1d^\x10\x9eK\x95\x063\xc6\
-a]\xb9\x15U\x09{t\xd6\x87\x95!\xb0\xbc\xa7\xbc\
-\x00N)\xcb9\xb8!\xd8\xe4\xde\xe5_\xb83l\x0e\
-\xcf\xd7\x13L%\x98\xb28\xc5*f\x22DO\x0f\x9b\
-\x823 l\x90H& \x1f\xf8\x1bX\xf7\xf4\xa0*\
-\xb3\xaa\xbe^\xc1\xb2~g\x94\x13\xdf\x9a\xcdN\xdf\xdd\
-aZ\xd7d\xc0x\x9b_\xf2\x9a\x11\xc2<\x09\xc7\x11\
-\x9dKN\xa8\xbarP8\x03\xdb\xe1\xeedt\xd7-\
-^\xb9\x1b\xb2\xea\xc9\xfd{\x9fpw&\xd6\x0f\xb8\xba\
-/\x9c\xd7B\x96\x9f\x0e\xeb\xfe\x0by{_\x1e\x95\x12\
-\xca8\xc6\xdd~\xef\xfb\x858\x9dm\x94\xa91\xa7E\
-J\xcb\xc4\x15\xa9q\xbb\xc0\xb2\x8d*%\xd6\xcd\xde\xa2\
-\x06\xf0\xf4p\xbf\x93E/\x8b\xd2\x80\x9fFw\xf9@\
-\x88.\xe0\xb2\x08\xf7P\x0e\xbb\x01\x11\x9aK\x15\xa2\xb2\
-j\x11`\xe0\x87\xd0\xcf\x90\xc2\x84e\xe0\xf4\x87u\xca\
-\xe74\x1a;|(.\xb5\xc0\xa8\xda\x1d\xd73\xd2D\
-\xd8\x18\xe6\x0a\xd11\x88\xfa\xa0p\xe1\x98\x14\xd2~\xa9\
-\x02\x96\x12\xd7\xe0\xc6\xfc\xb2\x8d~\xf9\xb2tr\xb0\xef\
-\xef/\x82O\x11k\x0c\xb9}\x16\x98\xe7Tf)\x85\
-\xe3\x12\xb7\x19\xd0\x8f\xa55H!&_{\x1c\xb3\xfe\
-x}\x12\x12\x07f>\xdb\x87\xb6\x98\xe2i\xf64-\
-LD\xc8\xa1\xb6\xc1\xa1k\xe3\x8a\xf8\xb1Q\xef\xaa\xee\
- WR\xf2K\x0a@a\x0d1\xdd3\x83\xf5\xe6s\
-L\x08\x13q\xd3\x09-6\xe0\xca\x9d\x02\xbd\xdc\xa5\xb1\
-\xb2\xaeCm+'l\x8b\xf9>\xc9i7\xcc\xeb\x0b\
-s\x1b\x9b\xedT\x18|^\x98\xbaE^\x1d4o/\
-\xc7\xd4\x9e\xa0\x9f\xeeZ\xde\xe4-~E\x8d#\xf1\xb0\
-Cn\x0a\xe7T\x9b\xf1\xab{X\xe9\xde\xfa;\xed\xac\
-\x06\xe8v\x17\xffJ\xa0\xfc\xd2\xcb\xdc?\x14#\xed,\
-\xb2\xe9\x99e\xdae\x82#K\xe1\x83\xc3.1\x08\xcf\
-\x07>\xeelD\xb6\x9eQ]I\x8d9** \xde\
-\x04\xaao~\xb4\x15!\xbc\xbe\xd6\xdb\x00\xeb\x04\xd5\xba\
-M?k\xf7\x1f\x88\x81\xcd\x1d\x9a\x945\xc8/\xb2G\
-\x9f\x0d\xfd]I\xed?\xc4\xfd\xcb\xc0\x99W\xf2:Q\
-,BE%9<\xfc\x06@w\x8a\x90\x0f\x0ev[\
-\x1e}\x90\xa8\xaf\x0b\xbb\x0f\x02\xf4\x02F\xe7>\xd2v\
-\x22\xd6\x17\x0eW\xca\xb1-\x0c\x92o \xc6\xdc\xd5\xf4\
-\xbf\x86\xa5_\xc4<\xfb\xdb{\xf67\x1b\xbbn<}\
-\x8b\x01[e\x9b\xdeU\xb4\xde\xaa\xcb'\xaf\xf7l\xdc\
-\x1a\xa7\x1a\xda\x93YvD\x17\xea,\x92\x22He\xa6\
-\x22S\xef\xfb\xa0\xa2p\xcfTu\xf6\xf2\xbfk\xed\x99\
-\xeet/\x9f8Ho\xe2\x9dvM\x84\xa5\x09\xc7\xcb\
-\x10\x8d\xa6\xa9V8\xd2E\x99\xd5\x14P\x8eh\xca\x08\
-=\x8e\xba\xd6]\x94cC_\x05\xb9_>yak\
-s=\xb3\xc9\xed.\x80me\xde@&T\x0c\x86\xf7\
-\xb9\x02\xfa;\xba\x08\xbb-i['\xe9G7\xb7\xa6\
-\xde\x8fn\x17v\xc4g\xd3-\x9f\xf8{\xa6[Y\xac\
-\xfe?\xd3k\xfd\x97\x98~\xe42\xffA\xe6\xb3\xa9e\
-&\xfd\x9e\x89U\xfd;\xf7W\xa8\x5c\xad|\xb5h\xf8\
-\xf7/\x9a\xb3O\x01\
-\x00\x00\x05*\
+\x00\x00\x05>\
+(\
+\xb5/\xfd`\xf5\x15\xa5)\x00V\xf8\x9f&\xe0\xb4\xb6\
+\x01$\x1aj\xf2\x82\xc9\x8a\x9b\xef\xcf\xd1M\x8a5\xa7\
+[\xc3G\xed\xecf*R\xde\xc83\xc1I\x98a\xf3\
+\xc8\x87\x03\x92\x00\x93\x00\x95\x00\x9f\xa5\x88\x9c\xed\xbe\xc9\
+\x01}u\x09\xd5C\xa9\x14\xaa\xc5z4f\xeb\xa38\
+FJ\x9b\x93y\xce\xaf\x8d\xdb\xb20\xec/R\x02=\
+\xb7:\xafB\xa0$\xc8\x83,H\xf6va\xcb\xc8K\
+\x8aHn\x7f\xfb9\xfb\xb7\xcf\xad\xca'\x8b\xe5;\x14\
+o\xc7\x92\x80\x90R\xe7\x1d\x7f\xa2\x00\xb8\x94>\xcdd\
+\x12d\xe4j\x1fb\x02R\xda~~\xe8\xcf\xee\x01\x04\
+\x9d\xda\xd7\xe9\x93\x92\xe3\xcc\xcc\x88$\xa3(\x8a\x7f9\
+H'Z\x19\xeek\x86\xc5v\xf8\xcf\xa7\x8f\xbb\xc7\x1b\
+,\x02i|]\xfcE>t\xab\xe2\xb9P9&\x0c\
+\x0b\xaf\x98\x97\x83r!f\x22U\x909\xcf'\x07G\
+i\x8c\x9b\xa1\xbc\x95\x1db+gco\x86\xf6\x82\x9f\
+\x97t\xdb\x1b}\xcb\x9e\xff_\x0d[\xa9\xdb\xc7\x9cu\
+\xef\xca\xcb\x05\x80\x92\x1c\x16Y\xf7$\xfe-\x84Wc\
+\x9fe\x8d\x8f\xdc\x94_\xea\x92\xaf\xed\xc3\xed\xb7\xed\x8d\
+\x14\xb7\xd4\xd3\xceT\xeds\xc8\x83;\xdc[\xcbR\xd6\
+\xeb<\x03\x12\x10\xe8<\xf5\xb6Y.$\xa7\x82%/\
+\xc9\x09\x9d\xd2\x8d\x81\xba\x95o\xec(\x1fy\xc2\xa9w\
+\xb6wE\x15'\xb1\xe9\x96\xff\xf8\xb7\xd7U\x02\x1a\xb8\
+\xae\xbd\xb3M\xdb\xda\xd8J)\x9e\xebe\x88\x17Y\xcd\
+\x8ep\xc6?v\x8b\xfdsN\x82AJ\x8f)\xa8\x99\
+\xca\xff}\xc3*\x13\xe9\xb3\x1cO\xb8\xff\x1e&\x14\xa8\
+\x89!)\xbd\xc8\xf6nt\x22\xa5n\xe6\xb0\x08\xbd\xf3\
+\xaa\xab}*I\x90\x8ah\xf2\xbf0N\xc1\xac\xcbr\
+\x8b\xc6\xed\x16\x1b\xbd[E-JJ\x22K\xe1\xf8c\
+cmk\x98\xe7Q\x5c\x8e\x92\xecmO'&E\x07\
+\xd5=\xfd\xf8\xa0~,\x90\x86\xed\xf3\xdd\xe4\xfb{\xda\
+2\xc6m\x0e\xad\xdc\x8e&\x19\xa5\xdfr;\x9f\xfe\xf9\
+\x97o4Q\xc8\x01C\x0ai\x94\xec\x14\xf1o\xabG\
+q\xeb\xf3&\xb1\x8e\xe36|S\xf8q\x83I\x09\xa4\
+m\xc5hBy\x22sN\x0bbA\x5cJ+.\xd0\
+WW 5\x182Ii\x1b\xbc<\xb2\xe7\x8d+\x94\
+\xb7\x963\xe70\xcei\xa8\xe2\xbc$H\xe3\xd6\x85\x98\
+\x8d\x97gB\xb9W\xab\xe7\xc0\xc3\x1c\xaa}\x89\x94\xf6\
+\x95\xda^7%\xa4\x14/v\x0aS\xe1\xdf\xb6\xa6,\
+%\xe8\xed-Ir\x9bz\xfam1,)\xc1\xcba\
+=\xde\x9d\x88\x8fcX\xfe\x9cm\x0b\xb4\xf0\x18\xe8p\
+\xceg1\x06<XG()\xd5\x04\x81 \xa0\x01\xa6\
+!\x12\x19\x11I\x92\xa4\xd2\x011\x08\x82`8\xc9\xa8\
+\x5c\x0fa\x83\x15R\xb0\x0eP\xb4I\xc53]\x8cZ\
+\x17\x12x\xda\xa1\xc8\xbf\x04\xa9\x10J\xb3L\xd63\x22\
+\x92\x15\xf1\xe3m\xd0\x0c\x80\xb0\xb0\xc3^?\xa7%\x83\
+\xeb\xb3\xa4-\x0d\xdc\x8f\x125\x88\x08}\xa1\xc9:\xe4\
+\x85\x06\xd9\xe7\xed-\x09c\x85\xc5\xca\xf8\x1b\x97\xed\xe6\
+\xa1\x03\x7f\x0c8\xe5>|\x88\xa6\xcc\x1f\xac\xd2B\x81\
+\x22\xd1\xcd\xf2\xd3\xe1\xf4\xa0\x88y\xcfhwV@u\
+0\x5c\xbfa\xfd\xc2h\x1f(*@h\xadFB\xc0\
+\xe9\xeep5\x89z5\xde\xe0 \x83'\x83V\xab\xdb\
+z0\x1f\x8e\xac>\xfc\x0fi\xd1\x99\xe5o\xcd\x86\xbf\
+m\xe3\x1e\xa8\xd7<j],\x99\xcd\x8cd\xe6N\x1a\
+\x06f\xbd\xc2A\x1e\x18\xb0\x8e\xd2\xbel\x98\xff)\xd9\
+\xaepq\xd6\xeb\xc0\xac\x0d\x8f\x92\xdb\x10\xb4\xfb]7\
+\x9acy3\x0c \x9d\xba\xda\x13\x8a\x97\xc1\x0a\xb9e\
+$\x88\xfc\xc2\x88\x01\x92\xed+\xa4\xbeA\x89\x13}\x9e\
+}\x84\xb9\x9c\xa2q-yH\x1aX\xc3\x0d\x1fH\xa8\
+&\x02/\x17-\xcf,6 ^\x9a\xd6\xca\xdc\xec\xfc\
+\x93\xa2*\x5c\x06\x89gAu\xc9\x1b\xdc\xc4\x0e,Z\
+]s\x00\x13Q\x9a\x07\x99\xc9oHK_}\xcb\xc1\
+.\x9bJ\xf3\x1d\xb3Q4P\xddb\xa8p\xa6\x84\xe9\
+\xadE\x0b\x96\xa6Y\xd4\x09\x82pe\x1aF\x92\xae\x9a\
+,\xb6\x00\xf1Y\xf8\xbd19\x14\x08\x1bE\x9a\x03)\
+\xa0\x91\xda\xf4i\xcc6-\x02[\x9b\xb8\x12\x9b\x82\xb7\
+\x0c]\x0c\x9c\x10$\x0d\x1d\xeeE`\x02\xa6+g\xc7\
+\xb0\x05d\x9c\x12\x88\xf5\x89\xe9\xca:L\xd8\xee\xa1\xb0\
+b\xbb$\x8f\x17|\xd0\x04\xa0r7\x22|\xb8\xda\x12\
+\x8c2\xa9dD\xde\x8a*\x00.s\xaf\xe1\xa7\xa4r\
+C\xe2\x86U&\xab\x02\xc7\x15\xbb\xc6\xd1B\x09$\x8f\
+\xca>\xfc\xdfo \x88\xab\x11\x1e\xc0iN\xbb<_\
+\x0a\x9e\xe1m0\x97g$\x9c\x00\x19\x07\xbb\x11\xff\xd5\
+\xab,?3\xa4\xd4d\xff=\x1e\xb6\xaf~\xf2\xce\x0a\
+\x82$\xa1\xed\xc2\x16\xdb\xd9[\xa0\x1f\xde\x9b\x05\xe9H\
+\xafm\x86\x84\xe8w]\xfe\xe8f\xde\xf1\xcax.\xb0\
+\xbdL8\x1c8YZ&;\xcb\x15\xca=dr>\
+\xd6\xaa=\x14\xacp\x13\x03\x00\xbd (\xf0yz\xbb\
+\x7f\xb2+`\x81R\x85+c\x8e\x0f\x96\xbd\xbcc\xda\
+\x8d|\xc22\xc2a*\xec\x9a!:\x17\xab\xcd+l\
+\x04\xa0\x05\xb8>\xb7u\xce\x86\x04\x91\x95v\xf1;\x83\
+\x86s\x89o\xf9\xf6\xda\xad\xef\xe0N\x0bph\xcfS\
+4\xcc\xce\x8e\x12\xcf\xda\x9f\xef\x22\xa3\x18\xea\x83N\xdb\
+\x07\x07|\x10 \xf1Nv;\xa1\x1e\x05^&\xda\xed\
+9\x86\x93(\xc2\xaf\xc0\x98\x88\x98\x22\x0b~\
+\x00\x00\x0b\xa8\
+(\
+\xb5/\xfd`\xa97\xf5\x5c\x00\xaae\x10\x129Pk\
+\x93\x0e03333\x89\xa8\xaa\xaa~*\x1b\xdaF\
+\xe4\xa4&r\xd3\x90\xdeDZ\xdaM\x93\x91d\xa2\x8d\
+\x81\x8f\x16`\x0c\xb46F\x1c\x8b\x0e\x8a\x15\x7f\x09\x84\
+\xb5\xceVf^\xc4\xd4\x0c\x01\x0b\x01\x13\x01\xc9\xe0\xa5\
+\xcfi\xe7\xf1)'%x\x0c\xcb\x16\x1d\xdd\xcbO\xf3\
+\xade+\x02A\xf8\xa4\x1b\xfc~\x8e\xd3\x1e\x8f\x14c\
+}\xac\x1c\xd5jy\xfc\x95\xc2\x0fo\xb3\xb3\xabl*\
+\x9b\xca\xf5\xd6f=\xe0\xb5\xe8`\xa7\x18\xd5\xfa\x08g\
+je<\x87\x15\xa2\xcb\xb7\xbb\xc9\x88JY\xad\x0a\xac\
+\x9d\x8c\xb8\xf5\xe9\x9c\xa0\xe3\x8e\x10o\xbbf\x81\xb7\x16\
+\xd3J\xe1O\x0a\xb5\xaa\xa8@\x9c\xf3\x86g\xa9\x18i\
+\x17(\xd3t_>\x85\x93\x8b\x0d\xddE\x8c\x7f\xaf\x94\
+-X7\xc9\xb7\xac+\xfbZ\xaa\x9d'cJ$q\
+\xd2\xc7\xc1\xc0u\xad\xcc=\xcb\x9aD\xed \xa5O\xbb\
+\xa7m\xab_\xdc\x1b\x17]'\x02\x89\xaez\xf3\x04\x02\
+\xb1&^H\xe9\xaf]\x7f|R@\x0eHIF\xf0\
+g\x96I\x8a\xf4\x90\xda\xfb\x0fn\xd4\xf0p)\x07R\
+jjr\xa7$$&&R\xa2\xba9\x8f'\xa5\xe6\
+23\x1f2\xe4\xc3\xc3C\x9c\xb6\xd2\xd7~\x14\xe3\xa9\
+\xe3\xb7b\xa2\xf8\x96\x1b.\xc5\xb3\x0d\xba\x08\xd1C\x07\
+s\x97\x83v\x90\xcdkU.J\x89\xa4\x08\xb7\xfb\xaa\
+h\xac\x0df\xc0H\xed\xfcir\xac\x81\x9b\xc1T\xb0\
+P2\x1ehTX*\x15.(\x1c\x13K&\xa5\xa7\
+\x1d~C\xa9M\xd0Ek;&?^\x9b\xb1Y;\
+J\xa7:\xcf\xe0\xb5\x9bW\xb6/}\xb0\xa9@\xcfV\
+\xa2\x16\xf1\x94\x0f\xcf\xa0\xc1ky\xba\xeb\xd0s\xa4\x9d\
+\x03J\x8a\xe4}\xcb$\xc8\x04\x1dd\xf5@\xf2Q\x19\
+\x94\x14k\xe7\xa1\xc8\xe8}\xa3\x18\xd6G\x93\x11\x9f4\
+\xc6W\x10k\xc5r\xe0\xa5\xda\xee\xdd|x\xa7\xb7R\
+\xfe\x9c\xc5\xdf4mC\x1dl\xdfG\x86||O(\
+9nB@J\x19\x81\xda%Z\x80i\x94\xea\xed$\
+\x92B\xc1\x05\x8fi\xd7N\x91\x1eo\xf0\xd2\xf0\xcc\x17\
+;\xe3\xe5D\x9e;\x08\x91\x06\xdf\xc1t\xf3iz~\
+\x0a\xc5v\xa9\x99\xf1,C\x9e\xe5\xe8\x85y\xd6\xbf\x7f\
+6\xd9\x1e\xe32\xcbxj\x82J\xb1\xdc\x9d\xf2\xa74\
+\xc7\xf03\xe7\x83\x22\x1b<\xeb\x1f\x8b2\xed\xddYD\
+ k;F\xfc\xcai\xda+*\xe9yF\x04\xea\xe8\
+0\xfa\xf1\x1cR\xc37\xdc(e\x04\xc2aC\x87\xb4\
+\xde/\x16$\xafu\x8e\xa4d\x14AaBF@@\
+D\xed\xce\xe0\xf9\x16\x19'\xd5\xa4\xc7=,\x97\x0c\xc9\
+\xdb\xcaj=\xd3t1>>:\x98{\x14\xb8\x90\xea\
+}\x81X\xdbZ\x91\x12\xbf\xe9\xa97\xebA\x04\xa24\
+|uf\xd0I\xed1\x9e7\xe0F\xf1\xf3\x06\xf1b\
++\xd1t\xa39\x7f\x1b\xda\xd7n&\xf0\x96\xc6;.\
+1L\x11kgs\x95k\xa7\x00\x89\x04\x802\xbe7\
+\x81LH)\xf2;\x13I\x87DQ\xc4\xc9w4\xa6\
+\xe6\xe3.\xc5\xf2Q\xff6 \xd7\xf0\xdb[\xeaL_\
+\x84W\x9a1\xe0\x18\x5c\xa6\xa1[+j\xb8\x1c\x03\x13\
+)A7\xb1b\xa2\x08Dz\xd4\x8d\xb6\xb6\xf4\x9c\xb3\
+y\xaa\x93\xdf\xd0\x92\xd2{\x8e\x13E^\x0aV\xd7[\
+\x0ae\xfb\x9alFd]\xd6n0\xf7v\xe3q_\
+\xa4\xe1Y-(%\x8f\x8c\x0e\x0d\xc9\xe7\xef)\x84x\
+\x9eH\xaae\xd1\xe6\xa2\xdaM\x12\x89\x14\xadn\x0a\x02\
+}\xdeS\xc8o\x0f\xcb\xe3\x07\xed \x81u\xc6&\x0f\
+\xf1\x124\xe4;\x83\x01\x0f\x1fQC^t0\xedL\
+\x04\x92\xe1\xb0h0.\x16\x1f\x18\x93\x0c\x06\x97\x9e\xd8\
+\xa8\xc6Z\x8d\x86l\xce1\xdeq\xcd\xf4Arz\x9e\
+<^\x8b\x19\xd0\x89*)\xbdu\xfa{\x03\x00\xd7@\
+\x82\x86gL%\xd6MJO\x99k~'b\xadx\
+o\x99e,\xf7\x98D\xe5\x9d\xc5<*\x025k\xc7\
+s\x04\x02\x22)((2\x02U\x8e;\x82km#\
+ p\xd1\xceVuU\xceC+jr\xfc\xee\xe1$\
+~\xefr\xa2\xfb\x15\xe3%[\x151\xd0\xc0\xb00\xc8\
+\x98\x5cP$\xfc\x8eZI6\xfb6\x92\xf8\xde\x8cs\
+\xa4g\xa9\xcc\xba\xe8b[\x81\xe8\xc4\xb3BLj\xbd\
+\xda\x8blv\x0b+a\xe0#\x9b^\x0e\xfa\xd2\xb0\xa4\
+t\xeb\xd3\xd1\x04]\xd4\x1b\x18\x90\x12_-\x13\x14\x88\
+$R\xda\xce\x04\x12\xd1DJ\xd52'3\xf07\xd5\
+\x95\x01\xe1\xc5o\x07\x1d\x07^\xa2\x94\xa2\xb5\x9f\xd6\xca\
+\xc1\xc9S\xd7\xf0\xd7\x85g\x1e\xf8\x0dO\x81\xd0\xf0\x15\
+\x9c\xdcS\x8d\xc9q\xf9y\x12I\x01\xd7\x94\x0f\xec\xdf\
+\x04\xb5\xd99(\x0d\x1d%\xe5\x82\x08\x92\xbc\x1c\xcfr\
+d\x83\x03\xa8\xf2l\x0c1C4$\x9a$)\xb4\x06\
+R\x18\x08\x83\x02\xb3DN[\xad\x07Rh0\x89Q\
+\x14\x8d@\x0c\xc4@\xce\x08\x08#\x84\x10\x81\x22\x90\x88\
+\x08\x91\x88h\xd3t\x81\xc1v\x85~\xa2\x1er\x02\xe3\
+D\x94\xaa\x0f\xf6E\xc4UPn\x19\x06XL\xc4\x09\
+\x1b\xe9#/\x86gnPUs=\x1e\xd1\x89\x8ev\
+<\xcc\xb2\x87\xe1\x0d\x8aF\xac\xa4\x9a\xf4\x11\xfd\xf8o\
+\xc3nsBZ\x87\x0d+\x90\xc6B\xfc\x8f\xa1\x8a\xc7\
+t\x0b\xb9&\xceB\xd5\xd3v\x8c\x0d\xcf)y+x\
+=Y\x12\xa1\xb8\x86c\x9d\xaeY\xbe\xfd\x0b\xd0o\x96\
+\x5c\xae\xa3\x92|\xf4\xe4q\xe2\xd1\xcen\xa0u\xd6\xff\
+\x89)7\xd5\x92>\xe6\x0d\xac\x98V\x11\xa7\x08'.\
+\xc2\x87a&Y;\xeeg\xde\x145\xff\xf724\xf7\
+\x8d\xa8\xc34\x87\x03q\xfe\xab\x9f\x808\xfb\x86\xc5\x08\
+\x03,\xacF\x8d\xbc\x0c\xe0(\xab\x04\x87\xda%J\x9f\
+@LeMSZ\x84\xb9]`\xca\xa8*\xe8\xc9\x05\
+\xef\xca\xfd\xe4\xdae\xd3z\x8b\xe2\xd4\x04\x8f\xa42\xd7\
+>\x1eB\xb8k\x0b\xa3\x0dHS~\xac\x0b\x9c\xcc\xa9\
+ikxR\x83\x845\xa4\x1a\xfc\x0bz2\x82\xd1\xb7\
+\x92\xf2#\x83P c\xcf\xb0\x81N<\xbb\x16-\x8a\
+\x9ed\xfd\xb5L?\x8d\xa9\xf9\xafh\x97R\xa7\xce\xbc\
+/\xb0\x1e\xa7\x89C&\x94mo\x13*3\xd4k\xbf\
+\xd0}\x05^\xeew.:\xe3\x01\x92 \xd8\x81\x9a\x06\
+X]\x93b\x8e\xbf\xed\xc7Z\x8a\x90\xa8Hs3!\
+\xe5\x92\xab\xed}UM\xfb!Z\x91W!\x18\xa4t\
+n\x03bj\x9b\xc5\xc7\xf1B1\xd2\xe9\x90\xc0\x0d\x82\
+\xd0\xf8\x1fq@\xdb\xf5#S\x916.\x8e\x93\xf0\xee\
+\xcbRG\xa9\xf9\x98\xb8I\xc4\x811\xf1\xebMD\xf8\
+\xd2w\x0a\x03\xa3r\x01\xbd\x84\xa5\xc3\x81\x9c\xcf\xf5\xc9\
+\xb1\xcf\xc4\xa89\xa7\x10\xec\xbe\xc2vd\xab;\xb7\xac\
+vN\xfe\x22Y%\x09\xad\x22\xbc\xd6\x99\xad&\x10&\
+\xc25\xf3\xa3\xa4\xa63UI\xbe\xc4B\xf7-\xe8\x9a\
+\xa5q?\x10\xb8\x81\x17\x83.\xae\xbd\xd6.\x81\xd7\xbd\
+\xa5$!h\xba\x1a\x07\x13\x10\x14\xbf\x99\x94\xec\x18\x93\
+\xc0\x0d\xe4\xd9\xbd\xd7\xf5\xa6\xe5\x15~\xb1 \xd7\x11\xe2\
+\xa2\x93\xc57\xf4t\xb6\xc1*\x16\x85\xffr\x12\xa5c\
+\xf7\xeb\x02\x0d\xc1\xc8\xc3\x82\xae\x07\x08m\xea;\xbfk\
+\x13\xea\x1f\xe9\xdcy\x14B\x16_\x19\x0a\xd7\xd0\xb3\x80\
+\xb8j\xe4~-\xfe\xfa\xa6\xa9\xa3\xf0=j\xfc\xf4\xa3\
+H$\x17\xfe9A\xde\x8f\xb6H\xfe~\xb2\xf4!\xfb\
+4\xb74\xc7\xc4:w0\xf3\xd6\x81V\xb10A\xbb\
+\xa3\x856\xd7\xaf\x89\xc8\xa0\x0db\x14\x00\xe9G`\xfa\
+\x14c\xe8<\x0fb\xc0\xd7\xb8[\xf9\xe9x\xac\xd5\xd5\
+\xc9\xe0\xd5\xd9\xe5\x06ZB(\x09h\xff\xa8\xcb\xda2\
+a(Ud\xc1\xd01\xdf\xdc|b5\x9b\xb2~\xa1\
+\xa35\xef\xcb\xa0v\xf3t\xbb\xd3R\x1d\x88d\xc2\xea\
+\x18\x9f\xe2I\x15\xcf\xb2\xf9\x0c<Z\x16L=\xea+\
+\xe95\x11\xac\xd9\xc2\xcc^\xa7=\x9c%\x1d\xf7\xea\x93\
+\x98\xd0\x18<\xb1+\xc1\xd9X\x22a7\xe4\xa2<v\
+\x03AD&H\xa5\xcd\x92\x99\xf9)\xf8U'\xc1\xb8\
+S\x85\x9a\xc2\xa5\xda\xecTR`\x80*\xff!(\x19\
+\xdfo\xb4i\x1bu?\xc2\xb1jx\x07\x8a\x8d0\xee\
+j\xec1\xa6\xa47\xf9\x08\x01\x94?\xf1\xd1\x85\x96Z\
+\x97\x8d\xb9\x05\xbbX\xad&\xe1X\x9d+h\xd7\x93x\
+\xf64\x85\xb7\xae \xb5\xbfZ\xad\xb1\xc1\xf0\xa7\x9c'\
+\xa1\x17k\xe5G\xf3\x90\xd6\x9cX\xb2W\x8d\x8c\xe6\x0a\
+\x81\xdaV\x9d\xac\xdca\xf4}\x01\x93\xd1\x87\x1c\xb4c\
+dE\xac04\xf2\x0dl\xa7\x90~\xf5\x0c\xdf\xe1\xc5\
+\x92Z\xf5\x95\xd89\xe5\x83\x86\xb2\x0ar\x1b\xc1_\xbb\
+x\xc2\xeb@\x81\x17N0 \xc4\xbd\xc3\x03-O\x1d\
+\xb9\xf5\x0ay\xa4\xdf\x1a\x95\xf5[\xfd\xd0\x85X\xf8\x0e\
+\x9f8\xd58B\xfc\xf8oL\x97\x17_\x919\xb1\xed\
+\x05\xfd~\xdd\xbcV\x8a\xdc\xfd\x00\xc0\xaf\xea!o\x84\
+N\x8f\xaf\x1d\x16/\x9dp\xe5\xac\xa4\xde~\x94\xcaR\
+\xc6\xa1L\xbf\x82\xb6\xbe\xf8\x05\x07m\xea\xbf\xcd\x98\xd5\
+\x84\x19[\x87\x91\xac,\xb0\x8b\x82\x05\x9b2\x07*\x0b\
+\xa3\xbb\x07\xf1\x1f\xb7\xa99\xa9\xb3\x89\xd57\x06?\xa0\
+C=\xba\xe7\xef\x08C\xad@\xa2\xdd\x06\x0c\xe2X\x1b\
+G\x96|x\x0a\xb04\xd9\x1e\x1a\xe7n]\xf3\x09j\
+\x93\x99\xa9Pu\xbft\xfe=\xc7\xd5\xa0\xb9U\x07.\
+@~\x1b\xc9\xe4\x83l\x9b\x80\xda*\xc2\x92\xcc\x8d\xa9\
+#\xa0\xc2m/\x82\x93\x15Qe\xc0\xb7}\xb7\xa7U\
+ \x1d\xb6\x0a\x93Co\x87fv\x90\x05\xc3\xc3e\xda\
+\x05\xa5\xf9\xd3M\x096l1\x06\x9fu\xa8\xf6t\x9f\
+\xc6\xe4\x1e\x1f\xa2\x05C\xc0z:u2\x0bk\xa1\x05\
+\x92P=\xaaB\x0a\xc4W\xe1=\x06\x91\x04{\xffV\
+\xc7.)Od\x93K\x98\xd0\x22(\xee\xf5\x96\xc5\x17\
+\xf4\x8f\xb0\xdd\x9b\x80[\x84\xf6\xe9\xedO\xdd\x15\xb8\xc4\
+\xe4w(\xd1\x89\xda\x03\xd0\xa9kp\x5c\x81\x8bug\
+\xda\xa5p\xb4\xb5\xdb\xe7\xb1\xa4\x90\xe3\xbd\x89\xc0*N\
+\x8d\x87\xc9]\x12\xb5\x15\x14\x19]\x1cs\xf9g\xe6P\
+\x14\x01\x8b\xa2\x14~m\x151\x1f\xf9\xd1\xcc_\x9e\xd3\
+\xf0\x99\x22\xdcY\xfe\xcd\x841W\x83\x1c\x82\x06\xbc\x96\
+\x9b\xde\x96*U\xcd\xd9\x8a<w\xfb\x092\xd9\xde-\
+d\xd4\xbe\x85O\x1cph\x0c\xb3\xce\xa7f\xd75\x03\
+[\xaeM\xcc\xf9\x1b\x1dg\xf9\x8aC\xf9\xe4\xe2\x05\x87\
+7\xb3\x22$\x02\x0bC\xf5x\x96\x0aA\xde+R)\
+N\x1fd+V\x8bH1\x0d\x97\xbe$\x9c\xb1\xec\x88\
+\x1a~$y\x96\xea\xe8:\xdf%_q\xf8\xc4n\xea\
+\xc38V0U\xd7\x01%\xbe\x8c\xc9\xd7\xc8k\x18`\
+\xcfE\xa3\xf4-\xdf\x05~\x7f\xdb\xec\x0dN7\x1b\xde\
+\xf4\xd1\xec\xcc\xceCTTa\x15\xbc\xab\xb1\x0e\xd8J\
+q\xd7\xca6\x10\xf7\x07E@H\x90\x9aq\xe5]\x08\
+\x98\xe5G\x83L\x95\x8f\xf3aS\xed\x1a\x22\x97\xa7\x12\
+1.\xfd.\x22;\x11t{x\xde\x7f\x9c\xb7T\xc2\
+P\xbe\xe5\xde\xf9(\x89j\xf8\x12\xe7\x94\x1e&|\x1a\
+,\xe5\x17}qGs\xabH\xdc\xf0\x1f\x06\x0fd\xa4\
+\xd8\x01\xd5\xd2\xa6[\x04za\xfe\xd0~:\x03\xa8L\
+Jc\xebo@\xff\xb4Tp\x8a\xed<{\xe9\x81\xf9\
+!\x9d\xa4O\x19\x13\xb9\x8bYx\xf5\xeeU\x12\x81\x8a\
+.2L=6B\xbefmF\x92\xf8\x05\x1el\x03\
+B\xb0\x1c\x04\xbd\xad\x9a\x961>\xa3{\xc7\xa5mh\
+\xba\x17\x15t`t\x00\x93;\xea\x8f\xd0v*\xac\xc4\
+\x9en\xec\xad\x0c\x0b\x82\x01\xc1<\xde\xf0\xed\x83\x7fp\
+\x0fd;\x93\xb4\x1b\x91zq\xa2\xc5o\x03\xed\x8d\x05\
+\x0beD\xe6\xe5\xb0\xba@PD\xc6\x81\xb1\xd9\x94\x80\
+\xcc\xb0\x82u+\x15I\xce\xb9U\xfb\xb0\xdd\xa8\xcb\x19\
+\xf6h\x93\xff\xd1\x0b0\x0f[\xf97\x12\xf7q\xe0L\
+g\xe8\x91\x11\xa3\xea\xe6\xb16! \x14\x92\x7fj\xbd\
+_\xc0B-\x05\xaf\xd80\xed\xcd\x80\x9b\xb5K@\x81\
+\xe3\xf1\xef\x82.\x03\xf2\x0dy\xeail\xa6\xf7\xf9\xeb\
+\xab\xcfD\x5c@\x04\xae\x97R\x9a\x07\x1fU\x98\xd1\x90\
+\x8aWA\x01a\xd6\x9c\xcb\xf8\xee\xed\x11.\x8c+\x07\
+\xe5b\x04a\xf8\x1c\x01\
+\x00\x00\x07\xb5\
+(\
+\xb5/\xfd`\x87n]=\x00\x06\xfd\xbc)\xc0\x92\xd5\
+\x03\xaaZ\xa5J#\xd1\xb8\xbf4\x98D\x86\xb4\x8dM\
+\x1ac6P\xb8t\xda\x09\xcb\xb0\xa6$\xc1\x0d\x07\xd7\
+U\x14\xa6\xab\x00\x04\xb1\x00\xb5\x00\xad\x00\xb6\x8e\xb7\xfa\
+I\x02\x9a\xc6\x0ak\xca\x01\x02\xf3\xa5\xf6#\x18q\xf6\
+,\xc1H@\x80yzC\xe2\x19\xaf\x9e.\xe5\xb1\xe2\
+\xe0\xbaw\x16\xbeg2\x19\xcf\xb0\xa6\xe7\xa3\x99 \xce\
+\xc5\xcc\xb6m\x82\xa302\xa8\x8e\xd3\xa6gCa\xb8\
+\x88B7\xfd@8\x7f\xb6\x8eY\x9c\xd4\xf9\xd1|\x1d\
+g\xbb=\x5c\x12IH!\xcf\x1e\xa9Wu\xdeH\x1c\
+\xab!\x8d\xd8^%\x852\x15\x1d\xbb\xd7\x8a\xaaQ\xe7\
+\x91\x87\xe9\xc6U\xeb\x92\xa6\xebh\xd3ZQ=*\x8e\
+\x8e}\xd6\xdd=\x02\xe2\x15\xa4\x9fHd\xdc\xa5\xecA\
+!.\xb5\xban\xbaU\xe3\xcdz\xe3\xacq\xe4\x0f\xdb\
+\x8a*\xa2\xe1\xd9\x92\xc4\x96\xf0\xad\xb3\x18\xda\x16\x16\xf2\
+\x7f\x03q\x5c\x06\xa1UM\xeff\x93\xf2\x9f\x0a\xf0\xe7\
+BY\x8b\x0b\x9e\xf9\xb1\x9e\x93\xb8\x9a4~\x8a\x9c(\
+\xca3\x19\x00\x8a\xf2\xca\xe4RS\xd5\xf9f/\x83\xba\
+\xb4D\xc2\xc8\x105:\xcaWH\x14;\xf1\x8aS\xe2\
+\x03E\x99\x80\xd8\xea\xcd\xe5]\x91:\xea\x87\xedE\x22\
+Y\x8c\x8cW*\xa3\x0d\xe2z+\x05\xb7\x9e`\xd9\x89\
+\xeb,\xb2,\xcb\xcb\x97\x96\x83\x83\xb7`0o\x91/\
+\xdf\x82\x80`Y\x0a\x0a,\xcbeQ>@u\x13\x97\
+e\xb1,\x0a\xc33>V\x10\xd3YC\xbb]S\x93\
+\xbc^r\x9a.c\x00i\xe6G\xd4x\x0f\xca0\xe7\
+\x9c\x93\xe38.\x92\xf1\x9e\xf1\xddQ\xf7\xad!z\xb3\
+\x08\x07cVM\xba\x8eU\x7f*\xac~y\xe3\xb0.\
+\xa3\xaa~X\xaecI\x8e<#\x18\x10\xdb\x1aR\xbd\
+\xa1\x08q]\xb5\x86\xac\xda\x12\xb8\x86\x18\x1cE\xaa\xdd\
+KCn\xe3\x18\xcev\xd3\x0f{\xe9\xb6\x22\xf5\xaa\x8d\
+\xb3H\xe2\x1d\x97i\x1a\xc9Dw\xe3\x86c\xa3\xfd\xd9\
+\x8aZ\xd2\xdb\xb1\xda \xe6\x1d\xe6\xbdsHT\xaf\xf5\
+\x8ea\x0b\xea\x11h5\x0eK7k')\xe5\xff\x93\
+\xa8\x94\xff/\xa5\xfc\xff\x0a\xc1\xbfCF\xa2\xf2\x7fz\
+\x22t\xc6v\x93\xff\x9cNC\x83\xfc\xd7Pt:-\
+\x031t6\x90G\xc3\xb1\xb6j\xb2\xdb\xcbr\x05\xa5\
+\xfc\xbf\xaeK\xfe\xcf)\xe7O\xf9\x9f\x08O\xf7\xf9\x91\
+\xd3\xe9I\xf4\xff\xafy\xcdk\xbe\x9c?\xe5t\x8b\xff\
+\xfc|>8\xef\xac?oa!\x7f\x13\xf9\xe6\xe3H\
+\xaf6\xca\xd7u\xd3\xaaA\xd7\xd9\xffr]\xf2\xa2\xeb\
+@t\x162\xe7\xba\x08\x0d\x85\xc6\xc0\xc0\xa0\xa0\xa0\x00\
+\x83\xc1\x5c.\x97\xeb\xba\xa4\x94\xff\x7f\xc9\xef\xe6\x90\xbc\
+*\xcb\x05\xfc-\xf1\xe1\xba\xa4|?Q\xb4nb\xe2\
+5\xb4\xdd\x05\xc1\xb1\x91#k\xce\xfb\xac\xe6\x88\xf6z\
+\x16\x1a\x86\x88\x8e\x8b\x0f~\x911X\xae\xa9\xe1\xd1\xbb\
+\xe0yrc\xa8\xf3\xe6\xdc~t\xba\xa67s\xdc\xa9\
+\xe2\xd3\xb9\xa2\x12\xa9\xe68\xfd;\xb6\xb1\xcd\x22E\xe2\
+\xb1\xad{vW\x0c\xd20W\xce\xc9n\xb6W\xc5\x82\
+\x15\xa8\x92#\x0d1E$\x22\x92$)d8\xf2*\
+\x04\xc1@\x1af\xadD\xe4\x01r@ E!\x0cB\
+1\x08\xc2!\x10\x820\x10D\x80 \x08\x82 \x08\x8b\
+ B !\x0a\x11e\xe4\xf4ID6\x91\xf6\x88y\
+\x8f\x16\x1d\x19-\xfb\xd8\xd1G@~9\x8b3g\x0a\
+\x16\x83I<8\xbf&\x97\xc8\xdek\xb8`\x946\xe0\
+\xc2\x92\xd2\xeb\x00G:\xde \xfe\xcaO\xd8^\xacK\
+\x1ces9\xde\x0e\xda\x01x\xdd\xdf\xeea\x9cB\x82\
+0\xba\x05`1\x01\xe3\x03\x8f\x97l\xc5q\xb6\xfa\xee\
+\x7fw\xe8\xf9\xa5\x87\xfe\x06\xe0)>\x00q\xeeU\x9a\
+\xd2\xf2\xadlc\x17L\xce\x98\x00\xbe\xe3L\x96%J\
+L\x97&\xacL)\xdb\xce\x15\x87)\x04\xa72\xb7\xa6\
+@\x19\x00\x0d\x84\x1f(Z\xed\x81\xd7l\x0f{\xa0!\
+6u5$\x1ePC/\x1a8\xd5\xccy\xaf\xd80\
+i\xdf\x14\xc2\xa9:\x87sBe\xd8\xa3p\xc7v\xb7\
+\xcd\xc9\xea\xad\xd9\xed\xb7\x7f\x88M\xc2\x8e\x90\x13\xda{\
+\xdd%}\xb0x!`\x97@\x97\xc0\x0awe\x8a\xbd\
+\xca\x96\x17\x8e\xa1\xc0\xbc\xfd\xeb\xc2\xb5\xc5a\x8bY\x11\
+\xd9\x9a\xe9\x81\xe7\xc0.\xfeu\xf9z\x04\xdc\x03\xda\x01\
+t\xc1h\xee\x8e\x15H\x0f\x0c\x0e\xf4\xe2G\x22\x8cT\
+\x80?\xa0\x1d@\x17\x8c>\xd3\x1a\x81\xfd@\xed\xc0+\
+~\xd4\x8aH\x05\xf8\x03\xda\x01t\xc1hy\x8b\x15H\
+\x0f\x0c\x0e\xf4\xe2G8E\xd7`\x98\x0ez \x8e\xa8\
+\xb0\x93\xce\x0f\x9b\xdc\x87\x22!\xc4U\xa2\xa9?\x14s\
+\x9d\x99\xc8\xea\xac\x1cY\x0bFb\xb8o\xde\xf9>H\
+jh\xccn\xb9)\xa8\xafFN}\xab\xa1]\xfa\x87\
+\x8f\x85<%\x0cE\x9b\xd2\xbc\x9d\x82V\xdaz0=\
+P\x11?\x0a\xc6\xc7jj\xb5\x05*\xcd\x1f\x8c\xe0\xe1\
+\xd0U\x9e\xcb\x02\x82\xf5Un~>\xa7\x80\x05\x00\x7f\
+f\xea\xc8\xe3\xfb\x0b\x9b\xf8\xac!U\xceT\xde0N\
+\xba\xce\xab\xbbC]I\xff\x9c\xcc\x12 \x22\xfd^o\
+\xb1\x07S\x89\xbf\x1b,\xcc;\x1am\x0bW\xf0\x19\xc6\
+6.\x0aeX\xa6 J\xe0B\xff\xa7\xae\xa3k\x14\
+v\x9bC\x0b\x80Nn\xe4\xc9\xe4\xfa\xe0*\xdf\x18\xca\
+\xf9C\x88$\x06(\x1b\xf5\xb89\x13_\x9c\x00S\xe4\
+\xf0\x08\x84\x1e\xb0\xbd\xed\x07\x8e\xc1\xbc\xc1^0\xa3H\
+\xd2\xf6\xe5g\xafUq\xb8\xc0\xb4\x15\xbc\xe5*$-\
+\x1f\x86E\x0b\xcaOJ.\x01\x82\x94\xa1\xcb\x8e\xac\x88\
+\x13\x954\xda)-\x97\xb6\xd0%\xb6\xd5\x13\xad\xedB\
+\x99\x1f\x88\x19\xaa\xcbz\x82\x8f\x82\xa3\xa3\x15\x19l\xd1\
+\x97A\x82\xae\x22\x0e\x89\xed\x1e\x8689G;-\xab\
+\xc8\x8e\xfbE\x06N\xff\x84JO\xf3A\x80\xf2O\xf0\
+b\x22V\xd5\x22(\xb7PdYX\xda\x80\x88\xb6\xed\
+\xbaNBD&\x07P\x8b^\xc2p\xc5=\xe0X\xc5\
+(\x02L\x5cL\x8d\xd2\xa8\x1b\x9f\xa37\xe4\x98\x13\x09\
+\xfe\xb5\xc6\xc6O\x8d~hY\x83h\x9b\x88\x03\x8c\x83\
+\xc0\xf6\xcb\x04\x0et\xe7\xea\xc3\xe6\xc9lZ\xd7\xa7\xd2\
+\x9a\xe1\x9e\xe3\xa5=\xd7\x00@K\xdc\x06\x8fJ\xe9\xea\
+\xe5\x13q\xca\x09yZ\x5c\x081,Uzn\x96J\
+!\x0c\x99\xc7\xcf\x19l\xd3\xdb\xaal|X\xf0\xda\x1a\
+u\xdc\x0a\xe1\xb3}\xdc\xa9`6c\xb4\xf5\xf4\xf6 \
+\x0a!^\x1c\xffm\x1f\xf0@\xafq\x9b\xa4\xf3\x04\x0c\
+\x8c\xa3\xb9\xc0\xb1\x9c\xaf\xb1C\x9bd\xact\x0e=6\
+\xd45\x9a\xfeG\xb2\xb1\x1f\xc4\x06\x03\xb6'=I\x89\
+\xdb9\xbe\x00\x98{'\xaeE\xeb\x14\xf5?\x0e\x1dG\
+\x7f\x058\x7f\x92<3\xb6\x9a\x8ea\x92q\x8dHs\
+\x12\xd2\xf1b\xb0\xe5(\xaf\x80d\x09\xbf\xa8\xbe\xe5\x1b\
+\xde[)S\xe9\x5cB\x8d\xfb$\xb79\x01\x94*\xb1\
+-S\xdd\x0dI\x82\xab\x11\x1da]\x87\xcbA\x22\x19\
+\x12%\xa7\xa1_'\xb4\x14CDt\xaf{\x86\xdbm\
+\xca|\x9a\xd4\x0c\x19\x0cL\xd5\x08\xeen\xb0\xa4Hy\
+W\x92\x0f\xd7\xb1=\x09\xcc\x8e\xf6\x17\x1a\xb0\xcdb>\
+\xd6%\x82`\xf3\x17\x1ahy\xe9\x85\xcf\xcb\xdc\xb7\x8b\
+\xa96\xb3\xc25M\x1f\xc3\x1c\xf5B\x94\xb1\x14\xa9@\
+p9f\xec\xfb\xb9\xf1yy\xa3\x89\xf8S\xe1\xac\xdf\
+\x16\xbc\x86n\x15\x85\x8a\xf0\xac\x04s\x22\x8c\xb1m^\
+@\x9c\xfe1]?\x05\xce\x12\x14'g\xc2\x00\x1f\xa9\
+L\xe9\x8a9\x0c\x97\x97\x07c\x7f\xccf3\x83=\x01\
+1\xc8SS\xe1\xd8s\x9cn\xc1\x7f\xa6l\x5cN=\
+c\xc3M\x8a\xb0I\xac\x0bl\xde Ao\x00\xf1\xc3\
+rh\xf0\xa07\x02Y.\x98g:\x02\x1a\x94\x8c\xda\
+\xba\x02\xcf\x8a\x16Wq\x89n}w\xe6\x88=\xf0\x92\
+p\x84\x0b\xeb\xcc\x82(\xe0\xdb\x8a\x8aQ\xa7/\x80\xd4\
+\x0c@u\x85cs~\x1d\x10A+\xceE\xa1P\xbc\
++\xa40:\xc7^n-\x12\xd4\xc9\x15\xba\x9dU=\
+\x92\x12j\x17\
+\x00\x00\x03\x16\
+(\
+\xb5/\xfd`\x8b\x0ae\x18\x006%q \xf0X7\
+\xd4EJ5\xa6\xf5\x83\xb2JJ\x19\x81D5\x14U\
+K\xca\xd1y^\x9b\xa80,N<LUd\x00g\
+\x00g\x00\xed}\xec\xf5\xa8\xe7+b\xce\x89\x8d\x17^\
+\xdf*\xed\xa5?\xed\x08\xbaB\xdd\xe4\x92\x9b\x87-\xf9\
+\xe9\xa1\xeeZo\x1d\xb7(\xb7Z)(\xcb\xf8\x82\xd3\
+6\x05\xc1-\xb0\x83\xdf\xae\xf1\xd9b\x96\x9bG\xa5\x94\
+\xd2JI\xff\x9abYV\xfe\xf1\x9e\x1aR\x9bb\xff\
+\x8ed\xb9^\xfc\xf6*J\xd7\xb3T\x93Y\xa2I\xc7\
+\xcaW\xe4\xe3+\x864Z\xd6\xb4\x89G\x9e\xab\xcb\x95\
+<H\x9fx\xbc93\xdd\x84\x7f\x1dJ\x90c\x82\xeb\
+\xb3b&6\xf64\xb7\xf4\xb3\xae\x85wf'\xaf\xb5\
+I\xd9qg\xa5RI\xd3\xb6,\xfe\x83\x17\x96?S\
+\x13\xa3b\x8ch:8\xed\xfd\x8b)\xf2\xd4\xdc\xe6\xcb\
+\x91S\xe3\x8d\x07\xe0!\xbdH@\xc7\x03\x00t\xe4A\
+\xbe\xc9?;a'\xdd\xe9\x5c\xf5\xaek\xa0?\x7f;\
+\x90WBAn\x96~\xb8#\x0f~\x14\xdbp\xacW\
+\x81y\xd6\xb3\x8f\xf8\xa5\xe0Z \x18\x8e\x0b\xb3.\x06\
+\x08\x04C\x1e\x19\x92\xc9\x22;\x1c\x0e\xd2\xf2\xd9\x06\xa7\
+\x7f\x7f>y\xed\xd8\xde,\x80}\xf6q\xe4\x9c\xf8\xef\
+\x80D6\xb2\xe4\x16\x83&\x89\x9b$\x9a\xdd\xd5\xdaS\
+\x0a*\x1e\xad\x80E\xca\x99\xd7\xae+mR\x7f\xfe\xda\
+O\xa6\xa1?\xee\xd6\x8a\x93L.\x13\x8e\xb2\xb2`.\
+\x88\x8bEr\x10\xdc`\xe3\xd5\xdb\x19\x0ars\x14\xb5\
+\xbc\xa5W\xcc\xde\xde\x8cJb\x7f\xeb\x0a\x07\x22\xfb\x8a\
+\xdc\xdezh?Z\xdbsmP\xe0\xda\x18\x91\xc7E\
+r8Ff\xa2`p\x17\x86/y$\xb7\xea\xdd*\
+\xf4/]\xcez\xda\xf8\xe9bF8\x09{vL\xc9\
+6\xf7n\x04|\x8fj6wl\xdeC\xbc\x1f\xde\x0f\
+\x80\x84\xa0\xe1\x19B\x88fD\x92(l[X\x03 \
+\x84\x10\xc4\x98\xd96)C\xdb6\xfe'\xafahK\
+\xa2%XD\xdb\xa0,D\x12\xc0Q|\xa9\x01T\xd2\
+0\xadu\xa0AM\x87`l\x80Q\x83\x8c\x02\xf5]\
+\x8a\x15\x8a4'$X\x87\x12\xee\x80\xc0}\x5c\x04\x0b\
+\xcf\xb5\x93\xc1\xb5/4\x8e:%\x1ah%\x02\x1cM\
+\x8a\xb4\x8a\xba`\x14|:`\xce\xa1\xef\xc0a\x805\
+\x15C\x81\xac\xc0\x1c9\x11P\xb6B\x06IywY\
+8\x04\xa6\xa3x\xc1\xba\xf4\xe9J\x9ay\x93\x02\x9c\xcf\
+\xc0\xcc\x93N \x1a\x120cX~wk\xc8zL\
+\x0e\xc5\xbf\xc7\xdd\xd1B/\x184\x04i\xa8\xc5\x996\
+\x9a\x01D\x94o\x9d\x19\xcd\x05\xd0P\x84r<u9\
+\x06\x5c\x00FY\x18\x00\x86\xa0\xa8\x19\x8d\xdd\xae\x0b\xeb\
+TBJ\xd8\xc6\xbah\xf9\xeb>P\x83\xd0\xe2\xb8\xd5\
+\x00<\xea\xc5\x8f\x0c`wnX \x9c4)U\x04\
+[Q\x9b\x06U\xfc\x16\x03\xab\xba\x02-\xcc\xe7\xb6\xa3\
+U\xe2#\xa0\xf6Z\x09\x17\xd7\x14\xf0)\xb6\xf0G\x1a\
+\xdd\x86\xd2XY\x98/\x0c|\x803XH{\xe0\x19\
+k\xe0\xa1\x04\x85\xc7&V6\x9a\x03OV|\xb2\xa4\
+6)\x07\xe77\x9e\xad\xfb\xc3l+r$Z\x06M\
+\x0a\xd9\x22\xf3>\
+\x00\x00\x06\x94\
+(\
+\xb5/\xfd`\xc4BU4\x00\xd6|\xb7(\xe0\xf0\xb8\
+\x01:U\xa6TrwY\xb8\x90\x0fv\xb0\x89}\x8d\
+a\x8c,R z|\xf1\x92\x9f\x8b\xc98\xcbi\xc2\
+\x0cm\x98y\x01\xaa\x00\xb2\x00\xa9\x00\xb0\xe2a\xe1\x8b\
+\xd4\x9c\x88\x22\xb9\xae\x0bB(P\xf1\xa8x\xc0\xaa\xe1\
+] v\xc1\xcc\x83\x82\x09\x1e\x99\x07\x13d$\xe4E\
+[lx\xbf\x02\xfd\xada\x93j\xd1/\xad\x10\xbf\xb4\
+\xa6\x92'\x8d\x9f\xcd.d\xef\x93\xfc\xb1\x0c:\xb1\x8d\
+\xb7\x19\xed_.\xbd\xf5Jm\x0d\xb0\x00q\x02\x98r\
+\xae\x1d>s\x0b\x10\xed\xca\x94\x9414]KE\xd9\
+\xec\x9fnmw\xb1.\xfa\xf6\x08\xcf\xba^\xa6\xb4\xc8\
+\xcc\x0c\xb0\xc1\xbeu\x07\xe0\xb2\xf9\xf0m~\xdc\x9f>\
+if0=\x00\xeew\xb4\xd4\x0d\xb2\xa3\xf5ok\xba\
+\x92\xda\x9f\xf4\x92A\xb5\x19#&\x80Q\x16\xbb\x87\x7f\
+\xe0\xb7\xb4r1L\xcd\xb8\xd9\xb6l\x06\xbd:#\xce\
+D\xddI\xff;\x05\xcd\xb66\xfb\xed\xdd\xeeuk\xa3\
+\x0b\x9a_\x95\xea\xbe@\xf1m\xb6\xe5L\xac\x83\xb8'\
+\x99\xee6\xb3\x8d\xb2\x06M\x07~\xa5sG\x84-\x16\
+\x0bC8\x14\x07X:\x86K&\xf0Zz&\xd06\
+\x1d\x14\x89h\x82\x89&\x19\x16\xc2\xea\xc4\xbb$\xeem\
+y!u\x123j\xefL\xac\x92\xdco\xa4\x0e!\xcd\
+\xbb8\xd7\xe7Q(\x07\x08\x08\x91\x0a\xf6\xa90\x18\xa9\
+|*\x08\xa1UY\x95\xc4\xc7r\xe0l</\xf3:\
+\x9c\xab\xd3Y\xfd^7\x0f\xf0\x83)\xae\x0c\x8f\x89A\
+:\xa8\xa56;j\xb1\x88\x8d\x18\x1e\xe4N\xd2gw\
+H\xae\xcd\xcd\xe8\xb2\x01\xa0\xc7T\xa9e\xbdQ\xd3$\
+\x05U\xa4\x93bM\xd8`\xce\x7f\xf3\x1d\x1de-\x15\
+\x98\xde\xa8\xf5\xc5\xb6%\x85\x9c\xa5\x0f9\x8b\xefsk\
+\x8ezfb\xc0\xd3$\xab0u3\xa8\xd5\xa2\xcd\xd4\
+(3\xe7\xdab*S\x84\xa9m\xc6\xac+\xb4\xfe\xef\
+\x92\xafJ\xe3yU\x04W\x97\xd7\x81\xfc\x1e\xc7!\xa2\
+\xa3\x22aJ\xf4Z\xcc`\x98: 8\xd8\xfaE\xf3\
+\xa6\x7f`\xea\xa7ss\xbb\xb5/R6\x071LM\
+\x1a\xbf5\xa2\xec\x8f\xb5\xb3\x03\xd7\x88\xf0g\xa4u\xfa\
+IC\x02\x01\x01\x10\xeb\xb9\x17LI\x07yg\x9f)\
+\xd7L\xae\x93\xf4R\xe9s\xf4\x9f\x82B.#\x07\x01\
+\x00\x1d\xfd\xdec\x8c\x865\xff\xcc+\xa9\xbaO+\xe4\
+\xb6\xd4v\x0f\x01\x81#\x15\xfeT\x5c\x15dQkK\
++\x84\xd6\xff;\x83l\xa9\xbf[\x95U\x15LJ\xad\
+\x02\xd1\xdb\xaeH\x9d%\xa0\xa1\xb1 \x5c\xca\xa6w\x17\
+n1\xec\x12\xd4\xf7\xc3\x8c\xb9(\x12\x8aD4\x11M\
+Xr1K$\x07\x13\x9e\x0d\xc4\xc6sy|\xbd\x06\
+\x0e\xe4\x89w\x15HT\xea\xb9\xae\xcbu\x5c$\xb5\xc5\
+\xf6\xba.\x84\x1d\x90\xe9\x95Z\xb8\x80\xcb\x16v\xf9\xf1\
+'J\xf3Ie\xecw\x8d-\x0d\xf1(\x8bRs\xeb\
+\x18T\xc4\x94KP\xbc\x11c\xaa\xd1#)\xf5\x94\xe4\
+\xe4<\xc9=\xd3gm\xff\x06\x81v\xa0\xa11RF\
+HDD\x92$Ic\xa1\x0c!HJ&Y\x15\x0f\
+^\xb9\x22\x8e\x0f\x22\x15\xf7\xd8\x05\xad\xa7v=\x86\xd6\
+*1\xae\xf9\xd1\x0cA8z\xf3\x97\xb4@\xe1\x1d\x95\
+\x18UA\x9f\x15E\x5cW\xab\x17\xa9\x9d\xc0\x15\x98\xc1\
+\x0b\xf5\xdb\xd6}\xdd\xbbRf\xf8T\xfb\x07\xae\xf7#\
+\xf5H\x0bP\x97:\xcb\x14\x9d\xfdUh\xc7\xeaf'\
+E&\x17\xc0\x16\xa9\xb8@\xd2\x05\xecB\xd9.;\xa4\
+\xc4\xda\xc3\xa9\xde\xf9\xdeKyu\xa9\xf6~\xa7\xcd$\
+\x9c\x99\xb0\xa1\x8e\xdb4&\xcd\x19\xd456U!a\
+\x12\xe2\x12\xd5\xc5(TC\x1f'\x03\xa3\x94Z\xfcG\
+\xbd\x06\xffP\xbc\xd6\x1fU\x0a\xfb\xa1yi\xa9\x85\xab\
+\xa7\x80\x9b>\xbe\xc4D]sQ\xe2\x93\xad\xa3\x8a#\
+%\x0b5\xc5c\x82\xe0\x16\x94F\xc7\x04\x9e\x83\x7f0\
+\x07ei\xf6\xe3\xa7I?\x22\xcd\xf3\x5cje\x0d\xee\
+hh\xd1Q\x9eW\xe9\x98G\x12\xec\xf7<|\xc1\x05\
+\xbf\x9f,n\xaalXL\xcdG\x97\xa5&\xc3\xf3>\
+M0\x9d\xf6OWj-/m\xa7\x92\x04ho*\
+\x86\xd4\xbdG\x80\x09\xb1\xa5\xf7\x8c\xda-\xf5\xac\xa0\x22\
+\xbd\x8e\xda\x8b^5?\xed\x8f\x88TB\xc4)\xaa\xa5\
+\x03\xe3%\xf8\xc7W`\xf1T\xab\xe1\xcc\xa6y\x91W\
+\xcc\xa7\xc9\xdc\xce\x0dj\xae\xe8\x88'\xdee\x13G#\
+F\xdd\xf0\xef\xba-\xc3#\x10\x1eY\x04\xa6TL\xee\
+\xd6\xa3\x03/\xa4\x12\x1e\xd1\xa9a\xce\xc6\xc6]\xbb\xbc\
+\xa1\x94\x14\xf6\xa0{>W>\xa1c\xec\x22\x82R1\
+\xcd\xa1\xc2\xca\x84u\x13I\xba\x1a\xf8>\xab\x9bB\x1e\
+\xba\xd2\xba\x94\x96\xd3\x0d\x12\x1d\xc4\xd28\xfd\xeeJ\xd8\
+\x17\xa9#\x04Dhb3/<\xfcQ\xe5\xb2\x99\xc5\
+)/E\x1d\x8f\xeb\x193\xb1B\xc06\xc9\x11\xd3w\
+\x0b\x15\x846\x90\xbb\x88\x0a\xaad\x89_u\x88\x01]\
+\xc9\xd1=\x8d{O\x9c\xd1\x9f\x19\x9ehf\x89\x0a\xdc\
+\xe6\xa5B\xc6AX\xfb\xf35\x93\x00\x0d\x15L\xf9!\
+*\xe3*\xf8\xe3\xc2\xa6\x8d\xd3\xbf\xbc\x86\x1f\xe2\xcaD\
+`\x81\xb8\x82\xe8E\x84\xd6\xae\x0a\xa7\xce\xfbl\x1a\xdf\
+\xa8a\xe0X\x7f\x8eL>G\xe9\xfcMZqD\xc3\
+$\xd9\x0f1b\xd9\x04b_\xaf R\xc0\x84\x02\x98\
+A\xfb\xb2w\xdfGQ\x96\x15\xdb\x9fu\x00z\xf7\x19\
+\xf1\xa3,\xff\xc0\xb9\xaf\xf2\xe11\xb5\xf1pd,N\
+\xa8-\x8e\xda\x8b\x1b\x1d0'\xfb\xd8\xe1b\xc3\x91\x9b\
+2\xc6\xc7\xe3\xa7A\xad\xe4\x1f\xd9l\xb5\x8c\x87\x92\xd3\
+\x04\x1c$\xe1G0\x16\x9cW\xb2#d\xfepv\x8b\
+\x1d\xbc3d\xb5\xb3Ma\x81N\xce\x81\xcb\x06\xe2\xfc\
+G\x90$N\xfd \x96\x9c\x0a\xc5\xf9\x93\xf6TLi\
+s\x07\xe7\x88]p\x00A\x1d\xbaIbM\xec}7\
+\x18\x10\x8a\xe9\xa6\xb4]\xaa#\xf1\xca;\x1f\x9c!\xc2\
+\x1aW\xa5\xeb\xda\xeb\xe5\xea\xaeJ\xa0E9\xe2\xc9w\
+\x0fy\xd3\xd9>\x80\x89\x0f\x044\xc03\xd0\x04A~\
+\xa4\x0e\xc1\xc6H\xc26P\xfe\xd6\xc4\x17\xb5\xc1(\x80\
+L\xe2\x95\x07,\x04\xa6|\x94\xa6w\x8c\xde\xf1,\xcf\
+9S:K@0\x02^<\xef\x10\x00\x80\x13\x09\xde\
+G\x90\x80`\x92\x09\x88\x1f\x193y\xc8\xe6`\x80#\
+\x16r9%k\xd2\x1b\xc9\xf2\xa3\xb4\xda\xca\x0c\xf4\xe6\
+\x09,\x11\xa5\xb3\x87\xa9@\xf8\x1aR\x10.\x84v\x1a\
+A\x10:\xbc\xb5 \x14\x0b\xf8\x1c\x80\x1ei\xd8 \xce\
+\xeb\x8b#\xbcx\x0a\x03\xbea\xf0\x15\xf0zr\xb3d\
+\xa2\xf0\xe8\xfab\xe1\xd1\xf5e\x85Ev\x8b\x02\xa8\xf5\
+\xcdA\xe2\x0b\x11 \xc7P\xef\xa6\x00g\xddJ\xb8\x8b\
+\xb3b_5\x0e\xb9\xe0Y\xbf3p5\x7f/\xa98\
+\xac\xf4f\xbd\x09x\x8c0\x89!\xd1*h\xe6Cv\
+\x91\x8b)\
+\x00\x00\x06u\
+(\
+\xb5/\xfd`B\x17]3\x00\xc6|\xb2'\xc0Xm\
+\x03\x847Z\x9e\xdbI\x15[5\x13\xaf\x1a\x93\x9a\x81\
+\x0a3\x0d\x9a\xc9\x90\xa6\xf5\xb1\x18%T\x9e\xa2(\x8a\
+ME\x01\x08\xa4\x00\xaa\x00\xa4\x00\x1a7B\x0dX#\
+%\x1c\xadN\xd8/\x13oS\x84E\x87\xa6\xa7w\xd6\
+\xda5M\x84\x85\xbe\x84\xcf\x91-\x0d\x0acL\xa8\xb1\
+{\xa4\x9b\xfd\xb5\xd4\xd7\xa4\x1b\xd6N\xaf\x98\x84\xfe\x93\
+\xca\xd6W\x83M;uNl\xe3\x15\x92\x0d\x7f\x1f\x8c\
+\x9a\xf6q\xd5\xe9a\x5c\xab\xb3\x96\x93\x12\xa8\x81r\xd4\
+If\x7f\x22\xf5hJe\xf1s\x94\xed^\xb2l\x10\
+\x82VO\xc2 \x93:\x9d\x04\xadHo]\xbc\x1fZ\
+\x12q%\x06E(ZYPU\xf5\xb2\xa2\x97\xcbe\
+\xfe\xd6\xa7\xbd\x88\x0b\x9d\x7fCn\xc6\xf6\x97\x0dBi\
+KB\x10w)=\xb8m\xfc\x86\xbe\xb7\x96\xc1\xa4\xdf\
+\xd0\x02F\xa5\x02\xa3\xd5\xa6@\xab\x15\x95\xbe=;\x82\
+:\x90\x1e\x93\x1c\x9d\x86\x12\xf5;\xf5\xe8|\x88\xc1+\
+\xa3R\x91\xd1P\x92\xb5vX\xc7\x85\x11\x96h\xb3\xd9\
+\x88\x08H\xb8\x99\xe9%\xbbo\xcfm\xeaQ\xef\x7f;\
+A\xb5\x18h\xd0\xdf\xe4\x88\x8dJi\x88\x1eq\xdc7\
+\x1dG_CR@=\x94\x1e\x8c\xc9%\xbd\x8c%\x17\
+BYX4sz\x92\xb7\x09\x0fIG\x84gd\x1d\
+\xd0\x8c\x12\xe8\x84\x19\xbf\x7f2\xf1\xe1\xbb\x0e\xa5\x97G\
+?\x85;\x9c\xad\xd8$~\x1b5\xc7[\xdc\x8f\xf7\xa8\
+\x86\x8a\xf1\xe3\xcb\xf1I\x93iBY\xdbQ\x9f\xdc\xae\
+\x0bG\xc0\xc5\xb8\x9c\x80\x87\xfd$\x0czGB\xcc7\
+\xf4\x17G\x99m\xb1A/\xb9\x8a\x11^nz\x934\
+&\x87\xb0h\xe4'\x17\x84\x91\xbe(\x8ee[rS\
+\x1e\xe9\xb7\x94\xfb\xb4]\xebP\x87\xc1\xe8\x9b\xca\xa4\xd7\
+~\xfd\xadG\xbb\x8a\xc1<\xb0oS\xb7>)\xfb\x07\
+\xc3\x9b\xbfV\x99\xc3K6(\xc2\xd2P<;>\xed\
+#\xbb\x94\xa1\xd5\x94\xfd\xbfAX\xbe\x96\xdc\x9fSO\
+1n\xd7{\xdbT\xc9<R\x92N\xdf:$\xcb\x00\
+((\xa3\x15\xb6sr\xa8\xb4\xec#\xb6\xa4\x85\x86\xfa\
+\xcf\xc0\xc0\xcb\xad\x1d\x1aR,H\xa9\xf7E\xc1\x10R\
+\xe8\x14\x944\x07\xba\xe9\x14P(\xad\xb9\x97\x96\x96\x15\
+\xcd\xf8-@\x1c\xcf\x82-8\x19\xc2\xfd[\xff9\xfa\
+hu\xda\xa8Mha0\xd3t\x9c\xc9\x99\x8cm\x06\
+9\xfbkq\xaa\xe7'\xcf\xb7\x9eN\xf6\x83\xaf\x0f\x1f\
+,\xea\x0c\xaa\x90\x18\x8c[\xc5}\xf0\x9dM\xce\x17\x22\
+\xc6\xf6'\x02\xb1\xbcA\x9c\xb6\xce*P\xf4\x12\xb6\xe6\
+^\xf6U]n\x13*\xe2hK\x0f\xc6\x09\x06\x0a\x85\
+\xd0\x01\x97ZT\x1b^W\xf4%g\x1c%B?\xe1\
+\x05g\x9a\xa3R\xad\xfcC6\x9c\x93]K\x91\xf0\x8d\
+\x1b\xc6\x1cZi0\x18\xca;\xe6\x89V 3\xee\xa5\
+\x95>h\x06\xa0\xe28\x82\x13\x9a\xac\xc8p\x02\xa59\
+\xb2\xfe\xef\x91\x16\x81\x93\xa8\xc1-B3##\x92$\
+I\x9a\x03A\x08\x820\x1ct\x14\x9e\x07\xe2x0J\
+1$EBD\x1a\x83\x0cAD\x11\x91\x80DDH\
+\xa4 M\xd2\x1a\xfde\x0fto\x99\x1a\xf2\x02\xb4\xdc\
+A\xca\x00x1fC\x012d\x9f?f?\x87\x85\
+i\xc0\xd7a\xfflb\xde\xff\x0a\xa9\x7f\x85e\xae\x08\
+0\xe5\xac+G\x14\xcf<\x0b\x05\xa3\xa3\xf0&!\xb1\
+\x90|\xb2\x94\x10\x99&\xc5\xa6\x88\xa6\xe88?\xfeU\
+\x22X\xfd\xf5\xd3\x22r2\xa4H?\xaa\xc6I\x9b2\
+\x15\x00J\xb4\x9dO@\xccj\xc0\x1d\xba\xc2\xd1\xead\
+\x19G\xeb\xa8\xa5\xf2\x83L=6\x81\xb7\xee%\x9bL\
+\x89\xadF\xff\xca\xf1\x5c\x83\xe5\x12\x9b)\xb0P\x07j\
+lh\xaa;\xa8\xde\x9bWo\xabp\xd5\xfc\x86\x82\xef\
+cL\xae\xa4\xad\xc3N7\xc6\xc4\x1d \x82\xb4\x11\xe6\
+\xdc\xc5uA\xa2I\xd5KX\xa77\xb4\xd9\x84c0\
+l\x1d06t+\x0e\xb86$\xac@\xe4\x0e\xc82\
+\x96_\xc6r\x8b\x92a\x18(G\xabg\xce5&\x17\
+\x18\xf5\x8c\x0c\xf1\x1d\xfdk.\xea\x90\xe0\xfd\xb6p\xa8\
+j\xb1\x19\xa8u\xda\x1e\xdf!\xc7\x16\xab\x8b|\x09\x19\
+\xcal\xa5\xdf/\xf5%qE\x1biN\x0b\x1b\x08C\
+\x86\xf9;?iG\xa2Iw\x0b\x91\xa4\xa3w\x129\
+\xb8\xcd\xa5\xdf(Zc\xa8Ec\x11oo\xc5\xe2\x95\
+e\x12I\x15\x86\x93\xc6F\xdbg`+O4_~\
+Q\x14ok\xcb\xab\x93\xf4\xd0'\xa5\x00\xb9\xd3\x88\xe6\
+\xbd\xe4\xa4\x9c\x00\xe2\xf0\xb8\xaa\xd4\x92\x0bLu\xbcD\
+'\x05\xa2)K\x8d\xca\x1b\x97~\xb4I\xf2z\xb9w\
+$\x8c\x99k\xcc\x90\xc2\xe0\x16i`\x1f\x22zxl\
+\xed\x97\x07\xff\x9e\xc2\xcc,\x1f\x80+J\x11\xc3\xb7\xf5\
+\x1b\xe5?\xa6RI\x07\xd1\x073\xa2\x99p\xd2\xf8u\
+\xcb\x04\x18N\xf5\xcc:\x8aCA\xc5\xfd\xe1\x88\xb7\xbb\
+O\x83}?\xf9\xa80\xb7\x5c\x04\x0c\x12\xf4\xc2\xdc\xfc\
+~!\x99\xfa\x13d\xef\x15R<\xd1\xb3\x9f\xc5M\x94\
+\x03\xf3\xd5\x0f\xb2\x13\xe7\x99\x89X\xad?\x00\x97\xf5\xa4\
+\x90\x85M\xe2[\x5c\x9b\xf0\xe7\x22\xcb\xeb\xad\x02\x91h\
+\xab\xa1\xcc\x0bx\xae\x8f\xc5 \xbd\xeb'k\x85H&\
+\xc5S\xc0pr\xbb\x8b\xa3.\x1a\x1c\x0b\x97\xadM\xb6\
+h\xba\xb7\x1b\xe3S\xfe\x13\xb4\x16`\x90\x96\xa4\x0b\x0d\
+\xcc]\xd5\x93\xa1s\xc0'tr\xe1S\xd2=\x05\x99\
+(4?\xdd\xe2~\xc8~\xd5\x89($x\x1f\x1b\xa0\
+\xa5\x14\xcc!\x1c\x91,b\x9d\xd1aS\xfa\xc1\xd9\xb1\
+\xc4.{\xcc\x7f[\x18\xde\x16\xe8S\xce1\xfa\x84\xa0\
+\x88K05Q\x92\x16\x0e\xde\xcaJ\xf8-\x82B}\
+\x91\x1fe\x82d\xc8\xf9\xef\xabQ\x0a\x7f\x8d\xd8\xa2\xb2\
+\xfbQZ\x92\x90\x0b\x94\x224{\xf9\x06E\xc81k\
+\xbd\x1f\xd5=\x867\x80\xce\xacfUZf\xf5X\x0d\
+\xdc\xcc\xb9K0\xe6'\x0aupb\x81I7j\xdf\
+\x8d\x8e\x17)\x86t\x8a\xed\x02 \x1a6\x91Ax:\
+6\x07\xfe\xea\xf1_\xee'S\x9c\x0f\xafh\xc3\x0c;\
+\x09\x12\xbe\x06<[\x06A~Z\xf0\x5cL6\xb6\xe9\
+\xac\xf4\xec\x93\x9f}r\x87\xc1@\x01\x1d\x9d\x04\xbc[\
+\x9a\xda\xb7\xfe\xba;d\x9fP\x8b\x82\x04\x15\xe4kW\
+h`\x1c8\xb8\xf2\xc1\x04`o\x97\x19A\x1c\x19\xd9\
+\xb6<\xcb;\x9a\x1d9\xc7S]{\xd6Q\xbai,\
+\x00\xb5\xd8\xcb\x87\xef#\xe4\xd6\xcd\x89\xfdL\x9aG/\
+\xbb\xc3\xb3^Y\xcb\xfc\x1d\x0a\x8et1\x97O\xb6c\
+\x14\x0c\xe4\xbes\xcdB\x8f\xc6\x9efY\x80u.\xfc\
+\xbe?^A\xdc\x1c=\xe8\xff6=\x93\x86M\x13\x97\
+\xd1\xf6\xe2_\xa1\xd4\xe99\x96')\x82o\xe3f\x0e\
+w\xb1\xb4~\
+\x00\x00\x0b\xac\
+(\
+\xb5/\xfd`\xd9@\x15]\x00\xeaU$\x0f,\xc0\xce\
+\x88\x1b\x0a\x02\xd0\x97\xedn\xf6b\xc5\xbe\x85\xab\xbec\
+\x01=\xcc\xb4\x88\xf04\x90y\xd3\xfa\x03\xae\xee'\xa0\
+v\xbf$\x08\x82`\x1a\x84r\x01\xe0\x00\xe7\x00\xe7\x00\
+\xcf/\xb5iK9\xad(\xd6>o>\xd8\xa3\xb9}\
+O\xa1^\xcd\x80\x01\xd5Sn\x1bJ\x05\xc9\x99@\x92\
+\x13\xc9\x09\xfd\xe9\x9e@\xddf\x91g\xdc\x9e\x8f\x8c\xd1\
+\xd4;\x99\xbb\xdc>\xc7,_\x16\xbelw)\x1d\xf6\
+i\xde9G\xb7\x9f\xd9th\x17\x94c\xf8q{\xdb\
+\xbe\xb6wE>bX\x0au\xe3\x9d2\xd4\xcb\x93\x98\
+\xcd\xd8\x8b\xc6lu\x14\xc7\x88\x93\x15\x91\xad}8q\
+\x1e\xc8\x11)d\xb4\xfd\xfc\x91\xd2\x9e*\xce\xf9\x95q\
+\xbf7\x81\x22\xcdsksk\xa3I\x02\x19\x91\x0f\x09\
+\xb9]\xc8,9\x91\x99\xa8\xedo;\x87\x9cS$2\
+\xfa\x8a\xe2\xad$\x12\x04\x19U\xdf\x18\xc3\x00\x97R\xa7\
+\x95\xf8n\xad\x8by\xcb\xa8qf&\x83\x85d`\x88\
+\x94W\xfc\xe5\x1a\xc5he\xb8\xaf\x15(\xb6\xc3wN\
+\xc1xs\xdc\x011\x840\xbe\x1c\xbc\x83|\xe8\xcf\xe2\
+\x97(-f\x9a\xf8\x9f%ML\xed\x9b\x00\x09H\xca\
+=H\xc0\x93N\x14\xe1~;\x9a\x1b\xdd+\x96\x1bu\
+{\xc3\x992j\x1f\x1e\x0f$\x93\x12\xa2\x0b\xa5\x89\x8c\
+<?\xd9kSA\xa6=\x19\xa7p\xc9r\xca>\x0d\
+\xc76[<7\x06\xbf\xf1\xddy.\xa51\xae\x95\x0f\
+\x0f\xd5\xeb\x06f\xdd\x13_\x1b\xb7^\x1e\xa8\xedE-\
+\xec\xb1\xf6/@\x22?\xb7mI\xddB\xce\xff/\x8a\
+m\x8a\xf2\x8d\xbd\xb9i\x1b\xc2\xb6b\x10{\xc1o\x89\
+#_\xa0\x8d\x8a=c\x1a\x9c\xdb5\xc9\x0b\x17\xb2a\
+)\xb5.\x1a6\xb6N\xcf\xe5\xb6\x12\xc2\xbc\x1b\xa0\x86\
+\x1c\x90\xb1\xcdSf\x1fj\xbdl\xd1\xd6\xf1t\xe5\xc4\
+\x04\x80''\xcels\x17\xef\x16\xc2\x8bA\x11z\x22\
+\x997\x90\xb6\xcf\xb67:x\xfd\xc2\xa7\x8a\xd7\x83>\
+\x1eC\x16\xb7\xad\xa5\xce\xa11\x08\xf3\x06E\xf8yw\
+9\xfb\xf0\xd0@\xe5\x16\xd0:o\xee\xca\x95\xf2\xdd9\
+e\x19\xe32\x87\x8f#\xa1\xad>\xfd%U\x09\xce\x82\
+\x85W\xccT\x0b\xf2\xe4~{+*\x91\x88\x83\xc7\x13\
+\xb52~\xb8\x17\x08*E\xb7w4\xe8\x1dP\xf3\xca\
+S\x88\x91@d\xb4\x15\xd8\xf2\x8e\xfdA\xef|\xaa\x88\
+&H\x17N\x1aX|8p\xab\xd7pp<v\x13\
+\xc2\xb8)\xce7b\x1cR\xfcF\xd3N\xa3\xe9\xc2\x88\
+\x03\xb7\xb5W\xcb\xb4\xdfg\x96\xa3\x03\xe3\x0f2\xea\xe6\
+\x09\x8a\xd0+\xe6\xd4YW;\xe5BBQlP\x9b\
+\xd3\x8f\x14\xffk\xe2\x19\xd0\xdb`\xdc\xbe\xb1\xd1\x9bE\
+\x11H\xdf\x93Q\xc6\x00f3Z\x9b\xb4\x02\x11\x10\x92\
+\x8c\xb7\x8cM\x9c;\x91\xd8\x1d\x1ff\x1bK.]o\
+#\x8b\x9d\xf9\xf72m\xfd\xb7\xffL\xcbX\xecq\xe3\
+x=h\xa9\x01\x8bR\x0b\xa3=\xe9E\x0b<\xcb\xc1\
+\x89P\xaeA\x8d\xd0\xd7E@\x86Q\xc8x\xab\x0c\x1b\
+\x8d\xb60\x92@D\xd8V\xac\x15\xcb\x03\x04\x16\x8c\x8b\
+\x09\x07\x83\x8ad\x80qa\xd1\x16\xc2\x9d\x16\xbe\xcd\xb4\
+\xddt\xe3\xfd\x15\xea[K\xbbs\x5cl\xe3\xb8\x14L\
+\xe1Gi\xa2\xfd\x22\xb7\xd6\xf4!>D~\xd0\xd7\xf6\
+\x101H\x81\xc1\xcb#\x8bp!\x1b8\x8a[[\x9b\
+\xb4\xa6{QK\xf7ea\xc9\x88!s\x9c\x8c4\x0f\
+\xf79|\xd0f\xe3\xe5\x95\x88\x8aWJ\x22\xa3xq\
+S\x98\x09\x22\xa8\xd2\xe3f\xf0\xaa\xd8\x8b\xf7;\xaf\xc0\
+n)\x12\x90\xe5\xb7\xdf-c\x0a\x1d\xe8\xcd\xf0k\xed\
+\xd2Fep\xdf\x83\xd0=\xb1\xc8H+p\xeb\xf3S\
+\xd6+9\x92\x00NF\xd0\xdb\x99\xa4\x00\xc66\xe5\xb8\
+\xe96\xd8(\xd1a]\x16;\xb6\x9e\x7fF\x94c\xa6\
+/Z\xfe\xef\xd2\xb4\xed\x98\x82Z\x81\x1b!\x1a15\
+\xdd\xd7\xc4\xae\x98n\xab\x8c\xb0\x01@6\xc4\x95\xd0\xcb\
+\x9cR\x1c\x07\x15\x13\x83e\xa8\xd2\x84\xce\x19*\x92\x91\
+$I\x1a\x03b(\x08Drq\x16\xe6y\x8c\x0f\x92\
+h$KQ\x18\x850\x14\xc2\xf0\x0c!D\x11\x02\x05\
+\x84\x10BD\xcc\x88\x88\x8cJ\x92\x0e\x09\x03\xe17\x87\
+\x9a\xfa\xcdc\x94\x7fR\xe7\x1c\x94\xb2\x979\x95\xbc\xbe\
+*\xa5\xa9\xb0TG\x15I\xceR\x03\x80\xe8\xfb\x1cC\
+\xd3\x87\xac\x95\x19\xd4\xd1\xbb|9\x02;\xc5\xaf\x90k\
+\xea\xb5\xe5;\x15\xdf]\xb8\x1b\xc1\xb7\xfd\x8d7\x85_\
+\xbb\xf5\x8e\xd0\x5cC\x14\x06\x00\xeb\x95\xb9\x03\xdc\xc8\xe2\
+g\x9f\x11T\x03\xb6\x83\xc2\xf6\xe5\xee \xcc@;\x96\
+\x925H\xf5\xa6\xc2H\xbfs\xe0Ml5\xc7\xba\x8c\
+\xd0\x0b\xef\xcfWo\xe4\xc0\xd2\x98L\x9e><6h\
+%\xdei\x87\x15\x19\xc4\x0a\xb2\xeeI\x98E6\xb0h\
+\x9dB\xfd\xa4\xb3f\xfd\xc3\xc3\x1b\xa99@\xbcR\x0a\
+\xb8c\xfc\x8e8\x01]F\x0a\x0f\xdf\xfa\x8f\xac\x81B\
+Q0_\x08\xb9\x86`\xcf\xbb\x0b\x96\x0d&\x9b\x03F\
+`E\x0e`.\x93\x81\x87_\xb5\x00}\xf9m\x8a\xab\
+&\xd7v\xc0Q\x07\xd3\x8bK\x95%K\x07\x19 \xb9\
+Ec\x85\x17\x0c\xc20\x16 \x92\xea\xedT\xaf\xc2M\
+^q\x99\xf8\x1c\xc8\xbaj\xb9\x99\x1c\x02\xcdT4\xdf\
+\x11;`'H\x81\x94\xe5\x10p?`,\xb4\xf7+\
+\xba\x1d\x00\xddS\xbe\xa0\x13\x15\x1b\x07\x07O\xe817\
+\xc3\x07\x16)\x82q\xba\xb3&\x8ag\x80\x01\x014B\
+m\x16\xca\xfeId\x08\x0bj\x0f\x0cs\x8e\xce\x82\xb9\
+O\x1eG%\xfe\xc7\x0a\xa6\x93\x894U\xb0w\x91\xa5\
+\xa2\xc9\xe0\x09\xa8\xb8Y\xabT(\x80\xfaZ1\xd7\x86\
+\xbc\x07\xbb\xf5\xfb<yt\x87k\x1b\xd8\x1aiF\x86\
+?\x09\xe2\xd5\xd7\xe6\xbc\xb9P\xe1\xc9N\x99\x0a'u\
+\x03\x1a\xc0\xc8\xc3\x8f\xc4\x8b\x96\xce\x14%M8\x8b\xaa\
+\x8brC\xeb$'A\xc1s.\xf3S\x5c1L\xe9\
+\x9c\x10\x01.j\xc2k\x1bm\xcf\xf5\xab\x19\xbc\xc4\x22\
+\x9e\x05\xcc\xebn\x16;j\xf6*L\xf7\xcb\x1f\xae\x7f\
+\xab\xda\xbb2R?\xf4z\xceGf%\xc4L\xaa'\
+o\xee#\x1d\x96%3\x07\xd9\x5c\xe4\x0b?\xa8|`\
+P!\xcaU\xe2WD\xa0\xa36\x8d?cU$2\
+\xc4\xf5\xaeK\xb71\x10\xda\xf1@\xb7\x85\xc2\x0b/\xfe\
+\x80\xbd\xb9Q\x1d\xa9\x10\xe0\xcf\xa4VO\x5c\x91\x87\xd0\
+R\xb4\xf5=x`\x9d\xb4\xed\xae\xf2\xa7RC2\x07\
+[ud\x1d7=\x06\x01\x8a\xd2\xaek^;\xda\xb0\
+\xdc\x06\xec\x80\xa2\xed\xe8\xaf{{^\x91\xddrpI\
+:e\xf2\xb7\xd5\xf0\xfe\xe0O\x87\xf5\xbd\xb0\xca\x95\x03\
+\x84*s\x07\x08'\x1a\xb9\x0d>,D\xd0\x0f\x0d&\
+\x14\x18\xe53 XI(\xb2\xafZj\xfd\x08\xcb\xce\
+)\x04\xafF\xb0\xc9\xe4\xa2\x0e\x02UP\xa6\x00G3\
+\xfeg\x81G\xe98_\xa5y\xc8\x8c\x10\xab\x11\xc4V\
+i\x8bz:\x18f\xb3\x86\xe3V\xb3\x0f\x04Go\xc9\
+\xa0\x9eV\x88\xe4\xa3\xec\x18\x13_>(=\xae\xd4\xa3\
+\x9f\xad\xc1\xbc#\x00\x84S\x90\x1c#\xaa\x1e\x14@\x19\
+x\xb9\x12K\xb4\xe1Ys8\x19\x14\xff\x90\xb5\xfe\xa9\
+\xa3Z\xc4]Q#8\xa11r\xac\xe0\xeb\xb1S\xe5\
+3Sh\xcd\x5c\xc4\xdb\xfe\x8c\x86\xc6+\xef]&'\
+\x8e\x1c\xf7{\x92,\x88}\xe3Gk\x9a\xd8\x85Z\x84\
+\x0c\x16\x16\xa7d\xc1\x1c\x18Q#\xf0A\xa6\xdanf\
++&\xac\x00\xa8 G8M\x857\x17\x81\x1a[\xec\
+F\x5cxZc\xb41\x03w\xb3wS\x99-P/\
+\xe5\x90\xf1\xf3R\x1e\xb8de\xba']3UR\xc9\
+\xd0\xedPij\xfc\xf9\xa6\xc4\x95\xdf\x12\xac\x5c\xbc+\
+6\x01\x0e\x026\xec\xa1\xe3\xae*H\xacn2\xa8\x0c\
+\x98F\xef.\xa9}2\xb3Lv\xd1<&\xb5\x80\xec\
+HN\xb6rE\x0cn\x90S\x07\xd6u\x13+\xc6d\
+\x04\xac\x02\xbb<\x19m\xe7\x86\x1f\xd0\x0c)\xdb?\xdc\
+\xe7\x88b\x8d\xa7[\xff\xabaH\x22\xe1\xb3\x8d'\xff\
+\x0e\xb0\xdf|S\xd0UkJ^%K\xa9j~\xd7\
+\x8d\x92\xff\xfe\xea\x1aI*\xcd5\x9d<\xaaE\x92\x98\
+\xc4\x89\x94%\x04\x1aS\xc8\xacf>m\x04\x91\xe6\x1f\
+\x07\x01S\xea\xf3\xd7^\x0f~\xffi\xf9m\xbb\x9d\xec\
+\xa8\xd2\xb8N\x8e\x19\x04\x8f\x85\xb6Jl5\xf9V)\
+Y\x9c[\xf5\xc0\xda\xa9\x8ec\xac\x82\x15q\xf3\x13\xc2\
+\x17`\x8c$\xb7\xdeC\xcb\xbf\xa8\x96ayR\xc3N\
+\x9eH\xc7\x06\x90\xc8\x83\xc6*{\x0b\x07+\xbcp\xff\
+=\xe9\xa8Y\xcc\xf1\x81\x1aM\xd1\xc3\x8c\x87\xafN\x80\
+\xbb\xf9])+\xe9\xb9FRj\xd2\xcd\xa4|h\x9a\
+U\xeb\xb5\x1f\xa2\xc8\x99\x82\xbb!\x22]\x88\xb8\x85\xd3\
+[\x80\xb5s\xe9\x88\x7f\xec\xe7$\x8ab\x157\x13\xcd\
++\x18\xb1\xc4J]\x8dE\x1bI\xf3#\x05\x5c\xa4\x00\
+\xed\x10\x02\xa86bH\xf6\xe9=\xbcd\x07\xf9\x10\x96\
+\xbdL\x93\xce\xa2C\xbd\xb6\x1e\x1f\xfa(\xee\x93l#\
+\x951u\xfb\x06\xa1\x80\xc9\x06<PZ\xe9\xc1\xdc\xb9\
+O\xc1C\xa1\xdd6\x06\x95\xfe\x13$D\x1e\xc0\xa5\xe9\
+\xed\x93p\xe2\xe4\x1e\x01V9?\xadS\xe5\x22Zo\
+\xaen\x86\xaeO\xd0\x1a\x8f\xaf\xc4\x13\xe6]>z\xc8\
+c\xfd\x8d\x81\x09\xe3b\x94\xefE\x07@\xeb\xae\x1a\x1b\
+`\xa6\x95\xb2X\xf6K\xefy\x17yf\x14\xc8DP\
+\x1a\xc0Y\x1d\x852X\x92\x1a\x93\xdf\x0c\xb8$0\xb8\
+.\x06\x10\x8f%s\x92\xd9\x8aS\xc6\x13\xc6\xa1{1\
+\xd2\xf6\xa3l\x04\xe7\x8a\xef\xce\xd4\x18\xc0\x86\xe4\x04\xfc\
+\xf6\xfeLbrs\xe2\xbaC\x96\x98>9\x0bv!\
+\xc4\xa4\xf1\xe9\x17\xaeI\x886\xaa\x18~\xe3\xdb\xe2\xde\
+2l\x0a\x98\x22\xec\xa38\xad$\xc6\xc1q\x8b.<\
+PB\x5c\xbe=\x0a\xf1c\xa9\xb9\xde\xef\xfa\xc3K\xff\
+\x11?=t\x99\xf0\x10\xf9\x8b\x5c\x90Hx\x02w\xad\
+b[\xe7\xec\x02\xacI\x87\xb9\xa1\xb4\x95\x18 \xd3\xc4\
+\xfe\xd5\xdbz-\x90l\x09\x91\xc2fn\x1e\xa6\xff`\
+\xa0\xaa\xd9,fSH\x0e\x0f\xded\x9f\x8fL\x9b\xa4\
+A\x10\x16\xce\xf5\x8cAZ\xba\x9b\x81\xdd\xa9\xb7\xcc\xda\
+\xa1D\xd4\xa2Y\xa6\xd1\xc3\xe4\xb3\x9c\x82(g\x83\xf1\
+\x09\x15-\xa7m6\x98\x0fSI-\xe0@\xb5\xa0\x15\
+\x90\x95_\xd3\x91\xc1\xa5cF8a7>r\xfc\x11\
+\xaap\x1f\x04\xf3A9/@\xec\xd8\xfc\x12\x98\xea\xb4\
+~\xf1\xe8\xf0~\xc9\xa4T\xc6\x07\x9f'\xb7\xa2\xf9\xea\
+\xc8\x12#n\xb1\xe9\xb0a\x9e\x93w-\xe2\xa9KQ\
+-\x8f\xde\x1e\x0e\x97\xde\x13\xe9rS@\xf1s\xd6\xda\
+/\xf6\x93\xc2\x00\x16:\xe3\xa7\xb3\xba\xe7\x02\xa0\xa8\xab\
+_\xd6\xb2q1\xbd\xfd\xf1\x80\xd5\xf7\xdc\x06h\xb8\xa8\
+\xa6;\x08L\x99\xc48\xf1\x00\xae\xf02gG^\xc8\
+-\xd3\x8c\xd730\x0b\xa4\x027\xb3\x88J\xd8o\xc3\
+4\xdc\xc4X\x01\xbbQ\xa5\xea}c\xd7\x93\xa8\x07\x10\
+0+o{V[\xf0\xd9\xe1_H\xbd\xc8\x85\xac\x18\
+\xaaN\x93&\x5c\xd7^*\xad8\x1c\xa0\x0dvuy\
+\xb9\x9ch\xb0\xa2\x0b&F\x18t-\x85\xee\x9a\xbek\
+\xd0\x8a\x19\xbc!F\x12\x88\xb4\x05s5\x11\x07\xfb\xdf\
++\xe6H\xf5w\x1a)\xf4\xf2\x1f\xf8\xac\xea:\x01q\
+\xa0\x01\xd7\x80\xdc8\xb0\x89\x80\xb2\x97\xa0[~\x00G\
+\xe5I\x19w[\xf7'x\xc6\x85#\xfd(dx\xae\
+\xd8Z'5R\x22\xd2\x86\xa5\x8fl\x01&\x08\x8dP\
+V\xae\x8c\x8bn\xe0?\xabF\xb2\xf1\xaf\x83\x85\x09\xc8\
+\xc2-\x81\xe8\xe6\xbc?!\x9a\xd00\x14( \x0b\xf2\
+R#\xdd\x1d\xb7\xd4\xfbJ\x1a\xe9\xf7\x9c\xfee%F\
+\x831\x90\x0d\xd56\xd4\x9d\xc3*C\x1d\x1dGx\x15\
+r\x5cO\x04\xc0\x92c\xa4\xf62j\xe8Q\xdd\xb9\xf0\
+\xe2\xe6CM\x09s\x82\xd4\xd7\xe5t\x82\x1c\xe5}\xde\
+\xff\xc1\xb0\x0d<jP\xd2\x16M\xa7\xb7\xc0.*\xca\
+\x82\xedc\x0d\xf72\xae\x01\x1f-8U\x1a\xccl\x0f\
+|7\xf4\x19#K\x1cL\xea\xb7\x05\x98\xa14\x0d\xe8\
+\xf3\xa8pd\xd6\x08Xy\xa2Mv\xdb\x09\xa4\x8d\xf6\
+d\xe5\xbd\xda$\xc7<\x12\xcd \x1c\
+\x00\x00\x08Y\
 i\
-mport QtQuick\x0d\x0ai\
-mport QtQuick.Wi\
-ndow\x0d\x0aimport QtQ\
-uick.Controls\x0d\x0ai\
-mport QtQuick.Co\
-ntrols.Material\x0d\
-\x0aimport QtQuick.\
-Layouts\x0d\x0a\x0d\x0a\x0d\x0aPag\
-e {\x0d\x0a    id: spa\
-ceWeatherAurora\x0d\
-\x0a    anchors.fil\
-l: parent\x0d\x0a\x0d\x0a   \
- objectName: \x22sp\
-aceWeatherAurora\
-Obj\x22\x0d\x0a\x0d\x0a    func\
-tion loadAuroraR\
-eport() {\x0d\x0a     \
-   checkUrlExist\
-s(\x22https://www.a\
-resvalley.com/po\
-seidon_engine/au\
-rora.png\x22, funct\
-ion(exists) {\x0d\x0a \
-           if (e\
-xists) {\x0d\x0a      \
+mport QtQuick\x0aim\
+port QtQuick.Lay\
+outs\x0aimport QtQu\
+ick.Controls\x0aimp\
+ort QtQuick.Cont\
+rols.Material\x0a\x0aD\
+ialog {\x0a    id: \
+root\x0a    x: (par\
+ent.width - widt\
+h) / 2\x0a    y: (p\
+arent.height - h\
+eight) / 2\x0a\x0a    \
+modal: true\x0a    \
+closePolicy: Pop\
+up.NoAutoClose\x0a\x0a\
+    property str\
+ing message: \x22\x22\x0a\
+    property str\
+ing messageType:\
+ \x22\x22\x0a    property\
+ string dialogTi\
+tle: \x22\x22 \x0a\x0a    wi\
+dth: 440\x0a\x0a    pa\
+dding: 16\x0a\x0a    R\
+owLayout {\x0a     \
+   anchors.fill:\
+ parent\x0a        \
+spacing: 16\x0a\x0a   \
+     Image {\x0a   \
+         Layout.\
+alignment: Qt.Al\
+ignLeft | Qt.Ali\
+gnTop\x0a          \
+  Layout.preferr\
+edWidth: 48\x0a    \
+        Layout.p\
+referredHeight: \
+48\x0a            s\
+ourceSize.width:\
+ 48\x0a            \
+sourceSize.heigh\
+t: 48\x0a\x0a         \
+   source: {\x0a   \
+             swi\
+tch (messageType\
+.toLowerCase()) \
+{\x0a              \
+  case \x22question\
+\x22:\x0a             \
+       return \x22q\
+rc:///data/image\
+s/icons/dialog_q\
+uest.svg\x22\x0a      \
+          case \x22\
+warn\x22:\x0a         \
+           retur\
+n \x22qrc:///data/i\
+mages/icons/dial\
+og_warn.svg\x22\x0a   \
+             cas\
+e \x22error\x22:\x0a     \
+               r\
+eturn \x22qrc:///da\
+ta/images/icons/\
+dialog_error.svg\
+\x22\x0a              \
+  case \x22info\x22:\x0a \
+               d\
+efault:\x0a        \
+            retu\
+rn \x22qrc:///data/\
+images/icons/dia\
+log_info.svg\x22\x0a  \
+              }\x0a\
+            }\x0a  \
+      }\x0a\x0a       \
+ ColumnLayout {\x0a\
+            Layo\
+ut.fillWidth: tr\
+ue\x0a            L\
+ayout.alignment:\
+ Qt.AlignLeft | \
+Qt.AlignTop\x0a\x0a   \
+         Label {\
+\x0a               \
+ text: root.dial\
+ogTitle\x0a        \
+        font.pix\
+elSize: 16\x0a     \
+           font.\
+bold: true\x0a     \
+           color\
+: Material.foreg\
+round\x0a          \
+      visible: t\
+ext !== \x22\x22\x0a     \
+           Layou\
+t.fillWidth: tru\
+e\x0a              \
+  wrapMode: Text\
+.Wrap\x0a          \
+  }\x0a\x0a           \
+ TextArea {\x0a    \
+            text\
+: root.message\x0a \
+               t\
+extFormat: Text.\
+RichText\x0a       \
+         wrapMod\
+e: Text.Wrap\x0a\x0a  \
+              re\
+adOnly: true\x0a   \
+             sel\
+ectByMouse: true\
+\x0a               \
+ background: nul\
+l \x0a\x0a            \
+    font.pixelSi\
+ze: 14\x0a         \
+       color: Ma\
+terial.foregroun\
+d\x0a\x0a             \
+   Layout.fillWi\
+dth: true\x0a      \
+          topPad\
+ding: 0\x0a        \
+        bottomPa\
+dding: 0\x0a       \
+         leftPad\
+ding: 0\x0a        \
+        rightPad\
+ding: 0\x0a        \
+    }\x0a        }\x0a\
+    }\x0a}\x0a\
+\x00\x00\x02L\
+(\
+\xb5/\xfd`\x0d\x09\x15\x12\x00\xb6\xd6D\x1f0s\x1e\
+\xfc\xeb\x92HtW\x0aT\x8b\xb0\x05\x9e\xdeM\xa7\xfc\
+\xfdS\xc2\x196\xf0+h(\x13\xa5\x02<\x00;\x00\
+:\x00\x89m_Q\xb0\xabB\xa1`\xd8V\xfd\x8b\xbc\
+\xab\xe7\xbe\xb4\xe3k\xe2l{pw7\x02m\x14\xd1\
+\xaf\xd3\xc3\x91\xc8\xd0\xfbY\xc2h\x9c\xfer28\xf3\
+Ixa\x91\xc6\xc1Jy\xca\xbe\xcf\xcb\x82\x01\x02\xc0\
+\xee`)\xb4\xfa]\x02\x04\xdcB7\xdb:>|J\
+q\xccH\xe4\x84\xcf\x0e\xc6\xeb\x92\xd8S\xb6y\x1eF\
+~\xd3\x0ayv\xb0\x87%,\x93\xdd\xee\xa6Ul\xa7\
+\xbd\xfe\x8er\xb2\x97-'#\x9f\xe9x0l\xeb\x0f\
+\x9cbw\xe0\xc5^\xc6\xc6pd\x9b\xf7\xcf\xf9\xb2\x9d\
+\xafm1\xc2\x0c\xa3>+'y\xb2\x8a\xfdN?\xa3\
+\x82\xa6\x98\xd2\xb6\x02\xce\x0bk\xfe\xcfE?\xbf\xab\xae\
+\x935\x0aQH\xd6\x90\xd5\x0fy\xb0N?\x09q\x1a\
+\xc7?ySlAVVi\x9a\xd8\xa7Wi\x22U\
+\x1a\xf4)\xbb\xf6\xe9\x08ye\xc8\xf9_\xbb\xfa_\x1e\
+\xc3\x16i\xd5\x88\xa9(\xe8\x88m\x94\x84\xef\xf1$\x80\
+\x82\xa0A\x1e\x99\x19\x19\xa1 IR\xe8 \x84\x10\xe5\
+\xd8\xcd\x03)\xa3\x11\x87A\x1a\x0d\xc1\x1frt\x090\
+\xc8\xfd\x95N\xd1aN\xca\xed\x02\xfc\xe8\x09\x1e9\xa4\
+B\xf20\xff0\xb1@\x18\xa1.m5NJ\xf5\x08\
+\xa6\x16\x01\xe5\xde\xa59g\xbavEfJ\xff\x22$\
+b4\x91\x0c\xb7Zv\xbb\xe4P\x81\xeb\xe6\xa5SI\
+b\x99\x936\xa52C\xf1\xb0\xaaD\x1d4\xf4E\x03\
+\xdb\x8a\xc2\x1b|\xe5\xd7\x9b\xf3\x17\xd0\xdc\xb5Q\xe8\x98\
+\xd1\xf7\x0e\xe8i[\xc2\x88\xcc\x10\xd0\xfa\xe1\x10\xa2\xdd\
+6\xc4l\x19\x84\x1c\xe0\xe4\xdfr\xf9\xc1{I\x18\x9e\
+N5\xc3$d\xa9\x94\xf5!\x80\x17y\x10m\x96\x9a\
+\x11\xe0\x15\x97{\xc3^p:\x5c\xe8q\xd3[ \xe6\
+\xf5\x15\x9e \xe9\xfc\xf0\xf9\xe1\xdd\x82\xad~\xfd\xae\xf3\
+\x975\x86\xdc\x0ds\xe44\x80\x06f\x0f^2\xcd\xcc\
+\x0b\xab\xc4!L\x1d\xab\xd7\xc1\x15\x1e\xf6\x93\xe2~\x9b\
+-\x16\xcf,\xe1-\xec\xac\xdd\xea>vl`p\xd3\
+M=\x16;{\xe5\xbe2!\x7f\xe3y;q\xf0Y\
+\xa6iH\xfcB\x00\x9f\x5c6`|b\xa2.\xda2\
+\x08\x19\xc2\xaf\xc0\x98BL\x91U\x1a\
+\x00\x00\x09\xa5\
+(\
+\xb5/\xfd`\xfc]\xddL\x00V;\xaf'\xe0\xd2\xb8\
+\x01\xaa\x0cM\xa9\xc0\xee&\x7f\xa9]V\x5c$\x0e!\
+\xdd\x9a\xed.\x87\xdcE\xb8\x05\xf3hu@\xab\x1a1\
+Fe\x06\x87\x9f\x00\xa5\x00\xa6\x00\xd8\x06e\x92\xf4\x91\
+E\xbb\x0e\x89\x91\x18'!w\xfe2\xbec\x97\xb1\x08\
+\xf2\x06-\x0e\xa6\x9a\x0d~\x93*\xb5\xa0\xbelEi\
+\xf8_6\xbb\x8d\xb2\x1f\xc6\x0e\x14\xf2\xb1\xd7\x96\xa6\xa4\
+\xb3\xe2Y\xea\xec\x84\xb5W+s\xab\xc5\xa6_\xa9\xa7\
+\xec\x0c\x9c\xfc\x97\x98,r\xad\x1ev\x03}#JS\
+\xf29\xdf\xfa\x8bZ\xd7\xc8\x14\xc2(\xa6\xbd\x98{\x13\
+\x0f9\x84\xc9\x8fL\xdf\xdc\xcb\xadJ\xe5\x06\xe3\xa3\xfc\
+\xde\xa0\xbd\xb2\xde\xdd\x8d|,k\xaf\x22\x12\x89\xd4\xef\
+d\xe9I\xf8k\xca\xff6VuI?\xca\x8c\x15\x11\
+\xc1\xee,\xdeb\x9f\xca\xc9u\x1ae\xae\xfa\xb4\x87\xca\
+\x22\xcf\xf9\xb6\xd7\x22\xbb\x15\xb1>\x15\x0fE\x1f{\xcd\
+\xdeT9\xca\xc0t\xb9\xec\x80\x85\xca\xb8\xa35\xf2\xad\
+\x8a\xeaL\x13\xc5\xb9\x00,K$%\xfa8\xae\xab.\
+\xdf\xb1\x17\x99]\xd3d\xc5\x1d}J\xc4\xd5\x1f\xc8\x9d\
+\xe1\xb92\xcdz\x03sX\xa2R\xe3\x7f\x19(\x1dJ\
+\x89\x08\xb5\xd5nZUS\xcf\xda\xc0\xc0\xc7N:+\
+loB\xa5\xa9\xa5\xf2\xe3\xa9-\xc1=\xef2\xb9\x01\
+\xc1\xa7\xc90l\x9f5\x093\xd9K\x22\xb9\xecGR\
+\x82\x91;\x90\xc430g\xe5\xf2\x97\xb2\x16J`\xab\
+\xcc\xb95\xdf\xc1O\xfd\x93\xae\xe1z\xd9,\xbe\x12T\
+M\x9a\x89\xa2\x9d\xca\xe1\x8c\x91\xe4\x85\xc6\xc5\x10\x1d\x12\
+3;\xa9\xc5\x86or\x0c\x0a\xf6\xaa$\x995}\x98\
+\xf2+\x96\xbdbk\xf4m~\xd3\x9aF\xaes\x99\xa9\
+x\xae\x96\x9d\x84v\x12\xa2\x9er\x8d-zL1\xd1\
+'\xe4\x11\x896!$\xb2PB\x0a\x1b\xba(l\x05\
+\xa2\xe8\xe0,\xb6E\xa1,X\x96\xb2\x91*d?\x1e\
+\xba\x145\x1fg]\xb6Ffl\xeb\xdb\xb6\x04\xf7\xd5\
+H\xbb\xe7\x0bvyQ\x9a\x80\x80\xacD2\xc9d<\
+\x92\x1cS\xca\xb5+a\x9b\xf1Cv\xae[\xb9\xe9G\
+\xd6bOf\xd1N\xbe3\xde\xf8\x16\xf4\xd6\x97\xb7_\
+\x8c% \xe0\x91\x10(%v2M\x99(\x0d\xb6\x91\
+E\xe2\xf8#\xfei\xec\x9c\xf1\xbb,\xfa0\xee\x92B\
+\xcel\x87\xb4k\xe0\x91\xdc\xf8V\xa9\x14p\x1d\xd7\xb1\
+9\x12w\xc6\xd7\xfeH*\xe6 \x03\xf6S\x8e\x9c\x81\
+\xb0\x22sQkg\xf0\xf7Qztd\xa6\x0f\x94U\
+qI9k\xe7\xfc\x1b\xf5C\x06\x84\x87\x83\x8d\x01\x8b\
+6a\xf2\x80\x98>\xf6#s\xec\x0e\x9b\xddK\x22\xd9\
++\xb3\x01\x01\xab\xc5\xb7e\xae\xca^\xd8G\x06;\xd6\
+\xc9\x86\xbd\xa8\xec\x0e\xe5\x8d\xe1\xf3\xd9\xe9D\xc9\xa9\xf3\
+e\xdc\x1f\xc7\xd1\xec\xe5\xd1\xfe\xbe\xe7\x83\x05\xec\xd1\x9c\
+\x8f-g\xe6\x12\xb3>\x06\x83\x14\xa8r]\xc5\x10\xcd\
+\xc8HR\x90\x14\x86\x03\xf2\x18\x84\x01\x89\x9c\xa7Z\xa8\
+\x9d\x07\xa2\x88\x1cDq\x08N\xc00\x1c\xc20D\x11\
+B\x08$\x86 B\x88!ID\x02\x11\xd2\xa4m\xc4\
+F\x11k\xa1\xa8dp\xadc\xef\xb1d\xa2\xf1\x0a\xb2\
+{\x1a\x7fat\x1f?/\x9b\xda\x9e\x22\xc9\x17\xd8\x9e\
+\xeeD1q\x1bc\x22H\xc2\x926f/hV\x12\
+\x81{\xdd\xf3E\xd3\xc8\xcd\xb4MtO\xc3uYx\
+Y\xcc\x0a\x93!\x13\x96\x09$\xff\xaatu\xecg\x9a\
+\x0d:\xca\x16rZ\xc4\xd6\xd7\xf2D \x94\xb1\xf1\xe0\
+\xbf\xc4\x00$H\x8bq7\x14*\xda\xe1\xe9XFI\
+h\xbai\xaf1}\xcb\x7f\xfd!n\x87\x98\xe8\xa6\xd8\
+\xd4\xc0\xf5\xa5y\x84Lf\xf9I\x0e\x02\x8b\xf2\x0d\x86\
+\x96[\x15\xd0%%\xe1\xb21q\xf7 8m\x11\xfa\
+\xcc\xe7\xd4l\xde%\x90\xb0\x01\xd94I\x11:x\x8b\
+\xa31\x86~0Um\xf4,1\x1e\xc3\x1c\x13\x91\x16\
+f\x9d\x1c\xcc\xc60\xa0\x9c\x1e\xfb\x9e\x11\x88\x0fK\xa4\
+9\x13.\x88%\x8e\xe9\x97\x1dw\x85\x1d\xc4\xbe\xdd\xb9\
+\x19\xf2nx\x19\x8f3{\x1e\xd0\xe5\x88\xfa-\xa4}\
+W\xc9\x0b\x89\xf8'\xa3\xbc:\xf4\x11c\x16\xdc\x0c\x1c\
+\xa7U\xcc\x81\x9b\x19D\x8f`T\xce\x800\x09~_\
+\xdb\x5c\x1e\x09\xad\xcc\xabW8>\xf9\x84%\xfc\x05\x0b\
+\x7f\x8d\xdb\xc8d\x84\xdf?w+HA\x83%\x10\x06\
+\xaf\x1e\xa6\xc4\xf2`\xc2\xbfR\x08!\xb8\xd9\x84\x81\xee\
+\xd12\x88\xcf\x95\xea\x043\x03\x0b\xb1DW\xfc\xaa~\
+\x04k\xc6\x15 \x028\xdfQ\x93\xd1\xb0W\xe3\xa7k\
+\x18\xac\xa9\x88\xd1\xbb\x88\xae\x1d\xed\xaf\x0cD\x01\xa1/\
+\x88\xfb\x08@\x06;\xeb>#\xb8\x91\xf4\x1c(\x9a\xc7\
+\xdc8l\x9a\xa9\x00E\x08\x0dB\xbe\xdc\xc9vY\xc1\
+\x09\x0e\xed\x08Wx\xcfr\x9b?\x00}\xc6B\xdb}\
+?h\xce\x09\xf7\xfe\x0b\x81y\x89\x0f\x84B1\x1cB\
+\xf8\xfb\xc8\xd2\xc9\xc4\xc0\xe3\xb5h\xed\xd5\xeb\xc2\x00%\
+N\x85?\xf6\x22a\xe106@1(-\xc05\x1c\
+\x03\xb4K9K\xe6@:\xb3^<d2\xf3\x18\x0e\
+\xb9\x8a\xffe\x95v\xeb'\x9a\xc8\x883\x8c\x82x\xb7\
+\xed\xac\xc3\xe7|\xabeU\x89\x9a/\xa0\x8d\xd7\x84\x9c\
+\xe5\xb2}\xdc\x8a\xd0\x9fC\xd9 ~z6\x10!q\
+\xd44\xa4\xc3\x01\x8f\x8f\xc6\x0e\x96\xbf\xe1\xd5Y \x8c\
+\xee\x9c(M\xd42d\x19\x04\xeb~\x89\x18M\xd6 \
+\x87\xb4f\xb1\xcb\xf8\xe6r\xb3\xe2\xf3\xa3\xa7B\xbd\xd8\
+\x80E\x83\xe6\x7f\xea\xa08`sS\xc8\x5c \x08\xed\
+\xfcqo\x11\x17\x0a\x07\xd0\xe1\x85&.8\xb9\x12\xb5\
+e\xdf\x9fm\x5c@}t}u\x90\x0dz=\x19\xb8\
+\xeb\xef\xf9\x1e\xd7\xd0f\xfc`\xa3o\xbc<\xd6\xb6\xfd\
+p\x9f \x9b\x83n\xfd\xee\x89`\x0c\xf8n\xd5\xe8C\
+}\xc78\xa7Yn\xa2\xd7\xea5\xb1\x05\xc8\xaf'\xa6\
+\xa9\xda_\xdb\x1bW\x10\x80\xdf\xfa\x0b\xf2n\x1b\x86\x99\
+\xf8J\x08P\xbd\xefP\xa3\x92\xc0\xc7t\xdc\x8a\xd6\x1f\
+M\x80vD\x03fr\xd3\xad\xeb?\x01Uy\x1c\x83\
+s\x02\x82;\xaa\xdfz\x09\x08\x7f>9\x8e\xc4\xea\x8c\
+j\x88\xe4\xe5\xd7Eg\xe5Z\xe1Tq\x8fa\xbf\xdc\
+\x83\xb0\xecrR\xd8@\xec\xbe{\xd7\xb7t\xfe\x8a\xf9\
+^Fp\x90\x87B\xf2\x03\x03\x92W(\xbb\x801\xa3\
+\xa7B\xbcP\xfd1\xb0c\x03RO\xc0\xac\xaa\x8b;\
+\xdeD\x10\x0b^\x853\xe5!\x09\xab\xe2#\xe2\x00h\
+\xa7\x00\xd9';Y\x1b\xf9_\xf5!\x82\xa8\xdb\xc9\xe0\
+g\x1a\xfd!T\xa6\xd2\xfe\xa4s\x0c\xa0I\xb3\x94\x9d\
+\x95\x08\xa2\x94\xe0\x9ct\xb3r[\x85A\xd7y\x9dt\
+\x1ce!\x8d\xf6!23\x80\x18\xab\xf9\x9a6W\xa9\
+\x02\x1f\xcfn\xb8u\xd2@]\xe9\xaf\xdd\x01a5\xe9\
+g\x99 \xbe\xe2\x94\x80\xccU\xe3\x8a\x94K\xcd\xdb\x1a\
+G\x19\xaf\x08<hb\x00go\xee\xe1\x1f#C?\
+\xabay\xc9\xb3d\x98\x89S\xd6\xbf\x96\xbd:N\xb3\
+\xa7\xc7\xe6|\x00C\xf5\xb2\x89PCg\xc4\xb4\x84\x0e\
+C\xc2\xe4\xf7!jj\xd3\xba\x89\x84\x5c\x9d\xa0l\xf1\
+h\xa4\xa9Q\xbc\x8dv\xbcD\xc5\x9f\xc5\x1d\xd1\x92F\
+`\xf4\xdf&\xa1H\xfe\x5c\x8a\xe0\x12\xa5\x86\x03\xac\xd8\
+\x8fndq\x8e\x0f0\xae\xf4L0\xbd\xb6\xffD\x92\
+\x0f\x80J\xdc\xe3\xc5\xf4\x85.\x9d<\xa0Eh\x1c\x13\
+\x03\xe9\xa6\x1dt\xac\xe0\x07\xbf\x10\xd2\x8b,z\xe3w\
+$\x9a\x99\xf1\x14\x09mg@\x96+\xd3!\xcaD\xec\
+\xb18\x849\x9bv{G+\xb3\x0b{]x\x80\xad\
+\x03\x9dGA\xcbV\x03\xa8l\x95\x9b\xf0\x07.7\x19\
+\x02\x10\xd0\x082\x09&Y\x86\x91\xc2\x06)f0\x7f\
+\x0a\xf8Ax\xdb\xa3\x82\x99S\x12b \xea\xc4H\xa4\
+\xe8v\xe7\x9f\x0b\x18w\xf0\x11'#\xcez\xf8\xf7\xa5\
+\xf9z\xa8\x89\xdf\xbc\xa2H\x09\x07@Lh\x1c\x951\
+\x05+\xa2\xa9V\x14GGZJ\x05\x819?DX\
+\xda0f\x16\xfb\xf66n!\x0f\x18-4\xbd\x1e\xd7\
+\xc5\x1c\xa7>\x8f\xf2B\xb5\xfd\x0a\x8a\xf4\x05\xa0\xc7\xf7\
+&\xa26\xa5\x16{\xa8\x01\x1e\xca\xa5\xb0\x06\xa58\xa4\
+\x16I\xd2\xc3\xff\x98ESf\x99\xd8\x87\xd4\xac\x16\xbd\
+MW\x021bD%\x8a%\xe6A\xe3\xf2-\x06\xf0\
+F\x01\xc4\xf6\x17U\xc4\x0d\xcc\xb2\xcal\x07(\xa7w\
+m\xd0Z\x8c]g\xb3\x85\xb9(47/p\x15\x8a\
+x\x15\xeb/\x94\xcb!\xcbn\xdai\xddJ\x9e9\xdc\
+\xd4\xbaKOc4N\x99\xdc\xb3\xf5\xfa\xa5]7\x92\
+\xa9Fh\xde\xe2\x8c\xec\x10LaM\x8dh\x0f\xffl\
+\xc9\x97\xed\xca\xf9\xd6\xba\x12\xa9\x06\x88\xf0y\xe8\xad\x9a\
+\xea\xe9\xf1\x11\xc4\x9c #\xe7T\xca\xdf:\x028\x0b\
+\x19\xaa\xf1\xa4W\x11\xb6o0\x8c\x8fZ^Z\xe9\x14\
+\xb4\x17\xe0w\x06,],\x1a\xae\x13\xdf\xdc\xd18\xfc\
+>t\x9f\x11\x91\xfe\xa3\x94\xda\xb8\x18\xf1\xcd\x89\x87\x16\
+\xd1<\x19\xa0\x10:\xcf\x81\xde\xc7\xb0\xdd\xe1O\xedE\
+l\x81\x08E\xe8\x129f\xec\x88\x8f#\xf8\xcc\x82\x90\
+\x81\xd3B\x92\xf4vA(\x9b\xc4\x96\xff0eV\xa1\
+\xec\x92\x1b\xd4r\x81\x18S\xdd\x8a\x97\x84\x22\xb7\xac\xa9\
+#\x96\xe0?9\x03\xd4\xbdq\xadJ\x15\xe2\xa9\x84\x99\
+=\xc0\x12\x99\xecn\xc2\x17\x8e\xa1\xf8\xee\xd8H\x142\
+\xa6\x12Y\xf5\x05\x22\xd3.\x90\x0a-\x16\xb1\xce\x9aO\
+\x8cj\x1d\x97\xaf\xc1\xc9\xf8\x0e*\xbe\x10\x08\xefJI\
+\x01\xe54\xe9\xc7\xae\xbf2\x7f\x7f\x87\x14\x07\xe4\xcca\
+R\xbd\x8aF\x0fo'O\x82^\x84\xf6\x90M\xcd2\
+\xaa\xc8\x8f\x1b\x86\x1b- U\xf0\xa3\x04j\xbc\xbc\xf9\
+DE\xb2\x03Nh\xe5\x85)a!\x09\xf04\x1df\
+\x16\xc3D\x02\x96a\xc2kE\x0c6X\xa6\xbf\x08y\
+\x1a\xe7\xdb\x93 ?9\xd4\xff\x95\x80\x81\xa8\xe6j\xca\
+\xf3\xfal\x83\xf7\xbc\xf9FFDH\xb2\xd7\xa7\xcc\xd3\
+?\xa67_19\x9a\x9a\xbbF\xe6\xc5\x00m\xf2\x5c\
+\xf1Q;\xefr4\xa1\xa1,c}\x8d`yw\xf9\
+-\xed\x94#\
+\x00\x00\x06\xc8\
+(\
+\xb5/\xfd`\xc4#\xf55\x00V\xfa\xa6&\xe0\xb4\xb6\
+\x01$\x0a\xb6\x9c\xa0%\xc5\xce\xb4\xe6\x92\xc9\xc1\xf9\x83\
+_\xaa\xbbZ\x22\xb7\x0cT\x1dc\x8fEf0\xc3\x1c\
+g\x18\x07\x99\x00\xa1\x00\x96\x00\xc9\x09U\xc4\x92\xd0-\
+\xefm\xa0\xeek\x97o\xec,\x1fy\xa2\xf5\xd5\x11m\
+\xe7@\xa5\xbdp\x7f\xdf\xba\xcbVJ1\xb9\xa4\x9a\xe1\
+GK6t^>m\x8a\xe3\xa5\xb2Q'}\xed\xa4\
+S\x9fH\x82\x8c\x5c\xed\xc3M\xc5\x02?1$\xa5}\
+\xcfO\xf9S\xeeDJ\x1f\xc8\xd3\xce\xaf\x8d\x9fem\
+\x984z~\xea\xbc:H\xe9C\x14o(\x93\xd1\xa4\
+\x14zG\x81Kik\xd5\xd0\x11\xa5\xe483\x93R\
+\x92\x14\x0a%\xfe\xe5#\x9dx\xcap_=,>\x87\
+\xdf\xce\x11\xb9k\xde`\x14\x90\xc6\xd7\xc5_\xe4C\xb7\
+*\x0e\xfb\xa6on_\x88\xe2\x10\xcb\x85\x8cWs\xd0\
+\xe8u\x85\xd3\x85\xac\xa13}@v\x1f\x93\xa5\xfd\xff\
+j\xa0\x04l0\x14\x01{\xc1\xdf\xf86O\xd4\xd9]\
+\x1b^J+\x89\x8c\xfe\x88\xdf[]\xcdc\xf3\xce\xfb\
+\xab\x13\xc8\x80\xa4\xa8\x90\xc8\xc0p\xd0\x08h\xe7\x08W\
+\x84\xfd\xc8>{;\xe9\xc4\xc6\xa7 \xcb\xd5\xeb\x01i\
+\xfe\xdc6\x83\xae\x5cX\x00\xb0$\xe82\xb2\xae%\xbe\
+\x17\xc2\xab1\xd1\xb2\xc6G~\x96_j!'\xf7\xe1\
+\xf6\xdb\xbe\x8d'n\xa9\xd6\x10\xa7\xda\xe7\x13\x0f\xeep\
+\xbd\x96\xa5\xcc=#\x01\x81\xd0S\xbd\x8f\xa5Br&\
+dr!\xea\xa9\xfc\xdf'v\xa9H\xa2m\xb8\xdf\x0e\
+)\xbd\xc7 \x16\xa1\x87\xba\xba\x9esL\x12\xa4\x82\xe3\
+\x7fm\x9c\x82Y\x97\xe5\x16\x8d\x9f[l\xf4\xd7F\x06\
+\x89\xc9K\x12$S\xcb\x92\xd2\x88\xe4\xf6\xadmm\xd3\
+\x1e\x97#M\xf2mk\xe50)Bu\xad\x1f)\x95\
+\x86*\xb2F\x1f\xb6\xed\xae\xaf\xdc)\xdf\xbb5ns\
+h}\x92\x8d\xde\xf7\xb6Vp\xad\x8c\xdf\xfb\xed-\xe3\
+s\xbe\xa7\xe9Z\xd3\xe5\x86>\xfd\xf3/\x9fT9*\
+\x0c\x0b\xaf\x98\x97\x8fr\xa5\xd7\x0a2\xa8\x9d\xd3q\x94\
+\xc6\xb8\x9e}\x14\xe5\x97\x01\x17\x94\x93\x09\x8c\x8b\xa5\xd7\
+r\x86!5\x89u\x1c\xb7\xe1\x9b\xc2\x8f\xd3&\xa5\x91\
+>+\xb2\xabP\x22\x91a\x22\x06\xa3\xaf\x0e#5\x18\
+\xd2\xe0\xe5\x91\xb57\xa68\x8e\xa6\x93\xc9\xa7\xef\x9f\xa8\
+1hje4\xc7\x10\x02\xe1d\xd2h\x98,'\xe2\
+{\xab\xd6\x89jvN-\xa0\xbfn\xc6s\xaf\x18\xa4\
+\xf1\xd3\x85\x9b\x8d\x97{\x0cDXG\xe2\x95\xe2hR\
+\x8a\x17;\x85\x99\xf0\xbd\xad)K\x09\xfa\xf3\x96\x8fj\
+\xfd\xb6\x18\x11\x19\xcb\x1f\xb4/\x03E\x8eaA\xf1\x81\
+\xeb\x9e\x87\xb6\xe9\xb36\xdc[~\xf8,\x09g|\xb3\
+[\x9a\x82\x94\x9a)\x18\x81\xc6\xa8Q\x22\x19\x99\x11\x91\
+$I\xb2\x8c\x01!\x08\x82P4\x08\xad\xb4\x1e\xb2P\
+<\x88\x22 \xc4`\x0c\x84\x80\x84\x10B\x08A\x84\x18\
+\x92D\xa2\x11I\xaa \xc9\x01\xe0U\x8f\x13M\x17\xf9\
+\xe1\xfan\x81\xce$mW\xa1Nh\xcb\xad\x87\xf2\x9c\
+\x17\x85B\xa5\x98\xb6_\xd5\x9b\x8e\xd2\x11d\xb1QL\
+$\xf8!\xc9/\xc6\x86\xd4\xab)\x95\xa8\x1d\xed\xeey\
+\xd9T\xdfT\xb5+KB\x00\xd1.\xc9V\x01m\x93\
+\xfb\xc9\xaap7\xbd*\xe0\x92\xdd\x82\xf2\xb6-\xd5C\
+\x99\x1a\xa4\x9b)\xe21\xf8Y\x22%\xcdol;\x1d\
+\xd8$\xcf\xbcHm\x90\x01\xbc\xa2\xfa\x1a\xd2\xdb#\x84\
+'\x0f\x11\xc1\xe2\xa9\x92\x91t\xfd\xca\x0c\x82a\xab\xf0\
+\x9b7p8\x15d\x0fq~qS\xf3]\xa6\xed\x9b\
+[9/$\xff@b\xd8\xb2n!XmX\xdf\xa8\
+\xbc\xcb\x8d\x82\x9b\xef\xcd\x86gt,\x1bO|\xc6\x95\
+L\xeb\xeb\x08\x1a{Kj\x84\x01r\xa0\xd1\x1c\xeb\xed\
+\xa9\x87\xc9\xe6\x98\xee\xb4\xa8\x97IB+\xc1\xd7>V\
+\x10\x81\x02]n\xda5\x06\xf7\x1e\xe4\x96\x0e\xfe\x10b\
+\xf2\xd4\xe6E\x0bc\xacIx\x1e\x8b\xa0\x5c\xca2!\
+\xe4\xf0\x5c\xb1\x99\xe4\x11\xa2\xf1\x1an~@S\xbf}\
+3\x8e_\x99\x07\x95\x9cgV-#[\xfer\x94\x80\
+\xb0Dw0\xf3h6\xf2\xa6\x0f\xec!5\xd1\x04\xf0\
+j\x87mMe\xcd\x87c\xf5\xea\xd3)\xeb%\xe2F\
+\xccp\x89\xed&K\xb0\xf4\x956(\x04X\xd7!\x05\
+Ej\x11\x0d\xd8L\x04\xe0a\x83\x03\xf0F\xe6J}\
+P\xd6=\xaf\xc9E=\x86-2?\xd7{w\x0a\xe6\
+\x0fp\x16'\x04n]\xa2J\xf9\xd1\x0b~\xa0\x162\
+8%\xc4\xb5\xd0\xda!\xe6\xae\xa0DIAam4\
+\xa7\x9c\xa4\xd0\xa3#\x10\xc4P\x14!(\xcd\xc6|\x1e\
+ejp{\xdc<\x0d\x12\xffe\xba\x01\x10\xdaFD\
+\xa0-\xcc\xbf\x09|\xf8\xc1\x95\xb14\x9e|2\xa6\x12\
+?\x8acL\x5c\xda\x8c_\x01k\xc1>~A\x1a4\
+\xd5\xb0\x16\xbe|\x11\xd0\x04m\xd2\x0c\xe5\x01\xf5.\x87\
+\x1f7\xf1\x0c\xd3p\x09#\x7fS$\x82\x81g3\xf5\
+\xe1\xa5z9\x15\x09\xce<\xe7\xd2\x1cs\x0fv\x0c\xd5\
+$\x00\xff\x9c\x11\x88\xa8\xddg\x98\xed\x18\x84]\x09M\
+_\xb4n/\x96\x8c\x0eK.!|v\xc5\x89l\xf3\
+CY~&rEx\xc0`\x02\xe15j#p\xee\
+\xfb\xb2\x22D\xf4q\x0dDL\xed\x97O\xe2\x0c\x82\xca\
+&S\xa9F\xfe\xc7\x7f\xd7!\xf3\xcaG\xca\x8de\xd9\
+\xa4`\xbc\xa1\xcb\x18L(4\xacc>\xbd\xbb]\x05\
+\x17{\xe5\xa6\xaek$\x01\x0f\xd5+\x9e\x16JS^\
+'T:\xebP\x1dO\x90\xe3I\x19\x86|G\x10\xc1\
+\xd0\xfcP\x90v@K\xd6\xa4\xac\xaa\xe3Y\x9b\x0d\x98\
+\xd1I\x00F\x8a\x96G\xb6\x1ajC@7\xcc\x84m\
+\xbcC=@,;\xe9{\x7fB><\xe1yT\x17\
+\xce*\x11,\xfeR\xee\xabo\xec\x82i*\xbb\x96?\
+\xb6\x1a\x83\x96\x05\xa2\x0fRYa\x9e\x12\xa0Q}\xda\
+d\xa0Sm\x09:\xbb\x06@o\x0a\xddA\x86\xcbe\
+ <:\xf1\xbf\x8ds\x88z\xa2f`\xa7I\x9dK\
+\x97G\x1e\x9a\xa27b\x887|\x8d\xe4\xef\xeb\xc9\xb4\
+r\x7f\xe7-\x16\xe5\x02\x18?\xb5R\x88\xa3\x5c\xe0\xf3\
+\x99}\xfb\x82\xc4I\x95\xae\xedc\x0d\xea\x8d\xddZ\x09\
+\xff\xec\x1d\xc4T8\xa7\xca\xcc\x1e:b\xf2t\x10\x11\
+\xfc\xfa\x0cj\xaa\x8e\xe7\xcb\x80\xf4\x8coitO\x22\
+U?}\xcf\x04\x9f\x98,&W\xe4`&\xa5\x1c\xd3\
+\xfb\xaa7bo\xcd\xa4\xe0GG\x5c\x88\x83\xb0\x1b1\
+\xe4\xe0C\xe9\xe8\x13\x5c>LV\x1d\x84\x11\x8d$W\
+\xba\x1ce\xb6\xaf:\x12\x04\xe1&y\xdc#\xc7\x90\xa0\
+\x0b\xf3\x89\xc9\xdc\x92\x1b\x89\xd9?\xa2\x02\xf9\xfa\xa8/\
+F\xab\x00\x06Hu\x87\x9a\xfb[\xa0\xabL\xa5\x19/\
+\xfd}s\xd4M\xc5.\xe4I\x19\x91\x88o\xb2\x1e\x0c\
+^NKT\xdf1\xab\xbb\x22\x167\xdba\x08v\x85\
+:/\x5c\x86\xac\xa4\xcb\xd5\xcbl\xcb\xa1\xef\x0a\xc0\xff\
+}\xde\x0f\xae\xbb\x19\x81/\xe5\xd8\xca\xa7\x12\x91D\xb3\
+\x11\x9c\x22\x0a\x05[\x96I\xa4E9(\x11\xe5\xe7\xde\
+\xf0y/\x12\xd9\x95\x06\
+\x00\x00\x04\xf9\
+i\
+mport QtQuick\x0aim\
+port QtQuick.Win\
+dow\x0aimport QtQui\
+ck.Controls\x0aimpo\
+rt QtQuick.Contr\
+ols.Material\x0aimp\
+ort QtQuick.Layo\
+uts\x0a\x0a\x0aPage {\x0a   \
+ id: spaceWeathe\
+rAurora\x0a    anch\
+ors.fill: parent\
+\x0a\x0a    objectName\
+: \x22spaceWeatherA\
+uroraObj\x22\x0a\x0a    f\
+unction loadAuro\
+raReport() {\x0a   \
+     checkUrlExi\
+sts(\x22https://www\
+.aresvalley.com/\
+poseidon_engine/\
+aurora.png\x22, fun\
+ction(exists) {\x0a\
+            if (\
+exists) {\x0a      \
           imageB\
 ox.source = \x22htt\
 ps://www.aresval\
 ley.com/poseidon\
 _engine/aurora.p\
-ng\x22\x0d\x0a           \
- } else {\x0d\x0a     \
-           image\
-Box.source = \x22qr\
-c:///data/images\
-/artemis_not_ava\
-ilable.svg\x22\x0d\x0a   \
-         }\x0d\x0a    \
-    })\x0d\x0a    }\x0d\x0a\x0d\
-\x0a    function ch\
-eckUrlExists(url\
-, callback) {\x0d\x0a \
-       var xhr =\
- new XMLHttpRequ\
-est()\x0d\x0a        x\
-hr.onreadystatec\
-hange = function\
-() {\x0d\x0a          \
-  if (xhr.readyS\
-tate === XMLHttp\
-Request.DONE) {\x0d\
-\x0a               \
- callback(xhr.st\
-atus === 200)\x0d\x0a \
-           }\x0d\x0a  \
-      }\x0d\x0a       \
- xhr.open(\x22HEAD\x22\
-, url, true)\x0d\x0a  \
-      xhr.send()\
-\x0d\x0a    }\x0d\x0a\x0d\x0a    C\
-olumnLayout {\x0d\x0a \
-       anchors.f\
-ill: parent\x0d\x0a   \
-     anchors.rig\
-htMargin: 10\x0d\x0a  \
-      anchors.le\
-ftMargin: 10\x0d\x0a  \
-      anchors.bo\
-ttomMargin: 10\x0d\x0a\
-        anchors.\
-topMargin: 10\x0d\x0a\x0d\
-\x0a        Image {\
-\x0d\x0a            id\
-: imageBox\x0d\x0a    \
-        Layout.f\
-illHeight: true\x0d\
+ng\x22\x0a            \
+} else {\x0a       \
+         imageBo\
+x.source = \x22qrc:\
+///data/images/a\
+rtemis_not_avail\
+able.svg\x22\x0a      \
+      }\x0a        \
+})\x0a    }\x0a\x0a    fu\
+nction checkUrlE\
+xists(url, callb\
+ack) {\x0a        v\
+ar xhr = new XML\
+HttpRequest()\x0a  \
+      xhr.onread\
+ystatechange = f\
+unction() {\x0a    \
+        if (xhr.\
+readyState === X\
+MLHttpRequest.DO\
+NE) {\x0a          \
+      callback(x\
+hr.status === 20\
+0)\x0a            }\
+\x0a        }\x0a     \
+   xhr.open(\x22HEA\
+D\x22, url, true)\x0a \
+       xhr.send(\
+)\x0a    }\x0a\x0a    Col\
+umnLayout {\x0a    \
+    anchors.fill\
+: parent\x0a       \
+ anchors.rightMa\
+rgin: 10\x0a       \
+ anchors.leftMar\
+gin: 10\x0a        \
+anchors.bottomMa\
+rgin: 10\x0a       \
+ anchors.topMarg\
+in: 10\x0a\x0a        \
+Image {\x0a        \
+    id: imageBox\
 \x0a            Lay\
-out.fillWidth: t\
-rue\x0d\x0a           \
- fillMode: Image\
-.PreserveAspectF\
-it\x0d\x0a        }\x0d\x0a \
-   }\x0d\x0a}\x0d\x0a\
-\x00\x00\x03s\
-\x00\
-\x00\x0cSx\xda\xadVmo\xda0\x10\xfe>i\xff\
-\xc1\xe2K\xa9\xb4\x05\xdal\xab\xca\xd4\x0f\x19\xb0\x81\x04\
--+\xed:i\x9a\x90I\xae\xc4\xab\xe3\xcbl\x87\x15\
-M\xfd\xb8_\xb6?6\xdb\x8c\x97@\xa8H7@(\
-\xce=w\xcf\xf99\xdbg\x96\xa4(5\xf9\xa8?f\
-,\xbc{\xfe\x8c\xe5\xc6\xde\x0d\x13\x11\xfe\xd8z\xddD\
-\xa1%r\xb5\xd3\xe0\xf5\xa9\x06\xc9(\xdfB\xf4\xe8\x0c\
-3m<\xedw@'@~>\x7fF\xcc\x87E\x0d\
-\xa2R\x1a\xc2\x0dP\x1d\x83\x1cf\xa2\x9b\x18\xbbTs\
-;\x15a\x8cRy\xb7\x8c\xf3\x06I\xa9\x04\xa1m\x0c\
-k\xc3\xf17\x08\xf59M\xa0A*\xc5A*\x0bl\
-*1\x05\xa9gdJ%IQ\x01\x8bP\x8c\xbe)\
-\x14\x0b\xc4m&B\xcdP\x10\x8e4jI\x9a^\x82\
-\x9dBu\x09\x8e\xa8\xa6\x87\x8b\xbc]\xcc\xf50\xe4\x8c\
-\xe4\x90+\x98\x8d\xe7\xd2\xa9\xe6\x1c\xbe\x1c\x5c_\xf6\x0e\
-\xbe~\x091\x19\xe3;\xbcw\x90\x81\xc4(\x0b\xb5\x17\
-f\xd2\xce\xf4\x13\xe5\x19xS\xfb\xff\xf5p\x1e\xf1\xa1\
-0\xdfy\xfcL\xf2\x5c\x82a\x0c\xe1\xdd\xb5\xe4\xed{\
-\xa6\xb4\xb2\xe6\x17K\xb7*\xb8\x979\xbc+\xc8-\xd9\
-erfKd\xb2\xf5\x14f2\x043k\x135\x0f\
-{ \xc0\x15\xec\xe7\x5c\xf9.\xc3F\xadV\xb3\x8a\xd5\
-\x9cY\xd5\xa8\xd4\x9005\x12\xa8GtJ\x19\xa7c\
-\x0e\x9e\x9aN*\x1b<\xab\xe1\xc3Nq\x8a$\x08)\
-\xe7c\x1a\xde\xe5&h\xd7\xc5},MN\x02~\x90\
-\xcf\xfd^Gk\xb3\x04\xbeg\xa0t\xf5p\x853\x18\
-\x0f\x85\x04\x1a\xcd\x946\xcb=\x8c\xa9\x98\xd8\xa9,\x85\
--\x94\xd4\xba9\xa7\xa1u\x22ggg\x1b\x1c^\xeb\
-\xe2\xbc](\xf9\x22]\x17\xc3rf\xca\xf9\x1f\xd7\xeb\
-\x87\xbb\x15\xd9\xc88\x05Q\xadt\xdaA\xab\xf2\x828\
-\x11\xb4\xcc`cZ\x0aDT\xddT\xb2\x89<K\xc4\
-|\xff\xaegW\xbc17\xad\x92Mb\xdd\xa7r\xc2\
-D\x83\x1c\xd5\xb7\x01\x1cn\x1f\xb5\x8fQkL\x1eC\
-hL\xd7\xcd+@\xf3\xef\xc6\xda*\x879r\x8a6\
-]\x1e\xa5\xe1^_\x227G\xcb\x81}<\xc8[\xe7\
-z\xb8\xc9\xdf\xb0H\xc7\x0d\xa7g\x1e\x93`\x04F\x1a\
-\xd23+\xafo\x9f\x8b\x8ak\x8dm\x0e\x89Q\x8f\xfc\
-t\xa4\xe6,;}E~\xff\x22/I\xa0\x13T\xa9\
-9\xd0XH\xe6\x07\xda\x8c\x04JA2\xe6\xb3\xca[\
-\xe2\xce\x05\x03\x0f\xba\xc1\xa8~\xfa\xaa\xb2^\xf4G\xe3\
-\x1f\xf9G\xa5\x09\x8cO\x09\x82\x93'\x10\x9c\x94!8\
-\xf5\xcb\x13\x9c\xfa\xfb\x13\xf8\xf5\xf2\x04~\xbdD\x0d|\
-\xffuy\x02\xffu\x09\x89\xde\xd4\xeb\xe552Ne\
-\xca\xfc\x14\x8a\x932\x14}:\x11\xa0q\x22ibh\
-:\xc0\x99\xed\xa1*1<TDdn^\x92nP\
-\xf5\x83\x0f\xe7\xfbSu\x85\x06\xa1\x98\x9e=\x8d\xac{\
-~\xd5\xde\x9f\xac\x85i\xcaA>\x8d\xaau1\x18\xec\
-O\xd5\x0b\x86\xcd\x0b\xd2<6<=sP\x02\x09\xc4\
-\x84\x83\xa3\x19\xa6\xe6\x02%1\x01m\x0b\xd7D\x89\x82\
-\x9a\x94\xd2x\x8d\xd0\xb9\x8f\x9a\xc7\xa5\x09\xfd\x7f#,\
-\xb1Y\xafbH\xa8U\xabO\xd3\xb5@\xc3\xebO\xdd\
-\xd1U\xa7\xdd\x0f\xae\xba\xcd\xadh\x1bC\x14\x81i\xdf\
-S\xd3\x9cM{(8\xa8\xff\xef-\xae\xb8c\xaf\x06\
-.LQ\xe3Z\x5c\xa1v\xb6\xa3\x0e\xd8\x96[\xd4\x8f\
-\xf6\xe9Y\xd6h{Uc\x9e\x817\x90\xa0@N!\
-P\xb6p\xef\x99^O\xf2ayU0\xbf?s\xdd\
-\x8eE\
-\x00\x00\x04^\
-\x00\
-\x00\x12\x8ax\xda\xddX_o\xdb6\x10\x7f/\xd0\xef\
-\xc0\xfa\xc9FW\xd9\xe96l\xf0\x96\x07\xdb\x01\xb6\x00\
-\x0d\x9a&\x19\x8aa\xd8\x03-\x9dd\xc2\x14\xa9\x90\x94\
-\x1do\xcbw\xdf\x91\x94mI\xa6e\xe7a\xe86\xd9\
-HD\xde\xef\x8e\xf7\x8f\xc7\xa3Y^He\xc8'\xf3\
-\xa9d\xf1\xf2\xf5+\xd6\x18G\x9f\x99H\xe4\xfa`z\
-&\x85Q\x92\xeb\xa3\x84\xe8\x86\x1aP\x8c\xf2\x03\xc4\x07\
-\xba\x91\xa5AN\xfb\xf1\xe2\xc9\x9f\xaf_\x11|X2\
-&k7s\xab \x05\x05\x22\x06\x07\xb4\xc45K\xcc\
-bL\xbe\xf9v\xe4\xc7\x0b`\xd9\xc2\xe0\xc4h\xb4\x85\
-\xcc$.%@\x98H\x0a\xfb\xce\xc1\x00\x8a\xac\xa4\xdb\
-\xe7\x89\x5c\x92\xfbX\x01\x88\xc8\xc9#C\xf2\x9e\xbc#\
-\xbb\xf7=r\xb3G\xfa\x95*\xe8~\xe0\xb1\xcf\xdb\xc5\
-s\x99P\xce\xccf\x8c\x96F\x93\xa2\xe0,\xa6\x86I\
-qc\xe7=$\xe54\xd3\x8e\xbeu\xab\x9f7\xccp\
-\x18\x93G\xfd\xa0\xfa\xbd\x892\x903\x8dK\xd5\x9c\xd0\
-\x1bl\xb1\x9ae\x82r\xa2\xe9\x0a\xb6.\x9e\xc41\xda\
-\xdc\xd7F1\x91\x11\xaa\xb2\xc1Q\xe8\xc3\x02r\xe8D\
-NJ#\xb9\xa4I\x9f\x09S!*\xe5K\x11[{\
-<\x8a\xf3\xfe\xa0\xee\xd8\x80>\xb1\xcc\xe7r*\x9f\xfc\
-0\x8aK\x85\xb6\x98\x07x2\x830\x9fWn\xcb\xe6\
-F\x1d\x5c;E\xe3\x05\xc4K\xbbN5\x11\xb9\x09H\
-\x06\xad\x00\xed\x0c\xb0\xa0\x96\xae\xd4\xfdkX\x94JE\
-\xfa+\xaa0+m\xd6\x8c~p/?\x92\xb6Y\xb2\
-\x14\xc6\xd3\xde\xbem\x08p\x19\x9d\x92J6\xb9\xbc\xbc\
-l\xf3\xae(/ab\xfa\xc8<8`\xb5O\xd8\x85\
-\xd7\x22\x01\xab\x12\xb2\x1d\xb2\xcc\x15\xd0es\xfay?\
-|>\xc7'>\x0e\xc6\xfe}\x91G\xaa\x88\x9dt\x88\
-\x93\xdc\xf0\x87\xe7<\xdb\x1d\x8d\xd4\xf8\xa7\xbc\xb1\xcb/\
-#\xb3\x8c7=\xe1\xac8\x9cv:\x1e\xc9F\xd4\xd0\
-\xa8\x12j\x8b\x13\xe0\x1a^\xc0\x9eR\xc4\x1fW\xfe\x0a\
-#'\xb3\x1b\xd0\x9af\x0d\xb1\xb6\xaa&\x8eX+(\
-\xf7\xb8\x83\x92=\xc6\x15\xafq\xa5\xe1~\xba*L\xbd\
-\x1a\xa3\xdb{\xc9\x9b^\x8d\xd7/\x89\xb0_4(R\
-\xd4\xb0\x0b\xaa\xc9\x1cK\xa8g\x22\xba\xc4<\xd6i\xc9\
-\xf9\xe6\x0d\xd9\xd69\x05\xdaP<\x1f\xdc\xebc\xc9\x14\
-\xb8D\x8b\x17Td(\xc2Hb\xe8\x12\x08\xa4)\xc4\
-&\xea\xd5\xd5CF\x91P\x95LKc\xa4\xc0\xca\xea\
-}\x10}\x5c\xd6QR\xd8\xedS\xb4\x8f\x02\x7f\xa6\xb4\
-\x0e\x9b(\xe6RC\x7f\x10v\xb3\x7f\xbd\xa5\xa2\xe1_\
-*\xe2\x85T:J\x19G\x17\x16\xd4&e}\xfd\x99\
-\xe4e.\xfc\xb1\xd7V \xcc\x1bB({\xec\xdc`\
-AfbL.Fa\x10\x87\xf4$f.\xd1Y\xf9\
-)\x94\x91E\x1d\xd2\x04\xdd\xc9u\xd8\x1c\xfbx\x8a\xb3\
-\xe8\xb3?\xb2\xdbY\xb5G\xce\x81\x87D\xb8\xd4\xc3\x8a\
-\x8f)\xb5\xadI\xc4\xed\xf9^\x18\x9bb\xd3\x11\x15\xec\
-\x09\xf8=\xfb\x03\x13\xf1\xe2}\x18\x17sV\x8c[\xdb\
-\xf0\x1c\xd5\xdb\xb8\xe7\x905\xb3\xaa8\x1d3\xc8n\xc3\
-F\x01\x0b\xc3\xaa6\xe7\xe2\xeb\xef\xc2\xf4]\xdb\xf3}\
-\x98\x8e;\x190\x95~\x0bS\xed\xd3\xbb\xdfh\xdcz\
-\xbd\xaf: \x1f\xec\x22\x9d\x88+\xaa\x96G\xc2\xf1{\
-\xd0c\x9d\x0e\xfc\x12\x19\xe5\x0f\xd5\xffKJyk\xbe\
-XN\xddA\xd2\x99.\xb7L,\xbb\x01\xa5\xc2~\xbd\
-;\xe5\x00\x8a3`\xd8\x10\xb0LvB\xa6\xd8h\x9c\
-\xce\xff\x93\xa8\xd9\x86\x8aN\xc0\x03P\xde\x09\xf8\xc9^\
-0Nkr\x0e,\xef\xd6\xf5W\xe0\x5c\xae;!\x93\
-|\x0e\xaa\x13\xf1Q\xd9C\xf9d\x90\xce\x80M\x95\x5c\
-\x8bS\xae\xd9\x9c\x0c\xa2\x03\xfd\x17\xab\x90\xed\xef\xde\xd9\
-\x06\x8f\xdc\xb3\xec\xfa\x8a$\xd4\xd09\xc5~\xd0^\xb0\
-l?T\x16\xa4\xcf\xb1TiCV\xa04v\xa5\x83\
-\x7fu\xa9\xaa\xfa\xd6\xceR\xd5\xeam_\x1e\xa0k<\
-\xb7N\xc4\xe6\xe7\xaa\x96\x1d\xea~ \xcd\xb7\x8d!y\
->H\xfe>n;\xe5\xde\xe0\x10\xc3b)\x22-K\
-\x15\xdb\xd6\xf7Q\xc5\xe3\xa1\x0d\xe2\x90\xe5\xd8\x0c\xeb\xa1\
-%\xeb\xa1\xed{#\xbd\xca\x02\xa1K\x98.8\xdd\x8c\
-\xc9d\x8e\xf7q\x1a\x1b\xafNd\xaf\xbaS\xd0,\x81\
-k\x14q\xd4V\xca\xf1\xce\x9ec\xc9\xf7\xbf7\xd8\xd1\
-\x9d\xfbe\xe2\xaf\xddx\xea:\xbdC\x09R\xcc8\xb3\
-\x97\x8a\xf1\xb1h\xed\xae\xf8ar\xf86\x11\xc9\x02D\
-\x88\xe5\xf9\x8c\x0b\x18~\xff\x06HZs\x03\
-\x00\x00\x05\x06\
+out.fillHeight: \
+true\x0a           \
+ Layout.fillWidt\
+h: true\x0a        \
+    fillMode: Im\
+age.PreserveAspe\
+ctFit\x0a        }\x0a\
+    }\x0a}\x0a\
+\x00\x00\x03w\
+(\
+\xb5/\xfd`\x01\x0bm\x1b\x00\xa6i\x81/P\x8ds\
+03333E\x85=\xb8\x91$A;%\xd2(\
+\xdc\x96V\xces\x08\xb1w\xf1\xd39\xedf^\xef\xca\
+\x13\xe2\x07\xf7C2Gr\xccD%\xc0m\x00v\x00\
+w\x00\xcf\x1a\xa49\x1e\xd3\x8a\xc6.wz|8\xbf\
+\xd0\xf4Z\xf1\x99\xae\xc5\xae\xee-e\xd1\x8e\x9e\xb6\xe7\
+\xd4\x9b\xa6\xb5\xbac\xcd\xc3\xae\x00\xb9\xf4\xb3){k\
+I\x19CT\xa5\xce\xc1\xc9\x95v\x98\xf9uhs\xcf\
+\x1d\xd1\x90\xbd\xba\x96\x16ww%\x8d\xed\x8d7\x92$\
+\xd5\xff|\xc4\x19\xc9\x91\xf6sFU\xe9\xf4\xa7c\x18\
+\xae\xcd\x18AI\x160~\x0e\xef\xb0O\xdd\xebb\xfc\
+u\xa4q\xd3\xe9T\x04\xf2\xb5\xbf\x8b\xe6x\xff\x97L\
+&\xb1\x18=\x97\xb2\x94\xcb\xb0\x80\x0c\x92\x92\xa14m\
+\xa2J\xb5\x04\xb1\x8c,\xe2\xcf\xfb\xfc\xd4\xd8\xf5S\x96\
+T\x89D\x22\xb1 \xbd\x98\xba\xca\xde\x0dI\xbf\xa5l\
+C\xfay\xa56\xd4\x10\x80\xfa5fX$}\xb0\x80\
+\xcdAI\xbf\x8d\x08\x85\x88\xeaO2\x04\xfd \xf5\xf0\
+\xd3\x9cn2\x5c\xc1A\x9d\xc3\x09\x8aG\x86\xf3\xf0\x98\
+\x80,e#\x1c\x08\x07\x02\x13\x81\x8d\x9d\x08\x10\xaa\xcf\
+\x85\xb96a\x1aIP\xd7\xb5^;\xa2\x0b#m\xce\
+\xab\xde\xfd\xb5\x01\xcb\xd1\xb1\x04\x08\xd3Z\xb3\xbb\x96\x96\
+\xeck\xb4dk\xdeY\xdck1\xe2\xf1X\xab\xa5s\
+>\xa3\x7f-\x0d\xf3\xfc;\xffwP\xa8e%\xb0\xd6\
+\x8c\x1b\xe5\xec\xb9-\xd2\xd9}\xd21\x886\xbb\xf6G\
+\x7f\x01\xa6\xcae\xb9L\x90\xd9^\xa4\xaa\x06\xeag\xd1\
+4T(\x0a\x85\xb2\x9dm2\x07\xfb\x03\xd2\x86\xf4q\
+\xa1^-\xa2]\x9bn(\xab/\x96\xd6\xcf\xa2\xf8\xf0\
+\x9a\x8ea<Wf\xb9x>\x18\x88\x87\x8e\xc7\x19w\
+\xcdy&\x93\x01\xec\xc3yL7\x9eN\x1d\xfb\xee\x9c\
+>l\xaf\xd3r\x9b\xd7\xf6F93\x80m\x03\xd6\xb9\
+2\x9bMC\x85\xb6\xf4<\xafX<\x1a\xcc\xe8c\x9d\
+\xfd\x13\xa3a\xb8\xb2\xd5&/\x8c]\x8d]=\xca\xbe\
+tL7\xff\x9e\x1bgUeP0!\xa8&\xd5d\
+\x12\x80\x98\xa0\x81\x9dR\xc8\x90\x8c\x08I\x92$i\x0c\
+P\x84\xc8\xd8U\xb5\x01\xd1\x80\x16M\xc06$\xc0\xb3\
+\xa5\x12\x1f\x83<]\xa8=\xf7\xca\xea\x0d\xe8\xb9\x01\x15\
+I\xcd\xa8\xf2\x86hX\xb5\x92K:T&\xa7\x983\
+9\x0e\xc8\x024\x92\xa5\xc6\x5c\x1c\x0cCX\x91<\x0c\
+\xc2m\xcd\x8d\x08\xd7l\xa7\x0aQ\x05P8\xa8\x19\x9e\
+\xef\x90\xb8W'\x00\xbaEw[\xb4\x82\xc3\xa4\x02\x00\
+\x00Z\xa0\xfc\x99rX\xec\x1a\x92\x8d<b\x88\x01\xb5\
+\xd1\x07\xc4#\x02\x10\x00@D\x02\x02\x00FT \x97\
+\xc09\x1a1E<\xcb\x05\xc7}^?uSCx\
+U\x06\x1e\x17\xcd\xdf\xe9\xb2\x84\x13`z\xac\xe8\xe7\xae\
+F\xc21\x82wm\x05 s\x18V\xd2\x04\x11\xda\x9e\
+$\xc3\xb2\xe1\x06\x13C\x12e\xc2\xf1\x19`\x90{Y\
+e\x86\x8e\x9e98!\x1c\x83J\xd9\x04T\x18FY\
+\x18\x02\x22X\xa8\x8fFoW\x0a\xb8\xe6\x04\x97\xeab\
+^\xb6\xbc\xf5R)Q\xd5\xc2\x91\x96F`\xa9z\x9d\
+\x80\xd7rg\xd4\x1f\xcd\x02)\xd4\x82&\x8dTqA\
+,\x0d\x0a\xef\xe3\xa4\x1eV\x02\xd3C\xe8+\x1bu\xc3\
+\x0b\xe4\xf3a\xed\x99J\x87Y\xfd\x81\x0b\xba\xb0K\xd8\
+\xd4\xb9/\xb2/\xd3L\xc6v\xb37C7\xdaN-\
+\x82}xx\x89\x89\x9e\xe5\x8e[!w\x0c\xbe\xc3\xf1\
+\xadCR\x9cJ;\x97\xb4\xa0\x04\x81\x8a,\x027\xc0\
+2\x03yD\x0eh\
+\x00\x00\x04R\
+(\
+\xb5/\xfd`\xda\x10E\x22\x00Fo\x87$\x00\xb3\xe6\
+o@D\x93E[\xb2\xa36\xba\x13\x17\xac\xedb\xec\
+\x86\x8d\x06}\x1c\xaa{\xe3\xd8\x1e7\x1aUUSD\
+\xf0}\x00|\x00}\x00\xc9\x96{\x93\x08\x07\xf0\xb9K\
+\xdf-\x91\xc41\x9e\x07N\xba\xef\xfeY\xb9\xd5\x04\xb7\
+\xfbln1\xcc\x22\xbd\x05N\xa0w\x9bT_!\x10\
+\x0e`\x01RPbUo\x19l\xc0\xcfD\xe9\xebr\
+K\xcf\xca\x8d]\x8d\xa9T~c9\xddT\x10\x0ep\
+\xda<\xe5<\x91\xa7\x8d\xd5\xb5R\xaf\xf0\xe0D9D\
+\xc4\x08\x08F\x22\x91\xf7Y\x83Rb\xd3\xb9~NH\
+o\xdb\x9f\x1b\xe3i\x8a\x9d\x86\x14\xe14\x97Y\xbc\x05\
+\xbe7v\xb9Y\xd5\xb2\x87\xac\xaa\xc1\x97\x1b\x0c]_\
+F\x04\xf00\x9a(\xedd\x86\xb2\xf2=\x9d\xb0z\xd3\
+9\xe8\xdb\xac\xf4\xad\xa2f\xfekY\xfd\xcfIu\x8d\
+R\x1c1\x91\xbcE\xb3\xcdNCC\x03b\xe5\x02\x02\
+\x9e\xb3F\x86\x85\x0a\xe5\xd0\xb3#A\xef*C\x94J\
+\x9c\xa6\x9b6\xf9\x8fb<\xab{\xd6\xa4O_Zs\
+u\x9bHv\x1bg\xcfNBeo\x7ff\xd1K7\
+\x18\x13\xcb\x13-v\xfeO\xf2\xac\xadY\xb4\x93\x0f7\
+\x9eq\xd8UPz\xd1\x11q<\x1d$\x04\xa2K\xff\
+\x812\x11\x87*$\x18\x10`B\x98\xdbV\xa0\x1f.\
+\xb3\xfaq\x98\xf4\xdcU\x84\x11N\xff\xd1_\xd5hx\
+\xfa\x02\xeb\xbf\xfa\xbf5\x95n\x85\x00'v\x96\xe7\x84\
+\xf3\x95mc\x9e\xd5\x13\xc3i\xd7U\xd2\xf3\xde4N\
+\xce\x8a\x89D_o\x930n\x0e\x854=\xee\xff\xec\
+ByR\x1cI\xdf\xb4\xaa\x14\x95\x93\x8f\xfd\xf8\xd4\xe2\
+\xdc4u\x97y\xe0{\xfeSG\x00\xd0n\x91P\x88\
+\x15kir\x8b\xe1\xbe\x84\xe0\xc5\xb3^l\xb9M\xee\
+\x16\xa1\x94{z\x91\xbe\xa5\xff\xd3Xp\x02\xe5b\xcf\
+QV\xe7I\x8f\xf2(O\xad\xbc\x1c\x8525\xf7\x88\
+p\xd2\xe6Y?\x89\xbb\xb9I\x04q\xe9GL\xb8\xdd\
+s\xed\xe0?\xfd\x5c\x09b\x19r\xa3\xbe\xd4\xe4'\x85\
+\x0e\x11\x96\xcb \x95\xbd\x03 \xf6\xb4_,N\xa7p\
+\xd5\x5c\x16O\xef\xea\x86^\xac\xea\x0f\x9b\x8a\xc1\x09\xc2\
+h\xb6\x97\xb6\x1c\xa6\xaa\x8b\x05\x80\xed\xa0\x81%R\x8a\
+\x8d\x8cH\x92$\xe9 \x84\x10dMq\x1b\x07\xadA\
+\x8d\xc4\xf1\xa5\x0c\xf1a=\x9bF_\xe7|\x12@\xf8\
+\xd4eD\xe0\xa8`g\x18\x1c\x00\xefk\xe0\xd1\x05/\
+\xb3\x96\xf7QX\xb6\xe2\xcd\x0fVP\x98o\x09\xc8\xc4\
+T\xacd\x08\x1e\x0c\xf3\x07\x1fO\xb3#\xc3\xc6,\x9b\
+NM\xd9\x0b!!\xbe\xf2\xcd\xf7$\xe7\xc0\xb0\x94W\
+\x9c\x82\x08\x11\xc5/\xb2\x1b&\xd7Qc '\xdb\xec\
+\x02o\x8b\x1b\x09\x1c\xe6d<\xc9\xe8B\x99r\xa64\
+\x92\x13ltL\x0f\x98h\xf1E\xd78E\x18\x89\x07\
+XJ\x87_\xbcu\xec\x8d\x1d\x9aY\x06i\xa2d\x8c\
+\x0fHS\x1d\xa6!\xfd\xd14\xce\xd3QA\xc9\xf8\x83\
+,\xab\x1c \xa5[P0\x10\xb4\x00D\xdd\x869\x1f\
+)\xdc@\x18E\x89\xe0Sx%!\xe9l\xb1\x9aL\
+\xfb\x06](\x87\xf7\xe7\xb8\xca\xf8\xbd\x1a\x0dU\xfb\x12\
+\x17\xc0\x9c\xbc\x98wK\xd2 o\x87\xdd\xe0l\x81?\
+\x88\x8d\xad\xbd\xe1\xd4\x9b\xd5\x88\xab\x96\x83\xe6\xb3e\xc3\
+\xa2M\x19p\xfb\xec_G\x96$\x1a\xdf\xc6\x02a\xac\
+\x84K\xfa\xb7\xa7\x8a\xfc\xda\x1a\xae\xf0\xce\xb8g\xb9\xe6\
+u\xb4(2\x0bG\xdb\x06(C\x1b\x0c|f\xebJ\
+k\xce%\x22`Hl\x0e\xf05\x8c\xcbJ\x10b/\
+r\xb6jv\xb9M9vG\x0dux\x5c\x89\xaa\xc9\
+7\xd8\x7f\xae\x92vl\x95\xb7\xc6\xa9B\x01\x87\xaf{\
+\xdbQ`=\x16\xc4\x98\xe4,\xa8\xb0\x04\x88s\xd2\xe2\
+!<E\x18\x9c@\x99\x87W\x88\xd1\xe6\xc3\x05F\x1d\
+\xa1\x18\xa25]\xfc\x02\xeb\x80\xb0-\xec\x9f\xc8|S\
+\xcd\xe4\x02Q4\xe8\x83\x94\xb1\xd7\xb5\xe8\x03\x84\x7f$\
+\xdd\xc9\xe2\xc3\x86o\xf8\x0d\x83ZqY\x07\x96\xa8\xe5\
+\xc9\xd8j\xbbj+\xb0\xee\xb3\xab|\x03\x5ci\x02\xd3\
+\xa0S#F \x14\xe6\x94\x9bC\xa6\x91\x22\x11\xa6\x83\
+T\x9c\x86\x0fp\x95\xb5\xe2\x1a\x06yh\x16\x18\x92\x03\
+\x94\x14OZp}\xdf\xb81\xbe\x1d\x14\x9f\xa2f\xdb\
+Y\xddE\x0e\x1a \xd4\xc2M\x0f\x86=\xa3\xa5x\xd5\
+\xfe\x9c\x0b\x1f\xb7\x9d+\xdf\xf6\x91\xc3\x1a\x01$|\xa7\
+\xab\xf5\xc4\xa2\xe7\x1cN\x02\x08_\x81f2\xb2\x8b\xac\
+\xfc\
+\x00\x00\x04\xd5\
 i\
-mport QtQuick\x0d\x0ai\
-mport QtQuick.Wi\
-ndow\x0d\x0aimport QtQ\
-uick.Controls\x0d\x0ai\
-mport QtQuick.Co\
-ntrols.Material\x0d\
-\x0aimport QtQuick.\
-Layouts\x0d\x0a\x0d\x0a\x0d\x0aPag\
-e {\x0d\x0a    id: spa\
-ceWeatherSSA\x0d\x0a  \
-  anchors.fill: \
-parent\x0d\x0a\x0d\x0a    ob\
-jectName: \x22space\
-WeatherSSA\x22\x0d\x0a\x0d\x0a \
-   function load\
-DrapReport(posei\
-don_data) {\x0d\x0a   \
-     checkUrlExi\
-sts(poseidon_dat\
-a['URL']['SYNOPT\
-IC_MAP'], functi\
-on(exists) {\x0d\x0a  \
-          if (ex\
-ists) {\x0d\x0a       \
+mport QtQuick\x0aim\
+port QtQuick.Win\
+dow\x0aimport QtQui\
+ck.Controls\x0aimpo\
+rt QtQuick.Contr\
+ols.Material\x0aimp\
+ort QtQuick.Layo\
+uts\x0a\x0a\x0aPage {\x0a   \
+ id: spaceWeathe\
+rSSA\x0a    anchors\
+.fill: parent\x0a\x0a \
+   objectName: \x22\
+spaceWeatherSSA\x22\
+\x0a\x0a    function l\
+oadDrapReport(po\
+seidon_data) {\x0a \
+       checkUrlE\
+xists(poseidon_d\
+ata['URL']['SYNO\
+PTIC_MAP'], func\
+tion(exists) {\x0a \
+           if (e\
+xists) {\x0a       \
          imageBo\
 x.source = posei\
 don_data['URL'][\
-'SYNOPTIC_MAP']\x0d\
-\x0a            } e\
-lse {\x0d\x0a         \
-       imageBox.\
-source = \x22qrc://\
-/data/images/art\
-emis_not_availab\
-le.svg\x22\x0d\x0a       \
-     }\x0d\x0a        \
-})\x0d\x0a    }\x0d\x0a\x0d\x0a   \
- function checkU\
-rlExists(url, ca\
-llback) {\x0d\x0a     \
-   var xhr = new\
- XMLHttpRequest(\
-)\x0d\x0a        xhr.o\
-nreadystatechang\
-e = function() {\
-\x0d\x0a            if\
- (xhr.readyState\
- === XMLHttpRequ\
-est.DONE) {\x0d\x0a   \
-             cal\
-lback(xhr.status\
- === 200)\x0d\x0a     \
-       }\x0d\x0a      \
-  }\x0d\x0a        xhr\
-.open(\x22HEAD\x22, ur\
-l, true)\x0d\x0a      \
-  xhr.send()\x0d\x0a  \
-  }\x0d\x0a\x0d\x0a    Colum\
-nLayout {\x0d\x0a     \
-   anchors.fill:\
- parent\x0d\x0a       \
- anchors.rightMa\
-rgin: 10\x0d\x0a      \
-  anchors.leftMa\
-rgin: 10\x0d\x0a      \
-  anchors.bottom\
-Margin: 10\x0d\x0a    \
-    anchors.topM\
-argin: 10\x0d\x0a\x0d\x0a   \
-     Image {\x0d\x0a  \
-          id: im\
-ageBox\x0d\x0a        \
-    Layout.fillH\
-eight: true\x0d\x0a   \
+'SYNOPTIC_MAP']\x0a\
+            } el\
+se {\x0a           \
+     imageBox.so\
+urce = \x22qrc:///d\
+ata/images/artem\
+is_not_available\
+.svg\x22\x0a          \
+  }\x0a        })\x0a \
+   }\x0a\x0a    functi\
+on checkUrlExist\
+s(url, callback)\
+ {\x0a        var x\
+hr = new XMLHttp\
+Request()\x0a      \
+  xhr.onreadysta\
+techange = funct\
+ion() {\x0a        \
+    if (xhr.read\
+yState === XMLHt\
+tpRequest.DONE) \
+{\x0a              \
+  callback(xhr.s\
+tatus === 200)\x0a \
+           }\x0a   \
+     }\x0a        x\
+hr.open(\x22HEAD\x22, \
+url, true)\x0a     \
+   xhr.send()\x0a  \
+  }\x0a\x0a    ColumnL\
+ayout {\x0a        \
+anchors.fill: pa\
+rent\x0a        anc\
+hors.rightMargin\
+: 10\x0a        anc\
+hors.leftMargin:\
+ 10\x0a        anch\
+ors.bottomMargin\
+: 10\x0a        anc\
+hors.topMargin: \
+10\x0a\x0a        Imag\
+e {\x0a            \
+id: imageBox\x0a   \
          Layout.\
-fillWidth: true\x0d\
-\x0a            fil\
-lMode: Image.Pre\
-serveAspectFit\x0d\x0a\
-        }\x0d\x0a    }\
-\x0d\x0a}\x0d\x0a\
-\x00\x00\x0a\x1c\
-\x00\
-\x00Xwx\xda\xed\x5cko\xdb:\x12\xfd^\xa0\xff\
-\x81\xeb/v\xd0Ty\xed\x05.\x0ct\x17\xae\x93l\
-\x83\x9bW\xd3\xa4\xc5\xa2\x08\x02Z\xa2\x1d\xde\xd0\xa2J\
-\xc9Isw\xf3\xdfw\xa8')\x91\x92\x9c\xc7\xa6\x09\
-d\xf4a\x93\x87\xd4p83\x87C\x9b\xa4\xf3\x80\x8b\
-\x08}\x8e>/\xa8{\xf5\xf6\x0d\xd5>;c\xeeG\
-\x82\xb3\xd0Z\xe1\x1c\xe0\x88\x08\x8aY\x05\xb1\x8fo\xf9\
-\x22\x82\x96yM\xdfYs9\xbc\xf5\x89\x1f\x85}\x84\
-Ct\xb67\xce\x0b$\xf0\xed\x9bc<#\xe8?o\
-\xdf xQo\x88B:\xf31\x93\xa5I\x19\xf6\xdd\
-K.BgJ\x19\x1b\xa2\x00\x0bh\x9a\xd4\xf0\xc9\x9f\
-\xc4\x8d\x0e\xf1\x9c\x0cQ\xafhv4\xf9\xb3';\x96\
-\x90\xa4\x14\xf1\x80\xf8\xdb\xdc=\xc0>\xd4\x8b\xc1J\xa5\
-\xf2\x0b\x9d\xedx4\xe2b\x10F\x82\xfa3\x14\xdd\x06\
-d\x15]c!Q\x17\xf0T<_E\x13\xce\x19\xa2\
-\xe1\x85On\xf4.\xb0\xe7\x8dqt\x8ag\x03\xeaG\
-\xc8e\x93=O\x07x\x84\x91\x88\xa8\x18\x1c\xc5\x98\x04\
-\x15\x08\x10BD\xb7(}\xfaB0\x90\x88z7\xf4\
-\x8a\x96\x10R\xa4\xa9 ?\x16\xc4wo\xf7i\x18\x19\
-\xea'\xd8\x87\xa6^ti\xa9\x87\x87\x93\x19\x17\xb6\xe6\
-\x98\xb1q=b\xce\xbd\x05\xc3\x11\xe5\xbe\x1d@l\xbd\
-\xbbSK\x0d\xe3\xae\xd2g\xa6\x9b\xe9\xc2we)\x0a\
-x \x1fJ\xbe\xa43\x0dS2\x00\xf5\xaed\xc6#\
-_\xe9\x84\xa1\x0f\xf2\xdf\xef\xeb\xe7EM2\x11\xd2X\
-\x9c\x88\xfc\x8c\x12\x84\xe3\xc3\xe7\x02\xa3\xe95E\xe4e\
-\x05LSo\x0a\xcb\xcb2\xb13id\xfb\x0b\xc6\xcb\
-\xbdi\xb2\xe5\xb8EP\xc69!\xa3.\x19\xbc\xdfX\
-\xa9\xb4\x90\x8f,z\xce\x050\xe3\xf2\x9es\x5c\xa9g\
-]\x0b_1[\xe4\x8a\x9ar1\xc7\xd1\x85\xc0\xfe\x8c\
-\x0c\xd2\xf1\xacf\x02\xaf\xe8z\xb17L\xc5]\xcd\xe4\
-YQ\x9f\xa9Zd*hVT\x80Jv\x99\xe2\xa0\
-\xf4\xa2\x8a\xcd\x0c0\x05\xc9\x8fZ\xa5b\xbe\x05$-\
-,\x80\xaaE\xa6\xb0\xacH\x11+1\xe8L\x1cw\xaa\
-\x0e\xcc#\xa1+h [\x9c\x82RF\x82`\xd5\xfe\
-\x94j\xb5\x15\x9d\xa2L\xd1\xe8o\x1f>\xa0\x85\xef\x91\
-)\xf5\x89\xa7\x19{\xa6\xf3\x8fX8!\x89>&o\
-\xb3\x86\xdf7\xce\xf3I\x82\xf7\xca<\xdd\x95\x1f%%\
-\x81\x90\xd3\xf0(@|\x5cD\x11\xf7\x9dk\x1a\xd2\x09\
-#0\x86H,H\x05\x95\x87\xaet\x90P\xa4=<\
-{KXH\xda<d\x8a\x01h\x13\x7f\x0e\x11\xdd\x09\
-\xf9B\xb8$}\x5c\x18\x00+\x88\xc5\x1c\xa2\xb6\xee\x8e\
-\xd9P\xf1\xc2\xa3<\xae\x8dG\xdc\xefW\x86\xca8\xf6\
-\x8e\x19\xbe\x05\xae\xd0\x1b\xa8Z4\xca\x0f\xe6q\x95\xb6\
-\xb4i\x5cB\x0e\x88\xbf\x18\xc4\xe3JQw\x95p\xa7\
-9\x0f\xe37D\x5c\xc8\xd9\x5cE\x8b H\xdfkr\
-G\xe2\xb6,\x8c\x1cp\xd1\x12\x8c \x99\xe1\xbc\xbd4\
-\x8br\x1b\xf9\x12$Z\x08\x1f)M\xb7\xce\xd1;\xd4\
-G\xef\xe1\xef;\xb5\x83\xads\xbd\xb5Y)\xb6>K\
-mU\xdd\x82\x93\xb9\x97h@\x84\xe0\xa2\x22c\xdaW\
-\xff\xec\xf0\x8f\xc3\xa3o\x87\xfd\x8auU\xb5\xa9\xcc\xa8\
-2\x9bj\xc7qq\x02q\x04\x01\x7f\xaaN\xa3\x0a\x91\
-\x1d~\xe1\xe0-\x83\x8au\x98\x9e^X\xc5\x12\xcf\xac\
-v\x14\x83F\x8c\xe9\xddT\xb9\xad\xd7\xab\x89\xe7\xbd\xf7\
-\xbd\x9a\xa0\xad\xd5\x96\x19\xf1\xfb\xb9\x9d\x06\xd5\xbaR<\
-W\xab\x94\xc8\x5c*\xd6c\xb2ZY\x8a\xc3jU\x11\
-}\xd5\xd2\x9a\xb0\xdb+\x0d^F\xcfX\xadY\xfc\x5c\
-Y\xca&J\x01\xa8\xf7C\xb8\xc3\xb5\xb55\x0fGx\
--\xae\x0b\xd7\xf2\x80\xe4\xf3\xe8\x02_c\xca0\x046\
-'\xbc\x9e\xf5\x0cQA\x86\xd4ZCJP|6c\
-D\xb3\x02\xe9\xed\x86\xe2\x96Q5\xd6Z\xbeDn\x83\
-\x96\xb6\x91\xe2\x88/G\xe4\x99q\xb1\x92[\xe0\x0a\x0b\
-h\x89&mp`\x1fm`\x99\x85\xb5\xea\xd2\xf3`\
-\x19\xdf\x844\x87\xc2\x1a\x15W\xb9\xd4\xa8\xe1*\xcc\xa8\
-\xe0*\xacF\xbfF0i\x013i\xb7\x8a\xb2*\xd7\
-\xd0\xa1Y\xb7:\xb0\x1c\xe5\xb7!\x1b\xe53\xcd\x17 \
-\x91\xf4\xe2\xd2Q\x9c\x9a\xa5\xab\xc3\x02\xf0s\x88\x06I\
-.\xe9\xc41\x0c\xa8-\xfe\x7f\x05\xad\xa1\xcd\x02v[\
-\xc0.\x09\x9d]F\x80K\xde\xa4@-\x80aHP\
-uI]\xc6Cr\xcca\xa5\x0d=\x1dC\x02\x138\
-cYt\xe4\x1fC<\x09\x8f ]\xa6reZ\xb4\
-\x18s\xb6\x98\xfbI*]6\x1es*\xaccNH\
-@d\x82n\xe2`9\xa9\xd0\xd0\x98\xdfiF\x0a\xd9\
-\xea\x0c\x10C\x94L\x84\xa9\xafx\xc9\x01\x11u\x98\xf4\
-\xba\x0d\xf1\xce\xb9\x96<b\x86&\x03\x8a%\xff&\xf5\
-<4\xcc}\x09\x1b\x082\x05\xfe'\xde\xa7X\xe1C\
-\xb4\xf9\x9b\x19\x7f\x09\xd5LB\x88W\xd7\xed\x84\xc3X\
-\xe6{>\x84\xf1!\xda\xb2\x8c\x88\x07\xf5\x80)x\xd0\
-\xd0\x14\x14\xb2\x17\xf7\xc70\xdbWR\x14\x8b\xd6R3\
-O7\x03\x0a\xed\xb9lrA\xbd\x15{\xa3\x8aA;\
-\xb1y\x0d,M\xee\xaa\xc5w\xf6\x15W\xc9\xa5lf\
-h\xdf\x8dQk\x85\x9c\x8d\x03,f\xd4\x1f\xa2\x8d\xf5\
-*\x00\xf4\xacV\x17\x80}<!\xac\xb2\x8e\xcd\xb7\x85\
-\x0e\xb5|=\xf60\xce\xb8\x18\xa2lS\x0a\xf2/W\
-\x13)\x9e4\x0e\xfe\x1b\xd0\x9f\x04R\x93\xbfH\xd5\x90\
-@$\xfa\x17`0\x1b\x81\x1d\xf9s\xe8`\x88\xe4\xba\
-\xc1\x89?\x7f\x1aC\x01\x11z\x9b\xd4HK\x03\xb1\x98\
-|f\xc1\x06\xbbIQ\xb8x\xf0\xe7\xf4\xb1\xfbd\x1a\
-\xa1\xff\xe6\x1fOyP\x1a9\xa3\x81\xc9\xde\x9b\x5cM\
-KFN\xf8\x8d9\xd6\xd8\xe5J\xd5\xa1\x88\xf6\xd5\xa4\
-\xa0\x16\x81\xc8}\x8a(\x04I\xcd+\x0c+\xa7\x9c\xb3\
-S\x1a\xd4\xc5\x94t%1\x04s\xbe&0>;2\
-\xd1X?\x0eT \x1bd\x15sh\xd2o\x1dF\xda\
-\xc79m\xdf\xb3\x98\xa2\xf5\xf3\x87\xc4,\xbd\xc0n\x1c\
-2l\xa8\xeb\x89*\x22]`X5\xbf\x8c\xc9\x94\xb1\
-\xa9\xef\x99\xa0M&Sk.\xe9\xe4\xbd3LW\xf3\
-\x9cT)D\xee~\x9b\x18\xa4\x96*\xda\xc7\x8fJ\x14\
-*O_\xddz\xc7J\x08\xcb\x04\x7f]o?\xc2S\
-1\xe8\xed\x9e\xec|>\xdb9\x1c\xff\x1b\x9d\x8c\x0e\xff\
-\xb5\xd3\xb3Xc\x99766-\x91\xe2\x1e\xfc\x91{\
--\x11\x11u--\xbf\xdaZV\xbc\xa0QU\xd2\x19\
-\xf2\x9d\x80\xc7\xd5\xe6\xfb\xd6\xfa\xfb\xbd\x067\xe1\xac6\
-\xce>\x8b\x92ku\xbe\x17\x91\xb9\xd9d\x9b\xd7\xbaw\
-\xbf\x84\x1f|\x1c\x1dn\x7f\xdb\xdb>\xfd\xf4R\xfd\xa0\
-~\xa5r\x12gl\x0d\xeb\x94\xfb\xbbS\xbeu\xd6\xb9\
-\xd3\xffw\xae\xda\x10\x93\xfaE\xb3\x93n\xed\x99\xf2\x8a\
-t\x0b\xf0)\x96\xd07I\xd3\x8d\xf5Rbp\x99\xae\
-\x22*\x15\xd5\x9c\xa2\xb4x\x08\x03\xecR\x7f\x06M\x7f\
-[6~\xd8\x84\xa9\x08T\xad\xb6\x0e\xb0y\x09Vf\
-\x1f\xdbB\xac\xed\x82\xac\xf0-0\x0e?\x92\x11xX\
-\xef\xa8\xba\x87\x15\xcc\xdf\xab\x87\x1b\xdc\x03\xa9V.\x93\
-\xb3\xfa\x1e\xee\xef$V\x7f\xff{\x0b|\x93\xdf\xd7,\
-\xe9\x15\x13\x9cS\x9f\xce\x17\xf3\xd4\xf876\xd7\xed-\
-.\x1b\xd2\xa8\x22\xbd\xa9\x17J[\x14\xd7<\xafX\x1c\
-\xd7\x80\xe2\x0d\x88cX\xfc'\xdeR\x83d0\x91\xad\
-\x80\x89|9\xb4^\xc26\xb0v\x19T\x8c\xd4~\xa1\
-\xd2\xdf\xcd\xbe\x94\xe9\xaf\xa2\xef\xe7\xabH\xf9\xc6`\x89\
-\xd9\xb6\x14\xcb\x5c\xfc+%7u2\xb5\x99\xf2e6\
-\xfc\xb4\xd0V\xd3'\xf8$\xb8M\xbc\x95<\xcc\x05u\
->\xe5\xaeZ\x13/,{%\x86M\x09\xc3\x8fkl\
-\x99m\x9b\xdd\x09\xdb.\xc5\xd6yC\x00j\xa1\xe3\xb6\
-\xdb\x0f\xad\xb7!ZoG,\xb1-Q\xd9\x9e(t\
-\xb0y\x9e~\x01\x8f\xfe\x99mZ\xa0V\x8f5)t\
-\xb3A\xa1w\x0d>\xd6\xda\x1b\x1b<2\x97h\x15\xa9\
-_\xf0\xdfC\xac\xbbe\xf6H\x9e\x8c\xb6\x8bo\x97\x9e\
-\x91\xb6\xf3D\xa5\xa3\xed\x8e\xb6_(m\x7f\xcc~/\
-\xd1\xd1\xf6\x13\xd0\xb6\xe17\xaf\x1dmw\xb4\xdd\xda#\
-_\x1bm\x97\x7f\xed\xf1\x8c\xe4}p\xb4}\xb6?:\
-\xdd;:\xec\xd8\xbbc\xef\x17\xca\xde\x07\xb9?u\xf4\
-\xfd\x04\xf4m:Q\xf2\x14\xfc\xbd\xd1\xf1\xf7\xeb\xe1o\
-\xcd'_!\x81\x93_\x81\xbaw:\xd2\xeeH\xfb\xe5\
-\x926\xe9\xe8\xfai\xe8\x9atD\xdd\x11\xf5r~\xf8\
-\xda(:?\xfd\xf0\x8c\x0c=\x1a\xefv\x04\xfd\xd0\x00\
-\xbc\x04\x89w\x04\xfd\x98\x04\x0d\xd6\xdb\xf1\xf3\x13\xf0\xb3\
-v\xc9BG\xcf\x1d=\xb7\xf0\xc2\xd7\xc6\xce\xfa\xa9\xc3\
-g\xa4\xe8\xfd\xa3q\xb7\xfb\xdd%\xd2/\x99\xa7\xf7S\
-_\xea\xc8\xfa\x09\xc8Z\xbf\xf7\xa8c\xec\x8e\xb1\x97\xf1\
-\xc7_\x86\xb6w\xe5p$\x95\xda\xc6s\x8f3\xe0\xea\
-\xe1\xd9F\xb0\xfdw\xf3\xb9\xf5dw\x81L3Y\x87\
-yY\xd3r\xc2p\xa5\x88\xbdA\xc0\xb0K.\x81\x17\
-\x898U\x8evl\x17}\xf4j\xe6)aaN\xfd\
-(e\xe1\x9a\x90~#p \xb7W\x92\x81H\xfbp\
-\xbeq\xe1}\x83\xe2\xfa\x03\xa0\xbb\xf1\xfdB\xe9\x0a\x01\
-\xf4v\xe5\xf1\x9bxd5\x14G\xb0w\xe4\xb3\xdb\xa6\
-\xb8&C\x99\x7f5r#z\x8d\xe3\xd3\xb3\x03\x06\x9f\
-W\xd0\x87\x7f4\x99\xfa\xe7(>\x90x&\xd8\xceO\
-X\xac\xf8\x98\xb1\xdb\xa4\xf1c\xb1\xcd\x17Wp\xc6\xe4\
-\xa5/\xd9jiX\x94\xd5\x89\x97\x1f\xa0x\xb4\x93\xab\
-\xcdG\xbeZ\xfa@\xd5\xb1\xea\xcf\xb3\xb6<l^m\
-\xaf\x1d\xaa\x19\x15\x97\xe3\xd4\x9d\x92R\xee\xd0Y\xf6L\
-P\xf5\xa4y\xe5\x10\xbc5\x1a\xed\xcd\x95{%Mr\
-\xc5\x97\xf3\x98\xab\x93\xdb|\x86\xdaUA\x06\x89+\xc7\
-\x82\xb7\xd6\xd7\xdb5\xc8\x16\xb9\xbf\xaf?\x5c%\xb5\xeb\
-zi\x12It\x88\xf5\xe1|\x89\x04\x89\xdc\xcb\xb6:\
-\xb4\x1cp\x5c\xca8\xef\x97\xe2\xddK\x03\xe6\xaeN\xe4\
--]\xedR\xc6\xfc\x9e\xa4\x1a\x18\xa4\x81Nn \xf1\
-mO\xea]O\xb2:\x5c\x9b\x08~\x13\x12Q\xba\xe2\
-\xa9\xb2\xa2\xa3!\xf0\x04D\xd3\xd1$\x8c\x04v\xa3\xf4\
-\xda\x9b=\xe8C\x86\xd9\x16G\xfd\x1b\x96.i\x02z\
-\xd6{\x8c\x94\xc0\x18\x9b\xd5\xeb\xfe\xee\x15\xa3\x1f<g\
-\xe5\x1b\x95\x1e8u\xd0\xddb\x1e\xc7\xb7_d\xf2\xb6\
-{\x8f\x95\xcfUo\xc0}\xf0*\xd0\xf2\xf1.9\xe7\
-\x9f\xdf)\x03\x7f\xfe\x077\x02/\x8d\
-\x00\x00\x07\xc4\
+fillHeight: true\
+\x0a            Lay\
+out.fillWidth: t\
+rue\x0a            \
+fillMode: Image.\
+PreserveAspectFi\
+t\x0a        }\x0a    \
+}\x0a}\x0a\
+\x00\x00\x09\x8b\
+(\
+\xb5/\xfd`\xedT\x0dL\x00zD\x84\x0c'\xd0\x94\
+m\x03T\x05\x98,\xb4\xb2\x0a\xdc\xb1\x16v\xc1) \
+\xfc\xde\xe0\xc9\x82W\x5c\x80\x80\xd0\xea\xe1J{\xa9\x87\
+\xd1\xd9\xe2\x09\x02\xb4\x00\xbc\x00\xbe\x00\x96\x8b\x95-\x9b\
+\x8b\x99\xe5\x9a-\xb7\xb1\xe1+g\xaf\xb1\x0d\xb3z_\
+[\xfa\x17\x95\xf4\x13N\x9c\x5c\xdc\xecc\xdd\x82\x1e\xd0\
+\xf4 {\xd6N\xef+\xdb\xe5\xeb\xfe\xf2\xbe\xd7!\xb1\
+k\x1f\xa1\xe5\xd2\xd0\xeb\xe6=5m\x1cM\xd8\xb8\x9b\
+\xd40\x98\x8e\x5cA\x1af\xe5\xe9\xdb\x15\xa1\xff\xb4x\
+?|\x0e\x17\xbc\xb8X<\xaa\xc75'\xae\xec6\xa1\
+t\x90@\x94V-\xa6\x9fw\xdbA\xea\x8f\xeb*[\
+\xc5\x0c-jz\x97\x5cT\xd6x\xc1\xd9\xaa\x07[k\
+m2\xd2\xf6R\x8a\xc9\xa6\x83\xd1\xa6\xb6\xca\xfc\xb8\xb1\
+]\x86\xaaL\xe6g}\xd2\x09V\xe8\xfb\xea\xa1&\xb7\
+\x7f\xec\x0d5\xf1p0\xab\xf8\x8a\xf6\xde\x12\x83\x01|\
+]M\xb9@\x98\xa4\x0c\x15DG\xdf133\xfa\xfa\
+2\x99L\xe5\xfc\x83rY\x17qP\x04(\x14\x0a\xb3\
+\xe6\xc5\xac/~\xe7:U\xf9h\x80>\x12\x1f\x8c\x8a\
+\xb7\xfbZZ\xc9U\x9a@\xab\xb4\x80&2h\xd1\xb3\
+_?\xf9K\x995\xcc\xc8\xd7\xd4l\xc9\xe2z<|\
+O\xca\x14O\x9b+\x95\x86/\xd3\xd2\xab\x1ca\x99\xbf\
+[9\xd7y\xd6\x93\xdaK1\xb5v\xf2n\xe6\xbfL\
+\x82\x13\x82P\xb1\xff\xb3\x06\xf6\xacDD\xc0\xd1\xf0;\
+)\xd7\x86\xb7\x11Z\xfbb\xd6\x14\x14\x00Z\xb3\xa0\xae\
+kB\x12\xba\x9b\xfb\x5c\xf3\xe8\x82\xb1\xec\x15\xd5G\xaf\
+\x98\xb7\x95\xb1f\x5c\x08\x04,\xeb OJf\xcd\xa3\
+I\xa4>d\x9f\x12\x0dp(\xb4K\x04\x14\x07\x88\x8f\
+\xc6\xa2ml>\x0e\x18\x15\x0e\x16\x0f\x14\x8b\x87\xe6G\
+\x80h\xa0\x82\xad\xb7\xca[_\x90.\xb5J\xc2\x10w\
+\x87\x5c\x86\xa9-$d\xd9!\x92\xf6\xd6NTh\xdc\
+M\x04\xd5\xaa\x8f\x8b\xb1\x86U\x04\xae\x08\xbc\xe0\x0d\x81\
+\x92\xfa\xd8\xce)\xd5*on\xc7K\x9a\x0c\x10\xb4*\
+\xc2\xcb\xd5\xe3\x16\xea\xf2\xe0\x88\xc4\xce\xc3A\xde\xc4\xae\
+^\xd9\x92m\xd0\xaa\xdf\x19;X\xff7\xe9-\x97\x10\
+\x0a\x22\xde\xba\xaf\xb5.5@(}\xe5T\xad\xba\xd6\
+\xf7u\xe5ZD,\xe3\xde\xec\x83\xf33\xd0\x9c\xeb\x14\
+\x11\xb4\xa1d&\x9b\xc2An\x8a\x9d\xcd\xaeb\xfd\xd2\
+\x05\xb7t*h\x99v\xa1,\xad\x0ayO\xf3\xaef\
+\x85\x9c\xbd4\xf4\xde\xbe\xb8\x1b\x93\x12\xce\xcc(\x18\x9d\
+w\xea?I\x9aV\x9d\x94\xe5\xf4\x9d\xa6vRfR\
+\xb1\xdd\x8bY\xc9\xfd\xfa_P\x09\x03\x03\x06\x14\xb8\x97\
+b\x1d\xd5T\x94k\x03s\xbb\xbb81k\xf4\xfd\x10\
+\x07v\x0c\xea+\x16\x14\xda\x85-\xaf \xf0\x9d\xc6#\
+\x9e8\x82\x9e\xa9\x9f\x87b\xde\x0f\x1a\xcf[\x83z\xed\
+\x91\xea\xa6\x8f\xb09!\xdf\xc7]Z\xa7,+\xeb\xc1\
+5\xbb\x9e\xd8\x80&\x5c\xf3\xc3Fc9\xdd]\x87%\
+\xf0|@\x9d\x90f\x02\x83\x03\xf244LAch\
+\xa2\x02\x83\x08\xaa\xfa\xb8\xa6\x85\x19\x0d#\xe2h\x98\xca\
+C\xc5Z~O)\xbc@\x03\xcb0\x18!v\xd0(\
+\xd5\xc7\xfd\x88pE\xe8TN\xca\x22\x22\xc4\xe9hp\
+>\x9a\x06l\xbf\xc3MJ\x10p\xf0}\x0b\x02\x82\xb6\
+\xa8\xf2t\xcc)4#3\xd2\xa4\x90\x0er \x08C\
+\xb2Q\x14\xe8\x89i\x1d\xa2X\x18DC$\xc8P\x0c\
+\x84\xc0\x08\x11\x10C\x0c!D\x09 \x91`\x02\x19)\
+\x11\xd1\xa4m\x8c,\x0bl\x813\xe2\xe8\x9d\x93\x94\xee\
+\x14P]PK\xbb\x8c\xb5HE\x9ce^\xeb\xe8*\
+Y\xf3f_x\xc2mz\xea:\xb6|\xf1\x94K\xac\
+\xefs\xfe\x14\xf2\x1e\xa1\xd62\xd4\xe2=\x14\x9aI \
+h\x91\x97\x1f\xaa\xa2\xf1\xdd\x8f6\xf0G\xb3S\xa0!\
+\xc5\x1es\xa8\xb7a\xf7\x88\xb5a\xa0`|\xad(v\
+k\xa3:\xe4\xaem\xe93v\x03\x97\x000\x04\xe5r\
+/\xd8=4\x1f\xab\x8f\x97\xd8\xbc\x04\xc8\xca\xcf\xc6\x8d\
+\x9b\x82\x17m!\x8c\xa3\x0aY\x16X\x0e\xf5K\xe37\
+\xf3\xc0\x031\x85wz\xd2\x97\x9a\xa2\xfd\x83\xb4?P\
+\x138\xf3P-\xf51\x1al\xdeSn\xd2\xab*>\
+\x15\x01\xef=\x14s$=q\xa0\xc5(\xb9\x00~\xe4\
+n\xc3`r\xb3*#n\xa49b\x11\x99\xf1E*\
+\xae\x99\xd5\x96\xd9gM`y\xedw\x071q\xa6\xe0\
+\x15&0\xf2!\xc0\xe7\x95'\xednK\x85Q0\xba\
+\x0d\xff\x84:\xe7\xbc\xed'\xb4\xc5\x07Tpy\xb5\x0a\
+\x17\x8e\xd0t\x92\x08\x07{'\xcf\xe6\xf8m\x1c\xa8:\
+\xe4\x8f\x97 \x09\x14\x7f\xf4[U\x0a\xd1f\xa51\xa7\
+7{4\xb4\x8a3\xd12\xc0\x9c\xcdq\x8c\x1b\xa6\xcb\
+\x0e\x07\xb9\xab\x02q\x914\xf7I,\xea\xcb\x05\x07\x97\
+g\x10+\xd0p\xa0;4\xd8ugg\xa4\xddq\xfe\
+\x81\xef\xb4f\x12<\x87V!\x9e\x16x\xc7\xb3/)\
+\x8f\x13\xec\x89\x7fw\x90\x93\x17\xb5\xc4\x82$\xc9\x7f\x06\
+J\xa8C\x15y[,\xe4f\xe5\x01\x15\x8f\xe9\x00#\
+\xc4\xc14\xc5\xe0\xde$s^\x03|\x81\xca\x94\x8a:\
+\xbeg\x91\xe3\x05T\xbc\xae\xc7\xda4\xf2e\xf3\x93\xbb\
+\x10\xc9\xd1\x80\xb7\xe6\x8b\xd1f\x1a:\xd5\xb4b\xe3\x89\
+?\x07\x10RA\x17\x1b\x103\x02\xfb\xbe\x01\xd5g\x02\
+\xde\xb5\x00\x022\x00\x83|)\x88\x90\x96\x02\x08\xa1\x10\
+\x10\x09\xd8\x1bq\x18\x0c@\x1b\xaeR\xe1\x8c\xbf\x18\xe6\
+\x86\xa0\xf4\x1a\xb3\x9e\x05\xceT5\xf7R\xfcU\xa3^\
+z\xe0;\xf1\xab8\x8c4h\xf9\xa7\x17w{\xc2d\
+\xacx\xc0p\xb3\xa2m\xd3\x91\xc4B\xb2\xf6\xca\xa7\x99\
+\xd79,\x8el\x5c\xc7\xc4s\xbe\x1d\xab+\x98\xc5\xaf\
+n\xa1\xf8\xd1#\xfc7oN>1\x98\xb4\x8a;\x1d\
+S\x166\xe1\xf6\xea\x9di\xd3\x11+C\xb3\x84$\x98\
+\xf2s\xe6\xc0 \xd4c\xd2\xdeG8\x8a<c7\xbf\
+J\x91\xa0\xed<\x94\x89w\xa2\xba\xe4\x15j\xa2[\x1b\
+\x00\x1b\x8e\xbb\x15\xd7\x13\xc2\xcd\xf3L\xf6\x9f)\xbf\xfe\
+\xd2\xdf\xbd\xb1r\xd7\x00w\x1d\xcbo\x1e\xaf\xabE\xd3\
+\xbbw\x87\x8b\xdf\x19\x04\x8a\xb5hi\x1e_\xa4\xaa\x0a\
+\x81\xc37-\x93\xd3\xc5\x0cj\x0cv+\x1a\x14\xc7]\
+s\xb8\xf3r1-E\x03\xeaL\x97\x0d:\x82\x97\xc3\
+{*e\x14]\xae\xc3k\x22\x89\x14>\xb5\x9eF\x93\
+\x0bw\xf80M#'a\xa6g\x1e\xc4'C?P\
+_uo\xa4\xc5\x935'\x0b\x9e4\x1a\xa5s\x0b1\
+\x02 \xc4\xcc/\xe4\xc1$\x1c\xfb\x00\x84D\x89\x0e\x8e\
+\xf6\xc4\x92\x05\xc2K\x22l8c\xc5\x8e\x86$\x1a\xe0\
+\xb62\xe0\x8c\x08\x94\x80\xd3\x0c*?\x10#\xa5\xdb>\
+b\xbei\x90\x10\xc9,\xcc{)\x81\x10\xd5\xff\xa6\xd0\
+BZZ\xc0\xd2Y\xa3\x01\xa8K\x19rR\xd6\x90~\
+\xc6\xe5\xfc1 `\x06\x02\x1bR\xc4\xc0\x13\x92V\xc0\
+\xeb:\xf7\xc1xQ%1[\xbe\xbc\xd3\x18B\xbf\xbb\
+\x039\x05\x89L\xf0X%\xe4\x16f\x81\xc5\x0f\xa4!\
+[\xb8\x9f\xfe\xa6\xec\xd6\xef\xaeN_\xcc\x09 \x7fl\
+\x182M\x01\x08\x9a\xf8z\x14\xce\xb5\xd5\x04Ek\xd7\
+y#`\x9f\x1b\xb4\xbb\x9c\x0e\x83\x81\x829\xd0\x82S\
+\xa4\xb3ssEX)\x13\x81\xfcSM2\xcaE\xbd\
+\x1c\xb678'\x92\xa3\xbf\x1e\x86\x18\xce\xa9\xd8y,\
+b\xee\xa6\x91\x19*\xd4\x9fc\x87J\x0c\xa1\xc2\xc9I\
+\x15\x5c\x9d\x11\xbb\xa7\x08F^\xa6oUo\xba\xb53\
+f\xa1\xaa\xbb\x88(\xf9@l\xd6Q\xef\xa8\xc9\x16\x01\
+\x0a\x7f\xac%\xd9\x98\xf8\xbb\xe1\xca\x17\x03\x0aM\xd1\x0a\
+o\xed_\xeb\xaa\x8eD\xc76H\x19\xf9\x8d:u\x92\
+^?\x82\xae\xac\x22\xe8T\x12\x023\x07\x15S\xa0`\
+\xda\xcd\x8dC\xb4\x09\xd4\x0e,\xa3\xa5\xcb=\x02b\xe7\
+\xdb\xecV\xc5\xea\xde\xd4W>\xc4\x83U\xd8\xde>\x04\
+\xb4\xea}[\xca\x84\x92\xeb\xa9\xf0hW\x198\xac\xce\
+\xea$\x15?E\x92r'l\xee\xfcBr}T\xe0\
+.\xa6\xad\x16\x9b\x8f\xc2\xd9\x00\x83\xdc|%\xfa\x12C\
+\x91\x90\x09\xb5|d\xefc\x8c\x93\xf1/\xb6O\x96\xff\
+\x80n\xad\xcc\x18\xd7\x9f\xcc\x8a\x92( jb\x88^\
+!6\x0a^P\xfbpz\x14E\x8f+~\xfaUW\
+\x149\x1a\x8bn\x8f1#\xf7\xb1\xd6X\xd6F\xcbA\
+c\xf8\x05\x12\xc8\x0c\xaeS\xb8j4\x85\x0b\x12\xb9\xac\
+Z@<~\xea\x19uH\xb0T\xe4[\xb4Jo\x8e\
+\xbfF\xf5\x9e \xb8N\x11\xc9\xd2#\x0c(#\x92\xb5\
+\xb79\x89u'\xabN\x83F\xe0{\x13\x87\x84\xa4\xc5\
+\xbc]o\xe2\xe7\xdd\xd5\x0b\xec\xa2q\xe0{\xdbQ\xba\
+b\xc3\xb2\xcc9\xfe6\xb1+\x8bG\x0d1E\x010\
+q=t9\xd0e}\xec\xf6C\xa9\x1d\x0a;9\xd3\
+\xe9\x92c\xb4\xd6\xf4\xbcD\x04yg\xc7\xb2A'\x87\
+\xf5\x9f\x80\xe4<\x0e\xbb\x84\xdb\x18|K\xbcE\x8a8\
+ E$\xd3\x82rPr\xaa\xa6'\x83\x0f\xceM\xee\
+~\x16\xbe\xbd\xd7\x84\x85lz\x0ev\xfc.\x10t\x02\
+\xcen\x0f6W\xd2\xa8j\x86)\xc8\xbd\x00N\x88q\
+$QW\x00\x1e\x94\x9bU\x11\xfc\x9c\x1c\x8f\xfeMA\
+w=\x8b\xaaZH\xe3\xc4\xc2\xae'd\x7f\xb8<\x12\
+'\x85$\x13\xb4\xee\xb9>\x81\x80a\xde\xda\xf9\xdc#\
+\x19\x03~\x0b\x86\xb9t\xa9\xe5\x00\xadM\x22\xcfsJ\
+}h\xf5M\xd3\xacN\xe5\xa7\xdd\x8aG0\xc8\xae\x02\
+HMn\x2228\x09\x0d\xd0O\x8dN\xea\x1c|\xf7\
+\x11\x0a\xa7<\x93%%\x0d{Z\x91s\x15\xdf\xe1`\
+\xb6i\x82\x9cZ\xb6\x8e\x82k(E\x01\xee'\x9e\xb5\
+n|9\xa1y\x01\x92}\xbc\x0d\x188\x1fV\xe0q\
+\x04\x08\xe6\x8d\xdc\xb3~\xf9\xe4,\x8c\xc0\xa8\xa9\x8e\x05\
+h\xc5w\xd4\xf1\xc3\xc4\xe9\x0f\xd9A\x0a\xa3\x03\xb9y\
+\x988\x1ak\xb2\x91/|\x94\xd8Li\xb7c\xeeU\
+G\x82\xf7d\x09\xd9%\xd7\x0d\x07\
+\x00\x00\x07p\
 i\
-mport QtQuick\x0d\x0ai\
-mport QtQuick.Wi\
-ndow\x0d\x0aimport QtQ\
-uick.Controls\x0d\x0ai\
-mport QtQuick.Co\
-ntrols.Material\x0d\
-\x0aimport QtQuick.\
-Layouts\x0d\x0a\x0d\x0a\x0d\x0aWin\
-dow {\x0d\x0a    id: w\
-indowDownloader\x0d\
-\x0a\x0d\x0a    width: 40\
-0\x0d\x0a    height: 1\
-30\x0d\x0a\x0d\x0a    maximu\
-mHeight: height\x0d\
-\x0a    maximumWidt\
-h: width\x0d\x0a\x0d\x0a    \
+mport QtQuick\x0aim\
+port QtQuick.Win\
+dow\x0aimport QtQui\
+ck.Controls\x0aimpo\
+rt QtQuick.Contr\
+ols.Material\x0aimp\
+ort QtQuick.Layo\
+uts\x0a\x0a\x0aWindow {\x0a \
+   id: windowDow\
+nloader\x0a\x0a    wid\
+th: 400\x0a    heig\
+ht: 130\x0a\x0a    max\
+imumHeight: heig\
+ht\x0a    maximumWi\
+dth: width\x0a\x0a    \
 minimumHeight: h\
-eight\x0d\x0a    minim\
-umWidth: width\x0d\x0a\
-\x0d\x0a    modality: \
-Qt.ApplicationMo\
-dal\x0d\x0a    flags: \
-Qt.Dialog\x0d\x0a\x0d\x0a   \
- title: qsTr(\x22Ar\
-temis - Download\
-er\x22)\x0d\x0a\x0d\x0a    sign\
-al abortRequeste\
-d()\x0d\x0a\x0d\x0a    onClo\
-sing: {\x0d\x0a       \
- abortRequested(\
-)\x0d\x0a    }\x0d\x0a\x0d\x0a    \
-function updateP\
-rogressBar(bytes\
-Received, bytesT\
-otal) {\x0d\x0a       \
- progressBar.ind\
-eterminate = fal\
-se\x0d\x0a        prog\
+eight\x0a    minimu\
+mWidth: width\x0a\x0a \
+   modality: Qt.\
+ApplicationModal\
+\x0a    flags: Qt.D\
+ialog\x0a\x0a    title\
+: qsTr(\x22Artemis \
+- Downloader\x22)\x0a\x0a\
+    signal abort\
+Requested()\x0a\x0a   \
+ onClosing: {\x0a  \
+      abortReque\
+sted()\x0a    }\x0a\x0a  \
+  function updat\
+eProgressBar(byt\
+esReceived, byte\
+sTotal) {\x0a      \
+  progressBar.in\
+determinate = fa\
+lse\x0a        prog\
 ressBar.value = \
-bytesReceived\x0d\x0a \
-       progressB\
-ar.to = bytesTot\
-al\x0d\x0a    }\x0d\x0a\x0d\x0a   \
- function setInd\
-eterminateBar() \
-{\x0d\x0a        progr\
-essBar.indetermi\
-nate = true\x0d\x0a   \
- }\x0d\x0a\x0d\x0a    functi\
-on updateStatus(\
-arg) {\x0d\x0a        \
-progressLabel.te\
-xt = arg\x0d\x0a    }\x0d\
-\x0a\x0d\x0a    Page {\x0d\x0a \
-       id: page\x0d\
-\x0a        anchors\
-.fill: parent\x0d\x0a\x0d\
+bytesReceived\x0a  \
+      progressBa\
+r.to = bytesTota\
+l\x0a    }\x0a\x0a    fun\
+ction setIndeter\
+minateBar() {\x0a  \
+      progressBa\
+r.indeterminate \
+= true\x0a    }\x0a\x0a  \
+  function updat\
+eStatus(arg) {\x0a \
+       progressL\
+abel.text = arg\x0a\
+    }\x0a\x0a    Page \
+{\x0a        id: pa\
+ge\x0a        ancho\
+rs.fill: parent\x0a\
 \x0a        ColumnL\
-ayout {\x0d\x0a       \
-     id: columnL\
-ayout\x0d\x0a         \
-   anchors.fill:\
- parent\x0d\x0a       \
-     anchors.mar\
-gins: 10\x0d\x0a\x0d\x0a    \
-        Label {\x0d\
-\x0a               \
- text: qsTr(\x22Dow\
-nloading in prog\
-ress...\x22)\x0d\x0a     \
-           Layou\
-t.alignment: Qt.\
-AlignHCenter | Q\
-t.AlignVCenter\x0d\x0a\
-            }\x0d\x0a\x0d\
-\x0a            Pro\
-gressBar {\x0d\x0a    \
-            id: \
-progressBar\x0d\x0a   \
-             Lay\
-out.rightMargin:\
- 20\x0d\x0a           \
-     Layout.left\
-Margin: 20\x0d\x0a    \
-            Layo\
-ut.fillWidth: tr\
-ue\x0d\x0a            \
-    indeterminat\
-e: false\x0d\x0a      \
-          value:\
- 0\x0d\x0a            \
-    to: 0\x0d\x0a     \
-       }\x0d\x0a\x0d\x0a    \
-        Label {\x0d\
-\x0a               \
- id: progressLab\
-el\x0d\x0a            \
+ayout {\x0a        \
+    id: columnLa\
+yout\x0a           \
+ anchors.fill: p\
+arent\x0a          \
+  anchors.margin\
+s: 10\x0a\x0a         \
+   Label {\x0a     \
+           text:\
+ qsTr(\x22Downloadi\
+ng in progress..\
+.\x22)\x0a            \
     Layout.align\
 ment: Qt.AlignHC\
 enter | Qt.Align\
-VCenter\x0d\x0a       \
-     }\x0d\x0a\x0d\x0a      \
-      Button {\x0d\x0a\
-                \
-Layout.alignment\
-: Qt.AlignHCente\
-r | Qt.AlignBott\
-om\x0d\x0a            \
-    text: qsTr(\x22\
-Abort\x22)\x0d\x0a       \
-         icon.so\
-urce: \x22qrc:/data\
-/images/icons/ab\
-ort.svg\x22\x0d\x0a      \
-          displa\
-y: AbstractButto\
-n.TextBesideIcon\
-\x0d\x0a              \
-  flat: true\x0d\x0a  \
-              on\
-Clicked: { abort\
-Requested() }\x0d\x0a \
-           }\x0d\x0a  \
-      }\x0d\x0a    }\x0d\x0a\
-}\x0d\x0a\
-\x00\x00\x05\xb1\
+VCenter\x0a        \
+    }\x0a\x0a         \
+   ProgressBar {\
+\x0a               \
+ id: progressBar\
+\x0a               \
+ Layout.rightMar\
+gin: 20\x0a        \
+        Layout.l\
+eftMargin: 20\x0a  \
+              La\
+yout.fillWidth: \
+true\x0a           \
+     indetermina\
+te: false\x0a      \
+          value:\
+ 0\x0a             \
+   to: 0\x0a       \
+     }\x0a\x0a        \
+    Label {\x0a    \
+            id: \
+progressLabel\x0a  \
+              La\
+yout.alignment: \
+Qt.AlignHCenter \
+| Qt.AlignVCente\
+r\x0a            }\x0a\
+\x0a            But\
+ton {\x0a          \
+      Layout.ali\
+gnment: Qt.Align\
+HCenter | Qt.Ali\
+gnBottom\x0a       \
+         text: q\
+sTr(\x22Abort\x22)\x0a   \
+             ico\
+n.source: \x22qrc:/\
+data/images/icon\
+s/abort.svg\x22\x0a   \
+             dis\
+play: AbstractBu\
+tton.TextBesideI\
+con\x0a            \
+    flat: true\x0a \
+               o\
+nClicked: { abor\
+tRequested() }\x0a \
+           }\x0a   \
+     }\x0a    }\x0a}\x0a\
+\x00\x00\x05\x80\
 i\
-mport QtQuick\x0d\x0ai\
-mport QtQuick.La\
-youts\x0d\x0aimport Qt\
-Quick.Controls\x0d\x0a\
-import QtQuick.W\
-indow\x0d\x0aimport Qt\
-Quick.Controls.M\
-aterial\x0d\x0a\x0d\x0a\x0d\x0aDia\
-log {\x0d\x0a    x: (p\
-arent.width - wi\
-dth) / 2\x0d\x0a    y:\
- (parent.height \
-- height) / 2\x0d\x0a\x0d\
-\x0a    property in\
-t currentYear: n\
-ew Date().getFul\
-lYear()\x0d\x0a\x0d\x0a    m\
-odal: true\x0d\x0a\x0d\x0a  \
-  RowLayout {\x0d\x0a \
+mport QtQuick\x0aim\
+port QtQuick.Lay\
+outs\x0aimport QtQu\
+ick.Controls\x0aimp\
+ort QtQuick.Wind\
+ow\x0aimport QtQuic\
+k.Controls.Mater\
+ial\x0a\x0a\x0aDialog {\x0a \
+   x: (parent.wi\
+dth - width) / 2\
+\x0a    y: (parent.\
+height - height)\
+ / 2\x0a\x0a    proper\
+ty int currentYe\
+ar: new Date().g\
+etFullYear()\x0a\x0a  \
+  modal: true\x0a\x0a \
+   RowLayout {\x0a \
        Layout.fi\
-llWidth: true\x0d\x0a\x0d\
-\x0a        spacing\
-: 10\x0d\x0a\x0d\x0a        \
-Image {\x0d\x0a       \
-     Layout.alig\
-nment: Qt.AlignC\
-enter\x0d\x0a\x0d\x0a       \
-     sourceSize.\
-height: 80\x0d\x0a    \
-        sourceSi\
-ze.width: 80\x0d\x0a  \
-          source\
-: \x22qrc:///data/i\
-mages/artemis_ic\
-on.svg\x22\x0d\x0a       \
- }\x0d\x0a\x0d\x0a        La\
-bel {\x0d\x0a         \
-   text: \x22<style\
->a { color: \x22 + \
-Material.accent \
-+ \x22; }</style>\x22 \
-+\x0d\x0a             \
-       \x22<p><b>Ar\
-temis</a> \x22 + AP\
-PLICATION_VERSIO\
-N + \x22</b></p>\x22 +\
-\x0d\x0a              \
-      \x22<p>\x22 + \x22<\
-a href=\x5c\x22https:/\
-/github.com/Ares\
-Valley/Artemis\x5c\x22\
->ARTEMIS</a> \x22 +\
-\x0d\x0a              \
+llWidth: true\x0a\x0a \
+       spacing: \
+10\x0a\x0a        Imag\
+e {\x0a            \
+Layout.alignment\
+: Qt.AlignCenter\
+\x0a\x0a            so\
+urceSize.height:\
+ 80\x0a            \
+sourceSize.width\
+: 80\x0a           \
+ source: \x22qrc://\
+/data/images/art\
+emis_icon.svg\x22\x0a \
+       }\x0a\x0a      \
+  Label {\x0a      \
+      text: \x22<st\
+yle>a { color: \x22\
+ + Material.acce\
+nt + \x22; }</style\
+>\x22 +\x0a           \
+         \x22<p><b>\
+Artemis</a> \x22 + \
+APPLICATION_VERS\
+ION + \x22</b></p>\x22\
+ +\x0a             \
+       \x22<p>\x22 + \x22\
+<a href=\x5c\x22https:\
+//github.com/Are\
+sValley/Artemis\x5c\
+\x22>ARTEMIS</a> \x22 \
++\x0a              \
       qsTr(\x22- Th\
 e Radio Signals \
 Recognition Manu\
 al\x22) + \x22<br/>\x22 +\
-\x0d\x0a              \
-      \x22Powered B\
-y Python \x22 + PYT\
-HON_VERSION + \x22 \
-& Qt \x22 + QT_VERS\
-ION + \x22</p>\x22 +\x0d\x0a\
-                \
-    \x22<p>Copyrigh\
-t (c) 2014-\x22 + c\
-urrentYear + \x22 <\
-a href=\x5c\x22https:/\
-/aresvalley.com\x5c\
-\x22>\x22 + qsTr(\x22Ares\
-Valley\x22) +\x0d\x0a    \
-                \
-\x22</a> GPLv3 Lice\
-nse</p>\x22\x0d\x0a\x0d\x0a    \
-        Layout.f\
-illWidth: true\x0d\x0a\
-            Layo\
-ut.minimumWidth:\
- 200\x0d\x0a\x0d\x0a        \
-    textFormat: \
-Text.RichText\x0d\x0a \
-           wrapM\
-ode: Text.WordWr\
-ap\x0d\x0a\x0d\x0a          \
-  onLinkActivate\
-d: (link) => {\x0d\x0a\
+\x0a               \
+     \x22Powered By\
+ Python \x22 + PYTH\
+ON_VERSION + \x22 &\
+ Qt \x22 + QT_VERSI\
+ON + \x22</p>\x22 +\x0a  \
                 \
-Qt.openUrlExtern\
-ally(link)\x0d\x0a    \
-        }\x0d\x0a     \
-   }\x0d\x0a    }\x0d\x0a}\x0d\x0a\
-\
-\x00\x00\x02\xff\
-\x00\
-\x00 \xfex\xda\xed\x9aAo\x9b0\x14\xc7\xef\x91\xf2\
-\x1d\xacL\xaa\x1aic\xa4\xddv@\xeb\xa4\xb5\xea\x96\
-I\xcd\xa1\xa3\xc9\xce.1\x895\x07g\xc6Y\xa7V\
-\xf9\xee\xb3!\x100Nd\x1c\xc6eX9\x80y\xcf\
-?\xfb\xfd\xed\x87\xb1\x82Wk\xca8\xb8\xe7\xf7\x1b\x1c\
-\xfc\xec\xf7p\xe9\xde\xf9\x81\xa39}\xaaT\xdf\xd0\x88\
-3J\xe2\x83\x0f\x9c\x09\xe4\x88aH\xfa\xbd~\xef\x1b\
-G+\xf0\xd2\xef\x01Q\x9e\xf0\x9c/=\xf0\xceu\xd3\
-\xfb%\xc2\x8b%\xf7\xc0\x85+-eM\xb8\x89\x02\x8e\
-i\x04b\xc4\xafa4\xbf\x86\xec\x9c\xd0\xf05\xd8\xac\
-\xc3a\xd6\x8c,\x0c\x15,\x86\x99\xbb,8\x04\xd2\x05\
-|\x04\x97n\xc9E\x96\x18\x11\x14p\xca\x1c\x18\x05K\
-\xcab\x87\xa0\x90\x83+\xd1\x5c\xc0a\xb4 \xe8\xf6\xee\
-KR\xb7w\xdb\x02Db\x947\xfb\xe9J\xb4\x0b\xce\
-\xce@\xc6\xb0\x80\xf8F\x902\xc5\x0235\xc3(\x1c\
-\x0b\xd0\xcc\x10\xa4\x92,P\xa6\xa4\x0a\xca\x8251e\
-Ua\x16\xb4\xb11M\x83\xb3\x11\xad\x06PG\xb4\x99\
-\x90u\x90Z\xa6\xcdb\xab\x05\xd5Sm\x12I\x15\xab\
-f)\x91\xd3\x0c\xb3\x14\x93yRMSI\xa5vT\
-\xb2\xe1<Oe\x14\x1b\x8co\x86)sl@SC\
-\x90B\xb2A\xcdLQ*\xcb\x06f\xcc\xaa\xc0lh\
-\x13cZ\x15g\xc3\x1b\x9b\xf34@+\xf1\xea u\
-L\xab\xc9Y\x0b\xaa\xa5Z-\xbezX=\xd7*\xb9\
-h\xc0\xe9\xe5\xb6\xb2O+\xef\xc3\x8a\xacC\x192\x10\
-\xbbD\x88#\xc4\x94\xf4x\xb0_:\x87\xbc#\xdf\xb3\
-N\x17\xd1x\xee\xed\xbd\x0a{F8\xc7\x9b\xd8\x03\xa3\
-\xcb}]\x06\x0b1!\x1eXC\x86\xa2B\x9f\x16\xd2\
-E\xd4x\xe0\xeb\xeeJ\x8d&e\xb2\x16\xcaX\xec\x8d\
-\x9c\xb1\xa8~\x96\x1d e\xeb\xcc\xc0\xe7t\xad\xb6$\
-\xcb\x9a\xc68m\xca\xad>\x0c(\xa1\xcc\x03\x83W#\
-\x98J;(\xdbl\xadY\xce\xfb#\xb4\x8b\x0f\xcd\xd2\
-F'\x8d\xac\xf4\x12\xd5\x8a\x9fM\x80\xe2\xbb\xb2\xfct\
-\xf7\x19\x92\x8a\xed$woGJ\xb7\x8a\x9367-\
-O\xd8\xa2\x19K?d\x8e\xec\xf0\xd5\xef\x1d\xed\xf8]\
-7L\x8a2\xfe;\xf8\x88\x88.\xaa\x1c\xfd\x11\xcd\xfd\
-\x8a\x1f\xd8\xf9@\x0cs0\xac\x9a\x84b\x1a:\x8f\x94\
-\x88\x88p\xb6AU\x83\xe3+ \xefz>\xa3?\x13\
-\xbc\x88V\xc9\xa2x\x10x'\xb9\x1f\xdf\x88\x8a\xe2Z\
-\xcb\xcao\xc48\x0e\x0ex\xcdt^\xa7\x89\xed\x9f\x22\
-\xb6\xaa\xe2\xb4}\x15\xfdN\xc54\xf0\xcd\xa98k_\
-\xc5i\xa7b\x1a\xf8\xe6Tl_\xc4Y'b\x12\xf7\
-\xe64\x9c\xb4\xaea'a\x12\xf6\xe6$\x1c\xb7.\xe1\
-\xa4\x93P\x86\xbd\xc1\xf7a\xfb\x1a\x8e;\x0d\x93\xb87\
-\xb85m_\xc4Y\xa7b\x1a\xf8\xe6T\xf4\xdbWq\
-\xda\xa9\x98\x06\xbe9\x15o\xdbW\xd1\xefTL\x03\x7f\
-\xb2\x8a;[\xe5\xbc\xf3\xdf\x9f\xd6\xfc\xcf\x02fG\xbd\
-\xb5\xe2\x9d\xfd\xa9\xc0\x81AP\x19t~\xb4\xab\xf8>\
-{\xe0\xcdHw\x8c-~\x7f\x01K`a9\
-\x00\x00\x02\xbf\
-\x00\
-\x00\x199x\xda\xed\x98]o\x9b0\x14\x86\xef'\xed\
-?X\xd9M\xbb\x0bd \x09\x04)\x17U\x8a\xd6H\
-\xf9P\x08M\xb7K>Lb\xd5\xc1\x198[\xda\xa9\
-\xff}\x90\xb4\x0d`\x93\x84L\x9aR\x09'\x17`\xbf\
-\xe7\xe5\xc0s\xcc\x87\xf1rE#\x06&l\xb2\xc6\xde\
-\xe3\xe7O8\xb7/=\xe0\xd0\xa7\xbf\xb9\xee\x1e\x0dY\
-DI\x5c: \x0d\x1d\x86\x22\xec\x10N1p\x9e\xe8\
-\x9a%\x91\xe9\xaf\xcf\xd0\x12\xfcI\xb7@\xd2\x82u\xe8\
-1LC\x10#6\xc0\xf3\x05\x8b\xaf\x1e\xfb\xa1\x8f6\
-\xd7\xa9\x06\xbc\xb6\x08\xed\x87\xaf\xf7\xdd8\x00\xafj\xd0\
-\xedv\x01\xcc\xc5\xec\xe2<\x06%\x8f\x12\x1a\x81.h\
-|i\xa9\x1d7\x08\x1a{\xd1\x0b@$FE#Y\
-h$g\x8c\xa0\xe7\x05M\xf5\xa8\x91\x224R\xaa\x1b\
-\xa9B#5c\x14@\x04!<j\xd4\x14\x1a5\xab\
-\x1b\xb5\x84F\xad\xacQ\xe0j'\x18\xb5\x85F\xed\x9c\
-\x91\xe6\x9e`\xa4\x09\x8d\xb4\x8c\x11\xd2\xe1)\xa7\xa6\x0b\
-\x8d\xf4\xeaF\x1d\xa1Q\xe7\xa0\xd1n\xf3\x85\x9b\x1f\xb9\
-)\x90\x9f\x1b\xf9\x1aW\xdc\xa6\xafek\x9c\xab]\xad\
-\xad+jA\xa0\x1c\x13dkM\xebhJ.\xebb\
-\x0d\x09\x05\xd9\xda\xd0\xe5V\xc0\x09\xda9AS\xe6\x04\
-Y\x96Z\x0b\xaa\x9c@?&\xe8\x94\x09\xde/x\x8f\
-\x92\xf52\xdc\xdd\xb1\xb2\x97\xd9\x09\xbd\x05\x8db)\xc0\
-\x84\x18`\xe5D(d\xfb\xd1x\xe5x8\x9c\x1b\x00\
-\xbe\xf9\xa4\xcdJ\x8e\xe8\x84s\x82\x8ae\x80}c\x97\
-N\xbe{\x9b\x9b!\xca=m\xbb\x9c\xb6\x09<`\x9f\
--\x0c\xc0\xa25*\xd5\xdc\xa1\xb4XD\x22\x8f\xe0\x95\
-\xa8\x9f\xd1\xd5\x00\x05\xccr|\xbc\x8e\x0d Cn\xd8\
-J-\xcb\xc6\x07\x8e\x8bH\xf1L\xb7\x81h\x93\xe4\xf1\
-3\xb6\xa3\xab\x86\xf9\xdd\xb6\xcc\xa1\x09\xa6\xf6\xd8\x1a6\
-\xaey\xf1\xe1\xeb\xfc\xd6\x12\x09~N\x9e;\x0e\xb9!\
-x\x1e.\x13\x91\x01\xec\xe48\xd2v\xff\xae\x97t\xa0\
-\x88\x8f\xfb\x85\x22\x86\xbd\x92\xa8YYT\x90\x1cIr\
-)\xf1EW\xed]\xb0\xc2\x1bD\xa6\xf8\x19\xbd\xa5-\
--\xb6\x08\xbeBI\xcd\x87\xbc\xe4\xe6{\x85z\xd1/\
-\xaa^N\x02>5g\xa6U\xf3>\x8f\xb7\xf6\x01y\
-\xdb\xd6x\xf4\xad\xe6}\x16\xefv\x09o\xeeix9\
-\xbc\x87\xe3[\xd3\xba\xb1\xeb\x19~\x1e\xf1V)\xf1\xc2\
-\x0b\xd2\x05\x11\xef\x8f\xc6V\x8d\xfb,\xdc\xcd\xb2\x1bz\
-\xf1\x85\xf9rp\xdf\xf4\xec\xfe\xcc\xacIW$\xad~\
-<\xd2\xf7\xa3\xa9i\xdb\x03\xf3\xb6\x86]\x11\xb6R\x02\
-\x9b\xfb\x92\xbe\x1c\xd8\x93\xfb\xbei\xd7\xa0+\x82\x96?\
-\x1e\xe8\xe4\xf3\xeb\x07\xa8i\x9fC\x1b\x96\xd0\xe6\x96\xd8\
-\xfe\x0bm\x972F\x97\x87Vhv\x8a\x7f_\xa4\xe9\
-\x8f\xea\x87>\xb7\x1e\x9b\xfc\xff\x02j\xe6B\xc4\
-\x00\x00\x05U\
-\x00\
-\x00 ?x\xda\xd5Y\xdfo\xdb6\x10~\x0f\x90\xff\
-\x81\xf0K\x9d\x01\x93\xdd`\x01\x0a\x01\xd9\xe0\xa6\x0f\x0d\
-\xd0\xa0i\x5c4\x0f\xc3P\xd0\x12m\x13\xa1E\x95\xa4\
-\x12{\x9b\xff\xf7\x1dE\xc9\xa2~P\x92\xdd4s\x95\
-\x00\xb6\xc8\x8f\xe4\xdd}\xc7\xe3\xf1LW1\x17\x0a}\
-R\x9f\x12\x1a<\x9c\x9e\xd0\xd2\xbbwO\xa3\x90?\xd5\
-\x9a?\xe0\x0dO\x94\xac\xb5_\xf1H\x09\xce\xdc\x1d\xde\
-\x0dVDP\xcc,\xc4M\xc2\x14]\x91\x90\xe2\xd3\x13\
-\xfdw\xad\xc8\x0a\xfdsz\x82\xe0y\xa2\xa1Z\xfa\xe8\
-|<6\xefKB\x17K\xe5\xa37c\x8d\xd4-\xb1\
-\xe01\x11j\x83f\x9c3\xc48\x8f}4\xc7L\x92\
-\x1c0O\xa2@Q\x1eA\x1f\x0e\xa7<\x89\xc2!N\
-B\xca\xbf\xc6X-\xcf\xf2\x85\xd2\xa9\x18\xde\x10\xe1I\
-\xc5\xe3\xe1Y\xbd\x99'\x22 \xe8\x12\x15\xa3\x0b\xcc,\
-Q\x8aG\xb7\x80\xf4h\xc0#/\xe0\x8c\x0b\xc0\xe6\xea\
-z8\x08H\xa4\x1a\x07\x90\x08\xcf\x18\x09\x01\xadDB\
-\xaa\x90\x0f\xa0Q#d[SP\x0bj\x14,\xa9\xd5\
-)\xdb\x9c\x0b\xb2\x10z`m\x10N$\xd9K\xa3)\
-\x18\xef{L\x90Q\xd7$F\xbb\x9d\xd2\x85\x0f4e\
-\xca2\x97T[q\xcah\x08l\x17\xb0\x9c~B\x1e\
-tS\xcd/\xf4G\xee.\x0d\x9ch\xd1\x0f!\xc5a\
-\xad\x16BZh\xecv\xb3\xaa\x89+<\xe4\xbaj\x94\
-[Y\xbds\xfeo][\x1c\xd0=(\xf5\x8c\x97\xb7\
-j\xa3\xe76b*\xae[\xc1\xe8\xa8\xe7\xe4\xcc\x0eg\
-u\xca\x04\x91D\xdd\xa6\xc8\xe1!\xc1\xf0\xd5\xab.1\
-~P\xf89B\x0f\xe8\x15\xbb~\x90\x0b8\xc3\x97\x85\
-\xdb\xb1oNu\x9bm\x1a\xfa\xe6\x5c\x9b\x12\xa5h\xb4\
-\xc8\xcf\xfd\x02\x91\x9d\xc4\xbf]\x8c\x8b\xb6\xfc4~}\
-1\xb6\xa1+\xbc\xa6\xabd\xf5>\xeb5\xa8Z\xf7\xbd\
-\x990\x9d\xb74\x9aF\xad\xa3M\xb7s4\x0f1\xa3\
-j\xe3Cb\xe1M\xe2\x98\xd1\x00k\xbb\xdc\xe8\xf6\x02\
-6gx!S\xcc;\xa0\x98/\xec)\x14U\x8c\xf8\
-\xe8\x9b\xfc,\x86\x83\x89\x80l\x84J\xf4+\x9ah\xf3\
- \xb3UPf&98\xb3G^q\xc8i\x22\x08\
-e\x1e\x8f\xf4wF\x14\x01\xc3Zv\xd6\xcf\x1aX\x99\
-\x06\x82\x90\xc8K\xc5G#t\x0e\xf3\xef\xbe\x97\xd1\x9b\
-\x02mL\x91\xc1\x8b\x97\x02\xbf\xb5\x85\xb9\xc5\x0bR]\
-\x1aG\xc1\x92\x0b\xe9\xcd)c>\x9cM\x22\x0d\xbbe\
-\xcc\x15g\xc9*2\x19^u\xbc{\x0e\x17Jh)\
-o\xb0X\xd0\x08\xfcd\xec\x0622\xef\x85\x9bq\xd8\
-\x0c\xab>H\xd8S6\xac\x0e\xbc\xe3On5\xf5c\
-zSM3\x7f3A\xde\x85\x9e\x11\xe6\x9a*u,\
-\xb2\x06\x87\x1e\x18G\xfa\x98\xa88Q\x037z\x0e)\
-\xb3\x17\xd35aS\xfa7\xf8\xe3\xebs76`4\
-\xf6+'P_e\x9a\xb0[\x97\x8e\xe0\xd53\xfe\x96\
-\xaf\xdb\xd4\xdc\xc5\x12\xa3b>\xa4S\xb2X\x909\x11\
-\x82\x84\xf7\x95\xa4\xbf\xe9\x81}N\xc0\xfd\xd2k\xc3;\
-\xf2H\x03\x22=kQ\xd9\xce\xc2\x1d\xd7;|\x10\x12\
-\x19\x08\x1a\xeb\xf8\xd0B\x04\xec\xe5Dh/\xbf\x8eB\
-\xb2\xbeZ\xe2h\xd1\xb0\xabk^X\x08\xe3\x85\xa9\x80\
-\xb0\x91\x9d\xe2\xfe\x19XK\xfc\xe5\x9ey\xeb\xe4\xab\x17\
-\x85\x07{\xfc\xf7\xf8\xfb\x17\x1dP\xc8\xf1zzS\xb3\
-9F\xbb\xbc\xfc1\xd5\xcc`\xfb\xbbw~\xb2\x9d\x8f\
-\x9fwK<b\x96\x80\xf5\xc6\xde\xc5O\xe8$wD\
-g\x96h\xa8\xb3\x9c\xb3\x9f\xcbW\xeetj\xf86\xcd\
-\xd1\xba\x1c\xa6\xc8\xe4Zp\xbb$\xd4o\xcfA\x1b\x07\
-\x9a\xc4\x1c\x0c\xfaM\x04\xfe(\xc4\x0a\x8f\xe8\x0a2\x01\
-9\xd2\xddrd\xf2\xf7\xaf:U\xf7\xe4\xe3\xa2\xc5\xd2\
-!\x95\x1a\xec\xa3\xc9L*\x81\x03eT\xf4\xaea\x9e\
-\x8f\x11\xdb\xb8Gf\xc9\xa7_\xcdQk\x5c2\xac\xba\
-\xf8\x81\xe0\x0b)\xdcC\x8f\x80K\xe7h\xa8\xd5:\xeb\
-\x02\xba\xaf*\xdd\x94t\xdd\x0b\x1a\xdd\x06\x11Xe\x0f\
-\xa9\xda-\xd2.T\xf5*\xbd\x87\x1f?\xc3\xf9b\x97\
-\xeeZvZ\x1e\x01\x9b\x15\xad,\xb6-\xe5\xb7\xa5\xa5\
-]\xa9j{\x8a*c\x1c@\xee\x0e\x91\xb2hs\xc6\
-\xbc&\xb0\xa5\x0d\xdc5\x16\xd1\x0a\xa67\xf7\x0d\xfd\xf6\
-\xfe\x0a^\xe1\xec\xf8w\xd7\xf2\xc5\xb4T\x0d\xd6\x117\
-\x8ax\xa1\xef\x1c\x0d\xfd\xfb\xc6\x89}\xe2\x83\xfep\xc4\
-\x87\xfd\xe3BW<h\x8b\x03\xd6\xfe\xb7\xca\x9b5\x0f\
-)7\xb8\xdc\xb0O\xb0\xdf\x1eN\x93\xbe\xe9\xbf4O\
-iu\xe1\xd8\x88\xb2j\x9eG\xc9\x94.\xb7\xbc0Q\
-\xba\x8evl<Y\xe5\xda\xe3\xa4)+\xb2\xbc\x14U\
-2[\xef\xf9yj\xa6\xa2'M\x8e\xf3\xb4^\xae\xf3\
-\xe4\x92?U\xb9\xec<Q{\x1c\x82\xee\xdb\x90&\xab\
-\x5czt:I\xaf\xfb\xcf\xceb\xce_]*\xb7\x9d\
-\x0c\x17&\x22-\xf3\xa1\xdf\xd1\x18\xfd\xb1\xfb\xb9\x22\x93\
-\x0c\x8dj\xb8\xda\x81\xbe\xcfe@\x97\x13\x1f[\xa8\xa9\
-.\x7fY[\xfe\x97j\xc16\x7f=\x98\xbc\x1b]Z\
-\xc8\xaa\x93\x15\xb1\xe8\xce\x9e\x95j`Q\x80(Ul\
-\xca(\x93\x7f\xccp\xf00U\xb0\xd5\xda\xea\x1f:\x05\
-\xb7~\x15\xdb\x8dA\x97\x97\x97\xb6\x80\x9e\x0e\xc01\x09\
-\xd3Ng\xbe\xde+\xa1w&\x05\xfd\xb3og\x18l\
-\xcf~\xfb\x902)\x8c\xdaD\x8a\xd3\xe6\xa6`T)\
-o\x85d\x8e\x13\xa6&\xaeA\xa6\x1aQ\xaeJx\xe9\
-6is\x99l\xf6&\xf1\xec\xd5\x9b\x92p\xf8\xff\x0f\
-EH3;\
-\x00\x00\x02|\
-\x00\
-\x00\x10'x\xda\xed\x97[o\xda0\x18\x86\xef'\xed\
-?XL\xaa\xca\xa4E\xce\x89\xd0h\x9d\x84h\xb4\x22\
-A\x11!\xa5\xd798`\xcd\xc4Y\xe2t\xac\x13\xff\
-}\x09\xe1\x10\xe7PV&U\x5c`\xb8\x88\xed\xd7o\
->\xfb\xf9\x9c8x\x19\xd2\x88\x81\x09\x9b$\xd8\xfd\xf1\
-\xf1\x03\xe6\xea\xc2\x13\x0e<\xfa\xab\xd2\xdc\xa7\x01\x8b(\
-\x89\x1b;\x84\x91\xcdP\x84mRQ\x0c\xed\xdf4a\
-\xe9\xc8\xec7`h\x09\xfedW -~\x12\xb8\x0c\
-\xd3\x00\xc4\x88\x0d\xf1|\xc1\xe2k{\x10xh\xd5\xce\
-4`[\x22t\xe8n\x1f\x9a\xb1\x0f\xb6j\xf0\xed\x16\
-@pu\x05\xb6\xd5\xaf\xa0\xcb\x19\xe4&.\x83\x82K\
-\x09\x8d\xc0-h}R\xe5\x1b\xc7\xf7[\x07\xd1\x1a \
-\x12\xa3\x92k\x97s\x15;\xb5\xb6b\xc1\x16\xba\xae\xaf\
-\xc8\xc7l\xc5\x0e\xe7+\xc3Z_\xa9\xe0\xebC\x04!\
-<\xe6+\xf3\xab\xa0\xd6\xfb\xcaE_\xdf\xd1\x8e\xfb\xaa\
-\xbc\xaf\x08\xeb\x8d\x15\xceXs\x8e\x1b79\xa9\x05'\
-\xd4\x85\xa5\xa9\xe7\x97\xebJ\x16q\x89\xc2g\x10\x0f_\
-r\x14O+\xc2\xaf`\xd4:]I.\x09\x8a<\xb4\
-\x1bM\xe2\x82*/lWT\xfd\x8a@\xe1\x04\x8aX\
-\x11\x14\xe7\xad\xa9P\xde\x0b\xf6\x93\xedS\x92,\x83|\
-O\x15\xa7h\x07\xee\x82F\xb1\xe0cBt\x10\xda\x11\
-\x0a\xd8\xa17\x0em\x17\x07s\x1d\xc0\x9dOV\xcc\xf4\
-\x8ev0'\xa8\x8c\x00{z\x1e\x0e\xdf\xbc\x89M/\
-\x87\xb6+yL\x9b\x00\x9e\xb0\xc7\x16:`Q\x82\x1a\
-5\xf7(\x03U'r\x09\x0e\xeb\xda\x19\x0d\x87\xc8g\
-\xa6\xed\xe1$\xd6\xd3\xdc\xa9t\x9b\x99eS\xff\xd0v\
-\x10)\xcft3\x10\xad\xd28~\xc6Vt\xdd\x9a\x1a\
-3\xc34\xc0\xd4\x1a\x9b\xa3V\xbb\xaa}}\x99w%\
-\x95\xe0\x97\xf4\xc1h\x93\x1e\xc1\xf3`\x99\x8at`\xa5\
-\xb7\x116\xf5\xfb~\xda\x80\xa2\xea\xb8g\x141\xec6\
-\x8c\x9a5\x8d\xf2\xd3;\x09\x0e%^\xdd\xa2\xed\x05!\
-^!2\xc5/h\x17\xb6\xb0\xd8\x10\xf8\x0c\x05\x89\x1f\
-\xb2\xe6\xb6\xda\x1b\xd2EiH\x97J\xaa\xbfK\xba\xfc\
-\x1bo\xcb\x1c?|\xbf\xf0>\x89\xb7\xdc\xc8\xbb\xf4\xec\
-;\x1f\xde\xa3\xf1\x9da\xf6\xac\xcb\x0e?\x8d\xb8\xd4\xf4\
-B(\xbf\x0e\xcf\x87x\xafo\x0df\xc6\x97\x0b\xefS\
-x\x8b\x0d\xbc+\xe7\xa3\xf3\xe1\xfd\xf805,kh\
-\xdc]`\xbf\x116l\x80]9-\xbf\x0bl\x872\
-F\x97\xaf\x1d\xf8r\xc5\xff\x9f\xf9&\x8f\x03\xc3\xbad\
-K\xe1\xbb*\xfd\xff\x05CN\x09\xae\
-\x00\x00Xg\
+  \x22<p>Copyright \
+(c) 2014-\x22 + cur\
+rentYear + \x22 <a \
+href=\x5c\x22https://a\
+resvalley.com\x5c\x22>\
+\x22 + qsTr(\x22AresVa\
+lley\x22) +\x0a       \
+             \x22</\
+a> GPLv3 License\
+</p>\x22\x0a\x0a         \
+   Layout.fillWi\
+dth: true\x0a      \
+      Layout.min\
+imumWidth: 200\x0a\x0a\
+            text\
+Format: Text.Ric\
+hText\x0a          \
+  wrapMode: Text\
+.WordWrap\x0a\x0a     \
+       onLinkAct\
+ivated: (link) =\
+> {\x0a            \
+    Qt.openUrlEx\
+ternally(link)\x0a \
+           }\x0a   \
+     }\x0a    }\x0a}\x0a\
+\x00\x00\x02\xd9\
+(\
+\xb5/\xfd`\xf9\x1e}\x16\x00\xe6\x95F#\x10S\xf4\
+\xbc7,\x15xB\xb0I\xff\xa7%\x81\xb7\x89\x0bg\
+\xd4\xe2\xde\xb3QD\xe5^\xa4\x1c\xcd\x08\x00\xa0\x0af\
+;\x00<\x00=\x004><SKk\xbf\xa4\x15\xb4\
+\x14\x83m/E\xcd\x92\xa2 l\x93\xfe\xe9\x8e\xdd\xdd\
+\x05\xb2\x13\xfe\x89\xb5fl\xe7\x8f\x0d\xa3f\xf5\xa7\x15\
+\xa2\xa3>\xb41\xd8\xd2\x90]U|\xc5\xbe\xd7i\xd2\
+\x01\xce\x93\xa2\xf6\xa9b\x5c\x03\x9d\xb7\x01\x01\xcb\xd0\xc0\
+\xd4\xe4\x0d\x89\xa0`xF4\xbed_\x86}\x88'\
+\xa3\xbcJ\x92F\xe6\xf5%O\xa6\x94\x83]\xd8\x85z\
+I\xd8%\xd0T\xed\x00T\xa7\x80\xc7\x87'\x9c\x11)\
+ EiK\x01[\x14\x0c\x12XH$.\x00\x91m\
+^g\x95JSu\x9a\xea\xbf\xf9\xe1X\xf4*\xb1-\
+\xa2\xecq\xda6gC\x07\xcb6\xaa\xea'z{\xda\
+\xc2\x99v|Z\xe5b\x5c\x03\x03+d!\xd8\xf6!\
+ed\x8ey\xccs\x9e\x03\x1d\xe8\xa0k\x5c\xd3@\xe8\
+@\xe79\x0f\xca~g\x0eg\x08\xc7.&4\xea\xe9\
+\xc0\x95\xff\xb6g\xd6\x0c\xf6\xb4B\x92HD\xc0/\xa8\
+\x8dm\xef\xc1?\x03\x80\xc2\xa0\xe1\xc9\x92\x91$I*\
+;\x07\x80D\x84\x08\xb7\xe9\x02\x96y\xcf2\x91J$\
+\xdf\xa8\xc0\xf5I\xc0\xcc\x1a0\x95\x96\xdbQ\xcaF$\
+\x89\x16\x9d\x85L2/\xf52\xfdF\xcfO\xbd\x98~\
+\x80\x9e\xd7\x95z\xf1\xf4\x1b:\xbeP/\xa5[\xe8x\
+\xa9\x95\xe96\xd1\xf9Q\xa8\x92\xbe\xa1\xe4\x0bu-\xe5\
+B\xcfK\xbdL\xbf\xd1\xf3S/N\xd3=\x09(\x07\
+\xb8\x08\xd6\x16,j\x99\xb9\x88\xc0\xf1\xf2g\xa8\xfb\xd1\
+\xb5\x8b\x0a\x1c\x16\xa9\xe3\xe3\xc6\x8a/9\xef\xe3\x00(\
+\xa6'\x81tAA>~>);5'\x01\xa5j\
+SN0\xdbV\xa3\x13q0\x81$Z\xec\xfe$\x0e\
+\xa5\x04\xa2\xd0\xefr\xf0O`\x7f\x00\xfd5[\xedT\
+\x1c\x85\xd6v\x5cwf\xf6\x80\xcc6\xf4N\xc1\x80\xdc\
+\x8aE\xe5!m\xb8,\x00\x16k\x03G\xf6\x023G\
+\xb3\x0c\xd9~\xf5\x19j\x90J\x18!\xec*\x90\xd7\x5c\
+L*Bu\xcb\xcf\xf8B\xf2\x80\xc2Lo%\x82s\
+A[\x8e\xd0\x02uh\xb1\x22ew\x91\xb2,\xbc\x97\
+\xbaN\xf9 \xf8\x95\x04\x97\xd3\x0d\xa8]\xa5P\xeaT\
+\x07B{)\xb8?\xc9\x83\x8e\xdc\x98\x13\x9c,\x96\xf9\
+~J\xc6\x92\x5cN\xaddQ\x16\xfbiE\xd6O\xa8\
+:\xa5\xcb\xea\x09\x94\xe3\xac\xcf$\xd3\xb4)L\x81\xb0\
+_^\x92!\x01\x94#\x99\x1c\xf3\xe2\x9fn\xc0\xed\x22\
+\x07l'u \xb4\x97\x85\xa8\xd3\x1c\xb8\xecd\xc0\xfe\
+\x0c\x0f&\xd2^Nn\xf2XR\xfb)9Ka9\
+\xadB\x0c)\xea\xa7\x14\xf9\x93F\x159\x97\x1fi\x93\
+\x88\xca\x88\xc8\x0cJlE^a\xbc~\x87\x92!\xcf\
+9k\xdbE\x890\x83\x092v\xea\xd0\x96b\x84j\
+\x09D\xd3H/2\xfd\x03\
+\x00\x00\x02\x8d\
+(\
+\xb5/\xfd`a\x17\x1d\x14\x00\xc6\x9c\x5c!\x10\xf3\x1c\
+\xfc?\xeay\xa4L\x9c \x8e\xd1\xfd\xee\xec\xef(\xe0\
+J\xc6\xba`K\x94\x1f\x8e\x11\x01\x80\x02@\x05P\x00\
+T\x00P\x00\x01@\x1f\xfa\xcc7\x87R\xfd\xb0\xf6\xe1\
+p\xe8\x1e\xed\xc0OP\x0f:.b\x0e#@\xbf$\
+m\xe3\x1dm\x9c\xed\x878\x1d\xbb\xbb\xa3\x08\xd4\x19\x7f\
+.\x8a\x22\xf4\xd3\xec\xf9\x1a\xf7\xb3\xa7\xff\xe7\x90\xd0\x9b\
+\xcf\xc79\xc1\xc9\x22\xb6\x15)\xc2\x846\x8d|\xa4\xff\
+\xccf\xc6\x06&\xfa\xd8\xcf\xcfl\xed^;J\xe8\x99\
+\xcb\x10\x7f8\x93\xde\x9c0dU\xbd0l\xb2\x0a\xe3\
+5e\x97U+\x85\x19\xb0\x8a\xaa\xa8\xac\x80a\xa2\x05\
+R\x91\xc1\x90e\xb5f\x8ea V(`\xe0x]\
+\x96Uk\xf5:V\x15EU\xd6\x18\x86u\x9a\x1c\xbd\
+\xde!\xc08\x82\x86\xea\x0a^k\x8f=\x83I{\x11\
+\xf7{\x9c?v\x00pt\x10O\xd2\x9bc\xeb<\xcb\
+\x06\x10\x9c\x1e\xaai\xed;\xfe\xd7\xc1\xafQ\x92\xb6\xab\
+Skhj\xc5\xaf\xfb\xd1\x1bf~\xd3\xde\xf0K\xd2\
+:\xc3\xd3\xf3[+_\xb4\x15M\x13\xad_\x12\x7f\x1f\
+z\x17\xd5\xd6Hl\xc3/Q(\x0auw?\xb8L\
+\xfe\xcf`\xedK\xb7Q&o\xe3&\x11J\xb15<\
+o\x93<&\xd5F\xe1\xbc\x04\xc2\xea \x0f\xceqy\
+\x88nS@\x1c\x85\xc5\x03\xd2yX\xb7Q6I\x16\
+\xaa\xa4J(%\xffX\xc9\xf5\x8e5\xc5\x9bA\xe9q\
+\x1e)\xa1\xfd\xd37\xa7?\xf6\x04C\xfa\x8e\x07{\xa0\
+!McP\xd9\x88\x82\xa2\x14\xd2\x1c\xd0\x02\x911\x8d\
+\xd3\x01\x01\xb6o\x95ZD$\xe4\x1c0\x11i\xcdM\
+\x08\xcb\xf8\xd1\x95\x12N-uT\x90pSS\x5c\xda\
+\xb25\x04\xad$\xe0\xaa\xa4B5I\xb7*\x8a@S\
+K\x03\xd0\xaf\x22\xae\xba\x22P\xd5\xd0\x00\xe8\xbfR\x9c\
+\x9a\xe2\xd1\xd3n\x90~\x95\xea\xaa\xa6ne\x1c\xaa\xc9\
+\x87|K\x11\x82 \xcf1\xbc\xfaa>\xbc\xc1\x16\xc2\
+Ayb\x96\xb1n\xec\x1aj\x98\xd1\x89p\x01\x88B\
+/\xbb\xe2\xc7\xe4+\xcb\x92_\x00\x1c\x07F\x92\x9a\xf4\
+4\xd9\x0d\x03\xfb#B\x1a \xb8\x16\x99E/3\x0f\
+Q\xe8 \xe8\xb1Kg\x99\x80*t!CEvx\
+fk\xda\xcdBc\xec\x08\x8f\x0b\xcd\xf8F\xe4\xe2\xd0\
+\xfc\x00\xf9T\xa9\xf0+\xb4\x86Tc\xe0\x8e\xe4\x15\x12\
+Y\x0a\xc2H\xeb\x88\xe8\xe5\xd8\x08\xfd9pL\xdb\xce\
+q\xa0\xf7H\xb4a\x89K\xef\xe8h\xc3\x1e\x07\xe8W\
+F\xd0\xd3Bfa\xbd\xe8\xe7\xf9L\x01\x01n\xd0\x97\
+\xb4\x16)\xa4\xdf\x04O&\xc2\x8b\x9c\xfd\
+\x00\x00\x05+\
+(\
+\xb5/\xfd`.\x1e\x0d)\x00\xe6k~$\x00\x93\xea\
+oUE\x89P\xb9J\x92\xc8L\xc8E\x03\x85\x99\x89\
+*\xffG^\xaag\x9eew\x8a\xe2\xfd\xff_\x95~\
+!q\x00r\x00s\x00\xdeXA<\xff\x9f\x19\xa5\xe8\
+\xb68]\x12\x81\xfeR\xc5\xe5\xb0\x96h\x9eA\x0cg\
+7Y\xc4\xbd\xe9\x18\xc7\xbc\xf59\x7f{3Z\xd9,\
+\xd2\x05\xdd[\xdb=\xa3\x9c\x8f\x0b=\xc2\x07:\xd0\xf5\
+\x1a\x89W\x03A\x04\xba4\xef\x98CU\xf5\xf1\xd0i\
+\xbf\xe1y\x1e\xc6n'\xfe\x9e\x97f\x1c\xf7\xd9E\xb5\
+\xc7\x7fn\x91?\x9d\xc3\x1c8\xdc=\xaePOF\xe3\
+\x19\xf1\x11\xfa\xd1\xe1\xc4\x01J\xd1\xcdr\xfb\xdb\xcf\xd5\
+\xbf}\x0e'\xb7H R\xb5\xa2\x02*y\xda\x8f\x15\
+H$NH\x0d]\xdb\xcf/y3^\x90\x12\xeb\xe8\
+\xc2\x1a7\x84\x15\xf5\x11\xba8\xcf\xcd\x9c?\xae`\x98\
+\xe6\xc4\x1b6A\x06\x03\x06\x05\xd2\xe3\xff\xc5,\xc7\x00\
+\x00\x11\x88_\xb91c7\xae\xe3\xc6\xb0t\xe8\x8fY\
+9Y\x946z\xd4\x81\xee\x0e;\xe3\xbb\xed\x0c{\xfb\
+o[cJ)\x1a\xbd\xbd\xa9\x17\x16\x14uJzL\
+c\xd9\xac{\x0d\xff6\xc6iy\xfe\x9c\x1frlr\
+\x1dD\xd7\xb6KH%\xb7\xf1\xc6.\xe8\xea\xadp\x1b\
+\xe3F\x1b\xe1\xc6\x15<\xd3\x81\xdc\x8d`@\xd7v0\
+\xa6w\xc3\xd0#\xc8O\xf8\xf3\x01\xa2\xeb7\xfb\xbd\x19\
+\x0e\x97\x80\xfe\x93\xff{&\xda\x86\x06t=\x96\x22\xbb\
+\xc47\xcd\xfe\xb7\x91A]\xdd\x1c)\x19]\xd3\x1e[\
+\x89ApT@\x09t\xa2\xea\xed\xc6\x86\x09OGU\
+\xbe'\x8b\xd6U\xdcBE\xa1Pt\x9f=&\xa3\xb1\
+\xcc\xe2K\x00ec\x92\xa0\x90\x22(\x8b\xd3I\x22\x1c\
+\xae\x91Jv\x1e\x8a\x0f\x8d\xfbo-\x0c\xffvz\x12\
+7{ ]\xd2\xe3\xc6\xa0\x5c\xd9\xab\x9d\x8eh\xc4\x19\
+\x8d\xfbYs\xfa=<o\x0d\xea\x1b\x8b/3\x15]\
+\x92\x9d\xb4!\x1bc\x22'r%6\xf1\x84=s\x93\
+\xd5\xa2\xc6R\x90\x90Dt%\x0c\x14\xa4kg\xb3\x8d\
+\x8d\xa5\xe8\x5c\xb4\x81S\xa8!\x9e\x99\x91\x19\x11\x91$\
+I\x0a\x1dA\x08\x82(\x9a\x92\x96\xdd\x1d\x22x Q\
+1\x10J1\x08\xc3\x80\x90\x80H!\x12`C\x82\x09\
+Fd$\x10\x91\x92\xa4\x1d$\x1b\x92/\x80\xe3D\xd7\
+[\xc4\xf3\x115\x9c\x02\x0a\x19\xe0\xc1z\x0f\xd1$j\
+E\xa3\x145\xfe\xecb\xa2\x0a\x8ay\x15\x0d\xc7\x8c\x82\
+l\xa0\xfa\x05\x91\x1b\xa1\xd4\xaa\x0e\xbc\x93\x95\xf3\x05\x9a\
+fC\xb3S\x94\x8c\xca\xea\x83\xf7\x1e\xc0\x8a^\x13\xe0\
+\x15\x81\x1f-\xf9\xa4\x5c\xa0N\xf5O\x96\xfb\x8b\xcc,\
+\xe5Q\xc8L\x03a\xe4_gd\xbb\xech\x11\xec\x96\
+V>G\xeb\x88_\xb3\xebME!\x14\xab\x15Dz\
+\x09\x15+Rx\xd2d\xd2\x90\xa0\x1e\x0d\xd10Tn\
+\x9b]\xbd\xc3b\xb1\x9f\x98\xbf\xb0\xa03'\x12\x91 \
+\xee\x9c\xfdX\x8b\x01*Bo(^\xc2\xc9\x9f\x88'\
+:q\xc1J\x0b\xca\x93C\x1ct>>\xf3\x94c\x0a\
+\xcf\xee\x9a\xe2\xea\xc4\xa8vv\xcbI\xc1D/\xcb\xc1\
+\xac\xa5\x1b\xef\xa1r\xe2?\xea5\xe5\xd3\xb6~\xc8\xeb\
+\xea\xe4\x02\xec\xa3\x02\xf2\xb6\xe8;\x95`\xf3\x1ah\xc9\
+6kl\xa9\xd1!\x1d\x13D7\x82;>\x824\xf6\
+\xc7\xd24\x98\xba\xeeyz+\xc6V\x08\x1e}\x1cQ\
+<\xd8\x0a2-\x0e\x1c\xe7\x8c\x14.\xdb\x84\xdb<\xa4\
+\x11Z\xbeQX\xc2\xbbU\xa0\x13&\xceX>\x82\x06\
+\xbe\xf7\xd4*[I\xf9\x1aW\x9cg\xff\xd0hEE\
+\x80\xdf\x918\xf2\xb7b\x94\x95\x07\x7fR\xd8l\x17/\
+\xfcz\xc9\xff\xac\xf3}\x04\x18!\x8f\xd1\xa0\x9c\xf62\
+v\x12_\xb7Jf\xc9\x99BL\x1f\xfe\xd5\x89DC\
+\xd0\xdc&\x85\xe1Z)P\x07\x1a\xed\xa9\x91\xe5\xd9\xe3\
+(\xbf\xfa\xc3\xda]\xe1\x13NzI\xb6\xfa\xd5\x10a\
+d\xd0\x0b\x5c\xed\x82_\xa9\x0dr\xd8D\x09\x07\xbf\xc4\
+pHCC\x09\x81%{7\xca\x94 \x7f\xfe%^\
+\xecA\xc3<z\x95\xbf3\xb2\x8f\xab\x0d\xa6\xb1j\xff\
+f\x95\xf0\xd5\xc6\xdf\x99\x1d\x0c\x96\xcb\x05J\xaf\x0e\xd5\
+&%\xdd\x16\xe8\x02\x86\xe9}\xe3\xd3\xc8\xb8\x84\xbeh\
+\xd8d\xb9|\x985\xb0Y\xd61\xe8\xca\xef\xd4\xdea\
+\xe8\x97\xca\x1e\x97\xcc!\x0b\x8a,1\x08\x0c*bH\
+\x81\x0bF\xd7\xa0y72\xce\x0ei\x03\x1e1@\xd0\
+\x1f\xab\xe1\xab\xf5O\x90n\xe9\x90\xbbV\xd8\xf2\x8b\xdc\
+\xaf\xe6\x08\x09Dd\x81\x82\xf3\x0f\x94n\xe6'\xb8\xb7\
+\x0e3\x04?\x17R\xf3B_y\xa1\x04\xe2\x87\xb1\x03\
+\xba\xbeiV\xedQ\x9bo\x84M\xdb!\x08D\x80\xa4\
+\x12\x11\x1f\xa3<H\x9eW\x14\x9d0\x17\xed\xc7\xf73\
+q\xf5=\xf3\xe2\xb4\x83\xef~\x0eS\xa8[\xea\xfdV\
+\x04\xe0B\x1as\xd8\xa0\x8cY\x88\x999O\xa5\x0c\x94\
+\xee9\x9c\xf2\xf5\xf9Y\xe4\x19h\x01\xed\x9d\xbd\x7f-\
+5\xb0+\xca\xdeYD\xf3I\xac\x19G\xb7\x9f\xc5R\
+\x84\xbe:\x89\xc1w\x998\xbdi'_\x82^\xb7\xf5\
+F\xe42\xe7D\xa0\x0e\x05\xac\xea\xf5\xfeWrN\xed\
+\x9b\xc2m\x0c\x99\xa0T\xc3\xc04E\x5c\x9d\xab\x95\xcb\
+'\x19\x06{\xea\xd9\xcbz\x10\x0bh\xa4\xf8\xeb3s\
+\xbc\x05\x07\xa2I\xd5\xc4\xca?\xf3\xa7\xc4\xaeHZ\xdc\
+\x09\xa8\xc20\x85\x81\x04(L\x01\
+\x00\x00\x02^\
+(\
+\xb5/\xfd`\x9b\x0e\xa5\x12\x00v\x9aU \x00\xd56\
+j\x89\x0d\xcc\xbb\x84\xce\xba\x14\xf7\xe79\xc8\x0e\x01\x17\
+-t\xc7\xc7\x12]\x8e\xb6\xff\xff\xeb\xff\x95J\x00M\
+\x00J\x00\x88V\xb4@\xd0\xb4\x17\x8c\xeej\x09^6\
+a\xe4#\x96\x80\x03\xf3;\x1c;y7\x1bg\xfb\x22\
+>kw7E\x99\xfa\xe3/\xa1(\xca\xfc3\x93\xc0\
+\xc9\x05m\xe9\x0fR*\xf3\xe6\xf2qv\x88\xf2\x88\xed\
+\xa6\xa2<\xa2=/\x7f\xe9/3\xf9\xb1\x01\x95Y\xe6\
+\x8e\x88A\xfc9ov`T\xdb4+\xcb\xaaf!\
+\xae-\xb1]\x88\xc3\xb6\x8dYxQ\x94\x22\x5c\x0b\xb7\
+\x8cZ\xda\x16VL\xa3\x18\xa5\xd4i\xbd(v\xb0\xb0\
+\xac\x8a\x22\xb5\x0e\x16\xc2\xcd\xeb}\x02\xd4\x1a&0-\
+\x00\xe8E\x97\xf9f\xb1\xa2/\x06\x8fs\xc9\x12\x00\x14\
+\xcf\xf2a\xba\xf3:M\x87\x01\x0c\xca\xcf\x045\xf7#\
+\xbf\x1e\x82\x13\x8fZ\xcd\x99\xa7\x1dA\xef\xabO\xc8\xfc\
+\xa4\xbd\xa2G\xfc,\xbf\xb9\xce\x8fv\xc3q\xa3\xf5\xcb\
+\xc1\xe0\x8b\xeeQ\xb49\x0e\xb6\x22H\x9a\x8f\xbd\x04\xc9\
+\xe6\xee\xb55\xd4\xe9\xeb$\x99\xcb'\xff\xe7\x90>\xba\
+\xc9\xf7u\x98J\xc62t\x1a\xc9\xe7h\x5c_\xc3\xeb\
+\x1e\x16J\xd50H\xc5\xe2}\xd9\xe9\xaah\xa1Sy\
+\xc9b\xae\x8f,9\xde\x1cV\x8fs\xd5\x88\xf6K\x0f\
+\x95\xfe\xd8\x1d\x91\xeaG\xfe5\xf7\xd8?\x98co\xe3\
+\x82\x01n\xa0Q\xb5355RAQ\x0ai\x0e\xb0\
+\x02\x112\x1a\xe7\xe9\x01\xec?ljK\x13)r\x8e\
+\x13Mt\x03\xa4\xa3\xd5A|H\x02\xae\xeaAQ\xa8\
+\xd1\xb1\x8f\xa6\xacz(Tj=X\x1fZ)N\xcd\
+\x03\xca\x82I%\xea\xe3B\xb9NKs\x84\x1f@,\
+\xdc\xe9\x0c\xaeu\xb3\xd7wm \x1c\xff\x00c\xa6j\
+\xc1\xd7[\xfb4\x8f\xc2%\xa0\x0b]\xc7\xd7\x5c\x8f\x1a\
+2S\xceQ\x00\x98i \x19\x12I5\xe1df\xb3\
+\xc1m\x0e\xf6Y\x80\xa01VXA\x89\x05\xc2\xa4\xb3\
+\x141\x08];z,\x13\x00\x85n\x98\xc0\xb9\x83s\
+\x05\x0e1.\xf2\x8e\x1c\x89\x80\xeaG\xb2\x0c\xa5)w\
+\xde?y6\xfe\x7f\xd5ds\xa0#\x0erN\x03}\
+\x12\xc3\x02\xf8\xf1\xe7\xb0\xf6\xfbrr\x0c\xf7_=\x98\
+\x86\x86\x84f\xc6\x11\x9b\xc6\x10\x96\xce\x1dw\xdd\xa1'\
+\x0b\xc6r\x10hZ\x98\xe5\x83\x5cZ\x1e\xf2>f\x09\
+\x14\x03E\x0a9W \xcf!\xa6\xc8\xd4\x0f\
+\x00\x00XH\
 <\
 ?xml version=\x221.\
 0\x22 encoding=\x22UTF\
--8\x22 ?>\x0d\x0a<!DOCTYP\
-E svg PUBLIC \x22-/\
-/W3C//DTD SVG 1.\
-1//EN\x22 \x22http://w\
-ww.w3.org/Graphi\
-cs/SVG/1.1/DTD/s\
-vg11.dtd\x22>\x0d\x0a<svg\
- width=\x22360pt\x22 h\
-eight=\x22600pt\x22 vi\
-ewBox=\x220 0 360 6\
-00\x22 version=\x221.1\
-\x22 xmlns=\x22http://\
-www.w3.org/2000/\
-svg\x22>\x0d\x0a<g id=\x22#b\
-0bec9ff\x22>\x0d\x0a<path\
- fill=\x22#b0bec9\x22 \
-opacity=\x221.00\x22 d\
-=\x22 M 178.81 10.5\
-7 C 184.39 15.94\
- 186.89 24.38 19\
-4.29 27.73 C 199\
-.43 30.35 205.20\
- 31.10 210.76 32\
-.37 C 224.57 35.\
-46 237.10 42.49 \
-248.82 50.21 C 2\
-59.93 57.98 266.\
-91 69.95 273.64 \
-81.40 C 281.97 9\
-5.98 291.21 110.\
-35 295.90 126.63\
- C 301.60 125.02\
- 307.33 123.43 3\
-13.21 122.55 C 3\
-12.84 120.77 312\
-.45 119.00 312.0\
-2 117.24 C 323.2\
-0 118.81 333.66 \
-112.79 344.81 11\
-3.66 C 336.40 11\
-8.27 326.85 120.\
-09 318.23 124.23\
- C 316.33 125.42\
- 314.08 124.59 3\
-12.01 124.60 C 3\
-08.98 124.64 306\
-.08 125.64 303.1\
-4 126.26 C 305.9\
-9 128.33 308.71 \
-130.58 311.35 13\
-2.92 C 307.96 13\
-8.99 305.95 145.\
-70 303.67 152.24\
- C 303.45 150.44\
- 303.25 148.63 3\
-03.08 146.83 C 3\
-01.68 147.54 300\
-.29 148.25 298.8\
-9 148.95 C 299.6\
-2 149.91 300.41 \
-150.85 301.03 15\
-1.90 C 304.79 17\
-1.72 302.78 192.\
-02 301.75 212.02\
- C 301.62 225.55\
- 300.23 239.61 2\
-93.72 251.71 C 2\
-88.21 262.05 281\
-.91 272.25 273.0\
-7 280.09 C 268.3\
-6 284.36 262.54 \
-287.59 259.07 29\
-3.08 C 254.45 29\
-9.40 257.05 307.\
-76 254.38 314.75\
- C 252.12 313.37\
- 250.20 311.54 2\
-48.50 309.52 C 2\
-26.20 284.48 203\
-.90 259.43 181.7\
-7 234.23 C 179.1\
-2 240.44 173.09 \
-244.78 171.81 25\
-1.62 C 170.46 25\
-7.64 170.95 263.\
-87 170.90 269.99\
- C 171.00 275.88\
- 170.26 281.99 1\
-72.30 287.66 C 1\
-73.76 292.69 176\
-.42 297.27 179.5\
-7 301.42 C 183.8\
-9 307.24 186.90 \
-313.91 191.37 31\
-9.63 C 193.93 32\
-2.88 195.82 326.\
-58 198.15 330.00\
- C 180.81 346.08\
- 165.10 363.89 1\
-47.29 379.46 C 1\
-30.62 363.82 115\
-.00 347.09 98.46\
- 331.31 C 100.84\
- 327.71 103.07 3\
-24.02 105.41 320\
-.40 C 110.19 312\
-.67 113.19 304.0\
-5 116.77 295.75 \
-C 119.07 289.96 \
-116.90 283.74 11\
-4.70 278.28 C 11\
-0.12 267.47 107.\
-27 256.04 102.77\
- 245.20 C 99.66 \
-237.55 93.00 232\
-.34 87.56 226.43\
- C 85.76 224.21 \
-82.63 224.49 80.\
-08 224.50 C 70.1\
-7 225.06 60.34 2\
-23.48 50.54 222.\
-34 C 39.00 220.8\
-8 27.05 218.29 1\
-7.90 210.65 C 19\
-.77 208.00 21.61\
- 205.27 24.10 20\
-3.14 C 28.61 199\
-.19 33.07 194.75\
- 38.97 192.97 C \
-53.09 188.96 68.\
-00 189.56 82.24 \
-186.17 C 88.53 1\
-84.70 94.35 181.\
-85 100.34 179.54\
- C 95.71 172.94 \
-91.86 165.27 92.\
-08 157.01 C 92.1\
-9 150.36 93.31 1\
-43.09 98.00 138.\
-02 C 109.41 126.\
-12 127.37 120.37\
- 143.38 125.15 C\
- 154.77 86.83 16\
-7.32 48.85 178.8\
-1 10.57 M 144.49\
- 126.13 C 149.43\
- 128.05 153.44 1\
-31.70 158.32 133\
-.72 C 163.69 135\
-.83 169.08 132.7\
-8 174.13 131.16 \
-C 186.68 126.43 \
-200.16 121.52 21\
-3.75 124.28 C 22\
-2.69 125.61 230.\
-87 130.45 236.73\
- 137.28 C 227.50\
- 135.65 217.91 1\
-35.54 208.80 137\
-.95 C 213.25 141\
-.01 218.18 144.2\
-6 219.52 149.89 \
-C 241.27 142.92 \
-263.35 137.03 28\
-5.21 130.41 C 28\
-2.26 119.76 279.\
-70 108.63 272.96\
- 99.60 C 270.73 \
-100.55 268.56 10\
-1.62 266.42 102.\
-74 C 268.21 94.9\
-8 267.75 86.69 2\
-64.63 79.34 C 26\
-2.89 75.36 259.9\
-2 72.13 256.95 6\
-9.03 C 245.92 57\
-.88 232.73 48.89\
- 218.34 42.68 C \
-213.15 40.59 206\
-.83 43.56 202.18\
- 39.87 C 197.94 \
-36.67 193.63 33.\
-50 188.82 31.21 \
-C 186.85 30.19 1\
-84.69 29.44 182.\
-97 28.01 C 180.1\
-4 24.95 179.98 2\
-0.54 178.78 16.7\
-4 C 167.29 53.18\
- 156.14 89.74 14\
-4.49 126.13 M 28\
-6.72 129.79 C 28\
-3.72 134.61 284.\
-39 141.83 278.96\
- 144.91 C 270.76\
- 148.87 261.72 1\
-50.56 253.01 153\
-.04 C 246.07 154\
-.76 239.42 157.5\
-7 232.30 158.50 \
-C 224.79 159.61 \
-219.59 165.52 21\
-3.77 169.76 C 20\
-9.59 172.95 204.\
-21 173.81 199.10\
- 174.11 C 189.08\
- 174.55 179.67 1\
-78.27 170.09 180\
-.85 C 170.81 189\
-.45 168.72 198.2\
-2 171.36 206.64 \
-C 184.05 201.05 \
-195.30 192.72 20\
-7.89 186.93 C 21\
-3.75 184.00 220.\
-58 185.47 226.73\
- 183.63 C 233.29\
- 182.13 239.07 1\
-78.44 244.16 174\
-.16 C 248.25 170\
-.65 253.23 168.5\
-1 257.93 165.97 \
-C 260.96 164.36 \
-263.55 161.98 26\
-6.78 160.71 C 27\
-3.37 158.03 280.\
-52 157.28 287.31\
- 155.20 C 285.26\
- 153.31 283.20 1\
-51.44 281.04 149\
-.68 C 283.63 148\
-.16 286.46 146.7\
-8 288.34 144.35 \
-C 290.95 141.29 \
-291.92 137.27 29\
-2.66 133.42 C 29\
-5.14 133.43 297.\
-61 133.45 300.08\
- 133.47 C 301.17\
- 132.36 302.27 1\
-31.26 303.36 130\
-.14 C 300.94 129\
-.47 298.60 128.5\
-3 296.14 128.03 \
-C 292.94 128.25 \
-289.84 129.16 28\
-6.72 129.79 M 30\
-4.43 130.13 C 30\
-3.61 132.34 304.\
-81 136.82 307.81\
- 134.90 C 309.32\
- 132.37 306.08 1\
-31.19 304.43 130\
-.13 M 223.04 150\
-.62 C 228.40 151\
-.77 233.54 153.9\
-0 238.97 154.70 \
-C 251.15 151.96 \
-263.18 148.52 27\
-5.18 145.11 C 28\
-0.49 143.66 280.\
-83 137.21 282.52\
- 132.90 C 262.75\
- 139.00 242.71 1\
-44.21 223.04 150\
-.62 M 297.45 140\
-.25 C 299.50 140\
-.33 301.29 140.9\
-1 302.82 141.99 \
-C 301.64 143.85 \
-298.51 143.06 29\
-6.61 143.95 C 29\
-8.85 144.63 301.\
-12 145.24 303.38\
- 145.87 C 304.42\
- 142.81 305.46 1\
-39.74 306.62 136\
-.72 C 303.58 137\
-.95 300.53 139.1\
-3 297.45 140.25 \
-M 137.27 151.76 \
-C 140.85 151.74 \
-144.43 151.61 14\
-8.00 151.38 C 14\
-7.07 153.76 146.\
-26 156.18 145.48\
- 158.62 C 143.76\
- 157.07 142.00 1\
-55.56 140.20 154\
-.10 C 140.05 155\
-.57 139.89 157.0\
-4 139.72 158.51 \
-C 138.27 157.24 \
-136.87 155.92 13\
-5.46 154.61 C 13\
-4.60 158.55 133.\
-82 162.52 132.48\
- 166.33 C 132.27\
- 163.56 132.52 1\
-60.80 132.92 158\
-.07 C 130.28 161\
-.68 127.13 164.9\
-4 123.19 167.16 \
-C 125.01 168.07 \
-126.82 168.99 12\
-8.62 169.95 C 12\
-9.09 167.65 129.\
-46 165.32 129.93\
- 163.02 C 130.96\
- 164.99 132.01 1\
-66.94 133.04 168\
-.91 C 135.66 167\
-.07 138.77 165.8\
-0 142.02 166.15 \
-C 147.04 166.95 \
-150.97 163.09 15\
-5.62 162.00 C 15\
-3.50 159.98 151.\
-43 157.90 149.35\
- 155.83 C 150.74\
- 151.20 150.78 1\
-45.86 146.99 142\
-.31 C 142.89 144\
-.47 140.14 148.2\
-6 137.27 151.76 \
-M 279.38 158.67 \
-C 272.18 159.78 \
-265.76 163.47 25\
-9.59 167.15 C 26\
-7.05 167.42 274.\
-49 167.13 281.94\
- 166.76 C 275.96\
- 170.33 270.64 1\
-74.96 266.62 180\
-.66 C 260.87 188\
-.80 253.76 197.0\
-4 243.77 199.78 \
-C 237.43 201.79 \
-230.89 199.56 22\
-4.49 199.19 C 21\
-8.26 198.49 211.\
-90 199.13 206.02\
- 201.34 C 209.93\
- 203.47 213.71 2\
-05.82 217.43 208\
-.26 C 205.27 214\
-.38 191.73 217.6\
-9 178.11 217.76 \
-C 180.86 223.38 \
-180.32 230.44 18\
-4.69 235.27 C 20\
-7.09 260.39 229.\
-35 285.64 251.82\
- 310.71 C 250.82\
- 305.73 248.58 3\
-00.48 250.23 295\
-.43 C 254.54 289\
-.69 258.18 283.4\
-8 260.80 276.78 \
-C 262.96 271.34 \
-270.27 271.99 27\
-3.46 267.51 C 28\
-3.77 254.44 290.\
-46 238.86 294.76\
- 222.87 C 297.28\
- 210.59 293.35 1\
-97.96 286.88 187\
-.54 C 289.16 187\
-.94 291.46 188.3\
-5 293.76 188.71 \
-C 295.52 177.90 \
-292.63 167.20 29\
-1.87 156.45 C 28\
-7.74 157.41 283.\
-56 158.04 279.38\
- 158.67 M 145.32\
- 167.94 C 146.54\
- 168.75 147.76 1\
-69.56 148.99 170\
-.36 C 154.18 168\
-.64 159.45 167.2\
-4 164.71 165.73 \
-C 161.49 165.02 \
-158.21 164.45 15\
-4.91 164.45 C 15\
-1.41 164.51 148.\
-41 166.57 145.32\
- 167.94 M 141.34\
- 173.47 C 142.52\
- 172.45 143.69 1\
-71.44 144.83 170\
-.38 C 143.85 169\
-.43 142.84 168.5\
-3 141.78 167.68 \
-C 140.05 167.32 \
-138.40 168.30 13\
-6.74 168.66 C 13\
-7.19 170.89 137.\
-80 173.09 138.28\
- 175.33 C 134.24\
- 176.87 130.16 1\
-78.58 125.72 178\
-.14 C 129.06 176\
-.09 132.57 174.3\
-0 135.55 171.72 \
-C 130.48 171.40 \
-125.70 173.27 12\
-0.73 173.81 C 12\
-3.11 172.35 125.\
-69 171.24 128.14\
- 169.89 C 126.03\
- 169.56 123.95 1\
-69.07 121.83 168\
-.79 C 116.18 169\
-.48 114.12 176.0\
-5 108.93 177.75 \
-C 101.17 180.65 \
-93.74 184.40 85.\
-82 186.86 C 77.7\
-1 189.31 69.22 1\
-89.62 60.87 190.\
-65 C 49.15 192.1\
-0 36.27 193.76 2\
-7.32 202.25 C 30\
-.58 203.35 33.72\
- 201.71 36.76 20\
-0.71 C 45.15 197\
-.50 53.83 194.81\
- 62.81 193.97 C \
-72.51 192.92 82.\
-03 190.85 91.50 \
-188.60 C 98.57 1\
-86.79 105.99 186\
-.47 112.85 183.8\
-6 C 117.58 182.0\
-9 122.36 180.45 \
-127.29 179.33 C \
-127.46 180.52 12\
-7.79 182.90 127.\
-96 184.09 C 128.\
-27 182.54 128.56\
- 180.99 128.85 1\
-79.44 C 131.80 1\
-81.01 134.68 182\
-.71 137.48 184.5\
-3 C 134.17 186.3\
-5 130.53 187.35 \
-126.81 187.93 C \
-128.62 188.40 13\
-0.42 188.89 132.\
-20 189.47 C 134.\
-16 187.87 136.10\
- 186.24 138.00 1\
-84.57 C 137.17 1\
-82.35 136.29 180\
-.15 135.49 177.9\
-2 C 139.19 179.5\
-0 142.82 181.25 \
-146.34 183.21 C \
-147.58 181.17 14\
-8.48 178.87 150.\
-14 177.12 C 151.\
-77 176.23 153.68\
- 176.10 155.41 1\
-75.46 C 159.84 1\
-74.01 163.09 170\
-.45 166.02 167.0\
-0 C 157.80 169.2\
-2 149.82 172.32 \
-141.34 173.47 M \
-147.44 193.73 C \
-149.12 195.56 15\
-0.81 197.40 152.\
-43 199.30 C 154.\
-18 195.62 155.84\
- 191.91 157.52 1\
-88.20 C 154.12 1\
-89.98 150.77 191\
-.83 147.44 193.7\
-3 M 107.53 194.4\
-1 C 100.85 197.1\
-8 94.21 200.14 8\
-7.16 201.86 C 97\
-.25 206.96 106.3\
-3 213.86 116.59 \
-218.67 C 110.96 \
-211.05 102.86 20\
-5.85 95.99 199.4\
-6 C 101.45 197.5\
-5 107.35 196.92 \
-113.02 198.27 C \
-113.43 196.67 11\
-3.85 195.08 114.\
-28 193.49 C 120.\
-30 192.66 127.77\
- 194.60 132.35 1\
-89.63 C 124.29 1\
-92.49 115.42 191\
-.03 107.53 194.4\
-1 M 126.49 209.9\
-8 C 129.50 211.5\
-1 132.55 213.00 \
-135.40 214.82 C \
-128.07 213.97 12\
-1.56 210.22 114.\
-58 208.12 C 120.\
-67 211.77 127.01\
- 215.08 133.83 2\
-17.15 C 140.97 2\
-13.09 145.92 206\
-.42 151.93 201.0\
-2 C 150.21 199.1\
-4 148.52 197.24 \
-146.85 195.32 C \
-145.43 198.44 14\
-4.07 201.59 142.\
-48 204.62 C 141.\
-68 200.00 141.51\
- 195.30 141.20 1\
-90.63 C 135.55 1\
-96.49 131.20 203\
-.39 126.49 209.9\
-8 M 154.99 205.2\
-7 C 154.28 204.2\
-7 153.57 203.28 \
-152.86 202.29 C \
-145.29 210.23 13\
-8.38 219.01 129.\
-24 225.25 C 123.\
-43 228.62 116.60\
- 230.75 112.40 2\
-36.36 C 116.26 2\
-35.47 120.18 234\
-.60 123.69 232.7\
-0 C 131.80 228.6\
-9 138.17 222.02 \
-145.92 217.44 C \
-140.52 225.16 13\
-3.20 231.22 127.\
-07 238.31 C 137.\
-99 230.73 149.51\
- 223.50 157.82 2\
-12.91 C 157.62 2\
-13.82 157.22 215\
-.65 157.03 216.5\
-7 C 159.20 216.1\
-6 161.36 215.71 \
-163.53 215.26 C \
-160.38 219.14 15\
-7.41 223.16 154.\
-28 227.05 C 160.\
-42 228.77 167.06\
- 229.67 173.15 2\
-27.19 C 174.56 2\
-19.88 169.32 212\
-.09 161.70 211.4\
-9 C 162.10 207.0\
-3 164.34 203.08 \
-165.83 198.93 C \
-164.14 200.48 16\
-2.53 202.09 160.\
-90 203.69 C 160.\
-96 200.92 160.97\
- 198.15 160.88 1\
-95.38 C 158.37 1\
-98.31 156.29 201\
-.62 154.99 205.2\
-7 M 67.93 212.37\
- C 71.59 212.03 \
-75.14 210.96 78.\
-27 209.01 C 81.7\
-2 210.70 85.63 2\
-11.77 88.37 214.\
-61 C 95.41 221.4\
-4 104.10 226.34 \
-113.21 229.84 C \
-103.82 220.89 92\
-.69 213.59 85.10\
- 202.86 C 79.28 \
-205.85 73.13 208\
-.34 67.93 212.37\
- M 154.69 234.89\
- C 159.76 235.81\
- 164.95 235.67 1\
-70.01 236.63 C 1\
-62.12 240.26 153\
-.22 239.68 144.7\
-6 239.77 C 150.8\
-2 244.48 159.67 \
-245.24 166.35 24\
-1.40 C 170.57 23\
-9.33 173.07 235.\
-17 174.91 231.03\
- C 168.56 234.10\
- 161.50 233.98 1\
-54.69 234.89 M 1\
-30.93 257.39 C 1\
-30.88 256.65 130\
-.80 255.16 130.7\
-6 254.42 C 129.4\
-1 255.99 128.04 \
-257.54 126.66 25\
-9.09 C 120.40 25\
-9.73 114.21 258.\
-04 109.14 254.30\
- C 110.90 258.90\
- 112.52 263.57 1\
-13.29 268.45 C 1\
-14.52 275.87 119\
-.02 282.09 121.3\
-7 289.12 C 121.8\
-9 292.45 120.45 \
-295.69 119.83 29\
-8.92 C 128.69 30\
-2.45 136.91 307.\
-58 146.19 310.00\
- C 148.26 310.36\
- 150.63 311.15 1\
-52.52 309.80 C 1\
-58.30 306.24 162\
-.30 300.61 166.4\
-5 295.39 C 168.5\
-8 293.16 168.17 \
-289.86 168.62 28\
-7.05 C 169.32 27\
-4.49 170.02 261.\
-73 167.56 249.32\
- C 159.26 250.30\
- 149.90 249.00 1\
-44.17 242.31 C 1\
-40.51 247.96 135\
-.64 252.64 130.9\
-3 257.39 M 116.6\
-9 254.10 C 121.2\
-2 255.01 125.85 \
-254.48 130.41 25\
-4.21 C 131.90 25\
-1.10 135.03 249.\
-34 137.07 246.65\
- C 130.76 250.33\
- 123.86 252.75 1\
-16.69 254.10 M 1\
-11.87 316.00 C 1\
-22.82 320.63 134\
-.22 324.75 146.2\
-1 325.33 C 136.8\
-4 317.56 124.10 \
-311.57 111.87 31\
-6.00 M 111.43 31\
-8.54 C 111.24 32\
-0.00 111.05 321.\
-47 110.88 322.94\
- C 122.37 327.83\
- 133.75 334.03 1\
-46.43 334.98 C 1\
-38.70 328.47 129\
-.04 325.04 119.8\
-8 321.11 C 117.1\
-9 319.87 114.35 \
-319.03 111.43 31\
-8.54 Z\x22 />\x0d\x0a<pat\
-h fill=\x22#b0bec9\x22\
- opacity=\x221.00\x22 \
-d=\x22 M 251.75 145\
-.65 C 255.39 144\
-.68 259.03 143.5\
-6 262.81 143.34 \
-C 258.86 146.27 \
-254.05 147.60 24\
-9.27 148.41 C 24\
-9.52 146.91 250.\
-35 145.99 251.75\
- 145.65 Z\x22 />\x0d\x0a<\
-path fill=\x22#b0be\
-c9\x22 opacity=\x221.0\
-0\x22 d=\x22 M 213.81 \
-178.02 C 231.78 \
-180.41 244.06 16\
-3.51 260.95 161.\
-21 C 257.55 163.\
-58 253.72 165.19\
- 250.08 167.13 C\
- 243.68 170.46 2\
-38.81 176.17 232\
-.15 179.06 C 227\
-.12 181.47 221.4\
-8 182.14 215.98 \
-182.35 C 215.25 \
-180.90 214.53 17\
-9.46 213.81 178.\
-02 Z\x22 />\x0d\x0a<path \
-fill=\x22#b0bec9\x22 o\
-pacity=\x221.00\x22 d=\
-\x22 M 173.66 190.4\
-5 C 183.55 192.8\
-7 192.40 186.82 \
-201.56 184.39 C \
-199.85 186.42 19\
-7.76 188.09 195.\
-40 189.30 C 188.\
-06 193.20 181.01\
- 197.64 173.69 2\
-01.58 C 173.72 1\
-97.87 173.73 194\
-.16 173.66 190.4\
-5 Z\x22 />\x0d\x0a<path f\
+-8\x22 ?>\x0a<!DOCTYPE\
+ svg PUBLIC \x22-//\
+W3C//DTD SVG 1.1\
+//EN\x22 \x22http://ww\
+w.w3.org/Graphic\
+s/SVG/1.1/DTD/sv\
+g11.dtd\x22>\x0a<svg w\
+idth=\x22360pt\x22 hei\
+ght=\x22600pt\x22 view\
+Box=\x220 0 360 600\
+\x22 version=\x221.1\x22 \
+xmlns=\x22http://ww\
+w.w3.org/2000/sv\
+g\x22>\x0a<g id=\x22#b0be\
+c9ff\x22>\x0a<path fil\
+l=\x22#b0bec9\x22 opac\
+ity=\x221.00\x22 d=\x22 M\
+ 178.81 10.57 C \
+184.39 15.94 186\
+.89 24.38 194.29\
+ 27.73 C 199.43 \
+30.35 205.20 31.\
+10 210.76 32.37 \
+C 224.57 35.46 2\
+37.10 42.49 248.\
+82 50.21 C 259.9\
+3 57.98 266.91 6\
+9.95 273.64 81.4\
+0 C 281.97 95.98\
+ 291.21 110.35 2\
+95.90 126.63 C 3\
+01.60 125.02 307\
+.33 123.43 313.2\
+1 122.55 C 312.8\
+4 120.77 312.45 \
+119.00 312.02 11\
+7.24 C 323.20 11\
+8.81 333.66 112.\
+79 344.81 113.66\
+ C 336.40 118.27\
+ 326.85 120.09 3\
+18.23 124.23 C 3\
+16.33 125.42 314\
+.08 124.59 312.0\
+1 124.60 C 308.9\
+8 124.64 306.08 \
+125.64 303.14 12\
+6.26 C 305.99 12\
+8.33 308.71 130.\
+58 311.35 132.92\
+ C 307.96 138.99\
+ 305.95 145.70 3\
+03.67 152.24 C 3\
+03.45 150.44 303\
+.25 148.63 303.0\
+8 146.83 C 301.6\
+8 147.54 300.29 \
+148.25 298.89 14\
+8.95 C 299.62 14\
+9.91 300.41 150.\
+85 301.03 151.90\
+ C 304.79 171.72\
+ 302.78 192.02 3\
+01.75 212.02 C 3\
+01.62 225.55 300\
+.23 239.61 293.7\
+2 251.71 C 288.2\
+1 262.05 281.91 \
+272.25 273.07 28\
+0.09 C 268.36 28\
+4.36 262.54 287.\
+59 259.07 293.08\
+ C 254.45 299.40\
+ 257.05 307.76 2\
+54.38 314.75 C 2\
+52.12 313.37 250\
+.20 311.54 248.5\
+0 309.52 C 226.2\
+0 284.48 203.90 \
+259.43 181.77 23\
+4.23 C 179.12 24\
+0.44 173.09 244.\
+78 171.81 251.62\
+ C 170.46 257.64\
+ 170.95 263.87 1\
+70.90 269.99 C 1\
+71.00 275.88 170\
+.26 281.99 172.3\
+0 287.66 C 173.7\
+6 292.69 176.42 \
+297.27 179.57 30\
+1.42 C 183.89 30\
+7.24 186.90 313.\
+91 191.37 319.63\
+ C 193.93 322.88\
+ 195.82 326.58 1\
+98.15 330.00 C 1\
+80.81 346.08 165\
+.10 363.89 147.2\
+9 379.46 C 130.6\
+2 363.82 115.00 \
+347.09 98.46 331\
+.31 C 100.84 327\
+.71 103.07 324.0\
+2 105.41 320.40 \
+C 110.19 312.67 \
+113.19 304.05 11\
+6.77 295.75 C 11\
+9.07 289.96 116.\
+90 283.74 114.70\
+ 278.28 C 110.12\
+ 267.47 107.27 2\
+56.04 102.77 245\
+.20 C 99.66 237.\
+55 93.00 232.34 \
+87.56 226.43 C 8\
+5.76 224.21 82.6\
+3 224.49 80.08 2\
+24.50 C 70.17 22\
+5.06 60.34 223.4\
+8 50.54 222.34 C\
+ 39.00 220.88 27\
+.05 218.29 17.90\
+ 210.65 C 19.77 \
+208.00 21.61 205\
+.27 24.10 203.14\
+ C 28.61 199.19 \
+33.07 194.75 38.\
+97 192.97 C 53.0\
+9 188.96 68.00 1\
+89.56 82.24 186.\
+17 C 88.53 184.7\
+0 94.35 181.85 1\
+00.34 179.54 C 9\
+5.71 172.94 91.8\
+6 165.27 92.08 1\
+57.01 C 92.19 15\
+0.36 93.31 143.0\
+9 98.00 138.02 C\
+ 109.41 126.12 1\
+27.37 120.37 143\
+.38 125.15 C 154\
+.77 86.83 167.32\
+ 48.85 178.81 10\
+.57 M 144.49 126\
+.13 C 149.43 128\
+.05 153.44 131.7\
+0 158.32 133.72 \
+C 163.69 135.83 \
+169.08 132.78 17\
+4.13 131.16 C 18\
+6.68 126.43 200.\
+16 121.52 213.75\
+ 124.28 C 222.69\
+ 125.61 230.87 1\
+30.45 236.73 137\
+.28 C 227.50 135\
+.65 217.91 135.5\
+4 208.80 137.95 \
+C 213.25 141.01 \
+218.18 144.26 21\
+9.52 149.89 C 24\
+1.27 142.92 263.\
+35 137.03 285.21\
+ 130.41 C 282.26\
+ 119.76 279.70 1\
+08.63 272.96 99.\
+60 C 270.73 100.\
+55 268.56 101.62\
+ 266.42 102.74 C\
+ 268.21 94.98 26\
+7.75 86.69 264.6\
+3 79.34 C 262.89\
+ 75.36 259.92 72\
+.13 256.95 69.03\
+ C 245.92 57.88 \
+232.73 48.89 218\
+.34 42.68 C 213.\
+15 40.59 206.83 \
+43.56 202.18 39.\
+87 C 197.94 36.6\
+7 193.63 33.50 1\
+88.82 31.21 C 18\
+6.85 30.19 184.6\
+9 29.44 182.97 2\
+8.01 C 180.14 24\
+.95 179.98 20.54\
+ 178.78 16.74 C \
+167.29 53.18 156\
+.14 89.74 144.49\
+ 126.13 M 286.72\
+ 129.79 C 283.72\
+ 134.61 284.39 1\
+41.83 278.96 144\
+.91 C 270.76 148\
+.87 261.72 150.5\
+6 253.01 153.04 \
+C 246.07 154.76 \
+239.42 157.57 23\
+2.30 158.50 C 22\
+4.79 159.61 219.\
+59 165.52 213.77\
+ 169.76 C 209.59\
+ 172.95 204.21 1\
+73.81 199.10 174\
+.11 C 189.08 174\
+.55 179.67 178.2\
+7 170.09 180.85 \
+C 170.81 189.45 \
+168.72 198.22 17\
+1.36 206.64 C 18\
+4.05 201.05 195.\
+30 192.72 207.89\
+ 186.93 C 213.75\
+ 184.00 220.58 1\
+85.47 226.73 183\
+.63 C 233.29 182\
+.13 239.07 178.4\
+4 244.16 174.16 \
+C 248.25 170.65 \
+253.23 168.51 25\
+7.93 165.97 C 26\
+0.96 164.36 263.\
+55 161.98 266.78\
+ 160.71 C 273.37\
+ 158.03 280.52 1\
+57.28 287.31 155\
+.20 C 285.26 153\
+.31 283.20 151.4\
+4 281.04 149.68 \
+C 283.63 148.16 \
+286.46 146.78 28\
+8.34 144.35 C 29\
+0.95 141.29 291.\
+92 137.27 292.66\
+ 133.42 C 295.14\
+ 133.43 297.61 1\
+33.45 300.08 133\
+.47 C 301.17 132\
+.36 302.27 131.2\
+6 303.36 130.14 \
+C 300.94 129.47 \
+298.60 128.53 29\
+6.14 128.03 C 29\
+2.94 128.25 289.\
+84 129.16 286.72\
+ 129.79 M 304.43\
+ 130.13 C 303.61\
+ 132.34 304.81 1\
+36.82 307.81 134\
+.90 C 309.32 132\
+.37 306.08 131.1\
+9 304.43 130.13 \
+M 223.04 150.62 \
+C 228.40 151.77 \
+233.54 153.90 23\
+8.97 154.70 C 25\
+1.15 151.96 263.\
+18 148.52 275.18\
+ 145.11 C 280.49\
+ 143.66 280.83 1\
+37.21 282.52 132\
+.90 C 262.75 139\
+.00 242.71 144.2\
+1 223.04 150.62 \
+M 297.45 140.25 \
+C 299.50 140.33 \
+301.29 140.91 30\
+2.82 141.99 C 30\
+1.64 143.85 298.\
+51 143.06 296.61\
+ 143.95 C 298.85\
+ 144.63 301.12 1\
+45.24 303.38 145\
+.87 C 304.42 142\
+.81 305.46 139.7\
+4 306.62 136.72 \
+C 303.58 137.95 \
+300.53 139.13 29\
+7.45 140.25 M 13\
+7.27 151.76 C 14\
+0.85 151.74 144.\
+43 151.61 148.00\
+ 151.38 C 147.07\
+ 153.76 146.26 1\
+56.18 145.48 158\
+.62 C 143.76 157\
+.07 142.00 155.5\
+6 140.20 154.10 \
+C 140.05 155.57 \
+139.89 157.04 13\
+9.72 158.51 C 13\
+8.27 157.24 136.\
+87 155.92 135.46\
+ 154.61 C 134.60\
+ 158.55 133.82 1\
+62.52 132.48 166\
+.33 C 132.27 163\
+.56 132.52 160.8\
+0 132.92 158.07 \
+C 130.28 161.68 \
+127.13 164.94 12\
+3.19 167.16 C 12\
+5.01 168.07 126.\
+82 168.99 128.62\
+ 169.95 C 129.09\
+ 167.65 129.46 1\
+65.32 129.93 163\
+.02 C 130.96 164\
+.99 132.01 166.9\
+4 133.04 168.91 \
+C 135.66 167.07 \
+138.77 165.80 14\
+2.02 166.15 C 14\
+7.04 166.95 150.\
+97 163.09 155.62\
+ 162.00 C 153.50\
+ 159.98 151.43 1\
+57.90 149.35 155\
+.83 C 150.74 151\
+.20 150.78 145.8\
+6 146.99 142.31 \
+C 142.89 144.47 \
+140.14 148.26 13\
+7.27 151.76 M 27\
+9.38 158.67 C 27\
+2.18 159.78 265.\
+76 163.47 259.59\
+ 167.15 C 267.05\
+ 167.42 274.49 1\
+67.13 281.94 166\
+.76 C 275.96 170\
+.33 270.64 174.9\
+6 266.62 180.66 \
+C 260.87 188.80 \
+253.76 197.04 24\
+3.77 199.78 C 23\
+7.43 201.79 230.\
+89 199.56 224.49\
+ 199.19 C 218.26\
+ 198.49 211.90 1\
+99.13 206.02 201\
+.34 C 209.93 203\
+.47 213.71 205.8\
+2 217.43 208.26 \
+C 205.27 214.38 \
+191.73 217.69 17\
+8.11 217.76 C 18\
+0.86 223.38 180.\
+32 230.44 184.69\
+ 235.27 C 207.09\
+ 260.39 229.35 2\
+85.64 251.82 310\
+.71 C 250.82 305\
+.73 248.58 300.4\
+8 250.23 295.43 \
+C 254.54 289.69 \
+258.18 283.48 26\
+0.80 276.78 C 26\
+2.96 271.34 270.\
+27 271.99 273.46\
+ 267.51 C 283.77\
+ 254.44 290.46 2\
+38.86 294.76 222\
+.87 C 297.28 210\
+.59 293.35 197.9\
+6 286.88 187.54 \
+C 289.16 187.94 \
+291.46 188.35 29\
+3.76 188.71 C 29\
+5.52 177.90 292.\
+63 167.20 291.87\
+ 156.45 C 287.74\
+ 157.41 283.56 1\
+58.04 279.38 158\
+.67 M 145.32 167\
+.94 C 146.54 168\
+.75 147.76 169.5\
+6 148.99 170.36 \
+C 154.18 168.64 \
+159.45 167.24 16\
+4.71 165.73 C 16\
+1.49 165.02 158.\
+21 164.45 154.91\
+ 164.45 C 151.41\
+ 164.51 148.41 1\
+66.57 145.32 167\
+.94 M 141.34 173\
+.47 C 142.52 172\
+.45 143.69 171.4\
+4 144.83 170.38 \
+C 143.85 169.43 \
+142.84 168.53 14\
+1.78 167.68 C 14\
+0.05 167.32 138.\
+40 168.30 136.74\
+ 168.66 C 137.19\
+ 170.89 137.80 1\
+73.09 138.28 175\
+.33 C 134.24 176\
+.87 130.16 178.5\
+8 125.72 178.14 \
+C 129.06 176.09 \
+132.57 174.30 13\
+5.55 171.72 C 13\
+0.48 171.40 125.\
+70 173.27 120.73\
+ 173.81 C 123.11\
+ 172.35 125.69 1\
+71.24 128.14 169\
+.89 C 126.03 169\
+.56 123.95 169.0\
+7 121.83 168.79 \
+C 116.18 169.48 \
+114.12 176.05 10\
+8.93 177.75 C 10\
+1.17 180.65 93.7\
+4 184.40 85.82 1\
+86.86 C 77.71 18\
+9.31 69.22 189.6\
+2 60.87 190.65 C\
+ 49.15 192.10 36\
+.27 193.76 27.32\
+ 202.25 C 30.58 \
+203.35 33.72 201\
+.71 36.76 200.71\
+ C 45.15 197.50 \
+53.83 194.81 62.\
+81 193.97 C 72.5\
+1 192.92 82.03 1\
+90.85 91.50 188.\
+60 C 98.57 186.7\
+9 105.99 186.47 \
+112.85 183.86 C \
+117.58 182.09 12\
+2.36 180.45 127.\
+29 179.33 C 127.\
+46 180.52 127.79\
+ 182.90 127.96 1\
+84.09 C 128.27 1\
+82.54 128.56 180\
+.99 128.85 179.4\
+4 C 131.80 181.0\
+1 134.68 182.71 \
+137.48 184.53 C \
+134.17 186.35 13\
+0.53 187.35 126.\
+81 187.93 C 128.\
+62 188.40 130.42\
+ 188.89 132.20 1\
+89.47 C 134.16 1\
+87.87 136.10 186\
+.24 138.00 184.5\
+7 C 137.17 182.3\
+5 136.29 180.15 \
+135.49 177.92 C \
+139.19 179.50 14\
+2.82 181.25 146.\
+34 183.21 C 147.\
+58 181.17 148.48\
+ 178.87 150.14 1\
+77.12 C 151.77 1\
+76.23 153.68 176\
+.10 155.41 175.4\
+6 C 159.84 174.0\
+1 163.09 170.45 \
+166.02 167.00 C \
+157.80 169.22 14\
+9.82 172.32 141.\
+34 173.47 M 147.\
+44 193.73 C 149.\
+12 195.56 150.81\
+ 197.40 152.43 1\
+99.30 C 154.18 1\
+95.62 155.84 191\
+.91 157.52 188.2\
+0 C 154.12 189.9\
+8 150.77 191.83 \
+147.44 193.73 M \
+107.53 194.41 C \
+100.85 197.18 94\
+.21 200.14 87.16\
+ 201.86 C 97.25 \
+206.96 106.33 21\
+3.86 116.59 218.\
+67 C 110.96 211.\
+05 102.86 205.85\
+ 95.99 199.46 C \
+101.45 197.55 10\
+7.35 196.92 113.\
+02 198.27 C 113.\
+43 196.67 113.85\
+ 195.08 114.28 1\
+93.49 C 120.30 1\
+92.66 127.77 194\
+.60 132.35 189.6\
+3 C 124.29 192.4\
+9 115.42 191.03 \
+107.53 194.41 M \
+126.49 209.98 C \
+129.50 211.51 13\
+2.55 213.00 135.\
+40 214.82 C 128.\
+07 213.97 121.56\
+ 210.22 114.58 2\
+08.12 C 120.67 2\
+11.77 127.01 215\
+.08 133.83 217.1\
+5 C 140.97 213.0\
+9 145.92 206.42 \
+151.93 201.02 C \
+150.21 199.14 14\
+8.52 197.24 146.\
+85 195.32 C 145.\
+43 198.44 144.07\
+ 201.59 142.48 2\
+04.62 C 141.68 2\
+00.00 141.51 195\
+.30 141.20 190.6\
+3 C 135.55 196.4\
+9 131.20 203.39 \
+126.49 209.98 M \
+154.99 205.27 C \
+154.28 204.27 15\
+3.57 203.28 152.\
+86 202.29 C 145.\
+29 210.23 138.38\
+ 219.01 129.24 2\
+25.25 C 123.43 2\
+28.62 116.60 230\
+.75 112.40 236.3\
+6 C 116.26 235.4\
+7 120.18 234.60 \
+123.69 232.70 C \
+131.80 228.69 13\
+8.17 222.02 145.\
+92 217.44 C 140.\
+52 225.16 133.20\
+ 231.22 127.07 2\
+38.31 C 137.99 2\
+30.73 149.51 223\
+.50 157.82 212.9\
+1 C 157.62 213.8\
+2 157.22 215.65 \
+157.03 216.57 C \
+159.20 216.16 16\
+1.36 215.71 163.\
+53 215.26 C 160.\
+38 219.14 157.41\
+ 223.16 154.28 2\
+27.05 C 160.42 2\
+28.77 167.06 229\
+.67 173.15 227.1\
+9 C 174.56 219.8\
+8 169.32 212.09 \
+161.70 211.49 C \
+162.10 207.03 16\
+4.34 203.08 165.\
+83 198.93 C 164.\
+14 200.48 162.53\
+ 202.09 160.90 2\
+03.69 C 160.96 2\
+00.92 160.97 198\
+.15 160.88 195.3\
+8 C 158.37 198.3\
+1 156.29 201.62 \
+154.99 205.27 M \
+67.93 212.37 C 7\
+1.59 212.03 75.1\
+4 210.96 78.27 2\
+09.01 C 81.72 21\
+0.70 85.63 211.7\
+7 88.37 214.61 C\
+ 95.41 221.44 10\
+4.10 226.34 113.\
+21 229.84 C 103.\
+82 220.89 92.69 \
+213.59 85.10 202\
+.86 C 79.28 205.\
+85 73.13 208.34 \
+67.93 212.37 M 1\
+54.69 234.89 C 1\
+59.76 235.81 164\
+.95 235.67 170.0\
+1 236.63 C 162.1\
+2 240.26 153.22 \
+239.68 144.76 23\
+9.77 C 150.82 24\
+4.48 159.67 245.\
+24 166.35 241.40\
+ C 170.57 239.33\
+ 173.07 235.17 1\
+74.91 231.03 C 1\
+68.56 234.10 161\
+.50 233.98 154.6\
+9 234.89 M 130.9\
+3 257.39 C 130.8\
+8 256.65 130.80 \
+255.16 130.76 25\
+4.42 C 129.41 25\
+5.99 128.04 257.\
+54 126.66 259.09\
+ C 120.40 259.73\
+ 114.21 258.04 1\
+09.14 254.30 C 1\
+10.90 258.90 112\
+.52 263.57 113.2\
+9 268.45 C 114.5\
+2 275.87 119.02 \
+282.09 121.37 28\
+9.12 C 121.89 29\
+2.45 120.45 295.\
+69 119.83 298.92\
+ C 128.69 302.45\
+ 136.91 307.58 1\
+46.19 310.00 C 1\
+48.26 310.36 150\
+.63 311.15 152.5\
+2 309.80 C 158.3\
+0 306.24 162.30 \
+300.61 166.45 29\
+5.39 C 168.58 29\
+3.16 168.17 289.\
+86 168.62 287.05\
+ C 169.32 274.49\
+ 170.02 261.73 1\
+67.56 249.32 C 1\
+59.26 250.30 149\
+.90 249.00 144.1\
+7 242.31 C 140.5\
+1 247.96 135.64 \
+252.64 130.93 25\
+7.39 M 116.69 25\
+4.10 C 121.22 25\
+5.01 125.85 254.\
+48 130.41 254.21\
+ C 131.90 251.10\
+ 135.03 249.34 1\
+37.07 246.65 C 1\
+30.76 250.33 123\
+.86 252.75 116.6\
+9 254.10 M 111.8\
+7 316.00 C 122.8\
+2 320.63 134.22 \
+324.75 146.21 32\
+5.33 C 136.84 31\
+7.56 124.10 311.\
+57 111.87 316.00\
+ M 111.43 318.54\
+ C 111.24 320.00\
+ 111.05 321.47 1\
+10.88 322.94 C 1\
+22.37 327.83 133\
+.75 334.03 146.4\
+3 334.98 C 138.7\
+0 328.47 129.04 \
+325.04 119.88 32\
+1.11 C 117.19 31\
+9.87 114.35 319.\
+03 111.43 318.54\
+ Z\x22 />\x0a<path fil\
+l=\x22#b0bec9\x22 opac\
+ity=\x221.00\x22 d=\x22 M\
+ 251.75 145.65 C\
+ 255.39 144.68 2\
+59.03 143.56 262\
+.81 143.34 C 258\
+.86 146.27 254.0\
+5 147.60 249.27 \
+148.41 C 249.52 \
+146.91 250.35 14\
+5.99 251.75 145.\
+65 Z\x22 />\x0a<path f\
 ill=\x22#b0bec9\x22 op\
 acity=\x221.00\x22 d=\x22\
- M 121.40 263.11\
- C 125.57 265.50\
- 130.88 267.16 1\
-33.35 271.56 C 1\
-34.72 277.55 135\
-.87 283.63 138.9\
-9 289.02 C 137.8\
-1 293.46 137.93 \
-298.73 134.37 30\
-2.09 C 134.87 29\
-8.71 136.44 295.\
-56 136.75 292.16\
- C 135.44 288.32\
- 132.92 285.00 1\
-31.92 281.05 C 1\
-31.02 278.25 131\
-.35 274.99 129.4\
-4 272.58 C 126.9\
-3 269.27 123.70 \
-266.58 121.40 26\
-3.11 Z\x22 />\x0d\x0a<pat\
-h fill=\x22#b0bec9\x22\
- opacity=\x221.00\x22 \
-d=\x22 M 63.95 409.\
-18 C 69.63 408.8\
-6 75.32 409.00 8\
-1.00 409.02 C 82\
-.85 408.79 84.87\
- 410.19 84.91 41\
-2.15 C 85.17 416\
-.76 84.92 421.38\
- 85.00 426.00 C \
-83.25 425.99 81.\
-49 425.99 79.73 \
-426.00 C 79.74 4\
-22.00 79.73 417.\
-99 79.73 413.99 \
-C 75.71 414.00 7\
-1.69 414.00 67.6\
-7 414.00 C 67.76\
- 417.88 67.41 42\
-1.79 67.85 425.6\
-6 C 73.19 432.47\
- 79.37 438.62 84\
-.49 445.60 C 85.\
-63 450.91 84.76 \
-456.56 84.98 461\
-.99 C 85.26 464.\
-24 83.25 466.28 \
-81.00 465.98 C 7\
-5.32 466.00 69.6\
-3 466.14 63.95 4\
-65.82 C 63.32 46\
-4.55 62.27 463.3\
-7 62.25 461.90 C\
- 62.09 457.27 62\
-.26 452.63 62.20\
- 448.00 C 64.02 \
-448.00 65.84 447\
-.99 67.67 447.99\
- C 67.66 452.33 \
-67.67 456.66 67.\
-66 461.00 C 71.6\
-9 461.00 75.71 4\
-60.99 79.73 461.\
-01 C 79.62 456.5\
-1 79.99 451.99 7\
-9.57 447.52 C 74\
-.44 440.70 68.37\
- 434.61 63.22 42\
-7.80 C 61.80 425\
-.86 62.30 423.33\
- 62.18 421.10 C \
-62.44 417.09 61.\
-23 412.59 63.95 \
-409.18 Z\x22 />\x0d\x0a<p\
-ath fill=\x22#b0bec\
-9\x22 opacity=\x221.00\
-\x22 d=\x22 M 93.34 40\
-8.99 C 99.87 409\
-.06 106.40 408.9\
-0 112.93 409.04 \
-C 115.46 408.91 \
-116.57 411.81 11\
-6.45 413.93 C 11\
-6.48 421.97 116.\
-48 430.02 116.45\
- 438.07 C 116.57\
- 440.18 115.46 4\
-43.08 112.93 442\
-.96 C 108.22 443\
-.10 103.51 442.9\
-5 98.80 443.00 C\
- 98.80 450.66 98\
-.80 458.33 98.80\
- 466.00 C 96.98 \
-465.99 95.15 466\
-.00 93.33 466.01\
- C 93.34 447.00 \
-93.33 428.00 93.\
-34 408.99 M 98.8\
-0 414.00 C 98.80\
- 422.00 98.80 43\
-0.00 98.80 438.0\
-0 C 102.87 438.0\
-0 106.95 438.00 \
-111.03 438.00 C \
-111.05 430.00 11\
-1.05 422.00 111.\
-03 414.00 C 106.\
-95 414.00 102.87\
- 414.00 98.80 41\
-4.00 Z\x22 />\x0d\x0a<pat\
-h fill=\x22#b0bec9\x22\
- opacity=\x221.00\x22 \
-d=\x22 M 124.34 408\
-.99 C 130.71 409\
-.01 137.09 409.0\
-0 143.46 409.00 \
-C 143.46 410.66 \
-143.46 412.33 14\
-3.46 414.00 C 13\
-8.91 414.00 134.\
-35 414.00 129.80\
- 414.00 C 129.80\
- 421.00 129.80 4\
-28.00 129.80 435\
-.00 C 133.86 434\
-.99 137.93 435.0\
-0 142.00 435.00 \
-C 142.00 436.66 \
-142.00 438.33 14\
-2.00 440.00 C 13\
-7.93 439.99 133.\
-86 440.00 129.80\
- 440.00 C 129.80\
- 447.00 129.80 4\
-54.00 129.80 461\
-.00 C 134.42 460\
-.99 139.04 461.0\
-1 143.66 460.98 \
-C 143.66 462.66 \
-143.66 464.33 14\
-3.66 466.02 C 13\
-7.22 465.99 130.\
-78 466.00 124.34\
- 466.01 C 124.33\
- 447.00 124.33 4\
-28.00 124.34 408\
-.99 Z\x22 />\x0d\x0a<path\
+ M 213.81 178.02\
+ C 231.78 180.41\
+ 244.06 163.51 2\
+60.95 161.21 C 2\
+57.55 163.58 253\
+.72 165.19 250.0\
+8 167.13 C 243.6\
+8 170.46 238.81 \
+176.17 232.15 17\
+9.06 C 227.12 18\
+1.47 221.48 182.\
+14 215.98 182.35\
+ C 215.25 180.90\
+ 214.53 179.46 2\
+13.81 178.02 Z\x22 \
+/>\x0a<path fill=\x22#\
+b0bec9\x22 opacity=\
+\x221.00\x22 d=\x22 M 173\
+.66 190.45 C 183\
+.55 192.87 192.4\
+0 186.82 201.56 \
+184.39 C 199.85 \
+186.42 197.76 18\
+8.09 195.40 189.\
+30 C 188.06 193.\
+20 181.01 197.64\
+ 173.69 201.58 C\
+ 173.72 197.87 1\
+73.73 194.16 173\
+.66 190.45 Z\x22 />\
+\x0a<path fill=\x22#b0\
+bec9\x22 opacity=\x221\
+.00\x22 d=\x22 M 121.4\
+0 263.11 C 125.5\
+7 265.50 130.88 \
+267.16 133.35 27\
+1.56 C 134.72 27\
+7.55 135.87 283.\
+63 138.99 289.02\
+ C 137.81 293.46\
+ 137.93 298.73 1\
+34.37 302.09 C 1\
+34.87 298.71 136\
+.44 295.56 136.7\
+5 292.16 C 135.4\
+4 288.32 132.92 \
+285.00 131.92 28\
+1.05 C 131.02 27\
+8.25 131.35 274.\
+99 129.44 272.58\
+ C 126.93 269.27\
+ 123.70 266.58 1\
+21.40 263.11 Z\x22 \
+/>\x0a<path fill=\x22#\
+b0bec9\x22 opacity=\
+\x221.00\x22 d=\x22 M 63.\
+95 409.18 C 69.6\
+3 408.86 75.32 4\
+09.00 81.00 409.\
+02 C 82.85 408.7\
+9 84.87 410.19 8\
+4.91 412.15 C 85\
+.17 416.76 84.92\
+ 421.38 85.00 42\
+6.00 C 83.25 425\
+.99 81.49 425.99\
+ 79.73 426.00 C \
+79.74 422.00 79.\
+73 417.99 79.73 \
+413.99 C 75.71 4\
+14.00 71.69 414.\
+00 67.67 414.00 \
+C 67.76 417.88 6\
+7.41 421.79 67.8\
+5 425.66 C 73.19\
+ 432.47 79.37 43\
+8.62 84.49 445.6\
+0 C 85.63 450.91\
+ 84.76 456.56 84\
+.98 461.99 C 85.\
+26 464.24 83.25 \
+466.28 81.00 465\
+.98 C 75.32 466.\
+00 69.63 466.14 \
+63.95 465.82 C 6\
+3.32 464.55 62.2\
+7 463.37 62.25 4\
+61.90 C 62.09 45\
+7.27 62.26 452.6\
+3 62.20 448.00 C\
+ 64.02 448.00 65\
+.84 447.99 67.67\
+ 447.99 C 67.66 \
+452.33 67.67 456\
+.66 67.66 461.00\
+ C 71.69 461.00 \
+75.71 460.99 79.\
+73 461.01 C 79.6\
+2 456.51 79.99 4\
+51.99 79.57 447.\
+52 C 74.44 440.7\
+0 68.37 434.61 6\
+3.22 427.80 C 61\
+.80 425.86 62.30\
+ 423.33 62.18 42\
+1.10 C 62.44 417\
+.09 61.23 412.59\
+ 63.95 409.18 Z\x22\
+ />\x0a<path fill=\x22\
+#b0bec9\x22 opacity\
+=\x221.00\x22 d=\x22 M 93\
+.34 408.99 C 99.\
+87 409.06 106.40\
+ 408.90 112.93 4\
+09.04 C 115.46 4\
+08.91 116.57 411\
+.81 116.45 413.9\
+3 C 116.48 421.9\
+7 116.48 430.02 \
+116.45 438.07 C \
+116.57 440.18 11\
+5.46 443.08 112.\
+93 442.96 C 108.\
+22 443.10 103.51\
+ 442.95 98.80 44\
+3.00 C 98.80 450\
+.66 98.80 458.33\
+ 98.80 466.00 C \
+96.98 465.99 95.\
+15 466.00 93.33 \
+466.01 C 93.34 4\
+47.00 93.33 428.\
+00 93.34 408.99 \
+M 98.80 414.00 C\
+ 98.80 422.00 98\
+.80 430.00 98.80\
+ 438.00 C 102.87\
+ 438.00 106.95 4\
+38.00 111.03 438\
+.00 C 111.05 430\
+.00 111.05 422.0\
+0 111.03 414.00 \
+C 106.95 414.00 \
+102.87 414.00 98\
+.80 414.00 Z\x22 />\
+\x0a<path fill=\x22#b0\
+bec9\x22 opacity=\x221\
+.00\x22 d=\x22 M 124.3\
+4 408.99 C 130.7\
+1 409.01 137.09 \
+409.00 143.46 40\
+9.00 C 143.46 41\
+0.66 143.46 412.\
+33 143.46 414.00\
+ C 138.91 414.00\
+ 134.35 414.00 1\
+29.80 414.00 C 1\
+29.80 421.00 129\
+.80 428.00 129.8\
+0 435.00 C 133.8\
+6 434.99 137.93 \
+435.00 142.00 43\
+5.00 C 142.00 43\
+6.66 142.00 438.\
+33 142.00 440.00\
+ C 137.93 439.99\
+ 133.86 440.00 1\
+29.80 440.00 C 1\
+29.80 447.00 129\
+.80 454.00 129.8\
+0 461.00 C 134.4\
+2 460.99 139.04 \
+461.01 143.66 46\
+0.98 C 143.66 46\
+2.66 143.66 464.\
+33 143.66 466.02\
+ C 137.22 465.99\
+ 130.78 466.00 1\
+24.34 466.01 C 1\
+24.33 447.00 124\
+.33 428.00 124.3\
+4 408.99 Z\x22 />\x0a<\
+path fill=\x22#b0be\
+c9\x22 opacity=\x221.0\
+0\x22 d=\x22 M 150.35 \
+414.06 C 150.26 \
+411.89 151.45 40\
+8.90 154.03 409.\
+05 C 159.34 408.\
+94 164.66 408.96\
+ 169.97 409.03 C\
+ 172.09 408.89 1\
+73.81 411.06 173\
+.75 413.07 C 173\
+.91 417.38 173.7\
+5 421.69 173.80 \
+426.00 C 171.97 \
+425.99 170.15 42\
+6.00 168.33 426.\
+01 C 168.34 422.\
+00 168.33 418.00\
+ 168.33 414.00 C\
+ 164.15 414.00 1\
+59.98 414.00 155\
+.80 414.00 C 155\
+.80 429.67 155.8\
+0 445.33 155.80 \
+461.00 C 159.98 \
+461.00 164.15 46\
+1.00 168.33 461.\
+00 C 168.33 456.\
+66 168.34 452.33\
+ 168.33 447.99 C\
+ 170.15 447.99 1\
+71.98 448.00 173\
+.80 448.00 C 173\
+.74 452.64 173.9\
+1 457.28 173.75 \
+461.92 C 173.81 \
+463.93 172.09 46\
+6.10 169.97 465.\
+97 C 164.66 466.\
+03 159.34 466.06\
+ 154.03 465.95 C\
+ 151.45 466.09 1\
+50.26 463.11 150\
+.35 460.94 C 150\
+.32 445.31 150.3\
+2 429.68 150.35 \
+414.06 Z\x22 />\x0a<pa\
+th fill=\x22#b0bec9\
+\x22 opacity=\x221.00\x22\
+ d=\x22 M 179.20 40\
+8.99 C 186.96 40\
+9.01 194.71 409.\
+00 202.46 409.00\
+ C 202.46 410.66\
+ 202.46 412.33 2\
+02.47 414.00 C 1\
+99.53 414.00 196\
+.59 414.00 193.6\
+6 414.00 C 193.6\
+7 431.33 193.66 \
+448.67 193.67 46\
+6.01 C 191.84 46\
+6.00 190.02 465.\
+99 188.20 466.00\
+ C 188.20 448.66\
+ 188.20 431.33 1\
+88.20 414.00 C 1\
+85.20 414.00 182\
+.20 414.00 179.2\
+1 414.01 C 179.2\
+0 412.33 179.20 \
+410.66 179.20 40\
+8.99 Z\x22 />\x0a<path\
  fill=\x22#b0bec9\x22 \
 opacity=\x221.00\x22 d\
-=\x22 M 150.35 414.\
-06 C 150.26 411.\
-89 151.45 408.90\
- 154.03 409.05 C\
- 159.34 408.94 1\
-64.66 408.96 169\
-.97 409.03 C 172\
-.09 408.89 173.8\
-1 411.06 173.75 \
-413.07 C 173.91 \
-417.38 173.75 42\
-1.69 173.80 426.\
-00 C 171.97 425.\
-99 170.15 426.00\
- 168.33 426.01 C\
- 168.34 422.00 1\
-68.33 418.00 168\
-.33 414.00 C 164\
-.15 414.00 159.9\
-8 414.00 155.80 \
-414.00 C 155.80 \
-429.67 155.80 44\
-5.33 155.80 461.\
-00 C 159.98 461.\
-00 164.15 461.00\
- 168.33 461.00 C\
- 168.33 456.66 1\
-68.34 452.33 168\
-.33 447.99 C 170\
-.15 447.99 171.9\
-8 448.00 173.80 \
-448.00 C 173.74 \
-452.64 173.91 45\
-7.28 173.75 461.\
-92 C 173.81 463.\
-93 172.09 466.10\
- 169.97 465.97 C\
- 164.66 466.03 1\
-59.34 466.06 154\
-.03 465.95 C 151\
-.45 466.09 150.2\
-6 463.11 150.35 \
-460.94 C 150.32 \
-445.31 150.32 42\
-9.68 150.35 414.\
-06 Z\x22 />\x0d\x0a<path \
-fill=\x22#b0bec9\x22 o\
-pacity=\x221.00\x22 d=\
-\x22 M 179.20 408.9\
-9 C 186.96 409.0\
-1 194.71 409.00 \
-202.46 409.00 C \
-202.46 410.66 20\
-2.46 412.33 202.\
-47 414.00 C 199.\
-53 414.00 196.59\
- 414.00 193.66 4\
-14.00 C 193.67 4\
-31.33 193.66 448\
-.67 193.67 466.0\
-1 C 191.84 466.0\
-0 190.02 465.99 \
-188.20 466.00 C \
-188.20 448.66 18\
-8.20 431.33 188.\
-20 414.00 C 185.\
-20 414.00 182.20\
- 414.00 179.21 4\
-14.01 C 179.20 4\
-12.33 179.20 410\
-.66 179.20 408.9\
-9 Z\x22 />\x0d\x0a<path f\
-ill=\x22#b0bec9\x22 op\
-acity=\x221.00\x22 d=\x22\
- M 208.33 408.99\
- C 215.61 409.07\
- 222.90 408.86 2\
-30.17 409.12 C 2\
-31.10 410.59 232\
-.24 412.10 231.9\
-7 413.95 C 231.8\
-0 421.50 232.28 \
-429.08 231.73 43\
-6.61 C 230.12 43\
-9.71 226.20 438.\
-90 223.34 439.08\
- C 226.62 448.02\
- 229.90 456.97 2\
-33.09 465.95 C 2\
-31.22 465.98 229\
-.34 466.00 227.4\
-7 466.03 C 223.9\
-8 455.38 220.09 \
-444.86 216.72 43\
-4.17 C 219.98 43\
-3.96 223.26 433.\
-98 226.53 434.00\
- C 226.53 427.33\
- 226.54 420.66 2\
-26.53 413.99 C 2\
-22.29 414.00 218\
-.04 414.00 213.8\
-0 414.00 C 213.8\
-0 431.33 213.79 \
-448.66 213.80 46\
-6.00 C 211.98 46\
-5.99 210.15 466.\
-00 208.33 466.01\
- C 208.34 447.00\
- 208.33 427.99 2\
-08.33 408.99 Z\x22 \
-/>\x0d\x0a<path fill=\x22\
-#b0bec9\x22 opacity\
-=\x221.00\x22 d=\x22 M 24\
-0.33 408.99 C 24\
-2.15 408.99 243.\
-98 409.00 245.80\
- 409.00 C 245.79\
- 426.34 245.80 4\
-43.67 245.80 461\
-.00 C 250.21 461\
-.00 254.62 461.0\
-0 259.03 461.00 \
-C 259.04 443.68 \
-259.06 426.35 25\
-9.02 409.02 C 26\
-0.83 409.01 262.\
-65 409.00 264.47\
- 409.00 C 264.46\
- 426.36 264.47 4\
-43.72 264.47 461\
-.08 C 264.71 463\
-.26 263.46 466.0\
-3 260.94 465.96 \
-C 255.30 466.04 \
-249.66 466.05 24\
-4.03 465.95 C 24\
-1.45 466.09 240.\
-26 463.11 240.35\
- 460.94 C 240.31\
- 443.63 240.35 4\
-26.31 240.33 408\
-.99 Z\x22 />\x0d\x0a<path\
+=\x22 M 208.33 408.\
+99 C 215.61 409.\
+07 222.90 408.86\
+ 230.17 409.12 C\
+ 231.10 410.59 2\
+32.24 412.10 231\
+.97 413.95 C 231\
+.80 421.50 232.2\
+8 429.08 231.73 \
+436.61 C 230.12 \
+439.71 226.20 43\
+8.90 223.34 439.\
+08 C 226.62 448.\
+02 229.90 456.97\
+ 233.09 465.95 C\
+ 231.22 465.98 2\
+29.34 466.00 227\
+.47 466.03 C 223\
+.98 455.38 220.0\
+9 444.86 216.72 \
+434.17 C 219.98 \
+433.96 223.26 43\
+3.98 226.53 434.\
+00 C 226.53 427.\
+33 226.54 420.66\
+ 226.53 413.99 C\
+ 222.29 414.00 2\
+18.04 414.00 213\
+.80 414.00 C 213\
+.80 431.33 213.7\
+9 448.66 213.80 \
+466.00 C 211.98 \
+465.99 210.15 46\
+6.00 208.33 466.\
+01 C 208.34 447.\
+00 208.33 427.99\
+ 208.33 408.99 Z\
+\x22 />\x0a<path fill=\
+\x22#b0bec9\x22 opacit\
+y=\x221.00\x22 d=\x22 M 2\
+40.33 408.99 C 2\
+42.15 408.99 243\
+.98 409.00 245.8\
+0 409.00 C 245.7\
+9 426.34 245.80 \
+443.67 245.80 46\
+1.00 C 250.21 46\
+1.00 254.62 461.\
+00 259.03 461.00\
+ C 259.04 443.68\
+ 259.06 426.35 2\
+59.02 409.02 C 2\
+60.83 409.01 262\
+.65 409.00 264.4\
+7 409.00 C 264.4\
+6 426.36 264.47 \
+443.72 264.47 46\
+1.08 C 264.71 46\
+3.26 263.46 466.\
+03 260.94 465.96\
+ C 255.30 466.04\
+ 249.66 466.05 2\
+44.03 465.95 C 2\
+41.45 466.09 240\
+.26 463.11 240.3\
+5 460.94 C 240.3\
+1 443.63 240.35 \
+426.31 240.33 40\
+8.99 Z\x22 />\x0a<path\
  fill=\x22#b0bec9\x22 \
 opacity=\x221.00\x22 d\
 =\x22 M 273.33 409.\
@@ -3186,377 +3224,376 @@ opacity=\x221.00\x22 d\
 00 C 273.34 447.\
 00 273.33 428.01\
  273.33 409.01 Z\
-\x22 />\x0d\x0a<path fill\
-=\x22#b0bec9\x22 opaci\
-ty=\x221.00\x22 d=\x22 M \
-11.34 499.00 C 1\
-2.73 498.99 14.1\
-3 498.99 15.53 4\
-98.99 C 20.40 51\
-2.71 25.68 526.2\
-9 30.37 540.07 C\
- 30.29 526.38 30\
-.36 512.69 30.33\
- 499.00 C 32.04 \
-498.99 33.75 498\
-.99 35.46 499.00\
- C 35.47 518.00 \
-35.45 536.99 35.\
-48 555.99 C 34.1\
-7 556.03 32.87 5\
-56.02 31.57 555.\
-97 C 26.57 542.1\
-2 21.37 528.34 1\
-6.47 514.46 C 16\
-.46 528.30 16.47\
- 542.15 16.46 55\
-6.00 C 14.75 555\
-.99 13.04 555.99\
- 11.33 556.00 C \
-11.34 537.00 11.\
-33 518.00 11.34 \
-499.00 Z\x22 />\x0d\x0a<p\
-ath fill=\x22#b0bec\
-9\x22 opacity=\x221.00\
-\x22 d=\x22 M 46.42 49\
-9.35 C 52.53 498\
-.55 58.80 499.16\
- 64.97 499.02 C \
-67.60 498.73 69.\
-25 501.62 68.95 \
-503.96 C 68.97 5\
-19.65 68.97 535.\
-35 68.95 551.04 \
-C 69.25 553.38 6\
-7.60 556.26 64.9\
-7 555.98 C 59.32\
- 556.02 53.67 55\
-6.06 48.03 555.9\
-5 C 45.45 556.09\
- 44.26 553.11 44\
-.35 550.94 C 44.\
-30 535.62 44.36 \
-520.29 44.32 504\
-.96 C 44.24 502.\
-91 44.64 500.63 \
-46.42 499.35 M 4\
-9.80 504.00 C 49\
-.80 519.66 49.80\
- 535.33 49.80 55\
-1.00 C 54.38 551\
-.00 58.95 550.99\
- 63.53 551.01 C \
-63.54 535.34 63.\
-54 519.66 63.53 \
-503.99 C 58.95 5\
-04.01 54.38 504.\
-00 49.80 504.00 \
-Z\x22 />\x0d\x0a<path fil\
-l=\x22#b0bec9\x22 opac\
-ity=\x221.00\x22 d=\x22 M\
- 74.20 498.99 C \
-81.96 499.01 89.\
-71 499.00 97.46 \
-499.00 C 97.46 5\
-00.66 97.46 502.\
-33 97.47 504.00 \
-C 94.53 504.00 9\
-1.60 504.00 88.6\
-6 504.00 C 88.67\
- 521.33 88.66 53\
-8.67 88.67 556.0\
-1 C 86.84 556.00\
- 85.02 555.99 83\
-.20 556.00 C 83.\
-20 538.66 83.20 \
-521.33 83.20 504\
-.00 C 80.20 504.\
-00 77.20 504.00 \
-74.21 504.01 C 7\
-4.20 502.33 74.2\
-0 500.66 74.20 4\
-98.99 Z\x22 />\x0d\x0a<pa\
-th fill=\x22#b0bec9\
-\x22 opacity=\x221.00\x22\
- d=\x22 M 126.45 49\
-8.98 C 128.22 49\
-8.99 129.99 498.\
-99 131.77 499.01\
- C 135.24 517.99\
- 138.50 537.01 1\
-41.95 556.00 C 1\
-40.14 556.00 138\
-.34 556.00 136.5\
-4 556.00 C 135.9\
-1 552.00 135.21 \
-548.01 134.57 54\
-4.02 C 130.83 54\
-3.99 127.09 543.\
-98 123.35 544.03\
- C 122.74 548.02\
- 122.00 552.00 1\
-21.40 556.00 C 1\
-19.64 556.00 117\
-.88 556.00 116.1\
-2 556.00 C 119.6\
-4 537.01 122.99 \
-517.99 126.45 49\
-8.98 M 129.01 50\
-8.84 C 127.37 51\
-8.90 125.75 528.\
-96 124.00 539.00\
- C 127.33 538.99\
- 130.66 538.99 1\
-34.00 539.01 C 1\
-32.22 528.97 130\
-.69 518.89 129.0\
-1 508.84 Z\x22 />\x0d\x0a\
-<path fill=\x22#b0b\
-ec9\x22 opacity=\x221.\
-00\x22 d=\x22 M 146.16\
- 499.01 C 147.96\
- 499.00 149.77 4\
-98.99 151.57 498\
-.99 C 153.88 514\
-.30 156.36 529.5\
-7 158.59 544.89 \
-C 161.18 529.62 \
-163.44 514.30 16\
-5.77 498.99 C 16\
-7.51 498.99 169.\
-26 499.01 171.00\
- 499.04 C 167.69\
- 518.03 164.39 5\
-37.01 161.14 556\
-.01 C 159.45 555\
-.99 157.77 555.9\
-9 156.08 555.99 \
-C 152.72 537.01 \
-149.56 517.99 14\
-6.16 499.01 Z\x22 /\
->\x0d\x0a<path fill=\x22#\
-b0bec9\x22 opacity=\
-\x221.00\x22 d=\x22 M 185\
-.45 498.98 C 187\
-.22 498.99 188.9\
-9 498.99 190.77 \
-499.01 C 194.24 \
-517.99 197.50 53\
-7.01 200.95 556.\
-00 C 199.14 555.\
-99 197.34 556.00\
- 195.54 556.01 C\
- 194.91 552.00 1\
-94.21 548.01 193\
-.57 544.02 C 189\
-.83 543.99 186.0\
-9 543.98 182.35 \
-544.03 C 181.74 \
-548.02 181.00 55\
-2.00 180.40 556.\
-00 C 178.63 556.\
-00 176.88 556.00\
- 175.12 556.00 C\
- 178.64 537.01 1\
-81.99 517.99 185\
-.45 498.98 M 188\
-.01 508.84 C 186\
-.37 518.90 184.7\
-5 528.96 183.00 \
-539.01 C 186.33 \
-538.99 189.66 53\
-8.99 193.00 539.\
-01 C 191.22 528.\
-97 189.69 518.89\
- 188.01 508.84 Z\
-\x22 />\x0d\x0a<path fill\
-=\x22#b0bec9\x22 opaci\
-ty=\x221.00\x22 d=\x22 M \
-207.73 499.00 C \
-209.49 498.99 21\
-1.24 498.99 213.\
-00 499.00 C 213.\
-00 518.00 213.00\
- 537.00 213.00 5\
-56.00 C 211.24 5\
-55.99 209.49 555\
-.99 207.73 556.0\
-0 C 207.74 537.0\
-0 207.74 518.00 \
-207.73 499.00 Z\x22\
- />\x0d\x0a<path fill=\
+\x22 />\x0a<path fill=\
 \x22#b0bec9\x22 opacit\
-y=\x221.00\x22 d=\x22 M 2\
-22.33 498.99 C 2\
-24.15 498.99 225\
-.98 498.99 227.8\
-0 499.00 C 227.7\
-9 516.34 227.80 \
-533.67 227.80 55\
-1.00 C 232.20 55\
-0.99 236.60 551.\
-00 241.00 551.00\
- C 240.99 552.66\
- 241.00 554.33 2\
-41.00 556.00 C 2\
-34.78 556.00 228\
-.56 555.99 222.3\
-4 556.01 C 222.3\
-3 537.00 222.34 \
-518.00 222.33 49\
-8.99 Z\x22 />\x0d\x0a<pat\
+y=\x221.00\x22 d=\x22 M 1\
+1.34 499.00 C 12\
+.73 498.99 14.13\
+ 498.99 15.53 49\
+8.99 C 20.40 512\
+.71 25.68 526.29\
+ 30.37 540.07 C \
+30.29 526.38 30.\
+36 512.69 30.33 \
+499.00 C 32.04 4\
+98.99 33.75 498.\
+99 35.46 499.00 \
+C 35.47 518.00 3\
+5.45 536.99 35.4\
+8 555.99 C 34.17\
+ 556.03 32.87 55\
+6.02 31.57 555.9\
+7 C 26.57 542.12\
+ 21.37 528.34 16\
+.47 514.46 C 16.\
+46 528.30 16.47 \
+542.15 16.46 556\
+.00 C 14.75 555.\
+99 13.04 555.99 \
+11.33 556.00 C 1\
+1.34 537.00 11.3\
+3 518.00 11.34 4\
+99.00 Z\x22 />\x0a<pat\
 h fill=\x22#b0bec9\x22\
  opacity=\x221.00\x22 \
-d=\x22 M 255.45 498\
-.98 C 257.22 498\
-.99 258.99 498.9\
-9 260.77 499.01 \
-C 264.24 517.99 \
-267.50 537.01 27\
-0.95 556.00 C 26\
-9.14 556.00 267.\
-34 556.00 265.54\
- 556.00 C 264.91\
- 552.00 264.21 5\
-48.01 263.57 544\
-.02 C 259.83 543\
-.99 256.09 543.9\
-8 252.35 544.03 \
-C 251.73 548.02 \
-251.00 552.00 25\
-0.40 556.00 C 24\
-8.63 556.00 246.\
-87 556.00 245.12\
- 556.00 C 248.64\
- 537.01 251.99 5\
-17.99 255.45 498\
-.98 M 258.01 508\
-.84 C 256.37 518\
-.90 254.75 528.9\
-6 253.00 539.01 \
-C 256.33 538.99 \
-259.66 538.99 26\
-3.00 539.01 C 26\
-1.22 528.97 259.\
-69 518.89 258.01\
- 508.84 Z\x22 />\x0d\x0a<\
-path fill=\x22#b0be\
-c9\x22 opacity=\x221.0\
-0\x22 d=\x22 M 277.34 \
-498.99 C 283.88 \
-499.06 290.44 49\
-8.90 296.98 499.\
-04 C 299.61 498.\
-94 300.86 501.80\
- 300.66 504.06 C\
- 300.62 510.25 3\
-00.81 516.46 300\
-.57 522.65 C 299\
-.70 525.21 296.6\
-1 525.51 294.47 \
-526.51 C 296.51 \
-527.42 298.91 52\
-7.85 300.53 529.\
-50 C 301.16 536.\
-63 300.64 543.86\
- 300.79 551.03 C\
- 301.05 553.30 2\
-99.55 556.21 296\
-.96 555.97 C 290\
-.42 556.08 283.8\
-8 555.95 277.34 \
-556.01 C 277.33 \
-537.00 277.33 51\
-8.00 277.34 498.\
-99 M 282.80 504.\
-00 C 282.80 510.\
-67 282.80 517.34\
- 282.80 524.01 C\
- 285.13 523.98 2\
-87.48 524.12 289\
-.81 523.90 C 291\
-.77 523.08 293.4\
-4 521.73 295.24 \
-520.62 C 295.16 \
-515.08 295.21 50\
-9.54 295.20 504.\
-00 C 291.07 504.\
-00 286.93 504.00\
- 282.80 504.00 M\
- 282.80 528.99 C\
- 282.80 536.33 2\
-82.80 543.66 282\
-.80 551.00 C 286\
-.98 551.00 291.1\
-5 550.99 295.33 \
-551.00 C 295.34 \
-544.75 295.31 53\
-8.50 295.36 532.\
-25 C 294.21 531.\
-50 293.08 530.74\
- 291.90 530.05 C\
- 289.23 528.21 2\
-85.81 529.24 282\
-.80 528.99 Z\x22 />\
-\x0d\x0a<path fill=\x22#b\
-0bec9\x22 opacity=\x22\
-1.00\x22 d=\x22 M 309.\
-33 498.99 C 311.\
-15 498.99 312.97\
- 498.99 314.80 4\
-99.00 C 314.79 5\
-16.34 314.80 533\
-.67 314.80 551.0\
-0 C 319.20 550.9\
-9 323.60 551.00 \
-328.00 551.00 C \
-327.99 552.66 32\
-7.99 554.33 328.\
-00 556.00 C 321.\
-78 556.00 315.56\
- 555.99 309.34 5\
-56.01 C 309.33 5\
-37.00 309.34 518\
-.00 309.33 498.9\
-9 Z\x22 />\x0d\x0a<path f\
+d=\x22 M 46.42 499.\
+35 C 52.53 498.5\
+5 58.80 499.16 6\
+4.97 499.02 C 67\
+.60 498.73 69.25\
+ 501.62 68.95 50\
+3.96 C 68.97 519\
+.65 68.97 535.35\
+ 68.95 551.04 C \
+69.25 553.38 67.\
+60 556.26 64.97 \
+555.98 C 59.32 5\
+56.02 53.67 556.\
+06 48.03 555.95 \
+C 45.45 556.09 4\
+4.26 553.11 44.3\
+5 550.94 C 44.30\
+ 535.62 44.36 52\
+0.29 44.32 504.9\
+6 C 44.24 502.91\
+ 44.64 500.63 46\
+.42 499.35 M 49.\
+80 504.00 C 49.8\
+0 519.66 49.80 5\
+35.33 49.80 551.\
+00 C 54.38 551.0\
+0 58.95 550.99 6\
+3.53 551.01 C 63\
+.54 535.34 63.54\
+ 519.66 63.53 50\
+3.99 C 58.95 504\
+.01 54.38 504.00\
+ 49.80 504.00 Z\x22\
+ />\x0a<path fill=\x22\
+#b0bec9\x22 opacity\
+=\x221.00\x22 d=\x22 M 74\
+.20 498.99 C 81.\
+96 499.01 89.71 \
+499.00 97.46 499\
+.00 C 97.46 500.\
+66 97.46 502.33 \
+97.47 504.00 C 9\
+4.53 504.00 91.6\
+0 504.00 88.66 5\
+04.00 C 88.67 52\
+1.33 88.66 538.6\
+7 88.67 556.01 C\
+ 86.84 556.00 85\
+.02 555.99 83.20\
+ 556.00 C 83.20 \
+538.66 83.20 521\
+.33 83.20 504.00\
+ C 80.20 504.00 \
+77.20 504.00 74.\
+21 504.01 C 74.2\
+0 502.33 74.20 5\
+00.66 74.20 498.\
+99 Z\x22 />\x0a<path f\
 ill=\x22#b0bec9\x22 op\
 acity=\x221.00\x22 d=\x22\
- M 334.34 498.99\
- C 340.71 499.01\
- 347.09 499.00 3\
-53.46 499.00 C 3\
-53.46 500.66 353\
-.46 502.33 353.4\
-6 504.00 C 348.9\
-1 504.00 344.35 \
-504.00 339.80 50\
-4.00 C 339.80 51\
-1.00 339.80 518.\
-00 339.80 525.00\
- C 343.86 524.99\
- 347.93 525.00 3\
-52.00 525.00 C 3\
-51.99 526.66 351\
-.99 528.33 352.0\
-0 530.00 C 347.9\
-3 529.99 343.86 \
-530.00 339.80 53\
-0.00 C 339.80 53\
-7.00 339.80 544.\
-00 339.80 551.00\
- C 344.42 550.99\
- 349.04 551.01 3\
-53.66 550.98 C 3\
-53.66 552.65 353\
-.66 554.33 353.6\
-6 556.02 C 347.2\
-2 555.98 340.78 \
-556.00 334.34 55\
-6.01 C 334.33 53\
-7.00 334.33 518.\
-00 334.34 498.99\
- Z\x22 />\x0d\x0a</g>\x0d\x0a</\
-svg>\x0d\x0a\
+ M 126.45 498.98\
+ C 128.22 498.99\
+ 129.99 498.99 1\
+31.77 499.01 C 1\
+35.24 517.99 138\
+.50 537.01 141.9\
+5 556.00 C 140.1\
+4 556.00 138.34 \
+556.00 136.54 55\
+6.00 C 135.91 55\
+2.00 135.21 548.\
+01 134.57 544.02\
+ C 130.83 543.99\
+ 127.09 543.98 1\
+23.35 544.03 C 1\
+22.74 548.02 122\
+.00 552.00 121.4\
+0 556.00 C 119.6\
+4 556.00 117.88 \
+556.00 116.12 55\
+6.00 C 119.64 53\
+7.01 122.99 517.\
+99 126.45 498.98\
+ M 129.01 508.84\
+ C 127.37 518.90\
+ 125.75 528.96 1\
+24.00 539.00 C 1\
+27.33 538.99 130\
+.66 538.99 134.0\
+0 539.01 C 132.2\
+2 528.97 130.69 \
+518.89 129.01 50\
+8.84 Z\x22 />\x0a<path\
+ fill=\x22#b0bec9\x22 \
+opacity=\x221.00\x22 d\
+=\x22 M 146.16 499.\
+01 C 147.96 499.\
+00 149.77 498.99\
+ 151.57 498.99 C\
+ 153.88 514.30 1\
+56.36 529.57 158\
+.59 544.89 C 161\
+.18 529.62 163.4\
+4 514.30 165.77 \
+498.99 C 167.51 \
+498.99 169.26 49\
+9.01 171.00 499.\
+04 C 167.69 518.\
+03 164.39 537.01\
+ 161.14 556.01 C\
+ 159.45 555.99 1\
+57.77 555.99 156\
+.08 555.99 C 152\
+.72 537.01 149.5\
+6 517.99 146.16 \
+499.01 Z\x22 />\x0a<pa\
+th fill=\x22#b0bec9\
+\x22 opacity=\x221.00\x22\
+ d=\x22 M 185.45 49\
+8.98 C 187.22 49\
+8.99 188.99 498.\
+99 190.77 499.01\
+ C 194.24 517.99\
+ 197.50 537.01 2\
+00.95 556.00 C 1\
+99.14 555.99 197\
+.34 556.00 195.5\
+4 556.01 C 194.9\
+1 552.00 194.21 \
+548.01 193.57 54\
+4.02 C 189.83 54\
+3.99 186.09 543.\
+98 182.35 544.03\
+ C 181.74 548.02\
+ 181.00 552.00 1\
+80.40 556.00 C 1\
+78.63 556.00 176\
+.88 556.00 175.1\
+2 556.00 C 178.6\
+4 537.01 181.99 \
+517.99 185.45 49\
+8.98 M 188.01 50\
+8.84 C 186.37 51\
+8.90 184.75 528.\
+96 183.00 539.01\
+ C 186.33 538.99\
+ 189.66 538.99 1\
+93.00 539.01 C 1\
+91.22 528.97 189\
+.69 518.89 188.0\
+1 508.84 Z\x22 />\x0a<\
+path fill=\x22#b0be\
+c9\x22 opacity=\x221.0\
+0\x22 d=\x22 M 207.73 \
+499.00 C 209.49 \
+498.99 211.24 49\
+8.99 213.00 499.\
+00 C 213.00 518.\
+00 213.00 537.00\
+ 213.00 556.00 C\
+ 211.24 555.99 2\
+09.49 555.99 207\
+.73 556.00 C 207\
+.74 537.00 207.7\
+4 518.00 207.73 \
+499.00 Z\x22 />\x0a<pa\
+th fill=\x22#b0bec9\
+\x22 opacity=\x221.00\x22\
+ d=\x22 M 222.33 49\
+8.99 C 224.15 49\
+8.99 225.98 498.\
+99 227.80 499.00\
+ C 227.79 516.34\
+ 227.80 533.67 2\
+27.80 551.00 C 2\
+32.20 550.99 236\
+.60 551.00 241.0\
+0 551.00 C 240.9\
+9 552.66 241.00 \
+554.33 241.00 55\
+6.00 C 234.78 55\
+6.00 228.56 555.\
+99 222.34 556.01\
+ C 222.33 537.00\
+ 222.34 518.00 2\
+22.33 498.99 Z\x22 \
+/>\x0a<path fill=\x22#\
+b0bec9\x22 opacity=\
+\x221.00\x22 d=\x22 M 255\
+.45 498.98 C 257\
+.22 498.99 258.9\
+9 498.99 260.77 \
+499.01 C 264.24 \
+517.99 267.50 53\
+7.01 270.95 556.\
+00 C 269.14 556.\
+00 267.34 556.00\
+ 265.54 556.00 C\
+ 264.91 552.00 2\
+64.21 548.01 263\
+.57 544.02 C 259\
+.83 543.99 256.0\
+9 543.98 252.35 \
+544.03 C 251.73 \
+548.02 251.00 55\
+2.00 250.40 556.\
+00 C 248.63 556.\
+00 246.87 556.00\
+ 245.12 556.00 C\
+ 248.64 537.01 2\
+51.99 517.99 255\
+.45 498.98 M 258\
+.01 508.84 C 256\
+.37 518.90 254.7\
+5 528.96 253.00 \
+539.01 C 256.33 \
+538.99 259.66 53\
+8.99 263.00 539.\
+01 C 261.22 528.\
+97 259.69 518.89\
+ 258.01 508.84 Z\
+\x22 />\x0a<path fill=\
+\x22#b0bec9\x22 opacit\
+y=\x221.00\x22 d=\x22 M 2\
+77.34 498.99 C 2\
+83.88 499.06 290\
+.44 498.90 296.9\
+8 499.04 C 299.6\
+1 498.94 300.86 \
+501.80 300.66 50\
+4.06 C 300.62 51\
+0.25 300.81 516.\
+46 300.57 522.65\
+ C 299.70 525.21\
+ 296.61 525.51 2\
+94.47 526.51 C 2\
+96.51 527.42 298\
+.91 527.85 300.5\
+3 529.50 C 301.1\
+6 536.63 300.64 \
+543.86 300.79 55\
+1.03 C 301.05 55\
+3.30 299.55 556.\
+21 296.96 555.97\
+ C 290.42 556.08\
+ 283.88 555.95 2\
+77.34 556.01 C 2\
+77.33 537.00 277\
+.33 518.00 277.3\
+4 498.99 M 282.8\
+0 504.00 C 282.8\
+0 510.67 282.80 \
+517.34 282.80 52\
+4.01 C 285.13 52\
+3.98 287.48 524.\
+12 289.81 523.90\
+ C 291.77 523.08\
+ 293.44 521.73 2\
+95.24 520.62 C 2\
+95.16 515.08 295\
+.21 509.54 295.2\
+0 504.00 C 291.0\
+7 504.00 286.93 \
+504.00 282.80 50\
+4.00 M 282.80 52\
+8.99 C 282.80 53\
+6.33 282.80 543.\
+66 282.80 551.00\
+ C 286.98 551.00\
+ 291.15 550.99 2\
+95.33 551.00 C 2\
+95.34 544.75 295\
+.31 538.50 295.3\
+6 532.25 C 294.2\
+1 531.50 293.08 \
+530.74 291.90 53\
+0.05 C 289.23 52\
+8.21 285.81 529.\
+24 282.80 528.99\
+ Z\x22 />\x0a<path fil\
+l=\x22#b0bec9\x22 opac\
+ity=\x221.00\x22 d=\x22 M\
+ 309.33 498.99 C\
+ 311.15 498.99 3\
+12.97 498.99 314\
+.80 499.00 C 314\
+.79 516.34 314.8\
+0 533.67 314.80 \
+551.00 C 319.20 \
+550.99 323.60 55\
+1.00 328.00 551.\
+00 C 327.99 552.\
+66 327.99 554.33\
+ 328.00 556.00 C\
+ 321.78 556.00 3\
+15.56 555.99 309\
+.34 556.01 C 309\
+.33 537.00 309.3\
+4 518.00 309.33 \
+498.99 Z\x22 />\x0a<pa\
+th fill=\x22#b0bec9\
+\x22 opacity=\x221.00\x22\
+ d=\x22 M 334.34 49\
+8.99 C 340.71 49\
+9.01 347.09 499.\
+00 353.46 499.00\
+ C 353.46 500.66\
+ 353.46 502.33 3\
+53.46 504.00 C 3\
+48.91 504.00 344\
+.35 504.00 339.8\
+0 504.00 C 339.8\
+0 511.00 339.80 \
+518.00 339.80 52\
+5.00 C 343.86 52\
+4.99 347.93 525.\
+00 352.00 525.00\
+ C 351.99 526.66\
+ 351.99 528.33 3\
+52.00 530.00 C 3\
+47.93 529.99 343\
+.86 530.00 339.8\
+0 530.00 C 339.8\
+0 537.00 339.80 \
+544.00 339.80 55\
+1.00 C 344.42 55\
+0.99 349.04 551.\
+01 353.66 550.98\
+ C 353.66 552.65\
+ 353.66 554.33 3\
+53.66 556.02 C 3\
+47.22 555.98 340\
+.78 556.00 334.3\
+4 556.01 C 334.3\
+3 537.00 334.33 \
+518.00 334.34 49\
+8.99 Z\x22 />\x0a</g>\x0a\
+</svg>\x0a\
 \x00\x00\x07\xfc\
 <\
 svg xmlns=\x22http:\
@@ -3687,1575 +3724,1409 @@ l1.432 2.567-9.9\
 -13.424-18.097-2\
 9.831z\x22 fill=\x22#f\
 ff\x22/></svg>\
-\x00\x00a\xeb\
-\x00\
-\x03\x02\xc3x\xda\xec]\x05X\x94O\x13\x7f\x01\x01\x05\
-\x15\x15\x15\x11\x05\xc5\xc2\x04,\x0cB1\x11\xb1\x05\x03\
-\xb1\x15T@\x0c\xb0\xc5n\xc1nT\xec\x16\x15\x15\xc4\
-V\xc2\x00\x14\xa5\x9b\x03.8\xae;\xf8v\xfd\x1f~\
-\xe7qI\xde\xc1\xed\xf3\x8c\x1ewo\xec\xce\xee\xce\xfc\
-fvv\x16A4\x10=\xa4E\x0b\x04\xfc\xdf\x09\xf1\
-l\x84 7\x11\x04i\xd7\xee\xbf\xbf\xf77A\x90\xe6\
-\xda\x08\xd2\xa9\xd3\x7f\x7f\xdf\x06\xd7\x9dn\x8e VV\
-\x82\xbf\xbb!\x88\xbd\x19\x82\x8c\x18\xf1\xdf\xdf\x16\x8e\x08\
-R4\x1aA\xc6\x8f\x17\xdc?\x03\xdc\xbf\x0fA\xa6L\
-\xf9\xefo\xf4rp\x7f\x06\x82,X \xb8\xff$\x82\
-l\x1b\xa5\x81\x04\x06\x0a\xeeo\xac\x81tO\xd5@`\
-\x81\x7f\xaf7G\x90I\xb9\x9a\x88\x05\xf8\x1b\xbc\x1a|\
-\xf3\xdf\xf7\x7f\x0a\xa8\xeb\xc7\xe6\xff\x91P\x99\x0a(\x0d\
-P\x99\x04\xe2\x8b\xa12\xc1=R\xefm\xd1\xa2\x05\x17\
-\x92\x94g\xa7\x09=\xaf\xc2{\xf7\xed\xdb\xc7\xda\xbf\x7f\
-?[\xda5\x92~\x1b6l\x18\x07\x8f\xc7\xf3 \x0d\
-\x1d:\x94\xa3\xc8\xfdzzz\xbc\xb0\xb00V\x99\xa0\
-<~\xfc\x98\xd9\xa4I\x13\xae\x84\xfb+<\xb7U\xab\
-V\x9c\xcf\x9f?\xb3\xcb\xef\x87\x9f[\xb6l\xc9\x96\xe7\
-~sss\xae\x8f\x8f\x0fs\xce\x9c9,\x06\x83\xc1\
-\xa7\xd3\xe9|\xf8\x19|\xc7\x80\xbf\xc9\xb8\x9f\x7f\xf8\xf0\
-aVbb\x22\xdb\xc8\xc8\x88s\xe3\xc6\x0d\xce\xf5\xeb\
-\xd7\xd9\xed\xda\xb5\xe3\xc0\xef\xc0o\xa2\xbc\xacp\xff\xc1\
-\x83\x07Y\x19\x19\x19\x1cSSSn\xa7N\x9d8\x90\
-\xe0g\xf8\xdd\xa1C\x87d\xdd_fff\xc6MI\
-I\xe1\x1c=z\xb4\xfcZ>\xfc\x0c\xbf\x83\xbf\xc9\xc3\
-\xbf%K\x96\xb0\xd1h4\x17\xf6\x1b$\xf8\x19~'\
-o\xff5m\xda\x94\xf7\xf2\xe5K\xce\x9b7o\xd8\x90\
-\xe0g\xf8\x9d\x22\xe3\xc7\xde\xde\x9eC \x10\xb8\x90\xe0\
-gE\xc7\x9f\x86\x86\x06?((\x88\x05\x88\x0d?K\
-\xb9_\xe2\xfci\xdd\xba5\x07\x90\xb4\xf9\x93*\x98\x83\
-\xa9\x12\xe6\xa94\x82\xf7LA\xaaX\xa0\x9c\x01\xa2\x0f\
-\xb1\x12\x963M\xc4\xca\x99\xc6\x80\xfc\x00\xe5K\x99\xcf\
-\xd2d\x8e8\xca\x17<\xb3\xfc\xd9\x14\x19\xcf\xad\x0c\xc1\
-g\xae\x06\x94'\xef=`\xbe0\xc1Xg)\xf0\x0e\
-\xf8l\x9e<\xd7jkk\xf3BCC\xe9\x80\x98\xf0\
-\xb3\x9c\xcf\xe7\xc9\xc1\xf3?4y\xf2d&\x909\x5c\
-@<\xf0Y\xde6\xf0\xe5y>\x1c\xcf111\x7f\
-\xe5jtt4\xd3\xd0\xd0\x90SM\xcf\xe7o\xd8\xb0\
-\x81\x06\x1e\xcb/\xfb\x7f\xe1\xf9\xfb\xfb\xd3\x14\x18o\x12\
-\xaf166\x86r\x91Q&R\xd2\xd3\xd3\xe9@\xd6\
-2\xab\xf8|\xbe\xae\xae.\xe7\xda\xb5k\x15\x9e\x0f\xfa\
-\x99\x01\x7f\x93u\xbf\xb4\xf7\xbb\xb8\xb80&L\x98\xc0\
-\xe8\xdd\xbb7\x0b\x85Bq\xca\x9f]PP\xc0\xe9\xd5\
-\xab\x17k\xfc\xf8\xf1tgggze\x9e\xdf\xb6m\
-[N||<\xeb\xcb\x97/L\x03\x03\x03v@@\
-\x00S\xd0\x07|\xc0{&\xd0\xff\xec\xaf_\xbf\xb2\xc0\
-5\x7ft\x92\x82\xcf\xff\xdb\xa7QQQL\xa0\x97\xb9\
-`\xbcp\xc1\xbb\xd8qqq,\xf8\x19~\xf7\xfa\xf5\
-\xeb?\xef\xdc\xb8q#S\xc2\xb3$>\x1f\xd4\x97\x0e\
-\xef\x05\xcf`5k\xd6\xec\x8f\xac\x1d;v,s\xcc\
-\x981\x0c\xf8\x19~\x07t\x08\x1c\xb3\xb0.\x0c\x05\x9f\
-\xff\x87?\xa0\xbe\x7f\xee_\xbe|9St<xz\
-z\xfe\xa9;\xbc\x06^[\x99\xfe\x9d>}:\x93\xcd\
-f\xf3\xd2\xd2\xd2\xd8\x9d;w\xe6\x08a\x096\x18\x9f\
-l\xf8\x1b\xbc\xa6\xb2\xe3\x13\x8c?\xde\xad[\xb7\xfe\xd4\
-388\x98\x09\xf5\x19$\xf8\x19~\x07\x7f\xd3\xd1\xd1\
-\xe1Ue~\xf5\xef\xdf\x1f\xea|\x0e\x89D\xe2\xda\xd9\
-\xd9\xb1lmmY\xf03\xfc\xce\xda\xda\x9a]\x1d\xf2\
-a\xfb\xf6\xed\x7f\xea\xfb\xfe\xfd{&$\xf8\x19~W\
-\x1d\xf2\x01\x12\xc4Y\xdf\xbf\x7f\xff\x8b\xfb\xe0g\xf8]\
-u\xc9OHnnnL\x16\x8b\xc5\x83\xe4\xea\xea\xca\
-T@>\xcb\xa5+\x1a7n\xcc\xbb\x7f\xff>\x03\x10\
-\x13\xf6\xbb\x02\xfa%_^}\xd7\xbd{wF\x8f\x1e\
-=\x98\x0a\xe8\xc7\x5c\x81\x0e\xae)\xfd\xee\x0bHW\xf0\
-\x8e\x5c!}Y\x15\xe2\x09\x9eU\xfe\xec\x1a-\x16\x02\
-[o\x840\x0ek!\x16\x87\xc1b\x04\xe8  \x94\
-\xbc\xe3\xae\x0a<(\x10\xbc\xcbH\xe8\xddw\x15xo\
-u\x10_\xf0N\xf8\xee\x03\xb5\xfcn\xe1:\x1c\x10\xf0\
-\xa3R\xcf\x002\x92\x0a\x88V\x85:\xc09\xca\xad\xcc\
-\xbd\xc0~\xe2DFFR\x011\xca\xf5d%\x88+\
-\xaf\x1c\x12\xe5\xdd\xb2e\xcb\xa8\x5c.\x97\x07\x09|\xa6\
-W\xb2\x0f\xf9\x95y?\xd0\xa3,\xa0[\x99\xe5r\x1d\
-~\x06z\x96U\xc9\xf7+To\xa0gy\xc7\x8f\x1f\
-\xa7\x8a\xe0Z\xa8{\xa9\xf0\xb7\x9a~\xbf\x83\x83\x03\x95\
-H$\xb2Eq)\xb0\x8bY@OSk\xf2\xfd`\
-\x9c\xb1\xc0x\xa3\x94I(\xc0\xae'\xe9\xeb\xeb3k\
-\xea\xfd\x1d;v\xa4\xe7\xe4\xe4\xd0%\xbd?;;\x9b\
-fbbB\xab\x89\xf7\x0b\xfa\x16\xda/\xb0\xfd<1\
-\xaf\xe7\xad_\xbf\x9e*\x18\xcf\xdc\xea|?\xb4+}\
-||\xc8\xc0\x8e\xfd\xe3\xb7\x02vZ\x05\x1e|\xfe\xfc\
-\x99\x01\xb1=\xb8\x86\xb5b\xc5\x8aR9mQ\xb9\xda\
-\x0e\xf07\x83J\xa5B\x7f\x15\xe4-\x0f\xd8/t\x1a\
-\x8d\xc6-\x7f7\xfc<q\xe2D(\x03xG\x8e\x1c\
-\xa1\xc1k\xe1=\xd5\xf1~h\xc3\xbc}\xfb\x96.\xe8\
-_F\xfb\xf6\xed\x19ZZZ\xbc+W\xae\xfc\xe5A\
-HH\x08\x1d~\x07\xfa\x9e\x09\xc6\xc7\x1f\xb9\x00\xee\x81\
-\xfc\xe0T\xf1\xfd\xd0F \xf1\xf9\xfc?m\xbdp\xe1\
-\x02\xbdQ\xa3F\x7f\xf8*\xb0\xdd\xd8\xc0fc\x01\x9b\
-\xed\xcf\x98\x87\xbf]\xbcx\x91\xf6G \xf0\xf9</\
-//ZU\xecD\xc1\xfb)\xf0Y\xe5\xef\xd7\xd4\xd4\
-,\xefW\xbe\x9f\x9f\x1f\xd5\xd7\xd7\x97R\xfe\x1c\xc8\x83\
-\xf2\xf7\xf3@\x01\xf7R\xab\xf8\xfe?\xfc\x07\xb6\xd8\x1f\
-^\x93\xc9dN\xb9\x1d&\xb0C8\x02[\xb8|\x9c\
-\xd0\xe15\xf0ZxO\xf3\xe6\xcd9\xd51\xfe\xc0;\
-\xff>\x17\xd8~\x0cP'\x8e\x98zr`\x9f\x97\xd7\
-s\xf4\xe8\xd1\xf4\xea\x9a\x7f\x90\xafg\xcf\x9e\xfd\xcb\xd7\
-U\xabV\x89\xea;\xbe\xb7\xb77\x0d\xfe\x06\xaf\x81\xd7\
-\xc2{\xaaS\xfe\x00\x8c\xce\x02\xe3\xff\x8f\xaf&33\
-\x93\xd5\xb5k\xd7\xbf\xfa\x0e~\xce\xca\xcab\x09\xe6\x08\
-\x0b\x5c\xcb\xac\x01\xf9\xcb_\xbdz5\xad|,\x9e>\
-}\xfa\xcfX\x84\x04>\xd3\xfe\x1b\xf2|\x1e\x18\x8f\xf4\
-J`X\xb9\xe45\x9c\xcf\xc0N\xfc\xd3\xc7\xc0\x16\xe5\
-\x8c\x1c9\x921b\xc4\x08\x06\xfc\x0c\xbf\x83\xbf\xc91\
-\xe7\xab\xa4\x7f\x9d\x9c\x9c\xe8\x14\x0a\xe5\xcf\xfbbbb\
-\xe8\xe5\xb2\x18~\x07~c\xd4\xb4\xfe\x17\xc8\x98r\xd9\
-\xc7/\xc7!P6\xc89\xe6\xaa\xf4~H={\xf6\
-d\xe6\xe6\xe6\xfe\xf5\x1b\xc2\xcf\x16\x16\x16\xcc\xda\xc2\x7f\
-\xf0\xbe\xb5k\xd7\xd2\x04z\x98\xb7f\xcd\x1aZ\x15\xf0\
-g\xa5\xb0s\xb9\x1e\x06\xc4\x00\x9f9U\xc0\xdf\x95\xb6\
-?\x00\x16$\x83\xf1O\xad\x82\xfd\x91WE\xfb\x8b_\
-\xc5{\xf7\x09l\xc0;u`\x7f\xde\x06\xd4V`\x03\
-\xc3\xff\xf7\x0b\xf8\xc1\xad\x06_\x83$\xe2\x0a\xde\xb1O\
-\xe8\xdduZ,\x04kE\x0b\x84\xfd\x14]%\xfa)\
-\xca\xcb0@\x97\x05c\x97[\x85~\xe0U3q\x04\
-65\xac\xdbP1\xf5\xd6\x06\xb4\xb2*s\xae\x16)\
-_PWm\xa1\xfa\xaf\x00DW\x81\xba\x97\x13]P\
-gD\xd0\x1f\xf9*Tw\xe1~\x18\x02(\xa4\xa6\xde\
-\x01t:\x1bR\x0d\xb6\xe1\x92\x22\xeb\xa5\x8a\xca\xd2\xa5\
-K\x97\xe2\x96-[VZ\x832\x1c\xfamk\x84?\
-]\xbat\xa1\x00\xfcB\x05\xc4\x80~\xf0\x1a\xaa?\xab\
-\x8arR\x92]\xc2\x01\xb6\x06\xa1\x1c\x07\x9e;w\x8e\
-\x02\xbe\xe3\xd6@\xfdy5Q\x7f`/\x92\x00n\xfe\
-\xeb\xc7\x03\x9f\xa1\xdf\x80RC\xf5\xe7U\xe73\x81\x9d\
-\x01\xd7\xac\xc8\xa2~\x98w\xef\xdeQ\xc0o,%\xaf\
-?\xb4\xe5\x88\xe5~\x0d\xe1\x02\xbf\xf3\xf1\xf1!T\xf3\
-\x5c\xae\xd6\xfa\x83y\x0a\xe7,M\x92\x1f0''\x87\
-\x0alb\x8a2\xd6\x1f\xce\xd9\xf3\xe7\xcf\xe3E\xfc\xc7\
-\x15\xba\x01\xcc\xeb\x12`[s\x94\xad\xfec\xc6\x8c\xc1\
-S\xa9TF\x99\x8c\x02\xe62\xdd\xd1\xd1\xb1D\x99\xea\
-\x0f\xe6%\xed\xc3\x87\x0f\xf829\xcb\x9b7o0\xcd\
-\x9a5\xa3TS\xfd\xab<\x9f\xfa\xf5\xeb\x87'\x12\x89\
-Ty\xebO \x10\xc8\xbdz\xf5*Q\x96\xfaC\x8c\
-s\xf1\xe2EYc\xff\xef\x1c\xb8p\xe1\x02\xbe\x9ap\
-QU\xeb\xffw\xfc\xf5\xe8\xd1\x83\x92\x97\x97'\xb3\x0f\
-\xa0|\x02r\x8aZ\xc5u\xb6j\xa9\xff\xf8\xf1\xe3\x89\
-\xe3\xc6\x8d#\x0a\xf9\x8d\x09\xe2d\xbf\xb0\x0e\x80\xfa\xa1\
-\xfc\x9d\xa3F\x8d\xc2Uq.W\xba\xfem\xda\xb4a\
-~\xff\xfe\x9d\xfa\xed\xdb7J\xeb\xd6\xad\x19\x02\xdf\x0b\
-\xf3\xe3\xc7\x8fdI\xf5\x07z\x19\xea`\xa6\xe0~\x06\
-\xb8\x97\xfc\xf5\xebWx?\xb3\x96\xeb\xcf\xdb\xbcy3\
-\xb1\xdcO\xb5q\xe3FB\xf98prr\x22\x039\
-\xca\x12#7Y\xa0\xaf\xcae\x0eo\xcb\x96-\x7f\xef\
-\xdf\xb4i\x13\xa9\x92\xe3\xa8Rc\xafo\xdf\xbe\x94\xc2\
-\xc2\xc2\xbf\xeb,\xf9\xf9\xf9\x14333\xb2`.s\
-\xc1\xfc$\x8b\xae\x83\x02\x0cJ*\xc7\xa0\x9d;w\xa6\
-\x14\x14\x14\xfc\xd5\xd3\xe0Y\x0c \xc3h\xb5Q\x7f(\
-7BCCK\x85\xeb\x17\x13\x13Cn\xd5\xaa\xd5_\
-\x8c\x0f\xe62\x1d\xe2~\xa1\xf5Cz\xb7n\xdd\xfe\xd6\
-\xcf\xd0\xd0\x90\x11\x1b\x1b+\xbc\xde\xc9\xbf~\xfd:Y\
-GG\x87S\xd3\xf5\x07z\x16G\xa7\xd3\xff\xd6\x8d\xc9\
-dr\xa6N\x9dJ\x16\x83\xe3\xc8\xd0\xef\x0e\xe7\xac\xb7\
-\xb77It\x9cN\x9f>\x9d\xc4b\xb1\xfe\xae\x173\
-\x18\x0c\xb6\xb3\xb33\xb9\xa6\xeb\x0fp|)\xa8?S\
-\xa8\xfe\xeci\xd3\xa6\x91\xc5\xe8d\x16\x98\xcb\x140g\
-I\xcd\x9b7\xaf\x80\x9bg\xcc\x98\xf1O\xfd\xc13a\
-|$\xb1\x16\xc6\x0f\xe7\xea\xd5\xab\x04\xe1\xf1\x13\x17\x17\
-G\x15'C\x86\x0e\x1dJ\xb4\xb1\xb1!\x88\x93]_\
-\xbe|\xf9g\xfc\x5c\xb9r\x85\xa8\xad\xad\xcd\xa9\x8d\xf9\
-\xdb\xbbwo\x0a\x0a\x85\x12\xc6\xc9P\x06\x89\x93!\xe2\
-\xfc\xb8\xc2\xb2\xebO\x01\xcf\xa2\x83gRkS~n\
-\xd8\xb0\x01\xf6\x01W\xa8\x0e\x8c>}\xfa\xd0\xe4\x90]\
-T(o\x84\xda\xce\x0d\x08\x08 VA~VJ\x7f\
-A\x9d\x05\xc6\xcd?c\x00\xc8%\xb2\xb41\x00\x7f\xbb\
-v\xed\x1aId\xec\xd5\x85\xfe\xfaC@\xee\x90\xa0\xdc\
-\x10\x9a\x83\xecI\x93&Q\xa4\xc4\xac\x93\xe15\xc22\
-g\xca\x94)\xa4\xba\xc2?P^\xdf\xbcy\x93$\xa2\
-\x0b\xa8@\xbeW\xe0'\xfcNT\xe6\xdf\xb8q\x83T\
-\x09\x99_\xad\xf8\xd9\xd2\xd2\x92ZTT$<\x9ey\
-`<\x8b\xca{\x18?M\x12\x9e\xb3\xf0\x1e\xa0s\xa9\
-J\x80\xffy[\xb7n\xfd\xa7n\x00\x1b\xc0\x18x\x9a\
-\x90\xbc\xa2\x81\xef\x84c[\xfe\xdcS\x0d\xb6_\xb5\xd8\
-\x8fm\xdb\xb6\x85XR\x18\xfb\xf3\x81\x8e C,\x04\
-\x09\xc8\xf6\x7f\xc6\x18\xbc\x16\xdc\xc3T&\xfb\x1d\xe8S\
-2\xd4\xc5B\xb1;\xec\x09\x13&\x90!\x1e\x85\x9f\x85\
-\xf1\x06\xbcV\xd9\xfc\x0f0\xde\xe4\xce\x9d;\xff`\xff\
-\x9f?\x7fR~\xfc\xf8\xf1\xcfw\xb7o\xdf&\x0b\xc7\
-\xa6(\x93\xff\x0a\xc6\x8d\xa2\xd1h\x89>\x14\xf8\x9b\xb5\
-\xb55U\x89\xfd\x87\xbc\xc0\xc0@\x92\xa488\xf8[\
-u\xbf\xaf\xba\xfd\xb7\xed\xda\xb5c$$$T\xb0\xe3\
-\xe3\xe3\xe3\xa9FFF\x0cD\x05\xfc\xe7\xb3f\xcd\x22\
-\x03l\xfcw\xff\x10\xc4\xc9\xae\xae\xaed\x04Q\x0d\xff\
-\x7f\xe3\xc6\x8d\xd9\xf7\xef\xdf'\x95\xd7\xff\xde\xbd{$\
-0g\xd95T\xff\x1aY?\x02s\x99\x82\xc3\xe1\xe8\
-\x80\x98\x03\x06\x0c\xa0\xd6\xc4;\x04\xebG5\xb5v\xca\
-\xdb\xb6m\x1b\x16\xccY|u\xcf1!\xca\xa9\xc9\xf5\
-S===\x9a\xbe\xbe~M\xae\x8b_\x10\xac\x01\xab\
-\xe2\xfa5\x5c\xf7\xb5\x11\xac\xc1{\x01\xa2\xa9P\xdda\
-]=E\xe27\xbcjp-\xbb\xba\xd7\xac\x97\x8b\xc4\
-o\x94\x17\x1b\xc1\x98\xca\x11\xccm\x9e\x92\x10KP'\
-X\xb7\xc1\x88\xba(M\xb1\x10\xec%\x0b\x14\x8e\xd3\x1a\
-!3N\x0b\x16}A^\x81[5\x14GQ\x8e\x0d\
-j\x83\xca\xc7\xe7MA\x9b\xf4e\xb0\xad\x8f\xe0Z\x92\
-\x0a\xcamY\x04}Y7\x04m\x14W\xec\x01%\xd5\
-\xc3v\x8b\x12l\xa3\x83\x98~\xff\xd9\x00\xda^N\xb0\
-\xad\xbd\x85\xe6\xfb\xf5\x06\xd4\xf6r\xba\x06H\x0f\xd0d\
-\xc1\xdchh\xed\x87m\x9eT\x97}\x0fl\xeaR@\
-u\xc9{\xd8\xf6\xac\xbax\xb7\x96\x96\x16+$$\xa4\
-\x10\x10\xb6\x86c9\xa5\x11l;\xa3.\xde\xed\xe4\xe4\
-\x84\xa5\xffWX...u5\x06h\x82\x18\xf0Z\
-}o\xcb\x96-\xa9\xd1\xd1\xd1%Byt\xc8p\xed\
-\xb8\x0e\xda\xcf\xad\x83\xf6\xc3=\xb1X\xd0l\x8e\xc8Z\
-[i\x0d\xfa\x13\x94\xa6\xfd\xbd{\xf7&\xa2P\xa8\x0a\
-\xb1(\xe0;j\x9f>}\xc8u\xd0~nm\xbdO\
-[[\x9b}\xed\xda\xb5\x12\x09\xf1\x5cp\x9d\x13\x0f\xaf\
-\xa9\xaf\xed\x9f2e\x0a\x9e\xc1`0%\xf9\xf1a\xfc\
-\x03\x90\x85\xf8\xfa\xd8\xfe\xd6\xad[S\xbf|\xf9R*\
-+\x0e.66\xb6\xb4U\xabV\xd4z\xd6~\xee\xc6\
-\x8d\x1b1\x222OR\xe1\xac_\xbf\x1e][\xf5\xaa\
-\x8d\xf7\x00\x99\x87/**\x22\xc9\x1b\x87\x0ad!\xd1\
-\xc2\xc2\x02_K\xed\xafQ\x9d\x03\xb0\x1d\x13\xc8\xbcb\
-9cX\xff\xca\xc2\xcb\x97/\x17\x02\x8c\xc8T\xf1\xf6\
-\xf3'N\x9cX\x04d\x1e\xadL\xc1\x02d!u\xec\
-\xd8\xb1(Un?\xc0tD \xf3\xd0e\x95,\x9f\
->}\xcao\xde\xbcy\xa9\xaa\xb6\xdf\xd1\xd1\x11\xc5f\
-\xb3\xa9\x95m?\x8b\xc5\x22\x0d\x1f><WU\xdb\x0f\
-\xfa\x8e\xf2\xf6\xed[Le\xdb\x0f\xf7\x13\x80gPU\
-Y\xfe\x8d\x1a5\x0aK\xa1P\x14\x9e\xffd2\x996\
-r\xe4H\x5c-\xcc\xff\xea\xde\x83\xc8\x17\xb6)45\
-5\xd9g\xcf\x9e\xc5H\x88}\x90Tx\xa7N\x9d\xc2\
-\xc2{\x85\x9e\xcb\xae\x81\xbaV{\xfbMMM\xa9\xcb\
-\x96-+\x14\x8eW\xec\xda\xb5+);;[n\xfd\
-\x9f\x95\x95E\xea\xd2\xa5\x0bI86{\xee\xdc\xb9\x19\
-\xc6\xc6\xc6$%o?\xf7\xc0\x81\x03x0v\xa9@\
-\xf6\x09\xc7\xf7\xf2\xbc\xbd\xbdq<\x1eO&\xfe\x03\xd7\
-\xb0W\xacX\x81\x13\x9e\x97`\x1e\xc0g\x92\xf6\xec\xd9\
-\x83\xabf\xbcV\xad\xed\xb7\xb1\xb1!\x96\x94\x94\xd0\x04\
-\xf9|J\x9b5k\xf6w\x8d\xdd\xc0\xc0\x80\x0ed\xa1\
-L\xfc\x0f\xef\x032\x8f!$C\x19@\x0e\xfe\xb9\x0f\
-\x87\xc3\xd1\x06\x0f\x1eLT\xc6\xf67i\xd2\x84\x19\x16\
-\x16\x86\x17\xeeGOOO\xacp?\x8e\x1e=\x9a\x00\
-\xfaQb\x1c\x17\x89Db\x88\x8e\x9bU\xabV\x95\x08\
-\x8f\x9b\xc7\x8f\x1f\x97\x82w\xb1\x94\xac\xfd|0?K\
-\x80\xae\xffg\x7fJFFFi\xc7\x8e\x1d\x09\xc2{\
-\x19\xcf\x9c9#i?\x17\xef\xe4\xc9\x93x\xe1=\x8c\
-\x9d:u\x22\x8a\xca\x0d\x98\x0c\xd7\xdd\xdd\x1d_M\xf5\
-\xae\x96\xb9\xd4\xae];\xf2\xcf\x9f?K\xc5\xc4\xe5\x91\
-z\xf4\xe8\xf1\x8f\x1d\x03\xf7\x99\x02\xf9V!'\x1e\xe0\
-\x15\xd9\xdc\xdc\xfc\x9f\x18i`\x03\x11\xc03*\x5c\x9b\
-\x94\x94Dj\xdf\xbe=UI\xda\xcf\xd9\xb9sg\x91\
-p\xcc}y\x7f\xee\xda\xb5\xabD\xcc;\xf8+W\xae\
-,\x15\x1e\xd3\x5c.\x17\xce\x15q}\xca\xdd\xbd{w\
-\x89\xb8g\x03Y\x88\xaf\x86\xfaW\xb9\xfd\xa0\x8f\xd0\x18\
-\x0c\xa6B\xdf\xff\xfe\xfd\x9b\x0c\xfa\x88&\x01\x172\x81\
-\x9c#\x96_\x1b\x19\x19\x09e\xa5X\xff\xaf\x89\x89\x09\
-%55\xb5\x82\xee\xc4b\xb14+++b]\xb7\
-\x1f\xee\x17\x05\xed\xafP\xbf\xe4\xe4d\x12\xa8;U\x8a\
-m@\x04\xb2\x90\x09d\x1e\xdd\xde\xde\x9e \xe9\xba\x0e\
-\x1d:\x88m?x'\xa5o\xdf\xbe\x04%\x18\xff\xdc\
-\xc0\xc0@\xb4\xb81\xbaw\xef\xde\x12I\xef\x80r\xee\
-\xd8\xb1c\xd8\xa3G\x8f\x16khhp\xa4\xe0\x89\x12\
-1\xd8\x11\xbe\x13\xab\x0c\xe3\x1f\x92\x91\x91\x11%11\
-\xb1\xc2\x1c\x90\xa5\xaf[\xb5j\x05\xf7]\x92\xe5\xc1\x13\
-\xc2%!!\x81\x00\xdeIU&\xfd\xe7\xe6\xe6\x86\x03\
-\xf6j\x05\xdf\xee\xa3G\x8f*\xa5\xafE\xf1\x84\x90M\
-\xcc\x04\xef*\xa9F\xfdW-\xf8\xa7q\xe3\xc6\xcc\x87\
-\x0f\x1f\xe2Du;\xa8/k\xce\x9c9\x8a\xeak>\
-\xd4\xf1\xa2x\x02>\xfb\xc1\x83\x07%\xf0]\xca\x88\x7f\
-\x07\x0d\x1aD\x00c\xbe\x82\xbf\xe3\xc7\x8f\x1f$`\xbb\
-\xc8\x1dG\x09u;\xc0\x13$1\xf3\x89:p\xe0@\
-\x822\xdb?@\xe6\xe1\xc4\xc8B.\xc0\x02\xf2\xeak\
-.\xd0\xed\xe2t>W\xd9\xed\x1f\x81\xbe\xa6\xfe\xfa\xf5\
-K\x9c\xbe\xa2\x0d\x180@\xa6\xfd\x0a\xfa\x97\x08u\xbb\
-\x18\xccG\xac&\xccW\xe3\xfe\x0f\x0f\x0f\x0f8wE\
-sN\xf3\xef\xdf\xbf_\x0a\xe6.K\x8a\x0ca\x81\xf9\
-]\xc1>\x80r\xa0\x1a1\x7f\x8d\xfb\xbf\xf4\xf4\xf4\x98\
-O\x9f>-\x15#\xbbY\xb3f\xcd\x92\x94\xf7\x8a\x0f\
-~\xc3\xc3kD\xef\x03z\x00\xea\x10\xa6*\xf9\xff\xe0\
-\x1eg<\x1e_!\xef4\xc0\x09$`/\xd1\xc4\xd8\
-P4\xf0\x1bQ\xf4z\xf8\x8c!C\x86\x10U\xcd\xff\
-\x090\x1d\xf7\xd0\xa1Cb\xb1\x1b\xb0\x97De!w\
-\xc7\x8e\x1db\xed\x9c\x83\x07\x0f\xe2\x91\x9a[\xa3\xabQ\
-\xff/\xb0\xfd\xa9\xd0\x0e\x90%\x0b\xfb\xf7\xefO\x04\xdf\
-Q\xc5\xd8\x10d\xf8\x0cU^\xffZ\xb8p!\x9e\xc3\
-\xe1\x88\x95\x85\xba\xba\xba,\x1d\x1d\x1d\xd6\xdd\xbbw+\
-\xc8<x\x0f\xb8\xb7&s\xe4\xd5\xca\xfa/\xcc\xef\xff\
-\xfc\xf9s\xb1\xb2p\xe6\xcc\x99\xf8\xe9\xd3\xa7\xe3\x99L\
-f\x05\x99\x17\x1e\x1eNP\xf0l\x00\xa5]\xff\xb6\xb5\
-\xb5%\x94\x96\x96V\x90\x85\x99\x99\x99\xc4\x8c\x8c\x8c\x0a\
-2\x0f^;|\xf8\xf0\xda\x88\x89\xab\x95\xf6C\xfb\x16\
-\xd8\xb9%r\xae\x81\xc03\x01\xf0P~\xd6\xa7\xf8\x17\
-333JZZ\x1aYV\xe3SSS\xc9\xe0\xda\
-\xfa\x16\xff\xf2G\x16.Y\xb2\x04\x0f}}\x92\xda\x0e\
-\x7f[\xbcx1\x1e\xa9\xbd\xdc\xce\xb5\x1a\xff\xd5\xb4i\
-S\xe6\xcb\x97/%\xae\x81\xbcx\xf1\xa2\xb4\x16d^\
-\x9d\xc6?:88\x10\x88D\x22]L\xee9\xba\x9d\
-\x9d\x1d\xa16\xebR\x17\xed\x17\xf8\xfdDe!/8\
-8\xb8D\x8a\x1f\xb0>\xc5\xff\xc2u\x1dJzz:\
-I\xe8<&2\xfc\xae\x8e\xe2\x9f\xeb\x22\xee\x1a\xe6@\
-\xc6\xc25B \xf38\xe0s\x09R7g\x9aA;\
-,\xbb.b\xef\xe1\xfe\xebW\xaf^\xa1\xa3\xa2\xa2\xf0\
-@.\xd6\xc9\x1e\x04@\x19\x82=qu\xb2\xff\xa4O\
-\x9f>\x85\x96\x96\x96\x98:\xdc\xffr\xb5\x8e\xf7?\xf1\
-\xebh\xdcC\x82\xba\xc6Y\xb0\x07\xecZ\x03\xdc\xff\x05\
-\xfb\xbe\x89`\x0f \xdc\x0b\xf8\xa3\x01\xb5=\x11PO\
-\x91=\xa0v\x0d\x84\x07\x09\x80\x86K\xd8\x03\xdc\x0bP\
-\xa8`n\xd4\xb7v\xc36]\x11\xd3\xef\xa2EO \
-\x17\xae\x0a\xf4\x03\xad\x16\xf7\xabW7\xd1\x04m\xb8*\
-hS\x13uf\x04u\x11\xcd\x131\x1eP\xb0p\x9e\
-\x88\xa9r\xe5\x89\x80\xa5% 7\xe4\xbf\xb3\x91\xcas\
-\x93\xd4\x14N\xa8\xab9\xc4\x10\xec\x93\xbd-hkK\
-9\xd8\xaa\x01h4\xa0\xe7H\xcd\x9cy\xad\xac\x04\xdb\
-\x1a\x0eh\x94\x80\x07\xe2\x0a\xcco\xb3\x0a\x10\x06ix\
-\x98\xab\x9c0\x02\x1eh\x8b\x197+\x1b\xd8\x98\x916\
-\x96V\x8a\x8c#G@h5o\xfe\x12Z\xc0\x93r\
-Y\x1c\xae\xe6I\x05z\x06\xa8\x05 W%\x9aWu\
-i\xf7\x8a\x12\x8c\xbf\x9b\x89\xfc\x97\xf7H)\xfa\xacW\
-\xaf^\xc5\x80\xb0J4\x86n\x08pt\x9d\xd7\x05\xe6\
-.|\xf1\xe2E! \x9c\xbe\xbe>CI\xf8\x93\x8e\
-(G\x9e@\xde\xc2\x85\x0b\x8b\xb8\x5c.\x13\xae%\xc1\
-\xf5&%\x99g\x94\xba\xf0\xb3\x8b\xd9\x9bEHMM\
-\xc5\x0b\xfb\xdd;w\xeeLU\x02\xfep\xeb\x9a?\x1a\
-\x1a\x1a\xec\xa0\xa0\xa0b\x91\x18\x1c\x1e\x5c\xab\xa9\xc6s\
-\xb5T\x96?\xf6\xf6\xf68qgI\xc1u;\x07\x07\
-\x87\xd2\x86\xcc\x1f\xb8\xcf-22\x12'i]7\x22\
-\x22\x02/i\x7fG\x03\xe0\x0f\x0f\xee\x83\x93\xb5\xee\xbf\
-l\xd92,R\xfb\xf9\x7f\xea\x9c?\xe6\xe6\xe6$\x18\
-\x07$+.$==\x9d\x00\xf7\xc3\xd5!\x7f\xb8\xb5\
-\xfd^\xb8\xff\xf9\xe4\xc9\x93hy\xe3\x86\x80\xac\x86{\
-i\xd8\x0d\x85?@\xeebH$\x92\xdc\xf9\x15\x80\xfc\
-\xa6\xd8\xda\xdab\x1a\x02\x7f\x9a6mJ\x8d\x8a\x8aR\
-8\xf7\xc6\xcb\x97/\x8b\x00\xc6\xa6\xd6s\xfe\xf0\x80\xbc\
--\xe0\xf1xLE\xf9\x03d5\x03`\xec\x82Z\x96\
-\xd5\xb5\xca\x1f\x80\x93K\x80L\xc6U6o\x07\xc0\xd5\
-\x18\x13\x13\x13\x5c}\xe4\x0f\x90\xafL gs\xc5\xc4\
-\xaa+R8\x07\x0e\x1c\x806#\xb3\x16\xf9S+\xe3\
-u\xc8\x90!\x05d2\x99XV\xc5\x02p5\xa6_\
-\xbf~\xd9\xf5\x8d?C\x87\x0eE\xc1\x5c\x16U\xe5\x0f\
-\xd0{\xc4A\x83\x06\x15\xd47\xfe\x00\xcc\xc3\x04\x98\xa7\
-@\xc1|1\x15\xb0\xd0\xf1\xe3\xc7Q\xe0Y\xac\xfa\xc6\
-\x1fH\x9d;w.\xcd\xca\xca*\xad,s\x80l/\
-\x05X\x9aP\xcb\xf2\x99W\x8b\xf2\x9f\xb7b\xc5\x8ab\
-\xa0\xdfY\x0a\x0f\x1cp\xcf\xf2\xe5\xcb\xd1\x22\xf5\xadi\
-\xfd\xc2\xadI?\xdd\xe8\xd1\xa31\xa3F\x8d\xc2\x88\xd8\
-\xec\xb47o\xde`\x15\xe5\xcf\xabW\xafp\xf0^\x11\
-\x99\x96\x0b(_\x15\xf9\xd3\xbauk\xda\xd7\xaf_K\
-\xbf|\xf9\x82744\xfc\x07\xf7:::\xe2`\x1e\
-.\x05d2m\xc4\x88\x11%\xa2{\xfc\xe3\xe2\xe20\
-\xb1\xb1\xb1\xd8\x1a\xcc\xebYS\xfc\x81y;\xb1\x02\xac\
-\xc3\x09\x08\x08\xc0\x08\xcf\x03h\x9f\x9e:uJ\xde\xdc\
-^\xbc\x13'N\x88\xe6\xf4\xe2n\xd8\xb0\xa1</(\
-\xc7\xdf\xdf\x1fSCr\xa2F\xf8\xd3\xa7O\x1fBa\
-a!Y(o'\xa9W\xaf^\xff\xf8\x02a\x1e/\
- oe\xea\xfb\x8c\x8c\x0c\x12\x90\xeb\xff\xec\x8f\x86\xf9\
-=D\x9eO\x86\xf9\x93U\x81?\xda\xda\xda\xack\xd7\
-\xaeaE\xcf\xbb\xber\xe5J1\xf8\x8d)\x22\xaba\
-n0\xa9\xfe1 \x93q\xc2u\xd4\xd5\xd5e^\xbf\
-~\xbd\xc2\xf3CCCq\xf0\xdd\xca\xce\x9f\x89\x13'\
-b`\xf2w1\xe7\x99\x93\xfa\xf7\xef_\x84\xfc\x9b/\
-\x87\x0e\xe3\xc4\xa5\xf8WKD\xfd\xab666h*\
-\x95J\x11\x93W\x941i\xd2\xa4\x92\x1a\xe0O\xb5=\
-\x0f\xe6D\x89\x8e\x8e\x16\xab\x9b\x92\x92\x92\xf0\xc6\xc6\xc6\
-\x15\xe6\xc0\xc8\x91#Ka.\x1d1v\x04\xcd\xde\xde\
-\xbeB.\xdd\xf6\xed\xdb\x93\x7f\xfd\xfaE\x10\xf7\x8e\x98\
-\x98\x98R\xa0\x0bhJ\xca\x1f\xee\xea\xd5\xab\xf3\xf9|\
-~\x05l\x03\xf3\x04xxx\xe0\xc4\x8dU\xb8\x86\x03\
-p\xb5\xb8}7X\x09\xfbn\xf8\x0b\x16,\xc0r8\
-\x1cq\x18\x0a\xcaj\x5c5\xca\xeaj\xe3O\x87\x0e\x1d\
-\xd0\xb9\xb9\xb9hI\xeb\x10zzz\x0c)\xbeh\xb8\
-/\x87,\xb4\x17\x91hffF\x96\xb6\x87\x03\xccK\
-\xb1~\x92\xfc\xfc|r\xd7\xae]\x89\xca\xc6\x1f\xd0\x9e\
-\x12\xc0\x1f\xb1\xb2$22\xb2D\xc6\x9a:\x1f\xc8\xe1\
-\x12(\x8f\x01\xb1\x16-Z\x84\x95&\x17\x9b6mJ\
-\x7f\xfd\xfau\x89\xb8w\x81:\x10\x80\xbe#(\xe1\xfc\
-\xe2\x81\xf9U\x04\xe6W\x05}\x04\xe7\xc2\xc2\x85\x0bq\
-2\xda\xcc\x80ka/^\xbc@\x83\xb1F\x97\xb1\x1f\
-\x14\xae\x0bU\x98_\xf0\xdd\xa0\x0ehe\x9c_\x02\xf9\
-L\xfd\xf4\xe9\x93X\xf9\x9c\x9c\x9cL\xec\xd8\xb1\xa3\xd4\
-s\x1c\x00\xae\xc1\x02\x1c\x83\x961N\xc9p\xfe\x89{\
-\xc7\xc7\x8f\x1fq\xb0\x0e\xca\xac\xdf\x9d\x9c\x9c04P\
-\xc4\xe1\xe0C\x87\x0eae\xecu\x94\x1a\x1f%\xd8O\
-\x8e\x15\x87\xbb\x81\xce\xa7\x8f\x1f?\x1e\xab\xec\xf8\xa7Q\
-\xa3F\xf0\xfc\x1f\xb1k[x<\x9e6l\xd8\xb0J\
-\xaf\xa9\x0f\x1f>\x1c_ZZ*\x8e\xf7|\xf0N\x0c\
-|\xb7*\xd8\x17={\xf6,-((\x10k;<\
-}\xfa\xb4D\x9a.\x93\xa2\xb3\x18\xe1\xe1\xe1%\x12t\
-\x16\x09\xe6\xdcT%\xfb\x14\xe0\x10\xb4\xb8s%\xa4a\
-!i\xf3N\x1a\xe6Y\xbf~\xbdJ\xd9\xa7\x90\xa0O\
-#66V\xac\xbe\x07\xf8\x97\x08\xf3K*\x80\xad\xc8\
-@\xbeK\xc2\xccx\x15\xf4o\xfc!`\x0f\xe1\xa0]\
-$\xce\xf4\xdc\xbf\x7f?N\x9e\x5c\x1cP&\x1f<x\
-\x10#n]\x08>\xdb\xc5\xc5\x05\xa7\xaa\xfeUhO\
-\x03[\x1b'.o1\xccO9d\xc8\x10\x992\x03\
-\x5cS\x0a\xe4:U\xc2\xb9G\xd8\x1a\xb0\xd9k\xd5?\
-\x0f0\x0d\xb1\xb0\xb0\x90\x22\xae}0\x8f%\xcc\x89&\
-%\xa6\x95\xf1\xe4\xc9\x13\xb1\xfc\x85\xfe\x1f\xe8g\xaa\x07\
-\xeb\x17\xdc\xcd\x9b7c%\xc9\xeay\xf3\xe6I\xca\x01\
-\xc0\x07\xbf\xe1\xc4\xe4\xc2\xfc#\x93\xa1\x7f\xb2\x16\xd6~\
-ke}\xa7M\x9b6T\xe8\x8b\x96\xe0\xf7 \xc2\x5c\
-\xc8H\xc5|\x8b\x14\xf0\x9bX\x99\x0c\x9f\x05\x9fY\x8f\
-\xd6\xbf\xf8\xd3\xa7O/\x91p\x86\x18w\xdf\xbe}\xa2\
-\xf919{\xf7\xee\xc5\x8a\x93\xc9\xf0\x19\xd3\xa6M+\
-\xa9\x85:\xd7j|\x82\x8e\x8e\x0e\xf3\xd6\xad[\x92d\
-5UXV\x0f\x1e<\xb8T\x5c\xbeVx/xF\
-\x09\xcc\xcdV\x1f\xe3[\xac\xac\xac\x08\xc5\xc5\xc5\x92d\
-\xf5\x9f\xfc\xba\x90\x1e=z$\x96\x8f\xf0\xdej\xc8=\
-\xae\xcc\xf1Q\xdcm\xdb\xb6\x89\x9d7P\x0e\xcf\x9d;\
-\x17;k\xd6,\xac\xb8\x5c\x9d\xf0\x1ep/\xae\xb6\xeb\
-[\xdb\xf1u0\xffv||\xbcX\xb9\x9b\x97\x97G\
-\x80\xfe-q\xbf}\xff\xfe\x9d\xd0\xb6m\xdb\xfa\x1e_\
-\xf7GV\xbb\xba\xba\xe2\x98\xa0\xc8\xbb~\x0a\xaf\x9d9\
-sf]\xe4\x02\xaa\x93\xf8U\xb8\x86u\xef\xde=\x9c\
-\x9cg\xe3\xf1\xef\xde\xbd\x8b\x83\xf74\xa4\xf8\xf0\xfe\xfd\
-\xfb\x13\xe0Y\x07\xb2\x98\x03\xcf\x09\xb1\xb6\xb6\xae\xab\xbc\
-\x1du\xb9\xbf\x00\xe6\xce\xc5\xca\x88G\xac\xae\xf3\x12T\
-r\x7fJ\xbbv\xed\xe0\xf9\x0c\x04I\xccIHH(\
-\x85g84\xe0\xfdM0\xf7\xb6\xd8\xf3\x1b\x04\xe7-\
-\xe0\x90\xba\xddGX\xe7\xfb\xbf \x1e|\xf0\xe0\x81\xa8\
-\xac\x86y\x8c\xebJ&+\x15\x7f \x0d\x180\xa0\x14\
-\x8b\xc5R\x84\xcf\xa8\x81\xdf)\xc9\xfeJ\xba\x12\xd4C\
-\xf8\xac(\x98\x07\x1dS\x872Yt\x7fn\xa62\xec\
-\xa5\x06\xd8\x98\xf4\xf3\xe7OLRRR)\x94\xdbJ\
-\xb2\xbf;U\x89\xf2\x03\xf0\xc7\x8f\x1f\x9f\xed\xe2\xe2R\
-\xa0$\xf5\x81\x14\xaad\xf9%\xd8\x02R\x86\xba\xc0\x98\
-\xbei\x82\xfc$\xcf\xd4\xf9H*P\x18 \x03A\x0e\
-\x97\x91\xea\xfc6\xff\x10\x8c\x03t\x10\xc9\x8f\xb4B\x90\
-\xb3\xa4\xa1\xf3\x06\xce+O1y\xb6`N)/@\
-\xc5\x0d|\xdc,\x07\xd4HB\x0e2\xc8\xb3\x11\x80\x9e\
-4\xb0\xb1D\x12\xc8\x1b\x07Dr~6\xe1b \x90\
-\xddP\xbf\xa5\x09\xe51\xe1\xd6\x13\xe2\x08\xda\x94&h\
-\xe34!Y\xfcO\x09\x14\x1a8\xea\xa2.\xeaR\xf5\
-\x22<\xa7`\x1e\xd2)\xc8\x7f\x09z\xff\xe6!]\x22\
-w\x1eRX\x8c\x00\xcd\x03t\x07\xf9/_gm\xf8\
-$x\x02\x19R\xd7\x04m{\x98\x9f\x0c\xe6(u\x17\
-\xf0B\xde\x02s\x02\xcf\x06\xf4\x01Q\x8e\x1c^uM\
-\x90\x07\xef\x01\xcd\x02\xd4X\x8e1wR\xcd7\xb1D\
-\x15\xf0F\xd2Xl\x0b\xe8\x96\x9aO2\xe9\x96\x18\x1e\
-\xc2qy\x02Q\x9e\x1c\x92\xcaN\xc7E\xe6\xb2\x9b`\
-|\xaay#\xff\x5cv\x15\x92y\xef\xd4<Q\x98\xde\
-\x0ad\xde\x5c%\x1e{\x1ceXG\x912\x06\xe7(\
-\x91\x1f\xba\x82_z\xe4\xc8\x91\xb9\x8e\x8e\x8e(%\x1e\
-\x837\x04\xb6\xae\xd2\xd5\xcd\xd0\xd0\x90\xf8\xfd\xfb\xf7\xa2\
-o\xdf\xbe\x95\xb4i\xd3FY\xf3\x9f\xa7\x22\xca\x99\x9b\
-\x9d\xb3i\xd3\xa6|\x18\x9e\x06\xd7\xd5\xb6n\xddZ\x97\
-\xb1\x0e\xb2\xfcOle\xabW\xbf~\xfd\xb0\xc5\xc5\xc5\
-\x04\xa1\xf8F*<\x93XI\xe5\xb3R\xf1OGG\
-\x87q\xfb\xf6\xedB\xd1\xb8\x80;w\xee(C\x5c\x80\
-\xb2\xf3\x8f?c\xc6\x8c\x22&\x93I\x17\x17\x0b\x08\xe3\
-\x07\x95\x0c\xe3+\x15\xff\x8c\x8c\x8cH\x09\x09\x09\x12\xf3\
-\xf4\xc5\xc7\xc7+\xd3\x1a\xba\xb2\xe1+\xce\x8e\x1d;\x8a\
-\xc4\xedG\x11\xde_\x12\x18\x18\x88V\x22]\xa24\xfc\
-\x1b8p`\x09\x16\x8b%\xcb\x11\x97I\xb6\xb6\xb6.\
-Q\xf3\xef\x9fX2\xfa\x83\x07\x0f\xd0\x0a\xc4\xfd\x16\x03\
-]\xc2P\xf3\xefo\xacb\x11\x8b\xc5b(\x10WN\
-\x87zF\x09tI\x9d\xf3\x0f\xe8\x0c\xc2\x8f\x1f?\x14\
-\xce\xfb\x06t\x09\x1a\xd8%\x84\x06\xce?6\xd0\x19\xf9\
-2t\x86\xa4\xc2\xde\xb2eK^\x1d\xd7\x9fS\x97\xba\
-\xcc\xca\xca\xaa\x18\xe8\x8cJ\xe7\xad\x04\xba\x04\xdf\xa7O\
-\x9f\xe2\x86\xc8?`gP\xef\xdf\xbf\x9f'\xa7\xce\x90\
-\x98\x83\xef\xe6\xcd\x9b9\xda\xda\xda\xd4\x06\xc6?hg\
-\xe4\x00\x9dA-\xabb\x01\xba\x84\xe4\xec\xec\x9cQG\
-\xba\xa4N\xf8\xd7\xb6m[\x1c\xd0\x19\xa8\xb2j*_\
-\xbe|\xc9000@7\x10\xfeA\xbc\x92\x0e\x9aM\
-\xab.\xfe\xf1\xf9|\x92\x8b\x8b\xcb\xef:\xe2_\xad\x9f\
-Qbff\x86\xc9\xcc\xccDW\x17\xff\xd2\xd3\xd3\xd1\
-\xa6\xa6\xa6\xd8\x86\xc2?\xe4\xbf\xf3\x0e\xf2*s\xde\x81\
-\xb8\xf3\x0f\x16/^\x9c_G\xed\xa8+\xfe\xc1\xbcn\
-\x94\xa8\xa8\xa8\xa2\xaa\xf2/\x22\x22\xa2X__\xbf.\
-\xf5/\xaf\x16\xdf\xf5\x8f\x8etpp@\x93H$r\
-ey\x07\xcfo\xb1\xb3\xb3\x13=\xbf\x85_\x8b>\xb9\
-Z\xe1\x1f\xc0g\xecE\x8b\x16\xe5\x98\x98\x98\xfc\x13\x9b\
-\x0b\xf3\xd9\x9f8q\xa2\xb0\x92gOp\x83\x83\x83\x8b\
-D\xcf\x07\x02\xba\x1d?m\xda\xb4\x9fZZZ\xec\xba\
-\x18\x135A\x8e\x8e\x8e%`\x9c\x91\xf6\xec\xd9\x83\x16\
-\xb5\xb7`\xee|\x98\xff\xbe\x12:C\x5c\xce|\xce\xae\
-]\xbb\x0a\x08\x04B\x09\x18\x97\xd8\xfa\xc0\xbf\xe6\xcd\x9b\
-\xd3^\xbf~\xfd\xc7\xa7\x8c\xc3\xe1\xc8\x83\x06\x0d\x12\xf5\
-\xdd\xc1\xf3\xcc\x8a\xc5\xe5\xad\x94\xa23XK\x97.\xad\
-\x90\xcf\x12<\x1b\xbc\x02G\x12\xe4\x1e\xc5\x88\xe6\x95W\
-A\xfe\xc1\x5c\xd6h\xa1s\x07\xf8\x8f\x1e=BC\x7f\
-\x9f\xf0u\xb0\x9d\xaf^\xbd\x92\xdb\x07\xf3\xf2\xe5K,\
-\xcc\xa5*\xfc\x8c&M\x9a0\xc2\xc2\xc20\xe5\xf6 \
-\xe4\xb1\x98s\x0bT\x8a\x7f\xe6\xe6\xe6D07\x09\x22\
-\xfb\x8f\x19\xd0\xdf'\xfa^\x98g_\xdcy\x8cb\xf2\
-?S\xed\xed\xedE\xc70\xcc)\x85f\xb3\xd9L\x91\
-\x1c\xec\x04X\x07U\xe4\x9f@7\x14\x8b\xcb\xa7\x99\x98\
-\x98\x88122*\x15\xb9\x9e}\xfc\xf8qY\xb9\xfb\
-\xb9AAAh\x91\x9c\xfd0\xe7\x14\xe1\xd7\xaf_%\
-\x12r\xfcW\xb8^\x15\xf8\x07\xc6\x08\x1a\xe2\x0b\x096\
-?\xd9\xd6\xd6\xb6\xc2\xf9\x160_?\xd0\x0b\x12\xcf:\
-JMM-\x05\xb6\x0bI\xf4>\x80\x83\x0a\xc13\xa9\
-\x120N\x853$\xaa\x99\x7f\xd5\xfe\x5c===\x0a\
-\xc0\xb5\x85\x92\xf8\xf0\xfc\xf9s\x0c\xc0\xbc4\x09v\x89\
-\xd8\x1c\xc80\x07'\xc0@\x18q\xfd\x0de\xe1\x8b\x17\
-/\xb02\xce(\xa1\xab\x08\xffx\xf3\xe7\xcf\xcf\x05<\
-\xa0+ \xbf\x84u\x09\x1d\xe6\xff\x17u\x11\x84\x87\x87\
-ca~rI\xf7\x811\x88\x93$?a\x7f\x80~\
-\xa9\x89\x5c\xa7\xd5\xce?CCC\xcc\xef\xdf\xbf\xf3$\
-\xf9;\xe1\xf9$\xb2\xe4\x11<\xbf\x17\x9e\x13 \x94\x7f\
-\x982l\xd8\xb0\x12Y\xf2\xf6\xdc\xb9s\xc5\x92\xe4'\
-\x9c\xfb@N\x92\x94\x9d\x7f\x10\xff\x03\xfeI\xf2\xad\xf0\
-\xce\x9c9#S\x9e\xc3\xb3\x05\x80\x9e(\xcfG\xcd=\
-x\xf0`\xb1\x8c\xfc\xd6\x7f\xf8w\xe1\xc2\x05\x89g\x9b\
-\x82:\xe1\xda\xb5kGP\x91\xf9\x8b\x02\xf2\x8a!A\
-\x9eS\x81<\x97\x99\xfb\xd5\xd4\xd4\x94\x9c\x96\x96FH\
-NN\xc6\x81q#\x13\x83\x8c\x1a5\x0a'\xe9\xecS\
-P\x17\xe6\x82\x05\x0b\x8aTa\xfe\x0a\xf4\x07\x15\xe8\x88\
-\x22Ik\x1b\xc06\xc0\xca!\xcfa\xbe\xb1\x02`\xcb\
-\xe6\xc9\xc2\x08\x02\x1bG\x92\xfe\xe0\x83\xba\xc0\xdc\xfd4\
-U\xc2/\xc3\x87\x0f\xc7\x00\x19F\x96$\xcf\xe5\xb1\x0d\
-\xc0\x9ceA\x925\xde\xbd\xbc\xbc\xd0\x92\xceV+-\
--%\x83\xba`U\x0d\xffA\xbf\xc8\xd1\xa3G%\xfa\
-V\xaa\xeb\xfci`_\x10Dm\x1c\xe1\xae\x02u(\
-\xaa\xc13\x9ck\xd4~\x03X\x97\x00d\x18^\xca\xf9\
-\xd4U\xb2\x0d\xe0\xbd\x92l\x1c\xc1\xb9\xb3x G\x09\
-\xaa\xec?X\xbati\x11\x98\xafLIX\xd0\xce\xce\
-\xae\xd2\xb6\x81\x0c\xcc\xc7\x5c\xb2dI\xb1*\xfb\x0f\x04\
-\xb6\x01\xf4\xad`\xa4\xf8Rp\xa2\xbe\x14y\x08\xfal\
-\xa0\x1e\x92\xf4\x5c\xe8\xbf\x82\xef\xae\x0f\xfeS\x80W\xb0\
-\x92\xb0\x05\xd4%`\x9c`\x14\xac\x07\x1c\xd7hI>\
-C8&\xc1\xd8\xac-\xffi\x8d\xfb\xef\xa1\x9c:y\
-\xf2\xa4D9\x95\x92\x92B\x10\xe7\x17\x90DP\xef\x00\
-\xd9V*\xe5\x5c\xc5\xe2\x1a\xf4\xb9\xd4\xc9\xfaQ\x97.\
-]\x88YYY\xd2\xf4$F\x96\x8dQ\xae\xd7\x81m\
-R,I\xafC]\x5c\xc3>\xbf\xbaZ\x7f\xe3\xad\x5c\
-\xb9R\x1aN\xa3\xda\xda\xda\xe2e=\x07\xe8\x1b\x1c\xd0\
-;\x14Ig\xe5B,X\xcbk\x8a\xb5\xb6\xfek`\
-`\x00\xcf\xc8\xc5I\xf1k\xe1\xa4\xf9X\xe0o\xd2\xfc\
-Tp\x9d\x05\xda\x22\xf5y\xfd|\xf4\xe8\xd1\x12\xcf\xd0\
-\x95\xe6\xe3\x83\xdf\x81\xdf\xd0\xd0\x96\x15w/|&\xb4\
-\x81\xeb{\xfc\x90\x96\x96\x16\xf43\xa1\xa5\xe9\x12\x80y\
-+\xe8\x92\x8e\x1d;\x92\xc0o\x12u\xc6\xd9\xb3g1\
-\xb5\xb4\xe6[\xe7\xf1k\xdd\xbau#\xe4\xe4\xe4H\xd4\
-%G\x8e\x1cA\x0b\xeb\x12\xf8\xf9\xd0\xa1C\x12uF\
-vv6\x11<\xb3.\xf6\xc7\xd5U\xfc$\xcf\xd7\xd7\
-\x17-\xe9\x8c^\x81.\xf9k\x97@\xdf)\xf4\xa1J\
-\xd0\x19l\x1f\x1f\x1f\x0cRw\xf1Cu\x12\xbf\x0b\xcf\
-+\xfc\xf0\xe1\x834]\x82\x85\xe7\x00\xc1u\xddg\xcf\
-\x9ea%\xf9\xc2\xde\xbf\x7f_\x02\x9eUW\xf9V\xea\
-4~|\xdc\xb8qX*\x95*Q\x97,\x5c\xb8\xb0\
-\xd8\xc3\xc3\xa3Xt]W\xe8le\x1ax\x06\xae\xae\
-\xea_\xd7\xfb\x17\xe0\xb9\x87\x17/^\x94\xa8K\x0a\x0b\
-\x0b\x09(\x14J\xa2\xce\xb8p\xe1BM\x9c\x9d\xa8R\
-\xfbgz\xf4\xe8A\xc8\xcb\xcb#*\x1a?\x94\x9b\x9b\
-K\x84\xf7\xaa\xf7o!\xbc5k\xd6\xa0\xc5\x9d\xaf+\
-%\xde\x99\xed\xe7\xe7\x87\xae#\x9d\xa1t\xfb\x07[\xb6\
-l\x09\xcf\xdf-\x91\x97\x7f\x1f?~,\x81\xf7\xa8\xf7\
-\x0f\xfe\x9f&L\x98\x80\x83g\xe5\xca\xe2\x1d\xd47N\
-NN8e\xa8\xb32\xf1\x0f\xea\x81\xcb\x97/\xcb\x8a\
-\x1f\xe2]\xbat\x09]\xc7:Ci\xf7\xef\xf7\xea\xd5\
-\x8b \xe9|_\xc1y\xbc\xc4\x1a:\x8f\xb7\xbe\xe4\x8f\
-\xe0\xae_\xbf^\xac.\x81\xdf\xad]\xbbV\x99\xf6\xee\
-+e\xfe\x12xfottt\x05\xbb\xe4\xf3\xe7\xcf\
-8%\xd1\x19J\xcd?H\xce\xce\xceh\xe1\xb3\xde\xc1\
-G:\xf8\x0e\xabl\xf5\x14\xf0O\xe9r\xaf\x01\xfd\xc0\
-\x04\xba\x04%\xd0%|\xf0\x19]\xc3\xe7\x01W%\x7f\
-S\xba2\xe6\xe6\x02\xb6\x05\x0e\xd8n%\xc0\x86#\xc1\
-s\xe3\x954\x7fX2\xa2\xbc9O\xb9\x9e\x9e\x9e\xa9\
->>>\xb9J`gH\x22\x98\xa3\x1d\xe6OT\xca\
-|\xbbZZZ\xe4:\xdc[.\x8b`\x1e$\x98\xf7\
-\x14\xe6\xa0|\xa7\xc49\x0a\x95\x95\xa2\x00\xb5F\xfe+\
-\xcat\xd6\x8f*\x10\xdc\xc77\x1d\xf9\x7f\x81\xb9x\x8f\
-!\xea\xfc\xc5r\xed\x9f\x07t\x14\x90.\xf2o\x81\xf3\
-\xf8\x86\x9a\x872y\x07uF\x1bD|\x81\xdf\x07\xab\
-\xe7\xb2\xc49{TH\xe6I*p\x5c\xce\x00\xf4Z\
-\xcd\xc7\xbfz6J \xeft\x11\xf9K\x1b\x81^\x81\
-\xe35E\x80\xb59\x0d\x84H\x02l\x1c*\xc0(\x12\
-\xc7\x5c`\xf9\x07\xf5A<\xea\xa2.*Q\x84\xe7,\
-<\xe7g\x81\xc0\x00\xf9{\xceO\xb0B\xe7\xfc\x94\xcf\
-~s@K\x91\xff\xce\xfbI\xadC\x9b\x90\x8b\xfc\xff\
-\xbcMe%\x8a@\xbe\xc2\xf3\x81\x96\x08xWY\x09\
-j\x0ah\x13\xa0\x04@\xca\x90\x93S\xd5\x88.\xe0\xdd\
-F\x01/\xe5-Z\x80\x5c\x00\xc5\xaa1\x7f\xf5\xac\xc3\
-\x03\x8a\x11\xf0TK\x06\xefu\x00\xadD\xd4g\xb3\xd6\
-\x04\xa1\x05\xbc\xd5\x91\xc0{M\xe4\xbf\xf3L\x89j^\
-\xd5\x18A\xde\xae\x10\xf0Z\xb48\xab\xc7}\xad\xcd\x03\
-g\x11\xdew\x04\x14\xad\xe6M\xad\xd1g@\x1d\x84\xf8\
-\x1f\xa0\xc4k!\xf5U'\xfb\x0bx\xdf\x19P\xbc\x9a\
-'\xb5N\xdf\x01A\xc3l\x91\x00\xab\xaa\x5c\x1b\x1a7\
-nLh\xd2\xa4\x09Q\x85\xed\x83\x05\x02\xdf\xbe*\xd6\
-\x9f\xb5y\xf3\xe6\xe4M\x9b6e\xc9\xb3?QI\xe9\
-:\xa0_\xaaXw+++\x14L*\x88\xc5b\x89\
-\x03\x06\x0c\xc0\xaa(\xff\x7f\x02\x22\xa8\xa0\xdc\xa1<x\
-\xf0 \xa7<\x8e\xe7\xe1\xc3\x870\x8f\x8a*\xfaH\xe0\
-^&\xa6\xaaa\x87Y\xb3f\xfd\x93\xe3\x1e|f\xce\
-\x9b7O\xd1\xbd\xfaJ!C\x05\xa42u666\
-.\xf9\xf9\xf3g\x85\xfc\xd0III\xf8\x0e\x1d:\x90\
-T\x8c\xff\x1cU\xe2?\xccY\xb4o\xdf\xbe\x5c\xc1\xf9\
-\x8f\x15\xb6\x86\xed\xdf\xbf\xbf&s\xea\xd4\x04\xb1U\x89\
-\xff666E%%%\x12s*\x83\xdfHC\x87\
-\x0e\xc5\xaa\xf9_3\xb9\xd3\x9e<yR \xe3\x5c\x18\
->\xb8\xa6\xb8\x86r\x9a5d\xfe\xc3\xdc\x7f\x05l6\
-[\xe6>\x22x\x8d\x87\x87G\xa1\x8a\xf8S\xd8\xca\x18\
-g\x8fT\xcc\x99X\x9a\x9c\x9c,w\x1e\xed_\xbf~\
-a\x81..U\xf3\xbfZr\x1c\xb1\x0e\x1f>\x5c\xa0\
-\xe0YhP\x17\xe7\xcb\x91cP\xcd\x7f\xd9\xf9\x1e\x8b\
-JKK\x15\xde\x87\x0ct1\x01\xeak5\xff\xab\xa4\
-s\xc9\xcf\x9f?\xcf\xaf\xe4Yl\xfc\xb0\xb0\xb0\xbc&\
-M\x9aP\xd4\xfc\xaf\xb4\xce\xcd\xe1p8\x95>O\x0b\
-\xda\xc8s\xe6\xcc\xc9Vb]\xccF\x94\xe7\x9c\xe4\x7f\
-\x08\xe8OlJJJ\x95\xcfA\x02v1\xaa]\xbb\
-vX5\xff\x15\xb2s\x99\x07\x0f\x1e\xcc\x90`\xe7*\
-<\x0dv\xef\xde\x9d\xae\xa4~.\xa5\xe4?\xd0\x9b\xb9\
-@\xe7\x96\x94US\x81njkk\xeb\x5c5\xff\xe5\
-\xf2-\x13\x9f={\x96Y\xc5\xf3O+\xe4'x\xf0\
-\xe0A\xaa\x8e\x8e\x0eQ\xcd\x7f\xe91\x9e\xee\xee\xee\xa9\
-@\xe7R\xca\xaa\xb9\x00]L\x982e\xcaO%\xd3\
-\xc5lD\x89\xf2\x06\xb4o\xdf\xbe\x10\xe8\xdc\xdc\xb2\x1a\
-*\x89\x89\x89\xbf[\xb6l\x99\xaf\xe6\xbfx_\xb8\xb7\
-\xb7\xf7O\xc0&zY\xcd\x152\xc0\xb4_\x94\xa8\xcd\
-J5\xfe\x87\x0c\x19\x92E \x10p5\xc5|\xa0\xd3\
-\xb1\x83\x06\x0d\xcaV\x8f\x7f\x89\xb8\x93q\xe4\xc8\x91\xf4\
-j\xc2\x9d\x15\x5c\xa3\x07\x0e\x1cH\x87\xd8V\xcd\x7f\xc9\
-\xd4\xb1cGLZZZQu3?99\xb9\xd8\
-\xc4\xc4\x04\xab\x84\xf8G\xd9ls.<\x93U\xd29\
-]\x95)\x00O\xd1\x81\xdc\xcfS\xc2\xb6\xd65\xff\xb9\
-\xe2\xe6\x9f\xbe\xbe>\xf9\xc5\x8b\x17\xf9\xd5d\x03\xf0\x81\
-=Q\x00\x9eI\x91\xb0\xfe\xcdm\xa0\xfc\xe7\x8f\x181\
-\x22\xdf\xde\xde\xbe@\xdc\xef\xb6\xb6\xb6\x85@\x17\x13\xab\
-\xca|<\x1eO\x1c:t\xa8X?\xb4\xa5\xa5e\xb2\
-\x95\x95UjC\xe4\xbf\xa1\xa1!)..\x0e\x1d\x13\
-\x13S\xdc\xaaU+\x92\x98u\x17fPPP\x9e\x82\
-\xeb.\x15D\xcf\xa1C\x87\xc4\xae\xc3\xb4h\xd1\x82\xf0\
-\xe9\xd3\xa7\x9c\x8f\x1f?\xe6\x19\x18\x18\x10\x1b\x18\xff\xb9\
-\xfe\xfe\xfe(\x98;\x0e\x10k\xdd\xbau\x05\xe2\xecp\
-33\xb3\x92\xd4\xd4Tl\x15t.\x16\xe8sqg\
-/p\xd6\xae]\x9b\x0b\xde\xcd\x84\xef\xf7\xf3\xf3\xcb\xaf\
-#9T'\xfc\xef\xdd\xbb7\xae\xa0\xa0\xe0o\x1c\x09\
-\xf8\x8c\xef\xd5\xab\x978l\xc2[\xbcxq\x81\xa43\
-\xf7d\xac\xc33\x16,X\x80\x12\xd7>\xc1\xfb\xff\x9e\
-_\x95\x97\x97\x87\xef\xd9\xb3'\xae\x8e\xf8_\xab1{\
-\xda\xda\xda\x8c\xabW\xaf\xa2D\xf2y\xf2._\xbe\x9c\
-\x0f\x7f\x13\xbd\xbei\xd3\xa6T\xa0\x8b\x8b\x14\xd4\xc5P\
-\xe7\x16\x01\x9d[!G\x94\x8e\x8e\x0e#44T\xdc\
-\xfbQ\xe2\xde_\xcf\xf8\xcf\x9f8qb\x11\x8dF\xa3\
-\x8a\xc9?K\x1e?~|\x81\xb8\xfa\xd8\xd9\xd9a\x80\
-\xedJR@\xe7\x92\x86\x0d\x1b\x86\x11\xf7\xfeI\x93&\
-\x15Jx?\xd5\xd9\xd9\xb9\xb8\x96\xf9Q\xab\xfc\x87z\
-6::\xbaXJ\xfe\xe4\x02\xa0\x17K\xc5\xc5@\x00\
-\xbbX\xe2\x99\x81\xa2:\x17\xd8\xb9(qq\x88\xad[\
-\xb7&\xc4\xc6\xc6J|?\xa8\x1b\x1a\xe0\x02r=\xe5\
-?g\xcd\x9a5\x7ft\x9e\xc4C\xc8\xb9\x5c\xf2\x84\x09\
-\x13\xc4\xe2Ax\xe6`JJ\x8a\xcc5\x19A\xec\x8f\
-\xd8\x98\xfa)S\xa6d\xf2x<\xaa\x94\xfc\xe3\x10\x0b\
-\xa0jQ\x17\xd7\xda\xda{\xf7\xee\xdd\xd1@\xcfI\xc5\
-2YYY\xd8\xce\x9d;c$\xad\xc7\x03\xbb\xb8\x08\
-\xeaU)>~\xfa\xbcy\xf3$\xc6\xbeu\xe9\xd2\x05\
-\x07\xde!\xd5\xbf\x97\x9f\x9f_\x0a\xb0@I}\xe2\xbf\
-\x96\x96\x16\xfd\xfc\xf9\xf3\x99\xd2\xe4\x07<c\xcb\xc7\xc7\
-\xa7@\xda\xd8\x83\xe7\x0e\x86\x87\x87\xa3%\xe8b\xfe\xe3\
-\xc7\x8f\x8bd\xc4~rW\xaf^]\x00\xc7\xb9\xb4\xb5\
-\xb2\x90\x90\x90B\xa0\x8b\x99\xf5\x84\xff|\x07\x07\x87L\
-\x0a\x85R*#w>\xa6e\xcb\x962e\xef\xf0\xe1\
-\xc3q@\xbf\x92\xc5\xac\xf1\x12mll0\xf2\xe8\xa0\
-\xcf\x9f?\x17K\xab\x0b\xa8+\xd5\xc9\xc9\xa96tq\
-\x8d\xf3\x1f\xe0=\xfc\xcb\x97/\x7fI\xc3\x8f\x0c\x06\x83\
-\x06p\x91\x5c\xed\x85\xe7\x1f\x8a9\xb3\x89\xb3g\xcf\x9e\
-\x029c\xff\xf9@\x0f\xa0\x98L\xa6\xd4\xb8\xa2w\xef\
-\xde\x15\x83\xf9FVu\xfe\xc3=\xa2\x91\x91\x91\xd9\xd2\
-\xda\x0a\xf9\x0fpa\x91\xbc\xe3\x0d\xd8\xb4D\xa0gK\
-\x84\xd6\x151\xc6\xc6\xc6\xf2\xeec\xe3O\x9b6\xadP\
-\x06\xff\xf9\xa0\xce\xf90\xfe\xae>\xc8\xff\x91#G\xe6\
-\x93\xc9d\xa9\xbe4 \x13\xd0\xe2\xfc@\x92x\xe8\xee\
-\xee\xfeG\x17\x03\x9dK\x83\xe7\xa1\xcb\xdbw\x00\x83\x92\
-\x00\x06EK\xab\x0b\x09\x14GGGT=\xd2\xbf\x8c\
-3g\xce\xe4H\xd3\xbfP'\xae]\xbbVn\xec\x07\
-\xf5,\xd0\xb7\x05\xf7\xee\xdd\xcb\xd6\xd5\xd5\x957\x172\
-'  @\x96\xfe\xe5\x82\xba\xe6\xc1:\xd7'\xfc\xdf\
-\xb5kWLNN\x8eT\xfc\x09\xf0ii\xcf\x9e=\
-\xe5\xc6~\x00O\x16v\xea\xd4\x09\xa5\xa0\xdf\x09/\xad\
-\x0e\xd9\xd9\xd98PWl=\xb4\xbf\xb8\xde\xde\xde\xb9\
-\x00g2d`?\x94\x02\xd8\x8f_E\xbf\x93(\x06\
-f\x82:\xe6\xd5\xb2\xfdUk\xfe\x07\x03\x03\x03\xd2\xfb\
-\xf7\xefQ2\xce!\xa2\x00\x1b\xb8\xa8\x9a\xeb%\xd1\xef\
-$\x82y\x0aa\x1d\xeb\xb3\xffm\xec\xd8\xb1(\x80\xaf\
-\xc92l\x01\xb4<\xb6@u\xf9\x9d\x04\x98\x9f\x0c\xea\
-VX\x9f\xfdo\x90\x1a5j\xc4\xb8x\xf1b\xbe,\
-[\xd8\xcf\xcf\xaf\xba\xfc0\x5c\xa0\xd7e\xea\xdc\x0b\x17\
-.\x14\xc0\xba\xd5w\xff?$\x0b\x0b\x0bl~~\xbe\
-T_\x1a\xd0\xd5\xf8\x1e=z\xe0\xab\xe1]8\xb8\xbe\
-\x22C\xef\x97\xc0sM\x1a\xd0\xfa#g\xdd\xbau\xf9\
-\xb2\xfc0\xe7\xcf\x9f/\x84g\xe6Te\xad\xe7\xd2\xa5\
-K\xb2t.k\xcd\x9a5\x05\x0di\xfdQ\x01\x99L\
-\x012\xb9\xb29\x01\xf9\xe3\xc7\x8f/\x82\xfa\x5c\x86\xdd\
-W\x0ctM]\xe5\x8d\xa8\xd3\xf8\x13\x17\x17\x97B9\
-0\x09\xbaE\x8b\x16\x0a\xef\xa1\x83\xfa\xfb\xc3\x87\x0f\xc5\
-\xb2\xb0\x96\xb3\xb3s!RwyS\xea4\xfeJ\xb0\
-\x16[(K>\xf8\xf8\xf8\x14*(\x1f\xfe\xf8\x99!\
-\x9e\x97&\xdf\xae\x5c\xb9R\x17k\xbeJ\x15\x7f\xd8\xa7\
-O\x1f\x9c\x94\xb3\x98\xcbmR|\xf7\xee\xdd\xe5\xd6\xc5\
-\xe0\xda\x92\xdc\xdc\x5c\xa9\xfa]\x10sQ\xd7\xe7\x9d*\
-C\xfc-g\xc3\x86\x0d(Y\xba\xf8\xdc\xb9sr\xe9\
-bx\x0d\xd0\xdb(Y\xbe\xa6\x80\x80\x00\x94\x12\xec\xfd\
-Q\x8a\xf8g\xe8\x93\x8c\x8b\x8b\xc3H\xdd8A&\xcb\
-\xa5\x8b\xc7\x8c\x19S\x0c\xf5\xb6\xb4gA\xff'|\xa7\
-:\xfe\xfc\xff\xbax\xea\xd4\xa9Et:]\xaa.~\
-\xfb\xf6\xadT]l``@\x01\xd7H\xd5\xb9\xe0\x1d\
-\xb4\xc9\x93'\x17!\xca\x91\xabLi\xe2\xffuuu\
-\xe97o\xde,\x94\xc3?&I\x17sW\xae\x5c\x89\
-\x92\xa5so\xdc\xb8Q\x08\xf5\xbez\xff\x85\xd8xd\
-lQQQ\xa5tq\xd7\xae]K\xb2\xb2\xb2\xa4\xea\
-\x5c\xf0lB\xbf~\xfd\x94\xe5\x8cqe\xdc\x7f\xca\xd9\
-\xb2eK\x81\x8c\xfdG\x15t\xb1\x96\x96\x16\xf3\xf4\xe9\
-\xd3\xb2t.{\xf3\xe6\xcd\x85J\xd6^\xa5\xdb\x7f\xdd\
-\xb6m[\xe2\xb7o\xdfd\xeab\xa8g\xcb\xef\x195\
-jT1\x89D\x92\xeaS\xfd\xfa\xf5+\x16<[\xd9\
-\xf2#*c\xfe\x01\xfe\xf4\xe9\xd3\x8b\xe0\x9a\xbc,]\
-\xdc\xbcysJ\xb3f\xcd\xa8QQQ\xc5\xb2\xe2+\
-\xc03\x8b\x11\xe5\xcb\x0f\xaa\x94\xf9\x1f\xa0.\xbes\xe7\
-N\xa14\x9er\xb9\x5c&\xb0\x8b\xf3W\xacX\x91\x0f\
-?K\x93W\xb7n\xdd*\x02\xcfT\xc6\xfc\xb8J\x9b\
-\x7f\xc6\xda\xda\x1a\x8bF\xa3\x092\xe2\x9cKKJJ\
-\xa4\xfa\x96\x8b\x8b\x8b\x09VVV8el\xa3\x92\xe7\
-_\xe2\x04\x06\x06\xa2\xaa\xb8\x17\x98\xbd}\xfbv\x94\xb2\
-\x8e1e\xcf?\xd6\xae];bBBB\xa5\xf7\x1f\
-}\xff\xfe\x1dkdd\xa4\xcc\xe7\x03({\xfe=\xbe\
-\x9b\x9b\x9b\xacX5\xb1\x05\xde\xe3\xea\xeaZ\x88(w\
-Nn\xa5\xcf\x7f\xd8\xb8qc\xfa\xfd\xfb\xf7\x0b\x15\xdd\
-\x7ft\xf7\xee\xddBx\xaf:\xffa\xd5\x09\x9e\xaf\x80\
-\xc1`\xe4\xde\x0b\x0c\xf5v\xff\xfe\xfdU!\x0f\xb4J\
-\xe4\x1f\x86q\xcd\xbbv\xedB\xc9\xb9\x17\x98\x0d\xf4v\
-\x81\x12\xeb\x5c\x95\xe3\xbf 7\x13111Q\xa6.\
-\x86\xfa\x1a\xeamUh\x13\xa2Z\xf9\xe7\xf9s\xe6\xcc\
-)\x84{\x8c\xa4\xe9\xdcY\xb3f)\xbb\xceUU\xfe\
-\x975i\xd2\x84\xf6\xe8\xd1#I\xba\x98\xff\xe0\xc1\x03\
-\xa8sU%\xf7\xbc\xca\xf1\x1f\xd2\xa0A\x83\xd0X,\
-\xb6\x82]\x0c\xf43a\xe0\xc0\x81\x18Uj\x8b@G\
-\xa9\xda\xf9;P\x17\xe7\x89\xd8\xc5\x1c\xf0]\x81*`\
-9\x11\x82c_\xe5\xce\x8f\x03\xfa\x15\xff\xe3\xc7\x8f\xc2\
-r\xe6\x83\xcf\x8a\xec?R&\x82~\xa9\xdf*Xo\
-\xde\xcc\x993s\xd8l6\x05\x9ew1{\xf6l\x14\
-\xa2\x9agu'\x02\xba\xa9\x82\xf5\x86>j\xf2\xbd{\
-\xf7\x92\x81>\x869\xe6i\xaa\xd8\x06@W\x11\x15>\
-\x7f\xd3\xc4\xc4$\xabS\xa7Ny*\xca{8f\xe6\
-!\xaa}\xfe,_E\xe5\x0e\xa48@\xa6\xc8\x7fE\
-}\xfer\xed\xe7\x1d\x5c\x8b\xfc\xbf\xc0\xb3\xb0?\xab\xf9\
-Rk\xf4\x01\x90\x09\xf2o\x99\x00\xa8X\xcd\x9b\x1a'\
-\xe8\x1f\x19\x87T,\x9a\x80<\x11\x15<\x8fV\x85\x08\
-\xe6\x96Z*\xe0\xb5\xb8\xa2\x0dh9\xa0\x225\xafj\
-d\xdc/\x15\xf0XZ\x81}\xe3\x04\xe8\xa3Z'W\
-\x9b\xae}/\x909\x1a\x88\xfc\x05\xea\x87u\x80`\xbe\
-|\xaa\x9a\x8f\x95\xc2\xf7\x90wk\x00\xb5G*_L\
-\x05v\x02\xb4\xd5~ \xff\x9d\x99\xcd\x12Z\xbbT\xd3\
-\xff\xfd\xc8%\x02\x9f\x02\xe4\x95\x87\x10\xbe\x97X\xde\xfd\
-\xff\xa3\x96\xf0gD]\xd4E]\xd4\xa5\x9a\x8a$9\
-c\x01\xfe\x09D\xfe\xd3\xcc\x1aH'\xc1\xd7\x1a\xc8\xc7\
-\xe6\xc8\x1f\xaad\xd1\x03d\x0dh\x15\xa0\x1b\x80\x12\x00\
-\xe1\x95\x1cOq\x05kQ\xf5\x91\xe0:\xc3W@\xd7\
-\x00\xad\x04d%\xe8\xa3\xea.p\xc48\x03\xba\x04(\
-]U\xfd\xba\x0d\x00\x17\xa6\x01\xba(\xf0\xb94\xaf\x86\
-~\x87x\xc5N0\xd7\xf1j\x1e\xab\x0c\x95\x08d\xc2\
-\xf0*`N\x03@~\x80\xb2\xd5\xfcTY\xca\x02\xb4\
-Z\xd0\x97\x8a\x14c@'\xd5\xf6y\xbd \xd8\x87'\
-\x04}*O1\x02\x14\xa2\x22q\xa6j\x92?\x1e\x0b\
-\xf6i;9d\xfe1\x15\x8cwR\x93|1\x91\xc7\
-\xa5\xe0B\x88\x13|\xd42\xbf^\x13E\xd0\xc7\xe20\
-!\xc4\x8a\x99j\x1e\xd5{\xca\x004T\xa4\xef\x9b\x01\
-\x0aU\xf3\xa6\xc1\xd0UA\x9f\x97\x17'\x81/I\xcd\
-\x9b\x86A8\xa1X\x91&\x80\xce\xa9y\xd2\xe0\xe8\xac\
-\xa0\xef-\x01\xa56D\x1ehjjR\x005T\xbc\
-\x9b\x02\xa8/\xa0e\x0d\x14\xf3\xb3g\xcc\x98\xf1\x0d\xd0\
-OD\xc9\xce\x8a\xafE\xbf\x10\xec\xfb+\x0dq\xfc\x9b\
-\x9a\x9a\xe6eddd\xa6\xa5\xa5\xa1:w\xee\x8cn\
-\xa02\x00\xfa\x84b\x1bZ\xbb\xb5\xb4\xb4\xa8AAA\
-Ipk1\xdc\xef\x17\x1c\x1c\x9cU\x07g\x04(\x03\
-E7\xc0\x98T\xbe\x9d\x9d]:\x91H\xfc{V\x16\
-\x81@(\x1d=z\xb4\xaa\xeeu\xab\x0a\xe5\x0a\xd6\x8d\
-\x1bL\x9b\x9b7o\x8e{\xf5\xeaU\xaaH>V\xfe\
-\x9b7oP\x0a\x9c\xd3V\x9f\xfc\x81\x0d)\x96\x83\xed\
-\xe9\xe9\x99\xcc\xe1p*\xe4\xb4\x84g\xd1\xfb\xf8\xf8\xe4\
-5\xb0u/VC\xea\xff.]\xba\xe4gff\xe6\
-K\xca3\x02~\xc3\xf6\xe8\xd1\x03\xa3\xee\xff\xfaG\x00\
-\xdfQ\xcf\x9c9\x93\x22#\xef!\xe7\xec\xd9\xb3\xb9\xda\
-\xda\xda\xf4\x06\xd4\xff\x0d\x01\xf7\xf2\xc7\x8c\x19\x93I\x22\
-\x91d\x9e3\x0f\xae!\x8e\x1b7.\xbf\x81`\xc1\x06\
-\xd1\xff-[\xb6,y\xf7\xee]\x96\x9c\xb9\x06\xf9o\
-\xdf\xbe-\x00X\x90\xa0\xee\xff\xfa\x81\xf9V\xaf^\x9d\
-\xce\xe3\xf1\xa8\xf2\xe69\xe4r\xb9t__\xdf\xec\x06\
-\x10\x07S\xef\xfb\xdf\xc2\xc2\xa20''\xa7P\xd1<\
-\xaf\xd9\xd9\xd9\xc5\xe0\xdebu\xff\xab.\xe9\xe8\xe8P\
-/^\xbc\x98)g~\xcd\x0aX\xf0\xdc\xb9s\x99\x00\
-\x0b\xd2\xd4\xfd\xaf\x92\xc4svv\xce\xa1P(\x84\xca\
-\xe6\xd9&\x93\xc9\xa5c\xc7\x8e\xcd\xa9\xc7X\x90\x85\xa8\
-^\x9e>\xb9\xc8\xd0\xd0\x10\xff\xe9\xd3\xa7\x5c\x05\xf3K\
-W\xc0\x82\x007f\x03\xfc\x88W\xf7\xbfj\xb5k\xdd\
-\xbaui\x00\xf3\xd1\xcb\xaaX\x00\x16\xa4\xfa\xf8\xf8\xa4\
-\xd6S,X/\xfb\xbfg\xcf\x9e\xf9yyy\x85e\
-\xd5T\x00\x16,\xe8\xd6\xad[\xbe\xba\xff\x95\x9f\x00^\
-#\x87\x84\x84\xa4T\xf1|\x93\x0a\xb9\xd7\xcf\x9e=\x9b\
-\xdc\xa8Q#J=\xec\x7fV}\xc2|NNNi\
-\x00\xf3\x95\x94Us!\x91HXGG\xc7\xb4z\x86\
-\x05\xebU\xff\x03\x9c\x86\xf9\xf8\xf1cz\x151\x9f\xc4\
-\xf3\xbe\xde\xbcy\x93\xd2\xbcys\xac\xba\xff\x95\x92\x98\
-\xabW\xafN\x02\x98\x8fRVC\x05`A\x92\xa7\xa7\
-\xe7\xcfz\xc4\xb3z\xd3\xff\xdd\xbbw\xcf\x06\x98/\xa7\
-\xac\x86K&(\x9d:u\xcaV\xf7\xbfR\xad\xed\x92\
-.\x5c\xb8\x90\x08\xba\x87UV\xf3\x85y\xfc\xf8\xf1x\
----r=\xe9\x7fU\xb7ky\xa3G\x8fN\xa2\
-R\xa9\xe8\xb2Z*\x00\x0b\xa2\x86\x0f\x1f\x0e\xf5\x00O\
-\xdd\xffuK\x06\x06\x06E\x00\xf3\xfd\xac!\xcc'\x11\
-\x0aDDD|m\xd2\xa4I\x91\xba\xff\xeb\x16\xf3y\
-{{\x7f\x05\x98\x8fTV\xcb\x05`A\xec\xdc\xb9s\
-?\xa8\xb8\xfeT\xe9\xfe\xef\xd2\xa5K*\xc0|\x19e\
-uT\xd2\xd2\xd2\xbe\xb6i\xd3&I\xdd\xffuB\xe4\
-c\xc7\x8e\xc5\xc0c\xd0\xcb\xea\xae\x90\xb6n\xdd\xfaR\
-\x85\xf7\xcf\xb1T8\xde\x99\xb6e\xcb\x968\xd0\x07\xd4\
-:\xec\x7f\xca\xbau\xeb\xa2Ux\x0d]\x95\xfb\xbf\xac\
-m\xdb\xb6y\x89\x89\x89)u\xd4\xf7\xfc\xf8\xf8\xf8\x14\
- \xff\x0bT\x5c\xfe\xab\xf2~\x07\x8e\xab\xab\xebO\x16\
-\x8bUZ\xdb\x9d\xcf`0\xf0\xd3\xa6MKR\xf1\xbd\
-\xc3\xaa\xde\xff\xf0\xec\xd2\xd2\x87\x0f\x1f\xfe\x86\x90\xbc6\
-\xe1\xff\xdd\xbbw\x93\x1b7nL\xa8\x07\xf6\x9f\xca\xef\
-w\x1a8p`\x16\x16\x8b-\xaa\xad\xceG\xa3\xd1E\
-\xd6\xd6\xd69\xf5\xc4\xff\xa7\xf2\xb9\x0f444\xe8\xbb\
-w\xef\xfe]K\xb6\x00#000\x05\xbc\x93\xa1\xee\
-\xffZ\xaf\xabD\x7fk\xfb\xf6\xed\x8b\x7f\xfc\xf8\x91]\
-\xd3\x9d\x0f0_n\xbbv\xed\xa4\xe5\x8b\xe0\xa9\x90O\
-H%\xfa_GG\x871s\xe6\xccD\xc0wi9\
-\xca\xb8s\xe6\xccIc2\x99\xc4\x1a\xc4|D\x807\
-3\xa4\xf1\xcc\xc0\xc0 \x7f\xc8\x90!\xaf\xb5\xb4\xb4\x18\
-\xea\xfe\xaf\x9e\xbd{#F\x8c\xc8\xc7\xe1p\x85\xdb\xb7\
-o\xcf\x946\xb7\xf4\xf4\xf4\x88\x8f\x1e=\xca\xa8!,\
-\x081_&\xc0\x9b\xd2r\x040\xfd\xfd\xfd\x13Q(\
-\xd4o\x88IT]\xa6*I\xbe\x06\xe2\xcb\x97/\xff\
-\xc4q\x17\x15\x15a\x01\xee\x92jo\x0f\x1e<8\x17\
-`ALuw~qq1f\xc0\x80\x01Rc@\
----s\x0aA\x81\xb1B\x8f\x1f?N\xd7\xd7\xd7\
-'\xaa\xfb\xbfJ\xc4]\xb6lY\x16\x9b\xcd.\xf7\xf1\
-q\xef\xdc\xb9\x93\x05\xe6 Y\x0a\x16d\xec\xd9\xb3'\
-]\x90\xdb\xa7z\x1c=|>s\xc7\x8e\x1d\xe9\xe0\xd9\
-\x12ce\x81-H\xba}\xfbvz\xf9^#\x16\x8b\
-E\x9e?\x7f~\xa6\x92\xcbW\xa5\xee\x7fssst\
-JJ\xca?v\x1d\x9dN'\x01\x1d,\x95\xaf\x00\x0b\
-b\x00\x16\xcc\xaf\xae\xfe\xff\xfe\xfd{\xbe\xb1\xb1\xb1\xb4\
-\xb8?\xee\xacY\xb3\xb2\x00>\xf8g\x1d\xf2\xd7\xaf_\
-\x05fffhu\xffW*G\x17=888S\
-\x5cL\x0f\xe8\x8f<\x80\x05\xa5\xe5\xe9\xe0\xce\x9d;7\
-\x0b`ArU\xfb^0\xde\xb2\xa5\xf1\xc9\xc4\xc4\x04\
-\x9b\x90\x90P \xe6v\xd6\xe1\xc3\x873\x95\x18\x0b*\
-k\xff\xf3\xed\xed\xed\xf3JKKK$\xc8c\xc6\xb6\
-m\xdb\xd2\xa4\xed]\x00\xba\x97\xfc\xf0\xe1\xc3l\x91<\
-O\x0ac>\xa0o\xb2\x81\xbe\x91\x18\xf7\xaf\xa9\xa9\xc9\
-\xdc\xb5kW\xa6$}S\x02\x8a\x9d\x9d\x9d\xb2\xe6\x93\
-P\xca\xfe\x87\x98\xef\xc5\x8b\x179\xd2\xfa\x0e`\xc1\x22\
-\x80\xb7\xf2d`A\x14\x06\x83\xc1U\xb6\xf3!\xde\xec\
-\xdf\xbf\x7f\xa1\x8cw\xe4\x83w`\xa5\xc5\x8d\x87\x87\x87\
-\xe7\xc06)i\xff+\xdb\xb8\xe4,Z\xb4(\x13`\
->Yq\xdc\xdc\x1b7n$\xeb\xea\xea\x92d\xcc\xcd\
-\xacJbA&\x901Y\x00\xf3\xb1\xa4\xac=\x90\x1e\
-<x\x90)K\xc6@\xfc\xbax\xf1\xe2l%\xc4\x82\
-J\xd7\xff\xa6\xa6\xa6E\xc9\xc9\xc9\xf9r\xeaf\xdc\xb8\
-q\xe3~\xc8\xd0\xcd8\xa0\x9bQ\x8av\xfe\xd7\xaf_\
-\xf3\x01\xc6(\x91\xe6\xe7\x9b:u\xea/\x801\xe4\xda\
-_\x0e\xdaT\xd8\xa9S'\xac\xba\xff%\x13\x98\xaf\xf4\
-\x83\x07\x0f&\xcb;_\x01\x0e\xa0,]\xba\xf4\x8b\x8c\
-5,\xde\xec\xd9\xb3s\x016'+\x82\xf9\xa6O\x9f\
-\x9e#C7rW\xacX\xf1\x03\xd4\x81&\xef\x1e\xc2\
-#G\x8ed)\x19\x16T\xaa\xfe\x07\xba4\x13\x87\xc3\
-\xc9\x1d\xc7\x1d\x1f\x1f\x9f#\xc3\x17_\xee\x17\xa4\xdc\xbb\
-w/WN\xbf \xd4+\xd9\xc0\x9e\x97\xb9\xd7\x13\xda\
-\x84@\xb6\xc8mg\x02(\x88\x17`Ae\xea\x7fe\
-Y\xc7\xc7?~\xfcX\xeeu|h\xdb\xcd\x993'\
-K^\x9d:h\xd0\xa0\xc2\xe2\xe2b\x99\xfbBQ(\
-\x14\x06\xe0\xcaBy\xfdS\xee\xee\xeeY\xd0\xd7#\xef\
-\x1eB\x88\x05\x9b5kFR\xf7\x7f\xc58\x1e\xd0\xa7\
-\xf2\xc6\xf1\xf0\xc2\xc2\xc2r\x9b6m*7\x1f!\x8e\
-\xdb\xb9sg\x0e\x90\xd7\x12\xf7\x08\xf1x<\xc6\xe6\xcd\
-\x9b3\x15\xe1\x0b\xe8K\xe2\xb3g\xcf\xe4\xb63\xc1X\
-\xa1,X\xb0@Y\xb0\xa0R\xf4\xbf\xa1\xa1a\x0e\x90\
-\xe5\xbf\xe4\xdd\xc3\x01t\x04~\xf8\xf0\xe1\x0a\xe7\xebn\
-\xdf\xbe=\xfe\xfb\xf7\xef\x92\xe2D\xf8qqq\xf9m\
-\xdb\xb6-\xa9\x84\xaf\x22\x17\x8f\xc7\xcb\xbd\xe7<))\
-\xa9\xd0\xcc\xcc\x0c\xab\xee\xff?\xc4\xf0\xf6\xf6~\x0f\xd3\
-\xb0\xcb\x8b\xa3\x8e\x1d;\x96\x0d\xb0bep\x14\xcf\xcd\
-\xcd-\x1f\xe0\xbb\x0a\xb6%\x8dF#N\x9e<9\xbb\
-2\xfe\x10\x80\xe9hg\xcf\x9e\xcdP \xcf\x1830\
-00C\x09ro(E\xff\xaf[\xb7.^\x818\
-n\xf6\x89\x13'\xb2\xa0\xadP\x99\xf7\x01,H\xbd}\
-\xfbv\x9e\x08\xce\xe0\x5c\xbdz5SWW\x97ZI\
-_5\xed\xfc\xf9\xf3\x8a\xe4\x99\xa3\x05\x04\x04$\xab\xfb\
-\xff?\x02\x18\xbe\x18\xc8ey\xf3\xb3\x96AY\x0bd\
-n\xa5}\xaa\xd6\xd6\xd6\xc5\x00\xe7\xfd\xf5\xd9\xe5\xe5\xe5\
-\x15\xf5\xea\xd5\x0bUY_\xb5\xa3\xa3c.\x81@\xc0\
-+\xb0\x9e$\x97\xdd\xd2\x80\xf0\x1f\x17\xe0\xbf\x14`\xa3\
-\x13\x14\xc4\xd1\x95\xf2\xa9B,\xb8i\xd3\xa6,\xb8\xae\
-\x0b0\x1f\xcd\xcf\xcf/\xb5\xb2\xbc000 DF\
-F\xe6\xc8;v\x051D\xe9j\xfcW\xc1\xfe#\xdc\
-\xbf\x7f?U^\xfb\x0f\xfa\x87\x17.\x5c\x98UY>\
-B\x9c\x07\xf0^\xce\xa7O\x9fR[\xb6lY\xd9\xb3\
-/9\xcb\x96-\xcb\xe4p8\xf2\xea..hc:\
-h+Q\xed\xff\x11\x1b\xc7\x9d\x83\xc1`\x8a\xe5\x95\xa3\
-\xbf\x7f\xff\x868\xba\xb2\xe75\xf0\x81\x0d\x912x\xf0\
-\xe0_\x95\xe5\x01<7,55U\xee<s\xa0m\
-h\xd0\xc6\x5c\xb5\xffOr\xec\xce\xee\xdd\xbb\x93\x15\x88\
-\xe3f\x1d:t\xa8*\xeb\xeb\xec\xca\xee\x7f\x15\xc4'\
-d(\x90g\x8e\xb1k\xd7\xaeTi1D\xea\xf5\x9f\
-\xbfq\xdc9\x0a\xf8TK\xc0<\xaem\x9fjy|\
-\x82\xdc\x98\x0f\xb4)\x0f\xb4M\xd9b\x81\x94q\xfd\xf7\
-O\x1c7\x8b\xc5\x927\x8e\x9b\xf7\xec\xd9\xb3\x9c\xa6M\
-\x9b\xd6\x9aN\x05\xb8\x93\xf0\xf2\xe5K\xb9}~L&\
-\x93\x04\xda\x94\xa1\xa4\xeb\xbfJ\x17\xff\xa1\xaf\xafO\x80\
-\xf1\xb3J\xeaS\xe5,Y\xb2D\x9e\xf8\x84\xbf\x98\xef\
-\xe1\xc3\x87\x19J\x1a\x0b\xac\xb4\xf1_C\x86\x0c\xc9\xc5\
-\xe1p\x18E|\xaa\xa6\xa6\xa65~vW\xa7N\x9d\
-\xd0p-_\xdezaA\xb1\xb1\xb1\xc9S\xc7\x7fU\
-*\x16 M\x81\xd8\x1d\xd6\xfe\xfd\xfb3+\xe9\x17\x96\
-\xbbN\x87\x0f\x1f\xceP \xcf\x1c\x13\xd4)\xbd&\xeb\
-T\x9f\xe3\xbf\xc1|.\x066^\xbe\x02s\x0d7t\
-\xe8PTM\xc9$\x883\x01\xdc\x94;\x9e\x10\xc6\x7f\
-w\xec\xd8Q\x1d\xff]\x05]\xbbp\xe1\xc2\x0c\x05t\
--\xef\xd1\xa3G90\xf6\xb7\xba\xeb\x02\xf1\xe5\xd3\xa7\
-O\x15Y\xe7%\x03L\xa2\xde\xffQ\x0dX\xfb\xf9\xf3\
-\xe7Y\x0a`m\x8a\xbb\xbb{N5\xf3\x9d\x0b\xf7\xf2\
-@\x9c\xa9\x80M\x92U\x9b6I}\xde\xffkgg\
-\xa7\xd0\xfa:\xb0\xb5Q\x1d:t\xc0U\xd7\xfb\x81\x0c\
-\xc7\x00|Y\xa0\xa0O\x22O\xbd\xff\xb7Z\xf7\x02)\
-\xe2kc\xed\xd9\xb3\x07\xae\x113\xab\x01\xf31\x00\x86\
-S\x04\xf3\xb1\x8e\x1c9\x92\xa1\xde\xff]\xbdT\x09_\
-{\x09\xb0\xbb\xaa\x8c\x05\x81\x1d\x9a\x0fq\xa5\xbc\xefM\
-II\x81q\xdehU\xe0\xa9\x8a\xe5\xff\x80kmY\
-\x0a\xac\xb5U\x19\x0b\x82{Iaaarc\x0f\x88\
-S\x17/^\x9c\xa9B9\x95T*\xff\x93\x81\x81\x01\
-1\x22\x22B\xee3\xdd\xaa\x88\x05\xb9\xf3\xe6\xcdSd\
-\x0f)\x1f\xeeYS\xd2}^\xf5%\xff\x17\x7f\xe4\xc8\
-\x91y\x8a\xc4\xda\x00,XX\x19,\x08\xee\xc1B\x1c\
-)\xef{\xe0Z\x10\xccS\x82\xa8\xd6\xf9@*\x97\xff\
-\xadQ\xa3Ft\x18\xff\xa7 \x16\xccV\x04\x0b\x0ar\
-Hd*\xe2{<v\xecX&\xac\x9b:\xff_\xcd\
-S\xd7\xae]\x8b322\x8a\x14\xc0\x828E\xb0\xe0\
-\xe0\xc1\x83\x0b\xd0h4V\x81<\xe0E]\xbatA\
-\xab\x1a\x1fU8\xff#g\xe5\xca\x950\xeeJ\xde\xbd\
-w\xbc\x07\x0f\x1e\xc8\x85\x05\xf5\xf4\xf4\xc8\xf7\xef\xdf\x97\
-\xdb\xcf\x07\xeb\xb0b\xc5\x8al\x15\xe5\xa3\xca\xe6\x7fo\
-\xd1\xa2\x05\xe1\xf5\xeb\xd7y\x0a`A\xb8_L\x16\x16\
-\xe4\xba\xb9\xb9e\x8b\xe6q\x91\x86\xf9\xa2\xa2\xa2\xf2`\
-]T8\xff\xa3\xaa\xe6\xff\xe7\x8f\x193&\x97D\x22\
-\xc9\x9d\xfb911\x11\x05\xf7\x83K\x89=\xc2)\xb2\
-\x9f\x93H$\x12F\x8f\x1e\x9d\x87\xa8\xee\x99\x90*}\
-\xfe\x87\xb6\xb66\xed\xcc\x993\x99\x8a`\xc1\xdd\xbbw\
-\x8b\xf5\x0b\xc2\xb8\xbc\x1d;vd(\x80\xf98\xa7O\
-\x9f\xce\x02u\xa0\xab*\xff\x90zp\xfeS\xf7\xee\xdd\
-\x8b\xb3\xb2\xb2\x8a\x15\xc1\x82\x10\xdf\x89>g\xc0\x80\x01\
-\xa8\xe2\xe2b\xb91_ff&\x1a\xbc\x1b\xad\xca\xbc\
-C\xea\xc7\xf9o\x1c\x1f\x1f\x9fL.\x97+7\x16\x84\
-y\xa1 \xce\x13\xda{@\xbe{\xf7n\x96\xbc{\x0f\
-\xe0\xbb\xbc\xbd\xbdU\x15\xf3\x89\xf6\xbf\xca\x9f\xff\xd8\xaa\
-U\xab\xd2w\xef\xde\xc9\xed\x17\x84\xb9@\x00\x16,\xdf\
-\xeb\xc9\x83\xf9\xdd`\xce\x0fy1\xdf\xdb\xb7o\xf3\xc0\
-;U=\xf7\x7f\xbd\xe9\x7f\x88\xbf\xc6\x8d\x1b\x97K&\
-\x93\x15\xc2\x82\xc6\xc6\xc68\xb8\x0f\xe8\xdb\xb7or\xaf\
-\xed\x02\xbcI\x00\xef\xcaG\xea\xc79\xe0\xf5\xe6\xfc_\
-\x1d\x1d\x1d\xb8\x077K\xde=\xb80\x0f\x04\x8c/\xdc\
-\xb3gO\x0a\xdc\x07(/\xe6;{\xf6l6\xc4\x9d\
-\xf5\x81gH=;\xff\xbdg\xcf\x9eE999r\
-cA\xb8\xdf\x14\xc8}\xb9\xd7\x12\x00\xceD[XX\
-\x14\xd7\x17~\xd5\xb7\xfe\x87Xv\xcd\x9a5\x10\x0b\xd2\
-\xab=\xf9;x\xe6\xea\xd5\xab\xb3\xea\x01^\x16\xed\x7f\
-f=j\x0f\xcc%S\xfa\xf1\xe3G\xb9\xfd\x82\xf2b\
-\xbe\xf7\xef\xdf\xe7C\x9cY\x9fxU\x1f\xfb\x1f\xe22\
-gg\xe7\x5c\x0a\x85B\xa8\xae\xce\x07\xb8\x92\xe0\xe4\xe4\
-\x94[O0_}\xef\x7f\x88\x05\xa9!!!rc\
-AY\x98\xef\xe2\xc5\x8bY\x10_\xd67>\xd5\xd7\xfe\
-\x87\xd4\xabW\xaf\xa2\xbc\xbc<tU;\x1f\xe0I4\
-\xc0\x95\xc5\xf5\x91G\x82\xfeg\xd4\xd3\xb6\xb1\xd7\xad[\
-\x97\xc9\xe3\xf1*\x8d\x05\xe1\xbd~~~\x99\xf5\x0c\xf3\
-5\x94\xfe/k\xdd\xbau\xe9\xa7O\x9f*\x8b\x05\xf9\
-\x1f>|\xc8\x83x\xb2\xbe\xf2\xa7\xbe\xf7?\xf4\xed\xba\
-\xb8\xb8\xe4P\xa9T\x85\xb1 \xc4\x8f\x13&L\xc8Q\
-\xf6\xfdQ\xea\xfe\x97N0\xa7\xdf\xd5\xabW\xb3\x15\xc4\
-\x82\x1c\x88\x1f!\x8e\xac\xcf\xbci\x08\xfd\x0f\xa9o\xdf\
-\xbe\x85\xf9\xf9\xf9rcA\x88\x1b{\xf7\xee]T\xdf\
-\xf9\xd2P\xfa\x1f\xb6s\xc3\x86\x0dY0\xbf\xb3<\x98\
-o\xfd\xfa\xf5\x19\xf5\x18\xf3\x89\xf6?\xbd\x01\xb4\xb3\xac\
-M\x9b6%111\xb2\xb0 \xff\xf3\xe7\xcfy\x00\
-7\x964\x04\x9e4\xa4\xfe\x878n\xd2\xa4I\xd9\xd2\
-\xb0 \xc4|\x00/f\xd7C?\x9f\xba\xff\xff\xf3\x0b\
-RBCC\xd3%`\xc1?9\xa0\x1b\x00\xe6\x13\xed\
-\x7fZ\x03jo\x19\xc0u\xf9\x05\x05\x05\x15\xf6\x11C\
-|\xd8\xa7O\x9f\xc2\x86\xc4\x0b@0\x06\x0e\xdd\xc0\xda\
-\xccZ\xb7n\xddo>\x9fO\x15\x8a\x05\xa1\xfb\xfb\xfb\
-7\x14\xcc'LpM\xebK\x03k3\x8c\x17\xc4\x00\
-\x9c\x97^\x8e\x05\xa3\xa3\xa3s!>lh|\x00\xf4\
-\x11\xd0\x95\x06\xd8n\xde\xb8q\xe3~\xd3h44\x9d\
-N'B\x5cX\xcf\xfd|b\xd7\xc9\x01\x9d\x03\xe4\xd5\
-\xd00\x80 \xa7\x0c\xf1\xf4\xe9\xd3\x9f._\xbe\x9c\xd4\
-\xb8qcj\x03\x9c\x03\xf0|\xbbE\x80,\x01\xa55\
-\xc0\xf6\xc3|\x12\xa9\xc0\xd6\xcfj\x88m\x07\x04\xf3\xde\
-\xf7\x02\xa4\x07\xe8B\x03\xe5\x01\xbf\x01\xd9\xfa\xa2t\x02\
-Pc\xe4\xbf2\x1e\x10\xae\x81\xf2\xa1!\x12\xcc\x93\xec\
-\x88\xfc\xbf4\x03tU\xcd\x97\x06C\x97\x00\xe9#\xff\
-\x96\xa1\x802\xd4\xbc\xa9\xf7\x04\xcf\xba\x1a\x8cT,\x9a\
-\x80V\x09p\xa1\x9aO\xf5\x93\xe0y\xb9\x9e\x82\xbe\x16\
-W\x9a\x03\x0aj\x80~\xb0\x86\xe2\xeb?\x0c\xa8)\x22\
-\xbd\x18\x09\xec\x01\xf5\x18\xa8_}\x7f\x06P\x1bD\xbe\
-\x02\xc7\xc0Q\xc1\xfa\x80\x9a\x7f\xaa/\xf3\x0f*\xd0\xf7\
-\xc26\xc1J@\xe9j\x1e\xaa4\xd6\xf3\x94C\xe6K\
-*\x10'\xd8\x00\x0a\x11\xd8\x8cj\x9e\xaa\x06\xc15\xdd\
-\x8b\x80\x06I\xc1z\x8a\x148~F\x03:\x09(I\
-`#\xf0\xd5|V*?&\xec\x93\xdf\x82>r\x14\
-c\xdfWG\xd1\x15\xf8\x8c\x17\x090\xe2'@y\x02\
-\x9c\xc0TS\xad\x12Y\xc0{\xd8\x07\xe7\x05}\xd2[\
-\xc8\xa7+Wa\xfe\xfb\xa7\x19\xf1\xdf\xbf\x0drE\xfa\
-\xff\xdd\xbf\x7fk\x05\xfe\xfb\xb7\x06\xa2.\xea\xa2.\xea\
-\xa2.\xea\xa2.\xd5^D\xf5\xad\xa8>\x16\xd5\xd7\xa2\
-\xfa\x5cT\xdf\x1f\x982i\x5c3\xbd\xf60\x06\xa0\x99\
-\xd3\xf8\xd1\xd3\xfeS\xe1\x1aH\xe3F\xe0?\xfa\xe6\x05\
-x\x041\xb7u\x1a=r\xc6\x86t\xfc%\xaf\x93\xad\
-\x97F\x16\x97\xb5<\xc6y\xe3\x1b\xee\x18v\xa0q\xe8\
-\xce\x83\x16\xbd\xd2\xf3\xd7\xb4\x1c\xddhG\xab\xd5\xc6\x9c\
-\x8b\xf6\x8c\x90s\x03(\xf8\xf8\xcc\x01\xc5\xdf^\x0fX\
-[zn-{T\xd0\xd6\xcd\xec\xe7O,wZ\x0c\
-\xde\xf92w\xe7\xe0\xc1\xa1\xb7c\xbbO\x19\xe3=;\
-\xc2\xf7\xd4\xb9S\x9b?m\xb9=V\xff\xf6\x97M\x03\
-z\xf7\x1e`\xfed\xdb\xe5\xdb\xdfbQG\xf6o\xb7\
-'E%pl\x13\x9c\xaf\xae\xeb:e\x94V\x979\
-V\x86\x03~4\xd5\xff\x968jZ\xb4\x8d\xcb4\xfb\
-\x8d\xa3[:\xb6x\xfd2\xf0\x10zLk\xbf\xa6\xe6\
-\xf3\xb1)S\xba\x99>\xd8\xab\xfd\xfd\xa5\xa1\xbe\xb5\x81\
-\xff\xf8\xf7\x81\x1a\xcd\xda\xcf8\x9030nC\xde\xbb\
-\x1d\xda\x874\xc9\xb1\xef\xf7\x11H\x83\xde\x8c\xb2\xdc9\
->\xb0KY{r\xc6\xd8\x8f;]3\x0f\xec\xf3\xb3\
-<\x1c\xbc\xf3\x5c\x14&j\x87\xd6>\xcd5\xfb\xf3Z\
-\x1f\xcd\xeb:\xace\xd76\x1ai}\xaf/\x88q\xb7\
-=\xdc\xc3Z[/\xf1\x84M\xc8\xad\xd5\x0b\x8e\x8d\xd5\
-m^\xb0\xf8\xe2\xae\xcb\xa3\x1bu}1-h8\xa9\
-k\x88c\xef\xeb'^x \xabcC\xb5\x08y\x8d\
-'u\xb1O~\xbf8kJ\x93\x9b\x8b\xb5C\xdew\
-\xb0X\xb1\xd5\xe3\xc4\xc9\xd1\xeds\x0a\xbc;|8\x95\
-\x7f\xb4\xf3t\xaa\xf3\xb3Y{\xcb\xf6\xd3</PI\
-\xda\xfb\x1a\x1d9\x1b\xe4\xda51(\x13\xbd\xefH?\
-Do\xd2\xaa\x0f\x0e\xb9\x1a\xb7Wn\xedw\xe2\xe4\x01\
-\xbd\x01V\xfa\xfd\xdd?\xe7z\xee\xb3\xba\xf6&{o\
-\xd9\xce#g\xad\xf7\x1e9\xbb;\xc7j\xf5\xc2\xc1M\
-_\x1ef\xc6\xf6\xcb\x8b}\xe1vp.)h\x83\xce\
-s\xa7[\x93\x89S\x12\x17\xea\xb8\xbf<l\x95z!\
-\xc7\xd4\x09\x99\xf6\xed\xf3\xf6\x98\xc5\x89.\xd9\xdb\xa6\x8e\
-\x18y\xe0\x8e\xe7\x07\xd6\xb1\xae\xab\x9f\x22\xed2\x0fn\
-\xff\xd0%qb\xf6\xb6\x1f#F\xee]60\xbf\x83\
-\xa3\x8d}\xe3\xb3\x17\x9a_\xda\xbb\xfdC\x7f\xcf\x15v\
-EN\xbd\xf4\xb4\x8d\xcf/\xf8\xcc\xd8\xefQ\x16}D\
-su\x9e\xc3\xe2\xc2\xeb$\xa3\xce\xad\x97x\xee\xd6\xcc\
-\xe9<\x94[\x88\xd3\xbe\xf2\xb9wjc\x1c\x0ao\xd4\
-\xad\xf5\xc9\xd5\x9d\x0f<\x8d\xe5\x93\xf3Wk\x8c\x0fk\
-\xfa\xf6=5.\xc3r\x8e\x05z\xe1\x18\xa3a\xdbH\
-\x8d\xf6\xea/\x18\xcc7l;9\x9e3\xa6\x99v\xef\
-\xebCv%\x86\x1bm\x8b\xc8\x1a\xbb\xeaSz\xdc\xed\
-\xcb\xe8\x85\xb9#\xda9\x98\xaf\xc5't\xb6\xc8\x0c\xda\
-\xfe\xee\xe4\x9c \x9f\xe3\xbd\xae\xecl^\x9chG\xd5\
-\xe5\xbd0\xba\xb4\xa1\xd5\xd3\x95vO\x9c\xee~r\xb7\
-\xd5\xc8Ht\xd8\xd7\xe8\xdd\x02\xfb\x90\x9d\xf7\x93\x0b\xce\
-_\x9f`A\x0cx\xe9\x1d\x9bf\xd6*\xb0c\xd0\xd5\
-;\xc9\xd7\xce_?8\xf1\xfd.+\xadQ\x9aW\xac\
-\x9b}\xed\xee\xc6\xc5\xe9\x19\x9b\xc6\xb4\x9e2J31\
-\xcf~`2\xa6\xe4rG\xaf=\xf7\x9b_\xb1\xd2b\
-8\x0e\xe8\x8a\xf4>\x9d\x8c\xa188s\xce\x22\xa7L\
-\xca\x8c\x9a\xb4\xd0>\xfdA318\xb4\x0de[H\
-\xb3_m\x0e\xfb\xc6\x1f\xdb|\xd4+4\xdct\x9c\xf7\
-$\xd3\x80\x0f\xda{\xf7\xb6e\x8c\x98w\xc6 p\xc6\
-\x5c\xc2\xca\xbd9\x91Ec\x83\xef\xd2\xa6\xac@\xb4\xb5\
-\xda\x8ep\x19\xb5k\x0f\x0d\x83\xf4\xca\xc2_\x1d\xb3\xd6\
-\xe8\x9b\x87\xd1\xd3\xdd\xcewn\xb4l6\xad\xcf\xce\xa3\
-{\x8d_\xfcZ\xcaux\x9e\xfa:~\xe4\x8bw\xf4\
-\xeb$\x0d\x87K\xb7i\xabW\x046z\xe1\xe8\xbcx\
-\xd8\xc4\xf5h\x0d\x94\x09{\xdb\x91;\xdf\x835\xfa\x16\
-\x1d\xf1$\x9d\xf1p\xed\xb9\xc1\x225q\xfcb\x7f;\
-{\xe4\xfa\x8f[\x1f\x83\x86-\xd0E\xda\x99\xf5\x7f\xb0\
-\xff\x8b\xee\x0a\xbb\x9bwG\x8d\xdc;t\xe0\xb2_W\
-\x915k#m\xbe\x86\x7fO\xe1\xff\x1af3\xbe8\
-b\xea\xf6\xa4\x91M\x96\xfd\xf0|8\xdc 0\x89\xfa\
-:\xf8\xcd\xb5\x96_.\xcf?\x96U\x9a\x19\x9c\xc4\xc1\
-\xc6\xb7Y\x92\x1b\x9aw\xdbFc\x0a\xe6\xc6\x9b\xe2\x81\
-\xcf\x163W>+4.\xfc\x89\x5c\xbaCK\xbd\xdb\
-\xb4Y\xefy\x01M\xae\x5c\xc4\x91\x9dW\xbb\xbc~O\
-\xba\xd1\xfe\xbc\xcdU\xcc\x8aKiH\xfb\xe4\xc8{\xb4\
-\xe5\x1f\x12\x96\x9a\xad\x19\xb19\xc9\x04\xbb\xef\xfe\xbd'\
-\xc7=\x1f\xc4\xb8\xcd\xb4h\x87sA\xf6hg]h\
-wd\xe5\xf5\x17\x03\xe9F\xab\x97\xdb\xe8\x85\x9b.j\
-s\xb5\xd3\x9d\xa7\x8d\x03\x9fo\xd6\xb2\xb9\xb7\xf4\xe4\x0d\
-K\xcc\xfd\xd3\xb4\x937\x1f%/\xbe\xdf\x8f\xb6T\xe3\
-\xf8\xe4O\xae+\x96D\xfe\xc8>\xbd2\xe4\x98\xa5~\
-\x90\xc7\x84\xbec\xb1_4\x9f\xf9\xbf\xf8\xf8cF\xd7\
-\xd2\xce~\x03\xc3\xa7\xf7\xcd\x0a7]>\xe8N\x17\x8d\
-\xf1Z\x09K\x8d2\xd0\xa1\x0f|\xda\x15j\x9d\x9ei\
-\xdc}\x0a.\xcc5\x88\xddrD\x91O\xce\xb0s\xd9\
-\xb6\xd1\xc6I:_\x87\xc5\xcd{\x93\xf7yz\xfeM\
-\x9f-\xc8\x89\xed\xf3\xb6\x9d\xdeu\xe5\xf7\xa9|\xd7\x98\
-\xc8\xc3\xd9sq$\xd7C\x9b\xc2\x90\x1f\xe3>N\xc6\
-\x14\x0e;>\xaa\x0d\xbb\x90=\xce|\xff\xefM\xb1\xbf\
-\xaf\xda7z\xf7|Lr\x92\xcb\xb2\x0fK-\xbd\xee\
-yk\x0d\xea6\xcdl\xea\xfb\xc8\x16\x81\xfd\x9f\xf5\xda\
-\xf2\xd6o7:\xc7\xd3\xd3\xcc\xca\xbe\xe3q\xed\x95v\
-\xa5+\xa6\x18h\x8e\xff\xae\xefpo\xc0\xac\x09D\x7f\
-\x8b\x13K\x8f,\xf3i\x87\x99c\xb05\xff\x8e\x96\xc6\
-,\x9d\xf4\x13\x94\xf5\xdd\xfc\x87\xcd\xcc\xbe\x93a\xb5\xe0\
-`\xf2\xa6\x12\xc3 \xb4\xf6\x88f\xb6\xb9\xdb>X\x84\
-\x9df\x0f\xbd\x83\xef\x99\xb4\xd5t\xc57\x8fW\x8e\xe3\
-J\x92\xde9\xae}6\xef\xe7\x0a\x8bQ\xe8\x89\x17H\
-\xda\x91\xd6\xe6\xf4/\x9d\x8f\xcdE\xc6l9\xc5Xh\
-wx\xe9\xd6\xd4g\xbf\x1e\x7f\xe8Mw\x1f\xe9\xa7\xdf\
-)\xe0P@\xb8G\xb1\x05\xa3`l\xcc\x9c\xac>A\
-/\xd7j\x8f\xe9\x8bl\xf5\x5c\xbbf\x87)\xf9\xc9\xdb\
-\x11o\xa6\xbc\xb5\xbe\xa3\x9f\xc2\xb6\xed\xde\xaa%\x07\x99\
-\xc1~\xcf/\xdc\x14m\x1fB\x08\x1e\x122\xb8O\xe9\
-\xbe\xfdk\xb5\xbdNF\xfa\x9d\x5c\xe0\x89\xce\xe8\xe3e\
-\xec\xfbj\xe5\x8a\xbb\xb41\xe9\x85\x0fi\x11\x13;\x84\
-nm\x94\xf8\xe3w\x98\xee\x91N\x07\xf9Fc\xde\xfe\
-\xe2\xae:|4\x99\xbd\xa5\xbb^\x98^\xe0\xabk\x01\
-\x97\x1c}\xef}r3\xbe\x8f\xbbA\xd9\xb4r\xab\xa3\
-\xe1\x9e\xf1[\x91\x99\x09\xfa\x11\x19\x1d\x0aV\x97\xed\xed\
-r\xb9\xd83\xa1\xf7\x98^\x1a~s\x02\xbf=I]\
-s\xc9}\xfe\x9dG'L\x5c=M\x9b\x1d\x1a\xe04\
-\xfa\xa4\xa6'65v\xf0\xb0^\xb3(\x16^\xfe>\
-\xf9\xed\x87\xad\xdc\xeaa\xb8\xa3\x9dv\x8b9q\xd9\xcb\
-\x17\xcf8\xc5\x9d0v\xfd[\xef\xa5\x1a\xe6\x87\x1b\xef\
-O\xd0]`\xb4)c\xe8\xda\xa1?\xca\x16%\xb6\xfd\
-\xb8\xf7\xc3<SR\xb7\x03\xfb\xe35=7\xa5\x14-\
-\xb3\xb9\x12\xfav;\x12\xb8bR\xc1\xf9\x9ds\xd6=\
-\xbc\x92\xda(\xd8\xbd\xfd\xf69\x0f\xce\x07\x87\x14\xaf\xa0\
-M\xf8\xfc\xd1/\xec\xd4\x91\xfd\xce\x88\xfb\xf4\xed\x9b\x1f\
-~\x1ek\xcb+\x08\x1e\xb5w\xc3{\xb7l\xacg\x82\
-\xcd\xc1>\xf3g\xcd\xd0\x0c\x1e}\xfa\x96\xe9c\xebO\
-\x11\xdb\xf7LD\x1f/\xbb\xd5\xc1\xef\xc4\x90\xb1\xaf?\
-q\x97\xec<\xf0\x8bm\xdb\xfb\xc0\xd9\x8b\xef\xbe\xb9\x97\
-\xe9DO(\xe5\x87\xf1\x13\xdf\xee\xe5/O54\x7f\
-\xd8x\xd9\xaah\xff\xa2\xe7\x81g\xcd5\xcd\x9f \x91\
-\xe8t\x94moVH\x8f=\xcc\xe5W\xf1}\x87\xdf\
-\xec\xa0_\x1cg\xf8\xf6\x17\xe5\xc1\xca\xe3\xe9\x9e\x0f\x12\
-\xc2\xd7\xec\x1f\x87\x1c\xf8\x1crjX\xb7\x8d\xa5\x93\x8b\
-\xee\x06\xf4\xc0\x87\xef\xc1\xbf\xba~\xc6\x0e\xa5\xff\xa6\xd7\
-\xc7\x01\xe9\x9c\xa8\x14\xdf\xd7\xdd\x97|2G\x92\x8d7\
-j$\xdd\x0f>\xbe\xad\xd3\xb9\xd4\xcb\xc3|v\xb6:\
-hx\xda.b\xc3\xe1\x0d{-/\xf8\xa4\x8d\x1f:\
-\xe6Do\x8bV\x1a\xb1\xc7{\xdb\x06\xb5\x1ba\xca\x9b\
-\xccK|19\xe4\xb1\xd6\x88/\xec\xe7%\xcf.D\
-\xe9\x04\xfet\x08\x9d[z\xec\xc0'\x9d\xfd\xa3\x90\x08\
-/;\xdc\xc0e\xc3\xc3F}\xdd\xbbs\xee\xb9\x01\xf1\
-oi\xe3\xae%\xbcz>^\xd3c\x91[\xf0\x93\xd4\
-d\xdcM\xda\xa1.nSZk&v\x1d|\xa3m\
-\xfb\xbd4\x9e\xc9.G\xec\xb5\xdc\x85CW\xbe\xa4\xdb\
-\xdc\x1a\x1e:\xa4\xd5\x97\x13\xfb6\x9c\xd4\x0f7)h\
-?\x95j\xd4\xf6\xfd\xc0\xe0/\x99\x9b\xbd\xf6x\x8c\x0d\
-\xe1\x5c \xe0\xd3;\xe3}\x8d\xf9\xd3\xae\xac?\x13\xfa\
-\xeaP\xd4\xfc\xc7\x99a\x1f\xd6\x11fNh\x944\xb2\
-\xe5,\xe4)a\xcc\xfa\x0b\xa7\xb8\x13\xfb\xff\xc8b%\
-L\xb4\x19x\xf0\xf8\xb6\x85i\xefo\xc4\xb9q\xd0^\
-7]\xd6\x9cx\x9b\x5cl\xbf\xad\x91%2,,\xb2\
-lj3\xefN\xfc\x11\xf4u\x09\xf6\x98+\x94\xe83\
-It\xad\x9f\xd3\xb7\xa2\x92F\xa6\x13{\x7f\x7fj:\
-\x87\xf8\xf0J\xa2\xf6;\x17\xc2\x16\x8f\xe5\xfd\xaeR\xbb\
-`\xd3\xcc\x87g\x0c\xfc\xb0+hX\x0eu\x98a\xcf\
-\x85\xe1\x09%\x1b<l^\xdfK6Z\x10\xd58S\
-7\x98\xe3\x11\xdf\xcf\xea\xd4\x14\x96\xc9\xf0V\xf6\xa1\xfd\
-<\xc7n:4\xd3\xecw\xc7\x83\x9d'\xb0g\x9e\xdc\
-r\x95\xff\xf9\xb0{n\x90\xc6\xc2\xb9\x81\x99\xc7\xdf\x14\
-n\xd2\xdeXh\x19pc\xfb\x85g9\x83\x0e\xa2{\
-n\xff\xe8\xcf\xeaf\xb3q\xff8\xaf\xad\xe9\x8fG\xe7\
-&\x8d\x1c\xa9\xff.\x9d\x16\xba\xe4\xee\x91\xa8\x8c\x8d\xef\
-\x9fZR\xdcLl\xb0m7^\xa4^\xf7\xf6\x1d\x96\
-3\xd9\x16\xb9\xf9=\xea@\x18\xf5\x17{\xd8a\xdd\xce\
-\x0e\x9a\xa1\xf7Z\x19\x9c\xeb\x86:2\x7f\xda\xfc\xb1\xf4\
-\xbb\xba\x13\xc7\xc4\x9f\x9dp\x96\x8e9\xba/\xae\x0b\xaf\
-\x15\xfe\xe3\xdeS~\x9dmN\xb6z\xac}6\xe9\xed\
-\xa4e\x1d\xef\x11r\xac\x1c\xdf\x5c\x8a\xb8\xbcj1J\
-\xcf\xb9_\x9a\x7f\xd1.\x94\x93\xd9\xb3\xefQ\x1e\xfd\xe7\
-\xbe\xbb\xb1xg\x9b\xc0\xa8\xe5[7\xbd9b~\x94\
-\xdfy\xc3@\xfa\x8en\xc3o\xbe\x8e\xf5rx\xf6\xda\
-L\xd7\xef\xd1\x94\x09\x1b\xf7m\x9d\xe7\xda=\xb5m\x92\
-c\x9b\x11\xcb\x9c\xb6\xec\x19;\xeaM\xda\x98<\xc7U\
-\xfb\x9e\xa5\x8c_\xfd\xe6Y\xc6\xe3]\x11-\xba\xcd7\
-N\xc4\x86\xfc\xe8s@?|\xe7\xac+\xf6\x81\xd7\x02\
-\xa6\xdf\xfd>\xc1\x83}\x8a\x16eb\xe7\xd5yb\xdb\
-\x1f\x17\x9ft<\xbc\xd4\xee\xd3\xaec/f\xa7\xebz\
-k\x86k|x\x86\xe4-\xbd\xd3\xady\xcf\x8d\x85\xbe\
-\xe4{(\x8f\xc5\xbfFl\xda\xf0\xebe\xca\x86E\xc8\
-\xa7Cv\xfd\xbf\x7f|\x1e\xa3\xd39\xd6}dg\xbd\
-\xc0\xd7\x83\xa2\x0e\xac\xc7\xc4\xdd\xda\xbe\x83\x18\xf2^\x9f\
-\xdd\xca\x7f\xfc\x99y\x89x'\x1d\xc7O1\xce\xed\xa9\
-\x17(/\x1a\xed9\xdb\xd5|\x84\x86\xc5\xd6\x84\xb1E\
-\xc3\xe38\xdb\xd6\x1c[\x9c\xc7x0{m\xcf\xb2q\
-\xf1k~\x91\x9c^\xee\xceyVzt\xefr\x9d\xd6\
-\x9a\x87\xf5\xf4&#\x98W\xd7\x120\xebQE\x0e\x01\
-\xdd\x22G\xa5O_q\xc3\xea\xf7\xb5\x9c~\x11\xad\xcc\
-\x83\xc8\x98\xf0\x95\xbf\xf5\xcd?\xe0\xfa\xf6\x1a\xd8#\xf8\
-\xa9\x8e\xc7\xc4o\xcf\x82\xc7\x95%\xfd\x080\xdfn}\
-*\xb1\x07\xb3}\xe4\xdbY\xd9\x07n\xc6y\x07\xae\xb9\
-\xe9\xbd\xf6g\xab\xd6shW\xde\xf5ANpg.\
-\xb8s\xc4\xba\xc5\xf6N\x94y\x0b\x1e\xf5s=\xcez\
-;\xf6\xdb\x93\xb9\x8c\xd7A\x5c\x9b\xbe\x83\xb8_\x22\x7f\
-M\xd6\xbf\xbfn\xe2,\xcd\xd8\xc9\x98\xed\xb3\xf3\xcd\x83\
-\xf8a-s\xe8\x99\xb3\x0d7>$\xae\x1f\x9fp\xde\
-\x7f\xc9\xe2m\x8bR\x8e\xfaX\xbd\x9eh\xc3\xd0_Y\
-0td\x93\x11\xc7f\x19\xbd\xfe\xaa\xd3\x0cC\xdaC\
-\xd5\xcd\x1b\xb5\xf7\xe2\x9d\xcc2K_\xd6\xd3\xbc.\x0e\
-\xce\xee\xc3t\xf0\x8e\x19\xe9\xc1\xeeSx{\xf6t\x0d\
-\xcc\xec\xd8q%\x15 \xca\xd9\xab\x03\xbc\xcf\xbc\x8c\xf9\
-mq7!\xcc%=g\x0c\xffB\xf2\xb9\x14\x8c/\
-\xa1\xf5O\xcd\xb0\xd5\x8d\xdea4\x1fY\x0dX\x85z\
-\xcaZ\xb5n\x5c\xa9~o\xf0\xea\xfd\xb7\x1d^\xe0c\
-Q\xb1k\xb5\x0b\x9fvx\x948G#b\xe7\xce\x96\
-\xc8\xa5\xb9\xd9\xaf'Zv\xbe\x1c\xdf\xe6\x0d>\xcbr\
-\xf2\xachNY\xf4\x03\xceR\x87\x93\x8f\xaf\xde\x9fQ\
-\xf6\x92~`\xd2\x1c\xab\xc1#,4s\xdd\x8dl\xb0\
-\xab\xfc\xc9\xa4\xee\x91\xd9\xc1\x17}\xbb\x06\xb5=z\x10\
-\xe5\x9e\x84\xfb\xf9\xbe_~\x81\xd7\xbe\xc5O\xdf\xfb\xcd\
-\xb6\x18<\xa2\x93\x1f\xe2Tr\x83j\xa7s>\xf3b\
-\x0f\x83\xeeG=\xd7\xb4\xf1j}\xe2\xf7\x9b[\xc3:\
-t&4u\xbc\xd7\x163\xb8\x99\x95\xa6\x9f\xf6\x9e\x85\
-\x1a\xa9\xaf\xfa\xd9\xdeK\x09f\xf0\x0a#\x87\xfb[\xdb\
-/\xdf\x13\x7f\x94>\x10\x1fL;Qv\xb3\xe7\x91\xc5\
-\xe1^|\xed\x85\xf7\x9b6vD\xee\xbe1:\x95\xf4\
-\x00\xb5\xb5lV\x99?{\xf7\xeb\x11o\x98\x03t\xb4\
-Y~8\xff\xa3]\x8eR\xa7\x1f\x9f{\xff\x91\xc5\xee\
-\x1fsO\xea|\xe6\xec{\x97\xfb\x85\xdf#|\x0d\x19\
-\x15\xf4\xcd-;\xe0\xba\xd6^\xbd\x10\xa36\x03\x08g\
-B\xd6\x18N&XD\x946\xa1\xad1\x88\xed\xd2x\
-\xd0(\xa4\xed\x95;\x8bw\xa5{8\xe6$\xcc\xca\xf1\
-\xc7F=\xfd\x06\xd4ol\xbc\x8d\xcf\xe2\xe3\xa8\xb7^\
-\x07\x92\x22F\xf6\xdd\x9d\x1d\x1ae\x84\xe0WN\xceY\
-\xb9$6\xebm\xec\xb1OS\xb7\xde\xcc\xdf\xaa\x99\x84\
-\xed\x92~\xcd\x9a\xcc\x9d?6,\xf5\xf1\xb6\xe0|\x9e\
-=j\x8b\xd1\x08\x9f\x1d\x9b\xc3'L\xf6`\xc7y\x90\
-\x08'\xa9\xa7r-[t\xc1\x84\xfb\x9eY\xb7\xf1\xc0\
-\xbc\xe1\xd1\x0b6Ozz\xe5rT\xfe\xcb\xc1Dw\
-$\xf2\x8d\xcb\x9e\xb9\x13\xf6\xf3\x0by\xba\xd3\xe6\xcfN\
-%\x8d)\x1b{\xf5\x0a\xfb\xe7\x16\xab\xf7\xc7{l\x8d\
-\xf5\x0d\xf7\xf9\xb6bC\xa9\x1eyx\xf3\x16[\x07r\
-wO\x9dT\x1a\xdfm\xf2^\xba\x97\xf9\xa9ue{\
-G\xedq\xd9<0gwl\x17M=\xde\x89\xe8q\
-\xa1\xb9\xb4\xe8\xb5Q\xcf\x91\xbe;\xbe\xbb/nr\xe4\
-\xb2\xe3\xb1yiko\xeay\x1bZ\xb7:8\xe0f\
-\xd6.k\xb2\xfbH\xaf\x13\xeb\xd7^=\x97r`\x91\
-m[\xa4`k\xf7\x97\xb1N'\x8a\xc9\xbb\x1d\x18\xaf\
-}\xbf\xb4\xeb\xbef\xa2W\xd2\xe6\xe4\x02\x0dp\xdd\x9c\
-W\xa9\x11\xe6\x9f\x98\xe0\xab\x82]o\x83\x02K2\x89\
-\x9b\xc2\x8f]?\xb9x\xff\x96\x98wm\xc7\x9c\xf1\xda\
-\xd9\xed\xfb\xba\xf3\xcfc#\x17}:4\xeaY\x5c\xea\
-\xc3\x10\x93B_\xdf\xa9\xd9s\x90K\xdb\xd7\xae>\xba\
-+\x0a\xbf\xb9\xfb\xa6\xd8\xed\x1f\xa6\x8c-\x9d\x7f`u\
-\xa4e\xd3qv\x1b\xc1S\x7fw\xc8\xd0\xdf\xd6\xd7\xf7\
-\xd6\xae-mFl9V\xdc\xf3\xcc\xc5(\xc2r\xf6\
-\xfd\xedg\x86\xba\x93M\xf3\x0a[<\xf3\x19t\xb9w\
-g\xb7)\x0b\xddK#c\x9c=\x96M\x9b\xc7\xec\x09\
-\xf4\x15\xd3\xe5\xf9)\xdb3A\x87\xc6<\xbf\x11\x8f\x9e\
-`\xc1kg@&\xac\x1f\x9e\xef\xb7\xc6\xa4\xd3\xa5E\
-\x5c\x97\xe8\xb8\xa4'-=\xf4\x02\x8dgeo\xf5\xd5\
-\x1fs\x91\xfb\xb9[\x10\xe3\xcd\xf28\xd7B\x86\x01b\
-\xccyE\x7f\xb4)\xeeU\xe3)7?\xf7\xdd\x9e\xd2\
-%\xafp]p\xd0\xa4\x05\xdb6%|\x1d; \x82\
-\xb5\x9c\xf3\xba\xeca\xd4\x1c\x7f\xecr\xe3)n\x13\xcb\
-&\x17Q\x82\xcbn~\xdf{f}\x12\x87y\xd6\xf2\
-\xdb(\xfd+\x8d\xdf\xb4?_\xd0\xd5\x97\x13\x12Tj\
-\xb0\xdd+d\x03\x830\x8c\x1a\xf3\xc0w\x9f>\x18\x19\
-\xb4\x8b{\xddB\xbf,\x98\x193\xbeQY\xa3\xe0\xb9\
-[\x0a1`(\x12\xce\xd9e<Mjq\xe7<\x90\
-\x03\x89\x91\xf3\x18\xd3\xdd\x9a4\xbbqx\xf2\xf0\xb6\xeb\
-\x89\x96\xf3\xcf\x06hZ\xb9\xf37\xdfL\x1bk\xcas\
-fD\xc5_z:c\x03\xe9L\xa34\x83\x22\x1b\xf2\
-lr\x91\xd5\xf1\xb6_s\x06D\xdf\x9biV\xdc\x8e\
-8\x11\x99\x91\xbf\x91\xb0\xb5\xdf\xde(\xea\x80\xad]\xd7\
-\xc5\x9e\xed\xce0z\xb8\xefF\xff\xd8\xd3\x17\xde\x9c\xeb\
-o6p[I7B\xd3\x0f\xe8\xd2\xb5\x0fI\xd3l\
-{w,8\x87\xdc\xbc\x9c\xb6\xaa\xff\xa9DFJ\xc0\
-\xd2\x0b\xf7\x83l\xdd\x88:\xad\x0f\xf4\xdc\xeem\xfb\xfe\
-$\xeeRR\x16\xbd\xef\x13b\x1br\xc1\xf7\xd3.{\
-\xbd\x1c\x5c\xc9\x9b\x8e\x98y4\x09\xf4{;!\x0b\xdb\
-\xeb*i\xfa\x82\xcdy\xfas\xaff~\xce\xd9\xb2\x96\
-:\x7fM\x99-\xba\xe9i\xdc\xa5\xe2\xdf\x97\xd3\xfc\x97\
-\x8c,I\x9f\xfaeh\xfc\xfc\xe9M\x1fm:H\xf2\
-j\x7fv\xfe\xa6\xa5{<\xc6\xbc9\xfbu[A\xb6\
-e\xef\xed$\xb76\x9b\xd3\xdfnI\xffrg2\xd5\
-\xe9k\x96\xe1Y=c\x86S\xc2\xb1G\xcc\xe9+x\
-z\xf8\x9f\x93\xec]t7.\xd1x\xb6|\xbe\xeb\xe0\
-\x08\xd0}\xd8\xd4\x1dk\xe3\x9f\x18m\x9f\xfeb\xa3\xdb\
-\xca\x19\xcd\x22\x8b\x9a\xb1gg\xaf1\x19\xbe\xfa\xe0\x80\
-fs1\xb6\x1bK/\xdf\x0f\xcb\xebv\xa4\xd4\xb1\xdb\
-\xa3\x0cfn\x10\xb2\x08\x07T\xde\xf5O\xa7\xde\x8e7\
-\x9d\xd0\xf1\xa7\xc1\xe9WN}\x96wL=;\x7fA\
-`\xeb\xbb\x9c\xa6x\xbf\xadi\xcdBZa\x1d\xee\xd9\
-w\xe8\x94Pv\xea\x8e\xe9O\x073]\xdf/c\x99\
-\xe6\x88Oz\x84\xff\x9e\xb81!_\x8b1\xe9\x1f\xe9\
-\xa7\x82\xfb\xac\xb1\x9b\xb8\xe6\xce\xe6\x88\xf6\xcd\x91+s\
-]\x8d\x8d\x18S\x0b\xfb%\xc7F^|\xd5\xc2\xfcr\
-\xb6\xd3\xb7x\xff\xc2o\x87\xb6\xf4\xecXp\xc0\xe0\x1d\
-\xd5\xe7\x13~\xd2\xf9(\xfc\xab\xedf\x9c\x88\xa7%?\
-\x1f}8\x99\xab\xb3\xf4c\xf8<\x9d\xdbw\xe2\xbf\xff\
-\x1cK\x1e\xdb\xc2&x\xe6\xb6U\x19g\xba\x10\xfaN\
-\xf8\xea\x1b\x10\x854\x99\xcc\xd6#\x7f\xd4\xbc~\xfae\
-\xca\xdd\xdf\xa8K\x0e\xfdoi\xf9\xf6\x1f9/\xe2\x9a\
-[LHP\xbf\xdf\xcdW\x0e\x5c8\xeb\xe6\xbc6\xc1\
-g2\xc8\xe7H&\xf4i\xcb\xb7~\x9aj?\xc7{\
-\xcb$\xfe\x08\x07\x87\xf6\x13H\x8eH\xf4\xc3\xef\xab\x9c\
-\x07l,\xb8\xb5\xdb\xd7\xadHw\x5c\xda\xa92\x96\xf6\
-\x9bA+\xf6\xacd:c\x8bh\xd8\x88\xd2'\xd3_\
-\xce\xbceB_\x96\x84:0\x9f\x5ct\xd3H\x8f\xfd\
-\x90\xe4\xf1b\xc2;]\x8d\xddF/\xcf\xf4\xba\x8e*\
-\xb2\xdd\xd6\x9f\x1e\xe2\xf7\xb8\xe4\xb3\xd9\xab\x80\xe9\x0b\xe9\
-G\xdew\xc7t|\xeeb\xac\xb5qs\xaa\xc9x\xcf\
-\xec\xdf\xdbL\xba\xcd\xeft\xdak\xdb\xd2m\x16\x13\xde\
-\x0c\x8f\xfb\xf4^W\xa3\x93q\x81\xf9\x8doGf\x9f\
-_\xfc\x856\x0f\x8d:\x11\xd6c\xdd\xc9\xbc\x9b)\xde\
-\xbd\xa9A:q\xd3\xdf\xf8\xee.x9-s\xd8\x9c\
-\xd0iq\xcc`\xf3\x0f\xba\x1ag\xdf\xf8\x0c\xe9\x10w\
-\xac\xc7\xdc\x95FX\xd3 \x8b\xaf\xd4\xf4\xe5\x9b\xd3\xbd\
-\xeem\xbd\x1e\xe0\x1eod\x1d\xfe-\xcb\xe1\xd7\x81[\
-\x8b\x02\xb0\xce\xb3>\xc4oi\xc3r\xdc\xb7\xa2\xc8\xea\
-\xb0\xa6Y\xa3\xc0L\xef\xed3\xfc\xd7\x1f/cS\x9f\
-\xaf\xff9t\xa9\xb6o\xeb\x90\xf0;{\xae\xad7v\
-\xb3\xf4\xbf\xef\xe4\xfc5.\xdf\xec\x22\xce\xe3\xde\x94\xe3\
-\x84y\xa7)T\xc2\x82\xcd\xf3>\xc5L\xee\x14\xd5\x02\
-\xf9\x95\xf3-\xf5\x84\x93\xce~\x97\xd0-W7\xae\xcf\
-nm\xb9\xb1\xdf\xa5\xf9\xad\xb6\xbb\xde\xe9\x7f\x98\xfe<\
-:j\xd2\xa6\xa0\xb7\xa8\x11}W\x1e}\xb0\xd0\xb7\x87\
-\xe5\x82\x82iq\x01\xd3\xc7MD\x19'\x186\xf9~\
-\x22\xf0\x13\x15\xff\xf3\xa9\xcf\xd1!!c\xd3\x92\x13\x0f\
-\xbd>\xde\xea2\x10WG0\x837\x1f[pb\xd5\
-\xd8\x8f\xfa\xb3\xa7\xbby\xe5\xf4r\xeaKzp\xfa\xc3\
-\xa4M\xb6g^\xa3\xd3\xce\x99\xad\xba\xffm\x8f\x89%\
-\xf71\x82\xfc\xf6\xcb\xa0\xaf\xdb\xbd\xc5|\xec \x1b\xbb\
-qCGus\xc9\x5c4y\x99\xd9\xf3\x09\x07\xedo\
--=\x1f\xe3\xf2\xf5g\xb7\x99\x94B\x13\xeeJO7\
-}\x12i\xd5@\xee2:\xaa\xf5\x1b\xf7\x8d!M\xb5\
-\x02\x97\xdebo\xb0\x9a\x5c\x9a\xee\xe56\xe1\xf4\x9e6\
-\xa8\xc1\x81\x17\x08\xdb;\xfb\xa6\x04\xf9E\xb7:\xb3t\
-\xad\xbfk\x93\xa4\x91\x85\xb9\x05Z_\x0bQY\xce\x14\
-\xcc\x89c\xf3\x9a6=\xf5ju\xc1.\x07\xcdw\xef\
-\xb8\x0e\xcd\xe8\x8ccFS\xef\xdc|\xb0<#\xf3z\
-\xcc=\xb6\xdb\x8d\xa2\xa11\xdbJ\xa7a_\xb5w\xbd\
-\xb9\xf4z\xab\xd8Ik\x1fYZ\xdclyyIv\
-q\x96)\xe1\xc2\xec\xb4\xde6\xa6\x1b\xba\x22\xb1G'\
-\x0dm\xed4\xee\xc0\xebVq\xad(\x07w\xef-a\
-\xfe:\xfe\xa9W\xf8iT\xc0\x04\xe3g\x09\xceFc\
-\x0eL{=\xc4{\xd5\x98M~M\xe6\xba\xdd4\x1c\
-g\xa8\xdb;\xeb\xcd2w\xe2\xe7&\x8d\x90\xd6\xe9\xfc\
-fFv\xdd&\x12\xe6\x0c\x0e\xa3\xb0\x1b\x1f-n\xbf\
-\x15\x8f\xc1,\xfb\x90\xa9Q\xd8\xa7x\xef\xb3#\x0b\x08\
-#z\x0d\xc8yzL;b\xf8\x99\x88\x92\xb2\xc5\x83\
-\x7f\xbb\xb3z\xbb\xd9oy\x82 \xf1\x09Y\xc6GO\
-'z\x05\xa4\xff*6\xdf\xc4\x98\x15\xe3\xbc(\xa8\x87\
-\xe9\x93\xe0[\xe7'\x84\x7f=\xfc\xf6\xe0\x8f\xc5}\x9b\
-\xfb\xe9\xe4<=\xf0\xfc\x0ej\xb9\xd1\xa1\xd2#\xdb\x06\
-,v\xec\xe7\x9e\x06\xc4\xdc\xc5m\xfb\x0aO\xee\xeb2\
-\xf9\xcc\xe3\x87\x8d\x87\xc6\xdcM\x8c\x8bo\xf2<\xe9h\
-X\xe6\xdb\xbc\xf1\xed'\x9aD\x9c\xe3['3R{\
-\xf2\x97\x87v\x8a\x1f\xbf\xcc0\x87\xf9\x023\x8b|\xb8\
-\xf8\xee\xbb\x01\x1a\xc8\x0e\xe3G7\xb2P^\xe7\xb5n\
-\x9d<f=\xac1vQB7B\xff\x13\x1c\xcc(\
-\xb3\xc8\x98\xc8^\x0f\x8f\xb6u\xb00/s\x9a\xc0}\
-\xb7\x88sm\xfbx\xda\x99\x05\x96w\xb5\x08\x8d\xde\xc5\
-\x1d\x0d\xdf\x9az\xb9\xcb\xc4\x1fz\xf36|D\xfb\xf6\
-\xdd\xd4v\xd7!\xdb{3\xbe\x1c\xbfV\xda\x9e\xd2\xfe\
-\xb7\xa6\xef\x8f\x19\x967o\x91\xd6\xbb\xe4\xf7Oc\x14\
-\x86\x9a1\xb6\xa7~\x9byk[D\xa3\x0d\x85\x8d4\
-\x91\xdb\xbby\x83\xf0\x9f;\x1d3*\xcd:\xc5\xbb{\
-\xac\xf7\xb2\x19\xb3\x97\xdf\xbet~\xea\xa4\xc2\xe0-\xcf\
-\x1f\x5cz\xba\xf7\x90\x9d\x87\xde\xde\xc5\xf1<\xaf\xd0\xec\
-\x1d\xe7\x0e\xbdO\x99\xa1U\xe0\xe31\x7f\xe3\x86\xe5\x1a\
-\xc8\xf8\xf8\xc1\xf8&MG\xc7\xd8\x1e\x1d\x9e\xf1t\xae\
-a\x98\xd1f$V\xe7\x8c\xaeiR\xb0\xc3\xadG\xaf\
-\x06F\xdf\xfa5y\xc3\x8d\xcf\xab\x90\x8e\x8f\xf1\xa7\xe7\
-\xe3\xdbs^-\x0a\xcb\xbajf\xd2\xfd\xca\xe6\xbc\x97\
-y\xd7\x90\xe0\xdf\x04on\xb4\x9d\xeb\x88\xe7\xab\xbdL\
-\x02\x9e\x87yzL\xf1\x19\xcb\xd8\xb4'mv\x91\x95\
-\xc5\x85{\xf3\xec\xc2=7\x9c\x9f\x19\xb2\xc6g\xb9u\
-\xb29\xf9]O\xc6\x85\xf8\x89w6\x1b\xb9j{\xe8\
-!\x13\xcf\xb0\x0cV\xcd\xbf\x7f;\xc0a\xc3@\xbf\xc4\
-\xe0>\x9b\xa6\x0e\x225\x8b\xd8|\x18ug\x99\xcdU\
-\xf7\xfb\xb3\xcfLis\xe1\xc4\x14\xeb\xac\xb9_\x12\xcc\
-\xc7\x14\x1c\xdb\x13\x92\xfa\xf6\xea!\xdb\x82\xb0\xbb\xc4\x04\
-]\x04Y\x1d9\xf9\x92\x19\xa3M\xc6\xbd\x1e\xbf\xc2\x0e\
-\xe1\xfd\xdb\xce\xddy\xa3?#\xe0\xbe\xeb\x84\x03n\x98\
-\xb1\x8e\xa5s\x1e\xbcyu\xa2\x97\xff\xe6B7\xf7\xe1\
-\xfaZc&\x8cz\xf2\xc3 \xf3rF\x04\x96n\xd9\
-i\xef\x99\xbb\x8d\x02\xaf\x14\x06E\x1f\xba:\xb5\xc7\xec\
-\x1dZ\x11\x93;D\x84\xf6\xde\xec:\xf9\xd5\x9a/\x1b\
-l\x8e\x5cY>lp\x9c\xcb\x98k;\xbdh\x9c\xe7\
-/\x9e\xb6s\xb9\x8f\xa1\x5cMq\xb9\xfa\xe4\xf9\xc3\xfb\
-:Qm\x10\xd4-\x1ag\x91V\x97qlJ\xf1\x96\
-W^\x97\xc3f5\x0d9\xf0\xa8\xb9\xed\xc3\xd0\xe8\x8e\
-\xfeW\xd7O\xee\xe5\xba\x01\xb3\x08\x13r8\xe5\xf1\x85\
-W\xa8\x8e\xd6\xfe\xef\xc7ty\xb5\xf8\x16\xcd0\xf5\xf5\
-\xba\xa8b7\x9c\xc6\xe1I\xd1a\x09\xd4\xf0 \x93\xbc\
-\x9f\xcb\xd99\x13/\xf9X\xb4O_\xe8\x8b\x99u\xab\
-\xff\x0cs\xcc\xce\xfe\x83\x1e\xb8M~5\xa7dj\xdc\
-\x8a7>[\x06\x9c\xe8\xf8~\xd2c\x92a\xb6Vt\
-\xe6K\xd3Q\x86\xfa\x93\xb7\x22\x08\xb2>.\xea\x08%\
-\xf3\x22\xf5\x18\xb3\x7f\xd4|#Kv\x86+\xdd\xf7K\
-\x8e\xd7\xc3\x89\x19C&\xf8\x07\xf9-\x1e\xeb1\xd0\xcd\
-\xea\xe6\xc6\xe9\xeb\xcd\xd7M\x9f\xb3\xe1\xa1\xe5K\xedK\
-\x05\xe9\x91kB\xf3\xc2\xb4\x91\x05\xb6\x8bl\xdb\xc7\xb9\
-\x13\xf6<\xddV\xf6|\xcb\xbe\xd7\xb7\xa7\xba8\xa0\xe7\
-\xdd9\xe6v\xd7\xb7\xc5\x8dg\x0f~\xda\xe6\xf6k\x7f\
-\xfe\xf8\xfc5\xab\xe2X\x8fr\x5c\x02\x9dc\x9a\xefs\
-\xb0\xda\xb9\xfcG\x19.\xef\x05\xd2\xc2\xdf\xfb\x9a\xa5\xf6\
-\xde\xc9ORwt\xc93\xc0G\x84\x1a\xfdN{z\
-\xce\xcb\xcfuA\xc2\xbb\x95\xe3\xd3K.,\xe8;,\
-#\xc1+hNsNZ^\xe7\x92\x92\x88w\xae^\
-\x17{Dl\xbf\xf6~\xad\xc6\x88M\x1f\xb6u\x1a\xda\
-\x82\xcd:s*\xe2\xe7\x8b\x99y\xbd\xedo\xd1\x1f\x1d\
-\xec7\xc8\xba\xcd%\x7f\xa7gAg]\x9b^\x99\x85\
-\xd7\xc4\xbf\x88\xba\x1a\x95\xc9\xa1D\xddhA{m\xec\
-0\xd3\xf1\xf5Z\xef\xdcWH\xf0\x0bB\xf0\xd6\x8e}\
-\xb9\xdf\xb9\xddu\x9f7\x0fy\xd2\xc6\xa5\xa4Wf\xe9\
-\x5cK\xcb\x1b\x09-Z\x1e\xfe\x1e9\xb2\x7f\xcc\xdc_\
-\x8b\xa7m\xc7\xa5\xb6\x9a\xcc\xf7\x1ev\xd6\x8ck\x1b5\
-\xea\xfb\xcc\xd7[\xe7\xdd!z #\x8aO\xcekR\
-\x96\xd8\xb57\x0d\xff\xfb\xc5\xf7]c\x8a\x7faK\xe9\
-\xa8\xa8V\x91\x87\x0d\xafE&\xf1\xb7L\x9bJ\xb5\x0e\
-~Rbs9jw\xa3\xc0\x8b\xaf\x084\x0d\xdf\xb9\
-.\x96\x1dZ\x0e\x1cb\x9a\xa0\xb5w\xca\xeb\xa5\xc3\xcf\
-\x7f\xfb4\xb51{\xfet\x8f\xb0\xb6[\x9f\xc7\x98\x1d\
-\xb6\xb4\xe9\xf9\xd5\xdb\xc4\xad\xe9\x04ow\xaf-\x9d<\
-\x9e!3~\xfe&\xce\x8d(\xd3{\xd2\xb3lG\xa2\
-\xee\x83\x82\xc6\x8en\xcd4f!\x9d~0\xc7>\xe9\
-\x12\x1c\xf4\x16\xc7\x9f1\xdf\x02\xcb\x1f\xb4q\xf0\xad\x9b\
-\xae\x9e\xec\x00C\xb2\xf1M\x17\xa7\xe5?\xb6,t-\
-;\xb7ts\xc0s\xce+~\xca\xcb>\x09Yo;\
-\xb7\xe3\xda\x9c\x9c\xe75w\x90gPr\xbe\xeb<v\
-J\xf4\xe5\x83\xff\x0b\xdc\x09#\xf6\xee\x07Ny\x9e\xf7\
-nri\xec\x13u>\xb4\xdc\xc2\xf6\x84\xbf\x97\x16+\
-\x02\xcdj\xbac\xd6\xc3;\x98\x13\x8b9\x01\xfc\xfe\x91\
-\x15\x86\x00\xc0\xca/\x87\x0f\xe7\x7fj.:\xfd\xcb\xce\
-s\xff#f\xba&\xd0\xf0\xd2Z\xca\x18=\x95\x0f\x18\
-\x8aXNI\x94>J\x9dk\xcb7\xd5\xf0r\x91\x93\
-e\xf0_\x85 \x00P\x09s\xa4)\xab.6Ru\
-\xdfo<O7K'6\xebFaA\xdcs\x92)\
-&DN\x93k-\xd8\x85\xf1pEV\x18\xc3\x04\xc0\
-IXi\xd1\x8b\x9aX\x14x\xc6\xaa\x9c\xf0U7\xb5\
-\xe9Y\xe3\xdd\xc1\xa2\xae \x0dY\x05\x83P\x13\x8c`\
-\x040\x06\x05\xa7\xe7?d\xa6[\xaa\xb0\xea&\x9fe\
-yy\xd0\xee\xe3Cw\x8fJ \x12\x01HbOy\
-\x1er\xa0*a\x17\xca\xf2\x88c\x99\x97\xe1M\xab\xc7\
-\xf1!\x0e\x01\xe4ft\xbd\xa42Wk\xd1\x95\xb2Y\
-_\x92\xb5u\xf3o\xf3\x87r\x10\x83\x008\x85\x7fc\
-|\xbe\xb3\xc4\xd2\x8f\xf1\xa0\xbd\xcb\xb1!&'\xefj\
-\xc4c\xc4 \x80\xec\xe2+\xab\x8d\xb2\xaa\xae\xba+m\
-ku\x0b/\xf3w?Pr\xf8\x9c\x10B\x06g\xb8\
-\xf8*\xd3\xdaX\xe5\x92kY[\xe3\xab\x8c\xbeS\xf0\
-WO\xf8\x16\x80\x1eX\xed{\xc4LMD\xf4\xbf\xf8\
-\xffk\x5cfx\xba\xb7\xec\x16\xd3\xbcA\xe8\x02`[\
-\xbf}Qch\xa9A(\x8b6\xb7\xbc\xa4m\xfa^\
-\xe8\xd3A\x81\x0b\x80\xe9~\x99\xbb\xbd\xa1\xec\xae\xc1\xe3\
-Cu\x97\xed\xc54\xc3\x93\xae\xdf\xe5\x22l\x01\xa4\x17\
-\x9d[\xabQ8k\x14\xca\xa6T\x0d\xeb\xb5\x0b\xce\x0a\
-\xdb\x15\x14\xb4\x13\xa8\xfe\xfe\xd7\xf2\xa6)U\xda2z\
-$\xe4-S^\x95+y\xb6\x0fXi\x08\xd9\x02\x04\
-\x97\x87\x1e\xb3H\xaa\xee\xfe\x0dGjxB\xf9P7\
-Q\x818O\x11\xb2\x05\x087sJM\x8d\x97](\
-YA\x19\xe3\xcf\x0e@\xa5#d\x0b\xd0\xf6\x8e\xec|\
-\x1fj:\x11\xe3\xfc_v\x1d1\x97\xd0'\x8cw\x08\
-Y\x00\xcc\xa5\xd9\x7f\x8aE{j8\x11K\xfb.\xfe\
-\x9fljQ\xad/\xc4x\x10\xb2\x00\x80\xc6\xbd\x8eO\
-\xfb\xd9\x9am\xca^\xe8>\xe0\xfe\xe2V\xf0\xb0\xf1\x0b\
-9\xc2\x16\x00b\xb7\xfd.\xdd\xdbU\xa3u\xb9\xc4\xf9\
-\xab\xbfU\xb2\xb7\xd7\xfa\x1a\x8c\x0f!;\x81\x00\xa0\xfe\
-r\xf6[\xfe\x1c\xf9\xe6\xad\x15$\xdd\xf1F\xa0\xe3n\
-!\xa4~\x17C\xe0\x16\x00\xc8\xb5\xfcAu\xdaC\xbe\
-]S\xc5\x08|\xde\xbf\xb3Y\xc8\xee\xdf\x10\x82\x17\x00\
-\xa4\x9d\xf3^\x0f\x0e\x90\xef\xdcY\x19\xd8@\xd7\xef\x07\
-\x82\xf3\x84\x93\xfb7\x1a\xc2\x17\x00X\xc3\xdbS?\x0c\
-\xa0\x9c\xbd~\xca\x86\xeb;\xe4\xfft.\xbf\x0b\xbf\xc9\
-\x10\xba\x0f\x00\x00L\xa8\xf5\x0f\x99\xee\xf2\xb7},\x9d\
-\xccE\xef\x1fd\xf1f1\xfc|Dp\x0a\x00\xb4'\
-o}\xcb\x9f\xaf\x9a+\x98\xee\xda\xed?3\x9b|\x93\
-8>#\x0e\x01 a~C\xf7\xad\xafJQ\xc1\xe8\
-\x89\xc0NGF\xd0\xb3\xff_\x10\x89\x00\xa0\xba\xd4\xb6\
--\x11\xed\xabBT\xb0\x10\xec}#\xd9\xdd\xca\xdf\xbe\
-_\xa5!\x16\x01 o~\xc7u\xcc\x8f\x09\xcf\xd4e\
-\xfd\xef\xf9\xdfo\xe1x\xb0\xe7ge\x10\x8d\x00\xc0x\
-\x9do\xd0]\x1e\xa2.\xe3\xe53x\xd9\xbdE\x11v\
-\x89\xe7\xba\x89\xe6D\x00\x18\x8f\xbb\x0eD\xd2\x13j\x03\
-\x92\xc1\xbd\xf1\x93\x0db\x98\xfe]CL\x02@\xc2\xb5\
-Ks\xd6=\x81\xab\xf3\xb1\xd3}{u\x19^\xec\xf9\
-[)\xc4\x10\x07\xf8\x05\xc5\xf7\xaem\xb9p\xa0\xe4\xdd\
-\x7f\xc9\xc8\xf9\xbd[\xd8\x8bM5LA\x9b\x00De\
-\x01\x00\xce\xf9\xb6\xfa\xb8\x97\x9d\x10\x1b\x90\x8f\x7f\x14x\
-W\x07^\xf7\xfd,\x1d\x91\x09\x00\xe8\x9f\xbaM\xd2\xeb\
-\x9e\x00W0\xd5\xd5\xbdM\x12&\xdf#T \x88N\
-\x00\xd0\x1e5\x1c\x8c\xa7J\xd9\xfe\x99\x04.\x19\xdb\x97\
-\xf9\xd4\xca\x8f-\xdf+\x89\xb8|\x00\x00@z\xdaN\
-\xc9\xc5\x1e\x10oEO\xc4\xe0\x99\xee\xddL\x9ew\x9b\
-\xbe\x8d\x1f\xf1Y\x00\x80\xfe\xa6y[!\x1a\xa8`T\
-\x90\x0d\xf9\xb6\xe2\x5c\x9b\x00z)\x95\x8c\x18\x05\x00\xd8\
-\xf6\xcb\xbf\xf4\xb1\x15K\x12)\xc4?\x09\xbe\xad\x82h\
-\xa2\x7f\xc3\x11\xa7\x00\xd0?\xf3\x0d\xb8\xdd\x15\x9a\x0e\xe6\
-\xbb{_\xe7\x82<\xda\xf2\xbd\x92\x88\xd0\x07\x00\x00(\
->\xb0\xbe;\x90\xabHT0\x13|+\xf9\x99K\x5c\
-\xb3\xff_\x10\xa9\x05\x00\x06\x9b\xb7(~\xf0W`:\
-\x98>\xed\xdb\xae\xc8\x08>\xf7o4h@\xa46\x80\
->\xd3\xbc+5\xe0\x1b\xef\xd7\x84\xbd\xdb2\x17Z\xc5\
-\xe8\xfe\x0d!\xd6G\x00\x80\xbc\xfe\x80\xe9\xd3\xf08\x0b\
-7\xc3\x1f\x87\xde\xb5\xf0m\xcb\xf7J\x22\xdaG\x00\x00\
-\xaa\xcf\xf9z\xe1j`\x1c\x12g/\x85\xfeD\xf9\x5c\
-\xe2\xfd\xfd\x8b[\x00\xe0T\xc7\x1b\xdf\x0d\xe7=\xe5~\
->\xe79\x18\xf9k\xa3 \xba~\x97\x8d\xa8\x05\x00\xc4\
-\x8c[\xf4\x7f\x8db\xb0\xac\x0f\x0f~\x15\xdfi\x8c\xd7\
-\xb4\xff\xc0\xc4#r\x01@v\xd1\xb2'\x1a.\xcb\x15\
-\x0c\x06\xf7$~\xb2T\xb9\xfd\x5c\xd5\x11\xb1\x138D\
-\xd6x\xa8\xf1X\x04\xa5W\x10\x87>\x0e\x1fvd\x0d\
-\xb5\x1e\xffD#v\x0b\x00\xd0\xbd\xfa\xad\xb8\x1c)\xb1\
-\x828\x7fq`\xbb\xa4W/f\xf7o\x08\xf1\x0b\x00\
-\xd0\xff\xc5q0\x94.\xa9t,\x1d\xfcs\xf8\x84\x05\
-<\xdd\xf2\xbd\x92\xd4\x83\x00\x10\xb3\xec\xd4\x9d\x0a\x96P\
-62xj`\xaf!&\xca\xc5\x9f\x1b\xa9\x0b\x01@\
-v\xd6\xbc+\x1d$\xcd\x15d\xfd\xe1=\xe9\x1f\x0db\
-\x8d\xfe_O}\x08\x00\xac\xfd\xcf\xa6\x8f\x02\x05\xa2\xa8\
-`!\xf1I\xe4\x90>?\xe1\x9b\xcf\xf0\x83:\x11\x00\
-\xe0ql\xa3\xaf\x92\x94\x8dd;\x03;\x99>\xdeo\
-\xf9Z)D?\x0d\xfc\x19\xedq\xfb\xbe\xe4`x\x8c\
-\xf3\xe5\x92\xf1\x03\xa9\xcfL\xe2\xcb\xfd\x1b\x8d\xba\xb1\x00\
-@\xca\xb5S\xf2m_\xf1\x5cA.\xf7]\xe0Mi\
-Rd\xa9\xdf\xc5\xa8#\x01\x80\xb9\xd0\xba\xb5\x10\xea-\
-\xe2\x0a\xb2a\xdf\xae\xc2\x19\x11U\xfe\x8dM\x1d\x9d*\
-\x00\xd3A\xdd\xe1H~\xd4\x94\xf1|\xe6\x83\xe4\xbbj\
-\xb6\x0ef\xff\xbfP?>\x00\x00 <m+\xd7\xd5\
-1JT\xb0\xd0\xdd\xb3\xbb\xe0\x11m\xee\xcf\xc8\xd4\x97\
-\x05\x00d_\xb6l\xcb\xa5G\x5c N\xc7\xde\xa4>\
-q@R\xeb!V\x97:\xb3\x00@\xce\xb1G\xfa\x95\
-{\x04W0{\xca\xbf\x0f)\x91/\xfe\xde\x00\x87|\
-\xdd\x09\x00\xf4\xd5\x99\x7fbC\x97o<\xef\x90g;\
-wN\x14}\xbfJ\x80C\x94FT\xe8\xdb\x1e\x95\x0a\
-\xab>l=0\xc0]\xb78\xc4\xc5\x0e%\x0fi\xf3\
-\x22\xe9\xfbC~)\x10\xa4\xd1;A\xd5\xf4\xfc\x85\x8e\
-\xb5l\x95\x5c\xe8\x1e\x16\x15\xcc_\xe8\xdf\xce\xf9\xed\xe2\
-_\xfc\xbd\x01\x16~\x1a]u'\x00@~\xbauk\
-*\xf5s_\xc1A\xdf\xae\xecI''\xf2\xdc\x9f\x11\
-(\xc0[\x9f\x02@\xc6\xfc\x96\xf1s\x1f\xc2\x00\x80\xd8\
-\xe7\xc1\xfd\xeaA\x11\xa7~\x8fJ\x01\x9d4.U\xb1\
-\xc5*\x7f\x90v7\xff;\xeb\xee\x03\x0b\xf4\x06\xb7p\
-\x9du7\xfd\x03\x00\xe4p\x9e\xc6%\x04\xeb\xcd\x0d\x04\
-\x00V\xf7\x89\xf3`\x00\x1e6\xf0\xe7\xf0'\x96\x82(\
-\xda\xbe\x96z\x09\x10B\xa7\x04A\xfc\x88\xd6:\x9b\xfe\
-\x00\x00\x1du\xee\x88\xdd\x7f%\xaf\xd8i\x08Y\xea\xce\
-\xfd\x03\x80\x02~D\x84\x01\x03\x17\x16\x8b=\xf9yD\
-d1t\x5c8\x96\xfafV\xb6\x1e\x9f\xff@\x06{\
-qB\x82\x04Nc\xb0~\xd6\xbf\x87\x934\x7fx?\
-\xe8\xbc\xa1\xd6\xe3\xa8\x09\x1c\xe28\x898\x8d<:\xf1\
-]=\xce\x04\x00N\x9e\xb3\xe7l\x5c=\xba\x7f\x00\x8b\
-\xef\xd0=\x14\x0a\xf6\xe3\xa3\x09\xee\xb0\xcb_\xe8\xba|\
-\xfa\x03@\x06\xc7\x10\x1cZ\x0d\x1c\xc0\x09\xf4\xd6\xdd\x9a\
-@}\xc3\xa1\x07_!~\xadAD\x17\x8e\xd5e4\
-\xa0~\xc9\xe1(:\xc1^\xcb\x07\xf0\xe1(zj=\
-\xa6I\xaaH\x0f>\x1c\xdafkH\x00y|\x8b\xc3\
-\xc8\xd6zT\x93T\x89\x0c\x8e\xe0\x87!\xc7\xffZ\x00\
-\xc8\x83\xf7\xf1S\xad\xc75I\x95\xb8\x80\xc3\xf8[V\
-\xd4/\x1b\x1fF`\xc4\xedb\xd9\x09g\x92\x22D\xb0\
-\x15\xef\x5c\xcb\x89\xfaE\x00)\x841\x15mu\x18\x14\
-\xae/\x0a\xf8\x18\xbfG\xf7\xb5?\x87o}\x1aF\x1a\
-\xb3a\xab\xdb\x99q=\xc0\xe1\x1c~\x87\xbf\xfc\xb2\xfc\
-7\x5c\x00,\xdc\xd0a6\xd4\x93\x12\x10)\x1c\xbc\xd8\
-\x82=\xc3Sb\xaf\xdf\xfc8\x83.\xd80\x0d\xf2I\
-\x09\x88\x92\x18\xde\xc6\xef\x10\x18\xfe\xd2\x8d\xbb_\xc7q\
-\x09\x8d\x98R\x1f\xb5\xf1uF\x12\x1f\xe1\x7f\xa1\xeb\xfa\
-\x98\xef\x8d\x02\xe0\x10\xc3%LEc].\x10\x8b\x99\
-A|\x86\x7f\xc6\xf9\x1b\x97\xfd\x98\x9b\x0ed\x11F'\
-Z \xda\xfe\xd8uI\x12\xc7\xf1?\xf0\xdd\xcd\x01\x7f\
-f\x84\x83Y\xf8p\x1e\x0e4MF\x05D\x01\x87\x01\
-|\x84\x7f\xc1w#\xd5D2#~\xa4\x00?\xceA\
-\x07\xe7\xe4\x8c@\xf0p\xf0\xe3m\xfco\x9c\x1d\xb9$\
-\x96\x19\xe5c,\x82\xf8\x0eY8`\x9e\x94\x80\x80)\
-\xe0\x02\xb6\xe1w\xe8\x18-\xe5\x87\x19\xf5\xa3\x1cb8\
-\x03/\xd4\xb0O>\x0a\x04\xca\x00\x8e\xe1\xffb\x17|\
-\xa3g{0E\xbf \x8d\x9fp\x16q\x98a\x1c\xe3\
-\xc8I\xf8F\x0e\xe7\xb1\x15\xbf\xc7\x17(\xbay\xd6X\
-\xb7\xb5\x00\x0f\xce\xe0\x02\x06a\x85fr\x9d@ \xe4\
-\xd1\x8d7\xf1{\x1c\xc0\xd5\xb1\xb2=\xc9\x9e\xef\x0c\x5c\
-\xb8\x03\x8f\xe11\xb8 \x9b\x94\x01\x8f) \x077>\
-\xc0\x078\x8d~\x92\x82\x1fr\x07O\x02;\xa6c1\
-\x1e\xc5\xadPC\x02f\xd29\xe4\x11\x1c\x0a\xc8#\x81\
-3\xf8\x14_\xe22|\xa4)~\xa5\xddD\x1az\xd8\
-0\x15\xf7\xe2n\xcc\x82\x0eR0`\xc0\x80\xe2\xb5\x18\
-\xc4\x9b\xee:t\xdb\x0b\xc8#\x86\xf3\xf8\x1a\x7fE'\
-\x02\x88\x95R\xeaW\xfa\x8d\xa3 \x85\x16\x1a\xd80\x1b\
-\xb31\x13-\xb0\xc3\xcc\xe3\xa8!\x8b\xb4H\x13^9\
-\x0c\xa2\x07\x1d\xb8\x8c\xcb\xb8\x04?\xe2H\x94\x9e\xd6\xf7\
-\xff\x01\xf66\x1f\xe8_\xafk\xb1\x00\x00\x00\x00IE\
-ND\xaeB`\x82\x93\xe4\xf7\x89\
+\x00\x00W\x87\
+(\
+\xb5/\xfd\xa0\xc3\x02\x03\x00\xe43\x00\x06\xf7\xcc2\xa0\
+\xf6\x1c)\xc9$S\x92It\x22\xa7\xedG^I\xc0\
+\x8c\xac\xa79\xe5@\xc6u\x9aL\x864H\x97\x16\xb4\
+\xca\xd4;\x8b\x22\x85[\xf8\x9b\xfa\xbduFok$\
+\x05\xbc\x00\xc3\x00\xc0\x00qEEEGDD\xe4W\
+WW\x1f\xee\xd1h\x14NKK\xebjjj\x1d\x0a\
+\x85\xc2\x83\x83\x83<++\xeb\xbf_k\xfd\xdf\xf7\xe5\
+===\xfb\xe8\xe8(\xc6\xc0\xc0\x80\x19\x18\x18\xe0\xbd\
+\xbd\xbd\xde\xd0\xd0\x90\x8d\x9dN\xe7\x8e\x8b\x8b\xcbr9\
+99o``\xd0GFF\xbc\xa4\xa4d'!!\
+\x81\xab\xaa\xaax\xb5Z\xfd?~>\x9f\x86\xd9\x9f5\
+\xc4\xd1\xcb\xd3\x0c`\xad\xc9\x19\xa3)\xe7\xcc,\xdc\xc8\
+\xcc&\x15Uf\xaeH\xe5\xfc\xe5\xe3\x933bP\xe4\
+\xcdM\xceU\x9d\x97\x97\x9cY sV\x99R\xa99\
+[\x9c\xe4\xac\x01\x02\x92\xb3\x02X\x9bT\x9a\xf3\x80B\
+\xce\xce\xaah4\xe7\xbc\x96\xb3\x80P\x96>\x9f\xd9 \
+3s\x0e\xdb\xce\xce\x8e\xfb\xf9\xf9\xc1q\xbc\xeb\xea\xea\
+8   \xbc\xff\xdfOOO\xf0\xc2\xc2\xc2\xfe\xfb\
+\xfb\xe3\x82\x82\x82\x1d\x02\x02B\xcb\xc8\xc8\xe8\x97\x97\x17\
+\xee\xe1\xe1\xd1\xaf\xd7k\x7f||\xe4\x1f\x1f\x1foL\
+L\xccKCC\x93}\xd1\xd0\xd0zAA\xc1\xdf\xfa\
+\xf0\xf0\xf0\x8d\x88\x88\xf8\xae\x93\x93\x93\xff.\x14\x14\xd4\
+\xef\x0e\x0e\x0e\x9b\x8f\x8f/\xcb\xfb\xfa\xfa|\xbcml\
+l\xbe\xdf\xfa\xec\xec\xcc\x0f\x0c\x0c\xf8F\xbe\x1b\x93\xb0\
+X%\xc7\xef\xa8\xd4t\x82D\xa77\x85\x1f\xa7\xb0?\
+<<\xc0\x9c\x8b\x8b\xeb3\x99\xcc\x98\x92\x92\xb2\x9f\x9c\
+\x9c\xc0www}nn\xce#  \xc4\x91\x91\x91\
+\xf0\xcf\xcf\xcf\xdf\xda\xda\xea\x84\x84\x84\xb1\x85\x85E\x16\
+\x0b\x0b\xabK\xa5\xd2\xefe\xec\xdb\xa6\xa6&\xef\xb1\xee\
+\xc4\xc4\x84\xbb\xb8\xb8\xa8\x19\x19\x195\x05\x05\xc5>8\
+8\xb0\xccby\xcb\xb3peee\x8b\x82\x82\xe2\xdb\
+\xd6\xcb\xcb\xcb\x7f\xbe\xb9\xf6q\x1c\xb7@@@>~\
+[::\xba\x1e;\xba\xed\xf5[A\xff\x1b\xf4\xea\x1f\
+\xaf\xa0O\xaatj\xf5\xd6\x02\xa4$\xeb\xe6\xe0\xe0x\
+766\x1c\xf7\x0b\x07\x07\xe7\x9b\xcd\xe6\xde\xd9\xd9\xf1\
+\x9c\xf3\xcd\xc3\xc3\x03\x07\x06\x06\xee\xbc\xbc\xbc=55\
+\x05\x87\x84\x84\xf0\x92\x92\x12nbb\x12[ZZv\
+\x11\x11\x11O@@\xb0\xbb\xba\xba\xd8\xd8\xd8<\x0c\xf7\
+\x8b\x8b\x0b\xd8\xd0\xd0\xd0\xc30\xbcsrr\xb6\x90\x90\
+\xd0\x0e\x0a\x0az\xdf\x96\x96\x96\xed\xe2\xe2\x12'$$\
+p\xbd\xa3\xa2\xa2\x02\xdd\xc7\xd72\x92\x0c\x1f\x90i5\
+\xfeqcU\x86hs\x83V\x7fc{y\xed\xaf\xbb\
+\xb4\xb4\xe4\xbd\xcb\xc4\xc4\xf4\xf7t:\xe5V\xabuw\
+tt\xfc\xaf_\xdd\xb1X\xac\x86\x81\x81y\xa9T\xea\
+\x9b\x92\x92\xd2_\xfd5\x18\x18\x98\x9b\x94\x94\xf47\xe7\
+\x8a\x8a\x8a<##\x83'&&r\xee\x1a\x19\x19}\
+]TT\x14\x16\x16\xa6YXX\xde\xae\xa0\xa0\xa0{\
+\xbf\xbc\xbcl=\x16\x09\x09\xa9URR\xfa\x00\x00\x00\
+\x1e\xfb\xdd\xa1\xa1!\xef\x8e\x8d\x8dm\x0e{\x01\x01\x01\
+-&&\x16\xff\xff-\xfb\xde\x9a\x8c\x8cL\x9b\x99\x99\
+\xf9\x80\x80\x80WBB\xe2\xd5xxx\xae\x96\x96\x96\
+\x9e\x99\x99\x89]\xd7\xd5\xdem\xdb\xf6\xfd\x93DDD\
+<\x81\xc5\xa8Qa\x22F\x0a$\x05\xa9\x0cc\x11\xa5\
+BL1CU\x1eb\x22\x0dq\x8e\x08\x0c!\x02b\
+\x88\x80\x08\x88\x80\x18\xe1\x88D$\x98\x80\x82\x11*z\
+\x00\xf2\xb8\xc1m\xca,y\xcd\x01\xaeW!\x17\x18\x80\
+\x07\xed\x9d\xf0IDZm-\xac\xad\xa9\x14p\xd0\xd6\
+X\x10\xbfT\x1cl\xd60\xc8\xcc\xc0\x03\xe2AAT\
+\x8f\xc1\xd1O\xf0\x80\xc5;\xa5\x83Sn\x1dT!\x18\
+p\x00-\x03\xa2\x9e\x1ee(O\x0a\xbe\xc3\xe5\x83\xf4\
+!h\xce\xe8H\x0f@\xff\xf0\x03\xf9ch?S\xaf\
+Fsp\xe9\x94\xdf\x12]/~\xf4Un\xc5\xea\xf4\
+k\x8f\x01Ia\x92\xe9\x01\x7f\x80O\xff\x98E?:\
+\x1e\x06C\x7f\xa2<y\xfe\x8e\x94\x8d\x98\x81\xbcv:\
+E:P\xbd\xe7w|\x8e|q\x83\x0aYlmi\
+\x0d\xe6\xc1\x95\xb6{\xe8\xb6\xdf\xc9\xe5\xf0\xdf\xc7\xd8(\
+\xee\xd9\x16\x83\xeeW\xe8\x89\x8f0\xae8\xf6\xfdE\xd2\
+\xb8X\x8e\xa5\xc7z}\x07\xe1k\xbf\x09\x1a\x07\xcf\x83\
+\xfau\xd9\x11\xb0\xa9\x01\xc5\xc1A\x87\x97\xe9\xa3\xbe\xf1\
+:\xf2\xb6T\xfe-E?\x90\xef\x84\x9e\xe2@\xdf\x04\
+\xf0\xe6\xb3\x11\x81\xff\x8b\x97\xa6o\xa3\xf1\xed1\x15P\
+\x0c\xd4\xef\xc9\xbb\xf4\xc3]\xab\xfe\xec0\xadv\xccJ\
+\xc1\xe0(cc{4\xcd\xe9\xbe\xf7\xc7\xb5\xd4\xd5\xc1\
+n\xb5j\xf3\xae\xd4\x96MeN*[\xa6IZ'\
+<m\xbe\x0c\x93>\xdf\x93\x0b\xb5\xbeX\xa9\x81f\xfb\
+z\xd6p\x9bcYsb9P\xac\xde\xbfq\x1d\x10\
+\x98\xda\xc8\x9d\x8bO\xe0%\xc0\x02\x10\x1c<\xd6\x16\x9d\
+\xf0\xedZ\xbfn\xe0\xe5\xf5\xc0\x0b\xa1\xf01\xe8)\x8a\
+D\xf9\x010\x11\xa9\x95uo\x0e\x95\xd3\x985\xd9j\
+\x1d\xf7$\x8d\xb2\x7f*jv\x14\xe9\xe9F\x12\xf2\xb4\
+;\x89\xff\xd9\xbe\x07M|\xd8\xc4=x\x1e\xda\xd8\xfc\
+\xc5\xe0\x02\x03\x14\xd0~\xe9K\xee\xcf\xccc\x9fv&\
+8\xbeB\xa7\x09\xc0\x1611\xec\xd7\xbf\xe3\x8e9\xd5\
+\x96p\xfaV\x8a\x1aJ\xfe\x16\xbfn\x9e\xb5\xa0\xc2\x91\
+\x109\xf4\xa0\xa2+F\x90\xb9\x05\xf8K\xdd?\x8c2\
+\xd6\xe2\xa1\x03\x7f\xd5\xe8N+\x01X=\x07EW\xeb\
+\xa7\x7f\xb3Q\x0c\x1f\x9e\xa0\xd0\x19\x87|\x9dC\xf6M\
+\x83\x09|\x1e\xc8\xcdt\xf4\x08HGW\x8f\xe7\xad\xf0\
+\x91\x83\x9b\xcd\x93\xad9@\xce\xeck\x8d\x99\xee\xa9\xe7\
+\xea\x02u\xe9\x9b\x9f\xc1c\xf3\x0er\x0d\xba\xa3\x13_\
+*\xcbi\x07\xf0\xfb\x871\x22[\x95\x11\xd3\xff\xe3q\
+\x96\x0e\xde\xdb]\x872l\xb0\xa1\xb7\x84\xdc\xc6\xdd\x1b\
+\xbd(IF\xf2\xdck8q\x1a\xc9\x05W\x98fl\
+\x17\x9e\xc5Q\xf7\xb5\x11\xb9\xc3@<\x9e\x11\xcf\x15\x1e\
+S>2LV\xc4;\xbe\x99\xc4\xd6y9\x0c\x1a\xc2\
+\x1f\xb6B\xa2\x09 \xc6Q\x80yk(\x12\x03j&\
+\xba\xd2\xc6\xa6\x1f\xb5\x8f\x22CC2\xb8\x0eW\xf3\x91\
+\xf5?9\x0f\x1a\x12\xb9\xb5\x7f\xd6It\xb88@\xd7\
+\x1d\x8d\xdd\xd2s\x08\xf2\xab\xb3\xbb\x96\xfd\xc8K\x87\x84\
+\x0b\xbc\xca\x1af\xa1\xc9\xb5\xf5\xb1\x01\xfba\x87\x07\x1a\
+j\x1c' \x91\xe9\x15\x18\x94\xe9\xa6\x81\xf8\x1d\xe0\x97\
+5\x0e\x7f\xdd\xc0:\x06\x93c\xf8\xc1\x1f\x01\xc1\x11\x16\
+\x09\xd4\x08\x1e\xcf\xd7'XZ\x93\x8a\xf47\xe0\x05t\
+\xa6h\x00\xcf\x8b\x040\xdc\x80\xd2\xb7\x9f\x00\xaf\x1bI\
+\xfb\xfd\x81\xa9\xba\x93\x02l)\x00\x06\xdba-Py\
+\x03#\xb2{gJ\x99R\xa6\xc8\x17|\xec\xa7Gy\
+\xef\xdfL\x9b\xdc\x1d7f\x16gR+\x01\x18\xc7L\
+\xc5\x1aNJ3\xeef\xd8q\xe9HV\x00S\x00S\
+\x00\x04\xa5\xc5bY\xd9\xcb\xe5\xc2\xf6~\x9e'O\x99\
+\xcct\xb9{\xbaX,\x98\x1c\xd9Lu:]\xbb\xac\
+T*\xaeO\xe3e\xcab\xb1xo\x99\xab\xcc\xbe<\
+\x97\xcb\xed\x99\xc3_\xcf|\xb5Z\xad\xb1\xfc\xfa\xce\x0b\
+\x85\x02QU~>\x1f\xe6\xe9\x82_\x10\x14\x05\x8c\xdc\
+Q\x00-\x92\x02\x1140\x18,~;\x9d\xce\xab\xf9\
+\xcb\xe1p\xe0\xafn\x18\xd6Z\xde{\xb3\xd9\xc4\xff\x7f\
+e\xbc9\x8f\xc7\xf3\x06\x83\xc1u\xfdV[\xdfr\xbd\
+\xe5\xcdQ\x14m\xbaF\xa3\x91+\x14\x8a\xa6.\x95J\
+\xa7\xd3i\xe6\xef\xbb\xe7\x955\x99L\xf3\xdf\xfe\xef\xdd\
+n\xf7=\xef\xf5z\xfd\x13\x08\x018\x1cN\xc3\x1b\x8e\
+\xb7\xc7\xe3\xf1\xbd\xfb|>\xafU*\xd5\xdc\xfd\xb6\xd9\
+l\xfb\xf7\xfbq \x10\xb8o\xb7\xdb\x86\xf7\xdf}v\
+[\x14\x0a5w\xa6?\x1e\x8f\x9d\xc1`\xe8\xdf5\x8d\
+F\xd3\x1a\x8dfs\x0c\x06\x03k\xbdY\xd9\xf76\x91\
+Hxy\xed\xae\xe6\xec\xfax<\xd8\xbe\x06H\xb9\xab\
+jO\x7f\x0a\xa7KX\xde\x9dU\xe3\xa4\xbc\x97=n\
+_7\xe9\x85I\xe3+\x94\xa9\x18\x96\xcd\x08b2\x04\
+\x108\x09Jf\xacN\x0chrM3\xa0\xa8(\x07\
+\x80c\xf8\xce\xef\xf0\x01\x22\x9e\x01@\xa8mE\x80\xc7\
+\x09i\xb9\xed0M\xa6R\xa9\x19\xed\x8dF\xe3\xbbJ\
+\xa5\x92\xc3:\x81\xc5\xa8\xa1y\x12g8\x11\xa5!\x86\
+\x10e\x14+|\xd2\xaa\x02\x84\xc3\x10\x81QF`\x14\
+\x11\x10B\x84FH\x88\x90\x10\x12H \x91\x88\x88\x9d\
+\x0fL\xf70K\xc1+\xe6@\xbe\x1b\x8eO\x1d\x8a\x85\
+\x13|\x83\xf7\xd1#\x8b\x0e\x90\x1f\xca\x1c\x08K,\xdf\
+\xfdf\x96k\x0e\xab:\xe7\xeb<#\xca(*`\x86\
+\x03\xdc*\x1b\x8f\xf8\x1e\xc5\xbe\xe4\xeb-Rw9V\
+\xdf6y_\xec/\xe0@\x10\xc4\xc5\xb0\x84\xfcn\x03\
+_\x90\xaaI\xf0\x87\xb6\x1b\xa1\xf5@3\x82+e\x07\
+\x18\x22{\x8b\x82\x13\xb0\xe3-\xa0\x8dZ\xb4\xed\xf6H\
+\x81fc\xf9\x8f\xbd\x5c\x1d\xc2\xfc\x8f\x9f\xd8 \xd2\x19\
+$\x9b\xa3\xd9\xe6\xe7\xd1d\x163\xb6\x0f\x0d\xe1\xb2)\
+\xc3\x02\x9e\xf3/\x04s\xf4\xd1\xbcO\xc2\xf9\x0a\xd9\xa8\
+[\xc8\x93B\xd1R8(\xa7\x0a\xdfj\xa1\x9e1\xd9\
+\x88`\xfb|!\x09\x13\x0b\xffJ\xcb@q8\xf4\x04\
+(\xf4\xe3L\x03\xf0\xa8\xe14J\xf0i\xc3\xeei\xb0\
+\xbf\xc7\x88;\x9b%\x87:\x18Vw\xb9}\x09\xd2%\
+\xc3!\xed\xd3G\xcf\xf1}l\x82\xc9\xe1\xdb\xcd\xdc\xf9\
+\x1b\x92\x94\x06\xf09\x84\xfe\xaet\xf9\xc7\xbaBC\x87\
+\xef\x8d\xf9\x8d\x09\xfa\x80\x93+f\xcb\x8fz\x17N\x1b\
+f\x88\xbe\xb3\xe7\xf5Y\x1d]z\xc3vThAK\
+*\xfa\xa1l\xe7\x84tc\x10z\x7f?\xcc\xa1\x84;\
+M\xaa<B'\xfb\x1ds\x8f\x1bSgL\x0c\x7f\xd7\
+\xfd\xe4=\xfa\x8c\xf0\xbb'#=\x04>\xd1\xbf\x0f\x8d\
+\x9e\x04L\xb8\x8c\x81\x81k\xf7\xf7\x8b3\xaa\xfb\xdb\xca\
+\x1e<\xcd\x0f\xa87\x1fc\x80\x01.\xbf{\xe4\xfet\
+[\xcc\x91n\xbeq\xda-\xeb9\x0e\xf3\xd0F\xb2\xdd\
+9\xd7}\xce^\x92w<Z\xfc\xc1\xcb\xd9\xd2\xac\x0e\
+dm\xee\xb8H\xb1[\xa7\xd3\xe1\xe3\x0e\x03{\x1c\xba\
+x\xc3\x92\xed\xcf\xa9?6\xfd\x19poB\x91\x07\x8e\
+;P\xb7\x0e\x97\x86=\xfd\xbe\x14\xe7)\xfa\xa9~!\
+\xe9\xa1.<O\x93\xa5\xa1\x1c.\xe5\x1ee\xc0\xe7\x97\
+l\xb2\x80\x09\xff\x10\xd2V&\xee\x9er\xb9\x93}v\
+\xdc\xe5[\x1dr]B\x93B\xbf\xb8\x8bW\xf5G8\
+\xe7\xa8Z\x0a\x02C\xba\xd3\xe4\xb84(\x86\xa7\xf4\x19\
+\x95o\xcb\x9e_\xbe\xfc4 \xec\xd6\xe5U\xd6\xc3\xe2\
+\x0b\xad\x8e]z-\xea\x93\xb4\xf8h\x92\x1c\xf9!\xc6\
+&\xa5!/O\xaa\xf4>\x91\xd6v\xa8\x87\xf3\xab\xb4\
+\x86[F2.\xa6\xcd\xddE\xf2\x10\x8b\xee\xaf\xfa\xfc\
+v\xce\xf3\xe0\xd4l512~=\x83;8\x08\xc3\
+\xf5\x98\x1c\x8f\x92\x817\x92\xe8ew}\x1fJU\xa2\
+\xd1X\x9f\xe3g)M\x99\xe0;\xc1\xe1\xf0\xa5\xc0\x9d\
+AR\xfc\x15\x8f\xb0\xa5\xf8.\x11=\x13\xe5\x11_\x95\
+Xl\x88\xd3\xdc\x13\x15\xffc\x07\xf1\xf0\xdc\xe6S\xbe\
+a\xc1\xbf\xc8w\xd6D\xda\x0d\x1f\xc7\xa1\xad\x9f#:\
+\x8c\xf8\xf7\xc0\xec\xf8og\xde1\xb6)24\x0e\x91\
+\xae-w\x95\xf9(w\xba\xa7\x95\x17v\x90|\xd6\xfd\
+}\xaf\x01\x0aD\xea\x17Z\xe7\xd8.\x14\xfc\xa4t\x81\
+\xc7\xaf\x91\xff\xc3\xb4\xeaMC\xf4\xde\x18o\x12}\x06\
+\xb07\xb7\x99\xc4p+\xcf[\xe9[\x8c\x8fy\x0c\x86\
+\x8d\xa1\xe5\xeb\xbb\xedX\x1eBe\x9b\xb7OF\x86\xd6\
+\xc5\x17\x0f$\x94\x05:\xb8}\xae&T\xbc\x817\x89\
+x\x09\xad\xb8\xe7\xc2\xe5\x0c\xc1\xe4\xa9\x91I\xbd\xd5\xc6\
+\x1a\x17M\x8fiX=*\x1fm \xdb\xd96\xe3\x95\
+b(\xb7\x9b\xbe\xaa\xec\x12\x5c\x10\xf0\x8d\xf5|\x5ck\
+\xb3 \x0d\xeb\x16.\x5c~\x18\xe5*#A\x09\xaa]\
+\x0e\xc4\x12PY\x0bAp\x9b\xd7S(y5\xb2X\
+\xcc0\xc9v \x12\x9bb\x18X\x8a\xd78\x8eW \
+\xb3\x86\xc9\xfb\xe4\x16/\xecP\x00V\xed\x9840W\
+\x0e\x99)\xed\x96\xbbR\xee\x8a\x88\x88\x88\x94{QI\
+a\x90\xe0\xca\x94\xb2\xa5\x9b\x12\x82\xf3$\xb1\x9c\x97H\
+C\xc5\x12\x05\x97Y\xb2\x8f\xad\xb8\xd7:\xc3\xc1\xf9\xff\
+~\x0e\x8c\x00\x8e\x00\x92\x00\x98\x89\x89i\xeb\xee\xd6\x9a\
+\x92\x92R\x85\x10ft\x9e\x9c\x9ctZW\xab\xd5\x9f\
+&&&\xbe\xbbJJJx\xc6HHHv\xd36\
+\x8a\xb5N988\xbeK]\x5c\x5c<\x0c\x0c\x8c\xad\
+\xde\xfc^\x9d]g#\xdd\xd7\xc1\xc1Aw\x1cW\xf5\
+\x9c\xf3v\x89\x82\x82\x82\xe5\xc7\xbd\xf7\xd2\xdbLUT\
+T:v\xda\xd8\xd8\xc0\x18\xf3\xaa\xfc\xbf\xf8\xf2\xf2\xe2\
+=\xfc\xf8\xffR\xeb\x98\xe1&\x05\x01\x01\x813U\x9d\
+\x22\x22\x22ze\x97*k\xd7\xdfU111\xd8\xf6\
+\xf4b\xda\xb3\x1b\x9f\xder\x9c\xadAAAu\x7f\x11\
+\x11\x11\xfa\xb3\xa6m\xd4\xcf{/Wk\xb5\x96\xc5b\
+y{oJ100\x80\x80\x80jNN\x8e\xe7q\
+\xce)\x08\x08\x88\x96o&!!\xe9\xb4\xdf\x87\x87\x87\
+\xab1\xb7\xe9\xaf^\xf5\xf1\xf1\xd9^\xfd\xa8\x87\x87\xc7\
+\xbdX'%%\xcd\xde\xa5e``\xc0\x1ag\xdb\xd0\
+\xd00utt\xfe\xf7\xe4\xce\xce\xce\xfes\xf3\xf0\xf0\
+l\x99\xad\xb6\xc5\x89E\x16\x16\x96\x99\x92\x92\x92u\xbb\
+\x19\x18\x18\xbc\xb8}3^ZZ\xc2waaA\xc7\
+\x18\x03Z\xcbL\xab\x9e\x92\x92QC\xf83\x0f\xf3\xb6\
+\xd6\xeaQ\xb5v\xebb*(x[~\xf3\x97\xd4\x96\
+P\xceV\xb7[>\xbb2\xdc\xe0\x87e\xdd\xbe\xb0\x8f\
+\xbe\xa3BBB\xb2J\x8f}=S\xcb\xb7o\xbb|\
+S'\xab\x9cl\x22v\x83\xa1\xfd\x9fA\xf0\xc3\x92\xc8\
+2\x89\xd5\xb6\xad\x00F \x1c\x09\x00\x98`m\x1b\x10\
+\x05\x80\xc6S\xd7\xbd(\x1c\x8d\x82\x8b\x95\x8a\x03\x81\x19\
+\xdd\xb5\xd3\xcc\x80\x8c\xb54\x09\x10E\x11\x08FG\x0a\
+\x0235\x03\x16\xf6\xcf\xc0*\x1b'\x9a\x0d\x0d\x0dA\
+\xe9\xc9c\x17wc\x18f\xbdY\xf3\x9e\xaf\xc8\xfb\xfc\
+7w\xf9gGGG\xecZOO\xcfv\xbd\x98\xab\
+\x94\x1dJI\xb5\xcb3<g\x85\x9fV\xed\xb3\xc8E\
+\xaf\xa1\xcc\xa2vs\xe6E.\xeb\xe4\xe7\xf2\xd6N.\
+\x86\x84\x84x\xf3O:\xaf&\xb5\xabe\x99\xe4\x9c\xc7\
+\x8f\x8f\x8f\x1f\xa5\xf7\xff\x9f\xd2\xd5jT\xd7K\xa36\
+\xbb-\xe7\x9cM\xce\x85\xa1'\xf7\x97rc\xd1\xd30\
+\xaeX\xb3\x1er\x0e{KK\x0b\xec\x90\xf7\x18\xe1\x0c\
+\x83\x8a\xa8b\xabKl8\xc2i\x08A \x0a\x02!\
+\x9c\x94Z\x1f\x02\xa3\x84\x00B\x88\x80 \xa1qD`\
+\x90\x11\x10$$\x84\x10B$\x90@DDD\x84|\
+\xd8\x91\x22?\xa0~\xd2.1\xbf\x18\x85\xb1\xb1kt\
+y\xed\xd9\xe1v\xa3\xe3\xa2\x0f\x8c\x8bZ\xd9\xd9\x8a?\
+\xb1\xf0\xb2\xbe6y\x9a\xd6M5\xd4\xcdQ\x80?\xd6\
+ht\x88\xf2\x93\x13\xe5\xc8\xf42\xd7\xd3\xf3\x11;f\
+\x16c\xe4\xc0\x0a}\x8dx&q\x19\xe3\x8f\xa3\xcbH\
+\x1e2G\xd9\x07\xe2G\xa3\xde\xc0B\x01\x1c\x99\xe1F\
+\x09\x95\xcb\x96G\xddOi\x0b\xe55\xb9\x91D_\xe0\
+0~\xd6$\xec\x82\x149\x86.\x17\x15\xbd\x8b\xe6Y\
+\x96\xf8h\xfc\xbe\xc6{\xd7\xb0W\x1bA\x16\xed\xa3\xe5\
+v\x92\xa3Ln`\xee\xb3\x19\x95\x04T\x92\xd1\xdf\xae\
+<u\x85\xdaXU\xdb\xe6\x8dwu\x82W\xc4\xe9\xb2\
+A~\x1c\x88\x0c\xdf\xda\xf73\xf7F'\x13\xd5%#\
+\xd78\xc4~3k<\xd9Sj\xde\x831I\x19\x18\
+\xa7\xf3?\x7f@\xf1\x1ax\x0e\xd5\xa8\xaf\x9b\x22]\xbc\
+\xc7\xe0\xb2\xdf\x87\xf8\xe2E(\x91\x1a\xb5r7u\xef\
+V\xe1K8\xc6#\xfb\xc7\xe2\xd97v\xb8\xf5\x87q\
+\xbc\x8f\xbb\xa3\xe9\x0e\x8d\x91\xebo\xbd-\xe7\xaf\x1e\x01\
+\xf8\x07x\x80\xa2\x18\x98\xf5vO\xf0\xab\x01\xf4\xae\xad\
+l\x9d\x81(\xcc\x07\xb4\xef\xcfx\x9d\xf2\x0d7R4\
+\xbbKo\x0c\x9f?\xc9\x1b1^6\x9f\x19\x7f\xfe\xf0\
+r \xd0\xb0\xd3\xf6\xe0\xf6\xf6Jw_\xc6J\xde|\
+!\xb7@\xc1\xf8\x99a\xdch\x8c\x91\xb1\xc7\x0e\xe9~\
+\x9c\xe0\xe7\x84\x96Iy\xd3\x1b\x05\xc0\x87}\xa1\xf7\xc7\
+\xffy\xfa\xf0\xec\xb9X\xc8\xd8\xc6\xbc\xec\xc3\xb3\xe0\xfa\
+\xa2>\xa4\x03\xe2\x8d\xd6\xc7\x9al/&>W\xef8\
+\xce\x05_\xd64_c\xa4\xdf\x19\xf3\xff\xe7ga\xb3\
+~\xd0\xd9l5<b\xc1\xe64\xf7h\xcd\x96o\xa1\
+\x86\x8bH\x22\x9e\xfa\xefL\xc2\xb41B9\xaf\xb9\x93\
+=\xca\x11C\xd9\x9b\xe6\xd6\xd4\x1dgu\xef\x0f\x10\xbe\
+\x02\xb0\x9d\xd9o\x80.\x94\x11m\xe1\xdd\x86\xf9\xab\x00\
+\x833\xe1\xff\xbd-l\xcd0X\xf4\xc4\x19\xfa'\xc1\
+\xc3\x02\xc0\xe4\xbc\xf0\xd4\x92|1\xb4\x0a\x8c8\x8fv\
+\xd5\xc6\x81\xf9\x87\xc0z\xcb\xb1\x02\xac\xb8'g\x8e1\
+\xa1O\x9e\xe6W\x00\x0f\xb5A1tF\x80x\x94U\
+w\xc4/\xdd\xcf\xdb\xf0\xe8\x97\xd9\x93\x91\x99a|\x0d\
+@\x9e\xbe{l\x7f\x9a\x81&54\xc2\x1b\xca(p\
+\xb4\xf5\xb2\xbe\xdbA\x03G\xf7\xcc\xbf\xcf%\x5c^\xae\
+\xfe\xbb\xc9\xda\xee\x04\xde\xd4lX\xf5+\x8d\xd0\xc9F\
+\xc6\xc6\x9a\xa5\x17\xce\xf5\x02\xe9\xe5\xear\xfcQg\x7f\
+\x8aQ\xcav'\xb4X#\xd2lO\xf8\xa3\x9c\xea\xfc\
+\xcf\x8f)T\x97\x95\xb2\x1d\xef4\xe0\xb3\xce]u\xb2\
+w|6\xa7L\xb1\x11\xda[\xb8\x06\xb8\xff\xbbEf\
+\xd8\x08\xdf2Hv\xfb}Q\x91\xbd\xe2\xb3b?\xe3\
+nD\x0f\xb4\xe0\xd0\xe6>\x11\x1a\x1f>2V\x07\x84\
+Dd\xfeOk\xbe\x8bZ\xdf\xa3`\xd7\x0a\xbd\xdf\xac\
+}\xec\xba\x83\x14\x82\xafE\xdf\xa3\xd5,\x9e\xbbi\xdf\
+\x9e\xdbW6\xe4\xb3\xe6H_LYgk-\x8b\x0f\
+|[\xb3^!\x8cP#\x1a!\xbb\xf1}\x1b\x1f\xc3\
+\x83\xc3\x81\xb8V\x1c\xebEtd]\x90W\xb45\xc6\
+\xea\xa3\xbe\xacte\xae\xaa\x10\xc6\xd9\xdc\xd7\x94\xda{\
+\x10@sAsGHg\xbbG\xc7O\xfc\x1b\xfa/\
+\x17_\xf9vxd\xfdh\xdepx2\x16\xf8\xa1\xfa\
+\xda\xeb\xa7<\xb2 _\x8b\xd4;$^\xe0\xa6\x81\xae\
+\xb3\xe5\x08\x8f\xb8M\x5c\xd9L#C\x96\x17\x88x_\
+m\xda#$\xe2Fs\xca\xfd\xdf_\xb8\xa9\xf4\x11\x14\
+:\xaan\xf7\xe68&\xd6m\xf7\xfc\x08}\xbd\xc2\xdc\
+\xdd\xf1I\xddO_\xd9\xfd\x11\x89\xdb\x0cx\xcd@\x0e\
+\x07\xee\xfb\xa3\xf9\x97{\xdd `\xc4\xdc\x8dU\xd8;\
+|\x8c\xb3\x9f\x15\x7f}A\x80$\xac=\x9d\xd3\xfa\x98\
+\xab\x12n~\x82\xb0\x02\xcd\x00r6G\x13\xfe\xbe\x82\
+\x05\xbf\xd0!\xe0<\x84\x8c\xccQW\xeaW\x90\xe0\x22\
+\x81\xa7 \xf2)p\x94E\x08\xad\x8fA/P\x16\xe0\
+\x83G\xf7\x92\xe7\x86\x8f2\x17\xd3\xef\x07\xa5\xd2\xf12\
+A\x09\xb0v-I>\x02\x9d\x08L)\xdf\x9d\xfb\x9c\
+C\x10\xe98\x82+x3AAr\xb2]\x11\xe8{\
+\x01&'\x9e\x06\xaa\xbdr\xdfc\x22\xda\xa7E\x5c\x1b\
+D\x0cT\xc6\xbe\xaeAk\x80\xe0\xacC\xf2A\xd1\xa5\
+\xe2\x92\xa59\x10\x11\xac\xec,<'\x82bI\xca\x07\
+j (Y\xbdz\x9c\xe6[\x06\xe3\x83*\xf30\x1e\
+\xfa\x8d\xcc\xdb\xa0\xb7\x83]\x17\xb7CV,\x0b\x12\xf4\
+\xcd=y'\xecv\x90\x01#\x1f\xd2\x81\xd6\xf4\x8b\xdf\
+\xe8\x90\xb4\x0d\xd3e;\xe3w\x07\xb2\x99@m\x1f\xda\
+\xc1\xfe\x9c\xbb\x03\xea\xf9\x9f4\xa5K\x87\x0e\xb9\x9c\xb2\
+\x03I\xc6{\xd4\xfe\xeeI\x9d\x0fO\xa8\xf9aI\xf5\
+C\xc0\xfd>s@\x9f\x86\x0e\x94\xfc#\xbcC\x1b\x7f\
+{\xa4\x00[3Eq 7\x14\xe0\x024\x94;]\
+w\x86q\x83\x15\x07\xc0q_\xdf=\x92\xed\xfb\xd17\
+7\x99A<\xa4Y\x82\x03_e\xbej{L8'\
+D\xe9x\x88\x8e\x7fWQ\x03N\xa3\xb0\xc5'\xf8\x1e\
+\xe2\xef\x11W\xf8\xf0K\x0f\x83\x1f\x82\x98\x1b\xd8\xca\x87\
+MG\x1cv\xd1/\xe6C\x1f\x82/P\xf9\xbf\xa2\xd7\
+\x80\x856\xd3-\x13\xc1:\xeb\x22\xcc4\xc9\xbf\x01s\
+-\xe5:\xd3\xba5PU\x0ek\xa6\x1a\x1f\xef\x8b\x9c\
+7S\xce\x0a\x86\xf1\x8c\xbf-\xf49\xcfL\x0d\x10\xd6\
+\x91c\xc1h\xde\xd7\x87\xf8\x8fT\xe4ad\xca\xfd\xc6\
+\x1bs\xdfA\x03\xe6\x95\xf7\xa3,\xf0\x13G\x98r\xbc\
+\x06\x9fJ\x12\xff}\xd2\xf9}\x88)\x09\x0d\xc4c\x1a\
+\xf7\xe1\xbf\xff\x8eO\x14\x9bo\x05\x9aY\xbd\xef}I\
+u\x06\xca\xb9\xc3}\x8fxg/\x1e`\xfeC\xd2=\
+8\x9f\x19h\x0a\xdf\xf0t\x0a\xbe\xef\x15<\xfe2\xf9\
+\x06\x81\xdf:\xbd\xf7\xf4\x22\x03\xeba/\x14\xabNA\
+}\xbe\x0b6\xfb\x0f\x9c\x9eh\xb5\xdfC~.\x01\x88\
+\x01\x0c\xf0\xce\xef\xe2\xb0\xa6piwf\x9f\xf4\xf5\xdf\
+\xf6\xd6M\x0c,y\xfb\xc55g\xa9\xd5S`\xdd\xcb\
+\x9a\xf5\x11\x80\xd9\x99t\xf0\x1a%\xcd\xc0:\xc9\x0c\x0c\
+\xd4z\x83\xfdG}S\xe8\xd6\xa1\xd1\x8b\x84\xc9\xd7H\
+\xb3N\xa2u\xcdS\xe2\xe1\xe4\x02z\xe26\xb2\xdd\x03\
+\x01\x03\xba\xff\x1d\x0d\xef{\xd8C\xe0:\xe6\xa7\xe9\xdf\
+\xfd\xd5\xcc\xe8\xab\x12}\xc0\xa7\xb5N\x9d\xfc\xbb_\xe2\
+\x93\xa8_~w\x1d\xe5\x1a\x18,~\xeetZ\x8a>\
+0@\x0f\xe5\xf8\x7fF8\xff\xd2\xbc\x90P\x01\xaei\
+\x9f\x9e\x10\x0b\xf64\xe9\x84\x81$\xdb\x8c]b<\xcc\
+\x07\x1d\xa8Z\x85\x92\x17\xday\x7f\x1c\xd9\x9a\x9e\x17}\
+#\x99n\x1e\x00\xbf\xb5\xaf\x10(\xd2\xb2=U\xa0\xdd\
+\x03\x5cvx\xbf\x9e[\xea\x18\xb7h\xd7?\xe3}\xd8\
+ps\xd9\xff\xfb~~tC\x8c\x01\x9fg\x0f\x7f\xf8\
+\x07\x09\xd7\x1d~\xd3@\x16\x03m;C\xee[?\xac\
+\x8b\x97\xeb\x9d\xe7\xc7<\xc282P\xdf\x84\xac\xb3\xe9\
+\x85\xcc\xf6\x0a\xd8{\xbe\xdaw4\xc0\xf4\xf2\xdc1>\
+\xd4_z\xfa\xd8\xd7\xecYe \x81\xbbk|\xa1\x8e\
+o\xfe\x93\x89\xfb\xa1\x0f\xd1\x7fk\x00\xf0\xf8g\x0e\xbf\
+\xeeq\x068\x1eW\xd4>\xdbh-\xafO\xa2\xdd\x0c\
+\xe0zi\x07\xcd\x11M\xfc;sSH\xd5\xf9\xfca\
+\xa8\x1f[\x5c\xc9\xe74_N#\x83:.\x15\xc6\x06\
+\xcf\x06\xfar Q\xd7)\x1b\xb9\x07w\xd6\xe6\x1d\xbd\
+)\xa8NM\xce\x04\xfa7\xc9\xd5\xa4\xa3LV\x9d\xbf\
+\xceu\xc02\xd5\x06`87\xac\xd5A\xca=\xd0u\
+4\xe5\x06\xc8\x0bs\xcb\x87\x80\x15\xfep\xcf\xb8\x1e\x90\
+x\xa7p\xa2a\xdf\x05\x17\xae\xf7\xf0\xbecDB\x9f\
+\x0cT#:`\x0fe,?o\xcb\xc9{\x0a\xc5c\
+\xdf\x00x\x1e\x1b\xd1\x13\xac\x97\x00\x0aI\x84\x0fA\xb0\
+\xf0\xb4\x01I\x99IIDID\x94D\x99II\x99\
+D\x84\xda\xec\xff\xaf\xa1\x07\x0e4\xf0(\xd4\xb4?\xbd\
+\xa4\x94A_\xe5\x1f\xf4\x1f\x98\x01\x8c\x08x\xb5\x99\xa4\
+\xe9\xe55\xbe\xf0\x9f\xfb#xT\xac\x8f\x90\xb4\xfe?\
+\xe3\x00\xec\x00\xd4\x00_\x0b\xb5\x09\x86zz\x5cg}\
+\xb5\xc4\xb9z\xceie\x96w\xc5:w_\x1bm\xfd\
+d\xd5\xbc[I2\xc3\xdf\x0d-\xce9_\xbdW\xcc\
+\x8d6N\xfd$\xbf&\xce\xffW\x7f\xd7\x19\x05\xad\xca\
+\xd6\xaa\x95r\xbc\x10\xa9&\xd5\xc1n\x92\xa7\x9btS\
+Y\xe9l\xcb|\xaf\xb8\xc5s\xcd\xe2H\xc7\xac\x8a\xf8\
+\xfbp\xed\x9dvO\xdc{\xd3\xbf\xe7\xc8u\xb6\xdc\xf3\
+\xd6[\x1d\x85)\x1d\xa2\xd4\xb7\xe2B\xf7\xae_x\xf9\
+\xb2B\xb3`\xf2\x9b\x14\xb8r\xa5\x81\x13\xed\xa4@\x0b\
+0a\x18\x06\xc8\x80\x03\x18X\x92\xc4^.e\x89\xe1\
+\xc0\xc6\x94\x13\x18\x90\xf8\x9c\xc0\xee\xe9\x9cP\xf8\xf0|\
+\xd0\xe2}[@\xf0\x04\xc8A3\x1d\xde\xc7\x83\x87\x86\
+\xd8\xf1\xd1R\xa4\x00\x85\xc7\xf9\xe9b\xfaVP\x9c\xe6\
+)i^\x04An\xdf\xbb/\xc8e\xd0\xe6|\xff\xfd\
+x\xef\xfbu\xce\xd9_k}\x18S\xceiOuo\
+\xa3\x98$\xb5]n\xfc\xcb&0\xdb\x0e\x8bSe\xe9\
+\x88$\xa2!f\xb1F\x855l,\x10)\xcb\x22\x13\
+\xc6\x90\xa1P\xa2\x96\xe0\xd1u;\x00\xf4\xe81\xa0\xa7\
+Li\xc6D\xcf\x8f\x11qls\xe4\xe7\x82\x0d,G\
+ \xf7\xa8,7.\xf0(\xf9B\x03\xc3\x0e\x12\x16\xa7\
+#\xaf{sN+\x18\xa4\xe0\xd2E\x05\x81\x05I>\
+%\x0cN\x9f\xa8A\x92\xbf$\xc5\xb7bg\x01\x97\x06\
+,\xbe\x17\xa7\x14\xca\x1fy\xf8\x22y\xf5c[[\xb1\
+\xde[}\x97\xab\x90\x90Py/\xc6e\xad]\xd6\xf2\
+\x0d\xb3,\xd4Z\xdb\x10\xdb\xa2\xa2\x22\xabq\xcc\xbb^\
+}\xce\xdc\xab\xbb~\xf1^\x12\xbc\x9b.\xbb\xd6q^\
+\xce,Y5m\xb5\xabe{\xd3\x9ci\xe6\xf6\xab\xe4\
+\xa7\x85\xf5\xff\xea\xb2\x9fj\xba\xbb\x9b\xbf\xabG,\xdf\
+\xda}i{\xad\x18\x0c9\xad\xd2\xfa\xb5\x1f\x8b\xa9\x19\
+3f\x94\xa2\x0d\x19X\xa7\x97\xd1\x0a^\xe4\xb4\xfa\xc5\
+w\xc3\xf6\xf2\x985\xce\xfaM\x0ab^\xb5?6\xa6\
+\xbc\xbd\x1b61g\xb5\xcak\xa6\x0bk\x1a\xbd\xea\xfd\
+p\xa4\xd5\xb2\xfe\xfc\xb8\xa3L_\x16\xee\xbd\xb1\x7fu\
+\x1eg\xfb\x99\xd6\xba\xef~\x1a\xa7\xf4\xf7E\xbf\xbf\xbc\
+\x92\x88\xb9{\xa7H5k+\xa6\x952\xce\xa8o\xa7\
+\xfaW3\xc7:we\x99\x9e_\xf3\xbc\x7f}\x1a\xd3\
+\x94\xea\xd1\xc2\xc6\x7f\xb7\x0d\x1b\xafr\xe3\xae\xb7\xc8\x9d\
+\xdal\xbf\x82\x82\x82H\xac\xab\x9ar\xaf\xb6\x97U\x0f\
+uD\xbbn^\xd6\x07\xaf\xff\xad\xcf\xfb\xb2\x12\xbd/\
+mF\xb5\xcd\x91F&{\x97<\x9aO4\xea\x96\x9c\
+\xd4\xe4F\x19D\xf9\x0eU*u)\x9c\xdaHd\xd2\
+\xb6\x98\xed%\x93\x0e\x9b\xc0\xca\xfa2%\xad~q\x96\
+\xe3\xe5\xbc\xc2\xec_\xd6\xc3\x01\x9a\xb5,\xb2\x1a\xbf#\
+\x10\xfb%\xea\x86)\x8c\xab]\xd7!}2K|\xc3\
+\xd1f\xa4TL\xa9\x9a\xa2\xbd\x91\x1a\x8e#\xc3\x1c\x10\
+\xa5\xc1\xc0\x13(\x06\xee\x1d1tB\x90\xa4\xd4\xe1\x07\
+\xf8\xa3\x87\x09_\xe2\xf3\xa0w)\x0e 4\xd1N \
+\xf8\x00Yb\x0a\xe2\xd3\x81\x0a\xde\x88<\xf4\x90\x88B\
+'\x14\x91\x84J$8\xb0\xa1\x07\x954w\xfb\xad\x0d\
+\x91\x0f\x0e\x07x\x90`\xf8\x22c\xc8\x0d&9\x89\xdf\
+\x0c\xfdD\x10\x12\xa2\x09\x92 \x02\x8c\x173B\xc0\xa4\
+9\x00\xdc\xe0\xb2\x0e\x00\x22fFBB\x981\x13v\
+\x86\xf8\x9f3?FX-\x0dUG\x9f\x157\x18\x10\
+\x10\x90\x086\x95r\xee\xdc:~u^m-\xe7\x1a\
+\xfe\xf0\xcfo\xbb~q\xccvs\xce\xce\xda\xaec\x1c\
+\xbb\x1b\x97k\xadv\xa4\x96\xb5\xff\xcfB\xea\xd9/\xeb\
+&\xdfW\xbf\x19cJ\xa9\x1d'\xe6\xe7\x14\x7f\x98\x81\
+\xa2(\xd2\x9fi\x1d\xc3:\xde\xb6;b{\xce\x19\x87\
+\x14\xa83\xc6o83\x84A\x08\x06\x05\x82\xa1a\xa0\
+4\x8e\xb3\xea\x03\x03'\x12\x02\x8e\x22\x88 \x84\x80\xe1\
+\x10\x02\x06B\x08\x18\x12!@(\x82\x86B\x04\x86 \
+B\x8c1\xc6\x18\xd7\x07\x17hfMC?\x7f\x8d\x10\
+3d\xb0\xe5\xbe:=@\x87\xbd\xafs\xffY\xfd4\
+\xb3\xe7\xf3n5\x93\x9a\xfd\x1c\x94\x81~\x7f\xb5%\xae\
+x\x1b\x1a\x1b#\xa7_\x0f\xf0\xf4\xdd\x81\xe1\x9b2\xbe\
+\xae\x85\x1f\xcb\xe6\x18\xf7\xee\xdd\xf0K\x85:\xfb\x82'\
+\xa0\xda\xaa\xff\xce\xc3}n9@\x9a\x8e(\x08_\xc1\
+\x8f\x97/\xffx\xc6\xed\xf2G\xb9\xe1\xa8\xfc\x97\xd9a\
+\xbaq\xbf\xd2\xe7\xa3\xdf/\x07A}^k\xcf;\xf3\
+\x10\xc7)\xe3\xb8\xc0\x9b\xeb\xbc\x08\xc4\xbaqg\x06\x08\
+G\xee\x9d\x85CG \xf7\xa2lX\x19r\xa9\xa7\x0b\
+MO\x16\xf1}!0nh\x04Z\xb4\xc8\x98\xaa\x99\
+\x8ck\xe6c\x0e\xfc\xdf\x9d'\xaa56X\xd3\x8c^\
+\xf9\x94yi\x09F\xb2\x01\xf3\x86;\xddw\x83\xf2\x86\
+J\xd5\xec\xa1\xd2\xdf\xed\x88J|\x06n[\xd1R\xc9\
+C\xbdb\xc4\x16\x0fu\xa3\xcf\x99\x8a\x10\xe3V\x88\xa7\
+\xa9\x0a\xeb*E\xda\xd8\xd7\xa0\x14\x08:\xa4\x82\xfb\xc4\
+\xee\x01\x07\xf5}F\xb6\xfat\x86s\xf5\xd9_\xa1\x10\
+X4\x8d\xfe\xa3\x10\x9b\xe5\xd8\x9d\x1bM\x1e\x177\x0d\
+D\x97\x8b'\xbf\xd0\xde\xb7\xff\xec\x87B`\xe3\x86H\
+\xfb\x89\x85\xc2\x0b\x11\xf7\x0a6\xf8\x18\x1bD2ho\
+g1\xa1\x1b\xcc\x17I\x93\xcb\xcc\x1b\xb4\x97\x9a\xd6\x1f\
+\xa4\xc6\xd4\x13r\x833=a\x07i\xdd\xbcMn\xfc\
+\xd1\x8b\x1a\xa7\xc6\x16\xd4c9\xf1\xe1\xbf\x1b\xa4\xe5p\
+\xbf&\xd8\xce\xbe\x1d\xa5\x06i!\x0f\x83W\x8dIm\
+\xdcc)\x80\x0d\x9e\xeb\xfe3\xb8\xd3\x8f3\xcd\xba\x99\
+a\x83\xa4|m.G\xd7\x11\xde\xa3\x18=\xe5\xcc\xaa\
+\x06C\xdc\xbb\xc5\xd9\x93\xed\xf1\xdb\xba\xcd\x9e-\xbf\xa8\
+\x01P~>F\xed\xef>\x7fF\xe7y\xe2\x82\x1a\xf4\
+<w\xa7\x9f\xbd^\xdd:+\xffL>\xa4\x01\xad\xb7\
+\xda\x9d\x0d\x0f\xfc<H\x13\xb2\xcdXE\x83\x18\xb5\xc5\
+l\xdf\xdd\xd2K\xe7\xe9\xe8X\x985h\xb0\x92\xfa\xa3\
+\x9e\x86\xe6\xc0'zG?\x1a\xd6\xabQ\x8f\xde,P\
+7\x22\x95\xe2\xab\x99q^\xa9\x0cg\xf0Q\x13\xaa\xb5\
+\xa6\xf4\xd3\xae\xfda\xe2it\xfb0\x83\xd6\xdd%\xbd\
+0>p\xdfE\xf0\x16f0\xf1\x9d\xd1\xe9\xf3\xc4\xb6\
+9\xb1\xae\xbcY\xf1\x8b\xc6\x99\x01^\xca\xa0\x01x-\
+gm\x0a\x9d\xa5\xe1\x07\x0b(\xf5\xc6]\xf5\x15\xcd\xd1\
+v0\xe6\xe3\xe9!\x03\x02o\xe0\xaa\xf8X\xc8e\x00\
+\x82\xccR\xfc\xb0\x17E\xa4\xc7w\xfe\xcf\x1e\x81\x0c\x02\
+\x80\xdf\x9e:eC)\x0eN5\x99\xd6\x96V\x8f\xef\
+O\xa1\xde\x0a\xa7\xfa\x18\x83\x7f2[y\xec\xee\xc9\xb7\
+\xc7\xf3%\x0b\xf4\xf8\x94\x83\xb4~f\xc8\xc6\x18\xd4\xe8\
+\xb0\xb7\xe0#\xfc}\x83\xf6\xc6\x92u\xa7\xc7\x81\x93L\
+\xc0\x88\xc1\x08\xba\xb7o\xaa\xdf\xad\x16\x140Q\xab\x91\
+\xb1\xb7-\xc5\x91\x85\x9000qL\x16\xde\xba\x9f\xeb\
+\xb1?i\xc7A\x15\xbc\x1f\xc7\x80R\x1f\x0fzvk\
+\x870\x189\xe1F\x1f\xa8\xc1\xdb\x83\xdd\x9d\xd9/\x16\
+\x95\xf3\xb86T)S\xf8pH\x5cR\xc8\x00\x83\xac\
+\xb9 \xbb\x7f\x13|\xf7\x97\x1f.\x0b|\x06|=~\
+\xfc\xc4;5\x06W'\x8aw\x93\xd3](\xf9\xf7\xff\
+\x86\xfc$\xa91\x9c[\xe1\xd2\xfac\x0e\xff/;7\
+}\xb0\xf4qB\x07\x0d\x9b\x9ffk\xe6\x05\xf7\x9b\xb6\
+\xd7\xff\xd8\x00\xa1\x07\x19\xeb^7\xe5-n1\x07\x1a\
+>\x97\x81.\xb3K\x5cB\xff\x0d2\x8a\x0f\x0a\xeb\xcd\
+\xc1\xdao\xce\xf4\xa3\xe1\xe5\x1fs\x14\xfe\xcb<\x14\x0f\
+\xb2\xb5Y\xd4\xcef+~\xf7\x91Z\xfd\x12\xf5F:\
+\xb8\x18\x835\x0aD\x0fr\xab?\xf6\xcf\x8de\x12^\
+ \x84\x9a_\xd74\xaf\x0f\xd7$\xea\xb5\xc87Uc\
+~\xdbAs\xbd\x87-\xd8\xdd\xda\xf6\xbcS\xe6\x22K\
+\xf9p\xf8\x84M? )g\x07\xa7\xfa\xa3\xfc\xe2\x8b\
+\xe5\xee\x89\x87\x85y\xfe\x81\xe2cs\xf1\xd6\xa3Gv\
+p\x9e\x9c\x1c\xf0\x1ew\xbc'\xad.\xca\x83\xd7\xb9\x18\
+\xb4\xa0\xdb\xefy\xcd\xde\x82\x0e\x9aB\x9e|\xd7\xc1.\
+uOZ\xd0\x077\xffG\xbc&\x7f\x1c\xfcA\x07\xab\
+\xf1\xaa\xf7\xef\xa2=\x1c0{\x927\xb7cJ\x83\xe1\
+Q^\x8cc\xf5\xf9v'a\xc3\x92\x83\x15z\x0b\xbc\
+(vp\x90\xafs\x0c{\xdb\xa1\xb6\x93\xc0\xdc\xe1}\
+\xd4\xdf\xbb_\x06\xf0\xc5\x88\x85\xc7\x01b\x91\x83o\xc6\
+O\xe66\xaa\xdf\xa1\xdac\xe1l\xb7\x89>\xdc\xadk\
+UvH\xa8\x1fl]@\xe1\xa5-\xd9-\xd8\x85O\
+\xfbL\xe3\xe6\xfa\xc1\xf9\xbb\x9f\xef\xcbV\xbc1a\xde\
+#,kK\xfa\xd4D\xd0\xcf\x86\xe4X\xd0>\x7fK\
+\xcf\x9dh\xab\xde`a\xee\x050K\xd64J\x17l\
+\x92\xff\xf7\x0f\x102\xbbM\x87\xf0x{\xcd\x9d\x8d\xdc\
+\xbc3C\xbb!\xdd\xc7\xf98\x1f\x9f\xbdA\xb2GO\
+\xfda\x92\x82\xbf\xcb\xa6\x0f\xadT\xdd\xf1\xc4\xf3v&\
+\x18{4Y0\xfa\x8f\x0c\xff\xc3\xf2{\xd2\x05\x19w\
+0e\xe2\xa0\xf2x\xfd\xb3;\x94<o\xbd\xd0\x956\
+\xa1\xffI\xe4\xe6\x84\xde\x94\xc5;\xbfc{0t\x81\
+K\xe9\xe6\xd9\x8a\xc3\xf4\xdb+\x9e\x89\xbe\x92\x83\xfc\x03\
+\xf8\xf5\x90I\xed\xee}\xcd\x97]t\xe7\xf9\x91\xfbn\
+=\xddx\xb2K>\xbf\xf3\xd8\xe2\x0a\xdf\x8f\xb3n\xaa\
+\xbb\xac\x9bL\x7f_N\xe5\xf1q> \x9b?m\x8a\
+\xc7AS{\x9c\xff\x83\xac\xfc(\x93\xacH\xd5l6\
+\xbak\xd9\xd8\x04\x07\x99:\xe8\xda@\xe9C\x805\xf8\
+\xd3\xe5\xcd\x1erC\xban\x05\x9e\x0cX\x1b\x97\xef1\
+\xbd6\xf6r(\xfb\xe6\x0f\xa6\xf4\xb5\xad\xae\x0e\x82\xc1\
+3\x04\xc7\x0c\xe4AR\xfc\xe9\xf3\xf3\xde\xdc=\xfdk\
+\xe4C\xc0\xda\xdd\xab\xd3\xcd\xba\x03\xed\xe9\x15\x15\x12\xda\
+\xc1\xc9\x1a\x0d\xde\x82\xf1\xc6\x97*\xdd\x88\xefv\x12\x8f\
+Wi\x0e\xeb\xd8\x8f\x8d\x01#\xd2\xe6\xf3(\xdbM\xce\
+\xa6w\xa2\x83\xf5\xd3\x22\xc2\xf2\x0e\x8a\x19<\xff\xf1\xf2\
+-~\xc7\x80N\xbc{\xe5!`\xdb\x16\xde\x15\x1f\x17\
+LD\xb6\x0bf\xbf<\xe8\xe2=\xa5\xba\xff\xcf\xb7\x0e\
+\xdc{\xacM\xcf\xbbe\xa7\xaf`\x19\x7f\x0f\x7f\xd4\xbc\
+,\xdf\x7f\xe5\xc7i\x9c2\xaee\x0f\xb6\x81O\xdeH\
+\xfa\x92\x88/\x0c\xd5/\xa6`\x5cCF\x0866\x0d\
+\xde\xb0\xd3\x86:5\xa43T0\xed\xfe\xc5\x07\xb9\x97\
+\xcb\xb9\xe0\x0b\xbb\x17\x8e\x8c`e\x0b|\x9c\xad_\x18\
+\xd4\x9d\x9b\x06D\xf9\xc2\xe0\x03ae\xf0\xef\xc2S\xd4\
+IH`jk\xd8\x5cR\xa6g\x18D\xb7\xdf|*\
+\x19\x92P\xad\xae\xe0\xcb\xba\xf3#h\x90\x81\xccs&\
+q\xa8\x0a\xeb\xf0\x80\xc3i\xbaJ\xa18\xf1\xc4?T\
+\xe5\x120\xd0\x93I\xdbSJ\x15\x83\xccG7]\x7f\
+\xfa\xb5\x0e-\xaa\x1f\x5c\x0bBM\x5c\xab\x8c\xf6T[\
+\x05\xfdW\xe22\xc5\xe0\xf7\xfeU4\x82Z\xc3\xa1w\
+\xbfz\x15r\x09F\x00\x18J78\xee|\xfc\x94\xe0\
+_r7k\x10@\x0f\xc7\xa0\xff\xaa\xd7\xb3f\x8c\x8f\
+\x84\xcc\x8dd\xfae\x95C\x06\xcb\xc7\xae^\xd5\x04\xa8\
+E\x17s\xf7D(\x19\xfc\x1a|\x19\xe8\xc0\x13?\xaf\
+\x9b~m\xe9\xce'\xa5\x0cf<+\xd88\x85\xbd\x90\
+\xc6-\x84\x1eZ\x8f\xb8\xc1\x0c\x06\xb9\xec\xb3-l5\
+\x04\xf3\xc1\xf7\xdd\xd4i\x06\xed\xd1\xc1:#-\x8d\x8f\
+\xadg\x03\xc2\xd2\x1a\xe6\x0c\xf2\xcf\x1e>.\xb1]\xe4\
+\xbc\x17\xc8\xb3H\xa1G\x92\xdc\xe3\x9c.\xbc\x8c3\x11\
+\x0dOIA\x83\xc6\xe3\xeb-\xd66K\x1b\x99\x89\xd0\
+>`\xeaHI\x830\xc4O\x8d\xfed\xfd%\xfa\xcd\
+i\xfe\xff\xb3=\xd3\xa0\xf5c=,$l\xed\x8f(\
+\xf4\xd3d\x8f\x1a\xacFl\xae\xdf\xa7\xbdW\xd9\xfa\x06\
+{)x\xa8A\x80\x8fC.H\xab\x01Y\xff\xdf\x0c\
+o\x116\x15\x8a5\xd8\xee\x84\xe8\xdce/\xbb\x8a\xf6\
+%kF\xea\xe6\xf0a3\xa1u\xc8\xfc\xe7\xd4\xb9\xb7\
+V\x22\x97\xb1n\x82*v\x12\xd6RaL\xb4K\xbc\
+M\x9e\x84\xed\xa1*n\x94\xe1\xfe!\xb65/cA\
+\xe5\x99\xe7h\x9d\xc5O\xd8\xf1q%\xe1\xa4\xda\xd7-\
+\xeeiC\x02\xf0j3\xf0\x97\xdc\x9fc\x0cb\x88\xb3\
+\xa75Y\x9e\xb4\xee\xde\x06\xb9\x12\xf2\xd4\x11k\x0c\x0b\
+8\xdd\xf1h{-\xaa}1\x07\xfa\xde\x16\xf0\xed\xe3\
+@\x8dkX\xcd\x99\x86\xbd\xcb\x06\xcd\xf0YS\xac\x06\
+\xaa\x7f\xb5\xad\xcd\x03\x94\xfd\x12o\x1f\xf0\x14\xf9\x83\x02\
+f\xc9\x03\xff08\xb3l\xb8\x16\x9c_+\xe2\x0b[\
+\x93\x1f\x88\xb4\xa6\xf5\xd3\x81K\xde\xf6\x11_Q\x82\xca\
+x:\xdd\x9dWQK\x1e\xd5\xf982;0V\x84\
+\xb0+\xa3I\xc0\xc1\xa7\x84C\x8a\xe7\xbaZ\xa3\xcf\xa9\
+\xcaq\x1c\x11P\x7f\xc8\x02u\x12-\x861p\x91H\
+\x82\xd3\x16:Rh\x86'm\xc3L\xad\xea\xbf\xbce\
+\xca\xa4\x95\xb9\x8b\xd0\x87\x0cQ\xfb\x14`\x1b\x820\xf7\
+T\xe5;r\xeav\xfc\xd5q\xd9\xdf\xea\xbf\xe8nc\
+\x0d\xc2\x84\x94\x09\xdc\xf3#3)O2\x895e\xe8\
+\x18vf4\xdb\xf7~}\x02\x9fIt\x0c\x18\x117\
+6\xd7\x91\x0d\xcd\xc7p\xc9(b\x9d\x18C\xcb\x9d\xc4\
+\xbd\x84.nH~\x12.\xefG\x8c!\xa1\x11`\xf2\
+\x0e7~\xab\x17\xc2\xd4\x88\xe1\xafH\xf8I\xf7\x10A\
+N\xabK~R;!|\xbeA\xce9\x0f\xd1\xcb\xfd\
+\x1e\xc7\x9fL\x18\xd6g\xdd\x98\xb9\xff\xe8\xd0l\xf0~\
+\x0cm\xc5\x01#D\xfd\x1e\xee\x93\x7f|\x91yn\xdf\
+j\x90\xa1\x13\xc0p\xe5\xf6\xd3\x09\xf2\xbb\x8e\x1b\xce\xf8\
+\xe8\xd2\xc1\x1d\xd1\xfa\x10\x84c\xfb\xecY\xe0\x8d\xed\x8c\
+\xff\xbc\xa9#?iO\xe9W\xf6aQ}\x18Z=\
+\xd6\xf9\xca!\xbe\xdd\xe8\xbe\x8d\xcc\xe7\x1c\x97\x1a\xd7\xeb\
+\xb6\xe2C\xce_{\xad\xa31\x0a<\xdc\xee`\x01\x0d\
+\x88'\xd7S^\xde\x9bx\xacy\xc8\x97\xcf\xec\x93z\
+\xa3xT\xd2~jc\xe4KObm\x15\xa1\x91y\
+xq@\xed\xc3_\xb9\xf1\x9f\xb6W\xfd\xb8\xcc\xe7V\
+\x94\xce\xce\xf1\xb4S8Nx\xd8@\xf9\x0a.\x87>\
+~\xe3\xb1\xdf\x87\xad_\xa0\xf7\x8a\xd2\x93zk\x92\xbc\
+\xd9\xb6\xbbC\xa4\xfb\xe0_z\xe1\xcbO>\x89\xdf\xec\
+\xf1\xf9L\xc2\xd1\xad\x7f\xb8\x9e\xd9A\x80\xff\xc8lk\
+\x89\xdf\xab\xd2\xeb\xb7}\xaa\xf5\xb6\xc8Nn\xd6\xa9\xb8\
+5:\xf4\xe8\xc7\x83\x10\xfd\xda3{\x1as>\x9bw\
+-EZ\x0d\xb6\x86s\xe3\x1cz\xde\xddO\xbe\x1fn\
+\xf7\xda6`\xd0-+\xcb\xe76\xdcN\x5c\xa5\xe2\x90\
+\x8cq\x91\x8b\xad\x22\xdfH\xef9$\x0f\x80\xe2\xc9\x22\
+\xa8\x7f\xf7\xe7\xa98|\xbdO\xd4=\x09\x1c\xbcM_\
+\xb0 \x5cq\xc5\x93\x1b\xfc,\xf8\x82C5\xc8\x1f\xf7\
+;[]\xb4\xd9m\xf8X\x0a\xa5O\x81\xe9Wt\xfb\
+\x83J\xb9!\x00&IT\xb8\x8f\x12\xba\xe5\x9at\xf8\
+ \xcd\xb3\xe3\x95\x90\x97\x1b\x82\xbb\x941~\xec\xe9\xf3\
+\x9c\xb7~\xc9U\x1f$\x8f\xea\xcdVQ\xea\x18\xf5\xbb\
+\xbe\xc5\x86\xcb\xedA\xe0p\xc8\xdc>\x9c\x93?F%\
+\xf9\xa0.\xe2W\x8c\xabO\xf0^\xb35\xa0\xf5\x87\xdc\
+\xeb~|\xb5\x82\xd5=\x8e\xf0\xbd\xd3\xdb\xca\xf2\x83\x1a\
+\x08\x1f\xe3\xee9\xfd\xd40\x90\x97\x93\x0f\x1d\x874\xe8\
+9\xc9\xe2\xe4g\xe79\x86\xebL\x87\xbdMp\x19O\
+\x9c\xdc\x90CB\xc3\xc92v\xe8\x91\xf6Oo\x9d\x89\
+\xfd\xedw\xd4\xb1\x0bw\xe2R}\xf2\x9d9\xa6S\xb3\
+\x10G\x1aN\xff\x05\xa8\x0b\x81\xfa\xc47\xfa\xbdE\xfa\
+.T\x00\x97+\x02\x18\x8cpfY\xb1\x154\xc0\x7f\
+o\x86\xfa\xacd\xeb\xfd\xbf\x84\xfc\xed\xfe\x9ak2b\
+\x1a\xc4tkv\xc3\xc34\xacK0\xda\xc9o(\x96\
+a\x9c\xda\xcax\xa7\xd0\x9b\xdb\x93\xb8\x0dE>D\xe5\
+\xf3\xe5>\xaf\xf4\x17\xff\xb0\xfe\xd5\x94\x0d\xf3\x82z\x1f\
+H'\x0d\xb9:%\xc3&\x8ceZli\xd2\xed \
+\xbf\xc3\xe9\x0d\x1ed\x8b\x9b\x8c\x91y/g\xe0\x22\xe0\
+\xc2\xb4-2\xa7\xcb<Vk\xe8\x9fo:r\x0e\x8d\
+\x0b~\x8bl\xc1/\xeb\xb0\xc5\x00\xa0tC\xc8\xec\xc7\
+\xf6;.U7\x09\xbd1P9\xa1k5$#\xcf\
+\xa4\x83o\xd2\x1f\xc8\xbdw\x8a\x90\xef.\xe8\x0a\xfc~\
+pR\x02\xb4\xf3\xdd\x9f]\xbe\xc3h\xbd\x1fB\x8a\x0d\
+\x098\xd0\xe8\xb03\x06\xaf\x14:\xa0!\xfd\x1c\x80\xbf\
+\xb7\x87\xb5\xcf\x8d\xf7-\xe7\xc7z}\xc0\xfc\xfa,\x83\
+W\x91\xb5!\xb4\xef\x82\xe1\x9c\xcd\xea{\xa4\x13{\xaa\
+\x22\x97\xa9\x22m\xe9\xab\xdf\xdf'\x9f\x9f}D\x08\x15\
+\xfe\xac]\xc3\x1bR\xb6\xbcE\x7f\x94\x9b\x95><\xf4\
+\xf9\x81\xd5\xb9\xd1\x9c\x9cf\xf7\x9f\x89\xca\xe62\xebv\
+\x0aoX\xdb\xe0P.\xbb\x89\xde\xbel\xe2\xe6S7\
+\xbe\x5c\xfc\xc9\xd0?\x1f\xaffH\x9c\xd7H\x10\xf7R\
+\xe2j\xbb\x90>A\xbf0\xb8\xf6\xf7\xa4\xde'\x7f\xf8\
+'\xa2\xa3L\xc6\xe3\x89\xf9\x1e\xf0+\x92\x8eF\x9e\xdc\
+\xaa\x8b\x93\x03;\x5c\xeee\x05\xf0\xd9\x92\xce\xe6r\xc4\
+\xc3\xe4\x1dB\x91\xeb\xf1\xfd\xb1\xb6\x9b\xd6\xd0C\x11\xd5\
+\xa9\x81\x9d\x0c\x84\xda\xf2\x98\x07\x93\xca\xf3\xb9\x07\xcf\x9b\
+\xe8\xd59\x9a:\x0f\x8aR\x96\xf14?\xc0\xfa\x882\
+\xad:E\x1f2\x8b\xbc\xe4\xa11\xb1\x11\xde\xa6\x14\xd0\
+#\xda\x8d\xfb\xcbEFyh\xadM /\xf1$\x06\
+\xa3\xcf\xdch\xc0\x1a\xd9\xd9C\xed\xb7\x8e\xb7\x833\xf8\
+\xac-\xce\x1b\xb3\xac\x11e|({\xd8\x84'u\xe0\
+])\xdfxxS\x0f\xd68\xf1,\xf6i$\x84\xdc\
+c\xdc\x98\xe1\x0f\xf1o\x92\xfd$\xa0\xee7\xf0d\x82\
+\xdeha\x7f\x08j\x5c\xb3\x17\xb0\xe5.\xf0\x15QE\
+0\xee\x89\xfdE\x14O\xc6\x90\x10\xfe\xa9\xcd\xc4\xc2\xea\
+\x80m\xc3PBL\xa7|\xe7\xccL1\x96\xe2\xf2\xe8\
+\x99Q\xb5\xf6\xab\x0f\xf6Kx\xb7$\xbf\x8a!\xd2\xfc\
+\x10*\xcc\xc1\x03\x92of\xb5\x1cC\xea\xe8.f\xd3\
+\x0d\xe0\x7fb\xaf\x93\xf5Nd)\xa3\xd9/q\xe0\x1a\
+G\xca5zk\x09\xb3\x8d\xcd\x7f3&\xb4\x83\x18w\
+zQ\x93\xbe\xe7\xb6\x1d\xf9\x08\xb52\xd0u\xb7);\
+x\xad\x1f\x84!/\x0f\xbfP\x16`6\x9e\xdc3\xec\
+\xc3\xec\xa5\xa03H\xa1MiE\xb6\x80l$\xbdx\
+\x8f\x14\x00@\xa6?=\xcf\x0c\x14c\xab2\x1e\x81\x00\
+|\x88\xa5u\x1f\xc1\xf5\xfe*\xc1N\x9b\xebN\x8b\xb0\
+\x01\xd8\x8aU\x0a)m\x07\xc5\x01~\xa8!_\xbc\x8b\
+=\x8ar\xe8\x22\x85\xc5\x8d\xaf\xb6\xc2\xe1\xbf\x0d\x88&\
+\xb2\xe3q\xcb\x0c\xab}\xfb\xf6\xd7\x00'ne\x99\xa8\
+!\xbfq\xa9%\xda\xfeq\xbc\x18\xd7\x1e\x8f\x09\xf7\x92\
+?#I\xa1\x01\xb0u\xfd\xd7E\x86a\xdc\x10\xfa_\
+\x88Q\x82J7\xa1\xda\x8c1a\xde\x85\xf9Sf\x8e\
+/H\xf8Xa\x16\xe0\xbb\xbd_\xc3\xfe\x8f\x80\x8fu\
+\xd2u\x8a\x08\xa3\xfb\xf7C\xcc\x89\xbc\xa8\xff\xe8\x0e\x08\
+c\x19\xd2S\xc7\xf7\xfbM\xd7Z\xfcW\xf4G.\xb1\
+\x96\xb1\x9a\xea\xb3c<\x1e\xea\xb7%\x00\xce\x85<\xfb\
+\xdb\xbe\xe1\xc7\xe9\xd7\xa9p\xa1|\xfa+[\xa4cg\
+\xc2\xb7\xb2\xee\xe7\xca\x08\x1f\x83\xec\x01C[!k\xd7\
+z\x07/\x1f\xf6#=\xe2\xfe\xbbuez\x01\x80\xfa\
+\xf1\xe1\xec\x8f\xb5\xee\xa2\xe1Et!>\x1b\x9b\xfau\
+\xf8\x08\x1eM\xf8\x5c\xb1\xfb\xac\x040\x1d\x17k\xde\x22\
+\x94\xfe\xbf!;\xb8\xc1f\xc7N\xe1\x91\x9f\x8a[z\
+\x9d\xf8;\x18q\xb1}l'q.\x98\xd9\x9a\x08\x5c\
+2\x00\xa6WN\x1f\xa0o\xa4\xb6\xfa\xeb\xaf\xbf\xfe\xfa\
+k\xaf-\xb5\xda\xea\xaf\xbf_\x106\xf1\xff\xff\xff\xff\
+\xff\xff\xff\x05\x0aF\x00F\x00C\x00\x0c\xf7\x19m\xf6\
+TUm>\x9c\xb8\xf3\xab\x9c\x96\x9e\xb9\xf52g\xda\
+\xb8`\xf4\xa9o\x02\xc5\xe9\xbf)\x04Gh\xcf\xb6\x0e\
+K*;\x8d\x96|\x8d\xae\xcc\xc9\x92\xffU\xc7Z\xed\
+\xbam\xb3X\x95\x82\xcbL\xde\xa2\xdcE-\xbfW\xa4\
+\x06\xde\xa4\xfe\xc6\xfb\xf7]\x19x\x99\x8f\xe2\x9e\xba2\
+_\xbd\xc9A\xaf\xcc\xb65'\x1f*\xef\xf7.\xab\xfb\
+o\x1b\xb5\x0f\xeb9\xc7\xed\x12\xf2\xfe!}C2q\
+\x16\xc9\x11\xd6\x12\xa9j\xac\xb1\x0a\x9cm\x816\xc8\x5c\
+I\x03x\x22\x1c\xe2\x03\xdc\xd3\x1b^\x17\xcf\xd1\xeb\x1f\
+)\xc4\x82\xa5\xf3\xc5\xae\x85K\xd89\xaf\xb7\xbbO(\
+\xd5\xb1\xcc?\xd8\xb7P\xc3\xb8\xcf\xbb\xa8S\xeb[\xe8\
+\xd4b\xb2\xce\xbe\x85\xee\x0f\xd3\xac\x97\x9d\xdb\x83\xbd\x7f\
+\xfa\xf4tL\x9d\xaeK\xa1\xdb\xefN$\x7f\x1d7)\
+\xafc\x89K%\xc5\xa5\xd55\xcb\xc8\x8f\x97\xacq`\
+\xb7\xbb\x19Zu\x8c\xa9\xecV\x13\xb7r\xab\xd5L\xfb\
+\xb7\xe0Rh\xc1\xed\x12\xbb\xcc\x8d\xa3\xc3\xbd\x95\xbe\x9a\
+\x9f\xd7\x8f\xcf\xbd}\xe2\xb6\xc7\xb9\xa7\xd6\x95\x06\x82&\
+\xa8\xb2\xe2k\x0d2Q\x88 A\x10\x8a\xe5\x90\x92\xe2\
+\xf8\x01\x02tD@\x88\x90\x10!!BB\x84\xc4\x10\
+\x01AD@\x88\x90\x08\x18\x11!\x19!{=\xb0w\
+RG\x1cd\xc3\xd2\xdc\xcf\xa4>.\x9f\xd2\x7fS\xc0\
+G\x0c\x88\xff7\xd8\x19\x90\xff\x8a~Dg\x14\x0c\xa9\
+\xffr\xde1\xd0\x09t\xccG\xbc\x9e\xe5\x82%*3\
+:~F\xac\xb9>\xa1\xea\x86\x01\xf3\x12\x06$\xd0\x1f\
+\x91^\x7f\xdd\x17\xa3\xb9\xcd\xfch\xce_\x1a\xd7}n\
+\xa4\xf1\x04\x86\x07\xa1LbY\x1a\x9d\xde\x18 \x0c\xa8\
+;\xbb<R\xa64\x1e\x89q\x83p\x9c\xbc\xd9\xd1\xb0\
+*\xfc\xeb\xf9\x8e|\x83\xbe\xaa\xe5.>\xbd\x95\xfc\x80\
+f\xb3q\xbcB\x04\xb6\x82\x9b\xfb\xc6\x0bR\xbb3\xc0\
+\xe6|\xd2\x8f\x8d%h[M\xf6 -r\xb2\x99\x1f\
+\xe1\xcc\xe9\xa8\x01\x0f\x18 >\x8f\x84\xe8\xac1\xfa\x88\
+p^\xc7\x98\xae\xe04,{\xb3\xba\x820\xe3\xd9\xfe\
+\x88\xfe,\xe5\xbd\xc8\xddoj\x83\xd6\x98\x8f\xe38\x82\
+\x01e\x83\x8e\xf0\xd3Np\xbf\xe8\xadi\xfe+,?\
+&\x98+t\xaf2\x0c\xb2~\x04\xbbAH\xe1\xec\x16\
+\x1c\x9c\xfd\x89\x1d\x94?\xc7\xbe\x16A\x05\x03\x14\x86\xa9\
+\xa3\x17B\xb2\xe6\xd5\xb6\x99\xed9\xbd\x7fO\xaa\xed(\
+X\xe0\x84l\x9b-\xacZN\x96^>\xfea[~\
+\xf35\xc3\xcbc\x86a@\xf8.9\xfa\xa0\xb8\xbe\xbd\
+\x07\xb156\x03\xb0%\xe8\xb7\xa2\xce[w<=6\
+\x01\xf9\xd5\xfc\xfc\x81|\xd7\xdbY\xfep3xO\xa7\
+\x02\xf22\x06H>\xe8v\x0d\x22\xcf\xfcE\xe4\x85\x05\
+\x93[\x9b\xbe\xdc\x96\xe6\x91\xabE.\xdb\xa0\x0c\x8e\xc7\
+\x93\xe7Uf}\xb6\xa7\xd9\xa9\x18\xc0=(\xde\x94\xde\
+\x85\xd6p@'\xa0-\x12o+$A\xf7\xe1\x9f\x93\
+e\x05\xc7\x8f\x95\xd8\xa4\xd1/\xc0!\x18\x19\xbf\xb3\x17\
+g\x0c\x08\xbd\xd6\x19\xb9\x02r\x81_\xa7\x97\xf2\x19\xf8\
+6\x08\xc1\x130\xd0+^\x0f\xfa\xf9<\xc6\x9ak\xb3\
+b\xdf1\xc0\xf7\xc8<\xaf\xec6\xac\xca8\xa3~4\
+\xf6\x1f\xac\xffn\xde\xce\x98\xe0\x83*\xf6\xce\x14\xb6{\
+Q\x01?\xa3\x9e\x14\x221\x96Q\x06,\xdf\x15~\xff\
+\x86\xc8?\xdb\x8d\xccC\xf2\xccif\xddPb3\x0f\
+:s\x09\xe3\x80v\x9fF\xcb}\xd2*\x19\xe0\x89W\
+p\x8eA\x10\xd4|b\xf8\x9dN\xea\x03r\xcc\x09\x06\
+\x90\xdc\xa0\xfb\xdfP\x08\xc2\xa9\xa0g2\xa1\xd7\xec\x0f\
++\xfbb\x19 >\xe8\xf7,\xcc\x85fDQw\xb0\
+\x19\xe6\xe9\xe6\x9c\xdd\x0bJ>{Ix\x10\x83\x9dt\
+v\xaan.p(\x221\x03d\x9cg\xe4-/\x8d\
+\x80\xa3\x86,\xd1\x22\x80\xe6\x1e\x06\xd5~\x0f\x02'\x1e\
+\x9e\xd78\x1d|\xc5.\xdb%\xad\xd7\x0c\xb8\xd1\x17N\
+\xbeor\xff-Qq\x1f\x0c\xc0\xb92\xb5\xa3t(\
+\xce\x0e\xb5|\xf2\x86\xe6\xdb\x8c\xb1\xe0\xb0\x0fG~\xfd\
+\xb0<\x5c\x96\xf1\xe3\x19\x10Wz=rA\x9f\x88^\
+\xb3\xa0O3\x87z\xce\x91Y\xefA\xd4\x17}\xbe\xb1\
+\x97z\xad\xa2\xa45\x19\xd7\xdc\xe8\xa9rH\xa7\xae\x0a\
+/!\xfb\x1b\x1a\xf4=R\x9aS\xda\xfb\xa8@\x0fZ\
+vn\xf9]U\x88x\xa7\x98\x8b1\xdb4\x90\x96h\
+\x80\xc2zJ\xf3\xc6\xd0\xa4I\xea\x86 s\x0a\x18\xe3\
+\xff\xbc\xf8\xb6\xe4S\xf0\xdec6m\xe0mI3\xd7\
+\x00\xa5\x98\xc3O{\xd5n\xf7A\xb0\x06\xf0\xcc\xd8f\
+\xb9'\x81\x87\xcb6\xc0\xe3\xdd\x8b\xfd5\xf2@}X\
+n-\xf5\x1a\xbcz\xc4\x01\xcae\x82m\xa1\xffR\x02\
+\xc4?\xf5;R\xdf\x8d\xf3\xa4\xfb,\xf2\x9b\xd0\x07\xaf\
+j\xbf\xfc\xd2(x\x03\x22\x97\xf6Z\xe4\xdf@m+\
+p\x7fh\xf7\xb8s\x87\xe3\xf0'\x5c\xe5\xf8\xd1\xcc\xef\
+\xfc~-\xd0\xc0\x05\xf6\x9a\x12\x8d\x09_\x09V\xd1\xc4\
+q\xb9\xf3\x0at&\xf85ZqNR\x84\xa1\x1b\xb0\
+\xbe\x9a9\xff\xc8\x0e\x91\x94\xb8O\xce\xf4\x99W7\xa0\
+0qiL\x90\x0fr\x0a\xf4\xbf\xee\x83\xda\xf9)\xf0\
+\x0d\xa0\xd1/}{\xe1\xc0\x0e\x19\xd9\xfb\x88\x9f~a\
+\xdf\x00\xdfg0\xd3\x83\xde\xbc\x11\x8e\xbf\x07\x9b7E\
+\xc4\x01\xe2Kz\xd8\xbb\xd0\x8a\xbc\x87&*\xeb\x07\xb0\
+\x19\x8d\xc4\x01\xff\x0f\xec\xb9\x22\xcc\xb0\xfb\x10\xbf\xf5I\
+\xe3\x80\x9co\xc8\xa3\xf8\xa0\xa3\x04\xff+Z\x1f\x12\x94\
+\x03\xee\x90\xd3'\xbe\x14\x9e\xab\xee\x93\xe7\x83j5\x8d\
+*\x07l\xc3O\xe2\xb9o\xd0U\xe0\x7f\xde\xc7\xc7\x1a\
+\xe3\x91\x93\xa1\x03dGT6\xa8\x1c\xbf\x83\xf8]\xa0\
+g\x93<t\x80\xce\xc8\xdf\xfd\xa0\x07G\x7f\xfa\xd3\xd1\
+\x9b\xa0\xe7\xd2\x01\x10\xda\xa0R\xc0\xccD\xdd':\xbf\
+\x10d\x1dP\x87\xa4v4\x98o\x96X\x98\xe0\xb9\x85\
+3:\x09v\x00\xf9O\x95!&F\xa1\xe0?\xb7Q\
+\xf3\x006H;@y\xd0O\x8aP|{t\x97\xf4\
+\x9f(\xcf\xe6\x0e\xb8\xf8\xba=!\x0a\x88\x7f\xba\x87\xf3\
+U\xd8\x0e\xf5\x00\xcc\xd4\x85\x81g\xcaEg^\x80\x83\
+[\xb4\x82x\x80y\xd08\xccL\xbdA\xc4\x1c\x9an\
+P\xbb\xe2\x01\xb8\xdb\x8f\xf5AG\xdb\xd9x\xc6l\x1b\
+s&\x1f\xf4\xba(_\xec_\x91\xa91\xee\x98\xecC\
+`0\xfe\x8fG =\xe0\x09w\xed\xc2\x02\xdc\x18\x00\
+\xb3H\x19\xd1.\xb3\xf0\x92\xb1\x8f^\xe4F\xff\xaac\
+\xcf\x03\xb5\xaecw\x5c\xbdZ\xc6\xcaP#/\xcc\xf2\
+\x5c\xc6\xac\xbf\xc6\x1e\x07f!\xd7\xe9W[,\x88\xc9\
+\xfe2c}\xee\xadkb\xf5b\xd9\x17j\xdb\xf3t\
+\xa3(\xffU\x9c\x85r\xd8;\xca}\xabV\xbf\x13\x06\
+z\xdfw\x99\x95\x8f\xcb\xea\xfcV\xc9\xbf\xf7\xb0Q\xe4\
+\xae\xd4\xc2\xf0\x0b]\xde\x16\x81\x13\xa8\x01\xfe\x81\x14B\
+\x04\x84 B\x08t\x9a\xde\x01\x22\xcbBb\x88\xc0\x10\
+A\x11\x12\x01\x11N\x04\x85\x08\x09\xa1\x04\x13\x11\x91\x91\
+\x07\xa7\xeb\xb3\xc6PhAP\x8e\x1e\xeep\xc2\xb5%\
+\x0e\xe0U\x1d\x81L\xe4\x84\xfd\xddH\x13\x0b\xf4\x0c\x0f\
+\x0f\x1f$\x9c-\xb0\x05$\x0bq\xc0\x8e\x9d\x11F\x93\
+\xf7\x99\x17Z\x1doJ~H%\xcd\xe1\xbcW\x03\xec\
+u\xd1\xd07 +\xcd}\xe6\x16\x8b\xfej\x04\x7fO\
+\x8a\xff\xa0\xc9z\xee\x86\xc2B3\x99Z\xa3}\x15p\
+\xc0-\xfd\xf5_\x80u\xe7#\xfc\x7f?\xc7\x1f\x8eg\
+\xb2\x07\xbd\xa3e\xbc\xff\xba\xe4\x0d\xa8\x85C\xff\x14#\
+B{\xbeX\xf7\x91\x8b\x0d\x9a14\x85\x9ey\x9dX\
+?\xff\x80\xb8\x012\x88\xfeP\xe1\x08Ri:_>\
+B\x19\x13\x9e\xbcp\xb0B\xcf\xebB\x19n\x00\xd4\xfa\
+(\xa7[\xe4\xf7\x19\x96\x8b3\x02\x19'c\xc6\x86\x9b\
+\x83iE\xeb\x0a\x9f\x10\x0ex:\x07jI\x16\xb0\xe0\
+C\x0b\xac\xcf?-\xa9O<\xab<\xa8Vwz\xf4\
+^\x89.\xbe#\xb4\x01,\x7f\xe4\xd2\x02\x17\xad\xa3>\
+\x7f\xec\x850\x0c\x86\x07\xe1\xdfFv\xb9]\x08\x1b\xc0\
+\x02\x1f\xf4Ry\xd0\xebH\xd8\x06\x81<\x88\x1b@\xeb\
+=\xec\xc8\x1a\xb0\xcaOy\x95`{\xd0\x9dn\x0aU\
+\xdf\x03\xe4A\xa3)\x1f\xbf\xb7q}\x8aY\x805@\
+\xa5\xf5\xea\xdeZiG\x9a\xba\xb7O\x0d\x1e\xd4\x0e\xef\
+e\xd2\xdbS\xa3\x06\xa4\xb3\xaf\xc7vU\xe1\xf6\x87\xbe\
+\x86F\xff\x1f\xe5Ac\x08\xbd\xedu\xd2\x80 \x9d\xb8\
+fq\xca\xa0-\xa1E\xe7l\xad{EI\xdf\x0e\x8a\
+4\xe0yW\xf4H\xf7\x19\x1f\xe7\xfd\x0d\x02\xd9\xea\xc4\
+\xe7\x00g7\xdef)\x1a\xf0\xf3\xce%hcJ:\
+\x8eu\x0a\xf8\x02w\xdf\xfe\xeb\xd8\x9f+sK\xa0\x01\
+\xfdIrI`M\xe9y\x8e\x19+.C\x0b\xe6\xd7\
+\x06\xe5\xde6\xa73 \x8d\x5c\xeb\xfd\xdf\xee>\x8c\xe9\
+\x85\x1d\xb4\x036\xbc\xbcM\xce\xa3Xyd\x06\x5cw\
+5N\xcb\xacC%\xa7vM\x0eDO\xb8\xd1\xe6\x0a\
+\xf16<\xef\x81\x07\x22\xd72\xa0\x88\x9c%\xb2\xd3)\
+\xc4\xa5\x18\xca\xf0~\xfbT\xa8 \xe7\xe0\x07p\x952\
+`\xcc\x908\x8dD7@\xcf\xbf\x8e\x1ffZ\xfb\x01\
+\x1d]\x15\xb0^~\x14\xc7S\x06\x0cs\xdd\x8b\x04\xdf\
+P\xd4Q\x805\x14UJ\xcaU\x91C\xcb\xfe\x0ev\
+\xc8\x80\xa0\x88$\xafv\xfeR\xdd\xf7t`\xcc\xd5\xcc\
+\x03\xd5\x83\xb3T\xae\xcc_ni@\x06|\xfb.\xae\
+\xf0\x5c\x158\x0a\x04V\xaeJ\xf1\xf2x\xf2\x7f\xba\xdc\
+n2\x06tw\xde\x8fZ\xab\xe7<\x0b\xa3\xe0F\x9c\
+\xac\x8c\xfd{\x83\xf5\x82.\xb7\xfcw\xf0V\x0c\x10\xe0\
+\x5c}\x87\x1fK\xe4f\x87\xcd\xe9EE*\x01\x8c,\
+\x02\xde\xf5\xe6\xe7\xed\xff\xe8\xfa\xf6\xdd\xee\xfe\xe2\xfe\xe0\
+\xef\xe0\xfe\xdd\xfb\xdd\xe6\xe8\xe7\xfa\xdc\xdc\xfa\xee\xfe\xe1\
+\xfd\xdf\xf4\xf4\xf4\xef\xdf\xfd\xde\xfb\xe5\xe2\xe2\xe2\xe8\xe6\
+\xf9\xdd\xdb\xec\xfe\xe1\xec\xfd\xde\xde\xfe\xf3\xda\xf9\xe2\xe5\
+\xe8\xe5\xf2\xe8\xd5\xf4\xf6\xe0\xca\xe9\xfe\xe0\xc3\xfd\xd5\xe8\
+\xf0\xfe\x99i\xf0\xc4\xd3\xf4\xf3b/\xd9\xd8\xdd\xd4*\
+\x0a\x9b\xfe\x93\x08H\xe9B\x0d\xa1\x9d\x0b9\xdb\xd86\
+l\xf1h\x02\x8f\xf9\x8c\x0c\x9b\xf9\x97\x15\x8e\xf1\x8ak\
+\xda\xd8h\x0c7\x9e\xe9\xe8\x9c5\x0cD\x94\xd3\xf3\xf3\
+\xd5\x94B\x07*b\x9b\xc4\xe1\xf2\xf8\xf2\xe1\x9ab+\
+\x08\xf8\x1f\xf0\x0f\xe0\x07\xc0\x03\x80\x89PNG\x0d\x0a\
+\x1a\x0a\x0dIHDR\x00\x08\x04\xf6{`\xed\x00\x00\
+\x22<IDATx\xda\xed\x9di\x94\x14e\xba\xe7\
+\xff\x11\x91\xfb\xbeo\xb5B\xb1\x89\x08\xa2\x82\x8a(*\
+\xda\xe2r\x11D\x04\x81\x12p\x19\xfb\x9c>\xf7\x9e\x99\
+3\xf3\xed\xce\xdc3\xe7\xcc\xbd3s\xee\x99s\xfaC\
+\x8f}{\xfa\xb6\xb2/\x82(6\x82\xb8\xe0\x8266\
+\xa2\xa8\xc8&PEmY\xb9o\x95\x99\x95{\xc4|\
+\xa8F\x0b\xa8\xcaz3++3\x22\xb2~\x9f\xa8\xcc\
+\xc8\xe4\x8d\x88\x7f>\xf1\xbc\xcf\xfb<\xcfK\xa1t$\
+PC\x03#Z0\x133\xd1\x0c\x0b\xcc\xd0CR\xc6\
+7MR>yD\x11B\x10\xbd\xb8\x80\x8b\xe8E\x14\
+q\x0c\x22_\xea\xd7P%\x1e\xad\x86\x05\xcd\xb8\x13\x0b\
+1\x0fvH\xc1\x80\x01\x0d\x1aT\x89\xdf4\xc9x\xe1\
+\xc0\x81\x05\x8b\x02\xf2\xc8\xc1\x87\xef\xf15\xbeC/\x82\
+H\x80#\xff\x1a\xf2\xdbF\xc3\x82V\xdc\x89\x87q/\
+\x8c\x90\x82\x99\xbc\xe9\xbc\x81\x03\x87\x02r\x88\xe1\x14\x8e\
+\xe1$:\x11$\x15\x01\xd9-\xa4`\xc7\x5c<\x8c'\
+1\x05\x0a\xd0\x937\x9e\xa7p`\x91F\x07\x0e\xe3c\
+\x9c\x83\x9fD\x04$\xb7R\x8f;\xf1$\x9eB+\xa4\
+\x93\xb7^\x00p\xc8\xa2\x03\xef\xe1\x08N#>\xd6\xc1\
+c\xddP\x09\xa6c\x05\x9e\xc1\x1c(j}^\x93\x94\
+D\x1a\xdf\xe3m\x1c\xc2\x95\xe2\x8e!S\xf4K\xb4X\
+\x86\xff\x88\xf5h\x9b\xf4\xf1\x05\x87\x04\x8d\x98\x8fV$\
+\xd0\x8f\xdc\xe8\x87\x8d.\x00\x0aNl\xc2?\xe0\x01\xa8\
+k}.\x93\x94\x89\x0a30\x0b2\x5c\xc5\xe0h\x87\
+0\xa3\xbe\xde\x86\xff\x82\x8d\x981\x86\x8d\x98\x84\xdf0\
+pa6\x0c\xb8\x8c\xf8\xc8.\xe1\xc8\xb7W\x8a[\xf1\
+\x8fx\x06\xb6I\xa7O\xf0P\xd0a\x06\x5c\xb8\x8c0\
+\xd8\x9b\xdf\x1eI\x00R\xcc\xc5\x7f\xc7c\xd0M\xde~\
+Q@A\x89\xa9h\xc2\xf9\x91$p\xb3\x00\x18\xdc\x8a\
+\x7f\xc2#\xd0L\xde~\xd1@A\x86f4\xe2\x1cB\
+7>\x08\x98\x9b\x0e\x9d\x86\x7f\xc22hj=\xe6I\
+*\x0a\x05\x19\x9a`\xc5\xf7\x88^\xff\xc6\x8d\x02p\xe1\
+?c\xe5\xa4\xf1\x17!\x14dh\x84\x02\xdf!9\xfc\
+\xe5\xeb\x05\xa0\xc5+\xd8\x08\xeb\xe4\xed\x17%\x14\x94p\
+!\x89\xb3\xc8\xfe\xf2\xe2p\x01H\xb1\x0c\xbf\xc1\xf4\xc9\
+\xdb/Z(\xe8aE\x17:~\xf1\x04\x86\x0b`6\
+\xfe\x13\x16O\xce\xfbE\x0d\x05+\xa48\x83\xd0\xb5\x17\
+~\xb9\xddFl\xc4\xda\xc9\xa8\x9f\xe8a\xe0@\x18?\
+\x22s\xed\xcf!(\xdc\x8f\x7f\xc0\x94Z\x8fn\x92*\
+\xa0\x82\x0e\xe7\xd0=\xf4\x07\xfd\xb7\x17\x9dx\x12\xb3k\
+=\xb2I\xaa\xc4\x5c<\x01\xdb\xd0?\x87\x04\xc0`>\
+\x9e\x82\xac\xd6\xe3\x9a\xa4J(\xf0w\xb8m\xc8\xd9\x1f\
+\x12\x80\x1d\x8f\xa1\xa9\xd6\xa3\x9a\xa4\x8aL\xc1\x830\x03\
+C\x02\xa01\x0d\xcb&W\xfc\xeb\x0a\x19\x1e\xc7\x14P\
+C\x02\xd0\xe1>4\xd6\xe9\xec\x9f\x1di\x85\xac\x0e\xa0\
+0\x03\xf7B3$\x00+\x96\xd6\xe9\xf3?K\xfb\x98\
+\x00\x95\x1b\xff\x17\x09\x10\x05\x96\xc2\x02\xd0\x90\xa2\x15\xf3\
+~\x9e\x0d\xd4\x15\x8co\xce\x91{\x8ei\xa2\xb5\x1eG\
+mN\x1ew\xc2\x05\x86\x86\x16\xf7@]\x97\x0f\x80T\
+[\xefk\x86\xdf\xba\xe6F\x90\xaa\xf5Pj\x00\x05\x03\
+\x16@MC\x83\x85\xf5\xe9\x00*\xdd\xed\xa1Es\x17\
+\xcc^\x17\xb3\x84K\xa9\xa5\x11\x0dR,\x82\x8e\x86\x19\
+\xb7\xd4e\xfc?\xb6\xd8\xbd\xceA\xb7\xc0\xf6\xa4\xf1\x01\
+?\x9d\xa8\xf5pj\x80\x04\xb7BKc:Lu\xe8\
+\x01\xe4\x1b\xfa~\x8d\xa9\xcd\x90\x01-\xe6\x8dh\xf1\x97\
+^V)x(\xd8\xd0Hcv=>\x00\xa4\xd1\xa7\
+\xc3\x8f:`\x07\x00\x18\x1f2\xad\x88\xca\x07j=\xa6\
+\xaaCA\x8694f\xd4\xa1\x00rs\xba7\xcb\xb5\
+\xcd\xd7\xfe\xd4:7H\xe7\xb9Q\x7f\xd3A\x09f\xd1\
+h\xae;\x0f\x80\xd3\xf4\xbd\x90\xbe\xa3\x11\xca\x9f_\x91\
+\xdd\xee\xdc\x90\xd3\xfb\xea\xce\x15d\xe0\xa2\xe1\xa87\x01\
+P\xe9\xa5\xbe\xe74\xb4c\xf8k\xb4\xe5\x19\xe5\xd2\x00\
+\x9d\xa9\xf5\xd8\xaa\x0c\x0d+]w\x09\xa0\x9c\xeb\xf2K\
+pM\xbd\xc1\xf1\xa5\x1a\x9a7\xa1\xe9j\x9d\xd9\x00\x1a\
+\xd6\xba\xab\xf5g\xc2\xcfe\x1fr@{\xd3\x1b\xea\x87\
+\xac\xab\xb2\x92h\xad\xc7WU(\x18\xebM\x00\x85\x05\
+\xdd\x9b\x18\x8dk\xa4\xb74\xf6\x17pg7\x0a\xb5\x1e\
+b\x15\xa1 \xa9\xb3\x08\x80\xb6{\x037\xabe\x94\xa5\
+/\xe9\xac\x96\xf5\x94\xa6\xaf\xd6c\xac.\xf5e\x01\x92\
+O\xc4Vjd\xba\xd1\xde\x96k\x9e\x91/\x0b\x8f^\
+J-F\xea\xca\x02\xb4v\xb7\xc3\xd1T$\xee!q\
+4\xb5S-\xdd\xb5\x1eg5\xa9#\x01H\x03\xcfe\
+\x17\xdb\xe8\xa2\xadn\x18\xe5\x03\x96U\x19&P\xeb\xb1\
+V\x8f\xfa\x11@\xe6n\xdf:\x99\xde<\xc6\x19\xd3\x06\
+\xcb:\xc9]\xbe\xe1\xc5S\xe2\xa6n|\x00\x93\x7f]\
+~\x96\x83\xa0\xd5\x95\xe2V\xc7\xba\x8c\xde[\xeb\xf1V\
+\x8bz\xb1\x00\xd1G\xc3O\xe9\xe5:\x92C\x15\xfa\xe5\
+\xfaG\x22\x88\xd5z\xc8\xd5\xa1>\x04\xc0\xb6E\xd6\xd3\
+Mf\xc2e/i\xabm\x035%R\x1fQ\xc1\xba\
+\x10\x802\xb4*|\xbfq\x84\xe8\xdfhh\x1f0>\
+\x1d\x92\x05k=\xeejP\x0f\x02H\xcd\x0b?\xab3\
+XJ\xf0v(\x93e\x8dfn\x18\xe9Z\x0f}\xe2\
+\xa9\x03\x01X\x06\xda\x93\xf3u%v:U\xde\xa9\xdb\
+0`\x8a\xd6z\xec\x13\x8f\xe8\x05@\x0d<\xe0~\xc2\
+(\xb1\x96\xfa9\xa9\xed)\xd3}\x1ej\xcc^\xbbB\
+G\xec\xd3\xc0Bs\xb4]\xd2j(C\xe8L\x9b\xf1\
+\x05\xba1\x22\xf6\xca!\x91[\x00E|\x95\xf7a=\
+\x8ce}\xd8\xb4\xd4\xb0\xc2+\xf6\x5cAq\x0b w\
+\x8bw\xb5^\xe7(\xf7\xe3F\xc7Z\xdd,\x8f\xb8s\
+\x05E-\x00}hsr\x81\x1e\xf2\xb2\xbf@\xbeP\
+\xbf1\xa9\x0b\xd7\xfa<&\x12\x11\xfb\x00T\xfa\xc1\xfe\
+\xe5z\xc6>\x9e\xef\x908\x9e6,\xee\x87\x88s\x05\
+i\x94\xbaq\x94`h\xe8\xdb,i\x19o\xbbkj\
+\xaa\xf5E\xda\xe5\xae\xf5\xb9L\x1c\xa2}\x04\xd0\xd1\xd5\
+\xb1\x07\x8d \x8a\xfe\x17E\xbf\xd4\xfcl\x8c\x8e\xd6\xfa\
+|&\x0a\xb1\x0a\x80\xbb\xa3w\x9dBo\xab\xc4W\x19\
+\xac\xeb\xa5\xf3zk}B\x13\x85H}\x00U\xcf\x0b\
+\xb9\xdb\x1c\xe3p\xff\x86#\x9f\xe7h\xcf+E*\x01\
+qZ\x80\xcc\xb2\xd8r\x9d\x5c_\xa9\xaf\x93\x1bVh\
+\x1e\x0d\x8b3ID\x94\x02h\xea\xd8\xc86:*X\
+\xf3(ivn\xe2\x1a:k}^\x13\x81\x18\x05\x10\
+Z\xc9\xdegcT\x95\xfcJFu\xbfme\x01\x22\
+\x8c\x08\x88\xcf\x07`\x17z\xdb9s9\xd1\xffb\xd0\
+\x16\xc3\x86\xc2]\x1e\xf1%\x89\x88\xce\x02hz\xd7\xe6\
+f7\xa0\xa2\xbf\x7f\x00\x80jN\xe3\x9a\x82Zt\xae\
+\xa0\xd8\x04\x90\x5c\x1a\x7fZ\xad\x9a\x90\x9e\xe7j\xf5J\
+\xc5\xc3q\xb1\x95\x8d\x88K\x00\x5cS\x7f{\xae\xc5F\
+<\xfd\xe3\x90C\x86x\xc1W\xde\xeah\xcf7\x8a,\
+_XT\x02\x90D\x96\xa7\x1e\xb01\xc4\xb9\x7f\x85L\
+\xe8\x92\xff\xa7\x1cq\x938F\xbd\xc4\xfcd\x82\x89\xd4\
+\xfa<+\x89\x98\x9c\xc0\xcc\x5c\xff\x06\xc6J\xee\xfe\xb1\
+\xfe\xd0\xbf\x86\xfeg\xd8\x13\x22\xae\x08fl\xc6v\xe6\
+\xb6\x80\x98\x22\x02\x22\xb2\x00\xba\xe8\xda\xe4<+\xf9\x9e\
+'\x85\xf8g\xa1\xed-;\xa6\x1c\x0b\xe7\xc9\x13\xbf\xd4\
+\xf3\xadk\x92\xdah\xad\xcf\xb5r\x88G\x00\x89\xc5\x9e\
+\x95:%y\xeeO\xe6\xaaw'\xed\xb5\x85\xed\xbb\xa4\
+\x97=\xe4\x0b\xbe*\xc33\xda\xfb\xbc\xd7o\xbd&d\
+\xc4\x22\x00\xd6\x19y\x01\xd3\xac\x90\x92~ \x99\xd8\x9f\
+:n\x82\x12\x8a\x13\x96=\xb9x\x8cx\x86/\x9bn\
+\xd9H9E\x93+(\x12\x01\xc8\x92+<\x8f\x18@\
+\x1e\xfdO\xfd\xd0\xb7O\x9e\xb0\x03@\xca\xfa\xb6\xec\xb4\
+\x9b\xbc\x06\x80\xd2?\xa2[\xee\x91\x89\xc4\x06\x88C\x00\
+\xb9i=\xeb4f;\xb1C\xcb\x86\x82[\x993\xce\
+\xbf\xf5G\xa3\xcf\xbb\xb6H\x02^bW\x90\xb2\xd8\xd6\
+\xeb\xa6\xf5\x8b#WP\x14\x02\xd0$6\xa5\x16\x1a\x86\
+\xf5\xfd\x1b\x83B\xea\xa3\xe0a9k\xb8\xf67\xa7;\
+\xa28\x12\xca\x93\x87x\x94\x0b\xb5\x1b\xe3\x1aQ\xf4\x17\
+\x16\xc14\x90\xca\xdc{i\x85^F\x9e\xfb\x9b\xef\xed\
+\xda!\xedo\x19\xfeR\xa0u\x97\xa2\xbb\x8b\xbc_\xb0\
+\xdc\xb1\xc2t\xefUJ\x04\xd3A\x11X\x00\xb3\xefE\
+u\x9b\x95\xfcL2\xd1\xdd\xf9\xcfL74\x8a\x92~\
+a\xd9\xc1\xa5\xc9W\xfb\xe8i\xa6Mr\x93\xbf\xd6\xe7\
+>~\x04/\x00:\xb1\xba\xffQ\x0dm \xfe@\xf6\
+t\xcf>\xe9\xa0\xf3\xc6\x97\xd3\xf6\x03\xd2S}\xe4\xd3\
+A\xda\xf0+\xcd\xb3\x1eZ\xf0\xae\xa0\xd0\x05\xc0M\xef\
+|^g.\xa1\xf4#\xea\xd9\x22;\xdb4\xc2\x83\x8f\
+:\xdf\xf4:\x13)a\xb5\xcf\xecx^7\xbd\xab\xd6\
+\x17`\xbc\x08\xdc\x07\x90\xfb^\xce.0\x95P\xf9\x1b\
+;\x12>\xa2.hFz\x8bU\x1f\xd5\x1d\x8a!J\
+\xfaU\x94|\xa1\xfe\xc5\x8c\x5c\xe0\x8f\x01a[\x80\xdc\
+\x92\xbe\xe5z\x05y\xe5/w\xa5\x7f\x9b\xb4\xdf5\x8a\
+\xe8)\x7f\xc3v\xf9%7y\x88Gi}\xda\xb0D\
+\xe0\xd3AA\x0b\xc0\xda\xf5\xa2d\xaa\x8d\xbc\xdby\xc1\
+\xb3/\xf3W\x1b7\xea\x16y\x9c\xf4\xa4mo:\xdf\
+O<\x00\xa6\xcd\xbc\x89\xb1\xf4\xd4\xfa:\x8c\x07!?\
+\x02\xa2\xab\x12\x0f\x99%\xe4\x8d_R_F\xf6\xaa\x07\
+LE\xce\x98J\x98\xf6\xe9\x8e\x87\xc9#\xfd\x12\xed\xc3\
+\x86\x95q!7\x94\x12\xb0\x05\x98\xd3\xbfNf\x1d\xab\
+\xef\xdf0B\xbe\x9d\xb9\x9flc\xe4\x0aK.\xd9v\
+\xe6\x83\xe4I\x1f\xb4\xcd\xbc^2[\xc0\xa5c\x82\x15\
+\x80\xbcg}z\xbe\x8d\x22\x8e\xfe!x4\xf6\x81%\
+;\xa6\xbd\xc8i?\xb4\xbd\x1f\x07q\xafPJy\x87\
+}]V&\xd8\x16\xd3B\x15@fI|\x85FC\
+\xbe\xd9E\xe1Bl\x87\xb4\xd7Hp\xbe\xb4\xdb\xb0\x83\
+\xb9\x10%_\x19\xd0\xea\x9e\xd1,\x89\x0b\xb5\x82X\xa0\
+>\x80\xa3wS\xaa\xcdJ^\xfa\x95\xf5\xbc\x1b=i\
+!L\x16\xd1\x9c\xb2\x1d\x8ce=\xc4\x83\x91\xb7Y\xda\
+\x07m\x02\xb5\x01\xc2\xb4\x00\xe1e\xa9%\x0e)y\xe5\
+o\xf2\xab\xe4^c\xd4@zx\xd4\xb8\xd7xb\x00\
+\xc4\x8b=2\xcd\xc3\xb6\xc7\x06!\xc8\x5cA!\x0a\x80\
+\xbd5\xbc\x89u\xe9\xc9\xa7\x7f\x81\xf0\x9e\xc1\x0b\xfa\x12\
+vH\x97]\xd0\xedI\x06B\xc4\xc7K\x1a\xf4\x9b\xf3\
+\xb7\x04\x85\x98$\x22@\x01(}\xcfF\xe6;\xc9\xfb\
+~r\x91c\xe1\xf7\xadYs)\xffG\xcer\xd4\xf1\
+I\xb8\x84\xdf\xb4\xee\x8e\x86g\x06\x14\x02\x8c\x0a\x0aO\
+\x00\xe9\xbb\xa3\xcf\xe9u\xe4\xe6?w%\xbaC\xdaS\
+j\xa50\xd5\xa3\xdf.\xb9\x12\x22\x8f\xf2\xe9\xb5k\xd5\
+\x0b\x22\xc2\xeb-*4'\x90\xb3\x06^L\xcc\xb4\x90\
+G\xff\xd3\xd1w\x22\x7f1\x95\xd0'\xf8\x1a\xba\xbfX\
+\xde\x89\xa6\xc9m\x80r\xa6ms\xd2\x12\x14Z\xf5\xa0\
+\xc0,\x00\x93\xfcU`\xa9\x8d1\x10\x7f \xf3]`\
+\xaf.V\x92\xf9\xbfF\xcc\xb2[\xf7\xbd\x8f\xfc7-\
+5\xfc\xca\xba\xd4O\x0b\xactLX\x02\xc8O\xe9\x7f\
+Y\xe2\x22\x8f\xfe\xb1\x11\xdf\xf6\xdcY\x13y\xae\xf0u\
+H\xcf\x9avdc~b\xd7\x8en0\xbdL7\xf7\
+\x0bk\xe39A\x09@\x91X\x17\xbd\xcb\x06\x0d\xe9\xf1\
+\x85\xf4\x07\xe1C\x86\x9c\xa9\xdc\xff/o\xf9\xb3\xe1#\
+?K\x5c:\x06\xedB\xdb\xda\x90\x5cP\xfd\x85\x85$\
+\x80\xdc\x1d\x1dk\xf4Ypwm\x97\xb8\xc7\xd5(\xaa\
+\xcf\xb1M\xda\xdfE\xfe\x9b\xd6\x99\xd7\xe9o\xef\x14\xd2\
+\x02\xb1p\x04\xc0\xe9\x02\xaf03l\xe4\xb3\xf9lt\
+G\xee\x0b+\x88\xa8?\xb7\xed\xc8\xe4\xc8s\x05\xe5\xb3\
+\x1c\xaf\xd0Z\x01\xb9\x82\x82\x11\x00\x9d[\xde\xbdL/\
+!\x9f\xce\x15\xbe\xed\xdd/OX\xc6\xfb\xff\xc6\xad\xfb\
+e?\x94\xb0\xa1\xacT\xff\xb8\xf6\x89NZ06@\
+(\x02\xe0\x5c\x177\xealv\xf2\xf1&\xba\xde\x90\x9c\
+o$\x8f\x16\x8e\x8a\xe4\x5c\xd3\xeb\xd2\xc1.\xe2\xe3i\
+\x87c\xb3\xc1qY(6@ q\x00I\xec\xa5\xf4\
+=\x06\x9a\xdc\x9c'\x0f&\x8ehr\x15i\x14\x93\xd5\
+\xbe\xa7:\x1c!\xef\x0cB\xab\x16\xe96\x0d0\x02q\
+\x05\x85a\x01\xd8\xbb.<\xab\xd7\x90\xf7\xfd\xe5\xba;\
+v1>g\x85\xce\x8e\xf64\xed\x90\xf5\x93\xff\xa6)\
+\x8dc\xb5i\xfe\x05a\xac\x0c\x08B\x00\xaa\xbe\x17\x95\
+\xd3\xad\xe4}\xffX\xffv\xfa\x84\xbd@\xbe\xf83\x06\
+\x05\xf9q\xebv\x8e#\x8e\xf4S\x92[\xac\xaf(\x84\
+\xd1[\x94\x06\xc5\xfb\x87\xc0\xe0\xca\xfe'\xb5r\xf2\xe4\
+\x8f\xccW\xdew\xa4\x03\x86\x0a\x9e\x17\x153\xef\x97\x9e\
+r\x13O\xef(\xb9\xee\x09\xf5r\x0f\xc8#\x085C\
+\x00\x16\xa0\xa9c\x83\xda^B\xdf\xcfX\xdfv\xea\xbc\
+\xb3\xcc\xc8\xce7nc\x92\xe4\xbfi\x89\xd3\xb9A-\
+\x84\xde\xa2\xbc\x17\x00\xedkO\xdfkd\xc8\xdd\xbf\xc8\
+\x91\xc4Q}\xa6\xe2}\x02\xd3\xea#\xda\xa31\xf2\xfc\
+_F\xb1\xd8\xb0~\x90\xe2\xfd>\xe4|\x17@n\x81\
+{\xb5JO^\xfa\xc9^\xf1\xef\x94\xf4\x95\xe0/\x10\
+#\xe9\xb5o\x97ty\x89];\xc6`{N\xb3\xa0\
+\x9f\xbc\xe2\xb86\xf0\x5c\x00\xba\xbeM\x85[J\x88\xfe\
+\xe5\xfd\x07R_Y\xd8\xf1E\xffF\xa1\xa0\xfa\xd2|\
+0\xc1\x92'}\xc8o\xb5n\xccjx\xee\x0a\xf2;\
+\x0e\x10}4\xfc\x84QN\xee\xce%O\x86\xf6i\x22\
+\x95t\xff\x86C\x85M{4\xdf\x84\xc8#\x02\x0a\xfd\
+\x93\xc6G\xa2\xe0\xf5\xc6s\xbc\xb6\x00-\x81\xcd\x5cc\
+\x09\x8d\x9fB\x91]\xd9s\xa6\x0am\x131\x12\x8a3\
+\xa6\xdd\x831\xf2\x5cAi\x93us\xa1\x99\xd7\x89b\
+<\x16\x00\xe3}&\xb8\xc8I\x93\xe7\xf2\x84?\xf7\xbd\
+o\xca\x18&rLi\xd3{\xd6\xe3\x01Z\xbb\xd8\xb9\
+\x22\xc4\xf8\xe3\x83\xbf\x8f\x80\xec\xdc\xf0z\xb5\x91\xa4\x94\
+c\x88|\xc7\xc0\x16E\x97i\x82%\xcdt\x9a\xb6\xc8\
+\xbab\xc4\x8bC\xb4\xc9\xd8\xae\x9e\x1b\xe5ooQ\xde\
+Z\x00\x9d\x7fsp\x8e\x83\xbc\xed{&z\xc8\x7f\xc2\
+PF\xee_\x89p\xba/\x0cG=y\xd5\x1c\xdb\x0b\
+~-o\xa7\x83|\x15@|\x91\xe7)\x97\x9c\xbc\xef\
+g\xfa\xac\x7f\x979\x5c\xf2\x1e\xe1\xe5\x10\xb4n5\x9f\
++!WPa\x5c\xee\xba\xc7K^fR]\xf8)\
+\xf8M\xb6\x95<\x97\x8f\x8bE\xb6\xa5\xce\xe8J(\xfd\
+\x18\x0f\xf2\xefu;\xe2qr\x1b \x9db\xfcM\xc6\
+\xc9\xd3\xb2\x11^\x0a\x80\x19X\xde}o\x0bE\x9c\xfc\
+\xc5%\x8f\xf7\xbeg\xc9V\xe5\xf7\x0f\x00\x19\xfb\xbb\xf6\
+\xafz\xc9\xbb\x08P\xa6\xc5-\x7f\xd7#\xe1\xe5t\x90\
+\x8fN`~z\xcf\xcbF3\xb9\xf9g\xfb\xbd\xff\xae\
+\xbcZv\xeag\x19PWL\xffO\xe6\xf3\x90\xff\xa6\
+\xcd\x86\x97u\xd3\xfb\xf8\x98/\xccC\x0b\xa0\x08\xbe\x1a\
+\x9a\xe3$o\xfb\x9e\x8f\xee\x0f\x7fi\x9ex\xf7\xef:\
+\xf4\xc7\xado\x87\x0b\xf5\x9c\x86W\xa2\xca`U\xc7H\
+\x04\xff\x04\x90[|\xe5\xe9\xef\x99=\xdb\xb3\xd3\x10\xa9\
+\x9a\xd0\xba]\xf7SW\x09\x0d\xa5\x8cO;\x16u\xf0\
+/_\x98w\x020\x5c\xfe{\xa6\xd9F\x1e\xfdK\xf7\
+\xbc\xce\x9d\xb3Tx\xf1\x97\x04\xd9\x0f\xe67\xf2Y\xf2\
+\xe60\x92\x16\xcb\xdf3\xc6\xabU\x1f\xe7\x18\xf0L\x00\
+T\xe2y\xef}.\x86\xbc\xf43}$t\xc8\x98&\
+\xf7\x17\xae\x87\xa52\xc8\x96\x9b\xbe\x992\x1f4~\xec\
+%\xef\x0c\xc2\xe8\xees\xae\xf1R<+\x1d\xe3\x99\x00\
+\xa6\x9f\xd9l2\x95\xd0\xf7\xd7we\x9b\xac\x8f<W\
+\xf0\x06\x14\x89)\x7fm<\xc1\x94\xeb\x9d\xd3\xdd\xf6-\
+\xb2\xf0\x15\xf2\xe3\xcd\x96M\x86i?V\xf2z\x8d\x1f\
+^\x09\x80q\xbfJ\xdd\xea*\xa1\xf1S`{\xe1\x0b\
+[\xa1\xdc\xc5\xdf|s\xf4_r\xff<\xe8\x0c\x96\xeb\
+\x9d\xe7\xd5\x9f\xd9vdA\xec\xdaQ\xca9\xce_S\
+\x0c\xafz\x8a\xf1i\x1a\x98_ze\x85^E\xbe\x98\
+\xcb~\xe3\xde/+\x7f\xf1W\x15{\xda\xbf|\xda\xca\
+\xa9O\xf4I\xcb\xdd\x13\x98\x0a\x19\xf7I\xcf\x91\xaf\xf8\
+Sj\xfd\x0a\xed\xd2N>M\x07yd\x01\xb4g_\
+V6\xb9\xea\xd8\x81s\xce\xb2\x17\x7fS\xb7yWk\
+T\x0d\xba\xe6\x0d\xfaY\xder\x1b;p\x8a3\x0d[\
+\xe9<y\xee\x9f\xac\xb1\xe1%\x8d\xeeB%\xaf\xdb\xf8\
+\xe0\x8f\x00b\xeb\xa4\xc4\x95\xbfH\x1eJ\x1d\xd2\x0f\x96\
+\xbbI,g\x1d\xd8\x98_`\x80\x14\xaa\xfb\x0c\xedq\
+}\xd9\x0d\x9e\x12\xea?\xab>\x1c \xcf\xff\x95\xa9\x1e\
+\xd2?\x1f\x07o\xcaF\xf8\x22\x00n\xda\xb9v\x85\xc9\
+E\x9e\xcb\xe7\xe9\xda\xc3\xf6\x95\x90,r=Lr\xa9\
+{\xb9\x1a\x0e\x00\xa0[V\x19\x17\xf7Q\xe5.\xd6\xc8\
+\xba\x9c\xbb\x10\x22\x9f\xdeI\xcc\xcev\xe5\xcc\x8b|)\
+\x1d\xe3\x89\x0f\xc0\xf4n\xc4\xedN\x9a\xbc\xed\xbb\x7f\x1f\
+\xfb\xb9\xb3\xec\xd2\xaf\xc2\x94\xe0\x06e\xc3\xb5]\x06\xa8\
+\xa9\xce\xcd\xd2F\xf2F\x107\x90U~l\xdb\x97#\
+\xef-J\xcbow\xbc\x00\x09O\xfa\x0a\xf2\xc3\x02\xa4\
+\x96\xb8\xd7\xaa\xd5\xe4\x9d?2\xa7\x03o2A]\xb9\
+\xa3W\xc7\x9e\x8f.\xd5\x0ek4aX\xa6]\x15\x90\
+\x97\xdb\xf2\x99\xf1\x1b\xf6Rg}\xc4Q>Zm|\
+N\xfe@??\x1aJ\xf1B\x00\xc6\xae\xcdlK3\
+y\xe3\xa7\x84oW\xe6\x07G\xd9\x95\xff\xf9\x05\xbe5\
+j\x85k\xf8K\xea\xe6\xf5\xea\xb9\xee\xb2S\xb8U\xa7\
+\x1b\xf6f\xd3\xe4\x89_\xf2\xe6\xa6\x17\x0a\xfa\xae\xf1^\
+\xb7J\xc0\x07\x01\x84\x17\xb8\x97*\xa4\xe4\xe6<~2\
+\xf6\x9eq\xb0\xec\xc5\x1f\xbbwSa\xf6\x8d\xc1&\xe9\
+\x1d\xb6M\x19\x03y{\xd8\x1bHh\xde\xd5~\x1b%\
+_ \x96i~e~(J\xbe;\xc9\xc4\xc1\x07\x01\
+ \x19\xe3\x22\xa5\xcc\x8dY\x9ac\xca\xf5]\xe8\xe4\x93\
+\xb1't\x94\xe1\xa6\xd7m+\xf4\x8f\x06\xc9S\xbeo\
+\x84\xe3\xb8R\xdc:Z\xa2R\xc9\xf8\x90\x22\xc2\x07\x01\
+\x98\xben8\x1c\xc9\x91'[k\x17\xea\x1e\x8f(\xcb\
+\xf4\xdag{\xdai\xab}\xa4w\x5c\xce\x171\xb5\xcc\
+\xdd?\xd4\x89\xa7bw\xeaKX\xc2\xce|\x15\xf9B\
+\x87j\xe60\x8c\x02\x1f\x04\x80\xdcm\x7fTvu\x92\
+\xff\xfa\xf4\xb6u\xd29e\x05o\x14\x9e\xb5\xa9\x85\xa3\
+u\x19W/v\xacIK\xcb\xc9\xe2\x1f\x9c\xeb^\xab\
+P\x92\xef]\x96\xf3\xf4\xef`{]\xc4\xc7O \xbc\
+\x10\x00\xd4\xdf\xcc\xd8\x93I\x06\x88M\xa2|\xa1yu\
+\xde\x14/y.\x9d_\x12\x7fV\xa92\x8c\xf6\xb6\xc6\
+\xbcNz\x8f\xbf\xe4@-k\x8e\xadao'/`\
+\xe3R\xc9wSGL\xe4\x19\xcf\x13\x09\xcd\x93\x80\xc4\
+\xf4\xed\xd2\xb3n\x8e8\x9eF\xd9\xd6\xd0\x8b\xbd\x92\x12\
+\x9f\x8d\xe96{\x91`\x93lF\xc3\x0bYSWi\
+\xdf*I-\xf1\xad\x96\xc2Nz<\x97\xbd\xe8\xd9\x99\
+\x1fl\xac\xcc\x85\x1b/\xfc\xb0\x00\x00\xd5q\xdb\xf6t\
+\x84|\x22F57=G9C%M\xdcbOf\
+\x1f\xb6J\x8a>\xa7e\x9a\xc7M\xcb\xd2%U\xf3\xe5\
+\x1b\xfckhW\x0b\xf1\xf1l4\xfcf\xf6\xe4\x14\xbe\
+\x5cy\x9e\x0c\x03\x80e\xa7\xfax0O\xee\xdaiW\
+J\x96\x85\x15\xe46\x80\x9b\xef\x7f!o\xd7\x8fq\xc6\
+\x12\x97esvV\x09\xd3A\xe5\xe0\xe3\x03\xcb\xe5\xe4\
+\xddK\xf3\xe9\x93\x91]\x0c\x0c\x95\xbbp\xe3\x83?\x02\
+\xc0\xc0\xfc?\x0d\xf6\xf7\x91\x17Q\xa9\xa6\xadg\xdb\xdc\
+\xa4\xc7\xab\xfaW\xa5\xe69\xc7~\xeeR\xea\xbb\x1aV\
+\xa6e\xa4\x12\xc8Ns\xaf/(\xa6\x11\x9fd\xde\xe7\
+\xdd\x1e\xef\x9bY\xd9+7\x1ex$\x00\xc8\x8eN9\
+\x14IG\x89\xbd\x12\xc9\x12\xf3\x8a\x84\x86\xec\xf8\xd4\x92\
+\xc4*\xb5\x96\xe4wJ\x19\xb4\xcfK\x17E\x89R\xbd\
+8mlEzq\x09[W\xa6\x13G\x13\x07+\xdd\
+\xbef\x5c\xf0\xc5\x09\x04\x00\x14\xda\xfe\x0d\x17=%L\
+\xefZ6\xb1\xf3\xfa\x08\x8e\xe7\x1a}\xed\xe9\xe9f\xc2\
+\xdc\x01\xe5,\xe7\x86\xb4\x8d`\xef@*3\xdf\xb3\x91\
+\x05\xb9;\x97\xb9\xec\xffc6\xd5\x5c\xf9+W>|\
+\xb2\x00\x00\xce\xcf\xdd\x19\x8e\x96\xd0iw\xda\xd4\xe7\x22\
+z\xf7X\xc7Kb\x8f'\x1e\xb2\x90\xa7\x9aJ\xb5\xcb\
+\x8c\xbf\x8a\xd1c-\x0eq\x06\xdf\xb3\x89\xb6\xa9\xe4g\
+\x17\x8b\xee\x8d~3cB.\x5c\xd9\x9c~\x87\xe5\x94\
+\x87#O\x97\xb0\xae\x089\xc7\xaa\xd0\xc9\xce\x09\xb6\xd3\
+\x8e\xb1\xdc\xbf\xe1H\x1aL\x1b\xb9\x99\xfe1\xd6\xf7\xd8\
+)\xfeg\xa2 \xceHf\x13\xdf\xf8\xb7\xe9X\xf2\x8c\
+\xe7\xaa\xc03\x01\x00\x81\x19\xaf\xa5\xdd\xe4i\x9a\x03\xa7\
+\x94\x911:\x08\xeab\xcf%\xef2\x93\xfb\xe9C\x1f\
+\xba\xc7\xba*\xae\x8e\x16?(\x22\xffIJ\xfc\xc0b\
+\xfb\xa3\x7fH\xf5\x97`/\xaa\x03\xef\x04\xc0\xc9\x8e\xb5\
+}\xd8\x9f#L\xd1\x0a]x\xc3\xe8o-z\x16\x83\
+\x8b<\xabT\xca\x92\xa3\xee\x1a\xf3\x1a\xd5\x02o\xd1T\
+/\xa6\xa7\xf1uM\xe22\xd9\xf7\xe5\xa2\x1f\xf7\x7f\xd8\
+\xccU\xa7~\xb9\x04x\xe5\x04\x02\x00\xa8\x84\xfd5\xed\
+\xc5 \x91\x17\xee\xdd\x95\xfd\xaa\x91+fTYg\xa8\
+\x9d\x9aQN\xe5\x90|\xb6\xad\x9d\xb3\x86\x8b=^\x0a\
+\x86c\xce\xfdi\xa2\xde\x81\x99\x8b\xc1\xd7T\x03\xe3n\
+^_yxg\x01\x00H\xce6\xed\x09\x0cD\xc7<\
+\x8e;\xdb\xb3[\x13\xb1\x17{\x00\xc8\x06\x97\x07\x1e\xd3\
+\x90?\xa7\xaf\xbb4\xc6\xa7\xd4Ox\xa5\xc5l\x00\x1d\
+\xb0\xed\x96_\xed\x1a\xfb\xbbb\xb1\xdd\xa1\x1f\x1b&\xa0\
+{\xe1\xb8\xe1\xa3\x00\x90\xd5\xefm\xfc\xc6=V@\xb6\
+pi\x1bw\xb6\xb1h^PnF\xf7z\x85\xd9Y\
+\xe60(\x9b\xab]=\xb5hx\x9aU\x9erng\
+1\xd6\x22\xf2\xc0)\xf7\x9b\xceL\xa9{\x17V\x05^\
+\x0a\x00L\x97\xf9\x0fl_\xac\xa8w?x4q\xd0\
+\x90,zQ5\xf1\x0d\xb9{\x8c\xe4\xa9f7\xa1\x5c\
+\xacY\x97P\x15\x9b\x93P1\xdd[\xca\xcf\x22E\xe3\
+\x91\x85\x9e\xd8\xbf\xa1\x8b<\xe3\xb1\xaa\xf0\xcf\x07\x00\x00\
+p\xbaO\x9d\x1f\xf7\x15\xdb\xab'\xd4\xb1\x8b\xedv\x16\
+[\x82\xa52\xf7w\xacVJ\x89W\xe9FB\xeeZ\
+\xad\xbe\xbb\x93*v{\xe5W\x5c;\x0b\x03EJC\
+\xb2\xd1\x0f\xdc\x9f\xdb\xb9\xea\xf6/ \x86\x97\xaa\x04\x80\
+\xa0\xe5\x8f\xc6\x8b\xa1Q'Y\x81\x03\xb9O\x1c\xb9\xa2\
++{VO\xbbr\xcax7\x8d\xa0g:6\xc9M\
+E\xa3\x82i\xf5\xfb\xb6\xb7\xb3\x18M\xac\xe9\xf3\xa1\xd7\
+M\xa1\xb2\xb6\xae\xac\x06\xbc\x15\x00\xe4\xa7\xf5\xfbb\x03\
+#G\xfa\xf3\xe7|\xbbi\x9f\xb1X\x0c\x9e\x89\xaf\x0e\
+<\xae\xa2\xc6\x1dv\xa1uO*Vx\xe9b\xe9\x9e\
+\x8c\xd7\xb0\x9b\xbb\xe4\x1d1v\xc1E#\xbbc\xa7\xf5\
+\x13\xd8\xbdt\xbc\xe7W\xeb\x01\x8cN\xc6\xb1\xcf\xf4\xb5\
+\x8f\x1b\xe1\xd2g\xfa\xdfL\x9dn(\x1a\xdaao\xe9\
+X\xa72T\x22\xe9\x8225\xadWO\xbbZ\xecQ\
+\xc9j\xben|3\x93\x1d\xc1N\xb0\xf1\x13\xde\x03\xc6\
+\xdc\xb8\x1eC\x13\x0bO}\x00\x00\x00u\xc9\xbc\x8d\xf3\
+\xdc\x9c\xf4\x91\xf82\xbc_\x17/\xfa\xdbV\xf6o\xca\
+\xdfi\xaeL\xdb8Jv\x8fqcF^4W0\
+\xa6ySu\x22tSZx\xae/\xb8\x05\x9d\xe3\xda\
+\xbar\xa2\xe1\xb1\x05\x00`<b<\x1a\xc9\x5c\xef\x85\
+\xb3~\xff\xb6|\x87\xbd\xa8QM?\xe8]\xa9\x91W\
+\xaao\x10\xa5\xb4\xad\xd2<\xe0.\x1a\x9a\x92_rl\
+\xc9\xf9\xaf\xdfM\x80K\xc7\x0e\x87?0\x82g\xd1\xff\
+\xeb\xe1\xb7\x00\x10vm\xa3/\x05\x86O\xb2\xd8\x81#\
+\xe1\x0f\xed\xb9\xa2\x17\xd5\xd9\xb3\x99iqV`\xcf\xc0\
+kH\xda\xec\x9b`-:\xdb\xcfi\x8fZ\x0e\xfb\xd9\
+\xe1!\xec\xec\xb9\xc0Vi\x9c'\xb9\x7f\xa3\xc1s\x01\
+@z\xc2~ 9\x10\xfa\xf9\x97\x95\xb9\xd2\xb7U\xe1\
++>\xa7\xf6\xaf\x8a.51\x15\x9dvI\xb4\x8f\x98\
+V\x0c\xa0X\xed\x02\xed\xb7\xbc\xa1\xbc\xdc\xfb\xf3\xbc\xa5\
+\x10\xf5\xbd\x19?UB\xbdsm\xe0\xbb\x00\x90\xb7\xef\
+\x90}\x1d-\xfc\xcd\xfc&\x07\xb6\x0e\x9e\xb2\x15M\xec\
+*\xdc\xee[//\xa5\xcf\x10\x11\x8c\xcd\xbaA2\xc7\
+[\xd4cR\x7f\xeb\xd8\x12O\xfem:\x98\x1f\xfc<\
+\xbcC\xcdU\xbd}]\xa9\xf0^\x00@\xe7\x94]\x09\
+\xff\xd0$+\xf5\xed\xd5\xb7\xcd\x83E\xe7\xd4\xea\xee\xf6\
+\xe4\xbc\x12\xba\x8c\x13\xa3\xba\xd3\xfe|RQ\xf41\x90\
+\xb2\xec7\x9f\xbc\x84\x04\x80\x9c\xbb\xef\xf5\x01o[M\
+/\x1c\x1148\x1e\xcf\x03\x86P\xbde;\x9a\xcc\xc4\
+Q\x08\xfa_S^\xb1\x16}\xb6\xc7\x1f\x8c/7)\
+\xcbm\x1bW\x0cJm\x5ci| ^\xb4\x00T\xd2\
+\xd5\xf0[\xb9\xff\x0a\xb2)\xff\x81\xd0\x07\xad\xe3\x08B\
+W\x0d\x01X\x00 \xd1\xf8F\xb2#\x90\x8f\xbf\xeb\xfe\
+T_(\xea\xfe5y6\xa7\xa6Vh\xfaw\x13\xf2\
+\x19\xa6MIg\xd1|aV\xff\x99e{w\xb6\xfb\
+\xbb\xfe\xd7\xb8,\xcf\xdd\xbf!\x18\xfc7\x94]i[\
+5h\x8f\xd6\xe2V]\xfa\xd7\xc6\x9f\x8a\xee\x07Ny\
+\x9e\xf7nri\xec\x13u>\xb4\xdc\xc2\xf6\x84\xbf\x97\
+\x16+\x02\xcdj\xbac\xd6\xc3;\x98\x13\x8b9\x01\xfc\
+\xfe\x91\x15\x86\x00\xc0\xca/\x87\x0f\xe7\x7fj.:\xfd\
+\xcb\xces\xff#f\xba&\xd0\xf0\xd2Z\xca\x18=\x95\
+\x0f\x18\x8aXNI\x94>J\x9dk\xcb7\xd5\xf0r\
+\x91\x93e\xf0_\x85 \x00P\x09s\xa4)\xab.6\
+Ru\xdfo<O7K'6\xebFaA\xdcs\
+\x92)&DN\x93k-\xd8\x85\xf1pEV\x18\xc3\
+\x04\xc0IXi\xd1\x8b\x9aX\x14x\xc6\xaa\x9c\xf0U\
+7\xb5\xe9Y\xe3\xdd\xc1\xa2\xae \x0dY\x05\x83P\x13\
+\x8c`\x040\x06\x05\xa7\xe7?d\xa6[\xaa\xb0\xea&\
+\x9feyy\xd0\xee\xe3Cw\x8fJ \x12\x01Hb\
+Oy\x1er\xa0*a\x17\xca\xf2\x88c\x99\x97\xe1M\
+\xab\xc7\xf1!\x0e\x01\xe4ft\xbd\xa42Wk\xd1\x95\
+\xb2Y_\x92\xb5u\xf3o\xf3\x87r\x10\x83\x008\x85\
+\x7fc|\xbe\xb3\xc4\xd2\x8f\xf1\xa0\xbd\xcb\xb1!&'\
+\xefj\xc4c\xc4 \x80\xec\xe2+\xab\x8d\xb2\xaa\xae\xba\
++mku\x0b/\xf3w?Pr\xf8\x9c\x10B\x06\
+g\xb8\xf8*\xd3\xdaX\xe5\x92kY[\xe3\xab\x8c\xbe\
+S\xf0WO\xf8\x16\x80\x1eX\xed{\xc4LMD\xf4\
+\xbf\xf8\xffk\x5cfx\xba\xb7\xec\x16\xd3\xbcA\xe8\x02\
+`[\xbf}Qch\xa9A(\x8b6\xb7\xbc\xa4m\
+\xfa^\xe8\xd3A\x81\x0b\x80\xe9~\x99\xbb\xbd\xa1\xec\xae\
+\xc1\xe3Cu\x97\xed\xc54\xc3\x93\xae\xdf\xe5\x22l\x01\
+\xa4\x17\x9d[\xabQ8k\x14\xca\xa6T\x0d\xeb\xb5\x0b\
+\xce\x0a\xdb\x15\x14\xb4\x13\xa8\xfe\xfe\xd7\xf2\xa6)U\xda\
+2z$\xe4-S^\x95+y\xb6\x0fXi\x08\xd9\
+\x02\x04\x97\x87\x1e\xb3H\xaa\xee\xfe\x0dGjxB\xf9\
+P7Q\x818O\x11\xb2\x05\x087sJM\x8d\x97\
+](YA\x19\xe3\xcf\x0e@\xa5#d\x0b\xd0\xf6\x8e\
+\xec|\x1fj:\x11\xe3\xfc_v\x1d1\x97\xd0'\x8c\
+w\x08Y\x00\xcc\xa5\xd9\x7f\x8aE{j8\x11K\xfb\
+.\xfe\x9fljQ\xad/\xc4x\x10\xb2\x00\x80\xc6\xbd\
+\x8eO\xfb\xd9\x9am\xca^\xe8>\xe0\xfe\xe2V\xf0\xb0\
+\xf1\x0b9\xc2\x16\x00b\xb7\xfd.\xdd\xdbU\xa3u\xb9\
+\xc4\xf9\xab\xbfU\xb2\xb7\xd7\xfa\x1a\x8c\x0f!;\x81\x00\
+\xa0\xfer\xf6[\xfe\x1c\xf9\xe6\xad\x15$\xdd\xf1F\xa0\
+\xe3n!\xa4~\x17C\xe0\x16\x00\xc8\xb5\xfcAu\xda\
+C\xbe]S\xc5\x08|\xde\xbf\xb3Y\xc8\xee\xdf\x10\x82\
+\x17\x00\xa4\x9d\xf3^\x0f\x0e\x90\xef\xdcY\x19\xd8@\xd7\
+\xef\x07\x82\xf3\x84\x93\xfb7\x1a\xc2\x17\x00X\xc3\xdbS\
+?\x0c\xa0\x9c\xbd~\xca\x86\xeb;\xe4\xfft.\xbf\x0b\
+\xbf\xc9\x10\xba\x0f\x00\x00L\xa8\xf5\x0f\x99\xee\xf2\xb7}\
+,\x9d\xccE\xef\x1fd\xf1f1\xfc|Dp\x0a\x00\
+\xb4'o}\xcb\x9f\xaf\x9a+\x98\xee\xda\xed?3\x9b\
+|\x938>#\x0e\x01 a~C\xf7\xad\xafJQ\
+\xc1\xe8\x89\xc0NGF\xd0\xb3\xff_\x10\x89\x00\xa0\xba\
+\xd4\xb6-\x11\xed\xabBT\xb0\x10\xec}#\xd9\xdd\xca\
+\xdf\xbe_\xa5!\x16\x01 o~\xc7u\xcc\x8f\x09\xcf\
+\xd4e\xfd\xef\xf9\xdfo\xe1x\xb0\xe7ge\x10\x8d\x00\
+\xc0x\x9do\xd0]\x1e\xa2.\xe3\xe53x\xd9\xbdE\
+\x11v\x89\xe7\xba\x89\xe6D\x00\x18\x8f\xbb\x0eD\xd2\x13\
+j\x03\x92\xc1\xbd\xf1\x93\x0db\x98\xfe]CL\x02@\
+\xc2\xb5Ks\xd6=\x81\xab\xf3\xb1\xd3}{u\x19^\
+\xec\xf9[)\xc4\x10\x07\xf8\x05\xc5\xf7\xaem\xb9p\xa0\
+\xe4\xdd\x7f\xc9\xc8\xf9\xbd[\xd8\x8bM5LA\x9b\x00\
+De\x01\x00\xce\xf9\xb6\xfa\xb8\x97\x9d\x10\x1b\x90\x8f\x7f\
+\x14xW\x07^\xf7\xfd,\x1d\x91\x09\x00\xe8\x9f\xbaM\
+\xd2\xeb\x9e\x00W0\xd5\xd5\xbdM\x12&\xdf#T \
+\x88N\x00\xd0\x1e5\x1c\x8c\xa7J\xd9\xfe\x99\x04.\x19\
+\xdb\x97\xf9\xd4\xca\x8f-\xdf+\x89\xb8|\x00\x00@z\
+\xdaN\xc9\xc5\x1e\x10oEO\xc4\xe0\x99\xee\xddL\x9e\
+w\x9b\xbe\x8d\x1f\xf1Y\x00\x80\xfe\xa6y[!\x1a\xa8\
+`T\x90\x0d\xf9\xb6\xe2\x5c\x9b\x00z)\x95\x8c\x18\x05\
+\x00\xd8\xf6\xcb\xbf\xf4\xb1\x15K\x12)\xc4?\x09\xbe\xad\
+\x82h\xa2\x7f\xc3\x11\xa7\x00\xd0?\xf3\x0d\xb8\xdd\x15\x9a\
+\x0e\xe6\xbb{_\xe7\x82<\xda\xf2\xbd\x92\x88\xd0(>\
+\xb0\xbe;\x90\xabHT0\x13|+\xf9\x99K\x5c\xa9\
+\x05\x00\x06\x9b\xb7(~\xf0W`:\x98>\xed\xdb\xae\
+\xc8\x08>\xf7o4h@\xa46\x80>\xd3\xbc+5\
+\xe0\x1b\xef\xd7\x84\xbd\xdb2\x17Z\xc5\xe8\xfe\x0d!\xd6\
+G\x00\x80\xbc\xfe\x80\xe9\xd3\xf08\x0b7\xc3\x1f\x87\xde\
+\xb5\xf0m\xcb\xf7J\x22\xdaG\x00\x00\xaa\xcf\xf9z\xe1\
+j`\x1c\x12g/\x85\xfeD\xf9\x5c\xe2\xfd\xfd\x8b[\
+\x00\xe0T\xc7\x1b\xdf\x0d\xe7=\xe5~>\xe79\x18\xf9\
+k\xa3 \xba~\x97\x8d\xa8\x05\x00\xc4\x8c[\xf4\x7f\x8d\
+b\xb0\xac\x0f\x0f~\x15\xdfi\x8c\xd7\xb4\xff\xc0\xc4#\
+r\x01@v\xd1\xb2'\x1a.\xcb\x15\x0c\x06\xf7$~\
+\xb2T\xb9\xfd\x5c\xd5\x11\xb1\x138D\xd6x\xa8\xf1X\
+\x04\xa5W\x10\x87>\x0e\x1fvd\x0d\xb5\x1e\xffD#\
+v\x0b\x00\xd0\xbd\xfa\xad\xb8\x1c)\xb1\x828\x7fq`\
+\xbb\xa4W/f\xf7o\x08\xf1\xff\xc5q0\x94.\xa9\
+t,\x1d\xfcs\xf8\x84\x05<\xdd\xd4\x83\x00\x10\xb3\xec\
+\xd4\x9d\x0a\x96P62xj`\xaf!&\xca\xc5\x9f\
+\x1b\xa9\x0b\xd6\xbc+\x1d$\xcd\x15d\xfd\xe1=\xe9\x1f\
+\x0db\x8d\xfe_O}\x08\x00\xac\xfd\xcf\xa6\x8f\x02\x05\
+\xa2\xa8`!\xf1I\xe4\x90>?\xe1\x9b\xcf\xf0\x83:\
+\x11\x00\xe0ql\xa3\xaf\x92\x94\x8dd;\x03;\x99>\
+\xdeo\xf9Z)D?\x0d\xfc\x19\xedq\xfb\xbe\xe4`\
+x\x8c\xf3\xe5\x92\xf1\x03\xa9\xcfL\xe2\xcb\xfd\x1b\x8d\xba\
+\xb1\x00@\xca\xb5S\xf2m_\xf1\x5cA.\xf7]\xe0\
+MiRd\xa9\xdf\xc5\xa8#\x01\x80\xb9\xd0\xba\xb5\x10\
+\xea-\xe2\x0a\xb2a\xdf\xae\xc2\x19\x11U\xfe\x8dM\x1d\
+\x9d*\x00\xd3A\xdd\xe1H~\xd4\x94\xf1|\xbbj\xb6\
+\x0ef\xff\xbfP?>\x00\x00 <m+\xd7\xd51\
+JT\xb0\xd0\xdd\xb3\xbb\xe0\x11m\xee\xcf\xc8\xd4\x97\x05\
+\x00d_\xb6l\xcb\xa5G\x5c N\xc7\xde\xa4>q\
+@R\xeb!V\x97:\xb3\x00@\xce\xb1G\xfa\x95{\
+\x04W0{\xca\xbf\x0f)\x91/\xfe\xde\x00\x87|\xdd\
+\x09\x00\xf4\xd5\x99\x7fbC\x97o<\xef\x90g;w\
+N\x14}\xbfJ\x80C\x94FT\xe8\xdb\x1e\x95\x0a\xab\
+>l=0\xc0]\xb78\xc4\xc5\x0e%\x0fi\xf3\x22\
+\xe9\xfbC~)\x10\xa4\xd1;A\xd5\xf4\xfc\x85\x8e\xb5\
+l\x95\x5c\xe8\x1e\x16\x15\xcc_\xe8\xdf\xce\xf9\xed\xe2_\
+\xfc\xbd\x01\x16~\x1a]u'\x00@~\xbauk*\
+\xf5s_\xc1A\xdf\xae\xecI''\xf2\xdc\x9f\x11(\
+\xc0[\x9f\x02@\xc6\xfc\x96\xf1s\x1f\xc2\x00\x80\xd8\xe7\
+\xc1\xfd\xeaA\x11\xa7~\x8fJ\x01\x9d4.U\xb1\xc5\
+*\x7f\x90v7\xff;\xeb\xee\x03\x0b\xf4\x06\xb7p\x9d\
+u7\xfd\x03\x00\xe4p\x9e\xc6%\x04\xeb\xcd\x0d\x04\x00\
+V\xf7\x89\xf3`\x00\x1e6\xf0\xe7\xf0'\x96\x82(\xda\
+\xbe\x96z\x09\x10B\xa7\x04A\xfc\x88\xd6:\x9b\xfe\x00\
+\x00\x1du\xee\x88\xdd\x7f%\xaf\xd8i\x08Y\xea\xce\xfd\
+\x03\x80\x02~D\x84\x01\x03\x17\x16\x8b=\xf9yDd\
+1t\x5c8\x96\xfafV\xb6\x1e\x9f\xff@\x06{q\
+B\x82\x04Nc\xb0~\xd6\xbf\x87\x934\x7fx?\xe8\
+\xbc\xa1\xd6\xe3\xa8\x09\x1c\xe28\x898\x8d<:\xf1]\
+=\xce\x04\x00N\x9e\xb3\xe7l\x5c=\xba\x7f\x00\x8b\xef\
+\xd0=\x14\x0a\xf6\xe3\xa3\x09\xee\xb0\xcb_\xe8\xba|\xfa\
+\x03@\x06\xc7\x10\x1cZ\x0d\x1c\xc0\x09\xf4\xd6\xdd\x9a@\
+}\xc3\xa1\x07_!~\xadAD\x17\x8e\xd5e4\xa0\
+~\xc9\xe1(:\xc1^\xcb\x07\xf0\xe1(zI\xaaH\
+\x0f>\x1c\xdafkH\x00y|\x8b\xc3\xc8\xd6zT\
+\x93T\x89\x0c\x8e\xe0\x87!\xc7\xffZ\x00\xc8\x83\xf7\xf1\
+S\xad\xc75I\x95\xb8\x80\xc3\xf8[V\xd4/\x1b\x1f\
+F`\xc4\xedb\xd9\x09g\x92\x22D\xb0\x15\xef\x5c\xcb\
+\x89\xfaE\x00)\x841\x15mu\x18\x14\xae/\x0a\xf8\
+\x18\xbfG\xf7\xb5?\x87o}\x1aF\x1a\xb3a\xab\xdb\
+\x99q=\xc0\xe1\x1c~\x87\xbf\xfc\xb2\xfc7\x5c\x00,\
+\xdc\xd0a6\xd4\x93\x12\x10)\x1c\xbc\xd8\x82=\xc3S\
+b\xaf\xdf\xfc8\x83.\xd80\x0d\xf2I\x09\x88\x92\x18\
+\xde\xc6\xef\x10\x18\xfe\xd2\x8d\xbb_\xc7q\x09\x8d\x98R\
+\x1f\xb5\xf1uF\x12\x1f\xe1\x7f\xa1\xeb\xfa\x98\xef\x8d\x02\
+\xe0\x10\xc3%LEc].\x10\x8b\x99A|\x86\x7f\
+\xc6\xf9\x1b\x97\xfdd\x11F'Z \xda\xfe\xd8uI\
+\x12\xc7\xf1?\xf0\xdd\xcd\x01\x7ff\x84\x83Y\xf8p\x1e\
+\x0e4MF\x05D\x01\x87\x01|\x84\x7f\xc1w#\xd5\
+D2#~\xa4\x00?\xceA\x07\xe7\xe4\x8c@\xf0p\
+\xf0\xe3m\xfco\x9c\x1d\xb9$\x96\x19\xe5c,\x82\xf8\
+\x0eY8`\x9e\x94\x80\x80)\xe0\x02\xb6\xe1w\xe8\x18\
+-\xe5\x87\x19\xf5\xa3\x1cb8\x03/\xd4\xb0O>\x0a\
+\x04\xca\x00\x8e\xe1\xffb\x17|\xa3g{0E\xbf \
+\x8d\x9fp\x16q\x98a\x1c\xe3\xc8I\xf8F\x0e\xe7\xb1\
+\x15\xbf\xc7\x17(\xbay\xd6X\xb7\xb5\x00\x0f\xce\xe0\x02\
+\x06a\x85fr\x9d@ \xe4\xd1\x8d7\xf1{\x1c\xc0\
+\xd5\xb1\xb2=\xc9\x9e\xef\x0c\x5c\xb8\x03\x8f\xe11\xb8 \
+\x9b\x94\x01\x8f) \x077>\xc0\x078\x8d~\x92\x82\
+\x1fr\x07O\x02;\xa6c1\x1e\xc5\xadf\xd29\xe4\
+\x11\x1c\x0a\xc8#\x813\xf8\x14_\xe22|\xa4)~\
+\xa5\xddD\x1az\xd80\x15\xf7\xe2n\xcc\x82\x0eR0\
+`\xc0\x80\xe2\xb5\x18\xc4\x9b\xee:t\xdb\x0b\xc8#\x86\
+\xf3\xf8\x1a\x7fE'\x02\x88\x95R\xeaW\xfa\x8d\xa3 \
+\x85\x16\x1a\xd80\x1b\xb31\x13-\xb0\xc3\xcc\xe3\xa8!\
+\x8b\xb4H\x13^9\x0c\xa2\x07\x1d\xb8\x8c\xcb\xb8\x04?\
+\xe2H\x94\x9e\xd6\xf7\xff\x01\xf66\x1f\xe8_\xafk\xb1\
+\x00IEND\xaeB`\x82\x81\x14\xa8au\x12I\
+ \xa2\xac\x94\x94$IcA\x9d!\x84\x10\x811\x08\
+\x1a)=\x22\x94D@\x88 \x09\x8c\x00\x09\x89\xa0\x08\
+\x0a\x11\x1c!\x11\x8c@Dd\xa2\xf4\x015>\xbdN\
+\xfcC!+\xfe\xa5\x80A\xf9\xfd5\x1a\xf5\xa0\xdaU\
+\xb4\x03H\xd2.-\xb5\xab\x96\x86A2\xab\x14\xd5\x09\
+\x7f&\xb2pU\xec\x0d|\x09\xe1\xfa_\x8099Z\
+{K\x87E\xd1\xaca?\xc9\x94\xa9\xd1\x22\xfdz\x94\
+\x87\xe0\xb7\xdf\xbeL,\xab\x92\xa8\x1c\xbe7\xb14\xa1\
+e~\xa6\x9a>\x84\xb3\xb3s\xf2@\x9d\x9b\x80\xb3\xd1\
+\x0a;\x1bS\xeb@s\xbf\x90}@\xf6\x90\x07b\xfa\
+\xb8x!\x0f\xa9\x1c\xb6\xa5c\x10\x8f\xa8\xf9L\xcc\xf8\
+\xc3o\xafr\x99\x1e\x89\x8e\x1b\xef\xc4:y\x8f_8\
+\x86\xf7\xa8\x0b\x9c^(\x1f\xa1?\xc4\x05\xb7\x17\xcc5\
+\xfcGAoK\xb0\xaa/\xb4\xdfq\xa4\x0b\xcc\x07\x16\
+\xee\xc2\xfd\xe6\x90z\xc0\xbc\xb0\xf57Y\xe1\x16\x86,\
+\x1b\x90\xac\xb0\xc2G\x8b\xc1\x07\x0cM\x117\xe8\x0a\x94\
+\xac\xef\xec\x03V\xfc\xda1Z=Dp\x02J\xbc\xc2\
+\xd5\xe0\xfb\xc9)\xc1\xa6m\x03\xa8\x17\xb2\xd7\x09\xef-\
+8\xcaC=\x1c\x0b\xec\x95\xe1\xd4>\x00\xe8$\xf8\x05\
+{\xb5\xa1\xd1\x01R\xde\x8f\xe6\xc7\xa7\x1b}\xc0\xd8\x0d\
+\xfb\x0b`Dd6ZSq\xc1k=\x8d\xe5~i\
+z\x0f!\xfe\x95\xef3\xee\xee&\x1e\xe0\xf5>\xb4\x83\
+~\x98:A/B?\x05\xdcV\xbc\xfb\xeba~R\
+\xd1mg\xb2=\xa0K9\x09\xbe\x0f\xd9\x1fh\x16\xfa\
+\x1b\x15j6H\x0f\xe8\x0164#\xed\xfb\xe0\xd7\x83\
+\xcaC\xc9\xdd\x96<`\xa9\xec\x88\xb6;Q\xc9\x83\xa6\
+\xcb\x99n5\x00G>\xe0r\x8b\x85/\xfd>\xdf\xfb\
+t\x8cg\xd0\x03\x03\x03y@\x85\xbc\xd2\xa8\xdd\xd1(\
+\xc0\xa7\xdf\xeff\xa6w@\x84ZR\xf2\x90Z\xc0\x83\
+d\xdf\x8f\xed\xebGp\xa8M\xd4\xec\x84\xf8\x90\x92\x01\
+\x04=*\xfc\x88;\xe0\x11OiZCh\x84>h\
+\x1c/\xec\x0e\x0a\xd4\x85\x1d0\xd8\x87\xb1\xcf\xffw\x0e\
+$\xdc\x96\xb2\x09v\xc0\x22\xb6\xb4\xa7\x84\xc0}\x01\x90\
+\xb6\x8bh\xba\x88O\x1d\x90`\xc6\x94\x1cQ\x84\x95\x1f\
+r\xa0\xe0\xa2\xfb\x13Yg\xca\xb6\x0c\xec\x96\xe2-\xb6\
+\xf7\x1f\xee@\x07\x142k\x9a\xc7\x0f*@e\x9c\x7f\
+\x0f\xe2\xc9\x88\xee\x1b0\x005\xb3l\xcc\xdf\xf3%S\
+\xaf=\x88\xdf\xfb\xdb\xc5\x1c\x10\xc8.\x1cxM\x09\xd0\
+\xf6\xbb\xcd\x9cN\xd6\xbd7\xc6\xfd\x01\x5c\xe4\x00\xc0v\
+#\x14n\xd9\xdb\x16\
 \x00\x00Pz\
 <\
 svg xmlns=\x22http:\
@@ -7424,96 +7295,96 @@ qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x03\xc6\x00\x02\x00\x00\x00\x12\x00\x00\x00\x09\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x03\xd6\x00\x00\x00\x00\x00\x01\x00\x00\x82j\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x046\x00\x01\x00\x00\x00\x01\x00\x00\xe2\xd5\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x04\x10\x00\x00\x00\x00\x00\x01\x00\x00\xda\xd5\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x04\x5c\x00\x00\x00\x00\x00\x01\x00\x01D\xc4\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x05\xc0\x00\x00\x00\x00\x00\x01\x00\x01\xa7\xe9\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x04\xde\x00\x00\x00\x00\x00\x01\x00\x01\x9b\x86\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x05\x9c\x00\x00\x00\x00\x00\x01\x00\x01\xa6\xcd\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x06|\x00\x00\x00\x00\x00\x01\x00\x01\xb7\xb4\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x06f\x00\x00\x00\x00\x00\x01\x00\x01\xb5\x9d\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x05\x04\x00\x00\x00\x00\x00\x01\x00\x01\x9c\xe4\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x05\xe0\x00\x00\x00\x00\x00\x01\x00\x01\xa9[\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x04\x94\x00\x00\x00\x00\x00\x01\x00\x01\x95B\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x05\xf6\x00\x00\x00\x00\x00\x01\x00\x01\xab\x97\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x060\x00\x00\x00\x00\x00\x01\x00\x01\xb0\xa8\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x06\xa0\x00\x00\x00\x00\x00\x01\x00\x01\xb9\xc4\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x05x\x00\x00\x00\x00\x00\x01\x00\x01\xa4\xe0\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x06J\x00\x00\x00\x00\x00\x01\x00\x01\xb2\x04\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x06\x0a\x00\x00\x00\x00\x00\x01\x00\x01\xad\xfd\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x05\x1c\x00\x00\x00\x00\x00\x01\x00\x01\x9f\x02\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x05@\x00\x00\x00\x00\x00\x01\x00\x01\x9f\xfa\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x05^\x00\x00\x00\x00\x00\x01\x00\x01\xa2\xb0\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x04\xb8\x00\x00\x00\x00\x00\x01\x00\x01\x99O\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x00\xb6\x00\x01\x00\x00\x00\x01\x00\x00\x19\xac\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x01(\x00\x01\x00\x00\x00\x01\x00\x00#\xa4\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x00\xec\x00\x01\x00\x00\x00\x01\x00\x00\x1c\xcc\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x00\x18\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x00B\x00\x01\x00\x00\x00\x01\x00\x00\x05Y\
-\x00\x00\x01\x9f\x19\x1d\x19\xad\
-\x00\x00\x02F\x00\x01\x00\x00\x00\x01\x00\x00PK\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x03\x14\x00\x00\x00\x00\x00\x01\x00\x00o\x16\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x00x\x00\x01\x00\x00\x00\x01\x00\x00\x11:\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x02\xa4\x00\x00\x00\x00\x00\x01\x00\x00X$\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x02\xf2\x00\x00\x00\x00\x00\x01\x00\x00gN\
-\x00\x00\x01\x9f\x18\xc9\xf4:\
+\x00\x00\x03\xd6\x00\x00\x00\x00\x00\x01\x00\x00\x84\xd1\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x046\x00\x04\x00\x00\x00\x01\x00\x00\xe5\x1d\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x04\x10\x00\x00\x00\x00\x00\x01\x00\x00\xdd\x1d\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x04\x5c\x00\x00\x00\x00\x00\x01\x00\x01<\xa8\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x05\xc0\x00\x00\x00\x00\x00\x01\x00\x01\x9f\xcd\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x04\xde\x00\x00\x00\x00\x00\x01\x00\x01\x93j\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x05\x9c\x00\x00\x00\x00\x00\x01\x00\x01\x9e\xb1\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x06|\x00\x00\x00\x00\x00\x01\x00\x01\xaf\x98\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x06f\x00\x00\x00\x00\x00\x01\x00\x01\xad\x81\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x05\x04\x00\x00\x00\x00\x00\x01\x00\x01\x94\xc8\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x05\xe0\x00\x00\x00\x00\x00\x01\x00\x01\xa1?\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x04\x94\x00\x00\x00\x00\x00\x01\x00\x01\x8d&\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x05\xf6\x00\x00\x00\x00\x00\x01\x00\x01\xa3{\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x060\x00\x00\x00\x00\x00\x01\x00\x01\xa8\x8c\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x06\xa0\x00\x00\x00\x00\x00\x01\x00\x01\xb1\xa8\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x05x\x00\x00\x00\x00\x00\x01\x00\x01\x9c\xc4\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x06J\x00\x00\x00\x00\x00\x01\x00\x01\xa9\xe8\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x06\x0a\x00\x00\x00\x00\x00\x01\x00\x01\xa5\xe1\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x05\x1c\x00\x00\x00\x00\x00\x01\x00\x01\x96\xe6\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x05@\x00\x00\x00\x00\x00\x01\x00\x01\x97\xde\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x05^\x00\x00\x00\x00\x00\x01\x00\x01\x9a\x94\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x04\xb8\x00\x00\x00\x00\x00\x01\x00\x01\x913\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x00\xb6\x00\x04\x00\x00\x00\x01\x00\x00\x18\xa7\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x01(\x00\x04\x00\x00\x00\x01\x00\x00\x22Y\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x00\xec\x00\x04\x00\x00\x00\x01\x00\x00\x1b\xc1\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x00\x18\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x00B\x00\x04\x00\x00\x00\x01\x00\x00\x05B\
+\x00\x00\x01\xa1P}\xea\x22\
+\x00\x00\x02F\x00\x04\x00\x00\x00\x01\x00\x00T\xa1\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x03\x14\x00\x00\x00\x00\x00\x01\x00\x00rN\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x00x\x00\x04\x00\x00\x00\x01\x00\x00\x10\xee\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x02\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x5cr\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x02\xf2\x00\x00\x00\x00\x00\x01\x00\x00j\xda\
+\x00\x00\x01\x9f\x1d&sX\
 \x00\x00\x00^\x00\x02\x00\x00\x00\x04\x00\x00\x00.\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01\xca\x00\x01\x00\x00\x00\x01\x00\x00;0\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x02\xd0\x00\x01\x00\x00\x00\x01\x00\x00].\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x01\xec\x00\x01\x00\x00\x00\x01\x00\x00D\x22\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x01N\x00\x01\x00\x00\x00\x01\x00\x00*4\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x01|\x00\x01\x00\x00\x00\x01\x00\x006X\
-\x00\x00\x01\x9f\x18\xfd\xab5\
-\x00\x00\x01\xa4\x00\x01\x00\x00\x00\x01\x00\x008\xdf\
-\x00\x00\x01\x9e\xfe\xdb\x99\x04\
-\x00\x00\x02\x80\x00\x01\x00\x00\x00\x01\x00\x00S\xc2\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x02\x0c\x00\x00\x00\x00\x00\x01\x00\x00K\x1d\
-\x00\x00\x01\x9e\xfe\xf3\x94P\
-\x00\x00\x03H\x00\x01\x00\x00\x00\x01\x00\x00w\xce\
-\x00\x00\x01\x9e\xfe\xdb\x99\x15\
-\x00\x00\x03\x90\x00\x01\x00\x00\x00\x01\x00\x00\x7f\xea\
-\x00\x00\x01\x9e\xfe\xdb\x99\x14\
-\x00\x00\x03,\x00\x01\x00\x00\x00\x01\x00\x00t\xcb\
-\x00\x00\x01\x9e\xfe\xdb\x99\x15\
-\x00\x00\x03l\x00\x01\x00\x00\x00\x01\x00\x00z\x91\
-\x00\x00\x01\x9e\xfe\xf3\x94S\
+\x00\x00\x01\xca\x00\x04\x00\x00\x00\x01\x00\x00?/\
+\x00\x00\x01\xa1Pp\xb1\x0b\
+\x00\x00\x02\xd0\x00\x04\x00\x00\x00\x01\x00\x00aK\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x01\xec\x00\x04\x00\x00\x00\x01\x00\x00H\xd8\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x01N\x00\x04\x00\x00\x00\x01\x00\x00(\xd2\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x01|\x00\x00\x00\x00\x00\x01\x00\x004\x82\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x01\xa4\x00\x04\x00\x00\x00\x01\x00\x00<\xdf\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x02\x80\x00\x04\x00\x00\x00\x01\x00\x00X\x1c\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x02\x0c\x00\x00\x00\x00\x00\x01\x00\x00O\xa4\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x03H\x00\x04\x00\x00\x00\x01\x00\x00z\xaf\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x03\x90\x00\x04\x00\x00\x00\x01\x00\x00\x82o\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x03,\x00\x04\x00\x00\x00\x01\x00\x00w\xd2\
+\x00\x00\x01\x9f\x1d&sX\
+\x00\x00\x03l\x00\x04\x00\x00\x00\x01\x00\x00}@\
+\x00\x00\x01\x9f\x1d&sX\
 "
 
 def qInitResources():
@@ -1,16 +1,21 @@
 import uuid
 
+from functools import cached_property
+
 from PySide6.QtQml import QQmlApplicationEngine
-from PySide6.QtCore import QObject, Slot, Signal, QUrl
+from PySide6.QtCore import QObject, Slot, Signal, QUrl, qVersion
 
 from artemis.utils.constants import Constants, Messages
-from artemis.utils.sys_utils import open_directory, make_tar, unpack_tar
-from artemis.utils.sql_utils import ArtemisDatabase, ArtemisSignal
+from artemis.utils.sys_utils import open_directory, make_tar
+from artemis.utils.sql_utils import ArtemisDatabase, ArtemisSignal, get_latest_sigid_db, import_database, open_database
+from artemis.utils.search_utils import SearchWorker
+from artemis.utils.model_utils import SignalListModel, SignalSearchModel
+from artemis.utils.thread_utils import run_in_background
 from artemis.utils.update_utils import UpdateManager
-from artemis.utils.generic_utils import generate_filter_query
 from artemis.utils.path_utils import normalize_dialog_path
-from artemis.utils.path_utils import DATA_DIR
 from artemis.utils.config_utils import CONFIGURE_QT
+from artemis.utils.ui_utils import WindowFactory
+from artemis.utils.profile_utils import PROFILER
 
 from artemis.ui.preferences import UIPreferences
 from artemis.ui.dbmanager import UIdbmanager
@@ -26,9 +31,12 @@ import artemis.resources
 class UIArtemis(QObject):
     # Python > QML Signals
     close_ui = Signal()
-    populate_sig_list = Signal(list)
     populate_sig_details = Signal(list)
     populate_filter_modulation = Signal(list)
+    merge_filter_lists = Signal(list)
+    reset_sig_list = Signal()
+    freeze_sig_list = Signal()
+    select_sig_list = Signal(int)
     
     clear_list = Signal()
     clear_signal_page = Signal()
@@ -41,37 +49,96 @@ class UIArtemis(QObject):
     show_dialog_update_artemis = Signal(str, str, str, bool)
     update_info_bar = Signal(str, str)
 
+    SECONDARY_WINDOWS = [
+        'qrc:/ui/DbManager.qml',
+        'qrc:/ui/SignalEditor.qml',
+        'qrc:/ui/DocumentsManager.qml',
+        'qrc:/ui/CategoryEditor.qml',
+        'qrc:/ui/Preferences.qml',
+        'qrc:/ui/SpaceWeather.qml',
+        'qrc:/ui/Downloader.qml'
+    ]
+
 
     def __init__(self):
         super().__init__()
 
+        # Signals list model, shown through the search proxy
+        self.signal_list = SignalListModel(self)
+        self.signal_search = SignalSearchModel(self.signal_list, self)
+        self.search_text = ''
+
         # Main UI initialization
         self._engine = QQmlApplicationEngine()
+        self._engine.rootContext().setContextProperty('signalListModel', self.signal_search)
         self._engine.rootContext().setContextProperty('APPLICATION_VERSION', Constants.APPLICATION_VERSION)
         self._engine.rootContext().setContextProperty('PYTHON_VERSION', Constants.PYTHON_VERSION)
-        self._engine.rootContext().setContextProperty('QT_VERSION', Constants.QT_VERSION)
-        self._engine.load('qrc:/ui/Artemis.qml')
-        self._window = self._engine.rootObjects()[0]
+        self._engine.rootContext().setContextProperty('QT_VERSION', qVersion())
+        self._engine.rootContext().setContextProperty('SEARCH_DEBOUNCE_MS', Constants.SEARCH_DEBOUNCE_MS)
+        # All the windows share the same engine
+        self.windows = WindowFactory(self._engine, self)
+        self._window = self.windows.create_window('qrc:/ui/Artemis.qml')
 
         self._window_filter = self._window.findChild(QObject, "filterPageObj")
         self._window_signal = self._window.findChild(QObject, "signalPageObj")
 
         self.loaded_db = None
+        self.loaded_sig = None
+        self.filter_page_visible = False
+        self.filter_lists_loaded = False
+        # Signals edited while the filters are active and no longer matching them: they
+        # stay listed until the filters change
+        self.kept_signals = set()
+        self.search_worker = SearchWorker()
 
         self._connect()
 
-        # Creating istances for other windows
-        self.preferences = UIPreferences(self)
-        self.dbmanager = UIdbmanager(self)
-        self.spaceweather = UIspaceweather(self)
-        self.docmanager = UIdocumentsmanager(self)
-        self.sigeditor = UIsignaleditor(self)
-        self.cateditor = UIcategoryeditor(self)
-        self.downloader = UIDownloader(self)
-
+        # Staged startup: the main window is shown first, the other windows are
+        # created the first time they are opened, while the autoload DB and the
+        # update check are done on worker threads
         self.update_manager = UpdateManager(self)
 
         self.autoload_db()
+        self.update_manager.update()
+
+        if int(CONFIGURE_QT.value('Startup', 'prewarm_windows', 0)):
+            self.windows.prewarm(self.SECONDARY_WINDOWS)
+
+
+    # Other windows, created on first use
+    @cached_property
+    def preferences(self):
+        return UIPreferences(self)
+
+
+    @cached_property
+    def dbmanager(self):
+        return UIdbmanager(self)
+
+
+    @cached_property
+    def spaceweather(self):
+        return UIspaceweather(self)
+
+
+    @cached_property
+    def docmanager(self):
+        return UIdocumentsmanager(self)
+
+
+    @cached_property
+    def sigeditor(self):
+        return UIsignaleditor(self)
+
+
+    @cached_property
+    def cateditor(self):
+        return UIcategoryeditor(self)
+
+
+    @cached_property
+    def downloader(self):
+        return UIDownloader(self)
 
 
     def _connect(self):
@@ -86,6 +153,8 @@ class UIArtemis(QObject):
         self._window.showSpaceWeather.connect(self.show_space_weather_ui)
         self._window.openDbDirectory.connect(self.open_db_directory)
         self._window.showCatManager.connect(self.open_cat_manager)
+        self._window.searchSignals.connect(self.search_signals)
+        self._window.filterPageVisible.connect(self.show_filter_page)
         
         self._window.newDb.connect(self.new_db)
         self._window.exportDb.connect(self.export_db)
@@ -101,7 +170,11 @@ class UIArtemis(QObject):
 
         # Python > QML connections
         self.close_ui.connect(self._window.close)
-        self.populate_sig_list.connect(self._window.populateList)
+        self.reset_sig_list.connect(self._window.resetList)
+        self.freeze_sig_list.connect(self._window.freezeList)
+        self.select_sig_list.connect(self._window.selectRow)
+        self.search_worker.results_ready.connect(self.show_search_results)
+        self.search_worker.more_results_ready.connect(self.show_more_search_results)
         self.clear_list.connect(self._window.clearList)
         self.update_info_bar.connect(self._window.bottomInfoBar)
         self.show_dialog_popup.connect(self._window.openGeneralDialog)
@@ -115,29 +188,66 @@ class UIArtemis(QObject):
         
         self.clear_filter_page.connect(self._window_filter.resetAll)
         self.populate_filter_modulation.connect(self._window_filter.loadLists)
+        self.merge_filter_lists.connect(self._window_filter.mergeLists)
 
 
     def load_db(self, db_dir_name):
-        """ Load the DB and populate the signals list
+        """ Load the DB (migrated first, if needed) on a worker thread, then populate
+            the signals list
 
         Args:
             db_dir_name (str): folder name in the data folder
         """
-        # Loading DB
-        self.loaded_db = ArtemisDatabase(db_dir_name)
-        self.loaded_db.load()
+        run_in_background(lambda: open_database(db_dir_name), self.show_db, self._on_load_db_failed)
+
+
+    def _on_load_db_failed(self, e):
+        self.dialog_popup(
+            Messages.DIALOG_TYPE_ERROR,
+            Messages.GENERIC_ERROR,
+            Messages.GENERIC_ERROR_MSG.format(e)
+        )
+
+
+    def show_db(self, database):
+        """ Replace the loaded DB with an already loaded one and populate the signals list
+
+        Args:
+            database (ArtemisDatabase): loaded DB
+        """
+        self.unload_db()
+        self.loaded_db = database
         # Clearing UI
         self.lock_menu.emit(False)
         self.clear_signal_page.emit()
         self.clear_filter_page.emit()
-        # Populating UI
-        self.load_filter_lists()
-        self.populate_sig_list.emit(self.loaded_db.all_signals)
+        self.filter_lists_loaded = False
+        # Populating UI (the FilterPage only when shown)
+        if self.filter_page_visible:
+            self.load_filter_lists()
+        self.update_sig_list(self.signal_list.set_signals, self.loaded_db.all_signals)
+        self.reset_sig_list.emit()
         # Updating status bar
         total_signals = len(self.loaded_db.all_signals)
         self.bottom_info_bar("Database loaded with {} signals".format(total_signals), "info")
 
 
+    def unload_db(self):
+        """ Release the connections held by the loaded DB (if any), once the running
+            search (on its own connection) is interrupted
+        """
+        self.search_worker.cancel(wait=True)
+        self.search_text = ''
+        self.loaded_sig = None
+        self.kept_signals.clear()
+        self.update_sig_list(self.signal_list.set_signals, [])
+        self.update_sig_list(self.signal_search.clear_results)
+
+        if self.loaded_db is not None:
+            self.loaded_db.close()
+            self.loaded_db = None
+
+
     @Slot(int)
     def load_sig(self, sig_id):
         """ Load the selected signal and populate the SignalPage
@@ -152,17 +262,181 @@ class UIArtemis(QObject):
         self.populate_sig_details.emit([sig_dic])
 
 
-    def load_filter_lists(self):
+    def reload_sig(self):
+        """ Reload the SignalPage of the selected signal, if it is still listed
+        """
+        if self.loaded_sig is not None:
+            sig_id = self.loaded_sig.sig_id
+            if self.signal_list.row_of(sig_id) >= 0:
+                self.load_sig(sig_id)
+
+
+    def update_sig_list(self, update, *args):
+        """ Apply a change to the signals list model, then select the loaded signal
+            again (if still listed). The list is frozen meanwhile, so that the signals
+            crossed by the selection are not loaded.
+
+        Args:
+            update (callable): method of the list models applying the change
+            args: arguments of the update
+        """
+        self.freeze_sig_list.emit()
+        update(*args)
+        self.select_loaded_sig()
+
+
+    def select_loaded_sig(self):
+        """ Select the loaded signal in the signals list (nothing if it is not listed)
+        """
+        row = -1 if self.loaded_sig is None else self.signal_search.row_of(self.loaded_sig.sig_id)
+        self.select_sig_list.emit(row)
+
+
+    def load_filter_lists(self, merge=False):
         """ Populates the 3 listviews in the FilterPage
+
+        Args:
+            merge (bool): If true, the lists are merged with the current ones keeping
+                the user selection, instead of being reset
         """
-        self.populate_filter_modulation.emit([{
+        filter_lists = [{
             'modulation': self.loaded_db.all_modulation,
             'location': self.loaded_db.all_location,
             'category': self.loaded_db.all_category_labels
-        }])
+        }]
+
+        if merge:
+            self.merge_filter_lists.emit(filter_lists)
+        else:
+            self.populate_filter_modulation.emit(filter_lists)
+        self.filter_lists_loaded = True
+
+
+    @Slot(bool)
+    def show_filter_page(self, visible):
+        """ Populate the FilterPage the first time it is shown for the loaded DB,
+            so that its distinct values are queried only when needed
+
+        Args:
+            visible (bool): True if the FILTERS tab is the current one
+        """
+        self.filter_page_visible = visible
+        if visible and self.loaded_db is not None and not self.filter_lists_loaded:
+            self.load_filter_lists()
+
+
+    def refresh_signal(self, sig_id, select=False):
+        """ Propagate the insertion, edit or deletion of a signal to the signals list
+            and to the FilterPage, without reloading the whole DB. Active filters are kept:
+            a signal not matching them anymore stays listed until they change (the info
+            bar tells the user).
+
+        Args:
+            sig_id (int): SIG_ID of the modified signal
+            select (bool): If true, the signal is selected in the list (e.g. new signals)
+        """
+        signal, is_visible = self.loaded_db.refresh_signal(sig_id)
+        row = self.signal_search.row_of(sig_id)
+
+        if signal is not None and not is_visible:
+            self.kept_signals.add(sig_id)
+            is_visible = True
+        else:
+            self.kept_signals.discard(sig_id)
+
+        is_loaded = self.loaded_sig is not None and self.loaded_sig.sig_id == sig_id
+
+        if is_visible:
+            self.update_sig_list(self.signal_list.upsert, signal)
+            if select or is_loaded:
+                self.load_sig(sig_id)
+        else:
+            self.update_sig_list(self.signal_list.remove, sig_id)
+            if is_loaded:
+                # The next signal of the list is loaded in place of the removed one
+                self.clear_signal_page.emit()
+                self.loaded_sig = None
+                next_sig_id = self.signal_search.sigId(min(row, self.signal_search.rowCount() - 1))
+                if next_sig_id >= 0:
+                    self.load_sig(next_sig_id)
+        self.select_loaded_sig()
+
+        if self.search_text:
+            # The edit may change the search matches and their rank
+            self.search_signals(self.search_text)
+
+        self.loaded_db.refresh_facets()
+        if self.filter_lists_loaded:
+            self.load_filter_lists(merge=True)
+        self.update_signals_count()
+
+
+    def refresh_category_labels(self):
+        """ Propagate the edit of the DB category labels to the FilterPage, to the
+            filtered signals list and to the SignalPage, without reloading the whole DB
+        """
+        self.loaded_db.refresh_facets()
+        if self.filter_lists_loaded:
+            self.load_filter_lists(merge=True)
+
+        if 'category' in self.loaded_db.filter_status:
+            self.loaded_db.select_by_filter(self.loaded_db.filter_status)
+            self.kept_signals.clear()
+            self.update_sig_list(self.signal_list.set_signals, self.loaded_db.filtered_signals)
+            self.update_signals_count()
+        self.reload_sig()
+
+
+    def update_signals_count(self):
+        """ Show the number of listed signals in the info bar
+        """
+        if self.loaded_db.filter_status:
+            total_signals = len(self.loaded_db.filtered_signals)
+            message = "FILTERS ACTIVE: {} signals found".format(total_signals)
+            if self.kept_signals:
+                message += " (+{} edited, not matching the filters)".format(len(self.kept_signals))
+            self.bottom_info_bar(message, "warning")
+        else:
+            total_signals = len(self.loaded_db.all_signals)
+            self.bottom_info_bar("Database loaded with {} signals".format(total_signals), "info")
+
+
+    @Slot(str)
+    def search_signals(self, text):
+        """ Start a full-text search over the whole DB in the background. The SIG_IDs
+            matching the search text are streamed back to the signals list, best matches
+            first. An empty text cancels the running search.
+
+        Args:
+            text (str): text typed in the search bar
+        """
+        self.search_text = text.strip()
+
+        if self.loaded_db is None or not self.search_text:
+            self.search_worker.cancel()
+            self.update_sig_list(self.signal_search.clear_results)
+        else:
+            self.search_worker.search(self.loaded_db, self.search_text)
+
+
+    @Slot(str, list)
+    def show_search_results(self, text, sig_ids):
+        """ Show the first chunk of the search results, unless the search text has changed meanwhile
+        """
+        if text == self.search_text:
+            self.update_sig_list(self.signal_search.set_results, sig_ids)
+
+
+    @Slot(str, list)
+    def show_more_search_results(self, text, sig_ids):
+        """ Add the following chunks of the search results to the list
+        """
+        if text == self.search_text:
+            self.update_sig_list(self.signal_search.add_results, sig_ids)
 
 
     @Slot(dict)
+    @PROFILER.profiled()
     def apply_filter(self, filter_status):
         """ Update the signal list according to the selected filters in the FilterPage.
 
@@ -172,17 +446,13 @@ class UIArtemis(QObject):
         """
         filter_status = filter_status.toVariant()
         if self.loaded_db is not None:
-            if filter_status != {}:
-                filter_query = generate_filter_query(filter_status)
-                self.loaded_db.select_by_filter(filter_query)
-                
-                self.clear_signal_page.emit()
-                self.populate_sig_list.emit(self.loaded_db.all_signals)
+            self.loaded_db.select_by_filter(filter_status)
+            self.kept_signals.clear()
 
-                total_signals = len(self.loaded_db.all_signals)
-                self.bottom_info_bar("FILTERS ACTIVE: {} signals found".format(total_signals), "warning")
-            else:
-                self.load_db(self.loaded_db.db_dir_name)
+            self.clear_signal_page.emit()
+            self.update_sig_list(self.signal_list.set_signals, self.loaded_db.filtered_signals)
+            self.reload_sig()
+            self.update_signals_count()
 
 
     def show_pref_ui(self):
@@ -271,6 +541,7 @@ class UIArtemis(QObject):
         try:
             new_db = ArtemisDatabase(str(uuid.uuid4()))
             new_db.create(name)
+            new_db.close()
             self.load_db(new_db.db_dir_name)
             self.dialog_popup(
                 Messages.DIALOG_TYPE_INFO,
@@ -296,7 +567,7 @@ class UIArtemis(QObject):
             url = QUrl(save_path)
             dest_path = url.toLocalFile()
 
-            make_tar(dest_path, self.loaded_db.db_dir)
+            make_tar(dest_path, self.loaded_db.db_dir, self.loaded_db.media_files())
             self.dialog_popup(
                 Messages.DIALOG_TYPE_INFO,
                 Messages.GENERIC_SUCCESS,
@@ -319,8 +590,7 @@ class UIArtemis(QObject):
         """
         try:
             origin_path = normalize_dialog_path(tar_path)
-            save_path = DATA_DIR / str(uuid.uuid4())
-            unpack_tar(origin_path, save_path)
+            import_database(origin_path).close()
             self.dialog_popup(
                 Messages.DIALOG_TYPE_INFO,
                 Messages.GENERIC_SUCCESS,
@@ -337,13 +607,13 @@ class UIArtemis(QObject):
     @Slot(int)
     def add_cat_tag(self, clb_id):
         self.loaded_sig.insert_category(clb_id)
-        self.load_db(self.loaded_db.db_dir_name)
+        self.refresh_signal(self.loaded_sig.sig_id)
 
 
     @Slot(int)
     def delete_cat_tag(self, cat_id):
         self.loaded_sig.delete_category(cat_id)
-        self.load_db(self.loaded_db.db_dir_name)
+        self.refresh_signal(self.loaded_sig.sig_id)
 
 
     def open_cat_manager(self):
@@ -354,12 +624,29 @@ class UIArtemis(QObject):
 
     def autoload_db(self):
         """ This will autoload the latest local sigID DB, if present
-            according to the user settings
+            according to the user settings. The DB is found and loaded on a
+            worker thread, then shown unless the user has loaded a DB meanwhile.
         """
-        sig_id_db = self.dbmanager.get_latest_local_sigid_db()
         autoload = CONFIGURE_QT.value("Database", "autoload", 0)
-        if sig_id_db is not None and int(autoload):
-            self.load_db(sig_id_db.db_dir_name)
+        if int(autoload):
+            run_in_background(self._load_latest_sigid_db, self._show_autoload_db)
+
+
+    @staticmethod
+    def _load_latest_sigid_db():
+        sig_id_db = get_latest_sigid_db()
+        if sig_id_db is None:
+            return None
+        return open_database(sig_id_db.db_dir_name)
+
+
+    def _show_autoload_db(self, database):
+        if database is None:
+            return
+        if self.loaded_db is None:
+            self.show_db(database)
+        else:
+            database.close()
 
 
     def dialog_popup(self, message_type, title, message):
@@ -1,4 +1,3 @@
-from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtCore import QObject, Signal, Slot
 
 from artemis.utils.path_utils import *
@@ -16,9 +15,7 @@ class UIcategoryeditor(QObject):
 
         self._parent = parent
 
-        self._engine = QQmlApplicationEngine()
-        self._engine.load('qrc:/ui/CategoryEditor.qml')
-        self._window = self._engine.rootObjects()[0]
+        self._window = parent.windows.create_window('qrc:/ui/CategoryEditor.qml')
 
         self._connect()
 
@@ -52,7 +49,7 @@ class UIcategoryeditor(QObject):
         else:
             self._parent.loaded_db.update_category_label(data[1], data[0])
 
-        self._parent.load_db(self._parent.loaded_db.db_dir_name)
+        self._parent.refresh_category_labels()
         self.load_cateditor_ui()
 
 
@@ -63,5 +60,5 @@ class UIcategoryeditor(QObject):
             foreign-key cascade propagation
         """
         self._parent.loaded_db.delete_category_label(clb_id)
-        self._parent.load_db(self._parent.loaded_db.db_dir_name)
+        self._parent.refresh_category_labels()
         self.load_cateditor_ui()
@@ -1,12 +1,8 @@
-import os
-
-from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtCore import QObject, Signal, Slot
 
-from artemis.utils.path_utils import DATA_DIR
 from artemis.utils.generic_utils import *
-from artemis.utils.sql_utils import ArtemisDatabase
-from artemis.utils.sys_utils import delete_dir
+from artemis.utils.sql_utils import ArtemisDatabase, scan_databases, get_latest_sigid_db
+from artemis.utils.profile_utils import PROFILER
 
 
 class UIdbmanager(QObject):
@@ -21,9 +17,7 @@ class UIdbmanager(QObject):
 
         self._parent = parent
 
-        self._engine = QQmlApplicationEngine()
-        self._engine.load('qrc:/ui/DbManager.qml')
-        self._window = self._engine.rootObjects()[0]
+        self._window = parent.windows.create_window('qrc:/ui/DbManager.qml')
 
         self._connect()
 
@@ -77,7 +71,7 @@ class UIdbmanager(QObject):
 
     @Slot(str)
     def delete_db(self, db_dir_name):
-        """ Delete the DB folder.
+        """ Delete the DB folder and release its media files.
             Clear the main UI if the database to be deleted is the selected one 
         """
         if self._parent.loaded_db is not None:
@@ -85,7 +79,8 @@ class UIdbmanager(QObject):
                 self._parent.lock_menu.emit(True)
                 self._parent.clear_list.emit()
                 self._parent.clear_signal_page.emit()
-        delete_dir(DATA_DIR / db_dir_name)
+                self._parent.unload_db()
+        ArtemisDatabase(db_dir_name).delete()
         self.load_local_db_list()
 
 
@@ -95,37 +90,21 @@ class UIdbmanager(QObject):
         """
         database = ArtemisDatabase(db_dir_name)
         database.rename(new_name)
+        database.close()
         self.load_local_db_list()
 
 
+    @PROFILER.profiled()
     def scan_db_dir(self):
         """ Scans the data directory for valid databases and
             return a dictionary containing only the valid ones.
-            Returns a list of objects (dbs)
+            Returns a list of objects (dbs) with only INFO and stats loaded.
         """
-        valid_db_list = []
-        db_dirs = next(os.walk(DATA_DIR))[1]
-
-        for db_dir_name in db_dirs:
-            try:
-                database = ArtemisDatabase(db_dir_name)
-                database.load()
-                valid_db_list.append(database)
-            except:
-                continue
-
-        return valid_db_list
+        return scan_databases()
 
 
     def get_latest_local_sigid_db(self):
         """ Return the newest valid local sigID database.
             Returns None if no valid sigID database is found.
         """
-        valid_dbs = self._parent.dbmanager.scan_db_dir()
-        sig_id_dbs = [db for db in valid_dbs if db.editable == -1]
-
-        if len(sig_id_dbs) != 0:
-            sig_id_latest = max(sig_id_dbs, key=lambda x: x.version)
-            return sig_id_latest
-        else:
-            return None
+        return get_latest_sigid_db()
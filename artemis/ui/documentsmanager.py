@@ -1,4 +1,3 @@
-from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtCore import QObject, Signal, Slot
 
 from artemis.utils.path_utils import *
@@ -18,9 +17,7 @@ class UIdocumentsmanager(QObject):
 
         self._parent = parent
 
-        self._engine = QQmlApplicationEngine()
-        self._engine.load('qrc:/ui/DocumentsManager.qml')
-        self._window = self._engine.rootObjects()[0]
+        self._window = parent.windows.create_window('qrc:/ui/DocumentsManager.qml')
 
         self._connect()
 
@@ -80,9 +77,8 @@ class UIdocumentsmanager(QObject):
             0
         ])
 
-        local_file_name = '{}.{}'.format(str(doc_id), file_extension)
         origin_path = normalize_dialog_path(doc_param[0])
-        copy_file(origin_path, self._parent.loaded_db.media_dir / local_file_name)
+        self._parent.loaded_db.store_document(doc_id, file_extension, origin_path)
         self.load_documents_list()
 
 
@@ -101,7 +97,7 @@ class UIdocumentsmanager(QObject):
         """ Open the selected document with the proper system application (if any)
         """
         try:
-            open_file(self._parent.loaded_db.media_dir / '{}.{}'.format(doc_id, extension))
+            open_file(self._parent.loaded_db.document_path(doc_id, extension))
         except Exception as e:
             self.close_ui.emit()
             self._parent.dialog_popup(
@@ -115,14 +111,11 @@ class UIdocumentsmanager(QObject):
     def delete_doc(self, doc_id, doc_extension, doc_type, doc_preview):
         """ Delete the selected document
         """
-        doc_file_name = '{}.{}'.format(doc_id, doc_extension)
-        doc_file_path = self._parent.loaded_db.media_dir / doc_file_name
-        
         self._parent.loaded_sig.delete_document(doc_id)
         
         if doc_preview:
             if doc_type == 'Audio':
                 self._parent.lock_audio_player.emit()
 
-        delete_file(doc_file_path)
+        self._parent.loaded_db.delete_media([doc_id])
         self.load_documents_list()
@@ -1,8 +1,11 @@
-from PySide6.QtQml import QQmlApplicationEngine
-from PySide6.QtCore import QObject, Slot, Signal, QUrl, QSaveFile, QDir, QIODevice
+from functools import partial
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Slot, Signal, QUrl, QTimer
 from PySide6.QtNetwork import QNetworkReply, QNetworkRequest, QNetworkAccessManager
 
-from artemis.utils.constants import Messages
+from artemis.utils.constants import Constants, Messages
+from artemis.utils.stream_utils import PartialFile
 
 
 class UIDownloader(QObject):
@@ -20,16 +23,25 @@ class UIDownloader(QObject):
 
         self._parent = parent
 
-        self._engine = QQmlApplicationEngine()
-        self._engine.load('qrc:/ui/Downloader.qml')
-        self._window = self._engine.rootObjects()[0]
+        self._window = parent.windows.create_window('qrc:/ui/Downloader.qml')
 
         self.file_url = None
         self.file_size = None
         self.dest_file = None
-        self.file = None
+        self.part = None
+        self.sink = None
         self.manager = QNetworkAccessManager(self)
-        self.reply = None
+        self.probe_reply = None
+        self.replies = {}
+
+        self.retries = 0
+        self._fed = 0
+        self._started = set()
+        self._aborted = False
+
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._get)
 
         self._connect()
 
@@ -47,123 +59,420 @@ class UIDownloader(QObject):
 
 
     def on_start(self, url, save_path):
-        """ Start the download process using the specified URL
+        """ Start the download process using the specified URL. The file is
+            downloaded as <name>.part and resumed if a previous download of the same
+            URL was interrupted. Large files are split in segments, a few of them
+            downloaded at the same time, if the server accepts range requests.
 
         Args:
             url (str): url from where download the file
             save_path (str): path where to save the downloaded file
         """
+        self._start(url, save_path, None)
+
+
+    def on_start_stream(self, url, save_path, sink):
+        """ Start the download process using the specified URL, passing the received
+            data to a sink as well (e.g. a StreamingUnpacker, which hashes and extracts
+            the archive while it is downloaded). The data are saved only as a .part file,
+            removed on success, so that an interrupted download can be resumed. The sink
+            always receives the data in order. The segments are requested in order, so
+            the sink follows the download: the segment right after the bytes it received
+            is passed as it arrives, and a later segment (already on disk) is passed as
+            soon as all the bytes before it are received, while the next ones are still
+            downloading. Only a resumed download reads the bytes of the previous session
+            back from disk.
+            The sink is cancelled on errors, while on success its owner finalizes it
+            after the finished signal.
+
+        Args:
+            url (str): url from where download the file
+            save_path (str): path where to save the partial file
+            sink (object): receiver of the data, with write(bytes), write_file(path, size, offset),
+                reset() and cancel() methods
+        """
+        self._start(url, save_path, sink)
+
+
+    def show_busy(self, status):
+        """ Show the window with an indeterminate progress bar while some work that is not
+            a download is done (e.g. a delta update being applied), until hide_busy()
+
+        Args:
+            status (str): text of the status label
+        """
+        self.show_ui.emit()
+        self.set_indeterminate_bar.emit()
+        self.update_status.emit(status)
+
+
+    def hide_busy(self):
+        self.close_ui.emit()
+        self._clear_ui()
+
+
+    def _start(self, url, save_path, sink):
         self._clear_ui()
         self.show_ui.emit()
 
         self.file_url = QUrl(url)
-        self.file_size = None
-        dest_path = QDir(save_path)
-        self.dest_file = dest_path.filePath(self.file_url.fileName())
-        self.file = QSaveFile(self.dest_file)
-
-        if self.file.open(QIODevice.WriteOnly):
-            # Start a GET HTTP request
-            self.reply = self.manager.get(QNetworkRequest(self.file_url))
-            self.reply.metaDataChanged.connect(self.on_metadata_changed)
-            self.reply.downloadProgress.connect(self.on_progress)
-            self.reply.finished.connect(self.on_finished)
-            self.reply.readyRead.connect(self.on_ready_read)
-            self.reply.errorOccurred.connect(self.on_error)
+        self.dest_file = Path(save_path) / self.file_url.fileName()
+        self.part = PartialFile(self.dest_file)
+        self.sink = sink
+
+        self.retries = 0
+        self._fed = 0
+        self._aborted = False
+
+        try:
+            self.part.open(url)
+        except OSError as e:
+            self.part = None
+            self._stop()
+            self.show_popup_error(e)
+            return
+
+        self.file_size = self.part.total
+
+        if self.part.received == 0 and Constants.DOWNLOAD_SEGMENTS > 1:
+            self._probe()
         else:
-            self.close_ui.emit()
-            self.show_popup_error(self.file.errorString())
+            self._get()
+
+
+    def _probe(self):
+        """ Ask for the headers of the file (HEAD HTTP request), to know whether it
+            can be downloaded in segments
+        """
+        request = QNetworkRequest(self.file_url)
+        request.setTransferTimeout(Constants.DOWNLOAD_TIMEOUT_MS)
+        self.probe_reply = self.manager.head(request)
+        self.probe_reply.finished.connect(self.on_probe_finished)
+
 
     @Slot()
-    def on_metadata_changed(self):
-        """ Read the Content-Length header once the reply's metadata
-            becomes available. If the header is missing, leave
-            file_size as None and set the progress bar to
-            'indeterminate' mode instead.
+    def on_probe_finished(self):
+        """ Split the file in segments if the server accepts range requests and the file
+            is large enough, then start the download. If the probe fails, the download
+            starts anyway as a single stream (and reports the errors, if any)
         """
-        if not self.reply:
+        reply, self.probe_reply = self.probe_reply, None
+        if reply is None:
+            return
+        reply.deleteLater()
+
+        if self._aborted:
+            self._stop()
             return
 
-        content_length = self.reply.header(QNetworkRequest.ContentLengthHeader)
-        if content_length is not None:
-            self.file_size = int(content_length)
+        if reply.error() == QNetworkReply.NoError:
+            accept_ranges = reply.rawHeader('Accept-Ranges').data().decode().lower()
+            content_length = reply.header(QNetworkRequest.ContentLengthHeader)
+            etag = reply.rawHeader('ETag').data().decode() or None
+
+            if accept_ranges == 'bytes' and content_length is not None and int(content_length) >= Constants.DOWNLOAD_SEGMENT_MIN_SIZE:
+                self.part.split(int(content_length), Constants.DOWNLOAD_SEGMENT_SIZE, etag)
+                self.file_size = self.part.total
+
+        self._get()
+
+
+    @Slot()
+    def _get(self):
+        """ Start a GET HTTP request for the first segments not yet downloaded (up to
+            DOWNLOAD_SEGMENTS at the same time, not already requested), asking only for
+            their missing bytes
+        """
+        pending = self.part.pending()
+        if not pending:
+            self._feed_sink()
+            self._complete()
+            return
+
+        requested = set(self.replies.values())
+        for index in pending[:Constants.DOWNLOAD_SEGMENTS]:
+            if index not in requested:
+                self._request(index)
+
+
+    def _request(self, index):
+        start, position, end = self.part.segments[index]
+
+        request = QNetworkRequest(self.file_url)
+        request.setTransferTimeout(Constants.DOWNLOAD_TIMEOUT_MS)
+        if position or end is not None:
+            last = str(end - 1) if end is not None else ''
+            request.setRawHeader(b'Range', 'bytes={}-{}'.format(position, last).encode())
+            if self.part.etag:
+                request.setRawHeader(b'If-Range', self.part.etag.encode())
+
+        reply = self.manager.get(request)
+        self.replies[reply] = index
+        reply.metaDataChanged.connect(partial(self.on_metadata_changed, reply))
+        reply.readyRead.connect(partial(self.on_ready_read, reply))
+        reply.finished.connect(partial(self.on_finished, reply))
+
+
+    def _begin_response(self, reply):
+        """ Once the headers are received, check whether the server sent the requested
+            range (206 Partial Content, same ETag) or the whole file. In the latter case
+            the bytes received so far are dropped and the download goes on as a single stream.
+        """
+        if reply in self._started:
+            return
+
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        if status is not None and status >= 300:
+            return
+
+        index = self.replies[reply]
+        _, position, end = self.part.segments[index]
+        etag = reply.rawHeader('ETag').data().decode() or None
+
+        if status == 206:
+            # Content-Range: bytes <first>-<last>/<total>
+            content_range = reply.rawHeader('Content-Range').data().decode()
+            first, _, total = content_range.partition(' ')[2].partition('/')
+            if first.partition('-')[0] != str(position):
+                self._restart_download()
+                return
+
+            self.file_size = int(total) if total.isdigit() else None
+            self.part.total = self.file_size
+        elif position or end is not None:
+            # Range ignored (or remote file changed): start again with a single request
+            self._restart_download()
+            return
         else:
+            content_length = reply.header(QNetworkRequest.ContentLengthHeader)
+            self.file_size = int(content_length) if content_length is not None else None
+            self.part.restart(etag, self.file_size)
+            if self.sink and self._fed:
+                self.sink.reset()
+            self._fed = 0
+
+        self._started.add(reply)
+        self.part.etag = etag or self.part.etag
+
+        if self.file_size is None:
             self.set_indeterminate_bar.emit()
 
+
+    def _abort_replies(self):
+        """ Abort the running requests, ignoring their finished signals
+        """
+        replies, self.replies = self.replies, {}
+        for reply in replies:
+            self._started.discard(reply)
+            reply.abort()
+            reply.deleteLater()
+
+
+    def _restart_download(self):
+        """ Drop the partial file and download again the whole file
+        """
+        self._abort_replies()
+        self.part.restart()
+        if self.sink and self._fed:
+            self.sink.reset()
+        self._fed = 0
+        self.file_size = None
+        self._get()
+
+
+    def on_metadata_changed(self, reply):
+        """ Read the Content-Length (or Content-Range) header once the reply's
+            metadata becomes available. If it is missing, leave file_size as None
+            and set the progress bar to 'indeterminate' mode instead.
+        """
+        if reply in self.replies:
+            self._begin_response(reply)
+
+
     @Slot()
     def on_abort(self):
-        """ Stop the download when user presses the abort button
+        """ Stop the download when user presses the abort button. The
+            partial file is kept, so that the next download resumes it.
+        """
+        if self.probe_reply:
+            self._aborted = True
+            self.probe_reply.abort()
+        elif self.replies:
+            self._aborted = True
+            self._retry_timer.stop()
+            for reply in list(self.replies):
+                reply.abort()
+        elif self._retry_timer.isActive():
+            self._retry_timer.stop()
+            self._aborted = True
+            self._stop()
+
+
+    def on_ready_read(self, reply):
+        """ Write available bytes to the partial file, at the position of the
+            segment, and pass them to the sink (in order)
         """
-        if self.reply:
-            self.reply.abort()
+        if reply not in self.replies or reply.error() != QNetworkReply.NoError:
+            return
 
+        self._begin_response(reply)
+        if reply not in self._started:
+            return
 
-    @Slot()
-    def on_ready_read(self):
-        """ Write available bytes to the file
+        index = self.replies[reply]
+        data = reply.readAll().data()
+        _, position, end = self.part.segments[index]
+        if end is not None:
+            # Never write over the next segment
+            data = data[:end - position]
+        if not data:
+            return
+
+        self.part.write(data, index)
+        if self.sink:
+            if position == self._fed:
+                self.sink.write(data)
+                self._fed += len(data)
+            self._feed_sink()
+
+        # Any progress restarts the retry count
+        self.retries = 0
+        self._update_progress()
+
+
+    def _feed_sink(self):
+        """ Pass to the sink the bytes already written after the ones it received,
+            up to the first gap in the file (read back by the sink's worker thread):
+            the rest of a segment received while the previous one was downloading
         """
-        if self.reply:
-            if self.reply.error() == QNetworkReply.NoError:
-                self.file.write(self.reply.readAll())
+        if not self.sink:
+            return
 
+        offset = self.part.offset
+        if offset > self._fed:
+            self.part.flush()
+            self.sink.write_file(self.part.part_path, offset - self._fed, self._fed)
+            self._fed = offset
 
-    @Slot()
-    def on_finished(self):
-        """ Finalize the download process and, if no errors
-            occurs, emits the finished signal usefull for
-            a callback
+
+    def on_finished(self, reply):
+        """ Finalize a request. When all the segments are downloaded, emits the
+            finished signal usefull for a callback, otherwise the next segments are
+            requested. The failed segments are resumed after a delay (doubled on every
+            attempt), unless the user aborted the download or the server refused the request.
         """
-        if not self.reply:
+        index = self.replies.pop(reply, None)
+        if index is None:
             return
+        self._started.discard(reply)
+        reply.deleteLater()
 
-        has_error = self.reply.error() != QNetworkReply.NoError
+        error = reply.error()
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
 
-        if self.file:
-            if not has_error:
-                self.file.commit()
+        if error == QNetworkReply.NoError and self.part.segments[index][2] is None:
+            if self.file_size is not None and self.part.segments[index][1] < self.file_size:
+                # Connection closed before the end of the body (not always reported
+                # as an error by Qt): resumed like any other interrupted request
+                error = QNetworkReply.RemoteHostClosedError
             else:
-                self.file.cancelWriting()
+                self.part.close_segment(index)
+
+        if error == QNetworkReply.NoError and self.part.is_complete(index):
+            if not self._retry_timer.isActive():
+                self._get()
+            return
 
-        self.reply.deleteLater()
-        self.reply = None
-        
-        if not has_error:
+        if self._aborted:
+            if not self.replies:
+                self._stop()
+            return
+
+        if status == 416 and self.part.received:
+            # Range Not Satisfiable: the partial file does not match the remote one
+            self._restart_download()
+            return
+
+        if self._is_retryable(status) and self.retries < Constants.DOWNLOAD_RETRIES:
+            if not self._retry_timer.isActive():
+                self.part.save_state()
+                self.retries += 1
+                delay = Constants.DOWNLOAD_RETRY_DELAY_MS * 2**(self.retries - 1)
+                self.update_status.emit(Messages.DOWNLOAD_RETRY_MSG.format(delay // 1000, self.retries, Constants.DOWNLOAD_RETRIES))
+                self._retry_timer.start(delay)
+            return
+
+        # Closing the window aborts the reply, read the error first
+        error_msg = reply.errorString()
+        self._retry_timer.stop()
+        self._abort_replies()
+        self._stop()
+        self.show_popup_error(error_msg)
+
+
+    def _is_retryable(self, status):
+        """ Network errors, timeouts and server errors are temporary, while
+            client errors (e.g. 404) are not (except timeouts and rate limits)
+        """
+        if status is not None and 400 <= status < 500:
+            return status in (408, 429)
+        return True
+
+
+    def _complete(self):
+        part, self.part = self.part, None
+        sink, self.sink = self.sink, None
+
+        if sink:
+            # The sink may still be reading parts of the file: the owner finalizes it
+            # on the finished signal, then the partial file (only kept for resuming) is removed
+            part.close()
             self.finished.emit()
+            part.discard()
+            self.close_ui.emit()
+            return
+
+        try:
+            part.commit()
+        except OSError as e:
+            self.part = part
+            self._stop()
+            self.show_popup_error(e)
+            return
 
+        self.finished.emit()
         self.close_ui.emit()
 
 
-    @Slot(int, int)
-    def on_progress(self, bytesReceived: int, bytesTotal: int):
-        """ Update progress bar and status label
+    def _stop(self):
+        """ Close the partial file (kept for resuming, unless empty), cancel the sink
+            and close the window
+        """
+        if self.part:
+            if self.part.received:
+                self.part.close()
+            else:
+                self.part.discard()
+            self.part = None
+        if self.sink:
+            self.sink.cancel()
+            self.sink = None
+        self.close_ui.emit()
+
 
-            Note: file_size (from the Content-Length header) may not be
-            populated yet on the very first call, since metaDataChanged
-            and the first downloadProgress signal can race. In that case
-            we fall back to bytesTotal for this tick only; file_size
-            takes over on subsequent calls once available.
+    def _update_progress(self):
+        """ Update progress bar and status label with the bytes received by all
+            the segments (including the ones downloaded before a resume)
         """
-        total = self.file_size if self.file_size is not None else bytesTotal
+        received = self.part.received
+        total = self.file_size or 0
 
         if total > 0:
-            self.update_status.emit(f"{bytesReceived/10**6:.1f} Mb / {total/10**6:.1f} Mb")
-            self.update_progress_bar.emit(bytesReceived, total)
+            self.update_status.emit(f"{received/10**6:.1f} Mb / {total/10**6:.1f} Mb")
+            self.update_progress_bar.emit(received, total)
         else:
-            self.update_status.emit(f"{bytesReceived/10**6:.1f} Mb")
-
-
-    @Slot(QNetworkReply.NetworkError)
-    def on_error(self, code: QNetworkReply.NetworkError):
-        """ Show a message if an error happen during download
-        """
-        if code == QNetworkReply.OperationCanceledError:
-            return
+            self.update_status.emit(f"{received/10**6:.1f} Mb")
 
-        if self.reply:
-            self.close_ui.emit()
-            self.show_popup_error(
-                self.reply.errorString()
-            )
 
     def _clear_ui(self):
         self.update_progress_bar.emit(0, 0)
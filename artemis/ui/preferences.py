@@ -1,4 +1,3 @@
-from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtCore import QObject, Slot, Signal
 
 from artemis.utils.config_utils import *
@@ -17,9 +16,7 @@ class UIPreferences(QObject):
 
         self._parent = parent
 
-        self._engine = QQmlApplicationEngine()
-        self._engine.load('qrc:/ui/Preferences.qml')
-        self._window = self._engine.rootObjects()[0]
+        self._window = parent.windows.create_window('qrc:/ui/Preferences.qml')
 
         self._connect()
 
@@ -1,10 +1,8 @@
-from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtCore import QObject, Signal, Slot
 
 from artemis.utils.path_utils import *
 from artemis.utils.generic_utils import *
 from artemis.utils.sql_utils import ArtemisSignal
-from artemis.utils.sys_utils import delete_file
 
 
 class UIsignaleditor(QObject):
@@ -18,9 +16,7 @@ class UIsignaleditor(QObject):
 
         self._parent = parent
 
-        self._engine = QQmlApplicationEngine()
-        self._engine.load('qrc:/ui/SignalEditor.qml')
-        self._window = self._engine.rootObjects()[0]
+        self._window = parent.windows.create_window('qrc:/ui/SignalEditor.qml')
 
         self._connect()
 
@@ -94,7 +90,10 @@ class UIsignaleditor(QObject):
             elif param_type == 'Location':
                 self._parent.loaded_sig.update_location(data[0], data[1], data[2])
 
-        self._parent.load_db(self._parent.loaded_db.db_dir_name)
+        self._parent.refresh_signal(
+            self._parent.loaded_sig.sig_id,
+            select=is_new and param_type == 'Signal'
+        )
 
 
     @Slot(str, int)
@@ -106,10 +105,7 @@ class UIsignaleditor(QObject):
         if param_type == 'Signal':
             self._parent.loaded_sig.delete_signal()
             self._parent.lock_audio_player.emit()
-            for doc in self._parent.loaded_sig.documents:
-                doc_file_name = '{}.{}'.format(str(doc[0]), doc[1])
-                doc_file_path = self._parent.loaded_db.media_dir / doc_file_name
-                delete_file(doc_file_path)
+            self._parent.loaded_db.delete_media([doc[0] for doc in self._parent.loaded_sig.documents])
         elif param_type == 'Frequency':
             self._parent.loaded_sig.delete_frequency(id)
         elif param_type == 'Bandwidth':
@@ -123,4 +119,4 @@ class UIsignaleditor(QObject):
         elif param_type == 'Location':
             self._parent.loaded_sig.delete_location(id)
 
-        self._parent.load_db(self._parent.loaded_db.db_dir_name)
+        self._parent.refresh_signal(self._parent.loaded_sig.sig_id)
@@ -1,4 +1,3 @@
-from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtCore import QObject, Signal
 
 from artemis.utils.path_utils import *
@@ -24,9 +23,7 @@ class UIspaceweather(QObject):
 
         self._parent = parent
 
-        self._engine = QQmlApplicationEngine()
-        self._engine.load('qrc:/ui/SpaceWeather.qml')
-        self._window = self._engine.rootObjects()[0]
+        self._window = parent.windows.create_window('qrc:/ui/SpaceWeather.qml')
 
         self._window_current = self._window.findChild(QObject, "spaceWeatherCurrentObj")
         self._window_forecast = self._window.findChild(QObject, "spaceWeatherForecastObj")
@@ -3,6 +3,8 @@ from configparser import ConfigParser
 from artemis.utils.path_utils import PREFERENCES_DIR, BASE_DIR
 from artemis.utils.sys_utils import copy_file
 
+__all__ = ['Config', 'merge_config_files', 'check_conf_file', 'CONFIGURE_QT']
+
 
 class Config(ConfigParser):
     """ Custom configuration class derived from ConfigParser.
@@ -71,5 +73,13 @@ def check_conf_file():
         merge_config_files(active_conf, template_conf)
 
 
-check_conf_file()
-CONFIGURE_QT = Config((PREFERENCES_DIR / 'qtquickcontrols2.conf').resolve().as_posix())
+def __getattr__(name):
+    """ The conf file is checked and loaded on first access to CONFIGURE_QT,
+        not when the module is imported
+    """
+    if name == 'CONFIGURE_QT':
+        check_conf_file()
+        config = Config((PREFERENCES_DIR / 'qtquickcontrols2.conf').resolve().as_posix())
+        globals()[name] = config
+        return config
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -1,8 +1,6 @@
 import locale
 import sys
 
-from PySide6.QtCore import qVersion
-
 
 class Constants():
     """ Container class for several constants of the software """
@@ -13,6 +11,36 @@ class Constants():
     APPLICATION_VERSION         = '4.1.1'
 
     SQL_NAME                    = 'data.sqlite'
+    SQL_CACHED_STATEMENTS       = 256
+    SQL_SCHEMA_VERSION          = 3
+
+    SEARCH_DEBOUNCE_MS          = 150
+    SEARCH_FIRST_CHUNK          = 100
+    SEARCH_CHUNK_SIZE           = 1000
+    SEARCH_PROGRESS_STEPS       = 1000
+
+    DB_SCAN_WORKERS             = 8
+
+    IDENTIFY_BAND_TOLERANCE     = 0.1
+    IDENTIFY_ACF_TOLERANCE      = 0.02
+    IDENTIFY_CANDIDATES         = 10
+
+    WINDOW_PREWARM_DELAY_MS     = 3000
+
+    DOWNLOAD_RETRIES            = 5
+    DOWNLOAD_RETRY_DELAY_MS     = 1000
+    DOWNLOAD_TIMEOUT_MS         = 30000
+    DOWNLOAD_STATE_INTERVAL     = 4 * 2**20
+    DOWNLOAD_SEGMENTS           = 4
+    DOWNLOAD_SEGMENT_SIZE       = 4 * 2**20
+    DOWNLOAD_SEGMENT_MIN_SIZE   = 8 * 2**20
+    STREAM_QUEUE_CHUNKS         = 64
+
+    DELTA_MEDIA_DIR             = 'media/'
+
+    MEDIA_DIR                   = 'media'
+    MEDIA_STORE_DIR             = 'media'
+    MEDIA_STORE_SQL_NAME        = 'store.sqlite'
 
     LATEST_VERSION_URL          = 'https://raw.githubusercontent.com/AresValley/Artemis/master/config/release-info.json'
     POSEIDON_REPORT_URL         = 'https://www.aresvalley.com/poseidon_engine/data.json'
@@ -20,7 +48,6 @@ class Constants():
     DEFAULT_ENCODING            = 'utf-8'
     SYSTEM_LANGUAGE             = 'en_US' # locale.getdefaultlocale()[0]
     PYTHON_VERSION              = '.'.join(str(v) for v in sys.version_info[:3])
-    QT_VERSION                  = qVersion()
 
 
 class Messages:
@@ -54,7 +81,10 @@ class Messages:
     ART_NEW_VER_MANUAL_MSG      = "A new version of Artemis ({}) is available for download. Check GitHub page now?"
     ART_NEW_VER_AUTO_MSG        = "A new version of Artemis ({}) is available for download. Update Artemis now?"
     DB_CORRUPTED_MSG            = "Downloaded data corrupted or invalid. Please retry."
+    DOWNLOAD_RETRY_MSG          = "Connection lost, retrying in {} s ({}/{})..."
     DB_DOWNLOAD_SUCCESS_MSG     = "The database has been successfully downloaded and is now being loaded."
+    DB_DELTA_STATUS_MSG         = "Updating the database..."
+    DB_DELTA_FAILED_MSG         = "The delta update failed, the whole database is downloaded. Details: {}"
 
 
 class Query():
@@ -70,6 +100,8 @@ class Query():
     
     SELECT_SIG_ID = "SELECT SIG_ID, NAME, DESCRIPTION FROM signals WHERE SIG_ID IN ({}) ORDER BY NAME ASC"
 
+    SELECT_SIG_ROW = "SELECT SIG_ID, NAME, DESCRIPTION FROM signals WHERE SIG_ID = ?"
+
     SELECT_ALL_CAT_LABELS = "SELECT CLB_ID, VALUE FROM category_label ORDER BY VALUE ASC"
     
     SELECT_INFO = """
@@ -81,22 +113,77 @@ class Query():
         FROM info
     """
 
-    SELECT_SIGNAL = """
+    SELECT_INFO_COLUMNS = "PRAGMA table_info(info)"
+
+    SELECT_SCHEMA_VERSION = "SELECT SCHEMA_VERSION FROM info"
+
+    # Each child table is aggregated from a sorted subquery: without ORDER BY, the order
+    # of the rows would depend on the index chosen by SQLite
+    SELECT_SIGNAL_DETAILS = """
         SELECT
-            NAME,
-            DESCRIPTION,
-            URL
+            signals.NAME,
+            signals.DESCRIPTION,
+            signals.URL,
+            (
+                SELECT json_group_array(json_array(CAT_ID, VALUE)) FROM (
+                    SELECT category.CAT_ID, category_label.VALUE
+                    FROM category
+                    INNER JOIN category_label ON category.CLB_ID = category_label.CLB_ID
+                    WHERE category.SIG_ID = signals.SIG_ID
+                    ORDER BY category.CAT_ID
+                )
+            ),
+            (
+                SELECT json_group_array(json_array(FREQ_ID, VALUE, DESCRIPTION)) FROM (
+                    SELECT FREQ_ID, VALUE, DESCRIPTION
+                    FROM frequency WHERE frequency.SIG_ID = signals.SIG_ID
+                    ORDER BY FREQ_ID
+                )
+            ),
+            (
+                SELECT json_group_array(json_array(BAND_ID, VALUE, DESCRIPTION)) FROM (
+                    SELECT BAND_ID, VALUE, DESCRIPTION
+                    FROM bandwidth WHERE bandwidth.SIG_ID = signals.SIG_ID
+                    ORDER BY BAND_ID
+                )
+            ),
+            (
+                SELECT json_group_array(json_array(MDL_ID, VALUE, DESCRIPTION)) FROM (
+                    SELECT MDL_ID, VALUE, DESCRIPTION
+                    FROM modulation WHERE modulation.SIG_ID = signals.SIG_ID
+                    ORDER BY MDL_ID
+                )
+            ),
+            (
+                SELECT json_group_array(json_array(MOD_ID, VALUE, DESCRIPTION)) FROM (
+                    SELECT MOD_ID, VALUE, DESCRIPTION
+                    FROM mode WHERE mode.SIG_ID = signals.SIG_ID
+                    ORDER BY MOD_ID
+                )
+            ),
+            (
+                SELECT json_group_array(json_array(LOC_ID, VALUE, DESCRIPTION)) FROM (
+                    SELECT LOC_ID, VALUE, DESCRIPTION
+                    FROM location WHERE location.SIG_ID = signals.SIG_ID
+                    ORDER BY LOC_ID
+                )
+            ),
+            (
+                SELECT json_group_array(json_array(ACF_ID, VALUE, DESCRIPTION)) FROM (
+                    SELECT ACF_ID, VALUE, DESCRIPTION
+                    FROM acf WHERE acf.SIG_ID = signals.SIG_ID
+                    ORDER BY ACF_ID
+                )
+            ),
+            (
+                SELECT json_group_array(json_array(DOC_ID, EXTENSION, NAME, DESCRIPTION, TYPE, PREVIEW)) FROM (
+                    SELECT DOC_ID, EXTENSION, NAME, DESCRIPTION, TYPE, PREVIEW
+                    FROM documents WHERE documents.SIG_ID = signals.SIG_ID
+                    ORDER BY TYPE ASC, DOC_ID
+                )
+            )
         FROM signals WHERE SIG_ID = ?
     """
-    
-    SELECT_CATEGORY = """
-        SELECT
-            category.CAT_ID,
-            category_label.VALUE
-        FROM category
-        INNER JOIN category_label ON category.CLB_ID = category_label.CLB_ID
-        WHERE SIG_ID = ?
-    """
 
     SELECT_DOCUMENTS = """
         SELECT
@@ -105,75 +192,47 @@ class Query():
             NAME,
             DESCRIPTION,
             TYPE,
-            PREVIEW 
+            PREVIEW
         FROM documents WHERE SIG_ID = ?
         ORDER BY TYPE ASC
     """
 
-    SELECT_FREQUENCY = """
-        SELECT
-            FREQ_ID,
-            VALUE,
-            DESCRIPTION
-        FROM frequency WHERE SIG_ID = ?
-    """
+    SELECT_DOCUMENT_FILES = "SELECT DOC_ID, EXTENSION FROM documents"
 
-    SELECT_BANDWIDTH = """
-        SELECT
-            BAND_ID,
-            VALUE,
-            DESCRIPTION
-        FROM bandwidth WHERE SIG_ID = ?
-    """
+    SELECT_FREQ_RANGES = "SELECT SIG_ID, MIN_VALUE, MAX_VALUE FROM FREQ_RANGE WHERE MIN_VALUE IS NOT NULL"
 
-    SELECT_MODULATION = """
-        SELECT
-            MDL_ID,
-            VALUE,
-            DESCRIPTION
-        FROM modulation WHERE SIG_ID = ?
-    """
+    SELECT_BAND_RANGES = "SELECT SIG_ID, MIN_VALUE, MAX_VALUE FROM BAND_RANGE WHERE MIN_VALUE IS NOT NULL"
 
-    SELECT_MODE= """
-        SELECT
-            MOD_ID,
-            VALUE,
-            DESCRIPTION
-        FROM mode WHERE SIG_ID = ?
-    """
+    SELECT_ACF_RANGES = "SELECT SIG_ID, VALUE, VALUE FROM acf WHERE SIG_ID IS NOT NULL AND VALUE IS NOT NULL"
 
-    SELECT_LOCATION = """
-        SELECT
-            LOC_ID,
-            VALUE,
-            DESCRIPTION
-        FROM location WHERE SIG_ID = ?
-    """
+    SELECT_SIGNAL_FREQ_RANGES = "SELECT SIG_ID, MIN_VALUE, MAX_VALUE FROM FREQ_RANGE WHERE MIN_VALUE IS NOT NULL AND SIG_ID = ?"
 
-    SELECT_ACF = """
-        SELECT
-            ACF_ID,
-            VALUE,
-            DESCRIPTION
-        FROM acf WHERE SIG_ID = ?
-    """
+    SELECT_SIGNAL_BAND_RANGES = "SELECT SIG_ID, MIN_VALUE, MAX_VALUE FROM BAND_RANGE WHERE MIN_VALUE IS NOT NULL AND SIG_ID = ?"
 
-    SELECT_STAT_DOCS = """
-        SELECT COUNT(*)
-            FROM documents
-    """
-    
-    SELECT_STAT_IMAGES = """
-        SELECT COUNT(*)
-            FROM documents
-        WHERE type IS 'Image'
+    SELECT_SIGNAL_ACF_RANGES = "SELECT SIG_ID, VALUE, VALUE FROM acf WHERE VALUE IS NOT NULL AND SIG_ID = ?"
+
+    # Range filter > (query for all the signals, query for a single signal)
+    SELECT_RANGES = {
+        'frequency': (SELECT_FREQ_RANGES, SELECT_SIGNAL_FREQ_RANGES),
+        'bandwidth': (SELECT_BAND_RANGES, SELECT_SIGNAL_BAND_RANGES),
+        'acf': (SELECT_ACF_RANGES, SELECT_SIGNAL_ACF_RANGES)
+    }
+
+    # bm25 weights: NAME, DESCRIPTION, PARAMETERS (lower is a better match)
+    SEARCH_SIGNALS = """
+        SELECT rowid
+        FROM signals_search
+        WHERE signals_search MATCH ?
+        ORDER BY bm25(signals_search, 10.0, 2.0, 1.0)
     """
 
-    SELECT_STAT_AUDIO = """
-        SELECT COUNT(*)
-            FROM documents
-        WHERE type IS 'Audio'
-    """    
+    SELECT_STATS = """
+        SELECT
+            (SELECT COUNT(*) FROM signals),
+            (SELECT COUNT(*) FROM documents),
+            (SELECT COUNT(*) FROM documents WHERE type IS 'Image'),
+            (SELECT COUNT(*) FROM documents WHERE type IS 'Audio')
+    """
 
 ############################## CREATE
 
@@ -273,31 +332,14 @@ class Query():
 
     CREATE_INFO = """
         CREATE TABLE info (
-            NAME        TEXT,
-            DATE        TEXT,
-            VERSION     INTEGER,
-            EDITABLE    INTEGER
+            NAME            TEXT,
+            DATE            TEXT,
+            VERSION         INTEGER,
+            EDITABLE        INTEGER,
+            SCHEMA_VERSION  INTEGER DEFAULT 0
         )   
     """
 
-    CREATE_VIEW_FREQ = """
-        CREATE VIEW FREQ_RANGE AS
-            SELECT SIG_ID,
-                MIN(VALUE) AS MIN_VALUE,
-                MAX(VALUE) AS MAX_VALUE
-            FROM frequency
-            GROUP BY SIG_ID
-    """        
-
-    CREATE_VIEW_BAND = """
-        CREATE VIEW BAND_RANGE AS
-            SELECT SIG_ID,
-                MIN(VALUE) AS MIN_VALUE,
-                MAX(VALUE) AS MAX_VALUE
-            FROM bandwidth
-            GROUP BY SIG_ID 
-    """
-
 ############################## INSERT
 
     INSERT_SIGNAL = """
@@ -392,6 +434,8 @@ class Query():
 
     RENAME_DB = "UPDATE info SET NAME = ?"
 
+    UPDATE_SCHEMA_VERSION = "UPDATE info SET SCHEMA_VERSION = ?"
+
     UPDATE_SIGNAL = """
         UPDATE signals SET
             NAME = ?,
@@ -480,14 +524,221 @@ class Query():
 
 ############################## FILTER QUERY
 
-    FILTER_FREQ = "SELECT SIG_ID FROM FREQ_RANGE WHERE ({} >= MIN_VALUE) AND ({} <= MAX_VALUE)"
+    FILTER_FREQ = "SELECT SIG_ID FROM FREQ_RANGE WHERE (? >= MIN_VALUE) AND (? <= MAX_VALUE)"
 
-    FILTER_BAND = "SELECT SIG_ID FROM BAND_RANGE WHERE ({} >= MIN_VALUE) AND ({} <= MAX_VALUE)"
+    FILTER_BAND = "SELECT SIG_ID FROM BAND_RANGE WHERE (? >= MIN_VALUE) AND (? <= MAX_VALUE)"
 
-    FILTER_ACF = "SELECT SIG_ID FROM acf WHERE ({} >= VALUE) AND ({} <= VALUE)"
+    FILTER_ACF = "SELECT SIG_ID FROM acf WHERE (? >= VALUE) AND (? <= VALUE)"
 
     FILTER_MODULATION = "SELECT SIG_ID FROM modulation WHERE VALUE IN ({})"
 
     FILTER_LOCATION = "SELECT SIG_ID FROM location WHERE VALUE IN ({})"
 
     FILTER_CATEGORY = "SELECT SIG_ID FROM category WHERE CLB_ID IN ({})"
+
+############################## MIGRATION
+
+    ADD_SCHEMA_VERSION = "ALTER TABLE info ADD COLUMN SCHEMA_VERSION INTEGER DEFAULT 0"
+
+    CREATE_INDEXES = [
+        "CREATE INDEX IF NOT EXISTS idx_signals_name ON signals (NAME)",
+        "CREATE INDEX IF NOT EXISTS idx_category_sig ON category (SIG_ID, CLB_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_category_clb ON category (CLB_ID, SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_frequency_sig ON frequency (SIG_ID, VALUE)",
+        "CREATE INDEX IF NOT EXISTS idx_frequency_value ON frequency (VALUE, SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_bandwidth_sig ON bandwidth (SIG_ID, VALUE)",
+        "CREATE INDEX IF NOT EXISTS idx_bandwidth_value ON bandwidth (VALUE, SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_modulation_sig ON modulation (SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_modulation_value ON modulation (VALUE, SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_mode_sig ON mode (SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_location_sig ON location (SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_location_value ON location (VALUE, SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_acf_sig ON acf (SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_acf_value ON acf (VALUE, SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_documents_sig ON documents (SIG_ID)",
+        "CREATE INDEX IF NOT EXISTS idx_documents_type ON documents (TYPE)"
+    ]
+
+    # Replaces the legacy FREQ_RANGE/BAND_RANGE views with tables kept up to date by triggers
+    MATERIALIZE_RANGE = [
+        "DROP VIEW IF EXISTS {range_table}",
+        """
+            CREATE TABLE IF NOT EXISTS {range_table} (
+                SIG_ID      INTEGER PRIMARY KEY,
+                MIN_VALUE   INTEGER,
+                MAX_VALUE   INTEGER
+            )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_{table}_range ON {range_table} (MIN_VALUE, MAX_VALUE)",
+        """
+            INSERT OR REPLACE INTO {range_table} (SIG_ID, MIN_VALUE, MAX_VALUE)
+                SELECT SIG_ID, MIN(VALUE), MAX(VALUE)
+                FROM {table}
+                WHERE SIG_ID IS NOT NULL
+                GROUP BY SIG_ID
+        """,
+        """
+            CREATE TRIGGER IF NOT EXISTS {table}_range_insert AFTER INSERT ON {table}
+            BEGIN
+                INSERT OR REPLACE INTO {range_table} (SIG_ID, MIN_VALUE, MAX_VALUE)
+                    SELECT SIG_ID, MIN(VALUE), MAX(VALUE)
+                    FROM {table}
+                    WHERE SIG_ID = NEW.SIG_ID
+                    GROUP BY SIG_ID;
+            END
+        """,
+        """
+            CREATE TRIGGER IF NOT EXISTS {table}_range_update AFTER UPDATE OF SIG_ID, VALUE ON {table}
+            BEGIN
+                DELETE FROM {range_table} WHERE SIG_ID IN (OLD.SIG_ID, NEW.SIG_ID);
+                INSERT INTO {range_table} (SIG_ID, MIN_VALUE, MAX_VALUE)
+                    SELECT SIG_ID, MIN(VALUE), MAX(VALUE)
+                    FROM {table}
+                    WHERE SIG_ID IN (OLD.SIG_ID, NEW.SIG_ID)
+                    GROUP BY SIG_ID;
+            END
+        """,
+        """
+            CREATE TRIGGER IF NOT EXISTS {table}_range_delete AFTER DELETE ON {table}
+            BEGIN
+                DELETE FROM {range_table} WHERE SIG_ID = OLD.SIG_ID;
+                INSERT INTO {range_table} (SIG_ID, MIN_VALUE, MAX_VALUE)
+                    SELECT SIG_ID, MIN(VALUE), MAX(VALUE)
+                    FROM {table}
+                    WHERE SIG_ID = OLD.SIG_ID
+                    GROUP BY SIG_ID;
+            END
+        """
+    ]
+
+    MATERIALIZE_FREQ_RANGE = [query.format(range_table='FREQ_RANGE', table='frequency') for query in MATERIALIZE_RANGE]
+
+    MATERIALIZE_BAND_RANGE = [query.format(range_table='BAND_RANGE', table='bandwidth') for query in MATERIALIZE_RANGE]
+
+    # Text of the parameters (values and descriptions of the child tables) indexed for the signal {sig_id}
+    SEARCH_PARAMETERS = """
+        (
+            SELECT group_concat(TEXT, ' ') FROM (
+                SELECT DESCRIPTION AS TEXT FROM frequency WHERE SIG_ID = {sig_id}
+                UNION ALL SELECT DESCRIPTION FROM bandwidth WHERE SIG_ID = {sig_id}
+                UNION ALL SELECT VALUE FROM modulation WHERE SIG_ID = {sig_id}
+                UNION ALL SELECT DESCRIPTION FROM modulation WHERE SIG_ID = {sig_id}
+                UNION ALL SELECT VALUE FROM mode WHERE SIG_ID = {sig_id}
+                UNION ALL SELECT DESCRIPTION FROM mode WHERE SIG_ID = {sig_id}
+                UNION ALL SELECT VALUE FROM location WHERE SIG_ID = {sig_id}
+                UNION ALL SELECT DESCRIPTION FROM location WHERE SIG_ID = {sig_id}
+                UNION ALL SELECT DESCRIPTION FROM acf WHERE SIG_ID = {sig_id}
+            )
+        )
+    """
+
+    # Rebuild the search entry of the signal {sig_id} (nothing is inserted if the signal does not exist)
+    SEARCH_REINDEX = """
+        DELETE FROM signals_search WHERE rowid = {sig_id};
+        INSERT INTO signals_search (rowid, NAME, DESCRIPTION, PARAMETERS)
+            SELECT SIG_ID, NAME, DESCRIPTION, """ + SEARCH_PARAMETERS + """
+            FROM signals
+            WHERE SIG_ID = {sig_id};
+    """
+
+    SEARCH_REINDEX_NEW = SEARCH_REINDEX.format(sig_id='NEW.SIG_ID')
+
+    SEARCH_REINDEX_OLD = SEARCH_REINDEX.format(sig_id='OLD.SIG_ID')
+
+    # Triggers keeping signals_search up to date, for each child table {table}
+    SEARCH_CHILD_TRIGGERS = [
+        "CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} BEGIN" + SEARCH_REINDEX_NEW + "END",
+        "CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE ON {table} BEGIN" + SEARCH_REINDEX_OLD + SEARCH_REINDEX_NEW + "END",
+        "CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN" + SEARCH_REINDEX_OLD + "END"
+    ]
+
+    # Full-text index (FTS5) of the signals, one row per signal with rowid = SIG_ID
+    CREATE_SEARCH_INDEX = [
+        """
+            CREATE VIRTUAL TABLE IF NOT EXISTS signals_search USING fts5 (
+                NAME,
+                DESCRIPTION,
+                PARAMETERS,
+                tokenize = 'unicode61 remove_diacritics 2'
+            )
+        """,
+        "DELETE FROM signals_search",
+        """
+            INSERT INTO signals_search (rowid, NAME, DESCRIPTION, PARAMETERS)
+                SELECT SIG_ID, NAME, DESCRIPTION, """ + SEARCH_PARAMETERS.format(sig_id='signals.SIG_ID') + """
+                FROM signals
+        """,
+        "CREATE TRIGGER IF NOT EXISTS signals_search_insert AFTER INSERT ON signals BEGIN" + SEARCH_REINDEX_NEW + "END",
+        "CREATE TRIGGER IF NOT EXISTS signals_search_update AFTER UPDATE ON signals BEGIN" + SEARCH_REINDEX_OLD + SEARCH_REINDEX_NEW + "END",
+        "CREATE TRIGGER IF NOT EXISTS signals_search_delete AFTER DELETE ON signals BEGIN" + SEARCH_REINDEX_OLD + "END"
+    ] + [
+        query.format(table=table)
+        for query in SEARCH_CHILD_TRIGGERS
+        for table in ('frequency', 'bandwidth', 'modulation', 'mode', 'location', 'acf')
+    ]
+
+    # Schema version > statements needed to reach it from the previous version
+    MIGRATIONS = {
+        1: CREATE_INDEXES,
+        2: MATERIALIZE_FREQ_RANGE + MATERIALIZE_BAND_RANGE,
+        3: CREATE_SEARCH_INDEX
+    }
+
+############################## DELTA UPDATE
+
+    # Tables compared by the delta updates, parents first (rows are matched by rowid)
+    DELTA_TABLES = [
+        'category_label',
+        'signals',
+        'category',
+        'documents',
+        'frequency',
+        'bandwidth',
+        'modulation',
+        'mode',
+        'location',
+        'acf'
+    ]
+
+    SELECT_DELTA_ROWS = "SELECT rowid, {columns} FROM {table} ORDER BY rowid"
+
+    SELECT_DELTA_COLUMNS = "PRAGMA table_info({table})"
+
+    UPDATE_DELTA_INFO = "UPDATE info SET VERSION = {version}, DATE = {date};"
+
+############################## MEDIA STORE
+
+    CREATE_STORE_BLOBS = """
+        CREATE TABLE IF NOT EXISTS blobs (
+            BLOB        TEXT PRIMARY KEY,
+            SIZE        INTEGER
+        )
+    """
+
+    # One reference for each document (of any DB) using the file
+    CREATE_STORE_REFS = """
+        CREATE TABLE IF NOT EXISTS refs (
+            DB          TEXT,
+            DOC_ID      INTEGER,
+            BLOB        TEXT,
+            PRIMARY KEY (DB, DOC_ID)
+        )
+    """
+
+    CREATE_STORE_REFS_INDEX = "CREATE INDEX IF NOT EXISTS idx_refs_blob ON refs (BLOB)"
+
+    INSERT_STORE_BLOB = "INSERT OR IGNORE INTO blobs (BLOB, SIZE) VALUES (?,?)"
+
+    INSERT_STORE_REF = "INSERT OR REPLACE INTO refs (DB, DOC_ID, BLOB) VALUES (?,?,?)"
+
+    SELECT_STORE_REFS = "SELECT DOC_ID, BLOB FROM refs WHERE DB = ?"
+
+    SELECT_STORE_REF = "SELECT BLOB FROM refs WHERE DB = ? AND DOC_ID = ?"
+
+    SELECT_STORE_REF_COUNT = "SELECT COUNT(*) FROM refs WHERE BLOB = ?"
+
+    SELECT_STORE_STATS = "SELECT COUNT(*), COALESCE(SUM(SIZE), 0) FROM blobs"
+
+    DELETE_STORE_REF = "DELETE FROM refs WHERE DB = ? AND DOC_ID = ?"
+
+    DELETE_STORE_BLOB = "DELETE FROM blobs WHERE BLOB = ?"
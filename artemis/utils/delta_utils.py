@@ -0,0 +1,237 @@
+import os
+import json
+import shutil
+import sqlite3
+import hashlib
+import requests
+
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urljoin, quote
+
+from artemis.utils.constants import Constants, Query
+from artemis.utils.stream_utils import StreamingUnpacker, HashMismatchError
+from artemis.utils.sys_utils import file_hash
+from artemis.utils.profile_utils import PROFILER
+
+
+class DeltaError(Exception):
+    """ The delta cannot be applied to the local database """
+
+
+def _delta_columns(conn, table):
+    """ Columns of a table compared by the deltas
+    """
+    return [column[1] for column in conn.execute(Query.SELECT_DELTA_COLUMNS.format(table=table))]
+
+
+def _select_rows(conn, table, columns):
+    return conn.execute(Query.SELECT_DELTA_ROWS.format(table=table, columns=', '.join(columns)))
+
+
+def content_hash(sql_path):
+    """ Return the SHA-256 hash of the content of the DB tables compared by the deltas.
+        Unlike the hash of the sqlite file, it does not depend on the page layout,
+        on the derived tables (ranges, search index) or on the schema migrations.
+
+    Args:
+        sql_path (Path): path of the sqlite file
+    """
+    code = hashlib.sha256()
+    with closing(sqlite3.connect(sql_path)) as conn:
+        for table in Query.DELTA_TABLES:
+            code.update(table.encode())
+            for row in _select_rows(conn, table, _delta_columns(conn, table)):
+                code.update(json.dumps(row).encode())
+    return code.hexdigest()
+
+
+def media_manifest(database):
+    """ Return the {file name: {sha256, size}} description of the media files of a DB
+    """
+    return {
+        file_name: {'sha256': file_hash(path), 'size': path.stat().st_size}
+        for file_name, path in database.media_files()
+    }
+
+
+def _sql_literal(value):
+    if value is None:
+        return 'NULL'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, bytes):
+        return "X'{}'".format(value.hex())
+    return "'{}'".format(str(value).replace("'", "''"))
+
+
+def _table_rows(conn, table):
+    columns = _delta_columns(conn, table)
+    rows = {row[0]: row[1:] for row in _select_rows(conn, table, columns)}
+    return columns, rows
+
+
+def _diff_sql(base_sql_path, new_sql_path, version):
+    """ Return the SQL statements turning the content of the base DB into the new one.
+        Rows are deleted from the children tables first and inserted in the parents first,
+        so that the script can run with the foreign keys enforced.
+    """
+    deletes, changes = [], []
+
+    with closing(sqlite3.connect(base_sql_path)) as base, closing(sqlite3.connect(new_sql_path)) as new:
+        for table in Query.DELTA_TABLES:
+            columns, base_rows = _table_rows(base, table)
+            _, new_rows = _table_rows(new, table)
+            key = columns[0]
+
+            deletes.append([
+                'DELETE FROM {} WHERE {} = {};'.format(table, key, rowid)
+                for rowid in sorted(base_rows.keys() - new_rows.keys())
+            ])
+
+            for rowid, row in new_rows.items():
+                old_row = base_rows.get(rowid)
+                if old_row is None:
+                    changes.append('INSERT INTO {} ({}) VALUES ({});'.format(
+                        table, ', '.join(columns), ', '.join(map(_sql_literal, row))
+                    ))
+                elif old_row != row:
+                    assignments = [
+                        '{} = {}'.format(column, _sql_literal(value))
+                        for column, value, old_value in zip(columns[1:], row[1:], old_row[1:]) if value != old_value
+                    ]
+                    changes.append('UPDATE {} SET {} WHERE {} = {};'.format(table, ', '.join(assignments), key, rowid))
+
+    statements = [statement for table_deletes in reversed(deletes) for statement in table_deletes]
+    statements += changes
+    statements.append(Query.UPDATE_DELTA_INFO.format(version=int(version), date=_sql_literal(str(datetime.now()))))
+    return '\n'.join(statements) + '\n'
+
+
+def make_delta(base_db, new_db, output_dir):
+    """ Write the delta updating base_db to new_db in output_dir: the JSON manifest
+        (v<from>-v<to>.json), the SQL patch (v<from>-v<to>.sql) and the media files
+        added or changed (media/). Returns the path of the manifest.
+
+    Args:
+        base_db (ArtemisDatabase): previous version of the sigID DB (loaded)
+        new_db (ArtemisDatabase): new version of the sigID DB (loaded)
+        output_dir (Path): folder where the delta is saved
+    """
+    name = 'v{}-v{}'.format(base_db.version, new_db.version)
+    output_dir = Path(output_dir)
+    os.makedirs(output_dir / Constants.DELTA_MEDIA_DIR, exist_ok=True)
+
+    patch = _diff_sql(base_db.sql_path, new_db.sql_path, new_db.version).encode(Constants.DEFAULT_ENCODING)
+    (output_dir / (name + '.sql')).write_bytes(patch)
+
+    base_media = media_manifest(base_db)
+    new_media = media_manifest(new_db)
+    new_paths = dict(new_db.media_files())
+    for file_name, entry in new_media.items():
+        if base_media.get(file_name) != entry:
+            shutil.copy2(new_paths[file_name], output_dir / Constants.DELTA_MEDIA_DIR / file_name)
+
+    manifest = {
+        'from_version': base_db.version,
+        'to_version': new_db.version,
+        'patch': name + '.sql',
+        'patch_sha256': hashlib.sha256(patch).hexdigest(),
+        'content_hash': content_hash(new_db.sql_path),
+        'media_url': Constants.DELTA_MEDIA_DIR,
+        'media': new_media
+    }
+    manifest_path = output_dir / (name + '.json')
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    return manifest_path
+
+
+def _fetch(url, reference_hash):
+    """ Download a (small) file in memory and check its SHA-256 hash
+    """
+    response = requests.get(url, timeout=Constants.DOWNLOAD_TIMEOUT_MS / 1000)
+    response.raise_for_status()
+    if hashlib.sha256(response.content).hexdigest() != reference_hash:
+        raise HashMismatchError(url)
+    return response.content
+
+
+def _download(url, path, reference_hash):
+    """ Download a file, checking its SHA-256 hash while it is received
+    """
+    code = hashlib.sha256()
+    with requests.get(url, stream=True, timeout=Constants.DOWNLOAD_TIMEOUT_MS / 1000) as response:
+        response.raise_for_status()
+        with open(path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=2**16):
+                code.update(chunk)
+                f.write(chunk)
+
+    if code.hexdigest() != reference_hash:
+        raise HashMismatchError(url)
+
+
+@PROFILER.profiled('net')
+def apply_delta(manifest_url, manifest_hash, base_db, destination):
+    """ Build a new version of a sigID DB from the local one and a remote delta: the SQL
+        patch is applied to a copy of the local sqlite file and only the media files
+        missing from the media store are downloaded (the unchanged ones are shared with
+        the local DB). Everything is verified (SHA-256 of the manifest, of the patch and
+        of each media file, content hash of the patched DB) before the new DB is moved
+        to its destination. Returns the number of media files downloaded.
+
+    Args:
+        manifest_url (str): url of the JSON manifest of the delta
+        manifest_hash (str): expected SHA-256 hash of the manifest
+        base_db (ArtemisDatabase): local sigID DB, as probed by scan_databases (its version, sqlite file and media store are used)
+        destination (Path): folder of the new DB (must not exist)
+    """
+    manifest = json.loads(_fetch(manifest_url, manifest_hash))
+    if manifest['from_version'] != base_db.version:
+        raise DeltaError('The delta applies to version {}, local version is {}'.format(manifest['from_version'], base_db.version))
+
+    store = base_db.store
+    staging = destination.parent / StreamingUnpacker.STAGING_DIR / destination.name
+    os.makedirs(staging / Constants.MEDIA_DIR)
+    downloaded = []
+
+    try:
+        patch = _fetch(urljoin(manifest_url, manifest['patch']), manifest['patch_sha256'])
+
+        sql_path = staging / Constants.SQL_NAME
+        with closing(sqlite3.connect(base_db.sql_path)) as source, closing(sqlite3.connect(sql_path)) as target:
+            source.backup(target)
+            target.execute('PRAGMA foreign_keys = ON;')
+            try:
+                target.executescript('BEGIN;\n' + patch.decode(Constants.DEFAULT_ENCODING) + 'COMMIT;')
+            except sqlite3.Error as e:
+                raise DeltaError('The patch cannot be applied: {}'.format(e))
+
+        if content_hash(sql_path) != manifest['content_hash']:
+            raise DeltaError('The patched database does not match the new version')
+
+        media_url = urljoin(manifest_url, manifest['media_url'])
+        doc_blobs = []
+        for file_name, entry in manifest['media'].items():
+            doc_id, _, extension = file_name.partition('.')
+            blob = store.blob_name(entry['sha256'], extension)
+            if not store.has(blob):
+                temp_path = staging / Constants.MEDIA_DIR / file_name
+                _download(urljoin(media_url, quote(file_name)), temp_path, entry['sha256'])
+                downloaded.append(store.add_file(temp_path, extension, move=True))
+            doc_blobs.append((int(doc_id), blob))
+
+        # The references are written first: the new DB never shows up without its media
+        store.add_refs(destination.name, doc_blobs)
+        try:
+            os.replace(staging, destination)
+        except BaseException:
+            store.release(destination.name)
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+        # Blobs downloaded for a delta that failed
+        store.collect(downloaded)
+
+    return len(downloaded)
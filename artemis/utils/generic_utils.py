@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 
 from artemis.utils.constants import Query
 
@@ -32,53 +33,79 @@ def _change_unit_freq(freq_hz):
         return 10**9, 'GHz'
 
 
+# Filter key > (query, True if the filter is a range, False if it is a list of values)
+FILTER_QUERIES = {
+    'frequency': (Query.FILTER_FREQ, True),
+    'bandwidth': (Query.FILTER_BAND, True),
+    'acf': (Query.FILTER_ACF, True),
+    'modulation': (Query.FILTER_MODULATION, False),
+    'location': (Query.FILTER_LOCATION, False),
+    'category': (Query.FILTER_CATEGORY, False)
+}
+
+
 def generate_filter_query(filer_status):
-    """ Returns the sql query according to the selected filter parameters 
+    """ Returns the sql query according to the selected filter parameters, as a
+        tuple (query, parameters). The values are bound as parameters, so the text
+        of the query only depends on the shape of the filter (active filters and
+        number of selected values) and is shared by every slider position: the
+        query text is cached here and its prepared statement by the sqlite3 connection.
 
     Args:
         filer_status (dic): dictionary containing a summary of the active
         filtering options with the related parametes.
     """
+    shape = []
+    parameters = []
+
+    for key, (_, is_range) in FILTER_QUERIES.items():
+        if key not in filer_status:
+            continue
+
+        val = filer_status[key]
+
+        if is_range:
+            shape.append((key, 2))
+            parameters.extend([val['upper_band'], val['lower_band']])
+        else:
+            shape.append((key, len(val)))
+            parameters.extend(val)
+
+    return _compile_filter_query(tuple(shape)), parameters
+
+
+@lru_cache(maxsize=128)
+def _compile_filter_query(shape):
+    """ Returns the sql text for a filter shape
+
+    Args:
+        shape (tuple): (filter key, number of bound parameters) pairs
+    """
     query = []
 
-    for key, val in filer_status.items():
-
-        if key == 'frequency':
-            query.append(Query.FILTER_FREQ.format(
-                val['upper_band'],
-                val['lower_band']
-            ))
-
-        elif key == 'bandwidth':
-            query.append(Query.FILTER_BAND.format(
-                val['upper_band'],
-                val['lower_band']
-            ))
-
-        elif key == 'acf':
-            query.append(Query.FILTER_ACF.format(
-                val['upper_band'],
-                val['lower_band']
-            ))
-
-        elif key == 'modulation':
-            query.append(Query.FILTER_MODULATION.format(
-                ', '.join(f"'{mod}'" for mod in val)
-            ))
-
-        elif key == 'location':
-            query.append(Query.FILTER_LOCATION.format(
-                ', '.join(f"'{loc}'" for loc in val)
-            ))
-
-        elif key == 'category':
-            query.append(Query.FILTER_CATEGORY.format(
-                ', '.join(f"{cat}" for cat in val)
-            ))
+    for key, n_parameters in shape:
+        filter_query, is_range = FILTER_QUERIES[key]
+
+        if is_range:
+            query.append(filter_query)
+        else:
+            query.append(filter_query.format(', '.join('?' * n_parameters)))
 
     return ' INTERSECT '.join(query)
 
 
+def generate_search_query(text):
+    """ Returns the FTS5 query matching every word of the text as a prefix
+        (e.g. 'stan 42' > '"stan"* "42"*'), None if the text has no words.
+        Each word is quoted, so the FTS5 syntax characters are searched literally.
+
+    Args:
+        text (str): text typed in the search bar
+    """
+    terms = ['"{}"*'.format(word.replace('"', '""')) for word in text.split()]
+    return ' '.join(terms) if terms else None
+
+
 def parse_date(date_str):
     """ Parses a date string in "%Y-%m-%d %H:%M:%S.%f" format and returns
     the date in "YYYY-MM-DD" format. If parsing fails, returns the original string.
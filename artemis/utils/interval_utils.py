@@ -0,0 +1,105 @@
+from heapq import heappush, heappop
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+
+
+class IntervalIndex():
+    """ In-memory index of closed intervals [low, high], each one tagged with a SIG_ID.
+        The intervals are kept in two lists sorted by low and by high bound, so the
+        SIG_IDs overlapping a given range are found with two binary searches and a
+        scan of the shortest candidate slice, without querying the DB.
+    """
+
+    def __init__(self, intervals=()):
+        """ Args:
+            intervals (iterable): (sig_id, low, high) tuples, as returned by the range queries
+        """
+        self._by_sig_id = {}
+        for sig_id, low, high in intervals:
+            self._by_sig_id.setdefault(sig_id, []).append((low, high))
+
+        self._by_low = sorted(
+            (low, high, sig_id) for sig_id, bounds in self._by_sig_id.items() for low, high in bounds
+        )
+        self._by_high = sorted((high, low, sig_id) for low, high, sig_id in self._by_low)
+
+
+    def __len__(self):
+        return len(self._by_low)
+
+
+    def overlap(self, lower, upper):
+        """ Return the set of SIG_IDs with at least one interval overlapping [lower, upper]
+
+        Args:
+            lower (float): lower bound of the searched range
+            upper (float): upper bound of the searched range
+        """
+        n_low = bisect_right(self._by_low, upper, key=itemgetter(0))
+        start_high = bisect_left(self._by_high, lower, key=itemgetter(0))
+
+        if n_low <= len(self._by_high) - start_high:
+            return {sig_id for low, high, sig_id in self._by_low[:n_low] if high >= lower}
+        else:
+            return {sig_id for high, low, sig_id in self._by_high[start_high:] if low <= upper}
+
+
+    def join(self, ranges):
+        """ Return, for each of the given ranges, the list of (low, high, sig_id) intervals
+            overlapping it. All the ranges are answered in a single sweep: an interval overlaps
+            [lower, upper] if it starts inside the range (binary search on the low bounds) or if
+            it contains the lower bound (active intervals while sweeping the sorted lower bounds).
+
+        Args:
+            ranges (list): (lower, upper) tuples
+        """
+        results = [[] for _ in ranges]
+        active = []
+        added = 0
+
+        for position in sorted(range(len(ranges)), key=lambda i: ranges[i][0]):
+            lower, upper = ranges[position]
+
+            # Intervals starting before the range and still open at its lower bound
+            while added < len(self._by_low) and self._by_low[added][0] < lower:
+                interval = self._by_low[added]
+                heappush(active, (interval[1], interval))
+                added += 1
+            while active and active[0][0] < lower:
+                heappop(active)
+            results[position].extend(map(itemgetter(1), active))
+
+            # Intervals starting inside the range
+            results[position].extend(self._by_low[added:bisect_right(self._by_low, upper, lo=added, key=itemgetter(0))])
+
+        return results
+
+
+    def sig_ids(self):
+        """ Return the SIG_IDs having at least one interval (set-like view)
+        """
+        return self._by_sig_id.keys()
+
+
+    def update(self, sig_id, bounds):
+        """ Replace all the intervals of a signal
+
+        Args:
+            sig_id (int): SIG_ID of the signal
+            bounds (list): new (low, high) tuples of the signal. An empty list removes the signal
+        """
+        self.remove(sig_id)
+
+        if bounds:
+            self._by_sig_id[sig_id] = list(bounds)
+            for low, high in bounds:
+                insort(self._by_low, (low, high, sig_id))
+                insort(self._by_high, (high, low, sig_id))
+
+
+    def remove(self, sig_id):
+        """ Remove all the intervals of a signal (if any)
+        """
+        for low, high in self._by_sig_id.pop(sig_id, []):
+            del self._by_low[bisect_left(self._by_low, (low, high, sig_id))]
+            del self._by_high[bisect_left(self._by_high, (high, low, sig_id))]
@@ -0,0 +1,251 @@
+import os
+import sqlite3
+import hashlib
+import tempfile
+import threading
+
+from itertools import chain
+from pathlib import Path
+
+from artemis.utils.constants import Constants, Query
+from artemis.utils.path_utils import STORE_DIR
+from artemis.utils.profile_utils import PROFILER
+
+
+class MediaStore():
+    """ Content-addressed store of the media files (spectra, audio samples, documents),
+        shared by all the databases of the data folder. A file is saved once, as
+        <sha256>.<ext> (in a subfolder named after the first two characters of the hash),
+        however many documents of however many DBs use it.
+
+        The index (an sqlite file in the store folder) records the blobs and, for each
+        document, the blob it references: a blob is deleted when its last reference is
+        released. The index is created on the first write, so a store is never created
+        just by reading the media files of a DB.
+    """
+
+    def __init__(self, root):
+        """ Args:
+            root (Path): folder of the store
+        """
+        self.root = Path(root)
+        self.index_path = self.root / Constants.MEDIA_STORE_SQL_NAME
+        self._conn = None
+        self._lock = threading.RLock()
+
+
+    def _connection(self, create=True):
+        """ Return the connection to the index, None if it does not exist and create is False
+        """
+        if self._conn is None:
+            if not create and not self.index_path.exists():
+                return None
+            os.makedirs(self.root, exist_ok=True)
+            self._conn = sqlite3.connect(self.index_path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(Query.CREATE_STORE_BLOBS)
+                self._conn.execute(Query.CREATE_STORE_REFS)
+                self._conn.execute(Query.CREATE_STORE_REFS_INDEX)
+        return self._conn
+
+
+    @staticmethod
+    def blob_name(digest, extension):
+        """ Name of the blob of a file, from its SHA-256 hash and its extension
+        """
+        return '{}.{}'.format(digest, extension) if extension else digest
+
+
+    @staticmethod
+    def extension(blob):
+        """ Extension of the file saved in a blob
+        """
+        return blob.partition('.')[2]
+
+
+    def path(self, blob):
+        return self.root / blob[:2] / blob
+
+
+    def has(self, blob):
+        return self.path(blob).is_file()
+
+
+################################## MARK: ADD Methods
+
+
+    def _store(self, temp_path, blob, size):
+        """ Move a complete temporary file to its blob (or drop it if the blob exists)
+        """
+        path = self.path(blob)
+        with self._lock:
+            if path.is_file():
+                os.remove(temp_path)
+                return blob
+            os.replace(temp_path, path)
+            with self._connection() as conn:
+                conn.execute(Query.INSERT_STORE_BLOB, [blob, size])
+        return blob
+
+
+    def _temp_file(self, blob_dir):
+        os.makedirs(blob_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=blob_dir, suffix='.tmp')
+        return os.fdopen(fd, 'wb'), temp_path
+
+
+    @PROFILER.profiled('io')
+    def add_stream(self, fileobj, extension, chunk_size=2**20):
+        """ Save the content of a file-like object (e.g. a member of a tar archive) in the
+            store, hashing it while it is copied. Returns the name of the blob.
+        """
+        head = fileobj.read(chunk_size)
+        tail = fileobj.read(chunk_size)
+        if not tail:
+            # Small file, hashed in memory: nothing is written if the blob already exists
+            blob = self.blob_name(hashlib.sha256(head).hexdigest(), extension)
+            if self.has(blob):
+                return blob
+
+        code = hashlib.sha256()
+        size = 0
+        f, temp_path = self._temp_file(self.root / 'tmp')
+        try:
+            with f:
+                for chunk in chain((head, tail), iter(lambda: fileobj.read(chunk_size), b'')):
+                    code.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            blob = self.blob_name(code.hexdigest(), extension)
+            os.makedirs(self.path(blob).parent, exist_ok=True)
+            return self._store(temp_path, blob, size)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+    @PROFILER.profiled('io')
+    def add_file(self, path, extension, move=False):
+        """ Save a file in the store and return the name of its blob. The file is copied,
+            or moved if move is True (it is then removed also if the blob already exists).
+        """
+        if not move:
+            with open(path, 'rb') as f:
+                return self.add_stream(f, extension)
+
+        code = hashlib.sha256()
+        with open(path, 'rb') as f:
+            while chunk := f.read(2**20):
+                code.update(chunk)
+        blob = self.blob_name(code.hexdigest(), extension)
+        os.makedirs(self.path(blob).parent, exist_ok=True)
+        return self._store(path, blob, os.path.getsize(path))
+
+
+################################## MARK: REFERENCES
+
+
+    def refs(self, db_name):
+        """ Return the {DOC_ID: blob} references of a DB
+        """
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return {}
+            return dict(conn.execute(Query.SELECT_STORE_REFS, [db_name]))
+
+
+    def ref(self, db_name, doc_id):
+        """ Return the blob referenced by a document of a DB (None if there is none)
+        """
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return None
+            row = conn.execute(Query.SELECT_STORE_REF, [db_name, int(doc_id)]).fetchone()
+            return row[0] if row else None
+
+
+    def refcount(self, blob):
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return 0
+            return conn.execute(Query.SELECT_STORE_REF_COUNT, [blob]).fetchone()[0]
+
+
+    def add_refs(self, db_name, doc_blobs):
+        """ Reference the blobs from the documents of a DB. The blobs previously
+            referenced by the same documents are released.
+
+        Args:
+            db_name (str): folder name of the DB
+            doc_blobs (list): (DOC_ID, blob) pairs
+        """
+        with self._lock:
+            old_refs = self.refs(db_name)
+            with self._connection() as conn:
+                conn.executemany(Query.INSERT_STORE_REF, [(db_name, doc_id, blob) for doc_id, blob in doc_blobs])
+            self.collect(old_refs[doc_id] for doc_id, blob in doc_blobs if old_refs.get(doc_id, blob) != blob)
+
+
+    def release(self, db_name, doc_ids=None):
+        """ Drop the references of some documents of a DB (all of them if doc_ids is None)
+            and delete the blobs no longer referenced
+        """
+        with self._lock:
+            if doc_ids is None:
+                refs = self.refs(db_name)
+            else:
+                refs = {doc_id: self.ref(db_name, doc_id) for doc_id in map(int, doc_ids)}
+                refs = {doc_id: blob for doc_id, blob in refs.items() if blob is not None}
+            if not refs:
+                return
+            with self._connection() as conn:
+                conn.executemany(Query.DELETE_STORE_REF, [(db_name, doc_id) for doc_id in refs])
+            self.collect(refs.values())
+
+
+    def collect(self, blobs):
+        """ Delete the given blobs if they are not referenced by any document
+        """
+        with self._lock:
+            for blob in set(blobs):
+                if self.refcount(blob) == 0:
+                    self.path(blob).unlink(missing_ok=True)
+                    with self._connection() as conn:
+                        conn.execute(Query.DELETE_STORE_BLOB, [blob])
+
+
+    def stats(self):
+        """ Return the number of blobs and their total size (bytes)
+        """
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return {'blobs': 0, 'size': 0}
+            count, size = conn.execute(Query.SELECT_STORE_STATS).fetchone()
+            return {'blobs': count, 'size': size}
+
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+
+def media_store(root=STORE_DIR):
+    """ Return the media store saved in a folder (APP_DIR/media by default), shared by
+        all the DBs opened with the same folder
+    """
+    root = Path(root).resolve()
+    with _STORES_LOCK:
+        if root not in _STORES:
+            _STORES[root] = MediaStore(root)
+        return _STORES[root]
@@ -0,0 +1,180 @@
+from array import array
+from bisect import bisect_right
+
+from PySide6.QtCore import Qt, QAbstractListModel, QSortFilterProxyModel, QModelIndex, QByteArray, Slot
+
+
+class SignalListModel(QAbstractListModel):
+    """ List of signals (sorted by name) shown in the main window.
+        The entries are stored column by column (SIG_ID, name, description) and
+        exposed to QML through roles, so the list is never copied into a QML ListModel.
+        Edits are applied as row insertions/removals instead of resetting the model.
+    """
+    SigIdRole = Qt.UserRole + 1
+    NameRole = Qt.UserRole + 2
+    DescriptionRole = Qt.UserRole + 3
+
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._sig_ids = array('q')
+        self._names = []
+        self._descriptions = []
+
+
+    def roleNames(self):
+        return {
+            self.SigIdRole: QByteArray(b'SIG_ID'),
+            self.NameRole: QByteArray(b'name'),
+            self.DescriptionRole: QByteArray(b'description')
+        }
+
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._sig_ids)
+
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._sig_ids):
+            return None
+
+        row = index.row()
+
+        if role == self.SigIdRole:
+            return self._sig_ids[row]
+        if role in (self.NameRole, Qt.DisplayRole):
+            return self._names[row]
+        if role == self.DescriptionRole:
+            return self._descriptions[row]
+        return None
+
+
+    def set_signals(self, signals):
+        """ Replace the whole content of the list
+
+        Args:
+            signals (list): signal entries (dict with SIG_ID, name and description) sorted by name
+        """
+        self.beginResetModel()
+        self._sig_ids = array('q', (sig['SIG_ID'] for sig in signals))
+        self._names = [sig['name'] for sig in signals]
+        self._descriptions = [sig['description'] for sig in signals]
+        self.endResetModel()
+
+
+    def row_of(self, sig_id):
+        """ Return the row of the signal, -1 if it is not listed
+        """
+        try:
+            return self._sig_ids.index(sig_id)
+        except ValueError:
+            return -1
+
+
+    def sig_id(self, row):
+        """ Return the SIG_ID of the signal at the given row
+        """
+        return self._sig_ids[row]
+
+
+    def upsert(self, signal):
+        """ Insert a new signal, or move an edited one to its sorted position
+
+        Args:
+            signal (dict): signal entry (SIG_ID, name and description)
+        """
+        self.remove(signal['SIG_ID'])
+
+        row = bisect_right(self._names, signal['name'])
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._sig_ids.insert(row, signal['SIG_ID'])
+        self._names.insert(row, signal['name'])
+        self._descriptions.insert(row, signal['description'])
+        self.endInsertRows()
+
+
+    def remove(self, sig_id):
+        """ Remove a signal from the list (if listed)
+        """
+        row = self.row_of(sig_id)
+        if row < 0:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._sig_ids[row]
+        del self._names[row]
+        del self._descriptions[row]
+        self.endRemoveRows()
+
+
+class SignalSearchModel(QSortFilterProxyModel):
+    """ Proxy of the SignalListModel showing the results of the full-text search,
+        best matches first. Without an active search, all the signals are shown in
+        their original order. The results can be added in chunks, as they arrive.
+    """
+
+    def __init__(self, source_model, parent=None):
+        super().__init__(parent)
+
+        self._ranks = None
+        self.setSourceModel(source_model)
+        self.setDynamicSortFilter(True)
+
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._ranks is None or self.sourceModel().sig_id(source_row) in self._ranks
+
+
+    def lessThan(self, source_left, source_right):
+        source = self.sourceModel()
+        return self._ranks[source.sig_id(source_left.row())] < self._ranks[source.sig_id(source_right.row())]
+
+
+    def set_results(self, sig_ids):
+        """ Show only the given SIG_IDs, in this order (first chunk of the search results)
+        """
+        self._ranks = {sig_id: rank for rank, sig_id in enumerate(sig_ids)}
+        self.invalidateRowsFilter()
+        self.sort(0)
+
+
+    def add_results(self, sig_ids):
+        """ Show also the given SIG_IDs, after the current ones (following chunks of the search results)
+        """
+        if self._ranks is None:
+            return
+
+        rank = len(self._ranks)
+        for sig_id in sig_ids:
+            self._ranks.setdefault(sig_id, rank)
+            rank += 1
+        self.invalidateRowsFilter()
+
+
+    def clear_results(self):
+        """ Show all the signals again, in their original order
+        """
+        self._ranks = None
+        self.sort(-1)
+        self.invalidateRowsFilter()
+
+
+    def row_of(self, sig_id):
+        """ Return the row of the signal in the proxy, -1 if it is not shown
+        """
+        source_row = self.sourceModel().row_of(sig_id)
+        if source_row < 0:
+            return -1
+        return self.mapFromSource(self.sourceModel().index(source_row)).row()
+
+
+    @Slot(int, result=int)
+    def sigId(self, row):
+        """ Return the SIG_ID of the signal shown at the given row, -1 if the row is not valid
+        """
+        if not 0 <= row < self.rowCount():
+            return -1
+        return self.sourceModel().sig_id(self.mapToSource(self.index(row, 0)).row())
@@ -60,5 +60,7 @@ def _preference_dir():
 BASE_DIR = Path(os.path.dirname(__file__)) / '../..'
 APP_DIR = _app_dir()
 DATA_DIR = _data_dir()
+# Created by the media store on its first write
+STORE_DIR = APP_DIR / Constants.MEDIA_STORE_DIR
 TMP_DIR = _tmp_dir()
 PREFERENCES_DIR = _preference_dir()
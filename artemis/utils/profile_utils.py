@@ -0,0 +1,180 @@
+import os
+import re
+import sys
+import json
+import threading
+import time
+
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+
+
+class Profiler():
+    """ Opt-in instrumentation of the application (startup phases, QML loading, DB queries...).
+        Enabled with the ARTEMIS_PROFILE environment variable or with profile=1 in the [Develop]
+        section of the conf file. When disabled, spans and traces cost a single attribute check.
+        The recorded events are saved as a Chrome trace (chrome://tracing, ui.perfetto.dev)
+        and summarized in a table printed on exit.
+    """
+    ENV_VAR = 'ARTEMIS_PROFILE'
+
+    _SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+    _SPACES = re.compile(r'\s+')
+
+
+    def __init__(self):
+        self.enabled = False
+        self._origin = time.perf_counter()
+        self._events = []
+        self._events_lock = threading.Lock()
+        self._local = threading.local()
+
+        if os.environ.get(self.ENV_VAR, '0') not in ('', '0'):
+            self.enable()
+
+
+    def enable(self):
+        self.enabled = True
+
+
+    def _now(self):
+        # Microseconds since the profiler creation (trace events time unit)
+        return (time.perf_counter() - self._origin) * 1e6
+
+
+    def _record(self, name, category, start, end, args=None):
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': start,
+            'dur': end - start,
+            'pid': os.getpid(),
+            'tid': threading.get_ident()
+        }
+        if args:
+            event['args'] = args
+        with self._events_lock:
+            self._events.append(event)
+
+
+    @contextmanager
+    def _span(self, name, category, args):
+        start = self._now()
+        try:
+            yield
+        finally:
+            self._record(name, category, start, self._now(), args)
+
+
+    def span(self, name, category='app', **args):
+        """ Context manager timing the enclosed block
+
+        Args:
+            name (str): name of the event
+            category (str): category of the event (app, qml, db, sql, io...)
+            args: additional details saved with the event
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._span(name, category, args)
+
+
+    def profiled(self, category='app', name=None):
+        """ Decorator timing each call of the function
+        """
+        def decorator(function):
+            event_name = name or function.__qualname__
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self._span(event_name, category, None):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+    def trace_connection(self, conn):
+        """ Time every statement executed on the SQLite connection (including the ones
+            run by triggers) through its trace callback. SQLite reports only the start of
+            each statement: a statement ends when the next one starts or when sql_done() is called.
+        """
+        if self.enabled:
+            conn.set_trace_callback(self._sql_statement)
+
+
+    def _sql_statement(self, sql):
+        now = self._now()
+        self._close_statement(now)
+        self._local.statement = (sql, now)
+
+
+    def _close_statement(self, now):
+        statement = getattr(self._local, 'statement', None)
+        if statement is not None:
+            sql, start = statement
+            self._local.statement = None
+            name = self._SPACES.sub(' ', self._SQL_LITERALS.sub('?', sql)).strip()[:100]
+            self._record(name, 'sql', start, now, {'sql': sql[:1000]})
+
+
+    def sql_done(self):
+        """ Mark the end of the statement running on the calling thread
+        """
+        if self.enabled:
+            self._close_statement(self._now())
+
+
+    def save_trace(self, path):
+        """ Save the recorded events as a Chrome trace-event JSON file
+        """
+        with self._events_lock:
+            events = list(self._events)
+
+        threads = {thread.ident: thread.name for thread in threading.enumerate()}
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid, 'args': {'name': threads.get(tid, str(tid))}}
+            for tid in {event['tid'] for event in events}
+        ]
+
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, f)
+
+
+    def summary(self):
+        """ Return the summary table of the recorded events (grouped by category and name,
+            sorted by total time)
+        """
+        stats = {}
+        with self._events_lock:
+            for event in self._events:
+                key = (event['cat'], event['name'])
+                count, total, longest = stats.get(key, (0, 0, 0))
+                stats[key] = (count + 1, total + event['dur'], max(longest, event['dur']))
+
+        lines = ['{:<6} {:>6} {:>11} {:>10} {:>10}  {}'.format('CAT', 'CALLS', 'TOTAL (ms)', 'MEAN (ms)', 'MAX (ms)', 'NAME')]
+        for (category, name), (count, total, longest) in sorted(stats.items(), key=lambda item: -item[1][1]):
+            lines.append('{:<6} {:>6} {:>11.2f} {:>10.3f} {:>10.3f}  {}'.format(
+                category, count, total / 1000, total / count / 1000, longest / 1000, name
+            ))
+        return '\n'.join(lines)
+
+
+    def dump(self, directory):
+        """ Save the trace in the given folder and print the summary table (only if enabled)
+        """
+        if not self.enabled:
+            return
+
+        os.makedirs(directory, exist_ok=True)
+        trace_path = os.path.join(directory, 'trace-{}.json'.format(datetime.now().strftime('%Y%m%d-%H%M%S')))
+        self.save_trace(trace_path)
+
+        print(self.summary(), file=sys.stderr)
+        print('Trace saved in {}'.format(trace_path), file=sys.stderr)
+
+
+PROFILER = Profiler()
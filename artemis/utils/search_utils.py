@@ -0,0 +1,109 @@
+import sqlite3
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from artemis.utils.constants import Constants
+
+
+class SearchWorker(QObject):
+    """ Run the full-text searches of the signals list on a background thread.
+        Only the latest request is served: a new search (or cancel()) interrupts
+        the running query and the results of stale searches are never sent.
+        The matching SIG_IDs are sent in chunks, the first (short) one as soon as
+        it is ready, so the list can be populated without waiting for all the matches.
+    """
+    # Worker thread > GUI Signals (text of the search, chunk of SIG_IDs)
+    results_ready = Signal(str, list)
+    more_results_ready = Signal(str, list)
+
+
+    def __init__(self):
+        super().__init__()
+
+        self._condition = threading.Condition()
+        self._request = None
+        self._generation = 0
+        self._running = False
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+
+    def search(self, database, text):
+        """ Queue a search, replacing (and interrupting) the previous one
+
+        Args:
+            database (ArtemisDatabase): loaded DB
+            text (str): text typed in the search bar
+        """
+        with self._condition:
+            self._generation += 1
+            self._request = (self._generation, database, text)
+            self._condition.notify_all()
+
+
+    def cancel(self, wait=False):
+        """ Drop the pending search and interrupt the running one
+
+        Args:
+            wait (bool): return only once the running search has stopped using its DB
+                (e.g. before the connections of the DB are closed)
+        """
+        with self._condition:
+            self._generation += 1
+            self._request = None
+            while wait and self._running:
+                self._condition.wait()
+
+
+    def _is_stale(self, generation):
+        return generation != self._generation
+
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._request is None:
+                    self._condition.wait()
+                generation, database, text = self._request
+                self._request = None
+                self._running = True
+
+            try:
+                self._search(generation, database, text)
+            except sqlite3.Error:
+                # Interrupted by a newer search or the DB has been unloaded meanwhile
+                pass
+            finally:
+                with self._condition:
+                    self._running = False
+                    self._condition.notify_all()
+
+
+    def _search(self, generation, database, text):
+        """ Stream the results of a search, stopping as soon as it becomes stale.
+            The SQLite progress handler aborts the query itself while it is running.
+        """
+        conn = database.connection()
+        conn.set_progress_handler(lambda: self._is_stale(generation), Constants.SEARCH_PROGRESS_STEPS)
+
+        try:
+            chunk = []
+            chunk_size = Constants.SEARCH_FIRST_CHUNK
+            ready = self.results_ready
+
+            for sig_id in database.stream_search(text):
+                chunk.append(sig_id)
+                if len(chunk) == chunk_size:
+                    if self._is_stale(generation):
+                        return
+                    ready.emit(text, chunk)
+                    chunk = []
+                    chunk_size = Constants.SEARCH_CHUNK_SIZE
+                    ready = self.more_results_ready
+
+            if not self._is_stale(generation):
+                ready.emit(text, chunk)
+        finally:
+            conn.set_progress_handler(None, 0)
@@ -1,86 +1,323 @@
 import os
+import json
+import uuid
 import sqlite3
+import threading
 
-from PySide6.QtCore import QUrl
+from heapq import nsmallest
+from bisect import insort
 from operator import itemgetter
 from datetime import datetime
 from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
 from artemis.utils.constants import Query, Constants
-from artemis.utils.generic_utils import format_frequency
-from artemis.utils.path_utils import DATA_DIR
+from artemis.utils.generic_utils import format_frequency, generate_filter_query, generate_search_query
+from artemis.utils.interval_utils import IntervalIndex
+from artemis.utils.media_utils import media_store
+from artemis.utils.path_utils import DATA_DIR, STORE_DIR
+from artemis.utils.profile_utils import PROFILER
+from artemis.utils.sys_utils import unpack_tar, delete_dir
 
 
 class Database():
     """ General superclass for SQLite DB manipulation.
-        Foreign keys are activated (otherwise disabled by default for compatibility purposes)
+        Foreign keys are activated (otherwise disabled by default for compatibility purposes).
+        Connections are opened lazily, one per thread, and reused until close() is called.
     """
-    def __init__(self, sql_path):
+    def __init__(self, sql_path, read_only=False):
+        """ Args:
+            sql_path (Path): path of the sqlite file
+            read_only (bool): open the connections in read-only mode (every write fails)
+        """
         self.sql_path = sql_path
+        self.read_only = read_only
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+
+    def connection(self):
+        """ Return the connection bound to the calling thread, opening it on first use.
+            Compiled statements are cached per connection, so repeated queries
+            with the same text skip the SQLite parser.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                '{}?mode=ro'.format(self.sql_path.resolve().as_uri()) if self.read_only else self.sql_path,
+                check_same_thread=False,
+                cached_statements=Constants.SQL_CACHED_STATEMENTS,
+                uri=self.read_only
+            )
+            conn.execute('PRAGMA foreign_keys = ON;')
+            PROFILER.trace_connection(conn)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
 
     def execute(self, query, parameters=None, last_rowid=False):
-        """ Open a connection, execute the given query with optional parameters and close the connection. 
+        """ Execute the given query with optional parameters on the connection of the calling thread.
             In the case of a SELECT query, returns the results as a fetchall().
             If last_rowid == True, this function returns a tuple with the result of the fetchall() and
             the latest modified row id of the current connection.
         """
-        with closing(sqlite3.connect(self.sql_path, check_same_thread=False)) as conn:
-            conn.execute('PRAGMA foreign_keys = ON;')
+        conn = self.connection()
+
+        with closing(conn.cursor()) as curs:
+            try:
+                if parameters:
+                    curs.execute(query, parameters)
+                else:
+                    curs.execute(query)
+
+                if last_rowid:
+                    result = (curs.fetchall(), curs.lastrowid)
+                else:
+                    result = curs.fetchall()
+
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                PROFILER.sql_done()
 
-            curs = conn.cursor()
+        return result
 
-            if parameters:
-                curs.execute(query, parameters)
-            else:
-                curs.execute(query)
 
-            conn.commit()
+    def stream(self, query, parameters=None):
+        """ Execute a SELECT query and yield the resulting rows one by one,
+            without materializing the whole result set with a fetchall()
+        """
+        with closing(self.connection().cursor()) as curs:
+            try:
+                curs.execute(query, parameters or [])
+                yield from curs
+            finally:
+                PROFILER.sql_done()
 
-            if last_rowid:
-                result = (curs.fetchall(), curs.lastrowid)
-            else:
-                result = curs.fetchall()
 
-        return result
+    def execute_transaction(self, queries):
+        """ Execute a list of (query, parameters) pairs in a single transaction.
+            Either all the queries are applied or, in case of error, none of them.
+        """
+        conn = self.connection()
+
+        with closing(conn.cursor()) as curs:
+            try:
+                curs.execute('BEGIN')
+                for query, parameters in queries:
+                    curs.execute(query, parameters or [])
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                PROFILER.sql_done()
+
+
+    def close(self):
+        """ Close all the connections opened on this DB (from any thread).
+            The next query will transparently open a new one.
+        """
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+        self._local = threading.local()
 
 ################################## MARK: >>> DATABASE <<<
 
 class ArtemisDatabase(Database):
     """ General CRUD class for SQLite DB manipulation.
-        Foreign keys are activated (otherwise disabled by default for compatibility purposes) 
+        Foreign keys are activated (otherwise disabled by default for compatibility purposes).
+        The facets of the DB (signals list, distinct values, stats, range indexes) are
+        queried on first access and memoized until invalidate() is called.
+        The media files of the documents are saved in a media store shared by several DBs,
+        which records the blob of each document; media/ holds only the files not adopted yet.
     """
+    FACETS = ('all_signals', 'all_modulation', 'all_location', 'all_category_labels', 'stats', 'range_index')
+
 
-    def __init__(self, db_dir_name):
+    def __init__(self, db_dir_name, data_dir=DATA_DIR, store_dir=STORE_DIR, read_only=False):
+        """ Args:
+            db_dir_name (str): folder name of the DB in the data folder
+            data_dir (Path): folder containing the DB folders (the application data folder by default)
+            store_dir (Path): folder of the media store (the application one by default)
+            read_only (bool): open the DB in read-only mode (e.g. for queries from scripts)
+        """
         self.db_dir_name = db_dir_name
-        self.db_dir = DATA_DIR / db_dir_name
+        self.db_dir = data_dir / db_dir_name
         self.sql_path = self.db_dir / Constants.SQL_NAME
-        self.media_dir = self.db_dir / 'media'
-        super().__init__(self.sql_path)
+        self.media_dir = self.db_dir / Constants.MEDIA_DIR
+        self.store = media_store(store_dir)
+        super().__init__(self.sql_path, read_only)
         
         self.name = None
         self.date = None
         self.version = None
         self.editable = None
 
-        self.all_signals = None
-        self.all_modulation = None
-        self.all_location = None
-        self.all_category_labels = None
-
         self.filtered_signals = None
-        
-        self.stats = {}
+        self.filter_status = {}
 
 
+    @PROFILER.profiled('db')
     def load(self):
+        """ Load the meta INFO of the DB, which is not modified (see migrate()).
+            The facets are loaded on demand.
+        """
         self._select_info()
-        self._select_all()
-        self._select_all_modulation()
-        self._select_all_location()
-        self._select_all_category_labels()
-        self._select_stats()
+        self.invalidate()
+
+
+    def migrate(self):
+        """ One-time migration of a DB created, imported or downloaded by an older version:
+            schema migrations and media files of media/ moved to the media store. Nothing
+            is done for a DB already migrated, but the adoption of the media files hashes
+            them all: run it off the GUI thread.
+        """
+        self._migrate_schema()
+        self._adopt_media()
+
+
+    def invalidate(self, *facets):
+        """ Drop the memoized facets, queried again on next access
+
+        Args:
+            facets (str): names of the facets to be dropped, all of them if none is given
+        """
+        for facet in facets or self.FACETS:
+            self.__dict__.pop(facet, None)
+
+
+    def needs_migration(self):
+        """ True if the schema of the DB is older than Constants.SQL_SCHEMA_VERSION
+            (the DB must be migrated before it can be queried)
+        """
+        info_columns = [column[1] for column in self.execute(Query.SELECT_INFO_COLUMNS)]
+        if 'SCHEMA_VERSION' not in info_columns:
+            return True
+        return (self.execute(Query.SELECT_SCHEMA_VERSION)[0][0] or 0) < Constants.SQL_SCHEMA_VERSION
+
+
+    @PROFILER.profiled('db')
+    def _migrate_schema(self):
+        """ Bring the schema of the DB up to Constants.SQL_SCHEMA_VERSION (indexes, etc.).
+            The reached version is stored in the 'info' table, so each step runs only once
+            for newly created, imported and downloaded DBs.
+        """
+        info_columns = [column[1] for column in self.execute(Query.SELECT_INFO_COLUMNS)]
+        if 'SCHEMA_VERSION' not in info_columns:
+            self.execute(Query.ADD_SCHEMA_VERSION)
+
+        schema_version = self.execute(Query.SELECT_SCHEMA_VERSION)[0][0] or 0
+
+        for version in sorted(Query.MIGRATIONS):
+            if version > schema_version:
+                queries = [(query, None) for query in Query.MIGRATIONS[version]]
+                queries.append((Query.UPDATE_SCHEMA_VERSION, [version]))
+                self.execute_transaction(queries)
+
+
+    @PROFILER.profiled('io')
+    def _adopt_media(self):
+        """ Move the files of media/ (<DOC_ID>.<ext>, as found in the archives and in the
+            DBs created before the media store) to the store and point the documents to them.
+            The files not belonging to any document are left in place.
+        """
+        try:
+            file_names = [entry.name for entry in os.scandir(self.media_dir) if entry.is_file()]
+        except OSError:
+            return
+        if not file_names:
+            return
+
+        documents = self.document_files()
+        doc_blobs = [
+            (documents[file_name], self.store.add_file(self.media_dir / file_name, file_name.partition('.')[2], move=True))
+            for file_name in file_names if file_name in documents
+        ]
+        self.link_media(doc_blobs)
+
+
+    def document_files(self):
+        """ Return the {<DOC_ID>.<ext>: DOC_ID} file names of the documents (as in media/)
+        """
+        return {
+            '{}.{}'.format(doc_id, extension): doc_id
+            for doc_id, extension in self.execute(Query.SELECT_DOCUMENT_FILES)
+        }
+
+
+    def link_media(self, doc_blobs):
+        """ Point the documents to their blobs of the media store
+
+        Args:
+            doc_blobs (list): (DOC_ID, blob) pairs
+        """
+        if doc_blobs:
+            self.store.add_refs(self.db_dir_name, doc_blobs)
+
+
+    def link_archive_media(self, media):
+        """ Point the documents to the media files of their archive, saved in the media store
+
+        Args:
+            media (dict): {file name: blob} of the media files of the archive (as in media/)
+        """
+        documents = self.document_files()
+        self.link_media([(documents[file_name], blob) for file_name, blob in media.items() if file_name in documents])
+
+
+    def document_path(self, doc_id, extension):
+        """ Return the path of the media file of a document (its blob is queried)
+        """
+        return self.media_path(doc_id, extension, self.store.ref(self.db_dir_name, doc_id))
+
+
+    def media_path(self, doc_id, extension, blob):
+        """ Return the path of a media file: its blob in the media store, or the file
+            in media/ if it has not been adopted yet (no blob)
+        """
+        if blob is not None:
+            return self.store.path(blob)
+        return self.media_dir / '{}.{}'.format(doc_id, extension)
 
 
+    def media_files(self):
+        """ Return the (file name, path) of all the media files of the DB, the file names
+            being the ones of the archives (<DOC_ID>.<ext>)
+        """
+        files = {
+            '{}.{}'.format(doc_id, self.store.extension(blob)): self.store.path(blob)
+            for doc_id, blob in self.store.refs(self.db_dir_name).items()
+        }
+        if self.media_dir.is_dir():
+            for entry in os.scandir(self.media_dir):
+                if entry.is_file():
+                    files.setdefault(entry.name, self.media_dir / entry.name)
+        return sorted(files.items())
+
+
+    def store_document(self, doc_id, extension, file_path):
+        """ Copy a file in the media store as the media file of a document
+        """
+        self.link_media([(doc_id, self.store.add_file(file_path, extension))])
+
+
+    def delete_media(self, doc_ids=None):
+        """ Release the media files of some documents (of all of them if doc_ids is None):
+            the blobs no longer used by any DB are deleted from the media store
+        """
+        self.store.release(self.db_dir_name, doc_ids)
+
+
+    @PROFILER.profiled('db')
     def _select_info(self):
         """ Load the DB meta INFO from the table 'info'
         """
@@ -91,50 +328,254 @@ class ArtemisDatabase(Database):
         self.editable = result[3]
 
 
-    def _select_all(self):
-        """ Load a list of tuple for all signals. Each tuple (representing a signal)
-            contains the SIG_ID and the NAME of the signal
+    @cached_property
+    @PROFILER.profiled('db')
+    def all_signals(self):
+        """ List of dict for all signals, sorted by name. Each dict (representing a signal)
+            contains the SIG_ID, the NAME and the DESCRIPTION of the signal
         """
-        self.all_signals = self.execute(Query.SELECT_ALL_SIGNALS)
         keys = ('SIG_ID', 'name', 'description')
-        result = [dict(zip(keys, values)) for values in self.all_signals]
-        self.all_signals = result
+        return [dict(zip(keys, values)) for values in self.execute(Query.SELECT_ALL_SIGNALS)]
+
 
+    @cached_property
+    @PROFILER.profiled('db')
+    def all_modulation(self):
+        return [{'value': item[0]} for item in self.execute(Query.SELECT_ALL_MODULATION)]
 
-    def _select_all_modulation(self):
-        self.all_modulation = self.execute(Query.SELECT_ALL_MODULATION)
-        self.all_modulation = [{'value': item[0]} for item in self.all_modulation]
 
+    @cached_property
+    @PROFILER.profiled('db')
+    def all_location(self):
+        return [{'value': item[0]} for item in self.execute(Query.SELECT_ALL_LOCATION)]
 
-    def _select_all_location(self):
-        self.all_location = self.execute(Query.SELECT_ALL_LOCATION)
-        self.all_location = [{'value': item[0]} for item in self.all_location]
 
+    @cached_property
+    @PROFILER.profiled('db')
+    def all_category_labels(self):
+        return [{'clb_id': item[0], 'value': item[1]} for item in self.execute(Query.SELECT_ALL_CAT_LABELS)]
 
-    def _select_all_category_labels(self):
-        self.all_category_labels = self.execute(Query.SELECT_ALL_CAT_LABELS)
-        self.all_category_labels = [{'clb_id': item[0], 'value': item[1]} for item in self.all_category_labels]
+
+    @cached_property
+    @PROFILER.profiled('db')
+    def range_index(self):
+        """ In-memory interval indexes used by the range filters
+            (frequency, bandwidth and ACF)
+        """
+        return {
+            key: IntervalIndex(self.execute(all_query))
+            for key, (all_query, _) in Query.SELECT_RANGES.items()
+        }
 
 
-    def _select_stats(self):
-        tot_docs = self.execute(Query.SELECT_STAT_DOCS)[0][0]
-        tot_images = self.execute(Query.SELECT_STAT_IMAGES)[0][0]
-        tot_audio = self.execute(Query.SELECT_STAT_AUDIO)[0][0]
+    def refresh_ranges(self, sig_id):
+        """ Update the interval indexes of a single signal after one of its
+            values has been inserted, changed or deleted (only if already built)
+        """
+        if 'range_index' not in self.__dict__:
+            return
 
-        self.stats['documents'] = tot_docs
-        self.stats['images'] = tot_images
-        self.stats['audio'] = tot_audio
-        self.stats['signals'] = len(self.all_signals)
+        for key, (_, signal_query) in Query.SELECT_RANGES.items():
+            bounds = [(low, high) for _, low, high in self.execute(signal_query, [sig_id])]
+            self.range_index[key].update(sig_id, bounds)
 
 
-    def select_by_filter(self, filter_query):
-        matching_sig_ids = self.execute(filter_query)
-        sig_ids = ",".join(str(num[0]) for num in matching_sig_ids)
+    def probe(self):
+        """ Load only the DB meta INFO and the stats, without the signals.
+            Enough to list the DB in the DB manager and to check that it is valid.
+        """
+        if not self.sql_path.is_file():
+            raise FileNotFoundError(self.sql_path)
 
-        self.all_signals = self.execute(Query.SELECT_SIG_ID.format(sig_ids))
-        keys = ('SIG_ID', 'name', 'description')
-        result = [dict(zip(keys, values)) for values in self.all_signals]
-        self.all_signals = result
+        self._select_info()
+        # Query the stats right away (memoized), so that invalid DBs fail here
+        self.invalidate('stats')
+        self.stats
+
+
+    @cached_property
+    @PROFILER.profiled('db')
+    def stats(self):
+        tot_signals, tot_docs, tot_images, tot_audio = self.execute(Query.SELECT_STATS)[0]
+
+        return {
+            'signals': tot_signals,
+            'documents': tot_docs,
+            'images': tot_images,
+            'audio': tot_audio
+        }
+
+
+    def select_by_filter(self, filter_status):
+        """ Select the signals matching all the active filters in filtered_signals.
+            Range filters are answered by the in-memory interval indexes, while
+            the remaining ones are resolved by a single query streaming the
+            matching signals (the filter query is nested as a subquery).
+
+        Args:
+            filter_status (dic): dictionary containing the active filters, as sent by the FilterPage
+        """
+        self.filter_status = filter_status
+        matching_sig_ids = None
+
+        for key in Query.SELECT_RANGES:
+            if key in filter_status:
+                sig_ids = self.range_index[key].overlap(
+                    filter_status[key]['lower_band'],
+                    filter_status[key]['upper_band']
+                )
+                matching_sig_ids = sig_ids if matching_sig_ids is None else matching_sig_ids & sig_ids
+
+        sql_filters = {key: val for key, val in filter_status.items() if key not in Query.SELECT_RANGES}
+
+        if sql_filters:
+            filter_query, parameters = generate_filter_query(sql_filters)
+            keys = ('SIG_ID', 'name', 'description')
+            self.filtered_signals = [
+                dict(zip(keys, values))
+                for values in self.stream(Query.SELECT_SIG_ID.format(filter_query), parameters)
+                if matching_sig_ids is None or values[0] in matching_sig_ids
+            ]
+        elif matching_sig_ids is not None:
+            self.filtered_signals = [sig for sig in self.all_signals if sig['SIG_ID'] in matching_sig_ids]
+        else:
+            self.filtered_signals = self.all_signals
+
+
+    def search(self, text):
+        """ Full-text search (FTS5 index) over the names, descriptions and parameters
+            of all the signals. Every word of the text is matched as a prefix.
+            Returns the matching SIG_IDs, best matches first.
+
+        Args:
+            text (str): text typed in the search bar
+        """
+        return list(self.stream_search(text))
+
+
+    def stream_search(self, text):
+        """ Same as search(), but yield the matching SIG_IDs one by one
+        """
+        search_query = generate_search_query(text)
+
+        if search_query is None:
+            for sig in self.all_signals:
+                yield sig['SIG_ID']
+        else:
+            for row in self.stream(Query.SEARCH_SIGNALS, [search_query]):
+                yield row[0]
+
+
+    @PROFILER.profiled('db')
+    def identify(
+        self,
+        observations,
+        frequency_tolerance=0,
+        bandwidth_tolerance=Constants.IDENTIFY_BAND_TOLERANCE,
+        acf_tolerance=Constants.IDENTIFY_ACF_TOLERANCE,
+        limit=Constants.IDENTIFY_CANDIDATES
+    ):
+        """ Identify a batch of observed signals. Each observation is matched against the
+            frequency, bandwidth and ACF interval indexes in a single sweep per parameter
+            (no query per observation). Returns, for each observation, the list of candidates
+            (dict with SIG_ID, name and score) best first.
+
+            A candidate must overlap the observed frequency (+/- tolerance and half bandwidth).
+            The score is the number of observed parameters matched, minus the ones known
+            for the signal but not matched. Ties are broken by the narrowest frequency range.
+
+        Args:
+            observations (iterable): (frequency, bandwidth, acf) rows (lists, tuples, NumPy rows
+                or dicts with these keys). Bandwidth and ACF are optional (None or NaN)
+            frequency_tolerance (float): tolerance on the frequency in Hz
+            bandwidth_tolerance (float): relative tolerance on the bandwidth
+            acf_tolerance (float): relative tolerance on the ACF
+            limit (int): maximum number of candidates for each observation
+        """
+        observations = [_parse_observation(row) for row in observations]
+
+        frequency = self._join_observations('frequency', [
+            None if freq is None else (freq - frequency_tolerance - (band or 0) / 2, freq + frequency_tolerance + (band or 0) / 2)
+            for freq, band, _ in observations
+        ])
+        bandwidth = self._join_observations('bandwidth', [
+            None if band is None else (band * (1 - bandwidth_tolerance), band * (1 + bandwidth_tolerance))
+            for _, band, _ in observations
+        ])
+        acf = self._join_observations('acf', [
+            None if value is None else (value * (1 - acf_tolerance), value * (1 + acf_tolerance))
+            for _, _, value in observations
+        ])
+
+        names = {sig['SIG_ID']: sig['name'] for sig in self.all_signals}
+        results = []
+
+        for position, (_, band, value) in enumerate(observations):
+            # Narrowest frequency range of each candidate
+            spans = {}
+            for low, high, sig_id in frequency[position]:
+                if high - low < spans.get(sig_id, float('inf')):
+                    spans[sig_id] = high - low
+
+            scores = dict.fromkeys(spans, 1)
+            for key, observed, matches in (('bandwidth', band, bandwidth), ('acf', value, acf)):
+                if observed is None:
+                    continue
+                matched = spans.keys() & matches[position]
+                for sig_id in matched:
+                    scores[sig_id] += 1
+                for sig_id in (spans.keys() & self.range_index[key].sig_ids()) - matched:
+                    scores[sig_id] -= 1
+
+            best = nsmallest(limit, spans, key=lambda sig_id: (-scores[sig_id], spans[sig_id], names.get(sig_id, '')))
+            results.append([{'SIG_ID': sig_id, 'name': names.get(sig_id, ''), 'score': scores[sig_id]} for sig_id in best])
+
+        return results
+
+
+    def _join_observations(self, key, ranges):
+        """ Join the ranges (None for the observations without this parameter)
+            with the interval index of the parameter
+        """
+        positions = [position for position, bounds in enumerate(ranges) if bounds is not None]
+        joined = self.range_index[key].join([ranges[position] for position in positions])
+
+        matches = [() for _ in ranges]
+        for position, intervals in zip(positions, joined):
+            matches[position] = intervals if key == 'frequency' else {sig_id for _, _, sig_id in intervals}
+        return matches
+
+
+    def refresh_signal(self, sig_id):
+        """ Update the in-memory state of the DB (signals list, interval indexes and
+            filtered signals) after a signal has been inserted, edited or deleted.
+            Returns a tuple with the signal entry (None if the signal has been deleted)
+            and a bool telling whether the signal matches the active filters.
+        """
+        self.refresh_ranges(sig_id)
+        self.all_signals = [sig for sig in self.all_signals if sig['SIG_ID'] != sig_id]
+
+        result = self.execute(Query.SELECT_SIG_ROW, [sig_id])
+
+        if result:
+            keys = ('SIG_ID', 'name', 'description')
+            signal = dict(zip(keys, result[0]))
+            insort(self.all_signals, signal, key=itemgetter('name'))
+        else:
+            signal = None
+
+        self.invalidate('stats')
+        self.select_by_filter(self.filter_status)
+
+        is_visible = signal is not None and any(sig['SIG_ID'] == sig_id for sig in self.filtered_signals)
+        return signal, is_visible
+
+
+    def refresh_facets(self):
+        """ Reload the distinct values listed in the FilterPage (modulation,
+            location and category labels) after an edit
+        """
+        self.invalidate('all_modulation', 'all_location', 'all_category_labels')
 
 
     def create(self, name):
@@ -158,14 +599,21 @@ class ArtemisDatabase(Database):
         self.execute(Query.CREATE_ACF)
         self.execute(Query.CREATE_DOCUMENTS)
 
-        self.execute(Query.CREATE_VIEW_FREQ)
-        self.execute(Query.CREATE_VIEW_BAND)
+        self._migrate_schema()
 
 
     def rename(self, name):
         self.execute(Query.RENAME_DB, [name])
 
 
+    def delete(self):
+        """ Delete the DB folder and release its media files
+        """
+        self.close()
+        self.delete_media()
+        delete_dir(self.db_dir)
+
+
     def insert_category_label(self, value):
         self.execute(Query.INSERT_CATEGORY_LABEL, [value])
 
@@ -177,6 +625,132 @@ class ArtemisDatabase(Database):
     def delete_category_label(self, clb_id):
         self.execute(Query.DELETE_CATEGORY_LABEL, [clb_id])
 
+
+def _parse_observation(row):
+    """ Return the (frequency, bandwidth, acf) of an observation as floats (None if missing or NaN)
+    """
+    if isinstance(row, dict):
+        values = [row.get('frequency'), row.get('bandwidth'), row.get('acf')]
+    else:
+        values = (list(row) + [None, None])[:3]
+
+    parsed = []
+    for value in values:
+        value = None if value is None or value == '' else float(value)
+        parsed.append(None if value is None or value != value else value)
+    return tuple(parsed)
+
+################################## MARK: >>> DISCOVERY <<<
+
+# DB folder > (signature of the sqlite file, probed database or None if not valid)
+_probe_cache = {}
+_probe_cache_lock = threading.Lock()
+
+
+@PROFILER.profiled('db')
+def scan_databases(data_dir=DATA_DIR, store_dir=STORE_DIR):
+    """ Scans the data directory for valid databases.
+        Returns a list of ArtemisDatabase with only INFO and stats loaded.
+        The folders are probed in parallel and the result is cached until
+        the sqlite file changes (mtime or size). Safe to call from any thread.
+
+    Args:
+        data_dir (Path): folder containing the DB folders (the application data folder by default)
+        store_dir (Path): folder of the media store of the DBs (the application one by default)
+    """
+    db_dirs = next(os.walk(data_dir))[1]
+    probed = []
+    if db_dirs:
+        with ThreadPoolExecutor(max_workers=min(Constants.DB_SCAN_WORKERS, len(db_dirs))) as executor:
+            probed = list(executor.map(lambda db_dir_name: _probe_db_dir(db_dir_name, data_dir, store_dir), db_dirs))
+
+    entries = {data_dir / db_dir_name: entry for db_dir_name, entry in zip(db_dirs, probed) if entry is not None}
+    with _probe_cache_lock:
+        # Only the entries of this data folder are replaced (the removed DBs are dropped)
+        for db_dir in [db_dir for db_dir in _probe_cache if db_dir.parent == data_dir]:
+            del _probe_cache[db_dir]
+        _probe_cache.update(entries)
+
+    return [database for _, database in entries.values() if database is not None]
+
+
+def _probe_db_dir(db_dir_name, data_dir, store_dir):
+    """ Returns a (file signature, database) tuple for the DB folder, database is None
+        if the folder does not contain a valid DB. Returns None if there is no sqlite file.
+    """
+    database = ArtemisDatabase(db_dir_name, data_dir, store_dir)
+
+    try:
+        stat = os.stat(database.sql_path)
+    except OSError:
+        return None
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _probe_cache_lock:
+        cached = _probe_cache.get(database.db_dir)
+    if cached is not None and cached[0] == signature:
+        return cached
+
+    try:
+        database.probe()
+    except Exception:
+        return signature, None
+    finally:
+        database.close()
+
+    return signature, database
+
+
+@PROFILER.profiled('io')
+def import_database(tar_path, data_dir=DATA_DIR, store_dir=STORE_DIR):
+    """ Import a DB archive in the data folder: the DB is extracted in a new folder and
+        its media files in the media store. Returns the loaded DB.
+
+    Args:
+        tar_path (str): path of the tar archive
+        data_dir (Path): folder containing the DB folders (the application data folder by default)
+        store_dir (Path): folder of the media store (the application one by default)
+    """
+    database = ArtemisDatabase(str(uuid.uuid4()), data_dir, store_dir)
+    media = {}
+    try:
+        media = unpack_tar(tar_path, database.db_dir, database.store)
+        database.link_archive_media(media)
+        database.migrate()
+        database.load()
+    except Exception:
+        database.delete()
+        raise
+    finally:
+        # Blobs of files not belonging to any document (or of a failed import)
+        database.store.collect(media.values())
+
+    return database
+
+
+def open_database(db_dir_name, data_dir=DATA_DIR, store_dir=STORE_DIR):
+    """ Return a DB ready to be shown: migrated, loaded, with its signals list queried.
+        Slow for a DB of an older version (see ArtemisDatabase.migrate): run it off the GUI thread.
+
+    Args:
+        db_dir_name (str): folder name of the DB in the data folder
+        data_dir (Path): folder containing the DB folders (the application data folder by default)
+        store_dir (Path): folder of the media store (the application one by default)
+    """
+    database = ArtemisDatabase(db_dir_name, data_dir, store_dir)
+    database.migrate()
+    database.load()
+    database.all_signals
+    return database
+
+
+def get_latest_sigid_db():
+    """ Return the newest valid local sigID database.
+        Returns None if no valid sigID database is found.
+    """
+    sig_id_dbs = [db for db in scan_databases() if db.editable == -1]
+    return max(sig_id_dbs, key=lambda x: x.version, default=None)
+
 ################################## MARK: >>> SIGNAL <<<
 
 class ArtemisSignal():
@@ -203,17 +777,36 @@ class ArtemisSignal():
         self.audio_path = None
 
 
+    @PROFILER.profiled('db')
     def load(self, sig_id):
+        """ Load the signal with all its parameters and documents in a single
+            round trip: every child table is aggregated as a JSON array by SQLite
+        """
         self.sig_id = sig_id
-        self._select_signals()
-        self._select_category()
-        self._select_frequency()
-        self._select_bandwidth()
-        self._select_modulation()
-        self._select_mode()
-        self._select_location()
-        self._select_acf()
-        self.select_documents()
+        details = self.db.execute(Query.SELECT_SIGNAL_DETAILS, [self.sig_id])[0]
+        (
+            self.name,
+            self.description,
+            self.url,
+            category,
+            frequency,
+            bandwidth,
+            modulation,
+            mode,
+            location,
+            acf,
+            documents
+        ) = details
+
+        self.category = json.loads(category)
+        self.frequency = self._format_values(json.loads(frequency))
+        self.bandwidth = self._format_values(json.loads(bandwidth))
+        self.modulation = json.loads(modulation)
+        self.mode = json.loads(mode)
+        self.location = json.loads(location)
+        self.acf = json.loads(acf)
+        self.documents = json.loads(documents)
+        self._select_default_media()
 
 
     def generate_dic(self):
@@ -238,67 +831,34 @@ class ArtemisSignal():
 ################################## MARK: SELECT Methods
 
 
-    def _select_signals(self):
-        signal = self.db.execute(Query.SELECT_SIGNAL, [self.sig_id])[0]
-        self.name = signal[0]
-        self.description = signal[1]
-        self.url = signal[2]
-
-
-    def _select_category(self):
-        self.category = self.db.execute(Query.SELECT_CATEGORY, [self.sig_id])
-        self.category = [list(x) for x in self.category]
-
-
-    def _select_frequency(self):
-        result = self.db.execute(Query.SELECT_FREQUENCY, [self.sig_id])
-        sorted_list = sorted(result, key=itemgetter(1))
-        self.frequency = [list(x) + [format_frequency(x[1])] for x in sorted_list]
-
-
-    def _select_bandwidth(self):
-        result = self.db.execute(Query.SELECT_BANDWIDTH, [self.sig_id])
-        sorted_list = sorted(result, key=itemgetter(1))
-        self.bandwidth = [list(x) + [format_frequency(x[1])] for x in sorted_list]
-
-
-    def _select_acf(self):
-        self.acf = self.db.execute(Query.SELECT_ACF, [self.sig_id])
-        self.acf = [list(x) for x in self.acf]
-
-
-    def _select_modulation(self):
-        self.modulation = self.db.execute(Query.SELECT_MODULATION, [self.sig_id])
-        self.modulation = [list(x) for x in self.modulation]
-
-
-    def _select_mode(self):
-        self.mode = self.db.execute(Query.SELECT_MODE, [self.sig_id])
-        self.mode = [list(x) for x in self.mode]
-
-
-    def _select_location(self):
-        self.location = self.db.execute(Query.SELECT_LOCATION, [self.sig_id])
-        self.location = [list(x) for x in self.location]
+    @staticmethod
+    def _format_values(values):
+        """ Sort a list of [id, value, description] by value and append the human-readable value
+        """
+        sorted_list = sorted(values, key=itemgetter(1))
+        return [list(x) + [format_frequency(x[1])] for x in sorted_list]
 
 
     def select_documents(self):
         self.documents = self.db.execute(Query.SELECT_DOCUMENTS, [self.sig_id])
+        self._select_default_media()
 
+
+    def _select_default_media(self):
+        """ Set the paths of the default spectrum and audio sample among the loaded documents
+        """
         default_spectrum = [doc for doc in self.documents if doc[4] == 'Image' and doc[5] == 1]
         default_audio = [doc for doc in self.documents if doc[4] == 'Audio' and doc[5] == 1]
 
         if default_spectrum != []:
-            default_spectrum_filename = '{}.{}'.format(str(default_spectrum[0][0]), default_spectrum[0][1])
-            self.spectrum_path = self.db.media_dir / default_spectrum_filename
-            self.spectrum_path = QUrl.fromLocalFile(self.spectrum_path.resolve())
+            doc = default_spectrum[0]
+            self.spectrum_path = self.db.document_path(doc[0], doc[1]).resolve().as_uri()
         else:
             self.spectrum_path = 'qrc:///data/images/spectrum_not_available.svg'
 
         if default_audio != []:
-            default_audio_filename = '{}.{}'.format(str(default_audio[0][0]), default_audio[0][1])
-            self.audio_path = self.db.media_dir / default_audio_filename
-            self.audio_path = QUrl.fromLocalFile(self.audio_path.resolve())
+            doc = default_audio[0]
+            self.audio_path = self.db.document_path(doc[0], doc[1]).resolve().as_uri()
         else:
             self.audio_path = ''
 
@@ -342,7 +902,7 @@ class ArtemisSignal():
 
 
     def insert_signal(self, value, description):
-        self.db.execute(Query.INSERT_SIGNAL, [value, description])
+        self.sig_id = self.db.execute(Query.INSERT_SIGNAL, [value, description], True)[1]
 
 
     def insert_frequency(self, value, description):
@@ -0,0 +1,446 @@
+import os
+import json
+import queue
+import hashlib
+import tarfile
+import threading
+
+from pathlib import Path
+from shutil import rmtree
+
+from artemis.utils.constants import Constants
+
+
+class HashMismatchError(Exception):
+    """ The SHA-256 hash of the received data does not match the expected one """
+
+
+def _file_chunks(f, size, offset=0, chunk_size=2**20):
+    """ Yield size bytes of an open file (starting at offset), chunk by chunk, then close it
+    """
+    with f:
+        f.seek(offset)
+        while size > 0:
+            chunk = f.read(min(chunk_size, size))
+            if not chunk:
+                break
+            size -= len(chunk)
+            yield chunk
+
+
+class _ChunkReader():
+    """ Blocking file-like object reading the chunks pushed in a queue (None marks the end).
+        An item of the queue can also be an iterable of chunks (e.g. a file read lazily).
+        Every chunk is hashed once, while it is consumed. The bytes not read yet are kept
+        in a buffer with a read offset, so that a read copies only the bytes it returns.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._pending = None
+        self._buffer = bytearray()
+        self._offset = 0
+        self._eof = False
+        self.hash = hashlib.sha256()
+
+
+    def _next_chunk(self):
+        while True:
+            if self._pending is not None:
+                chunk = next(self._pending, None)
+                if chunk is not None:
+                    return chunk
+                self._pending = None
+
+            item = self._chunks.get()
+            if item is None or isinstance(item, bytes):
+                return item
+            self._pending = iter(item)
+
+
+    def read(self, size=-1):
+        while not self._eof and (size < 0 or len(self._buffer) - self._offset < size):
+            chunk = self._next_chunk()
+            if chunk is None:
+                self._eof = True
+            else:
+                self.hash.update(chunk)
+                # Drop the bytes already read (once per chunk, not once per read)
+                del self._buffer[:self._offset]
+                self._offset = 0
+                self._buffer += chunk
+
+        end = len(self._buffer) if size < 0 else min(self._offset + size, len(self._buffer))
+        data = bytes(self._buffer[self._offset:end])
+        self._offset = end
+        return data
+
+
+    def drain(self):
+        """ Consume (and hash) the data left after the end of the archive
+        """
+        while self.read(2**20):
+            pass
+
+
+class StreamingUnpacker():
+    """ Verify and extract a tar archive while its bytes are received, without saving it.
+        The chunks passed to write() are hashed (SHA-256) and extracted in a staging folder
+        by a worker thread. Once the whole archive is received, commit() checks the hash
+        and moves the staging folder to its destination, so that the archive is never
+        read back from the disk. At most Constants.STREAM_QUEUE_CHUNKS chunks wait for the
+        worker: write() blocks when the extraction is slower than the download.
+        If a media store is given, the files of media/ are saved in the store by the worker
+        (as they are received) instead of the staging folder.
+    """
+    STAGING_DIR = '.staging'
+
+
+    def __init__(self, destination, reference_hash, media_store=None):
+        """ Args:
+            destination (Path): folder where the archive is extracted (must not exist)
+            reference_hash (str): expected SHA-256 hash of the archive
+            media_store (MediaStore): store of the media files
+        """
+        self.destination = destination
+        self.reference_hash = reference_hash
+        self.media_store = media_store
+        self.staging = destination.parent / self.STAGING_DIR / destination.name
+        self._start()
+
+
+    def _start(self):
+        self._chunks = queue.Queue(maxsize=Constants.STREAM_QUEUE_CHUNKS)
+        self._reader = _ChunkReader(self._chunks)
+        self._error = None
+        self._closed = False
+        # {file name: blob} of the media files saved in the store
+        self.media = {}
+
+        # Left by a previous run interrupted during the extraction
+        rmtree(self.staging, ignore_errors=True)
+        os.makedirs(self.staging)
+        self._thread = threading.Thread(target=self._extract, daemon=True)
+        self._thread.start()
+
+
+    def _extract(self):
+        try:
+            with tarfile.open(fileobj=self._reader, mode='r|') as tar:
+                if self.media_store is None:
+                    tar.extractall(self.staging, filter='data')
+                else:
+                    self._extract_members(tar)
+            self._reader.drain()
+        except Exception as e:
+            self._error = e
+            # Keep consuming, so that the queued chunks are released
+            try:
+                self._reader.drain()
+            except Exception:
+                pass
+
+
+    def _extract_members(self, tar):
+        for member in tar:
+            name = os.path.normpath(member.name)
+            if member.isfile() and os.path.dirname(name) == Constants.MEDIA_DIR:
+                file_name = os.path.basename(name)
+                self.media[file_name] = self.media_store.add_stream(tar.extractfile(member), file_name.partition('.')[2])
+            else:
+                tar.extract(member, self.staging, filter='data')
+
+
+    def write(self, chunk):
+        """ Feed the next chunk of the archive (called as the data arrive)
+        """
+        if not self._closed and self._error is None:
+            self._chunks.put(bytes(chunk))
+
+
+    def write_file(self, path, size, offset=0):
+        """ Feed size bytes of a file, starting at offset (e.g. the part of the archive
+            received before a download was interrupted). The file is opened right away and
+            read by the worker thread, so it can be removed before the worker reaches it.
+        """
+        if not self._closed and self._error is None:
+            self._chunks.put(_file_chunks(open(path, 'rb'), size, offset))
+
+
+    def _close(self):
+        if not self._closed:
+            self._closed = True
+            self._chunks.put(None)
+            self._thread.join()
+
+
+    def commit(self, link_media=None):
+        """ Wait for the extraction of the last chunks, then check the hash and move the
+            extracted files to the destination. Raises HashMismatchError if the archive
+            is corrupted, or the extraction error (the staging folder is removed in both cases)
+
+        Args:
+            link_media (callable): called with the staging folder and the {file name: blob}
+                of the media files saved in the store, once the archive is verified and
+                before it is moved, to reference them (the blobs left unreferenced are deleted)
+        """
+        self._close()
+
+        try:
+            if self._error is not None:
+                raise self._error
+            if self._reader.hash.hexdigest() != self.reference_hash:
+                raise HashMismatchError(self.reference_hash)
+            if link_media is not None:
+                link_media(self.staging, self.media)
+            try:
+                os.replace(self.staging, self.destination)
+            except BaseException:
+                if self.media_store is not None:
+                    self.media_store.release(self.destination.name)
+                raise
+        finally:
+            rmtree(self.staging, ignore_errors=True)
+            self._collect_media()
+
+
+    def _collect_media(self):
+        if self.media_store is not None:
+            self.media_store.collect(self.media.values())
+
+
+    def cancel(self):
+        """ Stop the extraction and remove the extracted files (and the media files saved
+            in the store)
+        """
+        self._closed = True
+        self._error = self._error or RuntimeError('cancelled')
+        self._chunks.put(None)
+        self._thread.join()
+        rmtree(self.staging, ignore_errors=True)
+        self._collect_media()
+
+
+    def reset(self):
+        """ Discard the data received so far and start again from the beginning of the archive
+        """
+        self.cancel()
+        self._start()
+
+
+def clean_staging(staging_dir, keep=()):
+    """ Remove what the previous runs left in a staging folder: the folders of the
+        extractions interrupted by a crash and the partial files of other downloads
+
+    Args:
+        staging_dir (Path): staging folder
+        keep (iterable): names of the entries to be kept (e.g. the download to be resumed)
+    """
+    try:
+        entries = list(os.scandir(staging_dir))
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry.name in keep:
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            rmtree(entry.path, ignore_errors=True)
+        else:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+class PartialFile():
+    """ File being downloaded, saved as <name>.part next to a JSON sidecar (<name>.part.json)
+        recording the URL, the ETag of the remote file and, for each segment of the file,
+        the bytes safely written. An interrupted download can then be resumed from the saved
+        positions (HTTP Range requests), even after a restart of the application.
+
+        A file is downloaded as a single segment of unknown length, or split in several
+        segments (a few of them downloaded in parallel) written at their offsets in a
+        preallocated file.
+        Each segment is a [start, position, end] list, end being None for the single segment.
+    """
+    PART_SUFFIX = '.part'
+    STATE_SUFFIX = '.part.json'
+
+
+    def __init__(self, path, state_interval=Constants.DOWNLOAD_STATE_INTERVAL):
+        """ Args:
+            path (Path): final path of the downloaded file
+            state_interval (int): bytes written between two updates of the sidecar
+        """
+        self.path = Path(path)
+        self.part_path = self.path.with_name(self.path.name + self.PART_SUFFIX)
+        self.state_path = self.path.with_name(self.path.name + self.STATE_SUFFIX)
+        self.state_interval = state_interval
+
+        self.url = None
+        self.etag = None
+        self.total = None
+        self.segments = [[0, 0, None]]
+        self._unsaved = 0
+        self._file = None
+
+
+    @property
+    def offset(self):
+        """ Number of contiguous bytes written from the beginning of the file
+        """
+        for start, position, end in self.segments:
+            if end is None or position < end:
+                return position
+        return self.segments[-1][2]
+
+
+    @property
+    def received(self):
+        """ Number of bytes written (in all the segments)
+        """
+        return sum(position - start for start, position, _ in self.segments)
+
+
+    def pending(self):
+        """ Indexes of the segments not completely written
+        """
+        return [index for index, (_, position, end) in enumerate(self.segments) if end is None or position < end]
+
+
+    def is_complete(self, index):
+        _, position, end = self.segments[index]
+        return end is not None and position >= end
+
+
+    def close_segment(self, index):
+        """ Mark the end of a segment of unknown length (its download is complete)
+        """
+        segment = self.segments[index]
+        segment[2] = segment[1]
+        if self.total is None:
+            self.total = segment[1]
+
+
+    def _load_state(self):
+        try:
+            with open(self.state_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+    def open(self, url):
+        """ Open the part file, keeping the bytes already received if they come from the same URL
+
+        Args:
+            url (str): url of the remote file
+        """
+        state = self._load_state()
+        self.url = url
+
+        if state.get('url') == url and state.get('segments') and self.part_path.exists():
+            # The sidecar is written after the data are flushed, so its positions are never
+            # past the bytes actually saved
+            size = self.part_path.stat().st_size
+            self.segments = [[start, min(position, size), end] for start, position, end in state['segments']]
+            self.etag = state.get('etag')
+            self.total = state.get('total')
+        else:
+            self.segments = [[0, 0, None]]
+            self.etag = None
+            self.total = None
+
+        os.makedirs(self.part_path.parent, exist_ok=True)
+        self._file = open(self.part_path, 'r+b' if self.part_path.exists() else 'wb')
+        if len(self.segments) == 1:
+            self._file.truncate(self.offset)
+        self.save_state()
+
+
+    def restart(self, etag=None, total=None):
+        """ Drop the bytes received so far (the remote file changed or cannot be resumed)
+            and go back to a single segment
+        """
+        self._file.truncate(0)
+        self.segments = [[0, 0, None]]
+        self.etag = etag
+        self.total = total
+        self.save_state()
+
+
+    def split(self, total, size, etag=None):
+        """ Preallocate the file and split it in segments of size bytes (the last
+            one may be shorter), only before writing any data
+        """
+        self._file.truncate(total)
+        self.segments = [[start, start, min(start + size, total)] for start in range(0, total, size)]
+        self.etag = etag
+        self.total = total
+        self.save_state()
+
+
+    def write(self, data, index=0):
+        """ Write the data at the current position of a segment
+        """
+        segment = self.segments[index]
+        self._file.seek(segment[1])
+        self._file.write(data)
+        segment[1] += len(data)
+
+        self._unsaved += len(data)
+        if self._unsaved >= self.state_interval:
+            self.save_state()
+
+
+    def flush(self):
+        self._file.flush()
+
+
+    def save_state(self):
+        """ Flush the part file and record the positions in the sidecar
+        """
+        self._file.flush()
+        with open(self.state_path, 'w') as f:
+            json.dump({'url': self.url, 'etag': self.etag, 'total': self.total, 'segments': self.segments}, f)
+        self._unsaved = 0
+
+
+    def close(self):
+        """ Close the part file, keeping it for a later resume
+        """
+        if self._file is not None:
+            self.save_state()
+            self._file.close()
+            self._file = None
+
+
+    def commit(self):
+        """ Close the part file and move it to the final path
+        """
+        self._file.close()
+        self._file = None
+        os.replace(self.part_path, self.path)
+        self.state_path.unlink(missing_ok=True)
+
+
+    def discard(self):
+        """ Close and remove the part file and its sidecar. A part file still open elsewhere
+            cannot be removed on Windows: it is left to clean_staging()
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.state_path.unlink(missing_ok=True)
+        try:
+            self.part_path.unlink(missing_ok=True)
+        except PermissionError:
+            pass
+
+
+    @property
+    def file_names(self):
+        """ Names of the part file and of its sidecar
+        """
+        return {self.part_path.name, self.state_path.name}
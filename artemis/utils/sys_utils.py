@@ -7,7 +7,8 @@ import tarfile
 from shutil import rmtree, copyfile, unpack_archive
 from pathlib import Path
 
-from artemis.utils.constants import Messages
+from artemis.utils.constants import Constants, Messages
+from artemis.utils.profile_utils import PROFILER
 
 
 def is_windows() -> bool:
@@ -75,28 +76,61 @@ def delete_file(file_path):
         os.remove(file_path) 
 
 
-def make_tar(save_path, origin_path):
+@PROFILER.profiled('io')
+def make_tar(save_path, origin_path, media_files=None):
     """ Create a tar archive from a folder
 
     Args:
         save_path (str): destination path exactly as provided by QUrl.toLocalFile()
         origin_path (Path): directory path of the folder to be archived
+        media_files (list): (file name, path) of the media files, archived in media/
+            in place of the content of the media/ folder (e.g. files of the media store)
     """
     origin_str = str(origin_path.resolve())
     with tarfile.open(name=save_path, mode="w") as tar:
-        tar.add(origin_str, arcname=".")
+        if media_files is None:
+            tar.add(origin_str, arcname=".")
+            return
+
+        media_arcname = './' + Constants.MEDIA_DIR
+        tar.add(origin_str, arcname=".", filter=lambda info: None if os.path.dirname(info.name) == media_arcname else info)
+        for file_name, path in media_files:
+            tar.add(str(path), arcname='./{}/{}'.format(Constants.MEDIA_DIR, file_name))
 
 
-def unpack_tar(tar_path, destination_path):
-    """ Unpack a tar archive in a folder
+@PROFILER.profiled('io')
+def unpack_tar(tar_path, destination_path, media_store=None):
+    """ Unpack a tar archive in a folder. If a media store is given, the files of media/
+        are saved in the store (as they are read) instead of the folder.
+        Returns the {file name: blob} of the media files saved in the store.
 
     Args:
         tar_path: path of the tar to be unpacked
         destination_path: path where the tar is extracted
+        media_store (MediaStore): store of the media files
     """
-    unpack_archive(tar_path, destination_path, 'tar')
-
+    if media_store is None:
+        unpack_archive(tar_path, destination_path, 'tar')
+        return {}
 
+    media = {}
+    try:
+        with tarfile.open(tar_path, mode='r|') as tar:
+            for member in tar:
+                name = os.path.normpath(member.name)
+                if member.isfile() and os.path.dirname(name) == Constants.MEDIA_DIR:
+                    file_name = os.path.basename(name)
+                    media[file_name] = media_store.add_stream(tar.extractfile(member), file_name.partition('.')[2])
+                else:
+                    tar.extract(member, destination_path, filter='data')
+    except Exception:
+        # Not referenced yet: drop the blobs added by this archive
+        media_store.collect(media.values())
+        raise
+    return media
+
+
+@PROFILER.profiled('io')
 def match_hash(data, reference_hash):
     """ Check whether the checksum of 'data' match the reference one.
 
@@ -107,6 +141,15 @@ def match_hash(data, reference_hash):
     if reference_hash is None:
         raise ValueError("ERROR: Invalid hash code.")
 
+    return file_hash(data) == reference_hash
+
+
+def file_hash(data):
+    """ Return the SHA-256 hash (hex digest) of a file
+
+    Args:
+        data (str): Path of the file
+    """
     code = hashlib.sha256()
     b = bytearray(128*1024)
     mv = memoryview(b)
@@ -114,4 +157,4 @@ def match_hash(data, reference_hash):
         while n := f.readinto(mv):
             code.update(mv[:n])
 
-    return code.hexdigest() == reference_hash
+    return code.hexdigest()
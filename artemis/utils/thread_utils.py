@@ -0,0 +1,68 @@
+import threading
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+class BackgroundTask(QObject):
+    """ Run a function on a worker thread and deliver its result (or the raised exception)
+        to callbacks executed on the GUI thread, so that slow work (network, DB loading)
+        never blocks the UI. The task keeps itself alive until its callback has run.
+    """
+    # Worker thread > GUI Signals
+    _finished = Signal(object)
+    _failed = Signal(object)
+
+    _running = set()
+
+
+    def __init__(self, function, on_finished=None, on_failed=None):
+        """ Args:
+            function (callable): work to be done on the worker thread (no arguments)
+            on_finished (callable): called on the GUI thread with the result of the function
+            on_failed (callable): called on the GUI thread with the exception raised by the function.
+                If missing, the exception is raised again on the GUI thread
+        """
+        super().__init__()
+
+        self._function = function
+        self._on_finished = on_finished
+        self._on_failed = on_failed
+
+        self._finished.connect(self._deliver_result)
+        self._failed.connect(self._deliver_error)
+
+
+    def start(self):
+        BackgroundTask._running.add(self)
+        threading.Thread(target=self._run, daemon=True).start()
+        return self
+
+
+    def _run(self):
+        try:
+            result = self._function()
+        except Exception as e:
+            self._failed.emit(e)
+        else:
+            self._finished.emit(result)
+
+
+    @Slot(object)
+    def _deliver_result(self, result):
+        BackgroundTask._running.discard(self)
+        if self._on_finished is not None:
+            self._on_finished(result)
+
+
+    @Slot(object)
+    def _deliver_error(self, error):
+        BackgroundTask._running.discard(self)
+        if self._on_failed is None:
+            raise error
+        self._on_failed(error)
+
+
+def run_in_background(function, on_finished=None, on_failed=None):
+    """ Shortcut to create and start a BackgroundTask
+    """
+    return BackgroundTask(function, on_finished, on_failed).start()
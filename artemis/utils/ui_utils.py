@@ -1,7 +1,12 @@
 import os
 
+from PySide6.QtCore import QObject, QTimer, QUrl
+from PySide6.QtQml import QQmlComponent
+
 from artemis.utils.sys_utils import is_windows, is_linux, is_macos
 from artemis.utils.config_utils import CONFIGURE_QT
+from artemis.utils.constants import Constants
+from artemis.utils.profile_utils import PROFILER
 
 
 def set_ui():
@@ -21,3 +26,72 @@ def set_ui():
     os.environ['QML_USE_GLYPHCACHE_WORKAROUND'] = '1'
 
     os.environ['QT_DEBUG_PLUGINS'] = CONFIGURE_QT.value('Develop', 'debug_plugin', '0')
+
+
+class WindowFactory(QObject):
+    """ Create the windows of the application from their QML file using a single
+        shared engine, so that the QML types and the compiled components are loaded once.
+        Each component is compiled the first time it is needed and kept for later use.
+    """
+
+    def __init__(self, engine, parent=None):
+        """ Args:
+            engine (QQmlEngine): engine shared by all the windows
+        """
+        super().__init__(parent)
+
+        self._engine = engine
+        self._components = {}
+        self._prewarm_queue = []
+        self._windows = []
+
+
+    def component(self, qml_file):
+        """ Return the compiled component of the QML file (compiled on the first call)
+
+        Args:
+            qml_file (str): QML file url (e.g. qrc:/ui/Preferences.qml)
+        """
+        component = self._components.get(qml_file)
+        if component is None:
+            with PROFILER.span('compile ' + qml_file, 'qml'):
+                component = QQmlComponent(self._engine, QUrl(qml_file), QQmlComponent.PreferSynchronous, self)
+            self._components[qml_file] = component
+        return component
+
+
+    def create_window(self, qml_file):
+        """ Instantiate a new window from the QML file
+
+        Args:
+            qml_file (str): QML file url (e.g. qrc:/ui/Preferences.qml)
+        """
+        component = self.component(qml_file)
+        with PROFILER.span('create ' + qml_file, 'qml'):
+            window = component.create()
+        if window is None:
+            raise RuntimeError("Unable to create {}: {}".format(qml_file, component.errorString()))
+
+        self._windows.append(window)
+        return window
+
+
+    def prewarm(self, qml_files, delay=Constants.WINDOW_PREWARM_DELAY_MS):
+        """ Compile the components of the QML files once the application is idle,
+            one per event loop iteration, so that the windows open faster the first time.
+            No window is created.
+
+        Args:
+            qml_files (list): QML files url
+            delay (int): milliseconds to wait before compiling the first one
+        """
+        self._prewarm_queue.extend(qml_files)
+        QTimer.singleShot(delay, self._prewarm_next)
+
+
+    def _prewarm_next(self):
+        if not self._prewarm_queue:
+            return
+        self.component(self._prewarm_queue.pop(0))
+        QTimer.singleShot(0, self._prewarm_next)
+
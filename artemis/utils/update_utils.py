@@ -1,11 +1,21 @@
 import uuid
+import logging
 import requests
 
 from packaging.version import Version
 
 from artemis.utils.constants import Constants, Messages
-from artemis.utils.sys_utils import is_windows, is_linux, is_macos, is_arm, is_x64, delete_file, match_hash, unpack_tar, open_file
+from artemis.utils.sys_utils import is_windows, is_linux, is_macos, is_arm, is_x64, open_file
+from artemis.utils.stream_utils import StreamingUnpacker, PartialFile, HashMismatchError, clean_staging
+from artemis.utils.delta_utils import apply_delta
 from artemis.utils.path_utils import DATA_DIR, TMP_DIR
+from artemis.utils.sql_utils import ArtemisDatabase, get_latest_sigid_db, open_database
+from artemis.utils.media_utils import media_store
+from artemis.utils.thread_utils import run_in_background
+from artemis.utils.profile_utils import PROFILER
+
+
+logger = logging.getLogger(__name__)
 
 
 class UpdateManager:
@@ -23,14 +33,19 @@ class UpdateManager:
         self.remote_db_version = None
         self.remote_db_size = None
         self.remote_db_file_name = None
+        self.remote_db_deltas = None
+        self.local_db = None
 
         self.remote_artemis_version = None
         self.remote_artemis_url = None
         self.remote_artemis_file_name = None
 
-        self.update()
+        self._db_unpacker = None
+        self._on_downloaded = None
+        self._downloader_connected = False
 
 
+    @PROFILER.profiled('net')
     def _get_meta(self):
         latest_json = self.fetch_remote_json(Constants.LATEST_VERSION_URL)
 
@@ -39,7 +54,7 @@ class UpdateManager:
             self.art_update = False
             return
 
-        local_db = self._parent.dbmanager.get_latest_local_sigid_db()
+        local_db = get_latest_sigid_db()
         remote_db = latest_json['sigID_DB']
 
         self.remote_db_version = remote_db['version']
@@ -47,6 +62,8 @@ class UpdateManager:
         self.remote_db_hash = remote_db['sha256_hash']
         self.remote_db_size = remote_db['total_bytes']
         self.remote_db_file_name = self.remote_db_url.split('/')[-1]
+        self.remote_db_deltas = remote_db.get('deltas', {})
+        self.local_db = local_db
 
         if is_windows():
             if is_x64():
@@ -79,40 +96,59 @@ class UpdateManager:
 
 
     def update(self, show_popup=False):
-        """ Main updating routine
+        """ Main updating routine. The remote metadata are fetched on a worker
+            thread (the UI is never blocked by the network), then the user is
+            notified from the GUI thread.
 
             Args:
                 show_popup (bool, optional): If false, suppress any error message
                 Defaults to False (to avoid error if the program is used offline)
         """
-        try:
-            self._get_meta()
+        run_in_background(
+            self._get_meta,
+            lambda _: self._notify_update(show_popup),
+            lambda e: self._notify_update_error(e, show_popup)
+        )
 
-            if self.db_update:
-                self._show_popup_db_update()
-            elif self.db_update is None:
-                self._show_popup_initial_db_download()
 
-            if self.art_update:
-                self._show_popup_art_update()
+    def _notify_update(self, show_popup):
+        """ Notify the user about the available updates, once the remote metadata are fetched
+        """
+        if self.db_update:
+            self._show_popup_db_update()
+        elif self.db_update is None:
+            self._show_popup_initial_db_download()
 
-            has_updates = bool(self.art_update or self.db_update or self.db_update is None)
+        if self.art_update:
+            self._show_popup_art_update()
 
-            if show_popup and not has_updates:
-                self._show_popup_up_to_date()
+        has_updates = bool(self.art_update or self.db_update or self.db_update is None)
 
-            self._parent.set_update_available(has_updates)
+        if show_popup and not has_updates:
+            self._show_popup_up_to_date()
 
-        except requests.exceptions.RequestException as e:
-            self.db_update = False
-            self.art_update = False
+        self._parent.set_update_available(has_updates)
 
-            if show_popup:
-                self._parent.dialog_popup(
-                    Messages.DIALOG_TYPE_ERROR,
-                    Messages.NO_CONNECTION,
-                    Messages.NO_CONNECTION_MSG.format(e)
-                )
+
+    def _notify_update_error(self, e, show_popup):
+        """ The remote metadata could not be fetched (network error, reported only if
+            the check was asked by the user) or are invalid (always reported)
+        """
+        self.db_update = False
+        self.art_update = False
+
+        if not isinstance(e, requests.exceptions.RequestException):
+            self._parent.dialog_popup(
+                Messages.DIALOG_TYPE_ERROR,
+                Messages.GENERIC_ERROR,
+                Messages.GENERIC_ERROR_MSG.format(e)
+            )
+        elif show_popup:
+            self._parent.dialog_popup(
+                Messages.DIALOG_TYPE_ERROR,
+                Messages.NO_CONNECTION,
+                Messages.NO_CONNECTION_MSG.format(e)
+            )
 
 
     def fetch_remote_json(self, url):
@@ -124,32 +160,133 @@ class UpdateManager:
 
 
     def download_db(self):
-        """ Open the downloader and download the sigID database in the 
-            TMP_DIR folder. After a succesfull download the callback function
-            from the downloader is post_download_db
+        """ Update the sigID database. If the release provides a delta from the local
+            version, only the changes are downloaded (on a worker thread), otherwise
+            the whole database is downloaded.
+            What interrupted downloads left in the staging folder is removed first,
+            except the partial archive that can be resumed.
+        """
+        staging_dir = DATA_DIR / StreamingUnpacker.STAGING_DIR
+        clean_staging(staging_dir, PartialFile(staging_dir / self.remote_db_url.split('/')[-1]).file_names)
+
+        delta = self.local_db and self.remote_db_deltas.get(str(self.local_db.version))
+
+        if delta:
+            destination = DATA_DIR / str(uuid.uuid4())
+            self._parent.downloader.show_busy(Messages.DB_DELTA_STATUS_MSG)
+            run_in_background(
+                lambda: self._apply_delta(delta, destination),
+                self._on_delta_applied,
+                self._on_delta_failed
+            )
+        else:
+            self.download_db_archive()
+
+
+    def _apply_delta(self, delta, destination):
+        """ Build the new DB from the local one and the delta, then load it (worker thread)
+        """
+        apply_delta(delta['url'], delta['sha256_hash'], self.local_db, destination)
+        return open_database(destination.name)
+
+
+    def _on_delta_applied(self, database):
+        self._parent.downloader.hide_busy()
+        self._show_downloaded_db(database)
+
+
+    def _on_delta_failed(self, e):
+        """ The delta could not be applied (network error, local DB modified, corrupted
+            data...): fall back to the download of the whole database
+        """
+        logger.warning(Messages.DB_DELTA_FAILED_MSG.format(e))
+        self._parent.downloader.hide_busy()
+        self.download_db_archive()
+
+
+    def download_db_archive(self):
+        """ Open the downloader and download the sigID database. The archive is
+            hashed and extracted while it is downloaded (the tar is kept only as a
+            partial file, in the staging folder, until the download is complete).
+            After a succesfull download the callback function from the downloader
+            is post_download_db
         """
-        self._parent.downloader.finished.connect(self.post_download_db)
-        self._parent.downloader.on_start(
+        self._db_unpacker = StreamingUnpacker(DATA_DIR / str(uuid.uuid4()), self.remote_db_hash, media_store())
+        self._downloader(self.post_download_db).on_start_stream(
             self.remote_db_url,
-            TMP_DIR
+            self._db_unpacker.staging.parent,
+            self._db_unpacker
         )
 
 
     def post_download_db(self):
         """ After a succesfull DB download, this function check the hash
-            for possible corrupted data, delete old sigID DB and extract
-            the new one
-        """
-        latest_db_tar_path = TMP_DIR / self.remote_db_file_name
-        if match_hash(latest_db_tar_path, self.remote_db_hash):
-            db_dir_name = str(uuid.uuid4())
-            unpack_tar(latest_db_tar_path, DATA_DIR / db_dir_name)
-            self._parent.load_db(db_dir_name)
-            self._parent.set_update_available(False)
-            self._show_popup_db_download_complete()
-        else:
+            for possible corrupted data and, if valid, load the extracted DB.
+            The end of the extraction is awaited on a worker thread.
+        """
+        unpacker, self._db_unpacker = self._db_unpacker, None
+        if unpacker is None:
+            return
+
+        run_in_background(lambda: self._commit_db(unpacker), self._show_downloaded_db, self._on_db_commit_failed)
+
+
+    @staticmethod
+    def _commit_db(unpacker):
+        """ Verify the extracted DB and move it to the data folder, its media files being
+            referenced first, then load it (worker thread)
+        """
+        store_dir = unpacker.media_store.root
+
+        def link_media(staging, media):
+            database = ArtemisDatabase(staging.name, staging.parent, store_dir)
+            try:
+                database.link_archive_media(media)
+            finally:
+                database.close()
+
+        unpacker.commit(link_media)
+        return open_database(unpacker.destination.name, unpacker.destination.parent, store_dir)
+
+
+    def _on_db_commit_failed(self, e):
+        """ The downloaded archive is corrupted or cannot be extracted
+        """
+        if isinstance(e, HashMismatchError):
             self._show_popup_db_hash_failed()
-        delete_file(latest_db_tar_path)
+        else:
+            self._parent.dialog_popup(
+                Messages.DIALOG_TYPE_ERROR,
+                Messages.GENERIC_ERROR,
+                Messages.GENERIC_ERROR_MSG.format(e)
+            )
+
+
+    def _show_downloaded_db(self, database):
+        """ Show the DB downloaded (as an archive or a delta)
+        """
+        self._parent.show_db(database)
+        self._parent.set_update_available(False)
+        self._show_popup_db_download_complete()
+
+
+    def _downloader(self, on_downloaded):
+        """ Return the downloader, with on_downloaded as the callback of its next completed
+            download. The finished signal is connected only once: a download started
+            again (resumed, retried) replaces the callback instead of adding another one.
+        """
+        downloader = self._parent.downloader
+        if not self._downloader_connected:
+            downloader.finished.connect(self._on_download_finished)
+            self._downloader_connected = True
+        self._on_downloaded = on_downloaded
+        return downloader
+
+
+    def _on_download_finished(self):
+        callback, self._on_downloaded = self._on_downloaded, None
+        if callback is not None:
+            callback()
 
 
     def download_artemis(self):
@@ -157,8 +294,7 @@ class UpdateManager:
             TMP_DIR folder. After a succesfull download the callback function
             from the downloader is post_download_artemis
         """
-        self._parent.downloader.finished.connect(self.post_download_artemis)
-        self._parent.downloader.on_start(
+        self._downloader(self.post_download_artemis).on_start(
             self.remote_artemis_url,
             TMP_DIR
         )
@@ -0,0 +1,266 @@
+""" Headless benchmarks of the Artemis data layer.
+
+Synthetic databases (same schema as the ones created by the application) are generated
+in a temporary folder, then the main operations of the data layer are timed on each of them.
+No display is needed. The results are saved as JSON and can be compared with a previous run:
+
+    python scripts/benchmark.py --sizes 500 10000 100000 --output bench.json
+    python scripts/benchmark.py --compare bench.json
+"""
+import os
+import sys
+import json
+import random
+import argparse
+import platform
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+import uuid
+
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from artemis.core import (
+    Query, ArtemisDatabase, ArtemisSignal, scan_databases, generate_filter_query, make_tar, unpack_tar, match_hash
+)
+
+
+DEFAULT_SIZES = [500, 10000, 100000]
+MODULATIONS = ['AM', 'FM', 'USB', 'LSB', 'CW', 'FSK', 'PSK', 'OFDM', 'QAM', 'MSK']
+LOCATIONS = ['Worldwide', 'Europe', 'North America', 'Asia', 'Russia', 'Australia']
+CATEGORY_LABELS = ['Military', 'Amateur', 'Aviation', 'Marine', 'Utility', 'Broadcast', 'Satellite']
+WORDS = ['digital', 'radar', 'beacon', 'burst', 'modem', 'voice', 'telemetry', 'navigation', 'data', 'link']
+MEDIA_FILES = 1000
+MEDIA_FILE_SIZE = 32 * 1024
+SIGNALS_LOADED = 200
+OBSERVATIONS = 1000
+
+
+def generate_database(data_dir, store_dir, n_signals, seed=0):
+    """ Create a synthetic DB with n_signals signals (with frequencies, bandwidths, modulations,
+        modes, locations, ACFs, categories and documents) and some media files
+        (moved to the media store in store_dir, as for the DBs used by the application)
+    """
+    rnd = random.Random(seed)
+
+    database = ArtemisDatabase(str(uuid.uuid4()), data_dir, store_dir)
+    database.create('Benchmark {}'.format(n_signals))
+    database.close()
+
+    signals, categories, documents = [], [], []
+    children = {query: [] for query in (
+        Query.INSERT_FREQUENCY, Query.INSERT_BANDWIDTH, Query.INSERT_MODULATION,
+        Query.INSERT_MODE, Query.INSERT_LOCATION, Query.INSERT_ACF
+    )}
+
+    for sig_id in range(1, n_signals + 1):
+        name = '{} {} {:06d}'.format(rnd.choice(WORDS).upper(), rnd.choice(WORDS), sig_id)
+        signals.append((name, ' '.join(rnd.choices(WORDS, k=12))))
+
+        for _ in range(rnd.randint(1, 3)):
+            children[Query.INSERT_FREQUENCY].append((sig_id, rnd.randint(3 * 10**3, 3 * 10**10), None))
+        for _ in range(rnd.randint(0, 2)):
+            children[Query.INSERT_BANDWIDTH].append((sig_id, rnd.randint(10, 10**7), None))
+        children[Query.INSERT_MODULATION].append((sig_id, rnd.choice(MODULATIONS), None))
+        children[Query.INSERT_MODE].append((sig_id, rnd.choice(['Single', 'Duplex']), None))
+        children[Query.INSERT_LOCATION].append((sig_id, rnd.choice(LOCATIONS), None))
+        if rnd.random() < 0.3:
+            children[Query.INSERT_ACF].append((sig_id, round(rnd.uniform(1, 1000), 1), None))
+        categories.append((sig_id, rnd.randint(1, len(CATEGORY_LABELS))))
+        documents.append((sig_id, 'png', 'Spectrum', None, 'Image', 1))
+
+    with closing(sqlite3.connect(database.sql_path)) as conn:
+        with conn:
+            conn.executemany(Query.INSERT_CATEGORY_LABEL, [(label,) for label in CATEGORY_LABELS])
+            conn.executemany(Query.INSERT_SIGNAL, signals)
+            conn.executemany(Query.INSERT_CATEGORY, categories)
+            conn.executemany(Query.INSERT_DOCUMENTS, documents)
+            for query, rows in children.items():
+                conn.executemany(query, rows)
+
+    # Media files, capped: the archive benchmarks measure the throughput, not the DB size
+    for doc_id in range(1, min(n_signals, MEDIA_FILES) + 1):
+        with open(database.media_dir / '{}.png'.format(doc_id), 'wb') as f:
+            f.write(rnd.randbytes(MEDIA_FILE_SIZE))
+
+    database.migrate()
+    database.close()
+    return database
+
+
+def measure(function, rounds, setup=None):
+    """ Time the function (after an optional untimed setup) and return the statistics in ms
+    """
+    timings = []
+    for _ in range(rounds):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        function(argument) if setup else function()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'rounds': rounds,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+        'max': max(timings)
+    }
+
+
+def filter_cases():
+    """ One filter per filter type (and one combining all of them), as sent by the FilterPage
+    """
+    return {
+        'frequency': {'frequency': {'lower_band': 10**8, 'upper_band': 2 * 10**8}},
+        'bandwidth': {'bandwidth': {'lower_band': 10**3, 'upper_band': 10**4}},
+        'acf': {'acf': {'lower_band': 100, 'upper_band': 200}},
+        'modulation': {'modulation': ['FSK', 'PSK']},
+        'location': {'location': ['Europe']},
+        'category': {'category': [1, 3]},
+        'combined': {
+            'frequency': {'lower_band': 10**6, 'upper_band': 10**10},
+            'modulation': ['FSK', 'PSK', 'AM'],
+            'location': ['Europe', 'Worldwide'],
+            'category': [1, 2, 3]
+        }
+    }
+
+
+def run_benchmarks(data_dir, work_dir, size, rounds):
+    results = {}
+
+    store_dir = work_dir / 'media'
+    database = generate_database(data_dir, store_dir, size)
+    db_dir_name = database.db_dir_name
+
+    def fresh_database():
+        return ArtemisDatabase(db_dir_name, data_dir, store_dir)
+
+    def load_database(db):
+        db.load()
+        db.close()
+
+    def load_signals_list(db):
+        db.load()
+        db.all_signals
+        db.close()
+
+    results['ArtemisDatabase.load'] = measure(load_database, rounds, fresh_database)
+    results['ArtemisDatabase.load + all_signals'] = measure(load_signals_list, rounds, fresh_database)
+
+    database = fresh_database()
+    database.load()
+    sig_ids = [signal['SIG_ID'] for signal in database.all_signals]
+    sample = random.Random(1).sample(sig_ids, min(SIGNALS_LOADED, len(sig_ids)))
+
+    def load_signals():
+        for sig_id in sample:
+            ArtemisSignal(database).load(sig_id)
+
+    results['ArtemisSignal.load x{}'.format(len(sample))] = measure(load_signals, rounds)
+
+    def reset_range_index():
+        database.invalidate('range_index')
+        return database
+
+    def build_range_index(db):
+        db.range_index
+
+    results['range_index build'] = measure(build_range_index, rounds, reset_range_index)
+    database.range_index
+
+    for name, filter_status in filter_cases().items():
+        list_filters = {key: val for key, val in filter_status.items() if key not in Query.SELECT_RANGES}
+        if list_filters:
+            results['generate_filter_query [{}]'.format(name)] = measure(lambda: generate_filter_query(list_filters), rounds)
+        results['select_by_filter [{}]'.format(name)] = measure(lambda: database.select_by_filter(filter_status), rounds)
+
+    rnd = random.Random(2)
+    observations = [
+        (rnd.randint(3 * 10**3, 3 * 10**10), rnd.choice([None, rnd.randint(10, 10**7)]), None)
+        for _ in range(OBSERVATIONS)
+    ]
+    results['identify x{}'.format(OBSERVATIONS)] = measure(lambda: database.identify(observations, frequency_tolerance=1000), rounds)
+
+    database.close()
+
+    results['scan_databases'] = measure(lambda: scan_databases(data_dir, store_dir), rounds)
+
+    tar_path = work_dir / 'export-{}.tar'.format(size)
+    unpack_dir = work_dir / 'import-{}'.format(size)
+    results['make_tar'] = measure(lambda: make_tar(str(tar_path), database.db_dir, database.media_files()), rounds)
+    results['unpack_tar'] = measure(lambda: unpack_tar(str(tar_path), str(unpack_dir), database.store), rounds)
+
+    results['match_hash'] = measure(lambda: match_hash(str(tar_path), '0' * 64), rounds)
+    results['archive size (MB)'] = round(tar_path.stat().st_size / 2**20, 2)
+
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(report, reference=None):
+    for size, results in report['results'].items():
+        print('\n{} signals'.format(size))
+        for name, stats in results.items():
+            if not isinstance(stats, dict):
+                print('  {:<45} {}'.format(name, stats))
+                continue
+
+            line = '  {:<45} {:>10.3f} ms (median, min {:.3f} ms)'.format(name, stats['median'], stats['min'])
+            old = (reference or {}).get('results', {}).get(size, {}).get(name)
+            if isinstance(old, dict) and old['median'] > 0:
+                line += '  {:+.1f}% vs {}'.format((stats['median'] / old['median'] - 1) * 100, reference.get('commit'))
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless benchmarks of the Artemis data layer')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='number of signals of the synthetic DBs')
+    parser.add_argument('--rounds', type=int, default=5, help='timed rounds of each benchmark')
+    parser.add_argument('--output', type=Path, help='save the results in this JSON file')
+    parser.add_argument('--compare', type=Path, help='JSON results of a previous run to compare with')
+    args = parser.parse_args()
+
+    report = {
+        'commit': git_commit(),
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'rounds': args.rounds,
+        'results': {}
+    }
+
+    with tempfile.TemporaryDirectory(prefix='artemis-benchmark-') as tmp:
+        for size in args.sizes:
+            data_dir = Path(tmp) / 'data-{}'.format(size)
+            work_dir = Path(tmp) / 'work-{}'.format(size)
+            os.makedirs(data_dir)
+            os.makedirs(work_dir)
+            report['results'][str(size)] = run_benchmarks(data_dir, work_dir, size, args.rounds)
+
+    reference = json.loads(args.compare.read_text()) if args.compare else None
+    print_results(report, reference)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=4))
+        print('\nResults saved in {}'.format(args.output))
+
+
+if __name__ == '__main__':
+    main()
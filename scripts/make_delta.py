@@ -0,0 +1,66 @@
+""" Build the delta update between two versions of the sigID database.
+
+The two versions are DB folders (as extracted from the release archives). The delta is
+saved in the output folder: the manifest (v<from>-v<to>.json), the SQL patch
+(v<from>-v<to>.sql) and the media files added or changed (media/). All of them have
+to be uploaded next to each other, then the manifest is listed in release-info.json:
+
+    python scripts/make_delta.py v72/ v73/ delta/ --url https://example.com/v73/delta/
+
+    "sigID_DB": {
+        ...
+        "deltas": {"72": {"url": ".../v72-v73.json", "sha256_hash": "..."}}
+    }
+"""
+import sys
+import json
+import argparse
+
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from artemis.core import ArtemisDatabase, file_hash
+from artemis.utils.delta_utils import make_delta
+
+
+def open_database(db_dir):
+    db_dir = Path(db_dir).resolve()
+    database = ArtemisDatabase(db_dir.name, db_dir.parent)
+    database.probe()
+    return database
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the delta update between two versions of the sigID database')
+    parser.add_argument('base', type=Path, help='folder of the previous version of the DB')
+    parser.add_argument('new', type=Path, help='folder of the new version of the DB')
+    parser.add_argument('output', type=Path, help='folder where the delta is saved')
+    parser.add_argument('--url', default='', help='url of the folder where the delta will be uploaded')
+    args = parser.parse_args()
+
+    base_db = open_database(args.base)
+    new_db = open_database(args.new)
+    if new_db.version <= base_db.version:
+        parser.error('the new DB (version {}) is not newer than the base one (version {})'.format(new_db.version, base_db.version))
+
+    manifest_path = make_delta(base_db, new_db, args.output)
+
+    manifest = json.loads(manifest_path.read_text())
+    media_size = sum(path.stat().st_size for path in (args.output / manifest['media_url']).iterdir())
+    print('Patch: {} statements, {} media files to download ({:.1f} MB)'.format(
+        (args.output / manifest['patch']).read_text().count(';\n'),
+        len(list((args.output / manifest['media_url']).iterdir())),
+        media_size / 10**6
+    ))
+    print(json.dumps({
+        str(base_db.version): {
+            'url': args.url.rstrip('/') + '/' + manifest_path.name if args.url else manifest_path.name,
+            'sha256_hash': file_hash(manifest_path)
+        }
+    }, indent=4))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+import re
+import sys
+import ctypes
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class FileServer():
+    """ Local HTTP server of in-memory files, with range requests (206, If-Range) and
+        a few faults: connections cut after some bytes, slow responses, ranges ignored
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.etag = '"1"'
+        self.accept_ranges = True
+        self.cuts = []
+        self.delay = 0
+        self.requests = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_HEAD(self):
+                server.requests.append(('HEAD', self.path, None))
+                self._respond(head=True)
+
+            def do_GET(self):
+                server.requests.append(('GET', self.path, self.headers.get('Range')))
+                self._respond(head=False)
+
+            def _respond(self, head):
+                data = server.files.get(self.path)
+                if data is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                start, stop = 0, len(data)
+                range_header = self.headers.get('Range')
+                if_range = self.headers.get('If-Range')
+                if server.accept_ranges and range_header and if_range in (None, server.etag):
+                    first, last = re.match(r'bytes=(\d+)-(\d*)', range_header).groups()
+                    start, stop = int(first), int(last) + 1 if last else len(data)
+                    if start >= len(data):
+                        self.send_response(416)
+                        self.send_header('Content-Range', 'bytes */{}'.format(len(data)))
+                        self.send_header('Content-Length', '0')
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header('Content-Range', 'bytes {}-{}/{}'.format(start, stop - 1, len(data)))
+                else:
+                    self.send_response(200)
+
+                body = data[start:stop]
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', server.etag)
+                if server.accept_ranges:
+                    self.send_header('Accept-Ranges', 'bytes')
+                self.end_headers()
+                if head:
+                    return
+
+                # cuts: bytes sent by the next responses before the connection is closed
+                # (None to send the whole body)
+                cut = server.cuts.pop(0) if server.cuts else None
+                if cut is not None:
+                    self.wfile.write(body[:cut])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    self.connection.shutdown(2)
+                    return
+
+                for i in range(0, len(body), 2**16):
+                    self.wfile.write(body[i:i + 2**16])
+                    if server.delay:
+                        time.sleep(server.delay)
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._httpd.daemon_threads = True
+        self.base_url = 'http://127.0.0.1:{}'.format(self._httpd.server_address[1])
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+
+    def url(self, path):
+        return self.base_url + path
+
+
+    def gets(self, path):
+        """ Range headers of the GET requests of a file
+        """
+        return [range_header for method, request_path, range_header in self.requests if method == 'GET' and request_path == path]
+
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def file_server():
+    server = FileServer()
+    yield server
+    server.close()
+
+
+def _pin_singletons():
+    """ PySide6 returns True/False/None from some calls (e.g. Signal.emit()) without taking a
+        reference, which is harmless from Python 3.12 (those objects are immortal) but, on
+        older interpreters, makes their reference count drop a little on every call until
+        they are deallocated at the interpreter shutdown (Fatal Python error: bool_dealloc).
+        Extra references keep them alive for the session.
+    """
+    if sys.version_info >= (3, 12):
+        return
+    for singleton in (True, False, None):
+        for _ in range(2**16):
+            ctypes.pythonapi.Py_IncRef(ctypes.py_object(singleton))
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """ The Qt application of the test session (Qt is imported only by the tests using it,
+        the data layer tests run without it). The objects scheduled for deletion are
+        destroyed before the application.
+    """
+    from PySide6.QtCore import QCoreApplication, QEvent
+
+    _pin_singletons()
+    app = QCoreApplication.instance() or QCoreApplication([])
+    yield app
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    QCoreApplication.processEvents()
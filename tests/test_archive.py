@@ -0,0 +1,75 @@
+""" DB archives streamed by the downloader: the media files must go straight to the media
+store, and a DB of an older version must be changed only by its explicit migration.
+"""
+import os
+
+import pytest
+
+from benchmark import generate_database
+from artemis.core import ArtemisDatabase, import_database, make_tar
+from artemis.utils.delta_utils import content_hash, media_manifest
+from artemis.utils.media_utils import media_store
+from artemis.utils.stream_utils import StreamingUnpacker
+from artemis.utils.sys_utils import file_hash
+from artemis.utils.update_utils import UpdateManager
+
+
+SIGNALS = 30
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """ Archive of a DB built in its own data folder (and media store), as on the release machine
+    """
+    database = generate_database(tmp_path / 'release' / 'data', tmp_path / 'release' / 'media', SIGNALS)
+    tar_path = tmp_path / 'db.tar'
+    make_tar(tar_path, database.db_dir, database.media_files())
+    yield tar_path
+    database.store.close()
+
+
+def test_streamed_archive_matches_import(archive, tmp_path):
+    data_dir, store_dir = tmp_path / 'data', tmp_path / 'media'
+    store = media_store(store_dir)
+    unpacker = StreamingUnpacker(data_dir / 'downloaded', file_hash(archive), store)
+    data = archive.read_bytes()
+    for i in range(0, len(data), 10000):
+        unpacker.write(data[i:i + 10000])
+
+    database = UpdateManager._commit_db(unpacker)
+    imported_db = import_database(archive, data_dir, store_dir)
+
+    # The media files are only in the store, referenced by the downloaded DB
+    assert not os.listdir(database.media_dir)
+    assert len(store.refs('downloaded')) == SIGNALS
+    assert media_manifest(database) == media_manifest(imported_db)
+    assert content_hash(database.sql_path) == content_hash(imported_db.sql_path)
+    assert not (data_dir / StreamingUnpacker.STAGING_DIR / 'downloaded').exists()
+
+    database.close()
+    imported_db.close()
+    store.close()
+
+
+def test_load_does_not_migrate(tmp_path):
+    data_dir, store_dir = tmp_path / 'data', tmp_path / 'media'
+    db_dir_name = generate_database(data_dir, store_dir, SIGNALS).db_dir_name
+    database = ArtemisDatabase(db_dir_name, data_dir, store_dir)
+
+    # Media files of a DB created before the media store
+    database.delete_media()
+    for doc_id in range(1, SIGNALS + 1):
+        (database.media_dir / '{}.png'.format(doc_id)).write_bytes(b'legacy')
+    sql_hash = file_hash(database.sql_path)
+
+    database.load()
+    assert file_hash(database.sql_path) == sql_hash
+    assert len(os.listdir(database.media_dir)) == SIGNALS
+    assert database.store.refs(db_dir_name) == {}
+
+    database.migrate()
+    assert not os.listdir(database.media_dir)
+    assert len(database.store.refs(db_dir_name)) == SIGNALS
+
+    database.close()
+    database.store.close()
@@ -0,0 +1,120 @@
+""" Delta updates served by a local HTTP server: a DB patched with the delta must have
+the same content (and media files) as the new version downloaded as a full archive.
+"""
+import hashlib
+import sqlite3
+
+from contextlib import closing
+
+import pytest
+
+from benchmark import generate_database
+from artemis.core import ArtemisDatabase, Query, import_database, make_tar
+from artemis.utils.delta_utils import DeltaError, apply_delta, content_hash, make_delta, media_manifest
+
+
+SIGNALS = 30
+
+
+def new_version(data_dir, store_dir, tmp_path):
+    """ Copy of the base DB (same content, generated with the same seed) turned into the
+        next version: rows deleted from children and parents tables, parents inserted with
+        their children, values updated, media files changed and added. It is built in
+        its own data folder (and media store), as on the release machine.
+    """
+    new_db = generate_database(data_dir, store_dir, SIGNALS)
+    new_db.load()
+
+    with closing(sqlite3.connect(new_db.sql_path)) as conn:
+        conn.execute('PRAGMA foreign_keys = ON;')
+        with conn:
+            # Children of a signal kept
+            conn.execute('DELETE FROM frequency WHERE SIG_ID = 2')
+            conn.execute('DELETE FROM documents WHERE SIG_ID = 3')
+            # Signal and category label removed with their children
+            conn.execute(Query.DELETE_SIGNAL, [4])
+            conn.execute('DELETE FROM category_label WHERE CLB_ID = 7')
+            conn.execute('UPDATE signals SET DESCRIPTION = ? WHERE SIG_ID = 5', ["new 'description'"])
+            conn.execute('UPDATE frequency SET VALUE = VALUE + 1 WHERE SIG_ID = 6')
+
+            label_id = conn.execute(Query.INSERT_CATEGORY_LABEL, ['Space']).lastrowid
+            sig_id = conn.execute(Query.INSERT_SIGNAL, ['NEW signal', 'Inserted by the delta']).lastrowid
+            conn.execute(Query.INSERT_CATEGORY, [sig_id, label_id])
+            conn.execute(Query.INSERT_FREQUENCY, [sig_id, 14 * 10**6, None])
+            conn.execute(Query.INSERT_MODULATION, [sig_id, 'OFDM', None])
+            doc_id = conn.execute(Query.INSERT_DOCUMENTS, [sig_id, 'png', 'Spectrum', None, 'Image', 1]).lastrowid
+        conn.execute(Query.UPDATE_DELTA_INFO.format(version=2, date="'2026-01-01'"))
+        conn.commit()
+
+    new_db.load()
+    changed_media = tmp_path / 'changed.png'
+    changed_media.write_bytes(b'changed spectrum')
+    new_db.store_document(1, 'png', changed_media)
+    added_media = tmp_path / 'added.png'
+    added_media.write_bytes(b'new spectrum')
+    new_db.store_document(doc_id, 'png', added_media)
+    new_db.delete_media([3, 4])
+    new_db.load()
+    return new_db
+
+
+@pytest.fixture
+def databases(tmp_path):
+    data_dir, store_dir = tmp_path / 'data', tmp_path / 'media'
+    base_db = generate_database(data_dir, store_dir, SIGNALS)
+    base_db.load()
+    new_db = new_version(tmp_path / 'release' / 'data', tmp_path / 'release' / 'media', tmp_path)
+    yield data_dir, store_dir, base_db, new_db
+    base_db.store.close()
+    new_db.store.close()
+
+
+def serve_delta(file_server, base_db, new_db, output_dir):
+    """ Build the delta and serve its files. Returns the url and the hash of the manifest.
+    """
+    manifest_path = make_delta(base_db, new_db, output_dir)
+    for path in output_dir.rglob('*'):
+        if path.is_file():
+            file_server.files['/delta/' + path.relative_to(output_dir).as_posix()] = path.read_bytes()
+    return file_server.url('/delta/' + manifest_path.name), hashlib.sha256(manifest_path.read_bytes()).hexdigest()
+
+
+def test_delta_matches_full_archive(databases, file_server, tmp_path):
+    data_dir, store_dir, base_db, new_db = databases
+    url, manifest_hash = serve_delta(file_server, base_db, new_db, tmp_path / 'delta')
+
+    downloaded = apply_delta(url, manifest_hash, base_db, data_dir / 'patched')
+    # Only the changed and the added media files are downloaded
+    assert downloaded == 2
+
+    patched_db = ArtemisDatabase('patched', data_dir, store_dir)
+    patched_db.load()
+    assert patched_db.version == 2
+
+    # The same version, downloaded as a full archive
+    tar_path = tmp_path / 'v2.tar'
+    make_tar(tar_path, new_db.db_dir, new_db.media_files())
+    imported_db = import_database(tar_path, data_dir, store_dir)
+
+    assert content_hash(patched_db.sql_path) == content_hash(imported_db.sql_path) == content_hash(new_db.sql_path)
+    assert media_manifest(patched_db) == media_manifest(imported_db)
+    assert patched_db.execute('PRAGMA foreign_key_check') == []
+
+    patched_db.close()
+    imported_db.close()
+
+
+def test_delta_refused_on_modified_db(databases, file_server, tmp_path):
+    data_dir, _, base_db, new_db = databases
+    url, manifest_hash = serve_delta(file_server, base_db, new_db, tmp_path / 'delta')
+
+    # Local change: the patched DB does not match the new version
+    base_db.execute('UPDATE signals SET NAME = ? WHERE SIG_ID = 1', ['renamed'])
+    blobs = base_db.store.stats()['blobs']
+
+    with pytest.raises(DeltaError):
+        apply_delta(url, manifest_hash, base_db, data_dir / 'patched')
+
+    assert not (data_dir / 'patched').exists()
+    # The media files downloaded for the failed delta are removed
+    assert base_db.store.stats()['blobs'] == blobs
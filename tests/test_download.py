@@ -0,0 +1,263 @@
+""" Downloads of the UIDownloader from a local HTTP server: retries and resumed
+downloads must continue with a range request and give back the same file.
+"""
+import json
+import os
+import time
+
+from types import SimpleNamespace
+
+import pytest
+
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, Signal, Slot
+
+from artemis.ui.downloader import UIDownloader
+from artemis.utils.constants import Constants, Messages
+from artemis.utils.update_utils import UpdateManager
+
+
+FILE_SIZE = 2**20
+
+
+class DownloaderWindow(QObject):
+    """ Stand-in for the QML window of the downloader, recording the status texts
+    """
+    abortRequested = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.statuses = []
+
+    @Slot()
+    def show(self):
+        pass
+
+    @Slot()
+    def close(self):
+        pass
+
+    @Slot(int, int)
+    def updateProgressBar(self, received, total):
+        pass
+
+    @Slot()
+    def setIndeterminateBar(self):
+        pass
+
+    @Slot(str)
+    def updateStatus(self, status):
+        self.statuses.append(status)
+
+
+class RecordingSink():
+    """ Sink of a streamed download, recording the data and the number of requests
+        made when each chunk was received
+    """
+
+    def __init__(self, server, path):
+        self.server = server
+        self.path = path
+        self.chunks = []
+
+    def write(self, chunk):
+        self.chunks.append((len(self.server.gets(self.path)), chunk))
+
+    def write_file(self, path, size, offset=0):
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            self.write(f.read(size))
+
+    def reset(self):
+        self.chunks.clear()
+
+    def cancel(self):
+        self.chunks.clear()
+
+    @property
+    def data(self):
+        return b''.join(chunk for _, chunk in self.chunks)
+
+
+class Windows():
+    def create_window(self, url):
+        return DownloaderWindow()
+
+
+class Parent():
+    """ Stand-in for the main UI, recording the error popups
+    """
+
+    def __init__(self):
+        self.windows = Windows()
+        self.popups = []
+        self.downloader = UIDownloader(self)
+
+    def dialog_popup(self, *args):
+        self.popups.append(args)
+
+
+@pytest.fixture
+def parent(qapp, monkeypatch):
+    """ Stand-in for the main UI. Its downloader (and the downloader window) are deleted
+        after the test, so that no Qt object is left to the interpreter shutdown.
+    """
+    monkeypatch.setattr(Constants, 'DOWNLOAD_RETRY_DELAY_MS', 10)
+    parent = Parent()
+    yield parent
+    parent.downloader.on_abort()
+    parent.downloader._window.deleteLater()
+    parent.downloader.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    QCoreApplication.processEvents()
+
+
+@pytest.fixture
+def data():
+    return os.urandom(FILE_SIZE)
+
+
+def wait_until(condition, timeout=20):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        QCoreApplication.processEvents()
+        time.sleep(0.001)
+
+
+def download(parent, url, save_path, sink=None):
+    """ Download a file (streamed to the sink, if any) and return how many times
+        the finished signal was emitted
+    """
+    finished = []
+    parent.downloader.finished.connect(lambda: finished.append(True))
+    if sink is None:
+        parent.downloader.on_start(url, save_path)
+    else:
+        parent.downloader.on_start_stream(url, save_path, sink)
+    wait_until(lambda: finished or parent.popups)
+    parent.downloader.finished.disconnect()
+    return len(finished)
+
+
+def abort_after(parent, url, save_path, size):
+    """ Start a download and abort it after some bytes are saved. Returns the size
+        of the partial file.
+    """
+    parent.downloader.on_start(url, save_path)
+    wait_until(lambda: parent.downloader.part is not None and parent.downloader.part.received >= size)
+    parent.downloader.on_abort()
+    state = json.loads((save_path / 'file.bin.part.json').read_text())
+    return sum(position - start for start, position, end in state['segments'])
+
+
+def test_retry_resumes_with_range(parent, file_server, data, tmp_path):
+    file_server.files['/file.bin'] = data
+    file_server.cuts = [300000]
+
+    assert download(parent, file_server.url('/file.bin'), tmp_path) == 1
+    assert not parent.popups
+    assert (tmp_path / 'file.bin').read_bytes() == data
+    assert file_server.gets('/file.bin')[-1] == 'bytes=300000-'
+    assert sorted(os.listdir(tmp_path)) == ['file.bin']
+
+
+def test_aborted_download_is_resumed(parent, file_server, data, tmp_path):
+    file_server.files['/file.bin'] = data
+    file_server.delay = 0.01
+
+    received = abort_after(parent, file_server.url('/file.bin'), tmp_path, 2**17)
+    assert 0 < received < FILE_SIZE
+    assert (tmp_path / 'file.bin.part').exists()
+
+    file_server.delay = 0
+    assert download(parent, file_server.url('/file.bin'), tmp_path) == 1
+    assert not parent.popups
+    assert (tmp_path / 'file.bin').read_bytes() == data
+    assert file_server.gets('/file.bin')[-1] == 'bytes={}-'.format(received)
+    assert sorted(os.listdir(tmp_path)) == ['file.bin']
+
+
+def test_changed_file_is_downloaded_again(parent, file_server, data, tmp_path):
+    file_server.files['/file.bin'] = data
+    file_server.delay = 0.01
+
+    abort_after(parent, file_server.url('/file.bin'), tmp_path, 2**17)
+
+    # The server now has a new version of the file: the If-Range of the resumed
+    # request does not match and the whole file is sent again
+    new_data = os.urandom(FILE_SIZE)
+    file_server.files['/file.bin'] = new_data
+    file_server.etag = '"2"'
+    file_server.delay = 0
+    assert download(parent, file_server.url('/file.bin'), tmp_path) == 1
+    assert (tmp_path / 'file.bin').read_bytes() == new_data
+
+
+def test_segments_are_streamed_in_order(parent, file_server, data, tmp_path, monkeypatch):
+    monkeypatch.setattr(Constants, 'DOWNLOAD_SEGMENT_MIN_SIZE', 2**19)
+    monkeypatch.setattr(Constants, 'DOWNLOAD_SEGMENT_SIZE', 2**17)
+    file_server.files['/file.bin'] = data
+    file_server.cuts = [None, 10000]
+    file_server.delay = 0.002
+    sink = RecordingSink(file_server, '/file.bin')
+
+    assert download(parent, file_server.url('/file.bin'), tmp_path, sink) == 1
+    assert sink.data == data
+    # The sink follows the download: it gets the first segments before the last
+    # ones are requested
+    segments = FILE_SIZE // 2**17
+    assert sink.chunks[0][0] < segments
+    assert os.listdir(tmp_path) == []
+
+
+def test_update_manager_callback_runs_once(parent, file_server, data, tmp_path, monkeypatch):
+    file_server.files['/artemis.zip'] = data
+    file_server.delay = 0.01
+    monkeypatch.setattr('artemis.utils.update_utils.TMP_DIR', tmp_path)
+
+    update_manager = UpdateManager(parent)
+    update_manager.remote_artemis_url = file_server.url('/artemis.zip')
+    calls = []
+    update_manager.post_download_artemis = lambda: calls.append(True)
+
+    # Download started, aborted and started again: the callback must not be
+    # connected twice
+    update_manager.download_artemis()
+    wait_until(lambda: parent.downloader.part is not None and parent.downloader.part.received >= 2**17)
+    parent.downloader.on_abort()
+    file_server.delay = 0
+    update_manager.download_artemis()
+    wait_until(lambda: calls or parent.popups)
+    QCoreApplication.processEvents()
+
+    assert calls == [True]
+    assert (tmp_path / 'artemis.zip').read_bytes() == data
+
+
+def test_failed_delta_falls_back_to_archive(parent, file_server, data, tmp_path, monkeypatch, caplog):
+    file_server.files['/sigid.tar'] = data
+    monkeypatch.setattr('artemis.utils.update_utils.DATA_DIR', tmp_path)
+
+    update_manager = UpdateManager(parent)
+    update_manager.local_db = SimpleNamespace(version=1)
+    update_manager.remote_db_deltas = {'1': {'url': file_server.url('/delta/missing.json'), 'sha256_hash': ''}}
+    update_manager.remote_db_url = file_server.url('/sigid.tar')
+    update_manager.remote_db_hash = ''
+
+    update_manager.download_db()
+    wait_until(lambda: parent.popups)
+
+    # The delta is applied with a status, its error is logged and the whole DB downloaded
+    # (not a valid archive here)
+    assert parent.downloader._window.statuses[0] == Messages.DB_DELTA_STATUS_MSG
+    assert '404' in caplog.text
+    assert file_server.gets('/sigid.tar')
+    assert len(parent.popups) == 1
+
+
+def test_invalid_update_metadata_are_reported(parent):
+    update_manager = UpdateManager(parent)
+    # Not a network error: reported even for the automatic check
+    update_manager._notify_update_error(ValueError('invalid metadata'), False)
+    assert parent.popups[-1][1:] == (Messages.GENERIC_ERROR, Messages.GENERIC_ERROR_MSG.format('invalid metadata'))
+    assert update_manager.db_update is False
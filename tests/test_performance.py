@@ -0,0 +1,51 @@
+""" Regression checks of the data layer timings. They compare DBs of different sizes
+(generated as in scripts/benchmark.py), so that an operation becoming O(DB size) fails
+whatever the speed of the machine.
+"""
+import random
+import time
+
+import pytest
+
+from benchmark import generate_database
+from artemis.core import ArtemisDatabase, ArtemisSignal
+
+
+SIZES = (500, 5000)
+SIGNALS_LOADED = 200
+ROUNDS = 5
+# Max slowdown of the per-signal load time on a 10x larger DB
+MAX_SLOWDOWN = 3
+
+
+def signal_load_ms(data_dir, store_dir, size):
+    """ Best time (ms) to load a signal, over ROUNDS loads of the same sample of signals
+    """
+    db_dir_name = generate_database(data_dir, store_dir, size).db_dir_name
+    database = ArtemisDatabase(db_dir_name, data_dir, store_dir)
+    database.load()
+    sig_ids = random.Random(1).sample([signal['SIG_ID'] for signal in database.all_signals], SIGNALS_LOADED)
+
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for sig_id in sig_ids:
+            ArtemisSignal(database).load(sig_id)
+        timings.append((time.perf_counter() - start) * 1000 / SIGNALS_LOADED)
+
+    database.close()
+    return min(timings)
+
+
+@pytest.fixture(scope='module')
+def load_times(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp('data')
+    store_dir = tmp_path_factory.mktemp('media')
+    return {size: signal_load_ms(data_dir, store_dir, size) for size in SIZES}
+
+
+def test_signal_load_does_not_scale_with_db_size(load_times):
+    small, large = (load_times[size] for size in SIZES)
+    assert large < small * MAX_SLOWDOWN, 'ArtemisSignal.load: {:.3f} ms on {} signals, {:.3f} ms on {}'.format(
+        small, SIZES[0], large, SIZES[1]
+    )
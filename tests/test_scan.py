@@ -0,0 +1,25 @@
+""" Discovery of the local DBs: the probes are cached per data folder.
+"""
+from benchmark import generate_database
+from artemis.core import scan_databases
+from artemis.utils import sql_utils
+
+
+def test_scans_of_other_data_folders_keep_the_cache(tmp_path):
+    store_dir = tmp_path / 'media'
+    first_dir, second_dir = tmp_path / 'first', tmp_path / 'second'
+    generate_database(first_dir, store_dir, 10)
+    generate_database(second_dir, store_dir, 10)
+
+    first = scan_databases(first_dir, store_dir)
+    second = scan_databases(second_dir, store_dir)
+
+    # Unchanged DBs are not probed again, whatever folder was scanned in between
+    assert scan_databases(first_dir, store_dir)[0] is first[0]
+    assert scan_databases(second_dir, store_dir)[0] is second[0]
+
+    first[0].delete()
+    assert scan_databases(first_dir, store_dir) == []
+    assert first[0].db_dir not in sql_utils._probe_cache
+    assert second[0].db_dir in sql_utils._probe_cache
+    second[0].store.close()
@@ -0,0 +1,41 @@
+""" Searches of the SearchWorker: a cancelled search must stop using its DB before
+the DB is closed.
+"""
+import itertools
+import threading
+
+from artemis.utils.search_utils import SearchWorker
+
+
+class EndlessDatabase():
+    """ Stand-in for a DB whose search never ends by itself
+    """
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.searching = False
+
+    def connection(self):
+        return self
+
+    def set_progress_handler(self, handler, steps):
+        pass
+
+    def stream_search(self, text):
+        self.searching = True
+        self.started.set()
+        try:
+            yield from itertools.count(1)
+        finally:
+            self.searching = False
+
+
+def test_cancel_waits_for_the_running_search(qapp):
+    worker = SearchWorker()
+    database = EndlessDatabase()
+
+    worker.search(database, 'text')
+    assert database.started.wait(5)
+    worker.cancel(wait=True)
+
+    assert not database.searching
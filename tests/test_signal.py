@@ -0,0 +1,95 @@
+""" Signal details loaded with a single query: they must match, list by list and in the
+same order, what the former per-table queries returned on a DB without indexes.
+"""
+import shutil
+import sqlite3
+
+from contextlib import closing
+from operator import itemgetter
+
+import pytest
+
+from benchmark import generate_database
+from artemis.core import ArtemisDatabase, ArtemisSignal, Query
+from artemis.utils.generic_utils import format_frequency
+
+
+SIGNALS = 50
+
+# Queries of the former loader, one per table
+PER_TABLE_QUERIES = {
+    'category': """
+        SELECT category.CAT_ID, category_label.VALUE
+        FROM category
+        INNER JOIN category_label ON category.CLB_ID = category_label.CLB_ID
+        WHERE SIG_ID = ?
+    """,
+    'frequency': "SELECT FREQ_ID, VALUE, DESCRIPTION FROM frequency WHERE SIG_ID = ?",
+    'bandwidth': "SELECT BAND_ID, VALUE, DESCRIPTION FROM bandwidth WHERE SIG_ID = ?",
+    'modulation': "SELECT MDL_ID, VALUE, DESCRIPTION FROM modulation WHERE SIG_ID = ?",
+    'mode': "SELECT MOD_ID, VALUE, DESCRIPTION FROM mode WHERE SIG_ID = ?",
+    'location': "SELECT LOC_ID, VALUE, DESCRIPTION FROM location WHERE SIG_ID = ?",
+    'acf': "SELECT ACF_ID, VALUE, DESCRIPTION FROM acf WHERE SIG_ID = ?",
+    'documents': """
+        SELECT DOC_ID, EXTENSION, NAME, DESCRIPTION, TYPE, PREVIEW
+        FROM documents WHERE SIG_ID = ?
+        ORDER BY TYPE ASC
+    """
+}
+
+
+def per_table_details(conn, sig_id):
+    details = {
+        table: [list(row) for row in conn.execute(query, [sig_id])]
+        for table, query in PER_TABLE_QUERIES.items()
+    }
+    for table in ('frequency', 'bandwidth'):
+        details[table] = [row + [format_frequency(row[1])] for row in sorted(details[table], key=itemgetter(1))]
+    return details
+
+
+@pytest.fixture
+def database(tmp_path):
+    """ Generated DB with several rows per child table, inserted in an order different
+        from the one of the indexes (e.g. categories by decreasing label)
+    """
+    data_dir, store_dir = tmp_path / 'data', tmp_path / 'media'
+    database = generate_database(data_dir, store_dir, SIGNALS)
+
+    with closing(sqlite3.connect(database.sql_path)) as conn:
+        with conn:
+            for sig_id in range(1, SIGNALS + 1, 3):
+                for label_id in (3, 1, 2):
+                    conn.execute(Query.INSERT_CATEGORY, [sig_id, label_id])
+                conn.execute(Query.INSERT_FREQUENCY, [sig_id, 10**6, 'same value'])
+                conn.execute(Query.INSERT_FREQUENCY, [sig_id, 10**6, 'same value, inserted later'])
+                conn.execute(Query.INSERT_MODULATION, [sig_id, 'FSK', None])
+                conn.execute(Query.INSERT_MODULATION, [sig_id, 'AM', None])
+                conn.execute(Query.INSERT_LOCATION, [sig_id, 'Europe', None])
+                conn.execute(Query.INSERT_ACF, [sig_id, 50, None])
+                conn.execute(Query.INSERT_ACF, [sig_id, 10, None])
+                conn.execute(Query.INSERT_DOCUMENTS, [sig_id, 'ogg', 'Sample', None, 'Audio', 1])
+                conn.execute(Query.INSERT_DOCUMENTS, [sig_id, 'png', 'Waterfall', None, 'Image', 0])
+
+    database = ArtemisDatabase(database.db_dir_name, data_dir, store_dir)
+    database.load()
+    yield database
+    database.close()
+    database.store.close()
+
+
+def test_details_match_per_table_queries(database, tmp_path):
+    # The former loader ran on DBs without indexes
+    reference_path = tmp_path / 'reference.sqlite'
+    shutil.copy(database.sql_path, reference_path)
+
+    with closing(sqlite3.connect(reference_path)) as conn:
+        indexes = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'")]
+        for index in indexes:
+            conn.execute('DROP INDEX {}'.format(index))
+
+        for sig_id in range(1, SIGNALS + 1):
+            signal = ArtemisSignal(database)
+            signal.load(sig_id)
+            loaded = {table: [list(row) for row in getattr(signal, table)] for table in PER_TABLE_QUERIES}
+            assert loaded == per_table_details(conn, sig_id), sig_id
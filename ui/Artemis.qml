@@ -38,38 +38,37 @@ Window {
     signal newDb(string name)
     signal exportDb(string path)
     signal importDb(string path)
+    signal searchSignals(string text)
+    signal filterPageVisible(bool visible)
 
-    property var loadedList
+    property bool listFrozen: false
     property bool updateAvailable: false
 
-    function populateList(signalsList) {
-        loadedList = signalsList
+    function resetList() {
+        // New DB loaded
+        searchTimer.stop()
+        textFieldSearch.clear()
         textFieldSearch.enabled = true
-        var currentIndex = listView.currentIndex
-        refreshList()
-        // Set the currentIndex back after refreshing the list
-        if (currentIndex >= 0 && currentIndex < listModel.count) {
-            listView.currentIndex = currentIndex
-        }
     }
 
-    function refreshList() {
-        listModel.clear()
-        for (var i = 0; i < loadedList.length; i++) {
-            var name = loadedList[i].name.toLowerCase()
-            var description = loadedList[i].description.toLowerCase()
-            var search = textFieldSearch.text.toLowerCase()
-            if (name.includes(search) || description.includes(search)) {
-                listModel.append(loadedList[i])
-            }
-        }
-        itemChangedList()
+    function freezeList() {
+        // The list model is going to change: the signals crossed by the selection are not loaded
+        listFrozen = true
+    }
+
+    function selectRow(row) {
+        // Select a row without loading its signal (already loaded by the backend)
+        listFrozen = true
+        listView.forceLayout()
+        listView.currentIndex = row
+        listFrozen = false
+        editSignalMenu.enabled = row >= 0
     }
 
     function itemChangedList() {
-        var selected_sig = listModel.get(listView.currentIndex)
-        if (selected_sig !== undefined) {
-            loadSignal(listModel.get(listView.currentIndex).SIG_ID)
+        var signalId = signalListModel ? signalListModel.sigId(listView.currentIndex) : -1
+        if (signalId >= 0) {
+            loadSignal(signalId)
             editSignalMenu.enabled = true
         } else {
             editSignalMenu.enabled = false
@@ -77,8 +76,7 @@ Window {
     }
 
     function clearList() {
-        listModel.clear()
-        loadedList = []
+        searchTimer.stop()
         textFieldSearch.clear()
         textFieldSearch.enabled = false
     }
@@ -131,6 +129,13 @@ Window {
         dialogUpdateArtemis.open()
     }
 
+    Timer {
+        // Debounce the search bar: the search starts once the user stops typing
+        id: searchTimer
+        interval: SEARCH_DEBOUNCE_MS
+        onTriggered: searchSignals(textFieldSearch.text)
+    }
+
     DialogMessage {
         id: dialogDownloadDb
         modal: true
@@ -419,7 +424,12 @@ Window {
 
                     placeholderText: qsTr("Search")
                     onTextChanged: {
-                        refreshList()
+                        if (text.trim() === '') {
+                            searchTimer.stop()
+                            searchSignals('')
+                        } else {
+                            searchTimer.restart()
+                        }
                     }
                 }
 
@@ -433,7 +443,11 @@ Window {
                         clip: true
                         ScrollBar.vertical: bar
                         highlight: Rectangle { color: Material.accent; radius: 5 }
-                        onCurrentIndexChanged: { itemChangedList() }
+                        onCurrentIndexChanged: {
+                            if (!listFrozen) {
+                                itemChangedList()
+                            }
+                        }
                         delegate: Item {
                             id: listDelegate
                             width: ListView.view.width
@@ -444,9 +458,7 @@ Window {
                                 onClicked: listView.currentIndex = index
                             }
                         }
-                        model: ListModel {
-                            id: listModel
-                        }
+                        model: signalListModel
                     }
 
                     ScrollBar {
@@ -465,6 +477,7 @@ Window {
                 TabBar {
                     id: tabBar
                     Layout.fillWidth: true
+                    onCurrentIndexChanged: filterPageVisible(currentIndex === 1)
 
                     TabButton {
                         text: qsTr("SIGNAL")
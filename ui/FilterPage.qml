@@ -211,6 +211,50 @@ Page {
         }
     }
 
+    function mergeLists(filterList) {
+        // Update the lists after an edit, keeping the entries selected by the user
+        var removedChecked = mergeList(modelModulation, filterList[0].modulation, 'value')
+        removedChecked = mergeList(modelLocation, filterList[0].location, 'value') || removedChecked
+        removedChecked = mergeList(modelCategory, filterList[0].category, 'clb_id') || removedChecked
+
+        if (removedChecked) {
+            updateFilterDict()
+        }
+    }
+
+    function mergeList(model, entries, keyRole) {
+        // Returns true if a checked entry has been removed
+        var removedChecked = false
+        var keys = entries.map(function(entry) { return entry[keyRole] })
+
+        for (var i = model.count - 1; i >= 0; i--) {
+            if (keys.indexOf(model.get(i)[keyRole]) < 0) {
+                removedChecked = removedChecked || model.get(i).checked === true
+                model.remove(i)
+            }
+        }
+
+        for (var j = 0; j < entries.length; j++) {
+            var index = -1
+            for (var k = j; k < model.count; k++) {
+                if (model.get(k)[keyRole] === entries[j][keyRole]) {
+                    index = k
+                    break
+                }
+            }
+
+            if (index < 0) {
+                model.insert(j, entries[j])
+            } else {
+                if (index !== j) {
+                    model.move(index, j, 1)
+                }
+                model.setProperty(j, 'value', entries[j].value)
+            }
+        }
+        return removedChecked
+    }
+
     ColumnLayout {
         anchors.fill: parent
         anchors.rightMargin: 10